@@ -0,0 +1,181 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+#include <arcticdb/arrow/arrow_handlers.hpp>
+#include <arcticdb/codec/encoding_sizes.hpp>
+#include <arcticdb/codec/codec.hpp>
+#include <arcticdb/column_store/column.hpp>
+#include <arcticdb/column_store/string_pool.hpp>
+#include <arcticdb/pipeline/column_mapping.hpp>
+#include <arcticdb/pipeline/string_pool_utils.hpp>
+#include <arcticdb/util/decode_path_data.hpp>
+
+#include <algorithm>
+
+namespace arcticdb {
+
+void ArrowStringDictionary::encode(
+        const StringPool& string_pool,
+        ankerl::unordered_dense::map<OffsetString::offset_t, int64_t>& codes) {
+    std::lock_guard lock(mutex_);
+    for (auto& [offset, code] : codes) {
+        const auto sv = get_string_from_pool(offset, string_pool);
+        if (auto it = codes_.find(sv); it != codes_.end()) {
+            code = it->second;
+        } else {
+            code = static_cast<int64_t>(values_.size());
+            const auto& value = values_.emplace_back(sv);
+            codes_.try_emplace(std::string_view{value}, code);
+        }
+    }
+}
+
+size_t ArrowStringDictionary::size() const {
+    std::lock_guard lock(mutex_);
+    return values_.size();
+}
+
+std::pair<std::vector<int64_t>, std::string> ArrowStringDictionary::to_large_utf8() const {
+    std::lock_guard lock(mutex_);
+    std::vector<int64_t> offsets;
+    offsets.reserve(values_.size() + 1);
+    offsets.emplace_back(0);
+    for (const auto& value : values_)
+        offsets.emplace_back(offsets.back() + static_cast<int64_t>(value.size()));
+
+    std::string data;
+    data.reserve(static_cast<size_t>(offsets.back()));
+    for (const auto& value : values_)
+        data.append(value);
+
+    return {std::move(offsets), std::move(data)};
+}
+
+std::shared_ptr<ArrowStringDictionary> ArrowHandlerData::dictionary(const ChunkedBuffer& buffer) {
+    std::lock_guard lock(dictionaries_->mutex_);
+    auto [it, inserted] = dictionaries_->by_buffer_.try_emplace(&buffer);
+    if (inserted)
+        it->second = std::make_shared<ArrowStringDictionary>();
+
+    return it->second;
+}
+
+std::shared_ptr<ArrowStringDictionary> ArrowHandlerData::find_dictionary(const ChunkedBuffer& buffer) const {
+    std::lock_guard lock(dictionaries_->mutex_);
+    auto it = dictionaries_->by_buffer_.find(&buffer);
+    return it == dictionaries_->by_buffer_.end() ? nullptr : it->second;
+}
+
+void ArrowStringHandler::handle_type(
+        const uint8_t *&data,
+        Column& dest_column,
+        const EncodedFieldImpl &field,
+        const ColumnMapping& m,
+        const DecodePathData& shared_data,
+        std::any& handler_data,
+        EncodingVersion encoding_version,
+        const std::shared_ptr<StringPool>& string_pool) {
+    ARCTICDB_SAMPLE(ArrowHandleString, 0)
+    util::check(field.has_ndarray(), "String handler expected array");
+    ARCTICDB_DEBUG(log::version(), "Arrow string handler got encoded field: {}", field.DebugString());
+    const auto &ndarray = field.ndarray();
+    const auto bytes = encoding_sizes::data_uncompressed_size(ndarray);
+
+    // String pool offsets and dictionary codes are the same width, so dense columns are decoded straight into the
+    // output and the offsets then overwritten in place with codes
+    static_assert(sizeof(OffsetString::offset_t) == sizeof(int64_t));
+    auto decoded_data = [&m, &ndarray, bytes, &dest_column]() {
+        if(ndarray.sparse_map_bytes() > 0) {
+            return Column(m.source_type_desc_, bytes / get_type_size(m.source_type_desc_.data_type()), AllocationType::DYNAMIC, Sparsity::PERMITTED);
+        } else {
+            Column column(m.source_type_desc_, Sparsity::NOT_PERMITTED);
+            column.buffer().add_external_block(dest_column.bytes_at(m.offset_bytes_, m.num_rows_ * sizeof(int64_t)), bytes, 0UL);
+            return column;
+        }
+    }();
+
+    data += decode_field(m.source_type_desc_, field, data, decoded_data, decoded_data.opt_sparse_map(), encoding_version);
+
+    if(is_dynamic_string_type(m.dest_type_desc_.data_type())) {
+        convert_type(
+            decoded_data,
+            dest_column,
+            m,
+            shared_data,
+            handler_data,
+            string_pool);
+    }
+}
+
+void ArrowStringHandler::convert_type(
+        const Column& source_column,
+        Column& dest_column,
+        const ColumnMapping& mapping,
+        const DecodePathData&,
+        std::any& handler_data,
+        const std::shared_ptr<StringPool>& string_pool) const {
+    ARCTICDB_SAMPLE(ArrowConvertString, 0)
+    using OffsetTag = ScalarTagType<DataTypeTag<DataType::UINT64>>;
+    auto dictionary = get_arrow_handler_data(handler_data).dictionary(dest_column.buffer());
+    auto ptr_dest = reinterpret_cast<int64_t*>(dest_column.bytes_at(mapping.offset_bytes_, mapping.num_rows_ * sizeof(int64_t)));
+    util::check(ptr_dest != nullptr, "Got null destination pointer");
+
+    auto data = source_column.data();
+    ankerl::unordered_dense::map<OffsetString::offset_t, int64_t> codes;
+    for (auto it = data.cbegin<OffsetTag, IteratorType::REGULAR, IteratorDensity::DENSE>();
+         it != data.cend<OffsetTag, IteratorType::REGULAR, IteratorDensity::DENSE>(); ++it) {
+        if (const auto offset = static_cast<OffsetString::offset_t>(*it); is_a_string(offset))
+            codes.try_emplace(offset, ArrowStringDictionary::null_code);
+    }
+    if (!codes.empty()) {
+        util::check(static_cast<bool>(string_pool), "Expected a string pool when converting strings");
+        dictionary->encode(*string_pool, codes);
+    }
+
+    const auto code_for = [&codes] (uint64_t value) {
+        const auto offset = static_cast<OffsetString::offset_t>(value);
+        return is_a_string(offset) ? codes.at(offset) : ArrowStringDictionary::null_code;
+    };
+    auto src = data.cbegin<OffsetTag, IteratorType::REGULAR, IteratorDensity::DENSE>();
+    if (const auto& sparse_map = source_column.opt_sparse_map(); sparse_map.has_value()) {
+        std::fill_n(ptr_dest, mapping.num_rows_, ArrowStringDictionary::null_code);
+        for (auto en = sparse_map->first(); en < sparse_map->end(); ++en, ++src)
+            ptr_dest[*en] = code_for(*src);
+    } else {
+        // When decoded in place the source and destination alias, which is fine as each row is read before it is written
+        for (auto row = 0UL; row < mapping.num_rows_; ++row, ++src)
+            ptr_dest[row] = code_for(*src);
+    }
+}
+
+int ArrowStringHandler::type_size() const {
+    return sizeof(int64_t);
+}
+
+TypeDescriptor ArrowStringHandler::output_type(const TypeDescriptor& input_type) const {
+    return input_type;
+}
+
+void ArrowStringHandler::default_initialize(
+        ChunkedBuffer& buffer,
+        size_t offset,
+        size_t byte_size,
+        const DecodePathData&,
+        std::any& any) const {
+    // The column may be entirely missing from the segments read, in which case it still needs an (empty) dictionary
+    (void)get_arrow_handler_data(any).dictionary(buffer);
+    // Chunked Arrow frames have one block per row-slice, so the range to initialize can span several blocks
+    while (byte_size > 0) {
+        auto [block, block_offset, block_index] = buffer.block_and_offset(offset);
+        const auto bytes = std::min(byte_size, block->bytes() - block_offset);
+        util::check(bytes > 0, "Unable to default initialize {} bytes at offset {}", byte_size, offset);
+        std::fill_n(reinterpret_cast<int64_t*>(block->data() + block_offset), bytes / sizeof(int64_t), ArrowStringDictionary::null_code);
+        offset += bytes;
+        byte_size -= bytes;
+    }
+}
+
+} //namespace arcticdb
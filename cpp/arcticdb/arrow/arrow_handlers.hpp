@@ -0,0 +1,133 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+#pragma once
+
+#include <arcticdb/entity/types.hpp>
+#include <arcticdb/util/type_handler.hpp>
+#include <arcticdb/util/offset_string.hpp>
+
+#include <ankerl/unordered_dense.h>
+
+#include <deque>
+#include <memory>
+#include <mutex>
+#include <string>
+#include <string_view>
+
+// Handlers for types that need converting when the output format is Arrow, conforming to the interface ITypeHandler
+namespace arcticdb {
+
+struct ColumnMapping;
+class Column;
+class StringPool;
+
+/*
+ * The distinct values of a single dynamic string column, accumulated across all of the segments decoded into it.
+ * Segments each have their own string pool, so the column is stored as codes into this dictionary rather than as
+ * string pool offsets, which lets the whole column be exported as dictionary-encoded Arrow arrays sharing one
+ * dictionary. Codes are assigned in order of first appearance and never change once assigned.
+ */
+class ArrowStringDictionary {
+public:
+    // Used for both None and NaN, which are indistinguishable in Arrow
+    static constexpr int64_t null_code = -1;
+
+    // Replaces the value of each string pool offset key in codes with its code in the dictionary, adding any strings
+    // not yet present. The lock is taken once per call, so segments being decoded into the same column in parallel
+    // contend once per segment rather than once per row
+    void encode(const StringPool& string_pool, ankerl::unordered_dense::map<OffsetString::offset_t, int64_t>& codes);
+
+    [[nodiscard]] size_t size() const;
+
+    // The offsets and data buffers of the dictionary as an Arrow large_utf8 array
+    [[nodiscard]] std::pair<std::vector<int64_t>, std::string> to_large_utf8() const;
+
+private:
+    mutable std::mutex mutex_;
+    // A deque so that the views used as keys in codes_ stay valid as values are added
+    std::deque<std::string> values_;
+    ankerl::unordered_dense::map<std::string_view, int64_t> codes_;
+};
+
+struct ArrowHandlerData {
+    // The dictionary for the column owning buffer, created on first use. Keyed on the buffer as that is all that
+    // default_initialize has to go on
+    std::shared_ptr<ArrowStringDictionary> dictionary(const ChunkedBuffer& buffer);
+
+    // The dictionary for the column owning buffer, or nullptr if nothing has been decoded into it
+    [[nodiscard]] std::shared_ptr<ArrowStringDictionary> find_dictionary(const ChunkedBuffer& buffer) const;
+
+private:
+    struct Dictionaries {
+        std::mutex mutex_;
+        ankerl::unordered_dense::map<const ChunkedBuffer*, std::shared_ptr<ArrowStringDictionary>> by_buffer_;
+    };
+    // std::any requires handler data to be copyable, copies share the dictionaries
+    std::shared_ptr<Dictionaries> dictionaries_ = std::make_shared<Dictionaries>();
+};
+
+inline ArrowHandlerData& get_arrow_handler_data(std::any& any) {
+    return std::any_cast<ArrowHandlerData&>(any);
+}
+
+struct ArrowHandlerDataFactory : public TypeHandlerDataFactory {
+    std::any get_data() const override {
+        return {ArrowHandlerData{}};
+    }
+};
+
+struct ArrowStringHandler {
+    void handle_type(
+        const uint8_t *&data,
+        Column& dest_column,
+        const EncodedFieldImpl &field,
+        const ColumnMapping& m,
+        const DecodePathData& shared_data,
+        std::any& handler_data,
+        EncodingVersion encoding_version,
+        const std::shared_ptr<StringPool>& string_pool
+    );
+
+    [[nodiscard]] int type_size() const;
+
+    [[nodiscard]] TypeDescriptor output_type(const TypeDescriptor& input_type) const;
+
+    void convert_type(
+        const Column& source_column,
+        Column& dest_column,
+        const ColumnMapping& mapping,
+        const DecodePathData& shared_data,
+        std::any& handler_data,
+        const std::shared_ptr<StringPool>& string_pool) const;
+
+    void default_initialize(
+        ChunkedBuffer& buffer,
+        size_t offset,
+        size_t byte_size,
+        const DecodePathData& shared_data,
+        std::any& handler_data) const;
+
+    size_t extra_rows() const {
+        return 0;
+    }
+};
+
+inline void register_arrow_string_types() {
+    using namespace arcticdb;
+    constexpr std::array<DataType, 2> string_data_types = {
+        DataType::ASCII_DYNAMIC64, DataType::UTF_DYNAMIC64};
+
+    for (auto data_type : string_data_types) {
+        TypeHandlerRegistry::instance()->register_handler(OutputFormat::ARROW, make_scalar_type(data_type), arcticdb::ArrowStringHandler());
+    }
+}
+
+inline void register_arrow_handler_data_factory() {
+    TypeHandlerRegistry::instance()->set_handler_data(OutputFormat::ARROW, std::make_unique<ArrowHandlerDataFactory>());
+}
+
+} //namespace arcticdb
@@ -0,0 +1,367 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <arcticdb/arrow/arrow_output_frame.hpp>
+#include <arcticdb/arrow/arrow_handlers.hpp>
+#include <arcticdb/column_store/column.hpp>
+#include <arcticdb/entity/performance_tracing.hpp>
+#include <arcticdb/util/preconditions.hpp>
+
+#include <algorithm>
+#include <cstring>
+
+namespace arcticdb {
+
+namespace {
+
+// Everything an exported array points at. Freed by the release callback, so its lifetime is controlled by the consumer
+struct ArrayPrivateData {
+    std::vector<std::unique_ptr<uint8_t[]>> owned_buffers_;
+    // Dictionary buffers, which are shared by the arrays for every block of a column
+    std::shared_ptr<const void> shared_buffers_;
+    std::vector<const void*> buffers_;
+    std::vector<std::unique_ptr<ArrowArray>> children_;
+    std::vector<ArrowArray*> child_ptrs_;
+    std::unique_ptr<ArrowArray> dictionary_;
+};
+
+struct SchemaPrivateData {
+    std::string format_;
+    std::string name_;
+    std::vector<std::unique_ptr<ArrowSchema>> children_;
+    std::vector<ArrowSchema*> child_ptrs_;
+    std::unique_ptr<ArrowSchema> dictionary_;
+};
+
+void release_array(ArrowArray* array) {
+    auto* private_data = static_cast<ArrayPrivateData*>(array->private_data);
+    // Children and dictionaries may have been moved out by the consumer, in which case they are marked as released
+    for (auto& child : private_data->children_) {
+        if (child->release != nullptr)
+            child->release(child.get());
+    }
+    if (private_data->dictionary_ && private_data->dictionary_->release != nullptr)
+        private_data->dictionary_->release(private_data->dictionary_.get());
+
+    delete private_data;
+    array->release = nullptr;
+}
+
+void release_schema(ArrowSchema* schema) {
+    auto* private_data = static_cast<SchemaPrivateData*>(schema->private_data);
+    for (auto& child : private_data->children_) {
+        if (child->release != nullptr)
+            child->release(child.get());
+    }
+    if (private_data->dictionary_ && private_data->dictionary_->release != nullptr)
+        private_data->dictionary_->release(private_data->dictionary_.get());
+
+    delete private_data;
+    schema->release = nullptr;
+}
+
+std::unique_ptr<ArrowArray> make_array(int64_t length, int64_t null_count, std::unique_ptr<ArrayPrivateData> private_data) {
+    auto array = std::make_unique<ArrowArray>();
+    array->length = length;
+    array->null_count = null_count;
+    array->offset = 0;
+    array->n_buffers = static_cast<int64_t>(private_data->buffers_.size());
+    array->buffers = private_data->buffers_.empty() ? nullptr : private_data->buffers_.data();
+    for (auto& child : private_data->children_)
+        private_data->child_ptrs_.emplace_back(child.get());
+
+    array->n_children = static_cast<int64_t>(private_data->child_ptrs_.size());
+    array->children = private_data->child_ptrs_.empty() ? nullptr : private_data->child_ptrs_.data();
+    array->dictionary = private_data->dictionary_.get();
+    array->release = &release_array;
+    array->private_data = private_data.release();
+    return array;
+}
+
+std::unique_ptr<ArrowSchema> make_schema(
+        std::string format,
+        std::string name,
+        std::vector<std::unique_ptr<ArrowSchema>>&& children = {},
+        std::unique_ptr<ArrowSchema> dictionary = nullptr) {
+    auto private_data = std::make_unique<SchemaPrivateData>();
+    private_data->format_ = std::move(format);
+    private_data->name_ = std::move(name);
+    private_data->children_ = std::move(children);
+    for (auto& child : private_data->children_)
+        private_data->child_ptrs_.emplace_back(child.get());
+
+    private_data->dictionary_ = std::move(dictionary);
+
+    auto schema = std::make_unique<ArrowSchema>();
+    schema->format = private_data->format_.c_str();
+    schema->name = private_data->name_.c_str();
+    schema->metadata = nullptr;
+    schema->flags = ARROW_FLAG_NULLABLE;
+    schema->n_children = static_cast<int64_t>(private_data->child_ptrs_.size());
+    schema->children = private_data->child_ptrs_.empty() ? nullptr : private_data->child_ptrs_.data();
+    schema->dictionary = private_data->dictionary_.get();
+    schema->release = &release_schema;
+    schema->private_data = private_data.release();
+    return schema;
+}
+
+// Arrow format string for the values of a column, for dynamic strings this is the format of the dictionary codes
+std::string arrow_format(const Field& field) {
+    const auto type = field.type();
+    schema::check<ErrorCode::E_UNSUPPORTED_COLUMN_TYPE>(
+        type.dimension() == Dimension::Dim0,
+        "Column '{}' of type {} cannot be output in Arrow format, only scalar columns are supported",
+        field.name(), type);
+    switch (type.data_type()) {
+    case DataType::UINT8: return "C";
+    case DataType::UINT16: return "S";
+    case DataType::UINT32: return "I";
+    case DataType::UINT64: return "L";
+    case DataType::INT8: return "c";
+    case DataType::INT16: return "s";
+    case DataType::INT32: return "i";
+    case DataType::INT64: return "l";
+    case DataType::FLOAT32: return "f";
+    case DataType::FLOAT64: return "g";
+    case DataType::BOOL8: return "b";
+    case DataType::NANOSECONDS_UTC64: return "tsn:";
+    case DataType::ASCII_DYNAMIC64:
+    case DataType::UTF_DYNAMIC64: return "l";
+    case DataType::EMPTYVAL: return "n";
+    default:
+        schema::raise<ErrorCode::E_UNSUPPORTED_COLUMN_TYPE>(
+            "Column '{}' of type {} cannot be output in Arrow format", field.name(), type);
+    }
+}
+
+struct StringDictionaryBuffers {
+    std::vector<int64_t> offsets_;
+    std::string data_;
+};
+
+class ColumnExporter {
+public:
+    ColumnExporter(Column& column, const Field& field, std::any& handler_data) :
+        column_(column),
+        field_(field),
+        format_(arrow_format(field)) {
+        const auto data_type = field.type().data_type();
+        if (is_dynamic_string_type(data_type)) {
+            auto dictionary = get_arrow_handler_data(handler_data).find_dictionary(column.buffer());
+            // A string column with no dictionary has had nothing decoded into it, so is entirely null
+            all_null_ = !dictionary;
+            auto buffers = std::make_shared<StringDictionaryBuffers>();
+            if (dictionary) {
+                auto [offsets, data] = dictionary->to_large_utf8();
+                buffers->offsets_ = std::move(offsets);
+                buffers->data_ = std::move(data);
+            } else {
+                buffers->offsets_.emplace_back(0);
+            }
+            dictionary_ = std::move(buffers);
+        } else if (is_empty_type(data_type)) {
+            all_null_ = true;
+        }
+    }
+
+    std::unique_ptr<ArrowSchema> schema() const {
+        if (!dictionary_)
+            return make_schema(format_, std::string{field_.name()});
+
+        return make_schema(format_, std::string{field_.name()}, {}, make_schema("U", ""));
+    }
+
+    // Arrays must be requested for consecutive ranges of rows, starting from the first
+    std::unique_ptr<ArrowArray> array(size_t num_rows) {
+        auto private_data = std::make_unique<ArrayPrivateData>();
+        const auto data_type = field_.type().data_type();
+        const auto type_size = static_cast<size_t>(data_type_size(field_.type(), OutputFormat::ARROW, DataTypeMode::EXTERNAL));
+        int64_t null_count = 0;
+        if (is_empty_type(data_type)) {
+            null_count = static_cast<int64_t>(num_rows);
+        } else if (data_type == DataType::BOOL8) {
+            auto values = take(num_rows * type_size);
+            auto bitmap = std::make_unique<uint8_t[]>(std::max<size_t>((num_rows + 7) / 8, 1));
+            pack_bits(values.get(), num_rows, bitmap.get());
+            private_data->buffers_ = {nullptr, bitmap.get()};
+            private_data->owned_buffers_.emplace_back(std::move(bitmap));
+        } else if (dictionary_) {
+            auto codes = take(num_rows * type_size);
+            auto* code_ptr = reinterpret_cast<int64_t*>(codes.get());
+            std::unique_ptr<uint8_t[]> validity;
+            if (all_null_) {
+                std::fill_n(code_ptr, num_rows, 0);
+                null_count = static_cast<int64_t>(num_rows);
+                validity = std::make_unique<uint8_t[]>(std::max<size_t>((num_rows + 7) / 8, 1));
+            } else {
+                validity = make_validity(code_ptr, num_rows, null_count);
+            }
+            private_data->buffers_ = {validity.get(), codes.get()};
+            if (validity)
+                private_data->owned_buffers_.emplace_back(std::move(validity));
+            private_data->owned_buffers_.emplace_back(std::move(codes));
+            private_data->dictionary_ = dictionary_array();
+        } else {
+            auto values = take(num_rows * type_size);
+            private_data->buffers_ = {nullptr, values.get()};
+            private_data->owned_buffers_.emplace_back(std::move(values));
+        }
+        return make_array(static_cast<int64_t>(num_rows), null_count, std::move(private_data));
+    }
+
+private:
+    // Returns a buffer holding the next bytes of the column. If that is exactly one detachable block, the block is
+    // detached and returned as is, otherwise the bytes are copied. Batches are exported in order, so the blocks are
+    // walked directly rather than looked up by offset
+    std::unique_ptr<uint8_t[]> take(size_t bytes) {
+        const auto& blocks = column_.buffer().blocks();
+        while (block_index_ < blocks.size() && blocks[block_index_]->bytes() == 0)
+            ++block_index_;
+
+        if (bytes == 0)
+            return std::make_unique<uint8_t[]>(sizeof(int64_t));
+
+        util::check(block_index_ < blocks.size(), "Ran out of blocks exporting column '{}' to Arrow", field_.name());
+        if (auto* block = blocks[block_index_]; block_offset_ == 0 && block->bytes() == bytes && block->is_external() && block->owns_external_data_) {
+            ++block_index_;
+            return std::unique_ptr<uint8_t[]>(const_cast<uint8_t*>(block->release()));
+        }
+
+        ARCTICDB_DEBUG(log::version(), "Copying {} bytes of column '{}' for Arrow output", bytes, field_.name());
+        auto res = std::make_unique<uint8_t[]>(bytes);
+        size_t copied = 0;
+        while (copied < bytes) {
+            util::check(block_index_ < blocks.size(), "Ran out of blocks exporting column '{}' to Arrow", field_.name());
+            auto* block = blocks[block_index_];
+            const auto to_copy = std::min(bytes - copied, block->bytes() - block_offset_);
+            std::memcpy(res.get() + copied, block->data() + block_offset_, to_copy);
+            copied += to_copy;
+            block_offset_ += to_copy;
+            if (block_offset_ == block->bytes()) {
+                ++block_index_;
+                block_offset_ = 0;
+            }
+        }
+        return res;
+    }
+
+    static void pack_bits(const uint8_t* values, size_t num_rows, uint8_t* bitmap) {
+        std::memset(bitmap, 0, (num_rows + 7) / 8);
+        for (size_t row = 0; row < num_rows; ++row) {
+            if (values[row] != 0)
+                bitmap[row / 8] |= static_cast<uint8_t>(1U << (row % 8));
+        }
+    }
+
+    // Returns nullptr if there are no nulls. Null codes are replaced with 0, as Arrow requires codes to be valid
+    // indices into the dictionary even in null slots
+    static std::unique_ptr<uint8_t[]> make_validity(int64_t* codes, size_t num_rows, int64_t& null_count) {
+        null_count = std::count(codes, codes + num_rows, ArrowStringDictionary::null_code);
+        if (null_count == 0)
+            return nullptr;
+
+        auto validity = std::make_unique<uint8_t[]>((num_rows + 7) / 8);
+        std::memset(validity.get(), 0, (num_rows + 7) / 8);
+        for (size_t row = 0; row < num_rows; ++row) {
+            if (codes[row] == ArrowStringDictionary::null_code)
+                codes[row] = 0;
+            else
+                validity[row / 8] |= static_cast<uint8_t>(1U << (row % 8));
+        }
+        return validity;
+    }
+
+    std::unique_ptr<ArrowArray> dictionary_array() const {
+        auto private_data = std::make_unique<ArrayPrivateData>();
+        private_data->shared_buffers_ = dictionary_;
+        private_data->buffers_ = {nullptr, dictionary_->offsets_.data(), dictionary_->data_.data()};
+        const auto length = static_cast<int64_t>(dictionary_->offsets_.size() - 1);
+        return make_array(length, 0, std::move(private_data));
+    }
+
+    Column& column_;
+    const Field& field_;
+    std::string format_;
+    std::shared_ptr<StringDictionaryBuffers> dictionary_;
+    bool all_null_ = false;
+    size_t block_index_ = 0;
+    size_t block_offset_ = 0;
+};
+
+// Row counts of the record batches, taken from the block sizes of the first column. Columns whose blocks turn out
+// not to line up with these are copied rather than detached
+std::vector<size_t> batch_row_counts(const SegmentInMemory& frame) {
+    std::vector<size_t> res;
+    if (frame.num_columns() > 0) {
+        const auto& column = frame.column(0);
+        const auto type_size = static_cast<size_t>(data_type_size(column.type(), OutputFormat::ARROW, DataTypeMode::EXTERNAL));
+        for (const auto* block : column.buffer().blocks()) {
+            if (block->bytes() > 0)
+                res.emplace_back(block->bytes() / type_size);
+        }
+    }
+    // Always produce at least one batch so that consumers get the schema
+    if (res.empty())
+        res.emplace_back(0);
+
+    return res;
+}
+
+} // namespace
+
+ArrowOutputFrame::ArrowOutputFrame(SegmentInMemory&& frame, std::any& handler_data) :
+        offset_(frame.offset()) {
+    ARCTICDB_SAMPLE_DEFAULT(ArrowOutputFrameCtor)
+    const auto index_field_count = frame.descriptor().index().field_count();
+    for (size_t c = 0; c < frame.num_columns(); ++c) {
+        names_.emplace_back(frame.field(c).name());
+        if (c < index_field_count)
+            index_columns_.emplace_back(frame.field(c).name());
+    }
+
+    std::vector<ColumnExporter> exporters;
+    exporters.reserve(frame.num_columns());
+    for (size_t c = 0; c < frame.num_columns(); ++c)
+        exporters.emplace_back(frame.column(static_cast<position_t>(c)), frame.field(c), handler_data);
+
+    size_t total_rows = 0;
+    for (auto num_rows : batch_row_counts(frame)) {
+        auto batch_data = std::make_unique<ArrayPrivateData>();
+        batch_data->buffers_ = {nullptr};
+        std::vector<std::unique_ptr<ArrowSchema>> field_schemas;
+        for (auto& exporter : exporters) {
+            batch_data->children_.emplace_back(exporter.array(num_rows));
+            field_schemas.emplace_back(exporter.schema());
+        }
+        arrays_.emplace_back(make_array(static_cast<int64_t>(num_rows), 0, std::move(batch_data)));
+        schemas_.emplace_back(make_schema("+s", "", std::move(field_schemas)));
+        total_rows += num_rows;
+    }
+    ARCTICDB_DEBUG(log::version(), "Exported {} rows in {} columns as {} Arrow record batches", total_rows, names_.size(), arrays_.size());
+}
+
+ArrowOutputFrame::~ArrowOutputFrame() {
+    for (auto& array : arrays_) {
+        if (array && array->release != nullptr)
+            array->release(array.get());
+    }
+    for (auto& schema : schemas_) {
+        if (schema && schema->release != nullptr)
+            schema->release(schema.get());
+    }
+}
+
+std::vector<std::pair<uintptr_t, uintptr_t>> ArrowOutputFrame::record_batches() const {
+    std::vector<std::pair<uintptr_t, uintptr_t>> res;
+    res.reserve(arrays_.size());
+    for (size_t i = 0; i < arrays_.size(); ++i)
+        res.emplace_back(reinterpret_cast<uintptr_t>(arrays_[i].get()), reinterpret_cast<uintptr_t>(schemas_[i].get()));
+
+    return res;
+}
+
+} // namespace arcticdb
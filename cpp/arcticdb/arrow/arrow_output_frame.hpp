@@ -0,0 +1,69 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#pragma once
+
+#include <arcticdb/arrow/arrow_c_data.hpp>
+#include <arcticdb/column_store/memory_segment.hpp>
+#include <arcticdb/util/constructors.hpp>
+
+#include <any>
+#include <memory>
+#include <string>
+#include <utility>
+#include <vector>
+
+namespace arcticdb {
+
+/*
+ * A frame read with OutputFormat::ARROW, exported through the Arrow C Data Interface as one record batch per block.
+ * Frames read in this format have one detachable block per row-slice in every column, so the column arrays of each
+ * record batch take ownership of the blocks themselves rather than copying them. The only copies made are of bool
+ * columns, which Arrow packs into bitmaps, and of the string dictionaries. Dynamic string columns are exported as
+ * int64 codes into a single large_utf8 dictionary per column that is shared by all of its record batches.
+ * Float NaNs and NaT timestamps are exported as values rather than as nulls.
+ */
+class ArrowOutputFrame {
+public:
+    ArrowOutputFrame(SegmentInMemory&& frame, std::any& handler_data);
+
+    ~ArrowOutputFrame();
+
+    ARCTICDB_MOVE_ONLY_DEFAULT(ArrowOutputFrame)
+
+    [[nodiscard]] size_t num_blocks() const {
+        return arrays_.size();
+    }
+
+    // Names of all of the columns, including the index columns
+    [[nodiscard]] const std::vector<std::string>& names() const {
+        return names_;
+    }
+
+    [[nodiscard]] const std::vector<std::string>& index_columns() const {
+        return index_columns_;
+    }
+
+    // The row of the symbol that the first row of the frame corresponds to
+    [[nodiscard]] ssize_t offset() const {
+        return offset_;
+    }
+
+    // The addresses of the ArrowArray and ArrowSchema structs for each record batch. Importing them (e.g. with
+    // pyarrow.RecordBatch._import_from_c) moves their contents to the consumer, after which this frame only owns the
+    // empty structs. Anything not imported by the time this frame is destroyed is released then
+    [[nodiscard]] std::vector<std::pair<uintptr_t, uintptr_t>> record_batches() const;
+
+private:
+    std::vector<std::string> names_;
+    std::vector<std::string> index_columns_;
+    ssize_t offset_ = 0;
+    std::vector<std::unique_ptr<ArrowArray>> arrays_;
+    std::vector<std::unique_ptr<ArrowSchema>> schemas_;
+};
+
+} // namespace arcticdb
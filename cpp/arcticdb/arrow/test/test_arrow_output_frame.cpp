@@ -0,0 +1,194 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <gtest/gtest.h>
+
+#include <arcticdb/arrow/arrow_handlers.hpp>
+#include <arcticdb/arrow/arrow_output_frame.hpp>
+#include <arcticdb/column_store/column.hpp>
+#include <arcticdb/column_store/string_pool.hpp>
+#include <arcticdb/stream/index.hpp>
+#include <arcticdb/util/decode_path_data.hpp>
+
+#include <numeric>
+
+namespace {
+
+using namespace arcticdb;
+
+// Mimics allocate_chunked_frame for an Arrow read, with one detachable block per row-slice in every column
+SegmentInMemory chunked_frame(const StreamDescriptor& desc, const std::vector<size_t>& block_row_counts) {
+    register_arrow_string_types();
+    SegmentInMemory frame{desc, 0, AllocationType::DETACHABLE, Sparsity::NOT_PERMITTED, OutputFormat::ARROW, DataTypeMode::EXTERNAL};
+    for (auto& column : frame.columns()) {
+        const auto data_size = data_type_size(column->type(), OutputFormat::ARROW, DataTypeMode::EXTERNAL);
+        for (auto row_count : block_row_counts) {
+            column->allocate_data(row_count * data_size);
+            column->advance_data(row_count * data_size);
+        }
+    }
+    const auto total_rows = std::accumulate(block_row_counts.begin(), block_row_counts.end(), size_t{0});
+    frame.set_row_data(static_cast<ssize_t>(total_rows) - 1);
+    return frame;
+}
+
+template<typename T>
+T* column_data(SegmentInMemory& frame, position_t col, size_t row) {
+    return frame.column(col).buffer().ptr_cast<T>(row * sizeof(T), sizeof(T));
+}
+
+bool is_valid(const ArrowArray* array, size_t row) {
+    const auto* validity = static_cast<const uint8_t*>(array->buffers[0]);
+    return validity == nullptr || (validity[row / 8] & (1U << (row % 8))) != 0;
+}
+
+} // namespace
+
+TEST(ArrowOutputFrame, NumericColumnsDetachBlocks) {
+    auto desc = stream::TimeseriesIndex::default_index().create_stream_descriptor(NumericId{123}, {
+        scalar_field(DataType::INT64, "int"),
+        scalar_field(DataType::FLOAT64, "float"),
+    });
+    auto frame = chunked_frame(desc, {3, 2});
+    for (size_t row = 0; row < 5; ++row) {
+        *column_data<timestamp>(frame, 0, row) = static_cast<timestamp>(row * 10);
+        *column_data<int64_t>(frame, 1, row) = static_cast<int64_t>(row);
+        *column_data<double>(frame, 2, row) = static_cast<double>(row) / 2;
+    }
+    const auto* first_block_ints = column_data<int64_t>(frame, 1, 0);
+    const auto* second_block_ints = column_data<int64_t>(frame, 1, 3);
+
+    std::any handler_data{ArrowHandlerData{}};
+    ArrowOutputFrame output{std::move(frame), handler_data};
+    ASSERT_EQ(output.num_blocks(), 2);
+    ASSERT_EQ(output.names(), (std::vector<std::string>{"time", "int", "float"}));
+    ASSERT_EQ(output.index_columns(), (std::vector<std::string>{"time"}));
+
+    auto batches = output.record_batches();
+    const auto* first_array = reinterpret_cast<ArrowArray*>(batches[0].first);
+    const auto* first_schema = reinterpret_cast<ArrowSchema*>(batches[0].second);
+    ASSERT_STREQ(first_schema->format, "+s");
+    ASSERT_EQ(first_schema->n_children, 3);
+    ASSERT_STREQ(first_schema->children[0]->format, "tsn:");
+    ASSERT_STREQ(first_schema->children[1]->format, "l");
+    ASSERT_STREQ(first_schema->children[1]->name, "int");
+    ASSERT_STREQ(first_schema->children[2]->format, "g");
+
+    ASSERT_EQ(first_array->length, 3);
+    ASSERT_EQ(first_array->n_children, 3);
+    // The blocks are handed over rather than copied
+    ASSERT_EQ(first_array->children[1]->buffers[1], first_block_ints);
+    const auto* second_array = reinterpret_cast<ArrowArray*>(batches[1].first);
+    ASSERT_EQ(second_array->length, 2);
+    ASSERT_EQ(second_array->children[1]->buffers[1], second_block_ints);
+    ASSERT_EQ(static_cast<const double*>(second_array->children[2]->buffers[1])[1], 2.0);
+}
+
+TEST(ArrowOutputFrame, BoolColumnPackedToBitmap) {
+    auto desc = stream::TimeseriesIndex::default_index().create_stream_descriptor(NumericId{123}, {
+        scalar_field(DataType::BOOL8, "bool"),
+    });
+    auto frame = chunked_frame(desc, {10});
+    for (size_t row = 0; row < 10; ++row)
+        *column_data<bool>(frame, 1, row) = row % 3 == 0;
+
+    std::any handler_data{ArrowHandlerData{}};
+    ArrowOutputFrame output{std::move(frame), handler_data};
+    auto batches = output.record_batches();
+    const auto* array = reinterpret_cast<ArrowArray*>(batches[0].first)->children[1];
+    ASSERT_STREQ(reinterpret_cast<ArrowSchema*>(batches[0].second)->children[1]->format, "b");
+    const auto* bitmap = static_cast<const uint8_t*>(array->buffers[1]);
+    for (size_t row = 0; row < 10; ++row)
+        ASSERT_EQ((bitmap[row / 8] & (1U << (row % 8))) != 0, row % 3 == 0);
+}
+
+TEST(ArrowOutputFrame, StringColumnSharesDictionary) {
+    auto desc = stream::TimeseriesIndex::default_index().create_stream_descriptor(NumericId{123}, {
+        scalar_field(DataType::UTF_DYNAMIC64, "str"),
+    });
+    auto frame = chunked_frame(desc, {4, 3});
+    std::any handler_data{ArrowHandlerData{}};
+
+    // The first row-slice holds strings, the second is missing the column entirely
+    StringPool pool;
+    const std::vector<std::string> values{"b", "a", "b"};
+    std::vector<OffsetString::offset_t> offsets;
+    for (const auto& value : values)
+        offsets.emplace_back(pool.get(value).offset());
+    offsets.emplace_back(not_a_string());
+
+    ankerl::unordered_dense::map<OffsetString::offset_t, int64_t> codes;
+    for (auto offset : offsets) {
+        if (is_a_string(offset))
+            codes.try_emplace(offset, ArrowStringDictionary::null_code);
+    }
+    auto& column = frame.column(1);
+    get_arrow_handler_data(handler_data).dictionary(column.buffer())->encode(pool, codes);
+    for (size_t row = 0; row < offsets.size(); ++row)
+        *column_data<int64_t>(frame, 1, row) = is_a_string(offsets[row]) ? codes.at(offsets[row]) : ArrowStringDictionary::null_code;
+
+    ArrowStringHandler handler;
+    handler.default_initialize(column.buffer(), 4 * sizeof(int64_t), 3 * sizeof(int64_t), DecodePathData{}, handler_data);
+
+    ArrowOutputFrame output{std::move(frame), handler_data};
+    auto batches = output.record_batches();
+    ASSERT_EQ(batches.size(), 2);
+    const auto* schema = reinterpret_cast<ArrowSchema*>(batches[0].second)->children[1];
+    ASSERT_STREQ(schema->format, "l");
+    ASSERT_STREQ(schema->dictionary->format, "U");
+
+    const auto* first = reinterpret_cast<ArrowArray*>(batches[0].first)->children[1];
+    ASSERT_EQ(first->null_count, 1);
+    ASSERT_EQ(first->dictionary->length, 2);
+    const auto* dictionary_offsets = static_cast<const int64_t*>(first->dictionary->buffers[1]);
+    const auto* dictionary_data = static_cast<const char*>(first->dictionary->buffers[2]);
+    const auto* first_codes = static_cast<const int64_t*>(first->buffers[1]);
+    for (size_t row = 0; row < values.size(); ++row) {
+        ASSERT_TRUE(is_valid(first, row));
+        const auto code = first_codes[row];
+        ASSERT_EQ(std::string_view(dictionary_data + dictionary_offsets[code], dictionary_offsets[code + 1] - dictionary_offsets[code]), values[row]);
+    }
+    ASSERT_FALSE(is_valid(first, 3));
+
+    const auto* second = reinterpret_cast<ArrowArray*>(batches[1].first)->children[1];
+    ASSERT_EQ(second->null_count, 3);
+    // Every batch refers to the same dictionary data
+    ASSERT_EQ(second->dictionary->buffers[2], first->dictionary->buffers[2]);
+    const auto* second_codes = static_cast<const int64_t*>(second->buffers[1]);
+    for (size_t row = 0; row < 3; ++row) {
+        ASSERT_FALSE(is_valid(second, row));
+        ASSERT_EQ(second_codes[row], 0);
+    }
+}
+
+TEST(ArrowStringDictionary, CodesStableAcrossStringPools) {
+    ArrowStringDictionary dictionary;
+    StringPool first_pool;
+    ankerl::unordered_dense::map<OffsetString::offset_t, int64_t> first_codes;
+    const auto hello = first_pool.get("hello").offset();
+    const auto world = first_pool.get("world").offset();
+    first_codes.try_emplace(hello, ArrowStringDictionary::null_code);
+    first_codes.try_emplace(world, ArrowStringDictionary::null_code);
+    dictionary.encode(first_pool, first_codes);
+    ASSERT_EQ(dictionary.size(), 2);
+
+    StringPool second_pool;
+    ankerl::unordered_dense::map<OffsetString::offset_t, int64_t> second_codes;
+    const auto second_world = second_pool.get("world").offset();
+    const auto again = second_pool.get("again").offset();
+    second_codes.try_emplace(second_world, ArrowStringDictionary::null_code);
+    second_codes.try_emplace(again, ArrowStringDictionary::null_code);
+    dictionary.encode(second_pool, second_codes);
+    ASSERT_EQ(dictionary.size(), 3);
+    ASSERT_EQ(second_codes.at(second_world), first_codes.at(world));
+    ASSERT_EQ(second_codes.at(again), 2);
+
+    auto [offsets, data] = dictionary.to_large_utf8();
+    ASSERT_EQ(offsets.size(), 4);
+    ASSERT_EQ(data.substr(offsets[second_codes.at(again)], offsets[3] - offsets[2]), "again");
+    ASSERT_EQ(offsets.back(), static_cast<int64_t>(data.size()));
+}
@@ -379,12 +379,15 @@ std::vector<folly::Future<pipelines::SegmentAndSlice>> batch_read_uncompressed(
         std::shared_ptr<std::unordered_set<std::string>> columns_to_decode) override {
     ARCTICDB_RUNTIME_DEBUG(log::version(), "Reading {} keys", ranges_and_keys.size());
     std::vector<folly::Future<pipelines::SegmentAndSlice>> output;
+    // Lets storages that support ranged reads fetch only the columns that DecodeSliceTask will decode
+    storage::ReadKeyOpts opts;
+    opts.columns_ = columns_to_decode;
     for(auto&& ranges_and_key : ranges_and_keys) {
         const auto key = ranges_and_key.key_;
         output.emplace_back(read_and_continue(
             key,
             library_,
-            storage::ReadKeyOpts{},
+            opts,
             DecodeSliceTask{std::move(ranges_and_key), columns_to_decode}));
     }
     return output;
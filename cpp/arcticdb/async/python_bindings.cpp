@@ -8,6 +8,7 @@
 #include <arcticdb/python/python_utils.hpp>
 #include <arcticdb/async/python_bindings.hpp>
 #include <arcticdb/async/task_scheduler.hpp>
+#include <arcticdb/async/segment_cache.hpp>
 
 namespace py = pybind11;
 
@@ -31,6 +32,16 @@ void register_bindings(py::module &m) {
     async.def("io_thread_count", []() {
         return arcticdb::async::TaskScheduler::instance()->io_thread_count();
     });
+
+    async.def("set_segment_cache_size", [](size_t max_bytes) {
+        arcticdb::async::SegmentCache::instance()->set_capacity_bytes(max_bytes);
+    }, "Set the maximum total size of the compressed segments cached by the process, where 0 disables the cache");
+    async.def("segment_cache_stats", []() {
+        return arcticdb::async::SegmentCache::instance()->stats();
+    });
+    async.def("clear_segment_cache", []() {
+        arcticdb::async::SegmentCache::instance()->clear();
+    });
 }
 
 } // namespace arcticdb::async
@@ -0,0 +1,90 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <arcticdb/async/segment_cache.hpp>
+#include <arcticdb/util/configs_map.hpp>
+
+namespace arcticdb::async {
+
+std::shared_ptr<SegmentCache> SegmentCache::instance() {
+    std::call_once(SegmentCache::init_flag_, &SegmentCache::init);
+    return SegmentCache::instance_;
+}
+
+void SegmentCache::destroy_instance() {
+    if(instance_)
+        instance_->clear();
+    instance_.reset();
+}
+
+void SegmentCache::init() {
+    instance_ = std::make_shared<SegmentCache>(
+        static_cast<size_t>(ConfigsMap::instance()->get_int("SegmentCache.MaxBytes", 0)));
+}
+
+SegmentCache::SegmentCache(size_t capacity_bytes) :
+    cache_(capacity_bytes),
+    enabled_(capacity_bytes > 0) {
+    foreach_key_type([this](KeyType key_type) {
+        if(is_ref_key_class(key_type))
+            return;
+
+        const auto default_policy = key_type == KeyType::TABLE_DATA ? 1 : 0;
+        cached_key_types_[static_cast<size_t>(key_type)] = ConfigsMap::instance()->get_int(
+            fmt::format("SegmentCache.KeyType.{}", key_type_long_name(key_type)), default_policy) == 1;
+    });
+}
+
+std::string SegmentCache::cache_key(const std::string& library_name, const VariantKey& key) {
+    return fmt::format("{}/{}", library_name, to_atom(key));
+}
+
+bool SegmentCache::caches(const VariantKey& key) const {
+    return enabled_ && cached_key_types_[static_cast<size_t>(variant_key_type(key))];
+}
+
+std::optional<Segment> SegmentCache::get(const std::string& library_name, const VariantKey& key) {
+    auto segment = cache_.get(cache_key(library_name, key));
+    if(!segment)
+        return std::nullopt;
+
+    ARCTICDB_DEBUG(log::storage(), "Segment cache hit for key {}", variant_key_view(key));
+    return (*segment)->clone();
+}
+
+void SegmentCache::put(const std::string& library_name, const VariantKey& key, const Segment& segment) {
+    const auto bytes = segment.buffer_bytes();
+    auto cached = std::make_shared<const Segment>(segment.clone());
+    if(!cache_.put(cache_key(library_name, key), std::move(cached), bytes))
+        ARCTICDB_DEBUG(log::storage(), "Segment for key {} of {} bytes is too large to cache", variant_key_view(key), bytes);
+}
+
+void SegmentCache::remove(const std::string& library_name, const VariantKey& key) {
+    cache_.remove(cache_key(library_name, key));
+}
+
+size_t SegmentCache::capacity_bytes() const {
+    return cache_.capacity_bytes();
+}
+
+void SegmentCache::set_capacity_bytes(size_t capacity_bytes) {
+    enabled_ = capacity_bytes > 0;
+    cache_.set_capacity_bytes(capacity_bytes);
+}
+
+void SegmentCache::clear() {
+    cache_.clear();
+}
+
+LRUCacheStats SegmentCache::stats() const {
+    return cache_.stats();
+}
+
+std::shared_ptr<SegmentCache> SegmentCache::instance_;
+std::once_flag SegmentCache::init_flag_;
+
+} // namespace arcticdb::async
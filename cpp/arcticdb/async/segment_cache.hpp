@@ -0,0 +1,80 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#pragma once
+
+#include <arcticdb/codec/segment.hpp>
+#include <arcticdb/entity/key.hpp>
+#include <arcticdb/entity/variant_key.hpp>
+#include <arcticdb/util/constructors.hpp>
+#include <arcticdb/util/lru_cache.hpp>
+
+#include <array>
+#include <atomic>
+#include <memory>
+#include <mutex>
+#include <optional>
+#include <string>
+
+namespace arcticdb::async {
+
+/*
+ * A cache of the compressed segments read from storage, shared by every library in the process. Atom keys are never
+ * rewritten once written, so a segment read for one call can be handed to later calls that read the same key, such
+ * as repeated reads, heads and tails of the same version of a symbol. Entries are keyed on the name of the storage
+ * and the full atom key, including its content hash, and the least recently used are evicted once the total size of
+ * the cached segments would exceed SegmentCache.MaxBytes.
+ *
+ * Segments are cached compressed rather than decoded, because the columns that are decoded depend on the read, and
+ * because the read pipeline takes ownership of the decoded segments. Every hit copies the compressed bytes, which
+ * costs far less than fetching them from storage again.
+ *
+ * The cache is disabled unless SegmentCache.MaxBytes is set. Whether a key type is cached is set by
+ * SegmentCache.KeyType.<long name of the key type>, e.g. SegmentCache.KeyType.tdata, and only data keys are cached by
+ * default. Ref keys are overwritten in place, so are never cached.
+ */
+class SegmentCache {
+    static std::shared_ptr<SegmentCache> instance_;
+    static std::once_flag init_flag_;
+
+    static void init();
+
+    SizeBoundedLRUCache<std::string, std::shared_ptr<const Segment>> cache_;
+    std::atomic<bool> enabled_;
+    std::array<bool, static_cast<size_t>(KeyType::UNDEFINED)> cached_key_types_{};
+
+    static std::string cache_key(const std::string& library_name, const VariantKey& key);
+
+public:
+    static std::shared_ptr<SegmentCache> instance();
+    static void destroy_instance();
+
+    // Reads the key types to cache from the config
+    explicit SegmentCache(size_t capacity_bytes);
+
+    ARCTICDB_NO_MOVE_OR_COPY(SegmentCache)
+
+    [[nodiscard]] bool caches(const VariantKey& key) const;
+
+    // Returns a copy of the cached segment, which the caller is free to modify
+    [[nodiscard]] std::optional<Segment> get(const std::string& library_name, const VariantKey& key);
+
+    void put(const std::string& library_name, const VariantKey& key, const Segment& segment);
+
+    void remove(const std::string& library_name, const VariantKey& key);
+
+    [[nodiscard]] size_t capacity_bytes() const;
+
+    // Setting the capacity to zero disables the cache
+    void set_capacity_bytes(size_t capacity_bytes);
+
+    void clear();
+
+    [[nodiscard]] LRUCacheStats stats() const;
+};
+
+} // namespace arcticdb::async
@@ -10,6 +10,7 @@
 #include <arcticdb/entity/atom_key.hpp>
 #include <arcticdb/storage/library.hpp>
 #include <arcticdb/storage/storage_options.hpp>
+#include <arcticdb/storage/column_range_reads.hpp>
 #include <arcticdb/storage/store.hpp>
 #include <arcticdb/storage/key_segment_pair.hpp>
 #include <arcticdb/entity/types.hpp>
@@ -22,6 +23,7 @@
 #include <arcticdb/stream/stream_sink.hpp>
 #include <arcticdb/async/base_task.hpp>
 #include <arcticdb/async/bit_rate_stats.hpp>
+#include <arcticdb/async/segment_cache.hpp>
 #include <arcticdb/pipeline/frame_slice.hpp>
 #include <arcticdb/processing/processing_unit.hpp>
 #include <arcticdb/util/constructors.hpp>
@@ -231,6 +233,21 @@ struct KeySegmentContinuation {
 };
 
 inline folly::Future<storage::KeySegmentPair> read_dispatch(entity::VariantKey&& variant_key, const std::shared_ptr<storage::Library>& lib, const storage::ReadKeyOpts& opts) {
+    auto segment_cache = SegmentCache::instance();
+    // Segments fetched with ranged reads only hold some of the columns, so must not be cached
+    if(segment_cache->caches(variant_key)) {
+        auto library_name = lib->name();
+        if(auto segment = segment_cache->get(library_name, variant_key))
+            return folly::makeFuture(storage::KeySegmentPair{std::move(variant_key), std::move(*segment)});
+
+        if(!storage::use_column_range_reads(variant_key, opts)) {
+            return lib->read(variant_key, opts).thenValueInline(
+                [segment_cache=std::move(segment_cache), library_name=std::move(library_name)](storage::KeySegmentPair&& key_seg) {
+                    segment_cache->put(library_name, key_seg.variant_key(), key_seg.segment());
+                    return std::move(key_seg);
+                });
+        }
+    }
     return util::variant_match(variant_key, [&lib, &opts](auto&& key) {
         return lib->read(key, opts);
     });
@@ -636,6 +653,9 @@ struct RemoveTask : BaseTask {
     ARCTICDB_MOVE_ONLY_DEFAULT(RemoveTask)
 
     stream::StreamSink::RemoveKeyResultType operator()() {
+        if(auto segment_cache = SegmentCache::instance(); segment_cache->caches(key_))
+            segment_cache->remove(lib_->name(), key_);
+
         lib_->remove(std::move(key_), opts_);
         return {};
     }
@@ -660,6 +680,13 @@ struct RemoveBatchTask : BaseTask {
 
 
     std::vector<stream::StreamSink::RemoveKeyResultType> operator()() {
+        if(auto segment_cache = SegmentCache::instance(); segment_cache->capacity_bytes() > 0) {
+            const auto library_name = lib_->name();
+            for(const auto& key : keys_) {
+                if(segment_cache->caches(key))
+                    segment_cache->remove(library_name, key);
+            }
+        }
         lib_->remove(std::span(keys_), opts_);
         return {};
     }
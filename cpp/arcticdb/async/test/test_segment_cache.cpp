@@ -0,0 +1,132 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <gtest/gtest.h>
+#include <arcticdb/async/segment_cache.hpp>
+#include <arcticdb/async/tasks.hpp>
+#include <arcticdb/async/task_scheduler.hpp>
+#include <arcticdb/storage/config_resolvers.hpp>
+#include <arcticdb/storage/library_index.hpp>
+#include <arcticdb/storage/storage_exceptions.hpp>
+#include <arcticdb/stream/test/stream_test_common.hpp>
+#include <arcticdb/util/test/config_common.hpp>
+
+using namespace arcticdb;
+namespace aa = arcticdb::async;
+namespace as = arcticdb::storage;
+
+namespace {
+Segment test_segment(size_t num_rows) {
+    auto segment_in_memory = get_test_frame<stream::TimeseriesIndex>("symbol", {}, num_rows, 0).segment_;
+    auto segment = encode_dispatch(std::move(segment_in_memory), proto::encoding::VariantCodec{}, EncodingVersion::V2);
+    (void)segment.calculate_size();
+    return segment;
+}
+
+VariantKey data_key(const StreamId& stream_id, VersionId version_id) {
+    return atom_key_builder().version_id(version_id).content_hash(version_id).build(stream_id, KeyType::TABLE_DATA);
+}
+}
+
+TEST(SegmentCache, GetReturnsCopies) {
+    aa::SegmentCache cache{1 << 20};
+    const auto key = data_key("sym", 1);
+    ASSERT_TRUE(cache.caches(key));
+    ASSERT_FALSE(cache.get("lib", key).has_value());
+
+    auto segment = test_segment(10);
+    cache.put("lib", key, segment);
+    auto first = cache.get("lib", key);
+    ASSERT_TRUE(first.has_value());
+    ASSERT_EQ(first->buffer_bytes(), segment.buffer_bytes());
+    ASSERT_NE(first->buffer().data(), segment.buffer().data());
+
+    auto second = cache.get("lib", key);
+    ASSERT_NE(first->buffer().data(), second->buffer().data());
+    ASSERT_EQ(memcmp(first->buffer().data(), second->buffer().data(), first->buffer_bytes()), 0);
+
+    // Keys are scoped to the storage they were read from
+    ASSERT_FALSE(cache.get("other_lib", key).has_value());
+
+    const auto stats = cache.stats();
+    ASSERT_EQ(stats.hits_, 2U);
+    ASSERT_EQ(stats.misses_, 2U);
+    ASSERT_EQ(stats.entries_, 1U);
+    ASSERT_EQ(stats.bytes_, segment.buffer_bytes());
+
+    cache.remove("lib", key);
+    ASSERT_FALSE(cache.get("lib", key).has_value());
+}
+
+TEST(SegmentCache, EvictsBySize) {
+    const auto segment_bytes = test_segment(100).buffer_bytes();
+    aa::SegmentCache cache{segment_bytes * 2};
+    for(auto i = 0U; i < 3; ++i)
+        cache.put("lib", data_key("sym", i), test_segment(100));
+
+    ASSERT_FALSE(cache.get("lib", data_key("sym", 0)).has_value());
+    ASSERT_TRUE(cache.get("lib", data_key("sym", 1)).has_value());
+    ASSERT_TRUE(cache.get("lib", data_key("sym", 2)).has_value());
+    ASSERT_EQ(cache.stats().evictions_, 1U);
+
+    cache.set_capacity_bytes(0);
+    ASSERT_FALSE(cache.caches(data_key("sym", 1)));
+    ASSERT_EQ(cache.stats().entries_, 0U);
+}
+
+TEST(SegmentCache, KeyTypePolicies) {
+    aa::SegmentCache disabled{0};
+    ASSERT_FALSE(disabled.caches(data_key("sym", 1)));
+
+    aa::SegmentCache cache{1 << 20};
+    ASSERT_FALSE(cache.caches(atom_key_builder().build(StreamId{"sym"}, KeyType::TABLE_INDEX)));
+    ASSERT_FALSE(cache.caches(RefKey{"sym", KeyType::VERSION_REF}));
+
+    ScopedConfig cache_index_keys("SegmentCache.KeyType.tindex", 1);
+    ScopedConfig cache_data_keys("SegmentCache.KeyType.tdata", 0);
+    aa::SegmentCache configured{1 << 20};
+    ASSERT_TRUE(configured.caches(atom_key_builder().build(StreamId{"sym"}, KeyType::TABLE_INDEX)));
+    ASSERT_FALSE(configured.caches(data_key("sym", 1)));
+}
+
+TEST(SegmentCache, ReadDispatch) {
+    as::EnvironmentName environment_name{"research"};
+    as::StorageName storage_name("lmdb_local");
+    as::LibraryPath library_path{"segment", "cache"};
+    auto env_config = get_test_environment_config(library_path, storage_name, environment_name);
+    auto config_resolver = as::create_in_memory_resolver(env_config);
+    as::LibraryIndex library_index{environment_name, config_resolver};
+    as::UserAuth au{"abc"};
+    auto lib = library_index.get_library(library_path, as::OpenMode::DELETE, au, as::NativeVariantStorage());
+
+    auto segment_cache = aa::SegmentCache::instance();
+    segment_cache->set_capacity_bytes(1 << 20);
+    segment_cache->clear();
+    const auto initial_stats = segment_cache->stats();
+
+    auto key = data_key("sym", 1);
+    auto segment = test_segment(10);
+    const auto segment_bytes = segment.buffer_bytes();
+    as::KeySegmentPair key_seg{VariantKey{key}, std::move(segment)};
+    lib->write(key_seg);
+
+    auto first = aa::read_dispatch(VariantKey{key}, lib, as::ReadKeyOpts{}).get();
+    ASSERT_EQ(first.segment().buffer_bytes(), segment_bytes);
+    ASSERT_EQ(segment_cache->stats().misses_, initial_stats.misses_ + 1);
+
+    // Served from the cache even once the key has been removed behind its back
+    lib->remove(VariantKey{key}, as::RemoveOpts{});
+    auto second = aa::read_dispatch(VariantKey{key}, lib, as::ReadKeyOpts{}).get();
+    ASSERT_EQ(second.segment().buffer_bytes(), segment_bytes);
+    ASSERT_EQ(segment_cache->stats().hits_, initial_stats.hits_ + 1);
+
+    // Removing through the tasks evicts the key
+    aa::RemoveTask{key, lib, as::RemoveOpts{true}}();
+    ASSERT_THROW(aa::read_dispatch(VariantKey{key}, lib, as::ReadKeyOpts{}).get(), as::KeyNotFoundException);
+
+    segment_cache->set_capacity_bytes(0);
+}
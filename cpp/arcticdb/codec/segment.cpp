@@ -194,6 +194,61 @@ void set_body_fields(SegmentHeader& seg_hdr, const uint8_t* src) {
     }
 }
 
+size_t serialized_header_bytes(const uint8_t* src) {
+    auto* fixed_hdr = reinterpret_cast<const FixedHeader*>(src);
+    util::check_arg(fixed_hdr->magic_number == MAGIC_NUMBER, "expected first 2 bytes: {}, actual {}", fixed_hdr->magic_number, MAGIC_NUMBER);
+    return FIXED_HEADER_SIZE + fixed_hdr->header_bytes;
+}
+
+std::optional<size_t> serialized_footer_offset(const uint8_t* src) {
+    const auto header_bytes = serialized_header_bytes(src);
+    if(reinterpret_cast<const FixedHeader*>(src)->encoding_version != HEADER_VERSION_V2)
+        return std::nullopt;
+
+    SegmentHeader seg_hdr;
+    seg_hdr.deserialize_from_bytes(src + FIXED_HEADER_SIZE, false);
+    if(!seg_hdr.has_column_fields())
+        return std::nullopt;
+
+    return header_bytes + seg_hdr.footer_offset();
+}
+
+SegmentColumnLayout serialized_column_layout(const uint8_t* src, const uint8_t* footer) {
+    const auto header_bytes = serialized_header_bytes(src);
+    util::check(reinterpret_cast<const FixedHeader*>(src)->encoding_version == HEADER_VERSION_V2, "Column layout is only available for V2 encoded segments");
+    SegmentHeader seg_hdr;
+    seg_hdr.deserialize_from_bytes(src + FIXED_HEADER_SIZE, false);
+    seg_hdr.set_body_fields(deserialize_body_fields(seg_hdr, footer));
+    const auto& encoded_fields = seg_hdr.body_fields();
+
+    size_t string_pool_bytes = sizeof(StringPoolMagic);
+    if(seg_hdr.has_string_pool_field())
+        string_pool_bytes += encoding_sizes::field_compressed_size(seg_hdr.string_pool_field());
+
+    size_t column_bytes = 0UL;
+    std::vector<size_t> column_sizes;
+    column_sizes.reserve(encoded_fields.size());
+    for(auto field = encoded_fields.begin(); column_sizes.size() < encoded_fields.size(); ++field) {
+        column_sizes.emplace_back(sizeof(ColumnMagic) + encoding_sizes::field_compressed_size(*field));
+        column_bytes += column_sizes.back();
+    }
+
+    // The string pool is written immediately before the footer, and the columns immediately before that
+    const auto footer_offset = header_bytes + seg_hdr.footer_offset();
+    util::check(column_bytes + string_pool_bytes <= seg_hdr.footer_offset(),
+                "Column bytes {} and string pool bytes {} exceed the body size {}", column_bytes, string_pool_bytes, seg_hdr.footer_offset());
+    SegmentColumnLayout layout;
+    layout.string_pool_ = {footer_offset - string_pool_bytes, string_pool_bytes};
+    auto pos = layout.string_pool_.offset_ - column_bytes;
+    layout.preamble_ = {header_bytes, pos - header_bytes};
+    layout.columns_.reserve(column_sizes.size());
+    for(auto column_size : column_sizes) {
+        layout.columns_.emplace_back(SegmentByteRange{pos, column_size});
+        pos += column_size;
+    }
+    return layout;
+}
+
 Segment Segment::from_bytes(const std::uint8_t* src, std::size_t readable_size, bool copy_data /* = false */) {
     ARCTICDB_SAMPLE(SegmentFromBytes, 0)
     util::check(src != nullptr, "Got null data ptr from segment");
@@ -61,6 +61,40 @@ inline EncodingVersion encoding_version(const storage::LibraryDescriptor::Varian
 }
 void set_body_fields(SegmentHeader& seg_hdr, const uint8_t* src);
 
+// A range of bytes within a serialized segment, relative to the start of its fixed header
+struct SegmentByteRange {
+    size_t offset_ = 0UL;
+    size_t length_ = 0UL;
+
+    [[nodiscard]] size_t end() const {
+        return offset_ + length_;
+    }
+};
+
+/*
+ * Where each part of the body of a serialized V2 segment lives. Calculated from the header and the encoded fields in
+ * the footer, which hold the compressed size of every column, so that storages supporting ranged reads can fetch
+ * just the columns that are needed.
+ */
+struct SegmentColumnLayout {
+    // Metadata and descriptors, which are needed to decode any column
+    SegmentByteRange preamble_;
+    // One range per field in the descriptor, each starting with its ColumnMagic
+    std::vector<SegmentByteRange> columns_;
+    // Starts with the StringPoolMagic
+    SegmentByteRange string_pool_;
+};
+
+// Size of the fixed and variable headers of the serialized segment at src, which must hold at least FIXED_HEADER_SIZE bytes
+size_t serialized_header_bytes(const uint8_t* src);
+
+// Offset of the footer of the serialized segment whose full header is at src, or std::nullopt if the segment is V1
+// encoded or has no column data, in which case there is no column layout to read
+std::optional<size_t> serialized_footer_offset(const uint8_t* src);
+
+// src holds the full header of a serialized V2 segment and footer the bytes starting at serialized_footer_offset
+SegmentColumnLayout serialized_column_layout(const uint8_t* src, const uint8_t* footer);
+
 /*
  * Segment contains compressed data as returned from storage. When reading data the next step will usually be to
  * decompress the Segment into a SegmentInMemory which allows for data access and modification. At the time of writing,
@@ -14,6 +14,8 @@
 #include <arcticdb/storage/test/in_memory_store.hpp>
 #include <arcticdb/pipeline/index_writer.hpp>
 #include <arcticdb/codec/codec.hpp>
+#include <arcticdb/util/configs_map.hpp>
+#include <arcticdb/util/key_utils.hpp>
 
 namespace arcticdb {
 using namespace arcticdb::pipelines;
@@ -257,4 +259,59 @@ TEST(IndexFilter, StaticMulticolumnFilterColumns) {
     ASSERT_EQ(pipeline_context->slice_and_keys_[4].key_, slice_and_keys[16].key_);
     ASSERT_EQ(pipeline_context->slice_and_keys_[5].key_, slice_and_keys[92].key_);
     ASSERT_EQ(pipeline_context->slice_and_keys_[9].key_, slice_and_keys[96].key_);
-}
\ No newline at end of file
+}
+
+TEST(IndexFilter, PagedIndex) {
+    using namespace arcticdb;
+    using namespace arcticdb::pipelines;
+
+    ScopedConfig page_rows("VersionStore.IndexPageRows", 3);
+    const auto stream_id = StreamId{"thing"};
+    const auto version_id = VersionId{0};
+
+    auto [metadata, slice_and_keys] = get_sample_slice_and_key(stream_id, version_id);
+
+    const IndexPartialKey& partial_key{stream_id, version_id};
+    auto mock_store = std::make_shared<InMemoryStore>();
+    index::IndexWriter<stream::RowCountIndex> writer(mock_store, partial_key, std::move(metadata));
+
+    for (auto &slice_and_key : slice_and_keys) {
+        writer.add(slice_and_key.key(), slice_and_key.slice());
+    }
+    auto key = std::move(writer.commit()).get();
+
+    // Ten rows in pages of three
+    auto top_level = mock_store->read(key, storage::ReadKeyOpts{}).get().second;
+    ASSERT_TRUE(index::is_paged_index(top_level));
+    ASSERT_EQ(top_level.row_count(), 4);
+
+    auto isr = index::get_index_reader(key, mock_store);
+    ASSERT_FALSE(index::is_paged_index(isr.seg()));
+    ASSERT_EQ(isr.size(), slice_and_keys.size());
+    for (auto i = 0u; i < slice_and_keys.size(); ++i) {
+        ASSERT_EQ(isr.row(i).key(), slice_and_keys[i].key());
+        ASSERT_EQ(isr.row(i).slice().row_range.first, slice_and_keys[i].slice().row_range.first);
+    }
+
+    // Only the pages that can contain the range are read
+    auto by_index = index::read_index_pages(
+        mock_store, SegmentInMemory{top_level}, std::nullopt, IndexRange{NumericIndex{25}, NumericIndex{55}});
+    ASSERT_EQ(by_index.row_count(), 6);
+    auto by_row = index::read_index_pages(mock_store, SegmentInMemory{top_level}, RowRange{95, 100});
+    ASSERT_EQ(by_row.row_count(), 1);
+    ASSERT_EQ(index::IndexSegmentReader{std::move(by_row)}.row(0).key(), slice_and_keys.back().key());
+
+    // The pages have their own key type, so are never mistaken for versions of the symbol
+    auto num_table_index_keys = 0;
+    mock_store->iterate_type(KeyType::TABLE_INDEX, [&num_table_index_keys](VariantKey&&) { ++num_table_index_keys; });
+    ASSERT_EQ(num_table_index_keys, 1);
+
+    // The pages are found when recursing the index, as they must be deleted with it
+    auto keys = recurse_index_keys(mock_store, std::vector<AtomKey>{key}, storage::ReadKeyOpts{});
+    ASSERT_EQ(keys.size(), slice_and_keys.size() + 4);
+    ASSERT_EQ(std::ranges::count_if(keys, [](const auto& k) { return k.type() == KeyType::TABLE_INDEX_PAGE; }), 4);
+
+    // Only the data keys are returned as the data keys of the index
+    auto data_keys = get_data_keys(mock_store, key, storage::ReadKeyOpts{});
+    ASSERT_EQ(data_keys.size(), slice_and_keys.size());
+}
@@ -42,6 +42,7 @@ KeyData get_key_data(KeyType key_type) {
     STRING_REF(KeyType::VERSION_REF, vref, 'r')
     STRING_KEY(KeyType::TABLE_DATA, tdata, 'd')
     STRING_KEY(KeyType::TABLE_INDEX, tindex, 'i')
+    STRING_KEY(KeyType::TABLE_INDEX_PAGE, tipage, 'e')
     STRING_KEY(KeyType::VERSION, ver, 'V')
     STRING_KEY(KeyType::VERSION_JOURNAL, vj, 'v')
     STRING_KEY(KeyType::SNAPSHOT, snap, 's')
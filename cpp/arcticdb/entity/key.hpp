@@ -192,6 +192,11 @@ enum class KeyType : int {
      * Used for a list based reliable storage lock
      */
     ATOMIC_LOCK = 28,
+    /*
+     * Contains a page of the rows of a large TABLE_INDEX key, see VersionStore.IndexPageRows. Only referenced from the
+     * segment of the TABLE_INDEX key it belongs to, so never listed as a version of the symbol.
+     */
+    TABLE_INDEX_PAGE = 29,
     UNDEFINED
 };
 
@@ -201,6 +206,7 @@ consteval auto key_types_write_precedence() {
     return std::array {
         KeyType::LIBRARY_CONFIG,
         KeyType::TABLE_DATA,
+        KeyType::TABLE_INDEX_PAGE,
         KeyType::TABLE_INDEX,
         KeyType::MULTI_KEY,
         KeyType::VERSION,
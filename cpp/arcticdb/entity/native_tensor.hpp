@@ -13,6 +13,8 @@
 
 // for std::accumulate
 #include <numeric>
+#include <optional>
+#include <string_view>
 
 #include <pybind11/numpy.h>
 
@@ -24,6 +26,21 @@ inline ssize_t calc_elements(const shape_t* shape, ssize_t ndim) {
     return std::accumulate(shape, shape + ndim, ssize_t(1), std::multiplies<ssize_t>());
 }
 
+/*
+ * The distinct values of a string column supplied in Arrow format, as the offsets and data buffers of an Arrow
+ * large_string array. The tensor holding the column then contains int64 codes into these values, with negative codes
+ * for missing values, rather than pointers to Python strings.
+ */
+struct StringDictionary {
+    const int64_t* offsets_;
+    const char* data_;
+    size_t size_;
+
+    [[nodiscard]] std::string_view at(int64_t code) const {
+        return {data_ + offsets_[code], static_cast<size_t>(offsets_[code + 1] - offsets_[code])};
+    }
+};
+
 /*
  * A wrapper around a 1D or 2D tensor that provides a more convenient interface for accessing the data
  * in the tensor. This is used to pass data between the Python and C++ layers.
@@ -77,7 +94,8 @@ struct NativeTensor {
     dt_(other.dt_),
     elsize_(other.elsize_),
     ptr(other.ptr),
-    expanded_dim_(other.expanded_dim_){
+    expanded_dim_(other.expanded_dim_),
+    string_dictionary_(other.string_dictionary_){
         for (ssize_t i = 0; i < std::min(MaxDimensions, ndim_); ++i)
             shapes_[i] = other.shapes_[i];
 
@@ -94,6 +112,7 @@ struct NativeTensor {
         swap(left.elsize_, right.elsize_);
         swap(left.ptr, right.ptr);
         swap(left.expanded_dim_, right.expanded_dim_);
+        swap(left.string_dictionary_, right.string_dictionary_);
         for(ssize_t i = 0; i < MaxDimensions; ++i) {
             swap(left.shapes_[i], right.shapes_[i]);
             swap(left.strides_[i], right.strides_[i]);
@@ -117,6 +136,8 @@ struct NativeTensor {
     [[nodiscard]] const void* data() const { magic_.check(); return ptr; }
     [[nodiscard]] auto extent(ssize_t dim) const { return shapes_[dim] * strides_[dim]; }
     [[nodiscard]] auto expanded_dim() const { return expanded_dim_; }
+    [[nodiscard]] const std::optional<StringDictionary>& string_dictionary() const { return string_dictionary_; }
+    void set_string_dictionary(StringDictionary string_dictionary) { string_dictionary_ = string_dictionary; }
     template<typename T>
     const T *ptr_cast(size_t pos) const {
         util::check(ptr != nullptr, "Unexpected null ptr in NativeTensor");
@@ -155,6 +176,7 @@ struct NativeTensor {
     /// API providing the strides and shapes arrays, expanded_dim is what ArcticDB thinks of the tensor and using it
     /// can lead to out of bounds reads from strides and shapes.
     int expanded_dim_;
+    std::optional<StringDictionary> string_dictionary_;
 };
 
 template <ssize_t> ssize_t byte_offset_impl(const stride_t* ) { return 0; }
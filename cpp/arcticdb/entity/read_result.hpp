@@ -13,6 +13,7 @@
 #include <arcticdb/entity/protobufs.hpp>
 #include <arcticdb/entity/frame_and_descriptor.hpp>
 #include <arcticdb/pipeline/python_output_frame.hpp>
+#include <arcticdb/arrow/arrow_output_frame.hpp>
 #include <arcticdb/util/memory_tracing.hpp>
 
 #include <vector>
@@ -45,12 +46,27 @@ struct ARCTICDB_VISIBILITY_HIDDEN ReadResult {
     ARCTICDB_MOVE_ONLY_DEFAULT(ReadResult)
 };
 
-inline ReadResult create_python_read_result(
-    const VersionedItem& version,
-    OutputFormat output_format,
-    FrameAndDescriptor&& fd) {
-    auto result = std::move(fd);
+struct ARCTICDB_VISIBILITY_HIDDEN ArrowReadResult {
+    ArrowReadResult(
+            const VersionedItem& versioned_item,
+            ArrowOutputFrame&& frame_data,
+            const arcticdb::proto::descriptors::NormalizationMetadata& norm_meta,
+            const arcticdb::proto::descriptors::UserDefinedMetadata& user_meta) :
+            item(versioned_item),
+            frame_data(std::move(frame_data)),
+            norm_meta(norm_meta),
+            user_meta(user_meta) {
+
+    }
+    VersionedItem item;
+    ArrowOutputFrame frame_data;
+    arcticdb::proto::descriptors::NormalizationMetadata norm_meta;
+    arcticdb::proto::descriptors::UserDefinedMetadata user_meta;
 
+    ARCTICDB_MOVE_ONLY_DEFAULT(ArrowReadResult)
+};
+
+inline void patch_legacy_range_index(FrameAndDescriptor& result) {
     // Very old (pre Nov-2020) PandasIndex protobuf messages had no "start" or "step" fields. If is_physically_stored
     // (renamed from is_not_range_index) was false, the index was always RangeIndex(num_rows, 1)
     // This used to be handled in the Python layer by passing None to the DataFrame index parameter, which would then
@@ -71,6 +87,14 @@ inline ReadResult create_python_read_result(
             }
         }
     }
+}
+
+inline ReadResult create_python_read_result(
+    const VersionedItem& version,
+    OutputFormat output_format,
+    FrameAndDescriptor&& fd) {
+    auto result = std::move(fd);
+    patch_legacy_range_index(result);
 
     auto python_frame = pipelines::PythonOutputFrame{result.frame_, output_format};
     util::print_total_mem_usage(__FILE__, __LINE__, __FUNCTION__);
@@ -80,4 +104,17 @@ inline ReadResult create_python_read_result(
             desc_proto.user_meta(), desc_proto.multi_key_meta(), std::move(result.keys_)};
 }
 
+// handler_data must be the Arrow handler data that the frame was read with, as it holds the string dictionaries
+inline ArrowReadResult create_arrow_read_result(
+    const VersionedItem& version,
+    FrameAndDescriptor&& fd,
+    std::any& handler_data) {
+    auto result = std::move(fd);
+    patch_legacy_range_index(result);
+
+    auto arrow_frame = ArrowOutputFrame{std::move(result.frame_), handler_data};
+    const auto& desc_proto = result.desc_.proto();
+    return {version, std::move(arrow_frame), desc_proto.normalization(), desc_proto.user_meta()};
+}
+
 } //namespace arcticdb
\ No newline at end of file
@@ -25,6 +25,9 @@ struct VersionedItem {
     VersionedItem() = default;
 
     entity::AtomKey key_;
+    // Populated by reads: the number of data segments that were not fetched as column stats showed they could not
+    // contain any rows matching the query's filters
+    uint64_t segments_skipped_ = 0;
 
     std::string symbol() const { return fmt::format("{}", key_.id()); }
     uint64_t version() const { return key_.version_id(); }
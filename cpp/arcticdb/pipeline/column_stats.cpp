@@ -4,10 +4,16 @@
 #include <arcticdb/processing/unsorted_aggregation.hpp>
 #include <arcticdb/entity/type_utils.hpp>
 #include <arcticdb/util/preconditions.hpp>
+#include <arcticdb/util/configs_map.hpp>
+#include <arcticdb/stream/merge_utils.hpp>
+#include <arcticdb/util/bloom_filter.hpp>
 
 #include <third_party/semimap/semimap.h>
 
+#include <algorithm>
 #include <charconv>
+#include <cmath>
+#include <compare>
 
 namespace arcticdb {
 
@@ -42,6 +48,8 @@ SegmentInMemory merge_column_stats_segments(const std::vector<SegmentInMemory>&
         merged.add_column(FieldRef{*type_descriptor, field_names.at(type_descriptor.index)}, 0, AllocationType::DYNAMIC);
     }
     for (auto &segment : segments) {
+        // append does not merge string pools, so remap any string columns (e.g. bloom filters) into the merged pool first
+        merge_string_columns(segment, merged.string_pool_ptr(), false);
         merged.append(segment);
     }
     merged.set_compacted(true);
@@ -52,7 +60,9 @@ SegmentInMemory merge_column_stats_segments(const std::vector<SegmentInMemory>&
 // Needed as MINMAX maps to 2 columns in the column stats object
 enum class ColumnStatTypeInternal {
     MIN,
-    MAX
+    MAX,
+    BLOOM_FILTER,
+    DISTINCT
 };
 
 std::string type_to_operator_string(ColumnStatTypeInternal type) {
@@ -60,6 +70,8 @@ std::string type_to_operator_string(ColumnStatTypeInternal type) {
     using TypeToOperatorStringMap = semi::static_map<ColumnStatTypeInternal, std::string, Tag>;
     TypeToOperatorStringMap::get(ColumnStatTypeInternal::MIN) = "MIN";
     TypeToOperatorStringMap::get(ColumnStatTypeInternal::MAX) = "MAX";
+    TypeToOperatorStringMap::get(ColumnStatTypeInternal::BLOOM_FILTER) = "BLOOM_FILTER";
+    TypeToOperatorStringMap::get(ColumnStatTypeInternal::DISTINCT) = "DISTINCT";
     internal::check<ErrorCode::E_ASSERTION_FAILURE>(TypeToOperatorStringMap::contains(type), "Unknown column stat type requested");
     return TypeToOperatorStringMap::get(type);
 }
@@ -96,11 +108,13 @@ std::string to_segment_column_name(const std::string& column,
 }
 
 // Expected to be of the form "<operation>(<column name>)"
-std::pair<std::string, ColumnStatType> from_segment_column_name_v1(std::string_view pattern) {
+std::pair<std::string, ColumnStatTypeInternal> internal_type_from_segment_column_name_v1(std::string_view pattern) {
     const semi::map<std::string, ColumnStatType> name_to_type_map;
     const ankerl::unordered_dense::map<std::string, ColumnStatTypeInternal> operator_string_to_type {
         {"MIN", ColumnStatTypeInternal::MIN},
-        {"MAX", ColumnStatTypeInternal::MAX}
+        {"MAX", ColumnStatTypeInternal::MAX},
+        {"BLOOM_FILTER", ColumnStatTypeInternal::BLOOM_FILTER},
+        {"DISTINCT", ColumnStatTypeInternal::DISTINCT}
     };
     std::optional<ColumnStatTypeInternal> type;
     for (const auto& [name, type_candidate]: operator_string_to_type) {
@@ -114,17 +128,26 @@ std::pair<std::string, ColumnStatType> from_segment_column_name_v1(std::string_v
     internal::check<ErrorCode::E_ASSERTION_FAILURE>(
             pattern.find('(') == 0 && pattern.rfind(')') == pattern.size() - 1,
             "Unexpected column stat column format: {}", pattern);
+    return std::make_pair(std::string(pattern.substr(1, pattern.size() - 2)), *type);
+}
+
+std::pair<std::string, ColumnStatType> from_segment_column_name_v1(std::string_view pattern) {
+    auto [column, type] = internal_type_from_segment_column_name_v1(pattern);
     struct Tag{};
     using InternalToExternalColumnStatType = semi::static_map<ColumnStatTypeInternal, ColumnStatType, Tag>;
     InternalToExternalColumnStatType::get(ColumnStatTypeInternal::MIN) = ColumnStatType::MINMAX;
     InternalToExternalColumnStatType::get(ColumnStatTypeInternal::MAX) = ColumnStatType::MINMAX;
-    return std::make_pair(std::string(pattern.substr(1, pattern.size() - 2)), InternalToExternalColumnStatType::get(*type));
+    InternalToExternalColumnStatType::get(ColumnStatTypeInternal::BLOOM_FILTER) = ColumnStatType::BLOOM_FILTER;
+    InternalToExternalColumnStatType::get(ColumnStatTypeInternal::DISTINCT) = ColumnStatType::DISTINCT;
+    return std::make_pair(std::move(column), InternalToExternalColumnStatType::get(type));
 }
 
 std::string type_to_name(ColumnStatType type) {
     struct Tag{};
     using TypeToNameMap = semi::static_map<ColumnStatType, std::string, Tag>;
     TypeToNameMap::get(ColumnStatType::MINMAX) = "MINMAX";
+    TypeToNameMap::get(ColumnStatType::BLOOM_FILTER) = "BLOOM_FILTER";
+    TypeToNameMap::get(ColumnStatType::DISTINCT) = "DISTINCT";
     internal::check<ErrorCode::E_ASSERTION_FAILURE>(TypeToNameMap::contains(type), "Unknown column stat type requested");
     return TypeToNameMap::get(type);
 }
@@ -133,6 +156,8 @@ std::optional<ColumnStatType> name_to_type(const std::string& name) {
     // Cannot use static_map here as keys come from user input
     semi::map<std::string, ColumnStatType> name_to_type_map;
     name_to_type_map.get("MINMAX") = ColumnStatType::MINMAX;
+    name_to_type_map.get("BLOOM_FILTER") = ColumnStatType::BLOOM_FILTER;
+    name_to_type_map.get("DISTINCT") = ColumnStatType::DISTINCT;
     return name_to_type_map.contains(name) ? std::make_optional<ColumnStatType>(name_to_type_map.get(name)) : std::nullopt;
 }
 
@@ -198,6 +223,8 @@ ankerl::unordered_dense::set<std::string> ColumnStats::segment_column_names() co
     struct Tag{};
     using ExternalToInternalColumnStatType = semi::static_map<ColumnStatType, std::unordered_set<ColumnStatTypeInternal>, Tag>;
     ExternalToInternalColumnStatType::get(ColumnStatType::MINMAX) = std::unordered_set<ColumnStatTypeInternal>{ColumnStatTypeInternal::MIN, ColumnStatTypeInternal::MAX};
+    ExternalToInternalColumnStatType::get(ColumnStatType::BLOOM_FILTER) = std::unordered_set<ColumnStatTypeInternal>{ColumnStatTypeInternal::BLOOM_FILTER};
+    ExternalToInternalColumnStatType::get(ColumnStatType::DISTINCT) = std::unordered_set<ColumnStatTypeInternal>{ColumnStatTypeInternal::DISTINCT};
     ankerl::unordered_dense::set<std::string> res;
     for (const auto& [column, column_stat_types]: column_stats_) {
         for (const auto& column_stat_type: column_stat_types) {
@@ -238,6 +265,20 @@ std::optional<Clause> ColumnStats::clause() const {
                                              ColumnName(to_segment_column_name(column, ColumnStatTypeInternal::MAX)))
                                              );
                     break;
+                case ColumnStatType::BLOOM_FILTER:
+                    index_generation_aggregators->emplace_back(
+                            BloomFilterAggregator(ColumnName(column),
+                                                  ColumnName(to_segment_column_name(column, ColumnStatTypeInternal::BLOOM_FILTER)),
+                                                  ConfigsMap::instance()->get_int("ColumnStats.BloomFilterBits", 4096))
+                                                  );
+                    break;
+                case ColumnStatType::DISTINCT:
+                    index_generation_aggregators->emplace_back(
+                            DistinctValuesAggregator(ColumnName(column),
+                                                     ColumnName(to_segment_column_name(column, ColumnStatTypeInternal::DISTINCT)),
+                                                     ConfigsMap::instance()->get_int("ColumnStats.MaxDistinctValues", 64))
+                                                     );
+                    break;
                 default:
                     internal::raise<ErrorCode::E_ASSERTION_FAILURE>("Unrecognised ColumnStatType");
             }
@@ -293,4 +334,383 @@ std::pair<std::string, ColumnStatType> ColumnStats::from_segment_column_name(
     }
 }
 
+namespace {
+
+std::optional<HashedValue> value_membership_hash(const Value& value, DataType column_type) {
+    if (is_sequence_type(column_type)) {
+        if (is_dynamic_string_type(value.data_type_)) {
+            return membership_hash(std::string_view(*value.str_data(), value.len()));
+        }
+    } else if ((is_numeric_type(column_type) || is_bool_type(column_type)) &&
+               (is_numeric_type(value.data_type_) || is_bool_type(value.data_type_))) {
+        return details::visit_type(value.data_type_, [&value](auto value_tag) -> std::optional<HashedValue> {
+            using RawType = typename ScalarTypeInfo<decltype(value_tag)>::RawType;
+            if constexpr (std::is_arithmetic_v<RawType>) {
+                const auto as_double = static_cast<double>(value.get<RawType>());
+                if (!std::isnan(as_double)) {
+                    return membership_hash(as_double);
+                }
+            }
+            return std::nullopt;
+        });
+    }
+    // Comparisons between incompatible types are handled (or rejected) by the filter itself
+    return std::nullopt;
+}
+
+std::optional<std::vector<HashedValue>> value_set_membership_hashes(ValueSet& value_set, DataType column_type) {
+    std::vector<HashedValue> res;
+    if (value_set.empty()) {
+        return res;
+    }
+    const auto value_set_type = value_set.base_type().data_type();
+    if (is_sequence_type(column_type) && is_sequence_type(value_set_type)) {
+        for (const auto& value: *value_set.get_set<std::string>()) {
+            res.emplace_back(membership_hash(std::string_view(value)));
+        }
+    } else if ((is_numeric_type(column_type) || is_bool_type(column_type)) && is_numeric_type(value_set_type)) {
+        for (auto value: *value_set.get_set<double>()) {
+            if (!std::isnan(value)) {
+                res.emplace_back(membership_hash(value));
+            }
+        }
+    } else {
+        return std::nullopt;
+    }
+    return res;
+}
+
+using NumericValue = std::variant<int64_t, uint64_t, double>;
+
+std::optional<NumericValue> to_numeric_value(const Value& value) {
+    if (!is_numeric_type(value.data_type_) && !is_bool_type(value.data_type_)) {
+        return std::nullopt;
+    }
+    return details::visit_type(value.data_type_, [&value](auto value_tag) -> std::optional<NumericValue> {
+        using RawType = typename ScalarTypeInfo<decltype(value_tag)>::RawType;
+        if constexpr (std::is_floating_point_v<RawType>) {
+            return NumericValue{static_cast<double>(value.get<RawType>())};
+        } else if constexpr (std::is_unsigned_v<RawType>) {
+            return NumericValue{static_cast<uint64_t>(value.get<RawType>())};
+        } else if constexpr (std::is_signed_v<RawType>) {
+            return NumericValue{static_cast<int64_t>(value.get<RawType>())};
+        } else {
+            return std::nullopt;
+        }
+    });
+}
+
+// Mirrors the type promotion used when filtering: comparisons are exact between integers of any signedness, and in
+// double precision if either side is floating point. nullopt if either side is NaN
+std::optional<std::strong_ordering> compare_numeric(const NumericValue& left, const NumericValue& right) {
+    return std::visit([](auto l, auto r) -> std::optional<std::strong_ordering> {
+        using L = decltype(l);
+        using R = decltype(r);
+        if constexpr (std::is_same_v<L, double> || std::is_same_v<R, double>) {
+            const auto l_double = static_cast<double>(l);
+            const auto r_double = static_cast<double>(r);
+            if (std::isnan(l_double) || std::isnan(r_double)) {
+                return std::nullopt;
+            }
+            return l_double < r_double ? std::strong_ordering::less :
+                   l_double > r_double ? std::strong_ordering::greater : std::strong_ordering::equal;
+        } else if constexpr (std::is_same_v<L, R>) {
+            return l <=> r;
+        } else if constexpr (std::is_same_v<L, int64_t>) {
+            return l < 0 ? std::strong_ordering::less : static_cast<uint64_t>(l) <=> r;
+        } else {
+            return r < 0 ? std::strong_ordering::greater : l <=> static_cast<uint64_t>(r);
+        }
+    }, left, right);
+}
+
+// Rewrites "value <op> column" as "column <op'> value"
+OperationType flip_comparison(OperationType operation_type) {
+    switch (operation_type) {
+        case OperationType::LT:
+            return OperationType::GT;
+        case OperationType::LE:
+            return OperationType::GE;
+        case OperationType::GT:
+            return OperationType::LT;
+        case OperationType::GE:
+            return OperationType::LE;
+        default:
+            return operation_type;
+    }
+}
+
+RowsMatch rows_match_not(RowsMatch operand) {
+    switch (operand) {
+        case RowsMatch::NONE:
+            return RowsMatch::ALL;
+        case RowsMatch::ALL:
+            return RowsMatch::NONE;
+        default:
+            return RowsMatch::SOME;
+    }
+}
+
+RowsMatch rows_match_and(RowsMatch left, RowsMatch right) {
+    if (left == RowsMatch::NONE || right == RowsMatch::NONE) {
+        return RowsMatch::NONE;
+    }
+    return left == RowsMatch::ALL && right == RowsMatch::ALL ? RowsMatch::ALL : RowsMatch::SOME;
+}
+
+RowsMatch rows_match_or(RowsMatch left, RowsMatch right) {
+    if (left == RowsMatch::ALL || right == RowsMatch::ALL) {
+        return RowsMatch::ALL;
+    }
+    return left == RowsMatch::NONE && right == RowsMatch::NONE ? RowsMatch::NONE : RowsMatch::SOME;
+}
+
+} // namespace
+
+ColumnStatsFilter::ColumnStatsFilter(
+        SegmentInMemory&& column_stats_segment,
+        const StreamDescriptor& data_descriptor,
+        bool dynamic_schema) :
+        column_stats_segment_(std::move(column_stats_segment)),
+        dynamic_schema_(dynamic_schema) {
+    for (const auto& field: data_descriptor.fields()) {
+        column_types_.emplace(field.name(), field.type().data_type());
+    }
+    std::optional<position_t> start_index_column;
+    std::optional<position_t> end_index_column;
+    for (const auto& field: folly::enumerate(column_stats_segment_.descriptor().fields())) {
+        const auto position = static_cast<position_t>(field.index);
+        const auto name = field->name();
+        if (name == start_index_column_name) {
+            start_index_column = position;
+        } else if (name == end_index_column_name) {
+            end_index_column = position;
+        } else if (auto underscore_position = name.find('_'); name.find("v1.") == 0 && underscore_position != std::string_view::npos) {
+            // Only version 1 stats are understood here, any other columns are ignored rather than used incorrectly
+            auto [column, type] = internal_type_from_segment_column_name_v1(name.substr(underscore_position + 1));
+            auto& stat_columns = stat_columns_[column];
+            switch (type) {
+                case ColumnStatTypeInternal::MIN:
+                    stat_columns.min_ = position;
+                    break;
+                case ColumnStatTypeInternal::MAX:
+                    stat_columns.max_ = position;
+                    break;
+                case ColumnStatTypeInternal::BLOOM_FILTER:
+                    stat_columns.bloom_filter_ = position;
+                    break;
+                case ColumnStatTypeInternal::DISTINCT:
+                    stat_columns.distinct_ = position;
+                    break;
+            }
+        }
+    }
+    internal::check<ErrorCode::E_ASSERTION_FAILURE>(
+            start_index_column.has_value() && end_index_column.has_value(),
+            "Column stats segment missing start or end index column");
+    for (size_t row = 0; row < column_stats_segment_.row_count(); ++row) {
+        auto start_index = column_stats_segment_.scalar_at<timestamp>(static_cast<position_t>(row), *start_index_column);
+        auto end_index = column_stats_segment_.scalar_at<timestamp>(static_cast<position_t>(row), *end_index_column);
+        if (start_index.has_value() && end_index.has_value()) {
+            auto [it, inserted] = rows_.try_emplace(std::make_pair(*start_index, *end_index), static_cast<position_t>(row));
+            if (!inserted) {
+                it->second.reset();
+            }
+        }
+    }
+}
+
+bool ColumnStatsFilter::may_match(timestamp start_index, timestamp end_index, const ExpressionContext& expression_context) const {
+    auto it = rows_.find(std::make_pair(start_index, end_index));
+    if (it == rows_.end() || !it->second.has_value()) {
+        return true;
+    }
+    return evaluate(*it->second, expression_context.root_node_name_, expression_context) != RowsMatch::NONE;
+}
+
+RowsMatch ColumnStatsFilter::evaluate(position_t row, const VariantNode& node, const ExpressionContext& expression_context) const {
+    if (!std::holds_alternative<ExpressionName>(node)) {
+        return RowsMatch::SOME;
+    }
+    const auto expression_node = expression_context.expression_nodes_.get_value(std::get<ExpressionName>(node).value);
+    const auto& left = expression_node->left_;
+    const auto& right = expression_node->right_;
+    const auto operation_type = expression_node->operation_type_;
+    switch (operation_type) {
+        case OperationType::NOT:
+            return rows_match_not(evaluate(row, left, expression_context));
+        case OperationType::AND:
+            return rows_match_and(evaluate(row, left, expression_context), evaluate(row, right, expression_context));
+        case OperationType::OR:
+            return rows_match_or(evaluate(row, left, expression_context), evaluate(row, right, expression_context));
+        case OperationType::EQ:
+        case OperationType::NE:
+        case OperationType::LT:
+        case OperationType::LE:
+        case OperationType::GT:
+        case OperationType::GE: {
+            if (std::holds_alternative<ColumnName>(left) && std::holds_alternative<ValueName>(right)) {
+                return evaluate_comparison(
+                        row,
+                        operation_type,
+                        std::get<ColumnName>(left).value,
+                        *expression_context.values_.get_value(std::get<ValueName>(right).value));
+            } else if (std::holds_alternative<ValueName>(left) && std::holds_alternative<ColumnName>(right)) {
+                return evaluate_comparison(
+                        row,
+                        flip_comparison(operation_type),
+                        std::get<ColumnName>(right).value,
+                        *expression_context.values_.get_value(std::get<ValueName>(left).value));
+            }
+            return RowsMatch::SOME;
+        }
+        case OperationType::ISIN: {
+            if (!std::holds_alternative<ColumnName>(left) || !std::holds_alternative<ValueSetName>(right)) {
+                return RowsMatch::SOME;
+            }
+            const auto& column = std::get<ColumnName>(left).value;
+            auto type_it = column_types_.find(column);
+            if (type_it == column_types_.end()) {
+                return RowsMatch::SOME;
+            }
+            auto hashes = value_set_membership_hashes(
+                    *expression_context.value_sets_.get_value(std::get<ValueSetName>(right).value),
+                    type_it->second);
+            return hashes.has_value() ? evaluate_membership(row, column, *hashes) : RowsMatch::SOME;
+        }
+        default:
+            return RowsMatch::SOME;
+    }
+}
+
+RowsMatch ColumnStatsFilter::evaluate_comparison(
+        position_t row,
+        OperationType operation_type,
+        const std::string& column,
+        const Value& value) const {
+    auto type_it = column_types_.find(column);
+    if (type_it == column_types_.end()) {
+        return RowsMatch::SOME;
+    }
+    const auto column_type = type_it->second;
+    if (operation_type == OperationType::EQ) {
+        if (auto hash = value_membership_hash(value, column_type);
+            hash.has_value() && evaluate_membership(row, column, {*hash}) == RowsMatch::NONE) {
+            return RowsMatch::NONE;
+        }
+    }
+    auto it = stat_columns_.find(column);
+    if (it == stat_columns_.end()) {
+        return RowsMatch::SOME;
+    }
+    auto min = stat_value(row, it->second.min_);
+    auto max = stat_value(row, it->second.max_);
+    if (!min.has_value() || !max.has_value()) {
+        return RowsMatch::SOME;
+    }
+    auto numeric_min = to_numeric_value(*min);
+    auto numeric_max = to_numeric_value(*max);
+    auto numeric_value = to_numeric_value(value);
+    if (!numeric_min.has_value() || !numeric_max.has_value() || !numeric_value.has_value()) {
+        return RowsMatch::SOME;
+    }
+    auto min_vs_value = compare_numeric(*numeric_min, *numeric_value);
+    auto max_vs_value = compare_numeric(*numeric_max, *numeric_value);
+    if (!min_vs_value.has_value() || !max_vs_value.has_value()) {
+        return RowsMatch::SOME;
+    }
+    bool none;
+    bool all;
+    switch (operation_type) {
+        case OperationType::EQ:
+            none = *min_vs_value > 0 || *max_vs_value < 0;
+            all = *min_vs_value == 0 && *max_vs_value == 0;
+            break;
+        case OperationType::NE:
+            none = *min_vs_value == 0 && *max_vs_value == 0;
+            all = *min_vs_value > 0 || *max_vs_value < 0;
+            break;
+        case OperationType::LT:
+            none = *min_vs_value >= 0;
+            all = *max_vs_value < 0;
+            break;
+        case OperationType::LE:
+            none = *min_vs_value > 0;
+            all = *max_vs_value <= 0;
+            break;
+        case OperationType::GT:
+            none = *max_vs_value <= 0;
+            all = *min_vs_value > 0;
+            break;
+        case OperationType::GE:
+            none = *max_vs_value < 0;
+            all = *min_vs_value >= 0;
+            break;
+        default:
+            return RowsMatch::SOME;
+    }
+    // Null rows (NaN, or missing with dynamic schema) are not covered by the min and max. They never match any of these
+    // comparisons except NE, so they rule out NONE for NE and ALL for everything else
+    const bool may_contain_nulls = is_floating_point_type(column_type) || dynamic_schema_;
+    if (none && !(may_contain_nulls && operation_type == OperationType::NE)) {
+        return RowsMatch::NONE;
+    }
+    if (all && !dynamic_schema_ && !(may_contain_nulls && operation_type != OperationType::NE)) {
+        return RowsMatch::ALL;
+    }
+    return RowsMatch::SOME;
+}
+
+RowsMatch ColumnStatsFilter::evaluate_membership(position_t row, const std::string& column, const std::vector<HashedValue>& hashes) const {
+    auto it = stat_columns_.find(column);
+    if (it == stat_columns_.end()) {
+        return RowsMatch::SOME;
+    }
+    const auto& stat_columns = it->second;
+    if (stat_columns.distinct_.has_value()) {
+        // Null if the row-slice had too many distinct values for the stat to be stored
+        if (auto distinct = column_stats_segment_.string_at(row, *stat_columns.distinct_); distinct.has_value()) {
+            std::vector<HashedValue> distinct_hashes;
+            distinct_hashes.reserve(distinct->size() / 16);
+            for (size_t pos = 0; pos < distinct->size(); pos += 16) {
+                distinct_hashes.emplace_back(hex_to_hash(distinct->substr(pos, 16)));
+            }
+            const bool any_present = std::ranges::any_of(hashes, [&distinct_hashes](HashedValue hash) {
+                return std::binary_search(distinct_hashes.begin(), distinct_hashes.end(), hash);
+            });
+            return any_present ? RowsMatch::SOME : RowsMatch::NONE;
+        }
+    }
+    if (stat_columns.bloom_filter_.has_value()) {
+        if (auto hex = column_stats_segment_.string_at(row, *stat_columns.bloom_filter_); hex.has_value()) {
+            auto bloom_filter = BloomFilter::from_hex(*hex);
+            const bool any_present = std::ranges::any_of(hashes, [&bloom_filter](HashedValue hash) {
+                return bloom_filter.may_contain(hash);
+            });
+            return any_present ? RowsMatch::SOME : RowsMatch::NONE;
+        }
+    }
+    return RowsMatch::SOME;
+}
+
+std::optional<Value> ColumnStatsFilter::stat_value(position_t row, std::optional<position_t> stat_column) const {
+    if (!stat_column.has_value()) {
+        return std::nullopt;
+    }
+    const auto data_type = column_stats_segment_.column(*stat_column).type().data_type();
+    if (!is_numeric_type(data_type) && !is_bool_type(data_type)) {
+        return std::nullopt;
+    }
+    return details::visit_type(data_type, [this, row, stat_column](auto stat_tag) -> std::optional<Value> {
+        using RawType = typename ScalarTypeInfo<decltype(stat_tag)>::RawType;
+        if constexpr (std::is_arithmetic_v<RawType>) {
+            // Absent if this row-slice did not contain the column
+            if (auto value = column_stats_segment_.scalar_at<RawType>(row, *stat_column); value.has_value()) {
+                return Value(*value, ScalarTypeInfo<decltype(stat_tag)>::data_type);
+            }
+        }
+        return std::nullopt;
+    });
+}
+
 }
\ No newline at end of file
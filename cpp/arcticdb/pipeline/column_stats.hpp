@@ -2,6 +2,7 @@
 
 #include <arcticdb/processing/clause.hpp>
 #include <arcticdb/entity/protobufs.hpp>
+#include <arcticdb/util/hash.hpp>
 #include <ankerl/unordered_dense.h>
 
 #include <map>
@@ -15,7 +16,9 @@ namespace arcticdb {
 SegmentInMemory merge_column_stats_segments(const std::vector<SegmentInMemory>& segments);
 
 enum class ColumnStatType {
-    MINMAX
+    MINMAX,
+    BLOOM_FILTER,
+    DISTINCT
 };
 
 static const char* const start_index_column_name = "start_index";
@@ -44,4 +47,47 @@ private:
 
 };
 
-}
\ No newline at end of file
+// Whether none, all, or an unknown number of the rows in a row-slice match (part of) a filter expression
+enum class RowsMatch {
+    NONE,
+    SOME,
+    ALL
+};
+
+// Uses the column stats of a symbol to identify row-slices that cannot contain any rows matching a filter expression,
+// so that they can be skipped without being read
+class ColumnStatsFilter {
+public:
+    // With dynamic schema columns may be missing from some rows, so the stats can never show that all rows match
+    ColumnStatsFilter(SegmentInMemory&& column_stats_segment, const StreamDescriptor& data_descriptor, bool dynamic_schema);
+
+    // Returns false only if the column stats prove that no row in the row-slice with the given start and end index
+    // satisfies the expression
+    [[nodiscard]] bool may_match(timestamp start_index, timestamp end_index, const ExpressionContext& expression_context) const;
+
+private:
+    struct StatColumns {
+        std::optional<position_t> min_;
+        std::optional<position_t> max_;
+        std::optional<position_t> bloom_filter_;
+        std::optional<position_t> distinct_;
+    };
+
+    SegmentInMemory column_stats_segment_;
+    bool dynamic_schema_;
+    // nullopt if more than one row-slice has the same start and end index, in which case the stats are ambiguous
+    std::map<std::pair<timestamp, timestamp>, std::optional<position_t>> rows_;
+    ankerl::unordered_dense::map<std::string, StatColumns> stat_columns_;
+    ankerl::unordered_dense::map<std::string, DataType> column_types_;
+
+    [[nodiscard]] RowsMatch evaluate(position_t row, const VariantNode& node, const ExpressionContext& expression_context) const;
+    [[nodiscard]] RowsMatch evaluate_comparison(
+            position_t row,
+            OperationType operation_type,
+            const std::string& column,
+            const Value& value) const;
+    [[nodiscard]] RowsMatch evaluate_membership(position_t row, const std::string& column, const std::vector<HashedValue>& hashes) const;
+    [[nodiscard]] std::optional<Value> stat_value(position_t row, std::optional<position_t> stat_column) const;
+};
+
+}
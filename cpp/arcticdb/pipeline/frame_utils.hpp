@@ -93,6 +93,43 @@ RawType* flatten_tensor(
     return reinterpret_cast<RawType*>(flattened_buffer->data());
 }
 
+template <typename AggregatorType>
+void set_dictionary_string_type(
+        AggregatorType& agg,
+        const entity::NativeTensor& tensor,
+        const entity::StringDictionary& dictionary,
+        size_t col,
+        size_t rows_to_write,
+        size_t row) {
+    ARCTICDB_SAMPLE_DEFAULT(SetDataDictionaryString)
+    // The codes are read straight from the tensor, no Python objects are involved so the GIL is never needed
+    const auto* codes = tensor.ptr_cast<int64_t>(row);
+    auto& column = agg.segment().column(col);
+    column.allocate_data(rows_to_write * sizeof(entity::position_t));
+    auto out_ptr = reinterpret_cast<entity::position_t*>(column.buffer().data());
+    auto& string_pool = agg.segment().string_pool();
+    // Remember where each value went in the string pool so that it is only hashed once per segment. Dense Arrow
+    // string columns have as many values as rows, in which case there is nothing to gain from this
+    std::vector<entity::position_t> pool_offsets(dictionary.size_ <= rows_to_write ? dictionary.size_ : 0, not_a_string());
+    for (size_t s = 0; s < rows_to_write; ++s) {
+        const auto code = codes[s];
+        if (code < 0) {
+            out_ptr[s] = not_a_string();
+            continue;
+        }
+        util::check(static_cast<size_t>(code) < dictionary.size_, "String code {} out of range of dictionary of size {}", code, dictionary.size_);
+        if (pool_offsets.empty()) {
+            out_ptr[s] = string_pool.get(dictionary.at(code)).offset();
+        } else {
+            auto& pool_offset = pool_offsets[code];
+            if (pool_offset == not_a_string())
+                pool_offset = string_pool.get(dictionary.at(code)).offset();
+
+            out_ptr[s] = pool_offset;
+        }
+    }
+}
+
 template <typename AggregatorType, typename TagType, typename RawType>
 std::optional<convert::StringEncodingError> set_sequence_type(
         AggregatorType& agg,
@@ -117,6 +154,8 @@ std::optional<convert::StringEncodingError> set_sequence_type(
         for (size_t s = 0; s < rows_to_write; ++s, char_data += str_stride) {
             agg.set_string_at(col, s, char_data, str_len);
         }
+    } else if (const auto& string_dictionary = tensor.string_dictionary(); string_dictionary.has_value()) {
+        set_dictionary_string_type(agg, tensor, *string_dictionary, col, rows_to_write, row);
     } else {
         auto data = const_cast<void *>(tensor.data());
         auto ptr_data = reinterpret_cast<PyObject **>(data);
@@ -12,6 +12,7 @@
 #include <arcticdb/pipeline/slicing.hpp>
 #include <arcticdb/pipeline/index_fields.hpp>
 #include <arcticdb/pipeline/query.hpp>
+#include <arcticdb/pipeline/index_writer.hpp>
 
 using namespace arcticdb::entity;
 using namespace arcticdb::stream;
@@ -21,12 +22,83 @@ namespace arcticdb::pipelines::index {
 
 IndexSegmentReader get_index_reader(const AtomKey &prev_index, const std::shared_ptr<Store> &store) {
     auto [key, seg] = store->read_sync(prev_index);
-    return index::IndexSegmentReader{std::move(seg)};
+    return index::IndexSegmentReader{read_index_pages(store, std::move(seg))};
 }
 
 folly::Future<IndexSegmentReader> async_get_index_reader(const AtomKey &prev_index, const std::shared_ptr<Store> &store) {
-    return store->read(prev_index).thenValueInline([](std::pair<VariantKey, SegmentInMemory>&& key_seg) {
-        return IndexSegmentReader{std::move(key_seg.second)};
+    return store->read(prev_index).thenValue([store](std::pair<VariantKey, SegmentInMemory>&& key_seg) {
+        return async_read_index_pages(store, std::move(key_seg.second));
+    }).thenValueInline([](SegmentInMemory&& seg) {
+        return IndexSegmentReader{std::move(seg)};
+    });
+}
+
+bool is_paged_index(const SegmentInMemory& seg) {
+    return seg.row_count() > 0 && key_type_from_segment<Fields>(seg, 0) == KeyType::TABLE_INDEX_PAGE;
+}
+
+namespace {
+
+std::vector<folly::Future<std::pair<VariantKey, SegmentInMemory>>> read_selected_pages(
+        const std::shared_ptr<Store>& store,
+        const IndexSegmentReader& top_level,
+        const std::optional<RowRange>& row_range,
+        const std::optional<entity::IndexRange>& index_range) {
+    std::vector<folly::Future<std::pair<VariantKey, SegmentInMemory>>> pages;
+    for (auto page = top_level.begin(); page != top_level.end(); ++page) {
+        const auto page_rows = page->slice().row_range;
+        if (row_range && (page_rows.first >= row_range->second || page_rows.second <= row_range->first))
+            continue;
+
+        if (index_range && !intersects(*index_range, page->key().start_index(), page->key().end_index()))
+            continue;
+
+        pages.emplace_back(store->read(page->key()));
+    }
+    ARCTICDB_DEBUG(log::version(), "Reading {} of {} index pages", pages.size(), top_level.size());
+    return pages;
+}
+
+SegmentInMemory flatten_index_pages(
+        const StreamId& stream_id,
+        const TimeseriesDescriptor& tsd,
+        std::vector<std::pair<VariantKey, SegmentInMemory>>&& pages) {
+    std::vector<SliceAndKey> rows;
+    for (auto& [_, page_seg] : pages) {
+        IndexSegmentReader page{std::move(page_seg)};
+        std::copy(page.begin(), page.end(), std::back_inserter(rows));
+    }
+    return make_index_segment(stream_id, tsd, rows.begin(), rows.end());
+}
+
+} // namespace
+
+SegmentInMemory read_index_pages(
+        const std::shared_ptr<Store>& store,
+        SegmentInMemory&& seg,
+        const std::optional<RowRange>& row_range,
+        const std::optional<entity::IndexRange>& index_range) {
+    if (!is_paged_index(seg))
+        return std::move(seg);
+
+    IndexSegmentReader top_level{std::move(seg)};
+    auto pages = folly::collect(read_selected_pages(store, top_level, row_range, index_range)).get();
+    return flatten_index_pages(top_level.seg().descriptor().id(), top_level.tsd(), std::move(pages));
+}
+
+folly::Future<SegmentInMemory> async_read_index_pages(
+        const std::shared_ptr<Store>& store,
+        SegmentInMemory&& seg,
+        const std::optional<RowRange>& row_range,
+        const std::optional<entity::IndexRange>& index_range) {
+    if (!is_paged_index(seg))
+        return folly::makeFuture(std::move(seg));
+
+    IndexSegmentReader top_level{std::move(seg)};
+    auto pages = read_selected_pages(store, top_level, row_range, index_range);
+    return folly::collect(pages).via(&async::cpu_executor()).thenValue(
+        [stream_id=top_level.seg().descriptor().id(), tsd=top_level.tsd()](auto&& key_segs) {
+            return flatten_index_pages(stream_id, tsd, std::move(key_segs));
     });
 }
 
@@ -45,7 +117,9 @@ bool IndexSegmentReader::empty() const {
 IndexRange get_index_segment_range(
     const AtomKey& prev_index,
     const std::shared_ptr<Store>& store) {
-    auto isr = get_index_reader(prev_index, store);
+    // The first and last rows of a paged index cover the first and last pages, so the pages are not needed
+    auto [key, seg] = store->read_sync(prev_index);
+    IndexSegmentReader isr{std::move(seg)};
     return IndexRange{
         isr.begin()->key().start_index(),
         isr.last()->key().end_index()
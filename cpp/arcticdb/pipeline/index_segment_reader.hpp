@@ -139,6 +139,25 @@ IndexRange get_index_segment_range(
     const AtomKey &prev_index,
     const std::shared_ptr<Store> &store);
 
+// True if the rows of the index segment refer to TABLE_INDEX_PAGE keys rather than to data keys, see
+// VersionStore.IndexPageRows
+bool is_paged_index(const SegmentInMemory& seg);
+
+// Returns the index segment unchanged if it is not paged. Otherwise reads the pages that intersect the given row and
+// index ranges, or all of them if neither is given, and returns a single index segment with their rows, carrying the
+// timeseries descriptor of the top-level index
+SegmentInMemory read_index_pages(
+    const std::shared_ptr<Store>& store,
+    SegmentInMemory&& seg,
+    const std::optional<RowRange>& row_range = std::nullopt,
+    const std::optional<entity::IndexRange>& index_range = std::nullopt);
+
+folly::Future<SegmentInMemory> async_read_index_pages(
+    const std::shared_ptr<Store>& store,
+    SegmentInMemory&& seg,
+    const std::optional<RowRange>& row_range = std::nullopt,
+    const std::optional<entity::IndexRange>& index_range = std::nullopt);
+
 
 void check_column_and_date_range_filterable(const IndexSegmentReader& index_segment_reader, const ReadQuery& read_query);
 
@@ -71,7 +71,7 @@ std::pair<index::IndexSegmentReader, std::vector<SliceAndKey>> read_index_to_vec
     const std::shared_ptr<Store> &store,
     const AtomKey &index_key) {
     auto [_, index_seg] = store->read_sync(index_key);
-    index::IndexSegmentReader index_segment_reader(std::move(index_seg));
+    index::IndexSegmentReader index_segment_reader(index::read_index_pages(store, std::move(index_seg)));
     std::vector<SliceAndKey> slice_and_keys;
     for (const auto& row : index_segment_reader)
         slice_and_keys.push_back(row);
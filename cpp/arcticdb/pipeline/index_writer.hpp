@@ -15,8 +15,65 @@
 #include <arcticdb/pipeline/index_fields.hpp>
 #include <arcticdb/pipeline/slicing.hpp>
 #include <arcticdb/pipeline/pipeline_common.hpp>
+#include <arcticdb/pipeline/index_segment_reader.hpp>
+#include <arcticdb/async/task_scheduler.hpp>
+#include <arcticdb/util/configs_map.hpp>
 
 namespace arcticdb::pipelines::index {
+
+template<typename RowBuilder>
+void set_index_row(RowBuilder& rb, const arcticdb::entity::AtomKey& key, const FrameSlice& slice, bool bucketize_columns) {
+    std::visit([&rb](auto &&val) { rb.set_scalar(int(Fields::start_index), val); }, key.start_index());
+    rb.set_scalar(int(Fields::version_id), key.version_id());
+    rb.set_scalar(int(Fields::creation_ts), key.creation_ts());
+    rb.set_scalar(int(Fields::content_hash), key.content_hash());
+    rb.set_scalar(int(Fields::index_type), static_cast<uint8_t>(stream::get_index_value_type(key)));
+
+    std::visit([&rb](auto &&val) { rb.set_scalar(int(Fields::stream_id), val); }, key.id());
+    std::visit([&rb](auto &&val) { rb.set_scalar(int(Fields::end_index), val); }, key.end_index());
+
+    rb.set_scalar(int(Fields::key_type), static_cast<char>(key.type()));
+
+    rb.set_scalar(int(Fields::start_col), slice.col_range.first);
+    rb.set_scalar(int(Fields::end_col), slice.col_range.second);
+    rb.set_scalar(int(Fields::start_row), slice.row_range.first);
+    rb.set_scalar(int(Fields::end_row), slice.row_range.second);
+
+    if(bucketize_columns) {
+        util::check(static_cast<bool>(slice.hash_bucket()) && static_cast<bool>(slice.num_buckets()),
+                    "Found no hash bucket in an index writer with bucketizing");
+        rb.set_scalar(int(Fields::hash_bucket), *slice.hash_bucket());
+        rb.set_scalar(int(Fields::num_buckets), *slice.num_buckets());
+    }
+}
+
+// Builds an index segment in memory from the given rows, without writing it
+template<typename Iterator>
+SegmentInMemory make_index_segment(const StreamId& stream_id, const TimeseriesDescriptor& tsd, Iterator begin, Iterator end) {
+    using AggregatorIndexType = stream::RowCountIndex;
+    using SliceAggregator = stream::Aggregator<AggregatorIndexType, stream::FixedSchema, stream::NeverSegmentPolicy>;
+    using Desc = stream::IndexSliceDescriptor<AggregatorIndexType>;
+
+    const bool bucketize_columns = tsd.column_groups();
+    auto slice_descriptor = Desc(stream_id, bucketize_columns);
+    SegmentInMemory output;
+    SliceAggregator agg(Desc::schema(slice_descriptor),
+        [&output](auto &&segment) {
+            output = std::forward<SegmentInMemory>(segment);
+        },
+        stream::NeverSegmentPolicy{},
+        slice_descriptor);
+    agg.segment().set_timeseries_descriptor(tsd);
+    for(auto it = begin; it != end; ++it) {
+        const SliceAndKey& sk = *it;
+        agg.start_row()([&](auto &rb) {
+            set_index_row(rb, sk.key(), sk.slice(), bucketize_columns);
+        });
+    }
+    agg.finalize();
+    return output;
+}
+
 // TODO: change the name - something like KeysSegmentWriter or KeyAggragator or  better
 template<ValidIndex Index>
 class IndexWriter {
@@ -41,40 +98,14 @@ public:
                 slice_descriptor_),
             sink_(std::move(sink)),
             key_being_committed_(folly::Future<AtomKey>::makeEmpty()),
-            key_type_(key_type) {
+            key_type_(key_type),
+            page_rows_(ConfigsMap::instance()->get_int("VersionStore.IndexPageRows", 0)) {
         agg_.segment().set_timeseries_descriptor(tsd);
     }
 
     void add_unchecked(const arcticdb::entity::AtomKey& key, const FrameSlice& slice) {
-        auto add_to_row ARCTICDB_UNUSED = [&](auto &rb) {
-            rb.set_scalar(int(Fields::version_id), key.version_id());
-            rb.set_scalar(int(Fields::creation_ts), key.creation_ts());
-            rb.set_scalar(int(Fields::content_hash), key.content_hash());
-            rb.set_scalar(int(Fields::index_type), static_cast<uint8_t>(stream::get_index_value_type(key)));
-
-            std::visit([&rb](auto &&val) { rb.set_scalar(int(Fields::stream_id), val); }, key.id());
-
-            // note that we don't se the start index since its presence is index type specific
-            std::visit([&rb](auto &&val) { rb.set_scalar(int(Fields::end_index), val); }, key.end_index());
-
-            rb.set_scalar(int(Fields::key_type), static_cast<char>(key.type()));
-
-            rb.set_scalar(int(Fields::start_col), slice.col_range.first);
-            rb.set_scalar(int(Fields::end_col), slice.col_range.second);
-            rb.set_scalar(int(Fields::start_row), slice.row_range.first);
-            rb.set_scalar(int(Fields::end_row), slice.row_range.second);
-
-            if(bucketize_columns_) {
-                util::check(static_cast<bool>(slice.hash_bucket()) && static_cast<bool>(slice.num_buckets()),
-                            "Found no hash bucket in an index writer with bucketizing");
-                rb.set_scalar(int(Fields::hash_bucket), *slice.hash_bucket());
-                rb.set_scalar(int(Fields::num_buckets), *slice.num_buckets());
-            }
-        };
-
         agg_.start_row()([&](auto &rb) {
-            std::visit([&rb](auto &&val) { rb.set_scalar(int(Fields::start_index), val); }, key.start_index());
-            add_to_row(rb);
+            set_index_row(rb, key, slice, bucketize_columns_);
         });
     }
 
@@ -121,13 +152,79 @@ private:
     void on_segment(SegmentInMemory &&s) {
         auto seg = std::move(s);
         auto key_type = key_type_.value_or(get_key_type_for_index_stream(partial_key_.id));
+        auto start = segment_start(seg);
+        auto end = segment_end(seg);
+        if(key_type == KeyType::TABLE_INDEX && page_rows_ > 0 && !bucketize_columns_
+            && seg.row_count() > static_cast<size_t>(page_rows_)) {
+            key_being_committed_ = write_paged(std::move(seg), key_type, std::move(start), std::move(end));
+            return;
+        }
+
         key_being_committed_ = sink_->write(
             key_type, partial_key_.version_id, partial_key_.id,
-                segment_start(seg), segment_end(seg), std::move(seg)).thenValue([] (auto&& variant_key) {
+                std::move(start), std::move(end), std::move(seg)).thenValue([] (auto&& variant_key) {
                     return to_atom(variant_key);
                 });
     }
 
+    // Splits a large index into pages of at most page_rows_ rows, each written as a TABLE_INDEX_PAGE key, and writes a
+    // top-level index with one row per page. The row and index ranges of each top-level row cover those of the rows
+    // in its page, so that reads of a row or date range only need the pages that intersect it.
+    folly::Future<arcticdb::entity::AtomKey> write_paged(
+            SegmentInMemory&& seg,
+            KeyType key_type,
+            IndexValue start,
+            IndexValue end) {
+        auto tsd = seg.index_descriptor();
+        IndexSegmentReader reader{std::move(seg)};
+        const auto page_rows = static_cast<size_t>(page_rows_);
+        std::vector<folly::Future<VariantKey>> page_keys;
+        std::vector<FrameSlice> page_slices;
+        for(size_t page_start = 0; page_start < reader.size(); page_start += page_rows) {
+            const auto page_end = std::min(page_start + page_rows, reader.size());
+            std::vector<SliceAndKey> rows;
+            rows.reserve(page_end - page_start);
+            for(auto row = page_start; row < page_end; ++row)
+                rows.emplace_back(reader.row(row));
+
+            auto page_start_index = rows.front().key().start_index();
+            auto page_end_index = rows.front().key().end_index();
+            FrameSlice page_slice{rows.front().slice()};
+            for(const auto& row : rows) {
+                page_start_index = std::min(page_start_index, row.key().start_index());
+                page_end_index = std::max(page_end_index, row.key().end_index());
+                const auto& slice = row.slice();
+                page_slice.col_range = ColRange{
+                    std::min(page_slice.col_range.first, slice.col_range.first),
+                    std::max(page_slice.col_range.second, slice.col_range.second)};
+                page_slice.row_range = RowRange{
+                    std::min(page_slice.row_range.first, slice.row_range.first),
+                    std::max(page_slice.row_range.second, slice.row_range.second)};
+            }
+            page_slices.emplace_back(std::move(page_slice));
+            page_keys.emplace_back(sink_->write(
+                KeyType::TABLE_INDEX_PAGE, partial_key_.version_id, partial_key_.id,
+                std::move(page_start_index), std::move(page_end_index),
+                make_index_segment(partial_key_.id, tsd, rows.begin(), rows.end())));
+        }
+
+        return folly::collect(page_keys).via(&async::cpu_executor()).thenValue(
+            [sink=sink_, partial_key=partial_key_, tsd=std::move(tsd), page_slices=std::move(page_slices), key_type,
+             start=std::move(start), end=std::move(end)] (auto&& keys) mutable {
+                std::vector<SliceAndKey> pages;
+                pages.reserve(keys.size());
+                for(auto i = 0UL; i < keys.size(); ++i)
+                    pages.emplace_back(page_slices[i], to_atom(std::move(keys[i])));
+
+                return sink->write(
+                    key_type, partial_key.version_id, partial_key.id,
+                    std::move(start), std::move(end),
+                    make_index_segment(partial_key.id, tsd, pages.begin(), pages.end()));
+            }).thenValue([] (auto&& variant_key) {
+                return to_atom(variant_key);
+            });
+    }
+
     bool bucketize_columns_ = false;
     IndexPartialKey partial_key_;
     stream::IndexSliceDescriptor<AggregatorIndexType> slice_descriptor_;
@@ -137,6 +234,7 @@ private:
     std::optional<std::size_t> current_col_ = std::nullopt;
     std::optional<std::size_t> current_row_ = std::nullopt;
     std::optional<KeyType> key_type_ = std::nullopt;
+    int64_t page_rows_ = 0;
 };
 
 
@@ -251,23 +251,6 @@ void decode_index_field(
     }
 }
 
-void handle_truncation(
-    Column& dest_column,
-    const ColumnTruncation& truncate) {
-    if(dest_column.num_blocks() == 1 && truncate.start_ && truncate.end_)
-        dest_column.truncate_single_block(*truncate.start_, *truncate.end_);
-    else if(truncate.start_)
-        dest_column.truncate_first_block(*truncate.start_);
-    else if(truncate.end_)
-        dest_column.truncate_last_block(*truncate.end_);
-}
-
-void handle_truncation(
-        Column& dest_column,
-        const ColumnMapping& mapping) {
-    handle_truncation(dest_column, mapping.truncate_);
-}
-
 void decode_or_expand(
     const uint8_t*& data,
     Column& dest_column,
@@ -313,85 +296,8 @@ void decode_or_expand(
             data += decode_field(source_type_desc, encoded_field_info, data, sink, bv, encoding_version);
         }
     }
-
-    if(mapping.requires_truncation())
-        handle_truncation(dest_column, mapping);
 }
 
-template <typename IndexValueType>
-ColumnTruncation get_truncate_range_from_index(
-    const Column& column,
-    const IndexValueType& start,
-    const IndexValueType& end,
-    std::optional<int64_t> start_offset = std::nullopt,
-    std::optional<int64_t> end_offset = std::nullopt) {
-    int64_t start_row = column.search_sorted<IndexValueType>(start, false, start_offset, end_offset);
-    int64_t end_row = column.search_sorted<IndexValueType>(end, true, start_offset, end_offset);
-    std::optional<int64_t> truncate_start;
-    std::optional<int64_t> truncate_end;
-    if((start_offset && start_row != *start_offset) || (!start_offset && start_row > 0))
-        truncate_start = start_row;
-
-    if((end_offset && end_row != *end_offset) || (!end_offset && end_row < column.row_count() - 1))
-        truncate_end = end_row;
-
-    return {truncate_start, truncate_end};
-}
-
-std::pair<std::optional<int64_t>, std::optional<int64_t>> get_truncate_range_from_rows(
-    const RowRange& row_range,
-    size_t start_offset,
-    size_t end_offset) {
-    std::optional<int64_t> truncate_start;
-    std::optional<int64_t> truncate_end;
-    if(contains(row_range, start_offset))
-        truncate_start = start_offset;
-
-    if(contains(row_range, end_offset))
-        truncate_end = end_offset;
-
-    return std::make_pair(truncate_start, truncate_end);
-}
-
-ColumnTruncation get_truncate_range(
-        const SegmentInMemory& frame,
-        const PipelineContextRow& context,
-        const ReadOptions& read_options,
-        const ReadQuery& read_query,
-        EncodingVersion encoding_version,
-        const EncodedFieldImpl& index_field,
-        const uint8_t* index_field_offset) {
-    ColumnTruncation truncate_rows;
-    if(read_options.output_format() == OutputFormat::ARROW) {
-    util::variant_match(read_query.row_filter,
-        [&truncate_rows, &frame, &context, &index_field, index_field_offset, encoding_version] (const IndexRange& index_range) {
-            const auto& time_range = static_cast<const TimestampRange&>(index_range);
-            const auto& slice_time_range =  context.slice_and_key().key().time_range();
-            if(contains(slice_time_range, time_range.first) || contains(slice_time_range, time_range.second)) {
-                if(context.fetch_index()) {
-                    const auto& index_column = frame.column(0);
-                    const auto& current_row_range = context.slice_and_key().slice().row_range;
-                    truncate_rows = get_truncate_range_from_index(index_column, time_range.first, time_range.second, current_row_range.first, current_row_range.second);
-            } else {
-                const auto& frame_index_desc = frame.descriptor().fields(0UL);
-                Column sink{frame_index_desc.type(), encoding_sizes::field_uncompressed_size(index_field), AllocationType::PRESIZED, Sparsity::PERMITTED};
-                std::optional<util::BitMagic> bv;
-                (void)decode_field(frame_index_desc.type(), index_field, index_field_offset, sink, bv, encoding_version);
-                truncate_rows = get_truncate_range_from_index(sink, time_range.first, time_range.second);
-            }
-        }
-            },
-        [&context] (const RowRange& row_range) {
-            const auto& slice_row_range = context.slice_and_key().slice().row_range;
-            get_truncate_range_from_rows(row_range, slice_row_range.start(), slice_row_range.end());
-        },
-        [] (const auto&) {
-            // Do nothing
-        });
-    }
-    return truncate_rows;
-};
-
 size_t get_field_range_compressed_size(
         size_t start_idx,
         size_t num_fields,
@@ -518,11 +424,7 @@ void decode_into_frame_static(
         decode_string_pool(hdr, string_pool_data, begin, end, context);
 
         auto& index_field = fields.at(0u);
-        const auto index_field_offset = data;
         decode_index_field(frame, index_field, data, begin, end, context, encoding_version, read_options.output_format());
-        auto truncate_range = get_truncate_range(frame, context, read_options, read_query, encoding_version, index_field, index_field_offset);
-        if(context.fetch_index() && truncate_range.requires_truncation())
-            handle_truncation(frame.column(0), truncate_range);
 
         StaticColumnMappingIterator it(context, index_fieldcount);
         if(it.invalid())
@@ -538,7 +440,6 @@ void decode_into_frame_static(
             auto field_name = context.descriptor().fields(it.source_field_pos()).name();
             auto& column = frame.column(static_cast<ssize_t>(it.dest_col()));
             ColumnMapping mapping{frame, it.dest_col(), it.source_field_pos(), context, read_options.output_format()};
-            mapping.set_truncate(truncate_range);
 
             check_type_compatibility(mapping, field_name, it.source_col(), it.dest_col());
             check_data_left_for_subsequent_fields(data, end, it, context);
@@ -655,9 +556,7 @@ void decode_into_frame_dynamic(
 
         const auto& fields = hdr.body_fields();
         auto& index_field = fields.at(0u);
-        auto index_field_offset = data;
         decode_index_field(frame, index_field, data, begin, end, context, encoding_version, read_options.output_format());
-        auto truncate_range = get_truncate_range(frame, context, read_options, read_query, encoding_version, index_field, index_field_offset);
 
         auto field_count = context.slice_and_key().slice_.col_range.diff() + index_fieldcount;
         for (auto field_col = index_fieldcount; field_col < field_count; ++field_col) {
@@ -673,7 +572,6 @@ void decode_into_frame_dynamic(
             auto& column = frame.column(static_cast<position_t>(dst_col));
             ColumnMapping mapping{frame, dst_col, field_col, context, read_options.output_format()};
             check_mapping_type_compatibility(mapping);
-            mapping.set_truncate(truncate_range);
             util::check(data != end || source_is_empty(mapping), "Reached end of input block with {} fields to decode", field_count - field_col);
 
             decode_or_expand(
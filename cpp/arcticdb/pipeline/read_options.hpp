@@ -72,6 +72,10 @@ struct ReadOptions {
         return data_->force_strings_to_fixed_;
     }
 
+    [[nodiscard]] const std::optional<bool>& optimise_string_memory() const {
+        return data_->optimise_string_memory_;
+    }
+
     [[nodiscard]] const std::optional<bool>& incompletes() const {
         return data_->incompletes_;
     }
@@ -0,0 +1,75 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <fmt/format.h>
+#include <fmt/ranges.h>
+
+#include <arcticdb/processing/asof_join.hpp>
+#include <arcticdb/util/preconditions.hpp>
+
+namespace arcticdb {
+
+std::string AsOfJoinOptions::to_string() const {
+    return fmt::format("ASOF_JOIN(by=[{}], tolerance={}, allow_exact_matches={})",
+                       fmt::join(by_, ", "),
+                       tolerance_.has_value() ? fmt::format("{}ns", *tolerance_) : "None",
+                       allow_exact_matches_);
+}
+
+AsOfJoinMatcher::AsOfJoinMatcher(AsOfJoinOptions options, std::vector<timestamp>&& right_index, std::vector<std::string>&& right_keys) :
+        options_(std::move(options)),
+        right_index_(std::move(right_index)),
+        right_keys_(std::move(right_keys)) {
+    internal::check<ErrorCode::E_ASSERTION_FAILURE>(
+            options_.by_.empty() ? right_keys_.empty() : right_keys_.size() == right_index_.size(),
+            "AsOfJoinMatcher expected {} right keys, received {}",
+            options_.by_.empty() ? 0 : right_index_.size(), right_keys_.size());
+    for (size_t idx = 1; idx < right_index_.size(); ++idx) {
+        sorting::check<ErrorCode::E_UNSORTED_DATA>(
+                right_index_[idx - 1] <= right_index_[idx],
+                "As-of join requires the right symbol to have a sorted index, {} follows {}",
+                right_index_[idx], right_index_[idx - 1]);
+    }
+}
+
+std::vector<int64_t> AsOfJoinMatcher::match(const std::vector<timestamp>& left_index, const std::vector<std::string>& left_keys) {
+    const bool has_keys = !options_.by_.empty();
+    internal::check<ErrorCode::E_ASSERTION_FAILURE>(
+            has_keys ? left_keys.size() == left_index.size() : left_keys.empty(),
+            "AsOfJoinMatcher expected {} left keys, received {}", has_keys ? left_index.size() : 0, left_keys.size());
+    std::vector<int64_t> matches(left_index.size(), NO_JOIN_MATCH);
+    for (size_t idx = 0; idx < left_index.size(); ++idx) {
+        const auto ts = left_index[idx];
+        sorting::check<ErrorCode::E_UNSORTED_DATA>(
+                !last_left_ts_.has_value() || ts >= *last_left_ts_,
+                "As-of join requires the left symbol to have a sorted index, {} follows {}", ts, last_left_ts_.value_or(0));
+        last_left_ts_ = ts;
+        while (right_position_ < right_index_.size() &&
+               (options_.allow_exact_matches_ ? right_index_[right_position_] <= ts : right_index_[right_position_] < ts)) {
+            if (has_keys) {
+                latest_by_key_[right_keys_[right_position_]] = static_cast<int64_t>(right_position_);
+            } else {
+                latest_ = static_cast<int64_t>(right_position_);
+            }
+            ++right_position_;
+        }
+        int64_t candidate{latest_};
+        if (has_keys) {
+            const auto it = latest_by_key_.find(left_keys[idx]);
+            candidate = it == latest_by_key_.end() ? NO_JOIN_MATCH : it->second;
+        }
+        if (candidate != NO_JOIN_MATCH &&
+            options_.tolerance_.has_value() &&
+            ts - right_index_[candidate] > *options_.tolerance_) {
+            candidate = NO_JOIN_MATCH;
+        }
+        matches[idx] = candidate;
+    }
+    return matches;
+}
+
+} //namespace arcticdb
@@ -0,0 +1,59 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#pragma once
+
+#include <cstdint>
+#include <optional>
+#include <string>
+#include <vector>
+
+#include <ankerl/unordered_dense.h>
+
+#include <arcticdb/entity/types.hpp>
+#include <arcticdb/processing/join_utils.hpp>
+
+namespace arcticdb {
+
+struct AsOfJoinOptions {
+    // Columns that must be equal on both sides for rows to match, in addition to the index
+    std::vector<std::string> by_;
+    // Maximum distance in nanoseconds between a left index value and its matched right index value
+    std::optional<timestamp> tolerance_;
+    // Whether a right row with exactly the same index value as the left row can be matched
+    bool allow_exact_matches_{true};
+
+    [[nodiscard]] std::string to_string() const;
+};
+
+/*
+ * Backward as-of matching, equivalent to pd.merge_asof(left, right, left_index=True, right_index=True,
+ * direction="backward"). Construction takes the index values (and by keys if any) of all of the right rows, in order.
+ * Left rows are then fed one row slice at a time, and for each left row the position of the last right row with the
+ * same key and an index value <= (or < if exact matches are not allowed) the left index value is output. Both sides
+ * are walked exactly once, with the most recent right row seen for each key carried between calls to match, in the
+ * same way that WindowAggregatorState carries its window between row slices.
+ */
+class AsOfJoinMatcher {
+public:
+    AsOfJoinMatcher(AsOfJoinOptions options, std::vector<timestamp>&& right_index, std::vector<std::string>&& right_keys);
+
+    // left_keys must either be empty (if there are no by columns) or have the same length as left_index
+    [[nodiscard]] std::vector<int64_t> match(const std::vector<timestamp>& left_index, const std::vector<std::string>& left_keys);
+
+private:
+    AsOfJoinOptions options_;
+    std::vector<timestamp> right_index_;
+    std::vector<std::string> right_keys_;
+    size_t right_position_{0};
+    std::optional<timestamp> last_left_ts_;
+    // Most recent right row seen for each key, only used if there are by columns
+    ankerl::unordered_dense::map<std::string, int64_t> latest_by_key_;
+    int64_t latest_{NO_JOIN_MATCH};
+};
+
+} //namespace arcticdb
@@ -0,0 +1,218 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <string>
+#include <type_traits>
+#include <unordered_map>
+#include <unordered_set>
+
+#include <fmt/format.h>
+
+#include <arcticdb/processing/categorical_utils.hpp>
+#include <arcticdb/processing/expression_context.hpp>
+#include <arcticdb/processing/operation_types.hpp>
+#include <arcticdb/util/variant.hpp>
+
+namespace arcticdb {
+
+namespace {
+
+// Missing values in a categorical column have code -1, so no stored row has this code
+constexpr int64_t UNMATCHED_CATEGORY_CODE = -2;
+
+struct CategoryCodes {
+    std::unordered_map<std::string, int64_t> string_codes_;
+    std::unordered_map<uint64_t, int64_t> int_codes_;
+    bool is_string_{true};
+};
+
+using CategoricalColumns = std::unordered_map<std::string, CategoryCodes>;
+
+CategoricalColumns get_categorical_columns(const arcticdb::proto::descriptors::NormalizationMetadata& norm_meta) {
+    CategoricalColumns categorical_columns;
+    const arcticdb::proto::descriptors::NormalizationMetadata::Pandas* common{nullptr};
+    if (norm_meta.has_df())
+        common = &norm_meta.df().common();
+    else if (norm_meta.has_series())
+        common = &norm_meta.series().common();
+    else
+        return categorical_columns;
+
+    for (const auto& [column_name, categories]: common->categories()) {
+        auto& codes = categorical_columns[column_name];
+        for (int64_t code = 0; code < categories.category_size(); ++code)
+            codes.string_codes_.try_emplace(categories.category(static_cast<int>(code)), code);
+    }
+    for (const auto& [column_name, categories]: common->int_categories()) {
+        auto& codes = categorical_columns[column_name];
+        codes.is_string_ = false;
+        for (int64_t code = 0; code < categories.category_size(); ++code)
+            codes.int_codes_.try_emplace(categories.category(static_cast<int>(code)), code);
+    }
+    return categorical_columns;
+}
+
+std::optional<int64_t> code_for_value(const CategoryCodes& codes, const Value& value) {
+    if (codes.is_string_ && value.has_sequence_type()) {
+        auto it = codes.string_codes_.find(std::string(*value.str_data(), value.len()));
+        return it == codes.string_codes_.end() ? UNMATCHED_CATEGORY_CODE : it->second;
+    } else if (!codes.is_string_ && is_integer_type(value.data_type_)) {
+        int64_t code{UNMATCHED_CATEGORY_CODE};
+        details::visit_type(value.data_type_, [&codes, &value, &code](auto data_type_tag) {
+            using RawType = typename ScalarTypeInfo<decltype(data_type_tag)>::RawType;
+            if constexpr (std::is_integral_v<RawType>) {
+                const auto raw = value.get<RawType>();
+                if constexpr (std::is_signed_v<RawType>) {
+                    if (raw < 0)
+                        return;
+                }
+                if (auto it = codes.int_codes_.find(static_cast<uint64_t>(raw)); it != codes.int_codes_.end())
+                    code = it->second;
+            }
+        });
+        return code;
+    }
+    // Comparisons between the categories and values of a different type are left for the usual type checks to reject
+    return std::nullopt;
+}
+
+std::optional<std::shared_ptr<std::unordered_set<int64_t>>> codes_for_value_set(const CategoryCodes& codes, ValueSet& value_set) {
+    auto output = std::make_shared<std::unordered_set<int64_t>>();
+    if (value_set.empty())
+        return output;
+    const auto data_type = value_set.base_type().data_type();
+    if (codes.is_string_ && is_sequence_type(data_type)) {
+        for (const auto& value: *value_set.get_set<std::string>()) {
+            if (auto it = codes.string_codes_.find(value); it != codes.string_codes_.end())
+                output->insert(it->second);
+        }
+    } else if (!codes.is_string_ && is_integer_type(data_type)) {
+        for (auto value: *value_set.get_set<int64_t>()) {
+            if (value < 0 && !is_unsigned_type(data_type))
+                continue;
+            if (auto it = codes.int_codes_.find(static_cast<uint64_t>(value)); it != codes.int_codes_.end())
+                output->insert(it->second);
+        }
+    } else {
+        return std::nullopt;
+    }
+    return output;
+}
+
+class CategoricalFilterEncoder {
+public:
+    CategoricalFilterEncoder(const CategoricalColumns& categorical_columns, const ExpressionContext& expression_context) :
+        categorical_columns_(categorical_columns),
+        expression_context_(expression_context) {
+    }
+
+    // Returns true if any node of the expression was rewritten
+    bool encode() {
+        visit(expression_context_.root_node_name_);
+        return modified_;
+    }
+
+    ExpressionContext&& release() {
+        return std::move(expression_context_);
+    }
+
+private:
+    const CategoricalColumns& categorical_columns_;
+    ExpressionContext expression_context_;
+    std::unordered_set<std::string> visited_;
+    bool modified_{false};
+
+    void visit(const ExpressionName& expression_name) {
+        if (!visited_.insert(expression_name.value).second)
+            return;
+        auto node = expression_context_.expression_nodes_.get_value(expression_name.value);
+        for (const auto& child: {node->condition_, node->left_, node->right_}) {
+            if (std::holds_alternative<ExpressionName>(child))
+                visit(std::get<ExpressionName>(child));
+        }
+        if (auto encoded = encode_node(*node); encoded) {
+            expression_context_.replace_expression_node(expression_name.value, std::move(encoded));
+            modified_ = true;
+        }
+    }
+
+    const CategoryCodes* categories_for(const VariantNode& node) const {
+        if (!std::holds_alternative<ColumnName>(node))
+            return nullptr;
+        auto it = categorical_columns_.find(std::get<ColumnName>(node).value);
+        return it == categorical_columns_.end() ? nullptr : &it->second;
+    }
+
+    std::optional<VariantNode> encode_value(const CategoryCodes& codes, const ColumnName& column, const ValueName& value_name) {
+        auto code = code_for_value(codes, *expression_context_.values_.get_value(value_name.value));
+        if (!code)
+            return std::nullopt;
+        auto name = fmt::format("{}__categorical_code({})", value_name.value, column.value);
+        expression_context_.add_value(name, std::make_shared<Value>(construct_value<int64_t>(*code)));
+        return ValueName(name);
+    }
+
+    std::optional<VariantNode> encode_value_set(const CategoryCodes& codes, const ColumnName& column, const ValueSetName& value_set_name) {
+        auto value_set = expression_context_.value_sets_.get_value(value_set_name.value);
+        auto code_set = codes_for_value_set(codes, *value_set);
+        if (!code_set)
+            return std::nullopt;
+        auto name = fmt::format("{}__categorical_codes({})", value_set_name.value, column.value);
+        expression_context_.add_value_set(name, std::make_shared<ValueSet>(NumericSetType{std::move(*code_set)}));
+        return ValueSetName(name);
+    }
+
+    std::shared_ptr<ExpressionNode> encode_node(const ExpressionNode& node) {
+        switch (node.operation_type_) {
+        case OperationType::EQ:
+        case OperationType::NE:
+            if (auto left_codes = categories_for(node.left_); left_codes && std::holds_alternative<ValueName>(node.right_)) {
+                if (auto value = encode_value(*left_codes, std::get<ColumnName>(node.left_), std::get<ValueName>(node.right_)))
+                    return std::make_shared<ExpressionNode>(node.left_, *value, node.operation_type_);
+            } else if (auto right_codes = categories_for(node.right_); right_codes && std::holds_alternative<ValueName>(node.left_)) {
+                if (auto value = encode_value(*right_codes, std::get<ColumnName>(node.right_), std::get<ValueName>(node.left_)))
+                    return std::make_shared<ExpressionNode>(*value, node.right_, node.operation_type_);
+            }
+            return nullptr;
+        case OperationType::ISIN:
+        case OperationType::ISNOTIN:
+            if (auto codes = categories_for(node.left_); codes && std::holds_alternative<ValueSetName>(node.right_)) {
+                if (auto value_set = encode_value_set(*codes, std::get<ColumnName>(node.left_), std::get<ValueSetName>(node.right_)))
+                    return std::make_shared<ExpressionNode>(node.left_, *value_set, node.operation_type_);
+            }
+            return nullptr;
+        default:
+            return nullptr;
+        }
+    }
+};
+
+} // namespace
+
+void encode_categorical_filters(
+        std::vector<std::shared_ptr<Clause>>& clauses,
+        const arcticdb::proto::descriptors::NormalizationMetadata& norm_meta) {
+    const auto categorical_columns = get_categorical_columns(norm_meta);
+    if (categorical_columns.empty())
+        return;
+
+    for (auto& clause: clauses) {
+        // Only FilterClause sets a row filter expression
+        const auto& row_filter_expression = clause->clause_info().row_filter_expression_;
+        if (!row_filter_expression)
+            continue;
+        CategoricalFilterEncoder encoder(categorical_columns, *row_filter_expression);
+        if (!encoder.encode())
+            continue;
+        auto filter_clause = folly::poly_cast<FilterClause>(*clause);
+        filter_clause.expression_context_ = std::make_shared<ExpressionContext>(encoder.release());
+        filter_clause.clause_info_.row_filter_expression_ = filter_clause.expression_context_;
+        clause = std::make_shared<Clause>(std::move(filter_clause));
+    }
+}
+
+} // namespace arcticdb
@@ -0,0 +1,31 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#pragma once
+
+#include <memory>
+#include <vector>
+
+#include <arcticdb/entity/descriptors.hpp>
+#include <arcticdb/processing/clause.hpp>
+
+namespace arcticdb {
+
+/*
+ * Categorical columns are stored as their integer codes, with the categories themselves held in the normalization
+ * metadata of the index segment. Rewrites any filter in clauses that compares a categorical column for equality or set
+ * membership against category values so that it compares against the corresponding codes instead, meaning the filter
+ * runs directly on the stored integers (and can use column stats) without the categories being materialised.
+ *
+ * Values that are not categories of the column are mapped to a code that cannot occur. Affected clauses are replaced
+ * with rewritten copies, the clauses passed in are never modified as they can be shared between reads.
+ */
+void encode_categorical_filters(
+    std::vector<std::shared_ptr<Clause>>& clauses,
+    const arcticdb::proto::descriptors::NormalizationMetadata& norm_meta);
+
+} // namespace arcticdb
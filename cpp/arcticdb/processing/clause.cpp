@@ -7,6 +7,8 @@
 
 #include <vector>
 #include <variant>
+#include <numeric>
+#include <map>
 
 #include <arcticdb/processing/processing_unit.hpp>
 #include <arcticdb/column_store/string_pool.hpp>
@@ -17,6 +19,7 @@
 #include <arcticdb/pipeline/column_stats.hpp>
 #include <arcticdb/pipeline/frame_slice.hpp>
 #include <arcticdb/stream/segment_aggregator.hpp>
+#include <arcticdb/stream/merge_utils.hpp>
 #include <arcticdb/util/test/random_throw.hpp>
 #include <ankerl/unordered_dense.h>
 #include <ranges>
@@ -74,6 +77,108 @@ public:
     }
 };
 
+struct GroupIdsHash {
+    using is_avalanching = void;
+
+    [[nodiscard]] uint64_t operator()(const std::vector<size_t>& group_ids) const noexcept {
+        return ankerl::unordered_dense::detail::wyhash::hash(group_ids.data(), group_ids.size() * sizeof(size_t));
+    }
+};
+
+// Assigns a group id to each row of the grouping column, adding values not seen before to the grouping map. Returns the
+// type of the grouping column
+DataType group_rows(
+        const ColumnWithStrings& col,
+        GroupingMap& grouping_map,
+        size_t& next_group_id,
+        StringPool& string_pool,
+        std::vector<size_t>& row_to_group) {
+    DataType grouping_data_type;
+    details::visit_type(
+        col.column_->type().data_type(),
+        [&col, &grouping_map, &next_group_id, &string_pool, &row_to_group, &grouping_data_type](auto data_type_tag) {
+            using col_type_info = ScalarTypeInfo<decltype(data_type_tag)>;
+            grouping_data_type = col_type_info::data_type;
+            // Faster to initialise to zero (missing value group) and use raw ptr than repeated calls to emplace_back
+            row_to_group.assign(col.column_->last_row() + 1, 0);
+            size_t* row_to_group_ptr = row_to_group.data();
+            auto hash_to_group = grouping_map.get<typename col_type_info::RawType>();
+            // For string grouping columns, keep a local map within this ProcessingUnit
+            // from offsets to groups, to avoid needless calls to col.string_at_offset and
+            // string_pool->get
+            // This could be slower in cases where there aren't many repeats in string
+            // grouping columns. Maybe track hit ratio of finds and stop using it if it is
+            // too low?
+            // Tested with 100,000,000 row dataframe with 100,000 unique values in the grouping column. Timings:
+            // 11.14 seconds without caching
+            // 11.01 seconds with caching
+            // Not worth worrying about right now
+            ankerl::unordered_dense::map<typename col_type_info::RawType, size_t> offset_to_group;
+
+            const bool is_sparse = col.column_->is_sparse();
+            if (is_sparse && next_group_id == 0) {
+                // We use 0 for the missing value group id
+                ++next_group_id;
+            }
+            ssize_t previous_value_index = 0;
+
+            Column::for_each_enumerated<typename col_type_info::TDT>(
+                    *col.column_,
+                    [&](auto enumerating_it) {
+                        typename col_type_info::RawType val;
+                        if constexpr (is_sequence_type(col_type_info::data_type)) {
+                            auto offset = enumerating_it.value();
+                            if (auto it = offset_to_group.find(offset); it !=
+                                                                        offset_to_group.end()) {
+                                val = it->second;
+                            } else {
+                                std::optional<std::string_view> str = col.string_at_offset(
+                                        offset);
+                                if (str.has_value()) {
+                                    val = string_pool.get(*str, true).offset();
+                                } else {
+                                    val = offset;
+                                }
+                                typename col_type_info::RawType val_copy(val);
+                                offset_to_group.insert(
+                                        std::make_pair<typename col_type_info::RawType, size_t>(
+                                                std::forward<typename col_type_info::RawType>(
+                                                        offset),
+                                                std::forward<typename col_type_info::RawType>(
+                                                        val_copy)));
+                            }
+                        } else {
+                            val = enumerating_it.value();
+                        }
+
+                        if (is_sparse) {
+                            constexpr size_t missing_value_group_id = 0;
+                            for (auto j = previous_value_index;
+                                 j != enumerating_it.idx(); ++j) {
+                                *row_to_group_ptr++ = missing_value_group_id;
+                            }
+                            previous_value_index = enumerating_it.idx() + 1;
+                        }
+
+                        if (auto it = hash_to_group->find(val); it ==
+                                                                hash_to_group->end()) {
+                            *row_to_group_ptr++ = next_group_id;
+                            auto group_id = next_group_id++;
+                            hash_to_group->insert(
+                                    std::make_pair<typename col_type_info::RawType, size_t>(
+                                            std::forward<typename col_type_info::RawType>(
+                                                    val),
+                                            std::forward<typename col_type_info::RawType>(
+                                                    group_id)));
+                        } else {
+                            *row_to_group_ptr++ = it->second;
+                        }
+                    }
+            );
+        });
+    return grouping_data_type;
+}
+
 struct SegmentWrapper {
     SegmentInMemory seg_;
     SegmentInMemory::iterator it_;
@@ -120,6 +225,15 @@ void check_is_timeseries(const StreamDescriptor& stream_descriptor, std::string_
     );
 }
 
+void check_is_sorted(const StreamDescriptor& stream_descriptor, std::string_view clause_name) {
+    sorting::check<ErrorCode::E_UNSORTED_DATA>(
+            stream_descriptor.sorted() == SortedValue::ASCENDING || stream_descriptor.sorted() == SortedValue::UNKNOWN,
+            "{}Clause requires the index to be sorted in ascending order. ArcticDB believes it is not sorted in "
+            "ascending order",
+            clause_name
+    );
+}
+
 std::vector<EntityId> PassthroughClause::process(std::vector<EntityId>&& entity_ids) const {
     return std::move(entity_ids);
 }
@@ -213,15 +327,60 @@ OutputSchema ProjectClause::modify_schema(OutputSchema&& output_schema) const {
     return expression_context_ ? fmt::format("PROJECT Column[\"{}\"] = {}", output_column_, expression_context_->root_node_name_.value) : "";
 }
 
+namespace {
+
+// Parses the quantile out of aggregation operators of the form "quantile(0.9)"
+std::optional<double> parse_quantile_operator(const std::string& aggregation_operator) {
+    constexpr std::string_view prefix{"quantile("};
+    if (!aggregation_operator.starts_with(prefix) || !aggregation_operator.ends_with(")")) {
+        return std::nullopt;
+    }
+    const auto quantile_str = aggregation_operator.substr(
+            prefix.size(),
+            aggregation_operator.size() - prefix.size() - 1);
+    double quantile{0.0};
+    try {
+        size_t parsed_chars{0};
+        quantile = std::stod(quantile_str, &parsed_chars);
+        user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+                parsed_chars == quantile_str.size(),
+                "Could not parse quantile from aggregation operator {}", aggregation_operator);
+    } catch (const std::logic_error&) {
+        user_input::raise<ErrorCode::E_INVALID_USER_ARGUMENT>(
+                "Could not parse quantile from aggregation operator {}",
+                aggregation_operator);
+    }
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+            quantile >= 0.0 && quantile <= 1.0,
+            "Quantile must be between 0 and 1, received {}", quantile);
+    return quantile;
+}
+
+} // namespace
+
 AggregationClause::AggregationClause(const std::string& grouping_column,
                                      const std::vector<NamedAggregator>& named_aggregators):
-        grouping_column_(grouping_column) {
+        AggregationClause(std::vector<std::string>{grouping_column}, named_aggregators) {
+}
+
+AggregationClause::AggregationClause(const std::vector<std::string>& grouping_columns,
+                                     const std::vector<NamedAggregator>& named_aggregators):
+        grouping_columns_(grouping_columns) {
     ARCTICDB_DEBUG_THROW(5)
 
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+            !grouping_columns_.empty(),
+            "Aggregation requires at least one grouping column");
     clause_info_.input_structure_ = ProcessingStructure::HASH_BUCKETED;
     clause_info_.can_combine_with_column_selection_ = false;
-    clause_info_.index_ = NewIndex(grouping_column_);
-    clause_info_.input_columns_ = std::make_optional<std::unordered_set<std::string>>({grouping_column_});
+    NewIndex new_index;
+    for (const auto&& [level, grouping_column]: folly::enumerate(grouping_columns_)) {
+        new_index.emplace_back(index_column_name(grouping_column, level));
+    }
+    clause_info_.index_ = std::move(new_index);
+    clause_info_.input_columns_ = std::make_optional<std::unordered_set<std::string>>(
+            grouping_columns_.begin(),
+            grouping_columns_.end());
     clause_info_.modifies_output_descriptor_ = true;
     str_ = "AGGREGATE {";
     for (const auto& named_aggregator: named_aggregators) {
@@ -242,6 +401,22 @@ AggregationClause::AggregationClause(const std::string& grouping_column,
             aggregators_.emplace_back(MinAggregatorUnsorted(typed_input_column_name, typed_output_column_name));
         } else if (named_aggregator.aggregation_operator_ == "count") {
             aggregators_.emplace_back(CountAggregatorUnsorted(typed_input_column_name, typed_output_column_name));
+        } else if (named_aggregator.aggregation_operator_ == "sum_of_squares") {
+            aggregators_.emplace_back(
+                    SumOfSquaresAggregatorUnsorted(typed_input_column_name, typed_output_column_name));
+        } else if (named_aggregator.aggregation_operator_ == "var") {
+            aggregators_.emplace_back(VarAggregatorUnsorted(typed_input_column_name, typed_output_column_name));
+        } else if (named_aggregator.aggregation_operator_ == "std") {
+            aggregators_.emplace_back(StdAggregatorUnsorted(typed_input_column_name, typed_output_column_name));
+        } else if (named_aggregator.aggregation_operator_ == "nunique") {
+            aggregators_.emplace_back(NUniqueAggregatorUnsorted(typed_input_column_name, typed_output_column_name));
+        } else if (named_aggregator.aggregation_operator_ == "median") {
+            aggregators_.emplace_back(
+                    QuantileAggregatorUnsorted(typed_input_column_name, typed_output_column_name, 0.5));
+        } else if (auto quantile = parse_quantile_operator(named_aggregator.aggregation_operator_);
+                   quantile.has_value()) {
+            aggregators_.emplace_back(
+                    QuantileAggregatorUnsorted(typed_input_column_name, typed_output_column_name, *quantile));
         } else {
             user_input::raise<ErrorCode::E_INVALID_USER_ARGUMENT>("Unknown aggregation operator provided: {}", named_aggregator.aggregation_operator_);
         }
@@ -254,7 +429,7 @@ std::vector<std::vector<EntityId>> AggregationClause::structure_for_processing(s
             std::any_of(entity_ids_vec.cbegin(), entity_ids_vec.cend(), [](const std::vector<EntityId>& entity_ids) {
                 return !entity_ids.empty();
             }),
-            "Grouping column {} does not exist or is empty", grouping_column_
+            "Grouping column {} does not exist or is empty", fmt::join(grouping_columns_, ", ")
     );
     // Some could be empty, so actual number may be lower
     auto max_num_buckets = ConfigsMap::instance()->get_int("Partition.NumBuckets",
@@ -318,149 +493,139 @@ std::vector<EntityId> AggregationClause::process(std::vector<EntityId>&& entity_
         }
     }
 
+    const auto num_grouping_columns = grouping_columns_.size();
     size_t num_unique{0};
-    size_t next_group_id{0};
     auto string_pool = std::make_shared<StringPool>();
-    DataType grouping_data_type;
-    GroupingMap grouping_map;
+    // Each grouping column has its own map from values to per-column group ids
+    std::vector<size_t> next_group_ids(num_grouping_columns, 0);
+    std::vector<DataType> grouping_data_types(num_grouping_columns);
+    std::vector<GroupingMap> grouping_maps(num_grouping_columns);
+    // With more than one grouping column, the overall groups are the distinct combinations of per-column group ids seen
+    ankerl::unordered_dense::map<std::vector<size_t>, size_t, GroupIdsHash> group_ids_to_group;
+    std::vector<std::vector<size_t>> group_to_group_ids;
     // Iterating backwards as we are going to erase from this vector as we go along
     // This is to spread out deallocation of the input segments
     auto it = row_slices.rbegin();
     while(it != row_slices.rend()) {
         auto& row_slice = *it;
-        auto partitioning_column = row_slice.get(ColumnName(grouping_column_));
-        if (std::holds_alternative<ColumnWithStrings>(partitioning_column)) {
-            ColumnWithStrings col = std::get<ColumnWithStrings>(partitioning_column);
-            details::visit_type(
-                col.column_->type().data_type(),
-                [&row_slice, &grouping_map, &next_group_id, &aggregators_data, &string_pool, &col,
-                        &num_unique, &grouping_data_type, this](auto data_type_tag) {
-                    using col_type_info = ScalarTypeInfo<decltype(data_type_tag)>;
-                    grouping_data_type = col_type_info::data_type;
-                    // Faster to initialise to zero (missing value group) and use raw ptr than repeated calls to emplace_back
-                    std::vector<size_t> row_to_group(col.column_->last_row() + 1, 0);
-                    size_t* row_to_group_ptr = row_to_group.data();
-                    auto hash_to_group = grouping_map.get<typename col_type_info::RawType>();
-                    // For string grouping columns, keep a local map within this ProcessingUnit
-                    // from offsets to groups, to avoid needless calls to col.string_at_offset and
-                    // string_pool->get
-                    // This could be slower in cases where there aren't many repeats in string
-                    // grouping columns. Maybe track hit ratio of finds and stop using it if it is
-                    // too low?
-                    // Tested with 100,000,000 row dataframe with 100,000 unique values in the grouping column. Timings:
-                    // 11.14 seconds without caching
-                    // 11.01 seconds with caching
-                    // Not worth worrying about right now
-                    ankerl::unordered_dense::map<typename col_type_info::RawType, size_t> offset_to_group;
-
-                    const bool is_sparse = col.column_->is_sparse();
-                    if (is_sparse && next_group_id == 0) {
-                        // We use 0 for the missing value group id
-                        ++next_group_id;
-                    }
-                    ssize_t previous_value_index = 0;
-
-                    Column::for_each_enumerated<typename col_type_info::TDT>(
-                            *col.column_,
-                            [&](auto enumerating_it) {
-                                typename col_type_info::RawType val;
-                                if constexpr (is_sequence_type(col_type_info::data_type)) {
-                                    auto offset = enumerating_it.value();
-                                    if (auto it = offset_to_group.find(offset); it !=
-                                                                                offset_to_group.end()) {
-                                        val = it->second;
-                                    } else {
-                                        std::optional<std::string_view> str = col.string_at_offset(
-                                                offset);
-                                        if (str.has_value()) {
-                                            val = string_pool->get(*str, true).offset();
-                                        } else {
-                                            val = offset;
-                                        }
-                                        typename col_type_info::RawType val_copy(val);
-                                        offset_to_group.insert(
-                                                std::make_pair<typename col_type_info::RawType, size_t>(
-                                                        std::forward<typename col_type_info::RawType>(
-                                                                offset),
-                                                        std::forward<typename col_type_info::RawType>(
-                                                                val_copy)));
-                                    }
-                                } else {
-                                    val = enumerating_it.value();
-                                }
-
-                                if (is_sparse) {
-                                    constexpr size_t missing_value_group_id = 0;
-                                    for (auto j = previous_value_index;
-                                         j != enumerating_it.idx(); ++j) {
-                                        *row_to_group_ptr++ = missing_value_group_id;
-                                    }
-                                    previous_value_index = enumerating_it.idx() + 1;
-                                }
+        std::vector<std::vector<size_t>> rows_to_group_ids(num_grouping_columns);
+        for (size_t idx = 0; idx < num_grouping_columns; ++idx) {
+            auto partitioning_column = row_slice.get(ColumnName(grouping_columns_[idx]));
+            if (std::holds_alternative<ColumnWithStrings>(partitioning_column)) {
+                grouping_data_types[idx] = group_rows(
+                        std::get<ColumnWithStrings>(partitioning_column),
+                        grouping_maps[idx],
+                        next_group_ids[idx],
+                        *string_pool,
+                        rows_to_group_ids[idx]);
+            } else {
+                util::raise_rte("Expected single column from expression");
+            }
+        }
 
-                                if (auto it = hash_to_group->find(val); it ==
-                                                                        hash_to_group->end()) {
-                                    *row_to_group_ptr++ = next_group_id;
-                                    auto group_id = next_group_id++;
-                                    hash_to_group->insert(
-                                            std::make_pair<typename col_type_info::RawType, size_t>(
-                                                    std::forward<typename col_type_info::RawType>(
-                                                            val),
-                                                    std::forward<typename col_type_info::RawType>(
-                                                            group_id)));
-                                } else {
-                                    *row_to_group_ptr++ = it->second;
-                                }
-                            }
-                    );
-
-                    num_unique = next_group_id;
-                    util::check(num_unique != 0, "Got zero unique values");
-                    for (auto agg_data: folly::enumerate(aggregators_data)) {
-                        auto input_column_name = aggregators_.at(
-                                agg_data.index).get_input_column_name();
-                        auto input_column = row_slice.get(input_column_name);
-                        std::optional<ColumnWithStrings> opt_input_column;
-                        if (std::holds_alternative<ColumnWithStrings>(input_column)) {
-                            auto column_with_strings = std::get<ColumnWithStrings>(input_column);
-                            // Empty columns don't contribute to aggregations
-                            if (!is_empty_type(column_with_strings.column_->type().data_type())) {
-                                opt_input_column.emplace(std::move(column_with_strings));
-                            }
-                        }
-                        agg_data->aggregate(opt_input_column, row_to_group, num_unique);
-                    }
-                });
+        std::vector<size_t> row_to_group;
+        if (num_grouping_columns == 1) {
+            row_to_group = std::move(rows_to_group_ids.front());
+            num_unique = next_group_ids.front();
         } else {
-            util::raise_rte("Expected single column from expression");
+            size_t num_rows{0};
+            for (const auto& row_to_group_ids: rows_to_group_ids) {
+                num_rows = std::max(num_rows, row_to_group_ids.size());
+            }
+            row_to_group.resize(num_rows);
+            // Reused for every row so that lookups of existing groups do not allocate
+            std::vector<size_t> group_ids(num_grouping_columns);
+            for (size_t row = 0; row < num_rows; ++row) {
+                for (size_t idx = 0; idx < num_grouping_columns; ++idx) {
+                    // Rows beyond the end of a sparse grouping column are missing values. Rows with missing values in
+                    // any grouping column have already been dropped by the PartitionClause, so these are never output
+                    group_ids[idx] = row < rows_to_group_ids[idx].size() ? rows_to_group_ids[idx][row] : 0;
+                }
+                if (auto group_it = group_ids_to_group.find(group_ids); group_it != group_ids_to_group.end()) {
+                    row_to_group[row] = group_it->second;
+                } else {
+                    const auto group = group_to_group_ids.size();
+                    group_ids_to_group.emplace(group_ids, group);
+                    group_to_group_ids.emplace_back(group_ids);
+                    row_to_group[row] = group;
+                }
+            }
+            num_unique = group_to_group_ids.size();
+        }
+        util::check(num_unique != 0, "Got zero unique values");
+        for (auto agg_data: folly::enumerate(aggregators_data)) {
+            auto input_column_name = aggregators_.at(agg_data.index).get_input_column_name();
+            auto input_column = row_slice.get(input_column_name);
+            std::optional<ColumnWithStrings> opt_input_column;
+            if (std::holds_alternative<ColumnWithStrings>(input_column)) {
+                auto column_with_strings = std::get<ColumnWithStrings>(input_column);
+                // Empty columns don't contribute to aggregations
+                if (!is_empty_type(column_with_strings.column_->type().data_type())) {
+                    opt_input_column.emplace(std::move(column_with_strings));
+                }
+            }
+            agg_data->aggregate(opt_input_column, row_to_group, num_unique);
         }
         it = static_cast<decltype(row_slices)::reverse_iterator>((row_slices.erase(std::next(it).base())));
     }
     SegmentInMemory seg;
-    auto index_col = std::make_shared<Column>(make_scalar_type(grouping_data_type), grouping_map.size(), AllocationType::PRESIZED, Sparsity::NOT_PERMITTED);
-
-    seg.add_column(scalar_field(grouping_data_type, grouping_column_), index_col);
-    seg.descriptor().set_index(IndexDescriptorImpl(0, IndexDescriptorImpl::Type::ROWCOUNT));
-
-    details::visit_type(grouping_data_type, [&grouping_map, &index_col](auto data_type_tag) {
-        using col_type_info = ScalarTypeInfo<decltype(data_type_tag)>;
-        auto hashes = grouping_map.get<typename col_type_info::RawType>();
-        std::vector<std::pair<typename col_type_info::RawType, size_t>> elements;
-        for (const auto &hash : *hashes)
-            elements.emplace_back(std::make_pair(hash.first, hash.second));
-
-        std::sort(std::begin(elements),
-                  std::end(elements),
-                  [](const std::pair<typename col_type_info::RawType, size_t> &l, const std::pair<typename col_type_info::RawType, size_t> &r) {
-                      return l.second < r.second;
-                  });
-
-        auto column_data = index_col->data();
-        std::transform(elements.cbegin(), elements.cend(), column_data.begin<typename col_type_info::TDT>(), [](const auto& element) {
-            return element.first;
+    for (size_t idx = 0; idx < num_grouping_columns; ++idx) {
+        const auto grouping_data_type = grouping_data_types[idx];
+        auto& grouping_map = grouping_maps[idx];
+        const auto num_rows = num_grouping_columns == 1 ? grouping_map.size() : num_unique;
+        auto index_col = std::make_shared<Column>(
+                make_scalar_type(grouping_data_type),
+                num_rows,
+                AllocationType::PRESIZED,
+                Sparsity::NOT_PERMITTED);
+
+        seg.add_column(scalar_field(grouping_data_type, index_column_name(grouping_columns_[idx], idx)), index_col);
+
+        details::visit_type(
+                grouping_data_type,
+                [&grouping_map, &index_col, &group_to_group_ids, num_grouping_columns, idx](auto data_type_tag) {
+            using col_type_info = ScalarTypeInfo<decltype(data_type_tag)>;
+            auto hashes = grouping_map.get<typename col_type_info::RawType>();
+            std::vector<std::pair<typename col_type_info::RawType, size_t>> elements;
+            for (const auto &hash : *hashes)
+                elements.emplace_back(std::make_pair(hash.first, hash.second));
+
+            std::sort(std::begin(elements),
+                      std::end(elements),
+                      [](const std::pair<typename col_type_info::RawType, size_t> &l,
+                         const std::pair<typename col_type_info::RawType, size_t> &r) {
+                          return l.second < r.second;
+                      });
+
+            auto column_data = index_col->data();
+            if (num_grouping_columns == 1) {
+                std::transform(
+                        elements.cbegin(),
+                        elements.cend(),
+                        column_data.begin<typename col_type_info::TDT>(),
+                        [](const auto& element) {
+                    return element.first;
+                });
+            } else {
+                // Per-column group ids are allocated contiguously, but start from 1 if the column is sparse as 0 is
+                // reserved for missing values
+                const auto first_group_id = elements.empty() ? 0 : elements.front().second;
+                std::transform(
+                        group_to_group_ids.cbegin(),
+                        group_to_group_ids.cend(),
+                        column_data.begin<typename col_type_info::TDT>(),
+                        [&elements, first_group_id, idx](const auto& group_ids) {
+                    const auto group_id = group_ids[idx];
+                    internal::check<ErrorCode::E_ASSERTION_FAILURE>(
+                            group_id >= first_group_id && group_id - first_group_id < elements.size(),
+                            "Unexpected group id {} in AggregationClause", group_id);
+                    return elements[group_id - first_group_id].first;
+                });
+            }
         });
-    });
-    index_col->set_row_data(grouping_map.size() - 1);
+        index_col->set_row_data(num_rows - 1);
+    }
+    seg.descriptor().set_index(IndexDescriptorImpl(0, IndexDescriptorImpl::Type::ROWCOUNT));
 
     for (auto agg_data: folly::enumerate(aggregators_data)) {
         seg.concatenate(agg_data->finalize(aggregators_.at(agg_data.index).get_output_column_name(), processing_config_.dynamic_schema_, num_unique));
@@ -475,7 +640,10 @@ OutputSchema AggregationClause::modify_schema(OutputSchema&& output_schema) cons
     check_column_presence(output_schema, *clause_info_.input_columns_, "Aggregation");
     const auto& input_stream_desc = output_schema.stream_descriptor();
     StreamDescriptor stream_desc(input_stream_desc.id());
-    stream_desc.add_field(input_stream_desc.field(*input_stream_desc.find_field(grouping_column_)));
+    for (const auto&& [level, grouping_column]: folly::enumerate(grouping_columns_)) {
+        const auto& grouping_field = input_stream_desc.field(*input_stream_desc.find_field(grouping_column));
+        stream_desc.add_scalar_field(grouping_field.type().data_type(), index_column_name(grouping_column, level));
+    }
     stream_desc.set_index({0, IndexDescriptorImpl::Type::ROWCOUNT});
 
     for (const auto& agg: aggregators_){
@@ -489,10 +657,7 @@ OutputSchema AggregationClause::modify_schema(OutputSchema&& output_schema) cons
     }
 
     output_schema.set_stream_descriptor(std::move(stream_desc));
-    auto mutable_index = output_schema.norm_metadata_.mutable_df()->mutable_common()->mutable_index();
-    mutable_index->set_name(grouping_column_);
-    mutable_index->clear_fake_name();
-    mutable_index->set_is_physically_stored(true);
+    set_new_index_norm_metadata(output_schema.norm_metadata_, std::get<NewIndex>(clause_info_.index_));
     return output_schema;
 }
 
@@ -879,6 +1044,531 @@ std::shared_ptr<Column> ResampleClause<closed_boundary>::generate_output_index_c
 template struct ResampleClause<ResampleBoundary::LEFT>;
 template struct ResampleClause<ResampleBoundary::RIGHT>;
 
+// Splits proc by row slice, ordered by the first row of each slice, for clauses that process rows in order
+std::vector<ProcessingUnit> sorted_row_slices(ProcessingUnit&& proc) {
+    auto row_slices = split_by_row_slice(std::move(proc));
+    std::sort(row_slices.begin(), row_slices.end(), [](const ProcessingUnit& left, const ProcessingUnit& right) {
+        return left.row_ranges_->at(0)->start() < right.row_ranges_->at(0)->start();
+    });
+    return row_slices;
+}
+
+WindowClause::WindowClause(WindowSpec window_spec) :
+        window_spec_(window_spec) {
+    clause_info_.input_structure_ = ProcessingStructure::ALL;
+    clause_info_.output_structure_ = ProcessingStructure::ALL;
+    clause_info_.modifies_output_descriptor_ = true;
+}
+
+std::vector<std::vector<size_t>> WindowClause::structure_for_processing(std::vector<RangesAndKey>& ranges_and_keys) {
+    if (ranges_and_keys.empty()) {
+        return {};
+    }
+    // Only called for the side effect of sorting ranges_and_keys into row slice order, so that the reads are queued
+    // in the order the row slices will be processed
+    std::ignore = structure_by_row_slice(ranges_and_keys);
+    std::vector<size_t> res(ranges_and_keys.size());
+    std::iota(res.begin(), res.end(), 0);
+    return {std::move(res)};
+}
+
+std::vector<std::vector<EntityId>> WindowClause::structure_for_processing(std::vector<std::vector<EntityId>>&& entity_ids_vec) {
+    auto entity_ids = flatten_entities(std::move(entity_ids_vec));
+    if (entity_ids.empty()) {
+        return {};
+    }
+    return {std::move(entity_ids)};
+}
+
+std::vector<EntityId> WindowClause::process(std::vector<EntityId>&& entity_ids) const {
+    ARCTICDB_SAMPLE(WindowClause, 0)
+    if (entity_ids.empty()) {
+        return {};
+    }
+    auto row_slices = sorted_row_slices(
+            gather_entities<std::shared_ptr<SegmentInMemory>, std::shared_ptr<RowRange>, std::shared_ptr<ColRange>>(*component_manager_, std::move(entity_ids)));
+    std::vector<WindowAggregatorState> states;
+    states.reserve(aggregations_.size());
+    for (const auto& aggregation: aggregations_) {
+        states.emplace_back(window_spec_, aggregation.operator_);
+    }
+    using IndexTDT = ScalarTagType<DataTypeTag<DataType::NANOSECONDS_UTC64>>;
+    using OutputTDT = ScalarTagType<DataTypeTag<DataType::FLOAT64>>;
+    std::vector<timestamp> index_values;
+    std::vector<double> input_values;
+    std::vector<double> output_values;
+    std::vector<EntityId> output;
+    ARCTICDB_DEBUG_THROW(5)
+    for (auto& row_slice: row_slices) {
+        const auto row_count = row_slice.segments_->at(0)->row_count();
+        const timestamp* index_ptr{nullptr};
+        if (window_spec_.type_ == WindowType::TIME) {
+            // All segments in a given row slice contain the same index column, so just use the first one
+            const auto& index_column = row_slice.segments_->at(0)->column(0);
+            internal::check<ErrorCode::E_ASSERTION_FAILURE>(is_time_type(index_column.type().data_type()),
+                                                            "Cannot apply time-based window to data with index column of non-timestamp type");
+            index_values.resize(row_count);
+            Column::for_each_enumerated<IndexTDT>(index_column, [&index_values](auto enumerating_it) {
+                index_values[enumerating_it.idx()] = enumerating_it.value();
+            });
+            index_ptr = index_values.data();
+        }
+        for (auto&& [idx, aggregation]: folly::enumerate(aggregations_)) {
+            input_values.assign(row_count, std::numeric_limits<double>::quiet_NaN());
+            output_values.resize(row_count);
+            auto variant_data = row_slice.get(aggregation.input_column_name_);
+            util::variant_match(variant_data,
+                                [&input_values](const ColumnWithStrings& column_with_strings) {
+                                    window_input_values(*column_with_strings.column_, input_values);
+                                },
+                                [](const EmptyResult&) {
+                                    // Dynamic schema, missing column from this row-slice, treated as missing values
+                                },
+                                [](const auto&) {
+                                    internal::raise<ErrorCode::E_ASSERTION_FAILURE>("Unexpected return type from ProcessingUnit::get, expected column-like");
+                                }
+            );
+            states[idx].aggregate(input_values.data(), index_ptr, row_count, output_values.data());
+            auto output_column = std::make_shared<Column>(make_scalar_type(DataType::FLOAT64), row_count, AllocationType::PRESIZED, Sparsity::NOT_PERMITTED);
+            if (row_count > 0) {
+                auto output_column_data = output_column->data();
+                std::copy(output_values.begin(), output_values.end(), output_column_data.begin<OutputTDT>());
+                output_column->set_row_data(row_count - 1);
+            }
+            row_slice.segments_->back()->add_column(scalar_field(DataType::FLOAT64, aggregation.output_column_name_.value), output_column);
+            auto new_col_range = std::make_shared<ColRange>(*row_slice.col_ranges_->back());
+            ++new_col_range->second;
+            row_slice.col_ranges_->back() = std::move(new_col_range);
+        }
+        auto row_slice_ids = push_entities(*component_manager_, std::move(row_slice));
+        output.insert(output.end(), row_slice_ids.begin(), row_slice_ids.end());
+    }
+    return output;
+}
+
+OutputSchema WindowClause::modify_schema(OutputSchema&& output_schema) const {
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(!aggregations_.empty(), "WindowClause requires at least one aggregation");
+    if (window_spec_.type_ == WindowType::TIME) {
+        check_is_timeseries(output_schema.stream_descriptor(), "Window");
+        check_is_sorted(output_schema.stream_descriptor(), "Window");
+    }
+    check_column_presence(output_schema, *clause_info_.input_columns_, "Window");
+    const auto& column_types = output_schema.column_types();
+    for (const auto& aggregation: aggregations_) {
+        const auto input_type = column_types.at(aggregation.input_column_name_.value);
+        schema::check<ErrorCode::E_UNSUPPORTED_COLUMN_TYPE>(
+                (is_numeric_type(input_type) && !is_time_type(input_type)) || is_bool_type(input_type),
+                "Window aggregations not supported with column '{}' of type {}",
+                aggregation.input_column_name_.value,
+                input_type);
+    }
+    for (const auto& aggregation: aggregations_) {
+        output_schema.add_field(aggregation.output_column_name_.value, DataType::FLOAT64);
+    }
+    return output_schema;
+}
+
+void WindowClause::set_aggregations(const std::vector<NamedAggregator>& named_aggregators) {
+    clause_info_.input_columns_ = std::make_optional<std::unordered_set<std::string>>();
+    aggregations_.clear();
+    str_ = fmt::format("{} | AGGREGATE {{", window_spec_.to_string());
+    for (const auto& named_aggregator: named_aggregators) {
+        str_.append(fmt::format("{}: ({}, {}), ",
+                                named_aggregator.output_column_name_,
+                                named_aggregator.input_column_name_,
+                                named_aggregator.aggregation_operator_));
+        clause_info_.input_columns_->insert(named_aggregator.input_column_name_);
+        auto window_operator = window_operator_from_string(named_aggregator.aggregation_operator_);
+        user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+                window_spec_.type_ != WindowType::EXPONENTIAL || window_operator == WindowOperator::MEAN,
+                "Exponentially weighted windows only support the mean aggregation, received {}",
+                named_aggregator.aggregation_operator_);
+        aggregations_.push_back({ColumnName(named_aggregator.input_column_name_),
+                                 ColumnName(named_aggregator.output_column_name_),
+                                 window_operator});
+    }
+    str_.append("}");
+}
+
+[[nodiscard]] std::string WindowClause::to_string() const {
+    return str_.empty() ? window_spec_.to_string() : str_;
+}
+
+AsOfJoinClause::AsOfJoinClause(AsOfJoinOptions options) :
+        options_(std::move(options)) {
+    clause_info_.input_structure_ = ProcessingStructure::ALL;
+    clause_info_.output_structure_ = ProcessingStructure::ALL;
+    clause_info_.modifies_output_descriptor_ = true;
+    clause_info_.input_columns_ = std::make_optional<std::unordered_set<std::string>>(options_.by_.begin(), options_.by_.end());
+    if (options_.tolerance_.has_value()) {
+        user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+                *options_.tolerance_ >= 0, "As-of join tolerance must be non-negative, received {}ns", *options_.tolerance_);
+    }
+}
+
+std::vector<std::vector<EntityId>> AsOfJoinClause::structure_for_processing(std::vector<std::vector<EntityId>>&& entity_ids_vec) {
+    internal::check<ErrorCode::E_ASSERTION_FAILURE>(
+            entity_ids_vec.size() == 2,
+            "AsOfJoinClause expected the outputs of exactly 2 symbols, received {}", entity_ids_vec.size());
+    num_left_entities_ = entity_ids_vec[0].size();
+    // A single processing unit, with the left entities first
+    auto entity_ids = flatten_entities(std::move(entity_ids_vec));
+    if (entity_ids.empty()) {
+        return {};
+    }
+    return {std::move(entity_ids)};
+}
+
+namespace {
+std::vector<timestamp> asof_join_index_values(const ProcessingUnit& row_slice) {
+    // All segments in a given row slice contain the same index column, so just use the first one
+    const auto& segment = *row_slice.segments_->at(0);
+    schema::check<ErrorCode::E_UNSUPPORTED_INDEX_TYPE>(
+            segment.descriptor().index().type() == IndexDescriptor::Type::TIMESTAMP && is_time_type(segment.column(0).type().data_type()),
+            "AsOfJoinClause can only be applied to timeseries");
+    std::vector<timestamp> index_values(segment.row_count());
+    Column::for_each_enumerated<ScalarTagType<DataTypeTag<DataType::NANOSECONDS_UTC64>>>(segment.column(0), [&index_values](auto enumerating_it) {
+        index_values[enumerating_it.idx()] = enumerating_it.value();
+    });
+    return index_values;
+}
+
+std::vector<std::string> join_keys(ProcessingUnit& row_slice, const std::vector<std::string>& key_columns, size_t row_count) {
+    std::vector<std::string> keys;
+    if (key_columns.empty()) {
+        return keys;
+    }
+    keys.resize(row_count);
+    for (const auto& key_column: key_columns) {
+        auto variant_data = row_slice.get(ColumnName(key_column));
+        util::variant_match(variant_data,
+                            [&keys](const ColumnWithStrings& column_with_strings) {
+                                append_join_keys(column_with_strings, keys);
+                            },
+                            [&keys](const EmptyResult&) {
+                                // Dynamic schema, missing column from this row-slice, treated as missing values
+                                append_missing_join_keys(keys);
+                            },
+                            [](const auto&) {
+                                internal::raise<ErrorCode::E_ASSERTION_FAILURE>("Unexpected return type from ProcessingUnit::get, expected column-like");
+                            }
+        );
+    }
+    return keys;
+}
+
+// Names of the non-index columns in all of the row slices, in order of first appearance, with their types
+std::vector<std::pair<std::string, DataType>> join_column_types(const std::vector<ProcessingUnit>& row_slices) {
+    std::vector<std::pair<std::string, DataType>> res;
+    ankerl::unordered_dense::set<std::string> seen;
+    for (const auto& row_slice: row_slices) {
+        for (const auto& segment: *row_slice.segments_) {
+            const auto& descriptor = segment->descriptor();
+            for (size_t idx = descriptor.index().field_count(); idx < descriptor.field_count(); ++idx) {
+                const auto& field = descriptor.field(idx);
+                if (seen.emplace(field.name()).second) {
+                    res.emplace_back(std::string(field.name()), field.type().data_type());
+                }
+            }
+        }
+    }
+    return res;
+}
+
+// Splits the single processing unit of a two symbol join into the row slices of each symbol, in row order. Both sides
+// are always gathered so that the right entities are released from the component manager
+std::pair<std::vector<ProcessingUnit>, std::vector<ProcessingUnit>> join_row_slices(
+        ComponentManager& component_manager,
+        std::vector<EntityId>&& entity_ids,
+        size_t num_left_entities) {
+    internal::check<ErrorCode::E_ASSERTION_FAILURE>(
+            num_left_entities <= entity_ids.size(),
+            "Join expected at least {} entities, received {}", num_left_entities, entity_ids.size());
+    std::vector<EntityId> right_entity_ids(entity_ids.begin() + num_left_entities, entity_ids.end());
+    entity_ids.resize(num_left_entities);
+    std::pair<std::vector<ProcessingUnit>, std::vector<ProcessingUnit>> res;
+    if (!entity_ids.empty()) {
+        res.first = sorted_row_slices(
+                gather_entities<std::shared_ptr<SegmentInMemory>, std::shared_ptr<RowRange>, std::shared_ptr<ColRange>>(component_manager, std::move(entity_ids)));
+    }
+    if (!right_entity_ids.empty()) {
+        res.second = sorted_row_slices(
+                gather_entities<std::shared_ptr<SegmentInMemory>, std::shared_ptr<RowRange>, std::shared_ptr<ColRange>>(component_manager, std::move(right_entity_ids)));
+    }
+    return res;
+}
+
+// Position of the first row of each row slice in its symbol, followed by the total row count
+std::vector<size_t> join_row_offsets(const std::vector<ProcessingUnit>& row_slices) {
+    std::vector<size_t> offsets{0};
+    offsets.reserve(row_slices.size() + 1);
+    for (const auto& row_slice: row_slices) {
+        offsets.emplace_back(offsets.back() + row_slice.segments_->at(0)->row_count());
+    }
+    return offsets;
+}
+
+// Gathers the values of every right column other than the key columns, raising if any of them are also present in
+// the left symbol
+std::vector<JoinColumn> right_join_columns(
+        const std::vector<ProcessingUnit>& left_row_slices,
+        std::vector<ProcessingUnit>& right_row_slices,
+        const std::vector<size_t>& right_offsets,
+        const std::vector<std::string>& key_columns) {
+    ankerl::unordered_dense::set<std::string> left_column_names;
+    for (auto& name_and_type: join_column_types(left_row_slices)) {
+        left_column_names.emplace(std::move(name_and_type.first));
+    }
+    const ankerl::unordered_dense::set<std::string> key_column_names(key_columns.begin(), key_columns.end());
+    std::vector<JoinColumn> join_columns;
+    for (auto&& [name, data_type]: join_column_types(right_row_slices)) {
+        if (key_column_names.contains(name)) {
+            continue;
+        }
+        user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+                !left_column_names.contains(name),
+                "Join column '{}' is present in both symbols, rename or drop it from one of them before joining",
+                name);
+        const auto output_type = join_output_type(name, data_type);
+        join_columns.emplace_back(std::move(name), output_type, right_offsets.back());
+    }
+    for (size_t slice_idx = 0; slice_idx < right_row_slices.size(); ++slice_idx) {
+        const auto offset = right_offsets[slice_idx];
+        for (auto& join_column: join_columns) {
+            auto variant_data = right_row_slices[slice_idx].get(ColumnName(join_column.name()));
+            util::variant_match(variant_data,
+                                [&join_column, offset](const ColumnWithStrings& column_with_strings) {
+                                    join_column.add_right_values(column_with_strings, offset);
+                                },
+                                [](const EmptyResult&) {
+                                    // Dynamic schema, missing column from this row-slice, treated as missing values
+                                },
+                                [](const auto&) {
+                                    internal::raise<ErrorCode::E_ASSERTION_FAILURE>("Unexpected return type from ProcessingUnit::get, expected column-like");
+                                }
+            );
+        }
+    }
+    return join_columns;
+}
+
+// Adds the matched right values to the last segment of the left row slice
+void add_join_columns(ProcessingUnit& row_slice, const std::vector<JoinColumn>& join_columns, const std::vector<int64_t>& matches) {
+    auto& segment = *row_slice.segments_->back();
+    for (const auto& join_column: join_columns) {
+        segment.add_column(scalar_field(join_column.output_type(), join_column.name()), join_column.matched_column(matches, segment.string_pool()));
+        auto new_col_range = std::make_shared<ColRange>(*row_slice.col_ranges_->back());
+        ++new_col_range->second;
+        row_slice.col_ranges_->back() = std::move(new_col_range);
+    }
+}
+}
+
+std::vector<EntityId> AsOfJoinClause::process(std::vector<EntityId>&& entity_ids) const {
+    ARCTICDB_SAMPLE(AsOfJoinClause, 0)
+    if (entity_ids.empty()) {
+        return {};
+    }
+    auto [left_row_slices, right_row_slices] = join_row_slices(*component_manager_, std::move(entity_ids), num_left_entities_);
+    if (left_row_slices.empty()) {
+        return {};
+    }
+    ARCTICDB_DEBUG_THROW(5)
+
+    const auto right_offsets = join_row_offsets(right_row_slices);
+    std::vector<timestamp> right_index;
+    right_index.reserve(right_offsets.back());
+    std::vector<std::string> right_keys;
+    for (auto& row_slice: right_row_slices) {
+        auto index_values = asof_join_index_values(row_slice);
+        auto keys = join_keys(row_slice, options_.by_, index_values.size());
+        right_index.insert(right_index.end(), index_values.begin(), index_values.end());
+        right_keys.insert(right_keys.end(), std::make_move_iterator(keys.begin()), std::make_move_iterator(keys.end()));
+    }
+    const auto join_columns = right_join_columns(left_row_slices, right_row_slices, right_offsets, options_.by_);
+
+    AsOfJoinMatcher matcher(options_, std::move(right_index), std::move(right_keys));
+    std::vector<EntityId> output;
+    for (auto& row_slice: left_row_slices) {
+        auto index_values = asof_join_index_values(row_slice);
+        const auto keys = join_keys(row_slice, options_.by_, index_values.size());
+        add_join_columns(row_slice, join_columns, matcher.match(index_values, keys));
+        auto row_slice_ids = push_entities(*component_manager_, std::move(row_slice));
+        output.insert(output.end(), row_slice_ids.begin(), row_slice_ids.end());
+    }
+    return output;
+}
+
+OutputSchema AsOfJoinClause::modify_schema(OutputSchema&& output_schema) const {
+    // Only the schema of the left symbol is available here, the columns added from the right symbol are only known
+    // once it has been read
+    check_is_timeseries(output_schema.stream_descriptor(), "AsOfJoin");
+    check_column_presence(output_schema, *clause_info_.input_columns_, "AsOfJoin");
+    return output_schema;
+}
+
+[[nodiscard]] std::string AsOfJoinClause::to_string() const {
+    return options_.to_string();
+}
+
+JoinClause::JoinClause(JoinOptions options) :
+        options_(std::move(options)) {
+    clause_info_.input_structure_ = ProcessingStructure::ALL;
+    clause_info_.output_structure_ = ProcessingStructure::ALL;
+    clause_info_.modifies_output_descriptor_ = true;
+    clause_info_.input_columns_ = std::make_optional<std::unordered_set<std::string>>(options_.on_.begin(), options_.on_.end());
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+            !options_.on_.empty(), "Join requires at least one column to join on");
+}
+
+std::vector<std::vector<EntityId>> JoinClause::structure_for_processing(std::vector<std::vector<EntityId>>&& entity_ids_vec) {
+    internal::check<ErrorCode::E_ASSERTION_FAILURE>(
+            entity_ids_vec.size() == 2,
+            "JoinClause expected the outputs of exactly 2 symbols, received {}", entity_ids_vec.size());
+    num_left_entities_ = entity_ids_vec[0].size();
+    // A single processing unit, with the left entities first
+    auto entity_ids = flatten_entities(std::move(entity_ids_vec));
+    if (entity_ids.empty()) {
+        return {};
+    }
+    return {std::move(entity_ids)};
+}
+
+std::vector<EntityId> JoinClause::process(std::vector<EntityId>&& entity_ids) const {
+    ARCTICDB_SAMPLE(JoinClause, 0)
+    if (entity_ids.empty()) {
+        return {};
+    }
+    auto [left_row_slices, right_row_slices] = join_row_slices(*component_manager_, std::move(entity_ids), num_left_entities_);
+    if (left_row_slices.empty()) {
+        return {};
+    }
+    ARCTICDB_DEBUG_THROW(5)
+
+    const auto right_offsets = join_row_offsets(right_row_slices);
+    if (!right_row_slices.empty()) {
+        const auto right_column_types = join_column_types(right_row_slices);
+        for (const auto& on_column: options_.on_) {
+            schema::check<ErrorCode::E_COLUMN_DOESNT_EXIST>(
+                    std::any_of(right_column_types.begin(), right_column_types.end(), [&on_column](const auto& name_and_type) {
+                        return name_and_type.first == on_column;
+                    }),
+                    "Join column '{}' is not present in the right symbol", on_column);
+        }
+    }
+    std::vector<std::string> right_keys;
+    right_keys.reserve(right_offsets.back());
+    for (size_t slice_idx = 0; slice_idx < right_row_slices.size(); ++slice_idx) {
+        auto keys = join_keys(right_row_slices[slice_idx], options_.on_, right_offsets[slice_idx + 1] - right_offsets[slice_idx]);
+        right_keys.insert(right_keys.end(), std::make_move_iterator(keys.begin()), std::make_move_iterator(keys.end()));
+    }
+    const auto join_columns = right_join_columns(left_row_slices, right_row_slices, right_offsets, options_.on_);
+
+    const HashJoinMatcher matcher(std::move(right_keys));
+    std::vector<EntityId> output;
+    for (auto& row_slice: left_row_slices) {
+        const auto keys = join_keys(row_slice, options_.on_, row_slice.segments_->at(0)->row_count());
+        auto matches = matcher.match(keys);
+        if (options_.type_ == JoinType::INNER) {
+            util::BitSet bitset(static_cast<util::BitSetSizeType>(matches.size()));
+            for (size_t idx = 0; idx < matches.size(); ++idx) {
+                if (matches[idx] != NO_JOIN_MATCH) {
+                    bitset.set_bit(idx);
+                }
+            }
+            if (bitset.count() == 0) {
+                continue;
+            } else if (bitset.count() < matches.size()) {
+                row_slice.apply_filter(std::move(bitset), PipelineOptimisation::SPEED);
+                std::erase(matches, NO_JOIN_MATCH);
+            }
+        }
+        add_join_columns(row_slice, join_columns, matches);
+        auto row_slice_ids = push_entities(*component_manager_, std::move(row_slice));
+        output.insert(output.end(), row_slice_ids.begin(), row_slice_ids.end());
+    }
+    return output;
+}
+
+OutputSchema JoinClause::modify_schema(OutputSchema&& output_schema) const {
+    // Only the schema of the left symbol is available here, the columns added from the right symbol are only known
+    // once it has been read
+    check_column_presence(output_schema, *clause_info_.input_columns_, "Join");
+    return output_schema;
+}
+
+[[nodiscard]] std::string JoinClause::to_string() const {
+    return options_.to_string();
+}
+
+ConcatClause::ConcatClause() {
+    clause_info_.input_structure_ = ProcessingStructure::ALL;
+    clause_info_.modifies_output_descriptor_ = true;
+}
+
+namespace {
+// Names and types of all of the fields in the given segments, including the index
+std::map<std::string, TypeDescriptor> concat_fields(const std::vector<std::shared_ptr<SegmentInMemory>>& segments) {
+    std::map<std::string, TypeDescriptor> res;
+    for (const auto& segment: segments) {
+        for (const auto& field: segment->descriptor().fields()) {
+            res.try_emplace(std::string(field.name()), field.type());
+        }
+    }
+    return res;
+}
+}
+
+std::vector<std::vector<EntityId>> ConcatClause::structure_for_processing(std::vector<std::vector<EntityId>>&& entity_ids_vec) {
+    std::optional<IndexDescriptor::Type> first_index_type;
+    std::optional<std::map<std::string, TypeDescriptor>> first_fields;
+    size_t row_offset{0};
+    for (size_t symbol_idx = 0; symbol_idx < entity_ids_vec.size(); ++symbol_idx) {
+        const auto& entity_ids = entity_ids_vec[symbol_idx];
+        if (entity_ids.empty()) {
+            continue;
+        }
+        auto [segments, row_ranges] = component_manager_->get_entities<std::shared_ptr<SegmentInMemory>, std::shared_ptr<RowRange>>(entity_ids, false);
+        const auto index_type = segments.front()->descriptor().index().type();
+        if (!first_index_type.has_value()) {
+            first_index_type = index_type;
+        }
+        schema::check<ErrorCode::E_DESCRIPTOR_MISMATCH>(
+                index_type == *first_index_type,
+                "Cannot concatenate symbols with different index types, symbol {} has index type {} but the first symbol has {}",
+                symbol_idx, static_cast<char>(index_type), static_cast<char>(*first_index_type));
+        if (!processing_config_.dynamic_schema_) {
+            auto fields = concat_fields(segments);
+            if (!first_fields.has_value()) {
+                first_fields = std::move(fields);
+            } else {
+                schema::check<ErrorCode::E_DESCRIPTOR_MISMATCH>(
+                        fields == *first_fields,
+                        "Cannot concatenate symbols with different columns without dynamic schema, symbol {} does not match the first symbol",
+                        symbol_idx);
+            }
+        }
+        std::vector<std::shared_ptr<RowRange>> offset_row_ranges;
+        offset_row_ranges.reserve(row_ranges.size());
+        size_t symbol_row_end{0};
+        for (const auto& row_range: row_ranges) {
+            offset_row_ranges.emplace_back(std::make_shared<RowRange>(row_range->start() + row_offset, row_range->end() + row_offset));
+            symbol_row_end = std::max(symbol_row_end, row_range->end());
+        }
+        component_manager_->replace_entities<std::shared_ptr<RowRange>>(entity_ids, offset_row_ranges);
+        row_offset += symbol_row_end;
+    }
+    return structure_by_row_slice(*component_manager_, std::move(entity_ids_vec));
+}
+
+std::vector<EntityId> ConcatClause::process(std::vector<EntityId>&& entity_ids) const {
+    return std::move(entity_ids);
+}
+
+[[nodiscard]] std::string ConcatClause::to_string() const {
+    return "CONCAT";
+}
+
 [[nodiscard]] std::vector<EntityId> RemoveColumnPartitioningClause::process(std::vector<EntityId>&& entity_ids) const {
     if (entity_ids.empty()) {
         return {};
@@ -1146,7 +1836,10 @@ std::vector<EntityId> ColumnStatsGenerationClause::process(std::vector<EntityId>
     seg.add_column(scalar_field(DataType::NANOSECONDS_UTC64, start_index_column_name), start_index_col);
     seg.add_column(scalar_field(DataType::NANOSECONDS_UTC64, end_index_column_name), end_index_col);
     for (const auto& agg_data: folly::enumerate(aggregators_data)) {
-        seg.concatenate(agg_data->finalize(column_stats_aggregators_->at(agg_data.index).get_output_column_names()));
+        auto stats_seg = agg_data->finalize(column_stats_aggregators_->at(agg_data.index).get_output_column_names());
+        // concatenate shares columns without merging string pools, so string valued stats must be remapped first
+        merge_string_columns(stats_seg, seg.string_pool_ptr(), false);
+        seg.concatenate(std::move(stats_seg));
     }
     seg.set_row_id(0);
     return push_entities(*component_manager_, ProcessingUnit(std::move(seg)));
@@ -19,11 +19,15 @@
 #include <arcticdb/processing/aggregation_interface.hpp>
 #include <arcticdb/processing/processing_unit.hpp>
 #include <arcticdb/processing/sorted_aggregation.hpp>
+#include <arcticdb/processing/window_aggregation.hpp>
+#include <arcticdb/processing/asof_join.hpp>
+#include <arcticdb/processing/join_utils.hpp>
 #include <arcticdb/processing/grouper.hpp>
 #include <arcticdb/stream/aggregator.hpp>
 #include <arcticdb/util/movable_priority_queue.hpp>
 #include <arcticdb/pipeline/index_utils.hpp>
 
+#include <fmt/ranges.h>
 #include <folly/Poly.h>
 #include <folly/futures/Future.h>
 
@@ -136,6 +140,7 @@ struct FilterClause {
             expression_context_(std::make_shared<ExpressionContext>(std::move(expression_context))),
             optimisation_(optimisation.value_or(PipelineOptimisation::SPEED)) {
         clause_info_.input_columns_ = std::move(input_columns);
+        clause_info_.row_filter_expression_ = expression_context_;
     }
 
     FilterClause() = delete;
@@ -226,12 +231,24 @@ struct PartitionClause {
     ClauseInfo clause_info_;
     std::shared_ptr<ComponentManager> component_manager_;
     ProcessingConfig processing_config_;
-    std::string grouping_column_;
+    std::vector<std::string> grouping_columns_;
 
     explicit PartitionClause(const std::string& grouping_column) :
+            PartitionClause(std::vector<std::string>{grouping_column}) {
+    }
+
+    explicit PartitionClause(const std::vector<std::string>& grouping_columns) :
             processing_config_(),
-            grouping_column_(grouping_column) {
-        clause_info_.input_columns_ = {grouping_column_};
+            grouping_columns_(grouping_columns) {
+        user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+                !grouping_columns_.empty(),
+                "GroupBy requires at least one grouping column");
+        clause_info_.input_columns_ = std::make_optional<std::unordered_set<std::string>>(
+                grouping_columns_.begin(),
+                grouping_columns_.end());
+        user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+                clause_info_.input_columns_->size() == grouping_columns_.size(),
+                "GroupBy grouping columns must be unique");
         clause_info_.modifies_output_descriptor_ = true;
     }
     PartitionClause() = delete;
@@ -252,9 +269,10 @@ struct PartitionClause {
             return {};
         }
         auto proc = gather_entities<std::shared_ptr<SegmentInMemory>, std::shared_ptr<RowRange>, std::shared_ptr<ColRange>>(*component_manager_, std::move(entity_ids));
+        std::vector<ColumnName> grouping_column_names(grouping_columns_.begin(), grouping_columns_.end());
         std::vector<ProcessingUnit> partitioned_procs = partition_processing_segment<GrouperType, BucketizerType>(
                 proc,
-                ColumnName(grouping_column_),
+                grouping_column_names,
                 processing_config_.dynamic_schema_);
         std::vector<EntityId> output;
         for (auto &&partitioned_proc: partitioned_procs) {
@@ -282,7 +300,10 @@ struct PartitionClause {
     }
 
     [[nodiscard]] std::string to_string() const {
-        return fmt::format("GROUPBY Column[\"{}\"]", grouping_column_);
+        if (grouping_columns_.size() == 1) {
+            return fmt::format("GROUPBY Column[\"{}\"]", grouping_columns_.front());
+        }
+        return fmt::format("GROUPBY Columns[\"{}\"]", fmt::join(grouping_columns_, "\", \""));
     }
 };
 
@@ -305,7 +326,7 @@ struct AggregationClause {
     ClauseInfo clause_info_;
     std::shared_ptr<ComponentManager> component_manager_;
     ProcessingConfig processing_config_;
-    std::string grouping_column_;
+    std::vector<std::string> grouping_columns_;
     std::vector<GroupingAggregator> aggregators_;
     std::string str_;
 
@@ -316,6 +337,9 @@ struct AggregationClause {
     AggregationClause(const std::string& grouping_column,
                       const std::vector<NamedAggregator>& aggregations);
 
+    AggregationClause(const std::vector<std::string>& grouping_columns,
+                      const std::vector<NamedAggregator>& aggregations);
+
     [[noreturn]] std::vector<std::vector<size_t>> structure_for_processing(ARCTICDB_UNUSED std::vector<RangesAndKey>&) {
         internal::raise<ErrorCode::E_ASSERTION_FAILURE>("AggregationClause should never be first in the pipeline");
     }
@@ -406,6 +430,182 @@ struct is_resample: std::false_type{};
 template<ResampleBoundary closed_boundary>
 struct is_resample<ResampleClause<closed_boundary>>: std::true_type{};
 
+// Appends rolling, expanding, or exponentially weighted aggregations of existing columns as new columns, keeping the
+// number of rows and the index unchanged.
+// Windows can span any number of row slices, so all of the row slices are processed in order in a single call to
+// process, with the state of each aggregation carried from one row slice to the next
+struct WindowClause {
+    struct WindowAggregation {
+        ColumnName input_column_name_;
+        ColumnName output_column_name_;
+        WindowOperator operator_;
+    };
+
+    ClauseInfo clause_info_;
+    std::shared_ptr<ComponentManager> component_manager_;
+    ProcessingConfig processing_config_;
+    WindowSpec window_spec_;
+    std::vector<WindowAggregation> aggregations_;
+    std::string str_;
+
+    WindowClause() = delete;
+
+    ARCTICDB_MOVE_COPY_DEFAULT(WindowClause)
+
+    explicit WindowClause(WindowSpec window_spec);
+
+    [[nodiscard]] std::vector<std::vector<size_t>> structure_for_processing(
+            std::vector<RangesAndKey>& ranges_and_keys);
+
+    [[nodiscard]] std::vector<std::vector<EntityId>> structure_for_processing(std::vector<std::vector<EntityId>>&& entity_ids_vec);
+
+    [[nodiscard]] std::vector<EntityId> process(std::vector<EntityId>&& entity_ids) const;
+
+    [[nodiscard]] const ClauseInfo& clause_info() const {
+        return clause_info_;
+    }
+
+    void set_processing_config(const ProcessingConfig& processing_config) {
+        processing_config_ = processing_config;
+    }
+
+    void set_component_manager(std::shared_ptr<ComponentManager> component_manager) {
+        component_manager_ = component_manager;
+    }
+
+    OutputSchema modify_schema(OutputSchema&& output_schema) const;
+
+    [[nodiscard]] std::string to_string() const;
+
+    void set_aggregations(const std::vector<NamedAggregator>& named_aggregators);
+};
+
+/*
+ * Joins two symbols on their timestamp indexes, for each row of the left symbol adding the columns of the most recent
+ * row of the right symbol at or before it (optionally with equal values in the by columns). Must be scheduled on the
+ * outputs of two separate read pipelines, see read_and_join_frames.
+ */
+struct AsOfJoinClause {
+    ClauseInfo clause_info_;
+    std::shared_ptr<ComponentManager> component_manager_;
+    ProcessingConfig processing_config_;
+    AsOfJoinOptions options_;
+    // Number of entity ids at the start of the single processing unit that belong to the left symbol. Set when the
+    // processing is structured, which always happens before process is called
+    size_t num_left_entities_{0};
+
+    AsOfJoinClause() = delete;
+
+    ARCTICDB_MOVE_COPY_DEFAULT(AsOfJoinClause)
+
+    explicit AsOfJoinClause(AsOfJoinOptions options);
+
+    [[noreturn]] std::vector<std::vector<size_t>> structure_for_processing(std::vector<RangesAndKey>&) {
+        internal::raise<ErrorCode::E_ASSERTION_FAILURE>("AsOfJoinClause should never be first in the pipeline");
+    }
+
+    // entity_ids_vec must contain exactly two elements, the output entity ids of the left and right symbols' pipelines
+    [[nodiscard]] std::vector<std::vector<EntityId>> structure_for_processing(std::vector<std::vector<EntityId>>&& entity_ids_vec);
+
+    [[nodiscard]] std::vector<EntityId> process(std::vector<EntityId>&& entity_ids) const;
+
+    [[nodiscard]] const ClauseInfo& clause_info() const {
+        return clause_info_;
+    }
+
+    void set_processing_config(const ProcessingConfig& processing_config) {
+        processing_config_ = processing_config;
+    }
+
+    void set_component_manager(std::shared_ptr<ComponentManager> component_manager) {
+        component_manager_ = component_manager;
+    }
+
+    OutputSchema modify_schema(OutputSchema&& output_schema) const;
+
+    [[nodiscard]] std::string to_string() const;
+};
+
+struct JoinClause {
+    ClauseInfo clause_info_;
+    std::shared_ptr<ComponentManager> component_manager_;
+    ProcessingConfig processing_config_;
+    JoinOptions options_;
+    // Number of entity ids at the start of the single processing unit that belong to the left symbol. Set when the
+    // processing is structured, which always happens before process is called
+    size_t num_left_entities_{0};
+
+    JoinClause() = delete;
+
+    ARCTICDB_MOVE_COPY_DEFAULT(JoinClause)
+
+    explicit JoinClause(JoinOptions options);
+
+    [[noreturn]] std::vector<std::vector<size_t>> structure_for_processing(std::vector<RangesAndKey>&) {
+        internal::raise<ErrorCode::E_ASSERTION_FAILURE>("JoinClause should never be first in the pipeline");
+    }
+
+    // entity_ids_vec must contain exactly two elements, the output entity ids of the left and right symbols' pipelines
+    [[nodiscard]] std::vector<std::vector<EntityId>> structure_for_processing(std::vector<std::vector<EntityId>>&& entity_ids_vec);
+
+    [[nodiscard]] std::vector<EntityId> process(std::vector<EntityId>&& entity_ids) const;
+
+    [[nodiscard]] const ClauseInfo& clause_info() const {
+        return clause_info_;
+    }
+
+    void set_processing_config(const ProcessingConfig& processing_config) {
+        processing_config_ = processing_config;
+    }
+
+    void set_component_manager(std::shared_ptr<ComponentManager> component_manager) {
+        component_manager_ = component_manager;
+    }
+
+    OutputSchema modify_schema(OutputSchema&& output_schema) const;
+
+    [[nodiscard]] std::string to_string() const;
+};
+
+// Vertical concatenation of the outputs of several symbols' pipelines, in the order the symbols were provided
+struct ConcatClause {
+    ClauseInfo clause_info_;
+    std::shared_ptr<ComponentManager> component_manager_;
+    ProcessingConfig processing_config_;
+
+    ConcatClause();
+
+    ARCTICDB_MOVE_COPY_DEFAULT(ConcatClause)
+
+    [[noreturn]] std::vector<std::vector<size_t>> structure_for_processing(std::vector<RangesAndKey>&) {
+        internal::raise<ErrorCode::E_ASSERTION_FAILURE>("ConcatClause should never be first in the pipeline");
+    }
+
+    // entity_ids_vec contains one element per symbol. The row ranges of each symbol are offset to follow on from
+    // those of the previous symbol, and the result is structured by row slice
+    [[nodiscard]] std::vector<std::vector<EntityId>> structure_for_processing(std::vector<std::vector<EntityId>>&& entity_ids_vec);
+
+    [[nodiscard]] std::vector<EntityId> process(std::vector<EntityId>&& entity_ids) const;
+
+    [[nodiscard]] const ClauseInfo& clause_info() const {
+        return clause_info_;
+    }
+
+    void set_processing_config(const ProcessingConfig& processing_config) {
+        processing_config_ = processing_config;
+    }
+
+    void set_component_manager(std::shared_ptr<ComponentManager> component_manager) {
+        component_manager_ = component_manager;
+    }
+
+    OutputSchema modify_schema(OutputSchema&& output_schema) const {
+        return output_schema;
+    }
+
+    [[nodiscard]] std::string to_string() const;
+};
+
 struct RemoveColumnPartitioningClause {
     ClauseInfo clause_info_;
     std::shared_ptr<ComponentManager> component_manager_;
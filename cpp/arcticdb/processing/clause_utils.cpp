@@ -84,6 +84,39 @@ std::vector<EntityId> flatten_entities(std::vector<std::vector<EntityId>>&& enti
     return res;
 }
 
+std::string index_column_name(const std::string& name, size_t level) {
+    return level == 0 ? name : fmt::format("__idx__{}", name);
+}
+
+void set_new_index_norm_metadata(
+        arcticdb::proto::descriptors::NormalizationMetadata& norm_meta,
+        const NewIndex& new_index) {
+    internal::check<ErrorCode::E_ASSERTION_FAILURE>(!new_index.empty(), "New index must have at least one column");
+    auto common = norm_meta.mutable_df()->mutable_common();
+    // Grouping on a categorical column groups on its codes, which are mapped back onto the categories on read
+    const auto is_categorical = [common](const std::string& name) {
+        return common->categories().count(name) > 0 || common->int_categories().count(name) > 0;
+    };
+    if (new_index.size() == 1) {
+        auto mutable_index = common->mutable_index();
+        mutable_index->set_name(new_index[0]);
+        mutable_index->clear_fake_name();
+        mutable_index->set_is_physically_stored(true);
+        mutable_index->set_is_categorical(is_categorical(new_index[0]));
+    } else {
+        auto multi_index = common->mutable_multi_index();
+        multi_index->Clear();
+        multi_index->set_name(new_index[0]);
+        multi_index->set_field_count(static_cast<uint32_t>(new_index.size() - 1));
+        for (uint32_t level = 0; level < new_index.size(); ++level) {
+            if (level > 0)
+                (*multi_index->mutable_timezone())[level] = "";
+            if (is_categorical(new_index[level]))
+                multi_index->add_categorical_field_pos(level);
+        }
+    }
+}
+
 using SegmentAndSlice = pipelines::SegmentAndSlice;
 
 std::vector<FutureOrSplitter> split_futures(
@@ -11,11 +11,13 @@
 #include <optional>
 #include <string>
 #include <unordered_set>
+#include <vector>
 
 #include <folly/futures/FutureSplitter.h>
 
 #include <arcticdb/pipeline/frame_slice.hpp>
 #include <arcticdb/processing/component_manager.hpp>
+#include <arcticdb/processing/expression_context.hpp>
 #include <arcticdb/processing/processing_unit.hpp>
 #include <arcticdb/processing/sorted_aggregation.hpp>
 
@@ -33,7 +35,9 @@ enum class ProcessingStructure {
 
 struct KeepCurrentIndex{};
 struct KeepCurrentTopLevelIndex{};
-using NewIndex = std::string;
+// The names of the columns forming the new index, in the order in which they should appear in the output. More than one
+// column produces a multi-index, for which the columns after the first are named as index_column_name describes
+using NewIndex = std::vector<std::string>;
 
 // Contains constant data about the clause identifiable at construction time
 struct ClauseInfo {
@@ -48,10 +52,13 @@ struct ClauseInfo {
     std::optional<std::unordered_set<std::string>> input_columns_{std::nullopt};
     // KeepCurrentIndex if this clause does not modify the index in any way
     // KeepCurrentTopLevelIndex if this clause requires multi-index levels>0 to be dropped, but otherwise does not modify it
-    // NewIndex if this clause has changed the index to a new (supplied) name
+    // NewIndex if this clause has changed the index to new (supplied) columns
     std::variant<KeepCurrentIndex, KeepCurrentTopLevelIndex, NewIndex> index_{KeepCurrentIndex()};
     // Whether this clause modifies the output descriptor
     bool modifies_output_descriptor_{false};
+    // Set if this clause only keeps rows matching this expression. Row-slices that the column stats show cannot contain
+    // any matching rows can then be skipped without being read
+    std::shared_ptr<ExpressionContext> row_filter_expression_{nullptr};
 };
 
 // Changes how the clause behaves based on information only available after it is constructed
@@ -194,6 +201,15 @@ ProcessingUnit gather_entities(ComponentManager& component_manager, const std::v
 }
 std::vector<EntityId> flatten_entities(std::vector<std::vector<EntityId>>&& entity_ids_vec);
 
+// Name of the column holding the given level of a new index. Levels after the first are prefixed in the same way as the
+// pandas normalizer does for multi-indexes, so that they are denormalized back to index levels with the original names
+std::string index_column_name(const std::string& name, size_t level);
+
+// Updates the normalization metadata to describe the new index, which is a multi-index if it has more than one column
+void set_new_index_norm_metadata(
+        arcticdb::proto::descriptors::NormalizationMetadata& norm_meta,
+        const NewIndex& new_index);
+
 using FutureOrSplitter = std::variant<folly::Future<pipelines::SegmentAndSlice>, folly::FutureSplitter<pipelines::SegmentAndSlice>>;
 
 std::vector<FutureOrSplitter> split_futures(
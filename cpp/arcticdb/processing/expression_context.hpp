@@ -38,6 +38,9 @@ struct ExpressionContext {
         void set_value(std::string name, std::shared_ptr<T> val) {
             map_.try_emplace(name, val);
         }
+        void replace_value(std::string name, std::shared_ptr<T> val) {
+            map_.insert_or_assign(std::move(name), std::move(val));
+        }
         std::shared_ptr<T> get_value(std::string name) const {
             return map_.at(name);
         }
@@ -47,6 +50,10 @@ struct ExpressionContext {
         expression_nodes_.set_value(name, std::move(expression_node));
     }
 
+    void replace_expression_node(const std::string& name, std::shared_ptr<ExpressionNode> expression_node) {
+        expression_nodes_.replace_value(name, std::move(expression_node));
+    }
+
     void add_value(const std::string& name, std::shared_ptr<Value> value) {
         values_.set_value(name, std::move(value));
     }
@@ -13,6 +13,7 @@
 #include <arcticdb/processing/operation_types.hpp>
 #include <arcticdb/processing/operation_dispatch_binary.hpp>
 #include <arcticdb/processing/operation_dispatch_unary.hpp>
+#include <arcticdb/processing/operation_dispatch_ternary.hpp>
 
 namespace arcticdb {
 
@@ -49,6 +50,14 @@ namespace arcticdb {
     return std::nullopt;
 }
 
+ExpressionNode::ExpressionNode(VariantNode condition, VariantNode left, VariantNode right, OperationType op) :
+    condition_(std::move(condition)),
+    left_(std::move(left)),
+    right_(std::move(right)),
+    operation_type_(op) {
+    util::check(is_ternary_operation(op), "Condition, left and right expressions supplied to non-ternary operator");
+}
+
 ExpressionNode::ExpressionNode(VariantNode left, VariantNode right, OperationType op) :
     left_(std::move(left)),
     right_(std::move(right)),
@@ -59,11 +68,15 @@ ExpressionNode::ExpressionNode(VariantNode left, VariantNode right, OperationTyp
 ExpressionNode::ExpressionNode(VariantNode left, OperationType op) :
     left_(std::move(left)),
     operation_type_(op) {
-    util::check(!is_binary_operation(op), "Binary expression expects both left and right children");
+    util::check(is_unary_operation(op), "Binary expression expects both left and right children");
 }
 
 VariantData ExpressionNode::compute(ProcessingUnit& seg) const {
-    if (is_binary_operation(operation_type_)) {
+    if (is_ternary_operation(operation_type_)) {
+        // All segments in a processing unit at this point hold the same rows
+        const auto row_count = seg.segments_.has_value() && !seg.segments_->empty() ? seg.segments_->front()->row_count() : 0;
+        return dispatch_ternary(seg.get(condition_), seg.get(left_), seg.get(right_), operation_type_, row_count);
+    } else if (is_binary_operation(operation_type_)) {
         return dispatch_binary(seg.get(left_), seg.get(right_), operation_type_);
     } else {
         return dispatch_unary(seg.get(left_), operation_type_);
@@ -79,7 +92,26 @@ std::variant<BitSetTag, DataType> ExpressionNode::compute(
     auto left_type = child_return_type(left_, expression_context, column_types, left_value_set_state);
     user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(left_value_set_state == ValueSetState::NOT_A_SET,
                                                           "Unexpected value set input to {}", operation_type_);
-    if (is_unary_operation(operation_type_)) {
+    if (is_ternary_operation(operation_type_)) {
+        // operation_type_ == OperationType::WHERE
+        ValueSetState condition_value_set_state;
+        auto condition_type = child_return_type(condition_, expression_context, column_types, condition_value_set_state);
+        user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+                condition_value_set_state == ValueSetState::NOT_A_SET &&
+                (std::holds_alternative<BitSetTag>(condition_type) || is_bool_type(std::get<DataType>(condition_type))),
+                "Unexpected non-boolean condition to {}", operation_type_);
+        ValueSetState right_value_set_state;
+        auto right_type = child_return_type(right_, expression_context, column_types, right_value_set_state);
+        user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(right_value_set_state == ValueSetState::NOT_A_SET, "Unexpected value set input to {}", operation_type_);
+        user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(std::holds_alternative<DataType>(left_type), "Unexpected bitset input as left operand to {}", operation_type_);
+        user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(std::holds_alternative<DataType>(right_type), "Unexpected bitset input as right operand to {}", operation_type_);
+        auto output_type = ternary_output_data_type(std::get<DataType>(left_type), std::get<DataType>(right_type));
+        user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+                output_type.has_value(),
+                "Unexpected data types {} {} input to {}",
+                std::get<DataType>(left_type), std::get<DataType>(right_type), operation_type_);
+        res = *output_type;
+    } else if (is_unary_operation(operation_type_)) {
         switch (operation_type_) {
             case OperationType::ABS:
             case OperationType::NEG:
@@ -112,6 +144,41 @@ std::variant<BitSetTag, DataType> ExpressionNode::compute(
                         "Unexpected data type {} input to {}",
                         std::get<DataType>(left_type), operation_type_);
                 break;
+            case OperationType::STR_LEN:
+                user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+                        std::holds_alternative<DataType>(left_type) && is_sequence_type(std::get<DataType>(left_type)),
+                        "Unexpected non-string input to {}", operation_type_);
+                res = DataType::FLOAT64;
+                break;
+            case OperationType::DT_YEAR:
+            case OperationType::DT_MONTH:
+            case OperationType::DT_DAY:
+            case OperationType::DT_HOUR:
+            case OperationType::DT_MINUTE:
+            case OperationType::DT_SECOND:
+            case OperationType::DT_DAYOFWEEK:
+            case OperationType::DT_DATE:
+                user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+                        std::holds_alternative<DataType>(left_type) && is_time_type(std::get<DataType>(left_type)),
+                        "Unexpected non-timestamp input to {}", operation_type_);
+                res = operation_type_ == OperationType::DT_DATE ? DataType::NANOSECONDS_UTC64 : DataType::INT32;
+                break;
+            case OperationType::LOG:
+            case OperationType::EXP:
+            case OperationType::SQRT:
+                user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(std::holds_alternative<DataType>(left_type), "Unexpected bitset input to {}", operation_type_);
+                details::visit_type(std::get<DataType>(left_type), [this, &res](auto tag) {
+                    using type_info = ScalarTypeInfo<decltype(tag)>;
+                    if constexpr (is_numeric_type(type_info::data_type) && !is_time_type(type_info::data_type)) {
+                        // All three promote in the same way
+                        using TargetType = typename unary_arithmetic_promoted_type<typename type_info::RawType, std::remove_reference_t<LogOperator>>::type;
+                        res = data_type_from_raw_type<TargetType>();
+                    } else {
+                        user_input::raise<ErrorCode::E_INVALID_USER_ARGUMENT>("Unexpected data type {} input to {}",
+                                                                              type_info::data_type, operation_type_);
+                    }
+                });
+                break;
             case OperationType::IDENTITY:
             case OperationType::NOT:
                 if (!std::holds_alternative<BitSetTag>(left_type)) {
@@ -133,6 +200,8 @@ std::variant<BitSetTag, DataType> ExpressionNode::compute(
             case OperationType::SUB:
             case OperationType::MUL:
             case OperationType::DIV:
+            case OperationType::POW:
+            case OperationType::ROUND:
                 user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(std::holds_alternative<DataType>(left_type), "Unexpected bitset input as left operand to {}", operation_type_);
                 user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(std::holds_alternative<DataType>(right_type), "Unexpected bitset input as right operand to {}", operation_type_);
                 user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(right_value_set_state == ValueSetState::NOT_A_SET, "Unexpected value set input to {}", operation_type_);
@@ -144,12 +213,12 @@ std::variant<BitSetTag, DataType> ExpressionNode::compute(
                             switch (operation_type_) {
                                 case OperationType::ADD: {
                                     using TargetType = typename type_arithmetic_promoted_type<typename left_type_info::RawType, typename right_type_info::RawType, std::remove_reference_t<PlusOperator>>::type;
-                                    res = data_type_from_raw_type<TargetType>();
+                                    res = arithmetic_output_data_type<left_type_info::data_type, right_type_info::data_type, PlusOperator, TargetType>();
                                     break;
                                 }
                                 case OperationType::SUB: {
                                     using TargetType = typename type_arithmetic_promoted_type<typename left_type_info::RawType, typename right_type_info::RawType, std::remove_reference_t<MinusOperator>>::type;
-                                    res = data_type_from_raw_type<TargetType>();
+                                    res = arithmetic_output_data_type<left_type_info::data_type, right_type_info::data_type, MinusOperator, TargetType>();
                                     break;
                                 }
                                 case OperationType::MUL: {
@@ -162,6 +231,19 @@ std::variant<BitSetTag, DataType> ExpressionNode::compute(
                                     res = data_type_from_raw_type<TargetType>();
                                     break;
                                 }
+                                case OperationType::POW: {
+                                    using TargetType = typename type_arithmetic_promoted_type<typename left_type_info::RawType, typename right_type_info::RawType, std::remove_reference_t<PowOperator>>::type;
+                                    res = data_type_from_raw_type<TargetType>();
+                                    break;
+                                }
+                                case OperationType::ROUND: {
+                                    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+                                            !is_time_type(left_type_info::data_type) && is_integer_type(right_type_info::data_type),
+                                            "Unexpected data types {} {} input to {}",
+                                            left_type_info::data_type, right_type_info::data_type, operation_type_);
+                                    res = left_type_info::data_type;
+                                    break;
+                                }
                                 default:
                                     internal::raise<ErrorCode::E_ASSERTION_FAILURE>("Unexpected binary operator");
                             }
@@ -200,6 +282,42 @@ std::variant<BitSetTag, DataType> ExpressionNode::compute(
                             std::get<DataType>(left_type), std::get<DataType>(right_type), operation_type_);
                 } // else - Empty value set compatible with all data types
                 break;
+            case OperationType::STARTSWITH:
+            case OperationType::ENDSWITH:
+            case OperationType::CONTAINS:
+            case OperationType::REGEX_MATCH:
+                user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(right_value_set_state == ValueSetState::NOT_A_SET, "Unexpected value set input to {}", operation_type_);
+                user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+                        std::holds_alternative<DataType>(left_type) && is_sequence_type(std::get<DataType>(left_type)),
+                        "Unexpected non-string left operand to {}", operation_type_);
+                user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+                        std::holds_alternative<DataType>(right_type) && is_sequence_type(std::get<DataType>(right_type)),
+                        "Unexpected non-string right operand to {}", operation_type_);
+                break;
+            case OperationType::DT_FLOOR:
+            case OperationType::DT_CEIL:
+                user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(right_value_set_state == ValueSetState::NOT_A_SET, "Unexpected value set input to {}", operation_type_);
+                user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+                        std::holds_alternative<DataType>(left_type) && is_time_type(std::get<DataType>(left_type)),
+                        "Unexpected non-timestamp left operand to {}", operation_type_);
+                user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+                        std::holds_alternative<DataType>(right_type) && is_integer_type(std::get<DataType>(right_type)),
+                        "Unexpected non-frequency right operand to {}", operation_type_);
+                res = DataType::NANOSECONDS_UTC64;
+                break;
+            case OperationType::CAST:
+                user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(right_value_set_state == ValueSetState::NOT_A_SET, "Unexpected value set input to {}", operation_type_);
+                user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+                        std::holds_alternative<DataType>(left_type) &&
+                        (is_numeric_type(std::get<DataType>(left_type)) || is_bool_type(std::get<DataType>(left_type))),
+                        "Unexpected non-numeric input to {}", operation_type_);
+                // The right operand is a value of the type being cast to
+                user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+                        std::holds_alternative<DataType>(right_type) &&
+                        (is_numeric_type(std::get<DataType>(right_type)) || is_bool_type(std::get<DataType>(right_type))),
+                        "Unexpected non-numeric target type for {}", operation_type_);
+                res = std::get<DataType>(right_type);
+                break;
             case OperationType::AND:
             case OperationType::OR:
             case OperationType::XOR:
@@ -82,10 +82,14 @@ struct BitSetTag{};
  * Basic AST node.
  */
 struct ExpressionNode {
+    // Only set for ternary operations, where it chooses between left_ and right_
+    VariantNode condition_;
     VariantNode left_;
     VariantNode right_;
     OperationType operation_type_;
 
+    ExpressionNode(VariantNode condition, VariantNode left, VariantNode right, OperationType op);
+
     ExpressionNode(VariantNode left, VariantNode right, OperationType op);
 
     ExpressionNode(VariantNode left, OperationType op);
@@ -0,0 +1,216 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <cmath>
+#include <limits>
+
+#include <fmt/format.h>
+#include <fmt/ranges.h>
+
+#include <arcticdb/processing/join_utils.hpp>
+#include <arcticdb/util/constants.hpp>
+#include <arcticdb/util/offset_string.hpp>
+#include <arcticdb/util/preconditions.hpp>
+
+namespace arcticdb {
+
+std::string JoinOptions::to_string() const {
+    return fmt::format("JOIN(on=[{}], how={})", fmt::join(on_, ", "), type_ == JoinType::INNER ? "inner" : "left");
+}
+
+namespace {
+void append_key_part(std::string& key, char type, std::string_view part) {
+    key.append(fmt::format("{}{}:", type, part.size()));
+    key.append(part);
+}
+
+void append_missing_key_part(std::string& key) {
+    key.push_back('n');
+}
+}
+
+void append_join_keys(const ColumnWithStrings& column, std::vector<std::string>& keys) {
+    std::vector<bool> present(keys.size(), false);
+    details::visit_type(column.column_->type().data_type(), [&column, &keys, &present](auto col_tag) {
+        using col_type_info = ScalarTypeInfo<decltype(col_tag)>;
+        if constexpr (is_empty_type(col_type_info::data_type)) {
+            // Every row is missing
+        } else if constexpr (is_sequence_type(col_type_info::data_type) ||
+                             is_numeric_type(col_type_info::data_type) ||
+                             is_bool_type(col_type_info::data_type)) {
+            Column::for_each_enumerated<typename col_type_info::TDT>(*column.column_, [&column, &keys, &present](auto enumerating_it) {
+                const auto idx = enumerating_it.idx();
+                auto& key = keys[idx];
+                present[idx] = true;
+                const auto value = enumerating_it.value();
+                if constexpr (is_sequence_type(col_type_info::data_type)) {
+                    if (auto str = column.string_at_offset(value, true); str.has_value()) {
+                        append_key_part(key, 's', *str);
+                    } else {
+                        append_missing_key_part(key);
+                    }
+                } else if constexpr (is_floating_point_type(col_type_info::data_type)) {
+                    if (std::isnan(value)) {
+                        append_missing_key_part(key);
+                    } else {
+                        append_key_part(key, 'f', fmt::format("{}", static_cast<double>(value)));
+                    }
+                } else if constexpr (is_time_type(col_type_info::data_type)) {
+                    if (value == NaT) {
+                        append_missing_key_part(key);
+                    } else {
+                        append_key_part(key, 't', fmt::format("{}", value));
+                    }
+                } else if constexpr (is_bool_type(col_type_info::data_type)) {
+                    append_key_part(key, 'b', value ? "1" : "0");
+                } else if constexpr (is_signed_type(col_type_info::data_type)) {
+                    append_key_part(key, 'i', fmt::format("{}", static_cast<int64_t>(value)));
+                } else {
+                    append_key_part(key, 'i', fmt::format("{}", static_cast<uint64_t>(value)));
+                }
+            });
+        } else {
+            schema::raise<ErrorCode::E_UNSUPPORTED_COLUMN_TYPE>(
+                    "Join key column '{}' has unsupported type {}", column.column_name_, col_type_info::data_type);
+        }
+    });
+    for (size_t idx = 0; idx < keys.size(); ++idx) {
+        if (!present[idx]) {
+            append_missing_key_part(keys[idx]);
+        }
+    }
+}
+
+void append_missing_join_keys(std::vector<std::string>& keys) {
+    for (auto& key: keys) {
+        append_missing_key_part(key);
+    }
+}
+
+HashJoinMatcher::HashJoinMatcher(std::vector<std::string>&& right_keys) {
+    positions_by_key_.reserve(right_keys.size());
+    for (size_t idx = 0; idx < right_keys.size(); ++idx) {
+        const auto [it, inserted] = positions_by_key_.try_emplace(std::move(right_keys[idx]), static_cast<int64_t>(idx));
+        user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+                inserted,
+                "Join requires the values of the on columns to be unique in the right symbol, rows {} and {} have the same values",
+                it->second, idx);
+    }
+}
+
+std::vector<int64_t> HashJoinMatcher::match(const std::vector<std::string>& left_keys) const {
+    std::vector<int64_t> matches(left_keys.size(), NO_JOIN_MATCH);
+    for (size_t idx = 0; idx < left_keys.size(); ++idx) {
+        if (const auto it = positions_by_key_.find(left_keys[idx]); it != positions_by_key_.end()) {
+            matches[idx] = it->second;
+        }
+    }
+    return matches;
+}
+
+DataType join_output_type(std::string_view column_name, DataType input_type) {
+    if ((is_numeric_type(input_type) && !is_time_type(input_type)) || is_bool_type(input_type)) {
+        return DataType::FLOAT64;
+    } else if (is_time_type(input_type)) {
+        return DataType::NANOSECONDS_UTC64;
+    } else if (is_sequence_type(input_type)) {
+        return DataType::UTF_DYNAMIC64;
+    } else {
+        schema::raise<ErrorCode::E_UNSUPPORTED_COLUMN_TYPE>(
+                "Join does not support column '{}' of type {}", column_name, input_type);
+    }
+}
+
+JoinColumn::JoinColumn(std::string name, DataType output_type, size_t right_row_count) :
+        name_(std::move(name)),
+        output_type_(output_type) {
+    if (output_type_ == DataType::FLOAT64) {
+        values_ = std::vector<double>(right_row_count, std::numeric_limits<double>::quiet_NaN());
+    } else if (output_type_ == DataType::NANOSECONDS_UTC64) {
+        values_ = std::vector<timestamp>(right_row_count, NaT);
+    } else {
+        values_ = std::vector<std::optional<std::string_view>>(right_row_count);
+    }
+}
+
+void JoinColumn::add_right_values(const ColumnWithStrings& column, size_t offset) {
+    details::visit_type(column.column_->type().data_type(), [this, &column, offset](auto col_tag) {
+        using col_type_info = ScalarTypeInfo<decltype(col_tag)>;
+        if constexpr (is_empty_type(col_type_info::data_type)) {
+            // Nothing to copy, the values are already all missing
+        } else if constexpr (is_sequence_type(col_type_info::data_type)) {
+            schema::check<ErrorCode::E_UNSUPPORTED_COLUMN_TYPE>(
+                    output_type_ == DataType::UTF_DYNAMIC64,
+                    "Join column '{}' has incompatible types {} and {} in different row slices",
+                    name_, output_type_, col_type_info::data_type);
+            auto& values = std::get<std::vector<std::optional<std::string_view>>>(values_);
+            Column::for_each_enumerated<typename col_type_info::TDT>(*column.column_, [&column, &values, offset](auto enumerating_it) {
+                values[offset + enumerating_it.idx()] = column.string_at_offset(enumerating_it.value(), true);
+            });
+        } else if constexpr (is_time_type(col_type_info::data_type)) {
+            schema::check<ErrorCode::E_UNSUPPORTED_COLUMN_TYPE>(
+                    output_type_ == DataType::NANOSECONDS_UTC64,
+                    "Join column '{}' has incompatible types {} and {} in different row slices",
+                    name_, output_type_, col_type_info::data_type);
+            auto& values = std::get<std::vector<timestamp>>(values_);
+            Column::for_each_enumerated<typename col_type_info::TDT>(*column.column_, [&values, offset](auto enumerating_it) {
+                values[offset + enumerating_it.idx()] = enumerating_it.value();
+            });
+        } else if constexpr (is_numeric_type(col_type_info::data_type) || is_bool_type(col_type_info::data_type)) {
+            schema::check<ErrorCode::E_UNSUPPORTED_COLUMN_TYPE>(
+                    output_type_ == DataType::FLOAT64,
+                    "Join column '{}' has incompatible types {} and {} in different row slices",
+                    name_, output_type_, col_type_info::data_type);
+            auto& values = std::get<std::vector<double>>(values_);
+            Column::for_each_enumerated<typename col_type_info::TDT>(*column.column_, [&values, offset](auto enumerating_it) {
+                values[offset + enumerating_it.idx()] = static_cast<double>(enumerating_it.value());
+            });
+        } else {
+            schema::raise<ErrorCode::E_UNSUPPORTED_COLUMN_TYPE>(
+                    "Join does not support column '{}' of type {}", name_, col_type_info::data_type);
+        }
+    });
+}
+
+std::shared_ptr<Column> JoinColumn::matched_column(const std::vector<int64_t>& matches, StringPool& string_pool) const {
+    const auto row_count = matches.size();
+    auto output_column = std::make_shared<Column>(make_scalar_type(output_type_), row_count, AllocationType::PRESIZED, Sparsity::NOT_PERMITTED);
+    if (row_count == 0) {
+        return output_column;
+    }
+    util::variant_match(
+            values_,
+            [&matches, &output_column](const std::vector<double>& values) {
+                auto data = output_column->data();
+                auto it = data.begin<ScalarTagType<DataTypeTag<DataType::FLOAT64>>>();
+                for (auto match: matches) {
+                    *it++ = match == NO_JOIN_MATCH ? std::numeric_limits<double>::quiet_NaN() : values[match];
+                }
+            },
+            [&matches, &output_column](const std::vector<timestamp>& values) {
+                auto data = output_column->data();
+                auto it = data.begin<ScalarTagType<DataTypeTag<DataType::NANOSECONDS_UTC64>>>();
+                for (auto match: matches) {
+                    *it++ = match == NO_JOIN_MATCH ? NaT : values[match];
+                }
+            },
+            [&matches, &output_column, &string_pool](const std::vector<std::optional<std::string_view>>& values) {
+                auto data = output_column->data();
+                auto it = data.begin<ScalarTagType<DataTypeTag<DataType::UTF_DYNAMIC64>>>();
+                for (auto match: matches) {
+                    if (match == NO_JOIN_MATCH || !values[match].has_value()) {
+                        *it++ = not_a_string();
+                    } else {
+                        *it++ = string_pool.get(*values[match]).offset();
+                    }
+                }
+            });
+    output_column->set_row_data(row_count - 1);
+    return output_column;
+}
+
+} //namespace arcticdb
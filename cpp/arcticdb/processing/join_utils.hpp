@@ -0,0 +1,101 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#pragma once
+
+#include <cstdint>
+#include <optional>
+#include <string>
+#include <string_view>
+#include <variant>
+#include <vector>
+
+#include <ankerl/unordered_dense.h>
+
+#include <arcticdb/column_store/column.hpp>
+#include <arcticdb/column_store/string_pool.hpp>
+#include <arcticdb/entity/types.hpp>
+#include <arcticdb/processing/expression_node.hpp>
+
+namespace arcticdb {
+
+enum class JoinType {
+    INNER,
+    LEFT
+};
+
+struct JoinOptions {
+    // Columns that must be equal on both sides for rows to match
+    std::vector<std::string> on_;
+    // INNER drops left rows with no matching right row, LEFT keeps them with missing values in the right columns
+    JoinType type_{JoinType::INNER};
+
+    [[nodiscard]] std::string to_string() const;
+};
+
+// Position output by the join matching for left rows with no matching right row
+constexpr int64_t NO_JOIN_MATCH = -1;
+
+// Appends one key part per row of column to keys, which should have one element per row of the row slice. Parts are
+// self-delimiting and integers of all widths are encoded identically, so keys built from several key columns only
+// compare equal if every key column value is equal. Missing values and NaNs are all encoded as the same part.
+void append_join_keys(const ColumnWithStrings& column, std::vector<std::string>& keys);
+
+// Appends the missing value key part to every key, for key columns that are not present in a row slice
+void append_missing_join_keys(std::vector<std::string>& keys);
+
+/*
+ * Many-to-one equi-join matching, equivalent to pd.merge(left, right, on=..., validate="many_to_one") in terms of
+ * which rows match. Construction takes the keys of all of the right rows, in order, and builds a hash table from
+ * key to position in the right symbol. Left rows can then be matched one row slice at a time.
+ */
+class HashJoinMatcher {
+public:
+    explicit HashJoinMatcher(std::vector<std::string>&& right_keys);
+
+    [[nodiscard]] std::vector<int64_t> match(const std::vector<std::string>& left_keys) const;
+
+private:
+    ankerl::unordered_dense::map<std::string, int64_t> positions_by_key_;
+};
+
+// Type of the column produced by the join for a right column of the given type. Numeric and bool columns become
+// FLOAT64 so that unmatched rows can be represented as NaN, times stay as times (with NaT for unmatched rows), and
+// strings become dynamic strings (with None for unmatched rows)
+DataType join_output_type(std::string_view column_name, DataType input_type);
+
+/*
+ * The values of one right column gathered from all of the right row slices, indexed by position in the right symbol
+ * so that they can be looked up using the positions output by the join matching.
+ * String values are views into the string pools of the right segments, which must outlive this object.
+ */
+class JoinColumn {
+public:
+    JoinColumn(std::string name, DataType output_type, size_t right_row_count);
+
+    // Copies the values of one right row slice, the first row of which is at position offset in the right symbol
+    void add_right_values(const ColumnWithStrings& column, size_t offset);
+
+    // Builds the output column for one left row slice, with one row per element of matches. New strings are added to
+    // string_pool, which should be the string pool of the segment the returned column is added to
+    [[nodiscard]] std::shared_ptr<Column> matched_column(const std::vector<int64_t>& matches, StringPool& string_pool) const;
+
+    [[nodiscard]] const std::string& name() const {
+        return name_;
+    }
+
+    [[nodiscard]] DataType output_type() const {
+        return output_type_;
+    }
+
+private:
+    std::string name_;
+    DataType output_type_;
+    std::variant<std::vector<double>, std::vector<timestamp>, std::vector<std::optional<std::string_view>>> values_;
+};
+
+} //namespace arcticdb
@@ -7,6 +7,9 @@
  */
 
 #include <arcticdb/processing/operation_dispatch_binary.hpp>
+#include <arcticdb/processing/operation_dispatch_datetime.hpp>
+#include <arcticdb/processing/operation_dispatch_string.hpp>
+#include <arcticdb/processing/operation_dispatch_unary.hpp>
 
 namespace arcticdb {
 
@@ -134,6 +137,12 @@ VariantData dispatch_binary(const VariantData& left, const VariantData& right, O
             return visit_binary_operator(left, right, TimesOperator{});
         case OperationType::DIV:
             return visit_binary_operator(left, right, DivideOperator{});
+        case OperationType::POW:
+            return visit_binary_operator(left, right, PowOperator{});
+        case OperationType::ROUND:
+            return visit_binary_operator(left, right, RoundOperator{});
+        case OperationType::CAST:
+            return visit_cast(left, right);
         case OperationType::EQ:
             return visit_binary_comparator(left, right, EqualsOperator{});
         case OperationType::NE:
@@ -150,6 +159,14 @@ VariantData dispatch_binary(const VariantData& left, const VariantData& right, O
             return visit_binary_membership(left, right, IsInOperator{});
         case OperationType::ISNOTIN:
             return visit_binary_membership(left, right, IsNotInOperator{});
+        case OperationType::STARTSWITH:
+        case OperationType::ENDSWITH:
+        case OperationType::CONTAINS:
+        case OperationType::REGEX_MATCH:
+            return visit_string_predicate(left, right, operation);
+        case OperationType::DT_FLOOR:
+        case OperationType::DT_CEIL:
+            return visit_datetime_round(left, right, operation);
         case OperationType::AND:
         case OperationType::OR:
         case OperationType::XOR:
@@ -327,7 +327,7 @@ VariantData binary_operator(const Value& left, const Value& right, Func&& func)
             auto right_value = *reinterpret_cast<const typename right_type_info::RawType*>(right.data_);
             auto left_value = *reinterpret_cast<const typename left_type_info::RawType*>(left.data_);
             using TargetType = typename type_arithmetic_promoted_type<typename left_type_info::RawType, typename right_type_info::RawType, std::remove_reference_t<Func>>::type;
-            output_value->data_type_ = data_type_from_raw_type<TargetType>();
+            output_value->data_type_ = arithmetic_output_data_type<left_type_info::data_type, right_type_info::data_type, std::remove_reference_t<Func>, TargetType>();
             *reinterpret_cast<TargetType*>(output_value->data_) = func.apply(left_value, right_value);
         });
     });
@@ -355,7 +355,7 @@ VariantData binary_operator(const ColumnWithStrings& left, const ColumnWithStrin
                                         right.column_->type()));
             }
             using TargetType = typename type_arithmetic_promoted_type<typename left_type_info::RawType, typename right_type_info::RawType, std::remove_reference_t<decltype(func)>>::type;
-            constexpr auto output_data_type = data_type_from_raw_type<TargetType>();
+            constexpr auto output_data_type = arithmetic_output_data_type<left_type_info::data_type, right_type_info::data_type, std::remove_reference_t<decltype(func)>, TargetType>();
             output_column = std::make_unique<Column>(make_scalar_type(output_data_type), Sparsity::PERMITTED);
             Column::transform<typename left_type_info::TDT, typename right_type_info::TDT, ScalarTagType<DataTypeTag<output_data_type>>>(
                     *(left.column_),
@@ -396,7 +396,7 @@ VariantData binary_operator(const ColumnWithStrings& col, const Value& val, Func
             using TargetType = typename type_arithmetic_promoted_type<typename col_type_info::RawType, typename val_type_info::RawType, std::remove_reference_t<decltype(func)>>::type;
             if constexpr(arguments_reversed) {
                 column_name = binary_operation_column_name(fmt::format("{}", raw_value), func, col.column_name_);
-                constexpr auto output_data_type = data_type_from_raw_type<TargetType>();
+                constexpr auto output_data_type = arithmetic_output_data_type<val_type_info::data_type, col_type_info::data_type, std::remove_reference_t<decltype(func)>, TargetType>();
                 output_column = std::make_unique<Column>(make_scalar_type(output_data_type), Sparsity::PERMITTED);
                 Column::transform<typename col_type_info::TDT, ScalarTagType<DataTypeTag<output_data_type>>>(
                         *(col.column_),
@@ -406,7 +406,7 @@ VariantData binary_operator(const ColumnWithStrings& col, const Value& val, Func
                 });
             } else {
                 column_name = binary_operation_column_name(col.column_name_, func, fmt::format("{}", raw_value));
-                constexpr auto output_data_type = data_type_from_raw_type<TargetType>();
+                constexpr auto output_data_type = arithmetic_output_data_type<col_type_info::data_type, val_type_info::data_type, std::remove_reference_t<decltype(func)>, TargetType>();
                 output_column = std::make_unique<Column>(make_scalar_type(output_data_type), Sparsity::PERMITTED);
                 Column::transform<typename col_type_info::TDT, ScalarTagType<DataTypeTag<output_data_type>>>(
                         *(col.column_),
@@ -456,6 +456,10 @@ extern template
 VariantData visit_binary_operator<arcticdb::TimesOperator>(const VariantData&, const VariantData&, TimesOperator&&);
 extern template
 VariantData visit_binary_operator<arcticdb::DivideOperator>(const VariantData&, const VariantData&, DivideOperator&&);
+extern template
+VariantData visit_binary_operator<arcticdb::PowOperator>(const VariantData&, const VariantData&, PowOperator&&);
+extern template
+VariantData visit_binary_operator<arcticdb::RoundOperator>(const VariantData&, const VariantData&, RoundOperator&&);
 
 // instantiated in operation_dispatch_binary_comparator.cpp to reduce compilation memory use
 extern template
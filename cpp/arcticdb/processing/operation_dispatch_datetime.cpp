@@ -0,0 +1,188 @@
+/*
+ * Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <arcticdb/column_store/column.hpp>
+#include <arcticdb/entity/type_utils.hpp>
+#include <arcticdb/processing/operation_dispatch.hpp>
+#include <arcticdb/processing/operation_dispatch_datetime.hpp>
+#include <arcticdb/util/constants.hpp>
+#include <arcticdb/util/variant.hpp>
+
+namespace arcticdb {
+
+namespace {
+
+using TimestampTDT = ScalarTagType<DataTypeTag<DataType::NANOSECONDS_UTC64>>;
+
+constexpr int64_t NANOSECONDS_PER_SECOND = 1'000'000'000;
+constexpr int64_t NANOSECONDS_PER_MINUTE = 60 * NANOSECONDS_PER_SECOND;
+constexpr int64_t NANOSECONDS_PER_HOUR = 60 * NANOSECONDS_PER_MINUTE;
+constexpr int64_t NANOSECONDS_PER_DAY = 24 * NANOSECONDS_PER_HOUR;
+
+constexpr int64_t floor_div(int64_t numerator, int64_t denominator) {
+    auto quotient = numerator / denominator;
+    if ((numerator % denominator != 0) && ((numerator < 0) != (denominator < 0)))
+        --quotient;
+    return quotient;
+}
+
+struct CivilDate {
+    int32_t year;
+    int32_t month;
+    int32_t day;
+};
+
+// Proleptic Gregorian calendar date from days since the epoch, see https://howardhinnant.github.io/date_algorithms.html
+constexpr CivilDate civil_from_days(int64_t days) {
+    days += 719468;
+    const int64_t era = floor_div(days, 146097);
+    const int64_t day_of_era = days - era * 146097;
+    const int64_t year_of_era = (day_of_era - day_of_era / 1460 + day_of_era / 36524 - day_of_era / 146096) / 365;
+    const int64_t day_of_year = day_of_era - (365 * year_of_era + year_of_era / 4 - year_of_era / 100);
+    const int64_t shifted_month = (5 * day_of_year + 2) / 153;
+    const auto day = static_cast<int32_t>(day_of_year - (153 * shifted_month + 2) / 5 + 1);
+    const auto month = static_cast<int32_t>(shifted_month < 10 ? shifted_month + 3 : shifted_month - 9);
+    const auto year = static_cast<int32_t>(year_of_era + era * 400 + (month <= 2 ? 1 : 0));
+    return {year, month, day};
+}
+
+template<OperationType operation>
+int32_t component_of(timestamp ts) {
+    const auto days = floor_div(ts, NANOSECONDS_PER_DAY);
+    const auto time_of_day = ts - days * NANOSECONDS_PER_DAY;
+    if constexpr (operation == OperationType::DT_YEAR) {
+        return civil_from_days(days).year;
+    } else if constexpr (operation == OperationType::DT_MONTH) {
+        return civil_from_days(days).month;
+    } else if constexpr (operation == OperationType::DT_DAY) {
+        return civil_from_days(days).day;
+    } else if constexpr (operation == OperationType::DT_HOUR) {
+        return static_cast<int32_t>(time_of_day / NANOSECONDS_PER_HOUR);
+    } else if constexpr (operation == OperationType::DT_MINUTE) {
+        return static_cast<int32_t>((time_of_day / NANOSECONDS_PER_MINUTE) % 60);
+    } else if constexpr (operation == OperationType::DT_SECOND) {
+        return static_cast<int32_t>((time_of_day / NANOSECONDS_PER_SECOND) % 60);
+    } else if constexpr (operation == OperationType::DT_DAYOFWEEK) {
+        // The epoch was a Thursday
+        return static_cast<int32_t>(days - floor_div(days + 3, 7) * 7 + 3);
+    } else {
+        static_assert(operation == OperationType::DT_YEAR, "Unexpected datetime component");
+    }
+}
+
+void check_timestamp_column(const ColumnWithStrings& col, OperationType operation) {
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+        is_time_type(col.column_->type().data_type()),
+        "Cannot perform datetime operation {} on {} ({})",
+        operation, col.column_name_, get_user_friendly_type_string(col.column_->type()));
+}
+
+template<OperationType operation>
+VariantData datetime_component(const ColumnWithStrings& col) {
+    auto output_column = std::make_unique<Column>(make_scalar_type(DataType::INT32), Sparsity::PERMITTED);
+    Column::for_each_enumerated<TimestampTDT>(*col.column_, [&output_column](auto enumerated_it) {
+        if (enumerated_it.value() != NaT)
+            output_column->set_scalar(enumerated_it.idx(), component_of<operation>(enumerated_it.value()));
+    });
+    // NaT rows at the end of the column leave no trace in the output without this
+    if (const auto missing_rows = col.column_->last_row() - output_column->last_row(); missing_rows > 0)
+        output_column->mark_absent_rows(static_cast<size_t>(missing_rows));
+    return {ColumnWithStrings(std::move(output_column), fmt::format("{}({})", operation, col.column_name_))};
+}
+
+VariantData datetime_date(const ColumnWithStrings& col) {
+    auto output_column = std::make_unique<Column>(make_scalar_type(DataType::NANOSECONDS_UTC64), Sparsity::PERMITTED);
+    Column::transform<TimestampTDT, TimestampTDT>(*col.column_, *output_column, [](timestamp ts) -> timestamp {
+        return ts == NaT ? NaT : floor_div(ts, NANOSECONDS_PER_DAY) * NANOSECONDS_PER_DAY;
+    });
+    return {ColumnWithStrings(std::move(output_column), fmt::format("{}({})", OperationType::DT_DATE, col.column_name_))};
+}
+
+VariantData datetime_round(const ColumnWithStrings& col, const Value& val, OperationType operation) {
+    check_timestamp_column(col, operation);
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+        is_integer_type(val.data_type_),
+        "Datetime operation {} on {} requires a frequency, received {}",
+        operation, col.column_name_, get_user_friendly_type_string(val.type()));
+    int64_t frequency{0};
+    details::visit_type(val.data_type_, [&val, &frequency](auto val_tag) {
+        using val_type_info = ScalarTypeInfo<decltype(val_tag)>;
+        if constexpr (is_integer_type(val_type_info::data_type))
+            frequency = static_cast<int64_t>(val.get<typename val_type_info::RawType>());
+    });
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+        frequency > 0,
+        "Datetime operation {} on {} requires a positive frequency, received {}ns",
+        operation, col.column_name_, frequency);
+
+    auto output_column = std::make_unique<Column>(make_scalar_type(DataType::NANOSECONDS_UTC64), Sparsity::PERMITTED);
+    if (operation == OperationType::DT_FLOOR) {
+        Column::transform<TimestampTDT, TimestampTDT>(*col.column_, *output_column, [frequency](timestamp ts) -> timestamp {
+            return ts == NaT ? NaT : floor_div(ts, frequency) * frequency;
+        });
+    } else {
+        Column::transform<TimestampTDT, TimestampTDT>(*col.column_, *output_column, [frequency](timestamp ts) -> timestamp {
+            return ts == NaT ? NaT : -floor_div(-ts, frequency) * frequency;
+        });
+    }
+    return {ColumnWithStrings(std::move(output_column), fmt::format("{}({}, {}ns)", operation, col.column_name_, frequency))};
+}
+
+} // namespace
+
+VariantData visit_datetime_component(const VariantData& left, OperationType operation) {
+    return std::visit(util::overload {
+        [operation] (const ColumnWithStrings& l) -> VariantData {
+            check_timestamp_column(l, operation);
+            switch (operation) {
+                case OperationType::DT_YEAR:
+                    return datetime_component<OperationType::DT_YEAR>(l);
+                case OperationType::DT_MONTH:
+                    return datetime_component<OperationType::DT_MONTH>(l);
+                case OperationType::DT_DAY:
+                    return datetime_component<OperationType::DT_DAY>(l);
+                case OperationType::DT_HOUR:
+                    return datetime_component<OperationType::DT_HOUR>(l);
+                case OperationType::DT_MINUTE:
+                    return datetime_component<OperationType::DT_MINUTE>(l);
+                case OperationType::DT_SECOND:
+                    return datetime_component<OperationType::DT_SECOND>(l);
+                case OperationType::DT_DAYOFWEEK:
+                    return datetime_component<OperationType::DT_DAYOFWEEK>(l);
+                case OperationType::DT_DATE:
+                    return datetime_date(l);
+                default:
+                    internal::raise<ErrorCode::E_ASSERTION_FAILURE>("Unexpected datetime operation {}", operation);
+            }
+        },
+        [] (EmptyResult l) -> VariantData {
+            return l;
+        },
+        [operation] (const auto&) -> VariantData {
+            user_input::raise<ErrorCode::E_INVALID_USER_ARGUMENT>("Datetime operation {} must be of a column", operation);
+            return EmptyResult{};
+        }
+    }, left);
+}
+
+VariantData visit_datetime_round(const VariantData& left, const VariantData& right, OperationType operation) {
+    if (std::holds_alternative<EmptyResult>(left))
+        return EmptyResult{};
+
+    return std::visit(util::overload {
+        [operation] (const ColumnWithStrings& l, const std::shared_ptr<Value>& r) -> VariantData {
+            return datetime_round(l, *r, operation);
+        },
+        [operation] (const auto&, const auto&) -> VariantData {
+            user_input::raise<ErrorCode::E_INVALID_USER_ARGUMENT>("Datetime operation {} must be of a column to a frequency", operation);
+            return EmptyResult{};
+        }
+    }, left, right);
+}
+
+}
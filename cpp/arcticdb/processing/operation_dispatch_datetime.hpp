@@ -0,0 +1,26 @@
+/*
+ * Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#pragma once
+
+#include <arcticdb/processing/expression_node.hpp>
+#include <arcticdb/processing/operation_types.hpp>
+
+namespace arcticdb {
+
+// All datetime operations work on timestamps in UTC
+
+// DT_YEAR, DT_MONTH, DT_DAY, DT_HOUR, DT_MINUTE, DT_SECOND and DT_DAYOFWEEK (Monday=0) of a timestamp column, producing
+// an INT32 column with no value for NaT rows. DT_DATE produces a timestamp column of the midnights starting each day
+VariantData visit_datetime_component(const VariantData& left, OperationType operation);
+
+// DT_FLOOR and DT_CEIL of a timestamp column to a multiple of a frequency given as an integer number of nanoseconds,
+// producing a timestamp column. NaT rows are left as NaT
+VariantData visit_datetime_round(const VariantData& left, const VariantData& right, OperationType operation);
+
+}
@@ -0,0 +1,188 @@
+/*
+ * Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <cstring>
+#include <limits>
+#include <string>
+#include <string_view>
+
+#include <ankerl/unordered_dense.h>
+
+#include <arcticdb/column_store/column.hpp>
+#include <arcticdb/column_store/string_pool.hpp>
+#include <arcticdb/entity/type_utils.hpp>
+#include <arcticdb/processing/operation_dispatch.hpp>
+#include <arcticdb/processing/operation_dispatch_string.hpp>
+#include <arcticdb/util/regex_filter.hpp>
+#include <arcticdb/util/variant.hpp>
+
+namespace arcticdb {
+
+namespace {
+
+void append_utf8(uint32_t code_point, std::string& output) {
+    if (code_point < 0x80) {
+        output.push_back(static_cast<char>(code_point));
+    } else if (code_point < 0x800) {
+        output.push_back(static_cast<char>(0xC0 | (code_point >> 6)));
+        output.push_back(static_cast<char>(0x80 | (code_point & 0x3F)));
+    } else if (code_point < 0x10000) {
+        output.push_back(static_cast<char>(0xE0 | (code_point >> 12)));
+        output.push_back(static_cast<char>(0x80 | ((code_point >> 6) & 0x3F)));
+        output.push_back(static_cast<char>(0x80 | (code_point & 0x3F)));
+    } else {
+        output.push_back(static_cast<char>(0xF0 | (code_point >> 18)));
+        output.push_back(static_cast<char>(0x80 | ((code_point >> 12) & 0x3F)));
+        output.push_back(static_cast<char>(0x80 | ((code_point >> 6) & 0x3F)));
+        output.push_back(static_cast<char>(0x80 | (code_point & 0x3F)));
+    }
+}
+
+// Fixed-width unicode strings are held as UTF-32, whereas values from Python and dynamic strings are UTF-8
+std::string utf32_to_utf8(std::string_view utf32) {
+    std::string output;
+    output.reserve(utf32.size() / UNICODE_WIDTH);
+    for (size_t pos = 0; pos + UNICODE_WIDTH <= utf32.size(); pos += UNICODE_WIDTH) {
+        uint32_t code_point;
+        memcpy(&code_point, utf32.data() + pos, UNICODE_WIDTH);
+        append_utf8(code_point, output);
+    }
+    return output;
+}
+
+size_t utf8_length(std::string_view str) {
+    size_t length{0};
+    for (auto c: str) {
+        // Count every byte other than continuation bytes
+        if ((static_cast<uint8_t>(c) & 0xC0) != 0x80)
+            ++length;
+    }
+    return length;
+}
+
+// Calls func once with the UTF-8 contents of the string at each distinct offset in the column, and sets the bit for
+// every row holding a string func returned true for. Rows with missing strings are never set
+template<typename Func>
+util::BitSet string_predicate(const ColumnWithStrings& col, Func&& func) {
+    const auto data_type = col.column_->type().data_type();
+    const bool fixed_width = is_fixed_string_type(data_type);
+    const bool utf32 = fixed_width && is_utf_type(data_type);
+    ankerl::unordered_dense::map<entity::position_t, bool> results;
+    util::BitSet output_bitset;
+    details::visit_type(data_type, [&](auto col_tag) {
+        using type_info = ScalarTypeInfo<decltype(col_tag)>;
+        if constexpr (is_sequence_type(type_info::data_type)) {
+            // Non-explicit lambda capture due to a bug in LLVM: https://github.com/llvm/llvm-project/issues/34798
+            Column::transform<typename type_info::TDT>(*col.column_, output_bitset, false, [&](auto input_value) -> bool {
+                const auto offset = static_cast<entity::position_t>(input_value);
+                auto [it, inserted] = results.try_emplace(offset, false);
+                if (inserted) {
+                    if (auto str = col.string_at_offset(offset, fixed_width); str.has_value())
+                        it->second = utf32 ? func(std::string_view{utf32_to_utf8(*str)}) : func(*str);
+                }
+                return it->second;
+            });
+        }
+    });
+    ARCTICDB_DEBUG(log::version(), "Evaluated string predicate on {} distinct strings", results.size());
+    return output_bitset;
+}
+
+VariantData string_predicate(const ColumnWithStrings& col, const Value& val, OperationType operation) {
+    if (is_empty_type(col.column_->type().data_type()))
+        return EmptyResult{};
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+        is_sequence_type(col.column_->type().data_type()),
+        "Cannot perform string operation {} on {} ({})",
+        operation, col.column_name_, get_user_friendly_type_string(col.column_->type()));
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+        val.has_sequence_type(),
+        "String operation {} on {} requires a string argument, received {}",
+        operation, col.column_name_, get_user_friendly_type_string(val.type()));
+
+    const std::string pattern(*val.str_data(), val.len());
+    switch (operation) {
+        case OperationType::STARTSWITH:
+            return string_predicate(col, [&pattern](std::string_view str) { return str.starts_with(pattern); });
+        case OperationType::ENDSWITH:
+            return string_predicate(col, [&pattern](std::string_view str) { return str.ends_with(pattern); });
+        case OperationType::CONTAINS:
+            return string_predicate(col, [&pattern](std::string_view str) { return str.find(pattern) != std::string_view::npos; });
+        case OperationType::REGEX_MATCH: {
+            util::RegexPattern regex_pattern{pattern};
+            util::Regex regex{regex_pattern};
+            return string_predicate(col, [&regex](std::string_view str) { return regex.match(str); });
+        }
+        default:
+            internal::raise<ErrorCode::E_ASSERTION_FAILURE>("Unexpected string operation {}", operation);
+    }
+}
+
+VariantData string_length(const ColumnWithStrings& col) {
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+        is_sequence_type(col.column_->type().data_type()),
+        "Cannot perform string operation {} on {} ({})",
+        OperationType::STR_LEN, col.column_name_, get_user_friendly_type_string(col.column_->type()));
+    const auto data_type = col.column_->type().data_type();
+    const bool fixed_width = is_fixed_string_type(data_type);
+    const bool utf32 = fixed_width && is_utf_type(data_type);
+    ankerl::unordered_dense::map<entity::position_t, double> lengths;
+    auto output_column = std::make_unique<Column>(make_scalar_type(DataType::FLOAT64), Sparsity::PERMITTED);
+    details::visit_type(data_type, [&](auto col_tag) {
+        using type_info = ScalarTypeInfo<decltype(col_tag)>;
+        if constexpr (is_sequence_type(type_info::data_type)) {
+            Column::transform<typename type_info::TDT, ScalarTagType<DataTypeTag<DataType::FLOAT64>>>(
+                *col.column_,
+                *output_column,
+                [&](auto input_value) -> double {
+                const auto offset = static_cast<entity::position_t>(input_value);
+                auto [it, inserted] = lengths.try_emplace(offset, std::numeric_limits<double>::quiet_NaN());
+                if (inserted) {
+                    if (auto str = col.string_at_offset(offset, fixed_width); str.has_value())
+                        it->second = static_cast<double>(utf32 ? str->size() / UNICODE_WIDTH : utf8_length(*str));
+                }
+                return it->second;
+            });
+        }
+    });
+    return {ColumnWithStrings(std::move(output_column), fmt::format("{}({})", OperationType::STR_LEN, col.column_name_))};
+}
+
+} // namespace
+
+VariantData visit_string_predicate(const VariantData& left, const VariantData& right, OperationType operation) {
+    if (std::holds_alternative<EmptyResult>(left))
+        return EmptyResult{};
+
+    return std::visit(util::overload {
+        [operation] (const ColumnWithStrings& l, const std::shared_ptr<Value>& r) -> VariantData {
+            return transform_to_placeholder(string_predicate(l, *r, operation));
+        },
+        [operation] (const auto&, const auto&) -> VariantData {
+            user_input::raise<ErrorCode::E_INVALID_USER_ARGUMENT>("String operation {} must be of a column against a value", operation);
+            return EmptyResult{};
+        }
+    }, left, right);
+}
+
+VariantData visit_string_length(const VariantData& left) {
+    return std::visit(util::overload {
+        [] (const ColumnWithStrings& l) -> VariantData {
+            return string_length(l);
+        },
+        [] (EmptyResult l) -> VariantData {
+            return l;
+        },
+        [] (const auto&) -> VariantData {
+            user_input::raise<ErrorCode::E_INVALID_USER_ARGUMENT>("String operation {} must be of a column", OperationType::STR_LEN);
+            return EmptyResult{};
+        }
+    }, left);
+}
+
+}
@@ -0,0 +1,27 @@
+/*
+ * Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#pragma once
+
+#include <arcticdb/processing/expression_node.hpp>
+#include <arcticdb/processing/operation_types.hpp>
+
+namespace arcticdb {
+
+// String operations are evaluated once per distinct string pool offset in the column rather than once per row, with the
+// result for each offset then broadcast to every row holding it
+
+// STARTSWITH, ENDSWITH, CONTAINS and REGEX_MATCH of a string column against a string value, producing a bitset. Missing
+// strings never match
+VariantData visit_string_predicate(const VariantData& left, const VariantData& right, OperationType operation);
+
+// STR_LEN of a string column, producing a FLOAT64 column of lengths in characters, with NaN for missing strings as in
+// pandas
+VariantData visit_string_length(const VariantData& left);
+
+}
@@ -0,0 +1,266 @@
+/*
+ * Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <algorithm>
+#include <limits>
+#include <numeric>
+#include <vector>
+
+#include <arcticdb/column_store/column.hpp>
+#include <arcticdb/entity/type_utils.hpp>
+#include <arcticdb/processing/operation_dispatch_ternary.hpp>
+#include <arcticdb/util/constants.hpp>
+#include <arcticdb/util/variant.hpp>
+
+namespace arcticdb {
+
+namespace {
+
+using BoolTDT = ScalarTagType<DataTypeTag<DataType::BOOL8>>;
+
+constexpr bool supported_operand_type(DataType data_type) {
+    return is_numeric_type(data_type) || is_bool_type(data_type);
+}
+
+std::optional<DataType> operand_data_type(const VariantData& operand, OperationType operation) {
+    return util::variant_match(operand,
+        [](const ColumnWithStrings& col) -> std::optional<DataType> {
+            return col.column_->type().data_type();
+        },
+        [](const std::shared_ptr<Value>& val) -> std::optional<DataType> {
+            return val->data_type_;
+        },
+        [](EmptyResult) -> std::optional<DataType> {
+            return std::nullopt;
+        },
+        [operation](const auto&) -> std::optional<DataType> {
+            user_input::raise<ErrorCode::E_INVALID_USER_ARGUMENT>("Bitset/ValueSet inputs not accepted as operands to {}", operation);
+            return std::nullopt;
+        });
+}
+
+std::string operand_name(const VariantData& operand) {
+    return util::variant_match(operand,
+        [](const ColumnWithStrings& col) -> std::string {
+            return col.column_name_;
+        },
+        [](const std::shared_ptr<Value>& val) -> std::string {
+            std::string name;
+            details::visit_type(val->data_type_, [&val, &name](auto val_tag) {
+                using type_info = ScalarTypeInfo<decltype(val_tag)>;
+                if constexpr (supported_operand_type(type_info::data_type))
+                    name = val->to_string<typename type_info::RawType>();
+            });
+            return name;
+        },
+        [](const auto&) -> std::string {
+            return {};
+        });
+}
+
+// One byte per row rather than a bitset so that the selection loop below has no data-dependent branches
+std::vector<uint8_t> condition_mask(const VariantData& condition, OperationType operation, size_t row_count) {
+    std::vector<uint8_t> mask(row_count, 0);
+    util::variant_match(condition,
+        [&mask, row_count](const util::BitSet& bitset) {
+            for (auto set_bit = bitset.first(); set_bit.valid() && *set_bit < row_count; ++set_bit)
+                mask[*set_bit] = 1;
+        },
+        [&mask](FullResult) {
+            std::fill(mask.begin(), mask.end(), 1);
+        },
+        [](EmptyResult) {},
+        [&mask, operation, row_count](const ColumnWithStrings& col) {
+            user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+                is_bool_type(col.column_->type().data_type()),
+                "Condition of {} must be boolean, {} is {}",
+                operation, col.column_name_, get_user_friendly_type_string(col.column_->type()));
+            Column::for_each_enumerated<BoolTDT>(*col.column_, [&mask, row_count](auto enumerated_it) {
+                const auto idx = static_cast<size_t>(enumerated_it.idx());
+                if (idx < row_count && enumerated_it.value())
+                    mask[idx] = 1;
+            });
+        },
+        [&mask, operation](const std::shared_ptr<Value>& val) {
+            user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+                is_bool_type(val->data_type_),
+                "Condition of {} must be boolean, received {}",
+                operation, get_user_friendly_type_string(val->type()));
+            if (val->get<bool>())
+                std::fill(mask.begin(), mask.end(), 1);
+        },
+        [operation](const std::shared_ptr<ValueSet>&) {
+            user_input::raise<ErrorCode::E_INVALID_USER_ARGUMENT>("ValueSet not accepted as the condition of {}", operation);
+        });
+    return mask;
+}
+
+// Densifies a column or value into one value per row, along with whether the row has a value at all
+template<typename T>
+void materialise_operand(const VariantData& operand, size_t row_count, std::vector<T>& values, std::vector<uint8_t>& present) {
+    values.assign(row_count, T{});
+    present.assign(row_count, 0);
+    util::variant_match(operand,
+        [&values, &present, row_count](const ColumnWithStrings& col) {
+            details::visit_type(col.column_->type().data_type(), [&](auto col_tag) {
+                using type_info = ScalarTypeInfo<decltype(col_tag)>;
+                if constexpr (supported_operand_type(type_info::data_type)) {
+                    Column::for_each_enumerated<typename type_info::TDT>(*col.column_, [&](auto enumerated_it) {
+                        const auto idx = static_cast<size_t>(enumerated_it.idx());
+                        if (idx < row_count) {
+                            values[idx] = static_cast<T>(enumerated_it.value());
+                            present[idx] = 1;
+                        }
+                    });
+                }
+            });
+        },
+        [&values, &present](const std::shared_ptr<Value>& val) {
+            details::visit_type(val->data_type_, [&](auto val_tag) {
+                using type_info = ScalarTypeInfo<decltype(val_tag)>;
+                if constexpr (supported_operand_type(type_info::data_type)) {
+                    std::fill(values.begin(), values.end(), static_cast<T>(val->get<typename type_info::RawType>()));
+                    std::fill(present.begin(), present.end(), 1);
+                }
+            });
+        },
+        [](const auto&) {
+            // A column missing from this row-slice with dynamic schema, which has no values
+        });
+}
+
+template<typename output_tdt>
+VariantData where(
+        const std::vector<uint8_t>& mask,
+        const VariantData& left,
+        const VariantData& right,
+        size_t row_count,
+        std::string_view name) {
+    using T = typename output_tdt::DataTypeTag::raw_type;
+    constexpr auto output_data_type = output_tdt::DataTypeTag::data_type;
+    std::vector<T> left_values, right_values;
+    std::vector<uint8_t> left_present, right_present;
+    materialise_operand(left, row_count, left_values, left_present);
+    materialise_operand(right, row_count, right_values, right_present);
+
+    std::vector<T> output_values(row_count);
+    std::vector<uint8_t> output_present(row_count);
+    for (size_t idx = 0; idx < row_count; ++idx) {
+        output_values[idx] = mask[idx] ? left_values[idx] : right_values[idx];
+        output_present[idx] = mask[idx] ? left_present[idx] : right_present[idx];
+    }
+    if constexpr (is_floating_point_type(output_data_type) || is_time_type(output_data_type)) {
+        // Missing values are represented in-band for these types, as they would be in pandas
+        T missing_value;
+        if constexpr (is_floating_point_type(output_data_type))
+            missing_value = std::numeric_limits<T>::quiet_NaN();
+        else
+            missing_value = NaT;
+        for (size_t idx = 0; idx < row_count; ++idx) {
+            output_values[idx] = output_present[idx] ? output_values[idx] : missing_value;
+        }
+        std::fill(output_present.begin(), output_present.end(), 1);
+    }
+
+    const auto present_rows = std::accumulate(output_present.begin(), output_present.end(), size_t{0});
+    if (present_rows == 0)
+        return EmptyResult{};
+    auto output_column = std::make_unique<Column>(make_scalar_type(output_data_type), present_rows, AllocationType::PRESIZED, Sparsity::PERMITTED);
+    auto output_data = output_column->data();
+    auto output_it = output_data.begin<output_tdt>();
+    if (present_rows == row_count) {
+        std::copy(output_values.begin(), output_values.end(), output_it);
+        output_column->set_row_data(row_count - 1);
+    } else {
+        util::BitSet sparse_map;
+        sparse_map.resize(row_count);
+        util::BitSet::bulk_insert_iterator inserter(sparse_map);
+        size_t last_present_row{0};
+        for (size_t idx = 0; idx < row_count; ++idx) {
+            if (output_present[idx]) {
+                *output_it++ = output_values[idx];
+                inserter = idx;
+                last_present_row = idx;
+            }
+        }
+        inserter.flush();
+        output_column->set_sparse_map(std::move(sparse_map));
+        output_column->set_row_data(last_present_row);
+    }
+    return {ColumnWithStrings(std::move(output_column), name)};
+}
+
+} // namespace
+
+std::optional<DataType> ternary_output_data_type(DataType left, DataType right) {
+    if (is_empty_type(left) || is_empty_type(right)) {
+        const auto other = is_empty_type(left) ? right : left;
+        return is_empty_type(other) || supported_operand_type(other) ? std::make_optional(other) : std::nullopt;
+    }
+    if (!supported_operand_type(left) || !supported_operand_type(right))
+        return std::nullopt;
+    if (left == right)
+        return left;
+    if (is_bool_type(left) || is_bool_type(right))
+        return std::nullopt;
+    if (is_time_type(left) || is_time_type(right)) {
+        // Timestamps can be combined with integers, which is how datetimes are passed in from Python
+        return is_integer_type(is_time_type(left) ? right : left) ? std::make_optional(DataType::NANOSECONDS_UTC64) : std::nullopt;
+    }
+    if ((left == DataType::UINT64 && is_signed_type(right)) || (right == DataType::UINT64 && is_signed_type(left)))
+        return DataType::INT64;
+    std::optional<DataType> output;
+    details::visit_type(left, [right, &output](auto left_tag) {
+        using left_type_info = ScalarTypeInfo<decltype(left_tag)>;
+        details::visit_type(right, [&output](auto right_tag) {
+            using right_type_info = ScalarTypeInfo<decltype(right_tag)>;
+            if constexpr (is_numeric_type(left_type_info::data_type) && is_numeric_type(right_type_info::data_type)) {
+                // Promote to the widest input, as for membership operations
+                using TargetType = typename type_arithmetic_promoted_type<typename left_type_info::RawType, typename right_type_info::RawType, MembershipOperator>::type;
+                output = data_type_from_raw_type<TargetType>();
+            }
+        });
+    });
+    return output;
+}
+
+VariantData dispatch_ternary(const VariantData& condition,
+                             const VariantData& left,
+                             const VariantData& right,
+                             OperationType operation,
+                             size_t row_count) {
+    internal::check<ErrorCode::E_ASSERTION_FAILURE>(operation == OperationType::WHERE, "Unexpected ternary operation {}", operation);
+    auto left_type = operand_data_type(left, operation);
+    auto right_type = operand_data_type(right, operation);
+    if ((!left_type.has_value() && !right_type.has_value()) || row_count == 0)
+        return EmptyResult{};
+    // An operand missing from this row-slice takes the type of the other
+    if (!left_type.has_value())
+        left_type = right_type;
+    else if (!right_type.has_value())
+        right_type = left_type;
+    const auto output_data_type = ternary_output_data_type(*left_type, *right_type);
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+        output_data_type.has_value(),
+        "Cannot choose between {} and {} in {}",
+        *left_type, *right_type, operation);
+    if (is_empty_type(*output_data_type))
+        return EmptyResult{};
+
+    const auto mask = condition_mask(condition, operation, row_count);
+    const auto name = fmt::format("{}({}, {})", operation, operand_name(left), operand_name(right));
+    VariantData output;
+    details::visit_type(*output_data_type, [&](auto output_tag) {
+        using type_info = ScalarTypeInfo<decltype(output_tag)>;
+        if constexpr (supported_operand_type(type_info::data_type))
+            output = where<typename type_info::TDT>(mask, left, right, row_count, name);
+    });
+    return output;
+}
+
+}
@@ -0,0 +1,32 @@
+/*
+ * Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#pragma once
+
+#include <optional>
+
+#include <arcticdb/entity/types.hpp>
+#include <arcticdb/processing/expression_node.hpp>
+#include <arcticdb/processing/operation_types.hpp>
+
+namespace arcticdb {
+
+// The type of the column produced by WHERE choosing between operands of the given types, or std::nullopt if they
+// cannot be combined. Numeric operands are promoted to a type able to hold both, and strings are not supported
+std::optional<DataType> ternary_output_data_type(DataType left, DataType right);
+
+// WHERE of a condition (a bitset, boolean column, or boolean value) choosing row by row between the left operand where
+// the condition holds and the right operand where it does not, each of which may be a column or a value. Rows where the
+// chosen operand has no value are NaN/NaT in floating point/timestamp outputs, and missing in other outputs
+VariantData dispatch_ternary(const VariantData& condition,
+                             const VariantData& left,
+                             const VariantData& right,
+                             OperationType operation,
+                             size_t row_count);
+
+}
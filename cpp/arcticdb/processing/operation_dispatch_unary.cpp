@@ -7,6 +7,8 @@
  */
 
 #include <arcticdb/processing/operation_dispatch_unary.hpp>
+#include <arcticdb/processing/operation_dispatch_datetime.hpp>
+#include <arcticdb/processing/operation_dispatch_string.hpp>
 
 namespace arcticdb {
 
@@ -61,10 +63,72 @@ VariantData visit_unary_boolean(const VariantData& left, OperationType operation
     }, data);
 }
 
+VariantData cast_column(const ColumnWithStrings& col, DataType target_data_type) {
+    std::unique_ptr<Column> output_column;
+    details::visit_type(col.column_->type().data_type(), [&](auto col_tag) {
+        using col_type_info = ScalarTypeInfo<decltype(col_tag)>;
+        if constexpr (is_numeric_type(col_type_info::data_type) || is_bool_type(col_type_info::data_type)) {
+            details::visit_type(target_data_type, [&](auto target_tag) {
+                using target_type_info = ScalarTypeInfo<decltype(target_tag)>;
+                if constexpr (is_numeric_type(target_type_info::data_type) || is_bool_type(target_type_info::data_type)) {
+                    using TargetType = typename target_type_info::RawType;
+                    output_column = std::make_unique<Column>(make_scalar_type(target_type_info::data_type), Sparsity::PERMITTED);
+                    if constexpr (is_floating_point_type(col_type_info::data_type) && is_integer_type(target_type_info::data_type)) {
+                        bool nan_seen{false};
+                        Column::transform<typename col_type_info::TDT, typename target_type_info::TDT>(
+                                *col.column_,
+                                *output_column,
+                                [&nan_seen](auto input_value) -> TargetType {
+                                    nan_seen |= std::isnan(input_value);
+                                    return std::isnan(input_value) ? TargetType{0} : static_cast<TargetType>(input_value);
+                                });
+                        user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+                                !nan_seen,
+                                "Cannot cast {} containing NaN to {}", col.column_name_, target_type_info::data_type);
+                    } else {
+                        Column::transform<typename col_type_info::TDT, typename target_type_info::TDT>(
+                                *col.column_,
+                                *output_column,
+                                [](auto input_value) -> TargetType {
+                                    return static_cast<TargetType>(input_value);
+                                });
+                    }
+                }
+            });
+        }
+    });
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+            output_column != nullptr,
+            "Cannot perform {} of {} ({}) to {}",
+            OperationType::CAST, col.column_name_, get_user_friendly_type_string(col.column_->type()), target_data_type);
+    return {ColumnWithStrings(std::move(output_column), fmt::format("{}({}, {})", OperationType::CAST, col.column_name_, target_data_type))};
+}
+
+VariantData visit_cast(const VariantData& left, const VariantData& right) {
+    if (std::holds_alternative<EmptyResult>(left))
+        return EmptyResult{};
+
+    return std::visit(util::overload {
+        [] (const ColumnWithStrings& l, const std::shared_ptr<Value>& r) -> VariantData {
+            return cast_column(l, r->data_type_);
+        },
+        [] (const auto&, const auto&) -> VariantData {
+            user_input::raise<ErrorCode::E_INVALID_USER_ARGUMENT>("{} must be of a column to a type", OperationType::CAST);
+            return EmptyResult{};
+        }
+    }, left, right);
+}
+
 VariantData dispatch_unary(const VariantData& left, OperationType operation) {
     switch(operation) {
         case OperationType::ABS:
             return visit_unary_operator(left, AbsOperator());
+        case OperationType::LOG:
+            return visit_unary_operator(left, LogOperator());
+        case OperationType::EXP:
+            return visit_unary_operator(left, ExpOperator());
+        case OperationType::SQRT:
+            return visit_unary_operator(left, SqrtOperator());
         case OperationType::NEG:
             return visit_unary_operator(left, NegOperator());
         case OperationType::ISNULL:
@@ -74,6 +138,17 @@ VariantData dispatch_unary(const VariantData& left, OperationType operation) {
         case OperationType::IDENTITY:
         case OperationType::NOT:
             return visit_unary_boolean(left, operation);
+        case OperationType::STR_LEN:
+            return visit_string_length(left);
+        case OperationType::DT_YEAR:
+        case OperationType::DT_MONTH:
+        case OperationType::DT_DAY:
+        case OperationType::DT_HOUR:
+        case OperationType::DT_MINUTE:
+        case OperationType::DT_SECOND:
+        case OperationType::DT_DAYOFWEEK:
+        case OperationType::DT_DATE:
+            return visit_datetime_component(left, operation);
         default:
             util::raise_rte("Unknown operation {}", int(operation));
     }
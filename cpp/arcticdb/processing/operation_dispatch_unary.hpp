@@ -167,6 +167,10 @@ VariantData visit_unary_comparator(const VariantData& left, Func&& func) {
     }, left);
 }
 
+// CAST of a numeric or boolean column to the type of the right operand, a value used only for its type. Floating point
+// values are truncated towards zero when cast to integers, and casting NaN to an integer type is an error
+VariantData visit_cast(const VariantData& left, const VariantData& right);
+
 VariantData dispatch_unary(const VariantData& left, OperationType operation);
 
 }
@@ -7,16 +7,19 @@
 
 #pragma once
 
+#include <array>
+#include <cmath>
 #include <unordered_set>
 #include <optional>
 
+#include <arcticdb/entity/types.hpp>
 #include <arcticdb/processing/signed_unsigned_comparison.hpp>
 #include <arcticdb/util/constants.hpp>
 #include <arcticdb/util/preconditions.hpp>
 #include <ankerl/unordered_dense.h>
 
 namespace arcticdb {
-// If reordering this enum, is_binary_operation may also need to be changed
+// If reordering this enum, is_unary_operation, is_binary_operation and is_ternary_operation may also need to be changed
 enum class OperationType : uint8_t {
     // Unary
     // Operator
@@ -28,6 +31,21 @@ enum class OperationType : uint8_t {
     // Boolean
     IDENTITY,
     NOT,
+    // String
+    STR_LEN,
+    // Datetime
+    DT_YEAR,
+    DT_MONTH,
+    DT_DAY,
+    DT_HOUR,
+    DT_MINUTE,
+    DT_SECOND,
+    DT_DAYOFWEEK,
+    DT_DATE,
+    // Math
+    LOG,
+    EXP,
+    SQRT,
     // Binary
     // Operator
     ADD,
@@ -43,10 +61,24 @@ enum class OperationType : uint8_t {
     GE,
     ISIN,
     ISNOTIN,
+    // String
+    STARTSWITH,
+    ENDSWITH,
+    CONTAINS,
+    REGEX_MATCH,
+    // Datetime
+    DT_FLOOR,
+    DT_CEIL,
+    // Math
+    POW,
+    ROUND,
+    CAST,
     // Boolean
     AND,
     OR,
-    XOR
+    XOR,
+    // Ternary
+    WHERE
 };
 
 inline std::string_view operation_type_to_str(const OperationType ot) {
@@ -58,6 +90,18 @@ inline std::string_view operation_type_to_str(const OperationType ot) {
         TO_STR(NOTNULL)
         TO_STR(IDENTITY)
         TO_STR(NOT)
+        TO_STR(STR_LEN)
+        TO_STR(DT_YEAR)
+        TO_STR(DT_MONTH)
+        TO_STR(DT_DAY)
+        TO_STR(DT_HOUR)
+        TO_STR(DT_MINUTE)
+        TO_STR(DT_SECOND)
+        TO_STR(DT_DAYOFWEEK)
+        TO_STR(DT_DATE)
+        TO_STR(LOG)
+        TO_STR(EXP)
+        TO_STR(SQRT)
         TO_STR(ADD)
         TO_STR(SUB)
         TO_STR(MUL)
@@ -70,20 +114,34 @@ inline std::string_view operation_type_to_str(const OperationType ot) {
         TO_STR(GE)
         TO_STR(ISIN)
         TO_STR(ISNOTIN)
+        TO_STR(STARTSWITH)
+        TO_STR(ENDSWITH)
+        TO_STR(CONTAINS)
+        TO_STR(REGEX_MATCH)
+        TO_STR(DT_FLOOR)
+        TO_STR(DT_CEIL)
+        TO_STR(POW)
+        TO_STR(ROUND)
+        TO_STR(CAST)
         TO_STR(AND)
         TO_STR(OR)
         TO_STR(XOR)
+        TO_STR(WHERE)
 #undef TO_STR
         default:return std::string_view("UNKNOWN");
     }
 }
 
 constexpr bool is_unary_operation(OperationType o) {
-    return uint8_t(o) <= uint8_t(OperationType::NOT);
+    return uint8_t(o) <= uint8_t(OperationType::SQRT);
 }
 
 constexpr bool is_binary_operation(OperationType o) {
-    return uint8_t(o) >= uint8_t(OperationType::ADD);
+    return uint8_t(o) >= uint8_t(OperationType::ADD) && uint8_t(o) <= uint8_t(OperationType::XOR);
+}
+
+constexpr bool is_ternary_operation(OperationType o) {
+    return uint8_t(o) >= uint8_t(OperationType::WHERE);
 }
 
 struct AbsOperator;
@@ -92,6 +150,11 @@ struct PlusOperator;
 struct MinusOperator;
 struct TimesOperator;
 struct DivideOperator;
+struct LogOperator;
+struct ExpOperator;
+struct SqrtOperator;
+struct PowOperator;
+struct RoundOperator;
 struct MembershipOperator;
 
 namespace arithmetic_promoted_type::details {
@@ -149,11 +212,15 @@ struct unary_arithmetic_promoted_type {
     static constexpr size_t val_width = arithmetic_promoted_type::details::width_v<VAL>;
     using type = typename
         /* Unsigned ints promote to themselves for the abs operator, and to a signed int of double the width with the neg operator
-         * Floating point types promote to themselves with both operators
-         * Signed ints promote to a signed int of double the width for both operators, as their range is not symmetric about zero */
+         * Floating point types promote to themselves with all operators
+         * Signed ints promote to a signed int of double the width for the abs and neg operators, as their range is not symmetric about zero
+         * Integers promote to double for the log, exp, and sqrt operators, as in numpy */
         std::conditional_t<std::is_floating_point_v<VAL> || (std::is_same_v<Func, AbsOperator> && std::is_unsigned_v<VAL>),
             VAL,
-            typename arithmetic_promoted_type::details::signed_width_t<2 * val_width>
+            std::conditional_t<std::is_same_v<Func, LogOperator> || std::is_same_v<Func, ExpOperator> || std::is_same_v<Func, SqrtOperator>,
+                double,
+                typename arithmetic_promoted_type::details::signed_width_t<2 * val_width>
+            >
         >;
 };
 
@@ -226,6 +293,31 @@ struct type_arithmetic_promoted_type {
     >;
 };
 
+// Always use doubles for power operations, as in numpy for negative or fractional exponents
+template <class LHS, class RHS>
+struct type_arithmetic_promoted_type<LHS, RHS, PowOperator> {
+    using type = double;
+};
+
+// Rounding keeps the type of the value being rounded, the right hand side being the number of decimals
+template <class LHS, class RHS>
+struct type_arithmetic_promoted_type<LHS, RHS, RoundOperator> {
+    using type = LHS;
+};
+
+/* Adding a duration to a timestamp, or subtracting one from it, gives a timestamp. Durations are held as int64
+ * nanoseconds, so the difference between two timestamps is an int64 of nanoseconds */
+template <DataType LHS, DataType RHS, class Func, class TargetType>
+constexpr DataType arithmetic_output_data_type() {
+    if constexpr (std::is_same_v<TargetType, int64_t> &&
+                  ((std::is_same_v<Func, PlusOperator> && is_time_type(LHS) != is_time_type(RHS)) ||
+                   (std::is_same_v<Func, MinusOperator> && is_time_type(LHS) && !is_time_type(RHS)))) {
+        return DataType::NANOSECONDS_UTC64;
+    } else {
+        return data_type_from_raw_type<TargetType>();
+    }
+}
+
 struct AbsOperator {
 template<typename T, typename V = typename unary_arithmetic_promoted_type<T, AbsOperator>::type>
 V apply(T t) {
@@ -307,6 +399,60 @@ V apply(T t, U u) {
 }
 };
 
+struct LogOperator {
+template<typename T, typename V = typename unary_arithmetic_promoted_type<T, LogOperator>::type>
+V apply(T t) {
+    return std::log(static_cast<V>(t));
+}
+};
+
+struct ExpOperator {
+template<typename T, typename V = typename unary_arithmetic_promoted_type<T, ExpOperator>::type>
+V apply(T t) {
+    return std::exp(static_cast<V>(t));
+}
+};
+
+struct SqrtOperator {
+template<typename T, typename V = typename unary_arithmetic_promoted_type<T, SqrtOperator>::type>
+V apply(T t) {
+    return std::sqrt(static_cast<V>(t));
+}
+};
+
+struct PowOperator {
+template<typename T, typename U, typename V = typename type_arithmetic_promoted_type<T, U, PowOperator>::type>
+V apply(T t, U u) {
+    return std::pow(static_cast<V>(t), static_cast<V>(u));
+}
+};
+
+struct RoundOperator {
+template<typename T, typename U, typename V = typename type_arithmetic_promoted_type<T, U, RoundOperator>::type>
+V apply(T t, U u) {
+    static constexpr std::array<double, 19> powers_of_ten{
+        1e0, 1e1, 1e2, 1e3, 1e4, 1e5, 1e6, 1e7, 1e8, 1e9, 1e10, 1e11, 1e12, 1e13, 1e14, 1e15, 1e16, 1e17, 1e18};
+    const auto decimals = static_cast<int64_t>(u);
+    if constexpr (std::is_integral_v<T>) {
+        if (decimals >= 0)
+            return static_cast<V>(t);
+    }
+    // Beyond this every double is already an integer multiple of the scale, or every value rounds to zero
+    if (decimals >= static_cast<int64_t>(powers_of_ten.size()))
+        return static_cast<V>(t);
+    if (decimals <= -static_cast<int64_t>(powers_of_ten.size()))
+        return static_cast<V>(0);
+    // nearbyint rounds half to even in the default rounding mode, matching numpy and pandas
+    if (decimals >= 0) {
+        const auto scale = powers_of_ten[decimals];
+        return static_cast<V>(std::nearbyint(static_cast<double>(t) * scale) / scale);
+    } else {
+        const auto scale = powers_of_ten[-decimals];
+        return static_cast<V>(std::nearbyint(static_cast<double>(t) / scale) * scale);
+    }
+}
+};
+
 struct EqualsOperator {
 template<typename T, typename U>
 bool operator()(T t, U u) const {
@@ -660,6 +806,61 @@ struct formatter<arcticdb::DivideOperator> {
     }
 };
 
+template<>
+struct formatter<arcticdb::LogOperator> {
+    template<typename ParseContext>
+    constexpr auto parse(ParseContext &ctx) { return ctx.begin(); }
+
+    template<typename FormatContext>
+    constexpr auto format(arcticdb::LogOperator, FormatContext &ctx) const {
+        return fmt::format_to(ctx.out(), "LOG");
+    }
+};
+
+template<>
+struct formatter<arcticdb::ExpOperator> {
+    template<typename ParseContext>
+    constexpr auto parse(ParseContext &ctx) { return ctx.begin(); }
+
+    template<typename FormatContext>
+    constexpr auto format(arcticdb::ExpOperator, FormatContext &ctx) const {
+        return fmt::format_to(ctx.out(), "EXP");
+    }
+};
+
+template<>
+struct formatter<arcticdb::SqrtOperator> {
+    template<typename ParseContext>
+    constexpr auto parse(ParseContext &ctx) { return ctx.begin(); }
+
+    template<typename FormatContext>
+    constexpr auto format(arcticdb::SqrtOperator, FormatContext &ctx) const {
+        return fmt::format_to(ctx.out(), "SQRT");
+    }
+};
+
+template<>
+struct formatter<arcticdb::PowOperator> {
+    template<typename ParseContext>
+    constexpr auto parse(ParseContext &ctx) { return ctx.begin(); }
+
+    template<typename FormatContext>
+    constexpr auto format(arcticdb::PowOperator, FormatContext &ctx) const {
+        return fmt::format_to(ctx.out(), "**");
+    }
+};
+
+template<>
+struct formatter<arcticdb::RoundOperator> {
+    template<typename ParseContext>
+    constexpr auto parse(ParseContext &ctx) { return ctx.begin(); }
+
+    template<typename FormatContext>
+    constexpr auto format(arcticdb::RoundOperator, FormatContext &ctx) const {
+        return fmt::format_to(ctx.out(), "ROUND");
+    }
+};
+
 template<>
 struct formatter<arcticdb::EqualsOperator> {
     template<typename ParseContext>
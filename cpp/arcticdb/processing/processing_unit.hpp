@@ -7,6 +7,7 @@
 
 #pragma once
 
+#include <algorithm>
 #include <unordered_map>
 #include <vector>
 
@@ -163,65 +164,124 @@ namespace arcticdb {
         return {std::move(row_to_bucket), std::move(bucket_counts)};
     }
 
+    // As above, but for grouping on several columns. The groups of each column are combined so that rows with the same
+    // values in all of the grouping columns end up in the same bucket. Rows with a missing value in any of the grouping
+    // columns are not assigned a bucket
+    template<typename GrouperType, typename Bucketizer>
+    std::pair<std::vector<bucket_id>, std::vector<uint64_t>> get_buckets(
+            const std::vector<ColumnWithStrings>& cols,
+            const Bucketizer& bucketizer) {
+        size_t num_rows{0};
+        for (const auto& col: cols) {
+            num_rows = std::max(num_rows, static_cast<size_t>(col.column_->last_row() + 1));
+        }
+        std::vector<uint8_t> row_to_group(num_rows, 0);
+        // The number of grouping columns with a non-missing value in each row
+        std::vector<size_t> row_group_counts(num_rows, 0);
+        for (const auto& col: cols) {
+            col.column_->type().visit_tag([&](auto type_desc_tag) {
+                using TypeDescriptorTag = decltype(type_desc_tag);
+                using TagType = typename std::decay_t<TypeDescriptorTag>::DataTypeTag;
+                if constexpr(!is_empty_type(TagType::data_type)) {
+                    typename GrouperType::template Grouper<TypeDescriptorTag> grouper;
+                    Column::for_each_enumerated<TypeDescriptorTag>(*col.column_, [&](auto enumerating_it) {
+                        auto opt_group = grouper.group(enumerating_it.value(), col.string_pool_);
+                        if (ARCTICDB_LIKELY(opt_group.has_value())) {
+                            // Multiplying by an odd number is a bijection on uint8_t, so no information is lost in
+                            // combining the groups
+                            auto& group = row_to_group[enumerating_it.idx()];
+                            group = static_cast<uint8_t>(group * 31 + *opt_group);
+                            ++row_group_counts[enumerating_it.idx()];
+                        }
+                    });
+                }
+            });
+        }
+        std::vector<bucket_id> row_to_bucket(num_rows, std::numeric_limits<bucket_id>::max());
+        std::vector<uint64_t> bucket_counts(bucketizer.num_buckets(), 0);
+        for (size_t row = 0; row < num_rows; ++row) {
+            if (ARCTICDB_LIKELY(row_group_counts[row] == cols.size())) {
+                auto bucket = bucketizer.bucket(row_to_group[row]);
+                row_to_bucket[row] = bucket;
+                ++bucket_counts[bucket];
+            }
+        }
+        return {std::move(row_to_bucket), std::move(bucket_counts)};
+    }
+
     template<typename GrouperType, typename BucketizerType>
     std::vector<ProcessingUnit> partition_processing_segment(
             ProcessingUnit& input,
-            const ColumnName& grouping_column_name,
+            const std::vector<ColumnName>& grouping_column_names,
             bool dynamic_schema) {
 
         std::vector<ProcessingUnit> output;
-        auto get_result = input.get(ColumnName(grouping_column_name));
-        if (std::holds_alternative<ColumnWithStrings>(get_result)) {
-            auto partitioning_column = std::get<ColumnWithStrings>(get_result);
-            partitioning_column.column_->type().visit_tag([&output, &input, &partitioning_column](auto type_desc_tag) {
+        std::vector<ColumnWithStrings> partitioning_columns;
+        for (const auto& grouping_column_name: grouping_column_names) {
+            auto get_result = input.get(grouping_column_name);
+            if (std::holds_alternative<ColumnWithStrings>(get_result)) {
+                partitioning_columns.emplace_back(std::get<ColumnWithStrings>(get_result));
+            } else {
+                internal::check<ErrorCode::E_ASSERTION_FAILURE>(
+                        dynamic_schema,
+                        "Grouping column missing from row-slice in static schema symbol"
+                );
+                return output;
+            }
+        }
+        // Partitioning on an empty column should return an empty composite
+        if (std::any_of(partitioning_columns.cbegin(), partitioning_columns.cend(), [](const ColumnWithStrings& col) {
+            return is_empty_type(col.column_->type().data_type());
+        })) {
+            return output;
+        }
+        auto num_buckets = ConfigsMap::instance()->get_int("Partition.NumBuckets",
+                                                           async::TaskScheduler::instance()->cpu_thread_count());
+        if (num_buckets > std::numeric_limits<bucket_id>::max()) {
+            log::version().warn("GroupBy partitioning buckets capped at {} (received {})",
+                                std::numeric_limits<bucket_id>::max(),
+                                num_buckets);
+            num_buckets = std::numeric_limits<bucket_id>::max();
+        }
+        std::vector<ProcessingUnit> procs{static_cast<bucket_id>(num_buckets)};
+        BucketizerType bucketizer(num_buckets);
+        std::vector<bucket_id> row_to_bucket;
+        std::vector<uint64_t> bucket_counts;
+        if (partitioning_columns.size() == 1) {
+            const auto& partitioning_column = partitioning_columns.front();
+            partitioning_column.column_->type().visit_tag([&](auto type_desc_tag) {
                 using TypeDescriptorTag = decltype(type_desc_tag);
-                using DescriptorType = std::decay_t<TypeDescriptorTag>;
-                using TagType =  typename DescriptorType::DataTypeTag;
-                using ResolvedGrouperType = typename GrouperType::template Grouper<TypeDescriptorTag>;
-
-                // Partitioning on an empty column should return an empty composite
+                using TagType = typename std::decay_t<TypeDescriptorTag>::DataTypeTag;
                 if constexpr(!is_empty_type(TagType::data_type)) {
+                    using ResolvedGrouperType = typename GrouperType::template Grouper<TypeDescriptorTag>;
                     ResolvedGrouperType grouper;
-                    auto num_buckets = ConfigsMap::instance()->get_int("Partition.NumBuckets",
-                                                                       async::TaskScheduler::instance()->cpu_thread_count());
-                    if (num_buckets > std::numeric_limits<bucket_id>::max()) {
-                        log::version().warn("GroupBy partitioning buckets capped at {} (received {})",
-                                            std::numeric_limits<bucket_id>::max(),
-                                            num_buckets);
-                        num_buckets = std::numeric_limits<bucket_id>::max();
-                    }
-                    std::vector<ProcessingUnit> procs{static_cast<bucket_id>(num_buckets)};
-                    BucketizerType bucketizer(num_buckets);
-                    auto [row_to_bucket, bucket_counts] = get_buckets(partitioning_column, grouper, bucketizer);
-                    for (auto&& [input_idx, seg]: folly::enumerate(input.segments_.value())) {
-                        auto new_segs = partition_segment(*seg, row_to_bucket, bucket_counts);
-                        for (auto && [output_idx, new_seg]: folly::enumerate(new_segs)) {
-                            if (bucket_counts.at(output_idx) > 0) {
-                                auto& proc = procs.at(output_idx);
-                                if (!proc.segments_.has_value()) {
-                                    proc.segments_ = std::make_optional<std::vector<std::shared_ptr<SegmentInMemory>>>();
-                                    proc.row_ranges_ = std::make_optional<std::vector<std::shared_ptr<pipelines::RowRange>>>();
-                                    proc.col_ranges_ = std::make_optional<std::vector<std::shared_ptr<pipelines::ColRange>>>();
-                                }
-                                proc.segments_->emplace_back(std::make_shared<SegmentInMemory>(std::move(new_seg)));
-                                proc.row_ranges_->emplace_back(input.row_ranges_->at(input_idx));
-                                proc.col_ranges_->emplace_back(input.col_ranges_->at(input_idx));
-                            }
-                        }
-                    }
-                    for (auto&& [idx, proc]: folly::enumerate(procs)) {
-                        if (bucket_counts.at(idx) > 0) {
-                            proc.bucket_ = idx;
-                            output.emplace_back(std::move(proc));
-                        }
-                    }
+                    std::tie(row_to_bucket, bucket_counts) = get_buckets(partitioning_column, grouper, bucketizer);
                 }
             });
         } else {
-            internal::check<ErrorCode::E_ASSERTION_FAILURE>(
-                    dynamic_schema,
-                    "Grouping column missing from row-slice in static schema symbol"
-            );
+            std::tie(row_to_bucket, bucket_counts) = get_buckets<GrouperType>(partitioning_columns, bucketizer);
+        }
+        for (auto&& [input_idx, seg]: folly::enumerate(input.segments_.value())) {
+            auto new_segs = partition_segment(*seg, row_to_bucket, bucket_counts);
+            for (auto && [output_idx, new_seg]: folly::enumerate(new_segs)) {
+                if (bucket_counts.at(output_idx) > 0) {
+                    auto& proc = procs.at(output_idx);
+                    if (!proc.segments_.has_value()) {
+                        proc.segments_ = std::make_optional<std::vector<std::shared_ptr<SegmentInMemory>>>();
+                        proc.row_ranges_ = std::make_optional<std::vector<std::shared_ptr<pipelines::RowRange>>>();
+                        proc.col_ranges_ = std::make_optional<std::vector<std::shared_ptr<pipelines::ColRange>>>();
+                    }
+                    proc.segments_->emplace_back(std::make_shared<SegmentInMemory>(std::move(new_seg)));
+                    proc.row_ranges_->emplace_back(input.row_ranges_->at(input_idx));
+                    proc.col_ranges_->emplace_back(input.col_ranges_->at(input_idx));
+                }
+            }
+        }
+        for (auto&& [idx, proc]: folly::enumerate(procs)) {
+            if (bucket_counts.at(idx) > 0) {
+                proc.bucket_ = idx;
+                output.emplace_back(std::move(proc));
+            }
         }
         return output;
     }
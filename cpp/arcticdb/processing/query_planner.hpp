@@ -21,6 +21,7 @@ using ClauseVariant = std::variant<std::shared_ptr<FilterClause>,
         std::shared_ptr<AggregationClause>,
         std::shared_ptr<ResampleClause<ResampleBoundary::LEFT>>,
         std::shared_ptr<ResampleClause<ResampleBoundary::RIGHT>>,
+        std::shared_ptr<WindowClause>,
         std::shared_ptr<RowRangeClause>,
         std::shared_ptr<DateRangeClause>>;
 
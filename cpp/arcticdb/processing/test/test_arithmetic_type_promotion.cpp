@@ -560,3 +560,19 @@ TEST(ArithmeticTypePromotion, Divide) {
     static_assert(std::is_same_v<type_arithmetic_promoted_type<double, int32_t, DivideOperator>::type, double>);
     static_assert(std::is_same_v<type_arithmetic_promoted_type<double, int64_t, DivideOperator>::type, double>);
 }
+
+TEST(ArithmeticTypePromotion, MathFunctions) {
+    static_assert(std::is_same_v<unary_arithmetic_promoted_type<uint8_t,  LogOperator>::type, double>);
+    static_assert(std::is_same_v<unary_arithmetic_promoted_type<int32_t,  ExpOperator>::type, double>);
+    static_assert(std::is_same_v<unary_arithmetic_promoted_type<int64_t,  SqrtOperator>::type, double>);
+    static_assert(std::is_same_v<unary_arithmetic_promoted_type<float,    LogOperator>::type, float>);
+    static_assert(std::is_same_v<unary_arithmetic_promoted_type<double,   SqrtOperator>::type, double>);
+
+    static_assert(std::is_same_v<type_arithmetic_promoted_type<int8_t,   uint8_t, PowOperator>::type, double>);
+    static_assert(std::is_same_v<type_arithmetic_promoted_type<float,    int64_t, PowOperator>::type, double>);
+    static_assert(std::is_same_v<type_arithmetic_promoted_type<uint64_t, double,  PowOperator>::type, double>);
+
+    static_assert(std::is_same_v<type_arithmetic_promoted_type<int16_t,  int64_t, RoundOperator>::type, int16_t>);
+    static_assert(std::is_same_v<type_arithmetic_promoted_type<float,    int32_t, RoundOperator>::type, float>);
+    static_assert(std::is_same_v<type_arithmetic_promoted_type<double,   uint8_t, RoundOperator>::type, double>);
+}
@@ -0,0 +1,85 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <gtest/gtest.h>
+
+#include <arcticdb/processing/asof_join.hpp>
+#include <arcticdb/processing/clause.hpp>
+
+using namespace arcticdb;
+
+namespace {
+// Feeds the left rows through a single matcher in chunks of chunk_size rows, to mimic consecutive row slices
+std::vector<int64_t> match_in_chunks(const AsOfJoinOptions& options,
+                                     const std::vector<timestamp>& left_index,
+                                     const std::vector<std::string>& left_keys,
+                                     std::vector<timestamp> right_index,
+                                     std::vector<std::string> right_keys,
+                                     size_t chunk_size) {
+    AsOfJoinMatcher matcher(options, std::move(right_index), std::move(right_keys));
+    std::vector<int64_t> output;
+    for (size_t start = 0; start < left_index.size(); start += chunk_size) {
+        const auto end = std::min(start + chunk_size, left_index.size());
+        std::vector<timestamp> index_chunk(left_index.begin() + start, left_index.begin() + end);
+        std::vector<std::string> keys_chunk;
+        if (!left_keys.empty()) {
+            keys_chunk.assign(left_keys.begin() + start, left_keys.begin() + end);
+        }
+        auto matches = matcher.match(index_chunk, keys_chunk);
+        output.insert(output.end(), matches.begin(), matches.end());
+    }
+    return output;
+}
+}
+
+TEST(AsOfJoin, Backward) {
+    std::vector<timestamp> left_index{0, 5, 10, 12, 30};
+    std::vector<timestamp> right_index{1, 5, 5, 11, 20};
+    for (size_t chunk_size: {1UL, 2UL, 5UL}) {
+        ASSERT_EQ(
+                (std::vector<int64_t>{NO_JOIN_MATCH, 2, 2, 3, 4}),
+                match_in_chunks(AsOfJoinOptions{}, left_index, {}, right_index, {}, chunk_size));
+        AsOfJoinOptions no_exact_matches;
+        no_exact_matches.allow_exact_matches_ = false;
+        ASSERT_EQ(
+                (std::vector<int64_t>{NO_JOIN_MATCH, 0, 2, 3, 4}),
+                match_in_chunks(no_exact_matches, left_index, {}, right_index, {}, chunk_size));
+        AsOfJoinOptions tolerance;
+        tolerance.tolerance_ = 2;
+        ASSERT_EQ(
+                (std::vector<int64_t>{NO_JOIN_MATCH, 2, NO_JOIN_MATCH, 3, NO_JOIN_MATCH}),
+                match_in_chunks(tolerance, left_index, {}, right_index, {}, chunk_size));
+    }
+}
+
+TEST(AsOfJoin, ByKeys) {
+    AsOfJoinOptions options;
+    options.by_ = {"ticker"};
+    std::vector<timestamp> left_index{2, 3, 6, 7};
+    std::vector<std::string> left_keys{"a", "b", "a", "c"};
+    std::vector<timestamp> right_index{1, 2, 4, 5};
+    std::vector<std::string> right_keys{"b", "a", "b", "a"};
+    for (size_t chunk_size: {1UL, 3UL}) {
+        ASSERT_EQ(
+                (std::vector<int64_t>{1, 0, 3, NO_JOIN_MATCH}),
+                match_in_chunks(options, left_index, left_keys, right_index, right_keys, chunk_size));
+    }
+}
+
+TEST(AsOfJoin, UnsortedIndexes) {
+    ASSERT_THROW(AsOfJoinMatcher(AsOfJoinOptions{}, {2, 1}, {}), UnsortedDataException);
+    AsOfJoinMatcher matcher(AsOfJoinOptions{}, {1, 2}, {});
+    ASSERT_NO_THROW(std::ignore = matcher.match({5}, {}));
+    ASSERT_THROW(std::ignore = matcher.match({4}, {}), UnsortedDataException);
+}
+
+TEST(AsOfJoin, InvalidOptions) {
+    AsOfJoinOptions options;
+    options.tolerance_ = -1;
+    ASSERT_THROW(AsOfJoinClause{options}, UserInputException);
+    ASSERT_THROW(join_output_type("col", DataType::EMPTYVAL), SchemaException);
+}
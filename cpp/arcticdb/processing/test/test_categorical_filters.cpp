@@ -0,0 +1,67 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <gtest/gtest.h>
+
+#include <arcticdb/processing/categorical_utils.hpp>
+#include <arcticdb/processing/clause.hpp>
+#include <arcticdb/processing/expression_context.hpp>
+
+namespace {
+
+using namespace arcticdb;
+
+arcticdb::proto::descriptors::NormalizationMetadata categorical_norm_meta() {
+    arcticdb::proto::descriptors::NormalizationMetadata norm_meta;
+    auto& categories = (*norm_meta.mutable_df()->mutable_common()->mutable_categories())["cat"];
+    categories.add_category("hello");
+    categories.add_category("hi");
+    return norm_meta;
+}
+
+std::shared_ptr<Clause> equality_filter(const std::string& column, const std::string& value) {
+    ExpressionContext expression_context;
+    expression_context.add_value("value_0", std::make_shared<Value>(construct_string_value(value)));
+    expression_context.add_expression_node(
+        "root", std::make_shared<ExpressionNode>(ColumnName(column), ValueName("value_0"), OperationType::EQ));
+    expression_context.root_node_name_ = ExpressionName("root");
+    return std::make_shared<Clause>(FilterClause({column}, expression_context, std::nullopt));
+}
+
+int64_t compared_code(const std::shared_ptr<Clause>& clause) {
+    const auto& expression_context = *clause->clause_info().row_filter_expression_;
+    auto node = expression_context.expression_nodes_.get_value("root");
+    auto value = expression_context.values_.get_value(std::get<ValueName>(node->right_).value);
+    EXPECT_EQ(value->data_type_, DataType::INT64);
+    return value->get<int64_t>();
+}
+
+} // namespace
+
+TEST(CategoricalFilters, EqualityComparesCodes) {
+    auto original = equality_filter("cat", "hi");
+    std::vector<std::shared_ptr<Clause>> clauses{original};
+    encode_categorical_filters(clauses, categorical_norm_meta());
+    ASSERT_NE(clauses[0], original);
+    ASSERT_EQ(compared_code(clauses[0]), 1);
+    // The clause passed in can be shared with other reads, so must be left as it was
+    auto original_node = original->clause_info().row_filter_expression_->expression_nodes_.get_value("root");
+    ASSERT_EQ(std::get<ValueName>(original_node->right_).value, "value_0");
+}
+
+TEST(CategoricalFilters, UnknownCategoryMatchesNothing) {
+    std::vector<std::shared_ptr<Clause>> clauses{equality_filter("cat", "bonjour")};
+    encode_categorical_filters(clauses, categorical_norm_meta());
+    ASSERT_LT(compared_code(clauses[0]), -1);
+}
+
+TEST(CategoricalFilters, OtherColumnsUntouched) {
+    auto original = equality_filter("not_cat", "hi");
+    std::vector<std::shared_ptr<Clause>> clauses{original};
+    encode_categorical_filters(clauses, categorical_norm_meta());
+    ASSERT_EQ(clauses[0], original);
+}
@@ -288,6 +288,106 @@ TEST(Clause, AggregationSparseGroupby) {
     });
 }
 
+TEST(Clause, AggregationMultipleGroupingColumns) {
+    using namespace arcticdb;
+    auto component_manager = std::make_shared<ComponentManager>();
+
+    AggregationClause aggregation(std::vector<std::string>{"mod_2", "mod_5"},
+                                  {{"sum", "sum_int", "sum_int"},
+                                   {"count", "count_int", "count_int"}});
+    aggregation.set_component_manager(component_manager);
+
+    // As 2 and 5 are coprime, the combinations of row % 2 and row % 5 are the same groups as row % 10, which are first
+    // seen in the order of the first 10 rows
+    const size_t num_rows{100};
+    const size_t unique_grouping_values{10};
+    SegmentInMemory seg;
+    auto mod_2_col = std::make_shared<Column>(generate_int_column_repeated_values(num_rows, 2));
+    seg.add_column(scalar_field(mod_2_col->type().data_type(), "mod_2"), mod_2_col);
+    auto mod_5_col = std::make_shared<Column>(generate_int_column_repeated_values(num_rows, 5));
+    seg.add_column(scalar_field(mod_5_col->type().data_type(), "mod_5"), mod_5_col);
+    for (const auto& name: {"sum_int", "count_int"}) {
+        auto col = std::make_shared<Column>(generate_int_column(num_rows));
+        seg.add_column(scalar_field(col->type().data_type(), name), col);
+    }
+    seg.set_row_id(num_rows - 1);
+    auto entity_ids = push_entities(*component_manager, ProcessingUnit{std::move(seg)});
+
+    auto aggregated = gather_entities<std::shared_ptr<SegmentInMemory>, std::shared_ptr<RowRange>,
+                                      std::shared_ptr<ColRange>>(*component_manager,
+                                                                 aggregation.process(std::move(entity_ids)));
+    ASSERT_TRUE(aggregated.segments_.has_value());
+    auto segments = aggregated.segments_.value();
+    ASSERT_EQ(1, segments.size());
+    ASSERT_EQ(unique_grouping_values, segments[0]->row_count());
+
+    using aggregation_test::check_column;
+    check_column<int64_t>(*segments[0], "mod_2", unique_grouping_values, [](size_t idx) { return idx % 2; });
+    // Index levels after the first are named as the pandas normalizer names multi-index levels
+    check_column<int64_t>(*segments[0], "__idx__mod_5", unique_grouping_values, [](size_t idx) { return idx % 5; });
+    check_column<int64_t>(*segments[0], "sum_int", unique_grouping_values, [](size_t idx) { return 450 + 10*idx; });
+    check_column<uint64_t>(*segments[0], "count_int", unique_grouping_values, [](size_t) { return 10; });
+    ASSERT_EQ(std::get<NewIndex>(aggregation.clause_info().index_), (NewIndex{"mod_2", "__idx__mod_5"}));
+}
+
+TEST(Clause, AggregationMomentsAndQuantiles) {
+    using namespace arcticdb;
+    auto component_manager = std::make_shared<ComponentManager>();
+
+    AggregationClause aggregation("int_repeated_values",
+                                  {{"sum_of_squares", "sum_int", "sum_int"},
+                                   {"var", "min_int", "min_int"},
+                                   {"std", "max_int", "max_int"},
+                                   {"median", "mean_int", "mean_int"},
+                                   {"quantile(0.25)", "mean_int", "quantile_int"},
+                                   {"nunique", "count_int", "count_int"}});
+    aggregation.set_component_manager(component_manager);
+
+    size_t num_rows{100};
+    size_t unique_grouping_values{10};
+    auto proc_unit = ProcessingUnit{generate_groupby_testing_segment(num_rows, unique_grouping_values)};
+    auto entity_ids = push_entities(*component_manager, std::move(proc_unit));
+
+    auto aggregated = gather_entities<std::shared_ptr<SegmentInMemory>, std::shared_ptr<RowRange>,
+                                      std::shared_ptr<ColRange>>(*component_manager,
+                                                                 aggregation.process(std::move(entity_ids)));
+    ASSERT_TRUE(aggregated.segments_.has_value());
+    auto segments = aggregated.segments_.value();
+    ASSERT_EQ(1, segments.size());
+
+    // Group idx holds the values idx, idx + 10, ..., idx + 90
+    using aggregation_test::check_column;
+    check_column<double>(*segments[0], "sum_int", unique_grouping_values, [](size_t idx) {
+        return double(10*idx*idx + 900*idx + 28500);
+    });
+    check_column<double>(*segments[0], "mean_int", unique_grouping_values, [](size_t idx) {
+        return double(idx) + 45.0;
+    });
+    check_column<double>(*segments[0], "quantile_int", unique_grouping_values, [](size_t idx) {
+        return double(idx) + 22.5;
+    });
+    check_column<uint64_t>(*segments[0], "count_int", unique_grouping_values, [](size_t) { return 10; });
+
+    // The sample variance of 0, 10, ..., 90
+    const double expected_variance = 8250.0 / 9.0;
+    auto& var_column = segments[0]->column(*segments[0]->column_index("min_int"));
+    auto& std_column = segments[0]->column(*segments[0]->column_index("max_int"));
+    for (size_t idx = 0; idx < unique_grouping_values; ++idx) {
+        ASSERT_NEAR(expected_variance, var_column.scalar_at<double>(idx).value(), 1e-9);
+        ASSERT_NEAR(std::sqrt(expected_variance), std_column.scalar_at<double>(idx).value(), 1e-9);
+    }
+}
+
+TEST(Clause, AggregationInvalidQuantile) {
+    using namespace arcticdb;
+    ASSERT_THROW(
+            AggregationClause("int_repeated_values", {{"quantile(1.5)", "sum_int", "sum_int"}}),
+            UserInputException);
+    ASSERT_THROW(
+            AggregationClause("int_repeated_values", {{"quantile(abc)", "sum_int", "sum_int"}}),
+            UserInputException);
+}
+
 TEST(Clause, Passthrough) {
     using namespace arcticdb;
     auto component_manager = std::make_shared<ComponentManager>();
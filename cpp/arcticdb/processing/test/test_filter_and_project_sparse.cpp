@@ -418,4 +418,27 @@ TEST_F(FilterProjectSparse, BinaryArithmeticSparseColLongerThanDenseCol) {
             ASSERT_FALSE(projected_column->has_value_at(idx));
         }
     }
-}
\ No newline at end of file
+}
+
+TEST_F(FilterProjectSparse, WhereBoolColumnSparseColDenseCol) {
+    const std::string output_column("where");
+    expression_context->root_node_name_ = ExpressionName(output_column);
+    auto expression_node = std::make_shared<ExpressionNode>(ColumnName("sparse_bools"), ColumnName("sparse_floats_1"), ColumnName("dense_floats_1"), OperationType::WHERE);
+    expression_context->add_expression_node(output_column, expression_node);
+    auto projected_column = std::get<ColumnWithStrings>(proc_unit.get(expression_context->root_node_name_)).column_;
+
+    // Floating point outputs are dense, with NaN wherever the chosen input has no value
+    ASSERT_FALSE(projected_column->opt_sparse_map().has_value());
+    for (auto idx = 0; idx <= projected_column->last_row(); idx++) {
+        auto opt_condition = sparse_bools->scalar_at<bool>(idx);
+        auto opt_expected = opt_condition.has_value() && *opt_condition ?
+                sparse_floats_1->scalar_at<double>(idx) : dense_floats_1->scalar_at<double>(idx);
+        auto opt_projected_value = projected_column->scalar_at<double>(idx);
+        ASSERT_TRUE(opt_projected_value.has_value());
+        if (opt_expected.has_value() && !std::isnan(*opt_expected)) {
+            ASSERT_FLOAT_EQ(*opt_expected, *opt_projected_value);
+        } else {
+            ASSERT_TRUE(std::isnan(*opt_projected_value));
+        }
+    }
+}
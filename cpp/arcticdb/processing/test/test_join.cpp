@@ -0,0 +1,81 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <cmath>
+
+#include <gtest/gtest.h>
+
+#include <arcticdb/processing/join_utils.hpp>
+#include <arcticdb/processing/clause.hpp>
+
+using namespace arcticdb;
+
+namespace {
+std::vector<std::string> string_keys(const std::vector<std::string>& values) {
+    std::vector<std::string> keys(values.size());
+    auto column = std::make_shared<Column>(make_scalar_type(DataType::UTF_DYNAMIC64), 0, AllocationType::DYNAMIC, Sparsity::PERMITTED);
+    auto string_pool = std::make_shared<StringPool>();
+    for (const auto& value: values) {
+        column->push_back<entity::position_t>(string_pool->get(value).offset());
+    }
+    append_join_keys(ColumnWithStrings(column, string_pool, "col"), keys);
+    return keys;
+}
+}
+
+TEST(Join, KeysIgnoreIntegerWidth) {
+    auto int8_column = std::make_shared<Column>(make_scalar_type(DataType::INT8), 0, AllocationType::DYNAMIC, Sparsity::PERMITTED);
+    int8_column->push_back<int8_t>(3);
+    auto uint64_column = std::make_shared<Column>(make_scalar_type(DataType::UINT64), 0, AllocationType::DYNAMIC, Sparsity::PERMITTED);
+    uint64_column->push_back<uint64_t>(3);
+    std::vector<std::string> int8_keys(1);
+    std::vector<std::string> uint64_keys(1);
+    append_join_keys(ColumnWithStrings(int8_column, {}, "col"), int8_keys);
+    append_join_keys(ColumnWithStrings(uint64_column, {}, "col"), uint64_keys);
+    ASSERT_EQ(int8_keys, uint64_keys);
+    std::vector<std::string> missing_keys(1);
+    append_missing_join_keys(missing_keys);
+    ASSERT_NE(int8_keys, missing_keys);
+}
+
+TEST(Join, MatchedColumn) {
+    auto right_column = std::make_shared<Column>(make_scalar_type(DataType::INT64), 0, AllocationType::DYNAMIC, Sparsity::PERMITTED);
+    for (int64_t value: {10, 20, 30}) {
+        right_column->push_back<int64_t>(value);
+    }
+    JoinColumn join_column("col", join_output_type("col", DataType::INT64), 4);
+    // The first right row is in an earlier row slice that does not contain this column
+    join_column.add_right_values(ColumnWithStrings(right_column, {}, "col"), 1);
+    StringPool string_pool;
+    auto output = join_column.matched_column({1, NO_JOIN_MATCH, 0, 3}, string_pool);
+    ASSERT_EQ(output->type(), make_scalar_type(DataType::FLOAT64));
+    ASSERT_EQ(output->scalar_at<double>(0), 10.0);
+    ASSERT_TRUE(std::isnan(*output->scalar_at<double>(1)));
+    ASSERT_TRUE(std::isnan(*output->scalar_at<double>(2)));
+    ASSERT_EQ(output->scalar_at<double>(3), 30.0);
+}
+
+TEST(Join, HashJoinMatcher) {
+    const HashJoinMatcher matcher(string_keys({"b", "a", "c"}));
+    ASSERT_EQ(
+            (std::vector<int64_t>{1, NO_JOIN_MATCH, 0, 1, 2}),
+            matcher.match(string_keys({"a", "d", "b", "a", "c"})));
+    ASSERT_TRUE(matcher.match({}).empty());
+}
+
+TEST(Join, DuplicateRightKeys) {
+    ASSERT_THROW(HashJoinMatcher(string_keys({"a", "b", "a"})), UserInputException);
+}
+
+TEST(Join, InvalidOptions) {
+    ASSERT_THROW(JoinClause{JoinOptions{}}, UserInputException);
+    JoinOptions options;
+    options.on_ = {"ticker"};
+    options.type_ = JoinType::LEFT;
+    ASSERT_EQ(JoinClause{options}.to_string(), "JOIN(on=[ticker], how=left)");
+    ASSERT_EQ(ConcatClause{}.to_string(), "CONCAT");
+}
@@ -0,0 +1,132 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <cmath>
+#include <limits>
+
+#include <gtest/gtest.h>
+
+#include <arcticdb/processing/window_aggregation.hpp>
+#include <arcticdb/processing/clause.hpp>
+
+using namespace arcticdb;
+
+namespace {
+constexpr double nan = std::numeric_limits<double>::quiet_NaN();
+
+// Feeds values through a single state in chunks of chunk_size rows, to mimic consecutive row slices
+std::vector<double> aggregate_in_chunks(const WindowSpec& spec,
+                                        WindowOperator op,
+                                        const std::vector<double>& values,
+                                        const std::vector<timestamp>& index,
+                                        size_t chunk_size) {
+    WindowAggregatorState state(spec, op);
+    std::vector<double> output(values.size());
+    for (size_t start = 0; start < values.size(); start += chunk_size) {
+        const auto rows = std::min(chunk_size, values.size() - start);
+        state.aggregate(values.data() + start, index.empty() ? nullptr : index.data() + start, rows, output.data() + start);
+    }
+    return output;
+}
+
+void assert_doubles_eq(const std::vector<double>& expected, const std::vector<double>& actual) {
+    ASSERT_EQ(expected.size(), actual.size());
+    for (size_t idx = 0; idx < expected.size(); ++idx) {
+        if (std::isnan(expected[idx])) {
+            ASSERT_TRUE(std::isnan(actual[idx])) << "at row " << idx;
+        } else {
+            ASSERT_DOUBLE_EQ(expected[idx], actual[idx]) << "at row " << idx;
+        }
+    }
+}
+}
+
+TEST(Window, RollingRowsAcrossChunks) {
+    std::vector<double> values{1, 2, nan, 4, 5, 6, nan, nan, 9};
+    const auto spec = WindowSpec::rows(3, 2);
+    for (size_t chunk_size: {1UL, 2UL, 4UL, 9UL}) {
+        assert_doubles_eq({nan, 3, 3, 6, 9, 15, 11, nan, nan}, aggregate_in_chunks(spec, WindowOperator::SUM, values, {}, chunk_size));
+        assert_doubles_eq({nan, 1.5, 1.5, 3, 4.5, 5, 5.5, nan, nan}, aggregate_in_chunks(spec, WindowOperator::MEAN, values, {}, chunk_size));
+        assert_doubles_eq({nan, 2, 2, 2, 2, 3, 2, nan, nan}, aggregate_in_chunks(spec, WindowOperator::COUNT, values, {}, chunk_size));
+        assert_doubles_eq({nan, 1, 1, 2, 4, 4, 5, nan, nan}, aggregate_in_chunks(spec, WindowOperator::MIN, values, {}, chunk_size));
+        assert_doubles_eq({nan, 2, 2, 4, 5, 6, 6, nan, nan}, aggregate_in_chunks(spec, WindowOperator::MAX, values, {}, chunk_size));
+    }
+}
+
+TEST(Window, RollingTime) {
+    std::vector<double> values{1, 2, 3, 4, 5};
+    std::vector<timestamp> index{0, 10, 10, 25, 40};
+    const auto spec = WindowSpec::time(20, 1);
+    for (size_t chunk_size: {1UL, 2UL, 5UL}) {
+        // Windows are (ts - 20, ts]
+        assert_doubles_eq({1, 3, 6, 9, 9}, aggregate_in_chunks(spec, WindowOperator::SUM, values, index, chunk_size));
+        assert_doubles_eq({1, 1, 1, 2, 4}, aggregate_in_chunks(spec, WindowOperator::MIN, values, index, chunk_size));
+    }
+}
+
+TEST(Window, RollingTimeUnsortedIndex) {
+    WindowAggregatorState state(WindowSpec::time(20, 1), WindowOperator::SUM);
+    std::vector<double> values{1, 2};
+    std::vector<timestamp> index{10, 5};
+    std::vector<double> output(2);
+    ASSERT_THROW(state.aggregate(values.data(), index.data(), 2, output.data()), UnsortedDataException);
+}
+
+TEST(Window, Expanding) {
+    std::vector<double> values{3, nan, 1, 2};
+    for (size_t chunk_size: {1UL, 3UL}) {
+        assert_doubles_eq({3, 3, 4, 6}, aggregate_in_chunks(WindowSpec::expanding(1), WindowOperator::SUM, values, {}, chunk_size));
+        assert_doubles_eq({nan, nan, 1, 1}, aggregate_in_chunks(WindowSpec::expanding(2), WindowOperator::MIN, values, {}, chunk_size));
+    }
+}
+
+TEST(Window, ExponentiallyWeightedMean) {
+    // Expected values from pd.Series([1, nan, 3, 4]).ewm(alpha=0.5).mean()
+    std::vector<double> values{1, nan, 3, 4};
+    for (size_t chunk_size: {1UL, 2UL, 4UL}) {
+        assert_doubles_eq({1.0, 1.0, 2.6, 3.4615384615384617},
+                          aggregate_in_chunks(WindowSpec::exponential(0.5, 0, true), WindowOperator::MEAN, values, {}, chunk_size));
+        // Expected values from pd.Series([1, nan, 3, 4]).ewm(alpha=0.5, adjust=False).mean()
+        assert_doubles_eq({1.0, 1.0, 2.3333333333333335, 3.1666666666666665},
+                          aggregate_in_chunks(WindowSpec::exponential(0.5, 0, false), WindowOperator::MEAN, values, {}, chunk_size));
+    }
+}
+
+TEST(Window, InvalidSpecs) {
+    ASSERT_THROW(WindowSpec::rows(0, 0), UserInputException);
+    ASSERT_THROW(WindowSpec::rows(3, 4), UserInputException);
+    ASSERT_THROW(WindowSpec::time(0, 1), UserInputException);
+    ASSERT_THROW(WindowSpec::exponential(0.0, 0, true), UserInputException);
+    ASSERT_THROW(window_operator_from_string("first"), UserInputException);
+    WindowClause window_clause{WindowSpec::exponential(0.5, 0, true)};
+    ASSERT_THROW(window_clause.set_aggregations({NamedAggregator("sum", "col", "out")}), UserInputException);
+}
+
+TEST(Window, TimeWindowRequiresSortedIndex) {
+    StreamDescriptor stream_desc(StreamId("test symbol"));
+    stream_desc.set_index({1, IndexDescriptor::Type::TIMESTAMP});
+    stream_desc.add_scalar_field(DataType::NANOSECONDS_UTC64, "timestamp");
+    stream_desc.add_scalar_field(DataType::FLOAT64, "col");
+    arcticdb::proto::descriptors::NormalizationMetadata norm_meta;
+    norm_meta.mutable_df()->mutable_common()->mutable_index()->set_name("timestamp");
+    norm_meta.mutable_df()->mutable_common()->mutable_index()->set_is_physically_stored(true);
+
+    WindowClause time_window{WindowSpec::time(20, 1)};
+    time_window.set_aggregations({NamedAggregator("sum", "col", "out")});
+    WindowClause row_window{WindowSpec::rows(2, 1)};
+    row_window.set_aggregations({NamedAggregator("sum", "col", "out")});
+    for (auto sorted: {SortedValue::UNKNOWN, SortedValue::ASCENDING}) {
+        stream_desc.set_sorted(sorted);
+        ASSERT_NO_THROW(time_window.modify_schema({stream_desc.clone(), norm_meta}));
+    }
+    for (auto sorted: {SortedValue::UNSORTED, SortedValue::DESCENDING}) {
+        stream_desc.set_sorted(sorted);
+        ASSERT_THROW(time_window.modify_schema({stream_desc.clone(), norm_meta}), UnsortedDataException);
+        // Row-based windows do not depend on the index values
+        ASSERT_NO_THROW(row_window.modify_schema({stream_desc.clone(), norm_meta}));
+    }
+}
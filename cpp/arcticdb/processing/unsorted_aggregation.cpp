@@ -7,7 +7,11 @@
 
 #include <arcticdb/processing/unsorted_aggregation.hpp>
 
+#include <algorithm>
 #include <cmath>
+#include <cstring>
+#include <limits>
+#include <type_traits>
 
 namespace arcticdb {
 
@@ -57,6 +61,104 @@ SegmentInMemory MinMaxAggregatorData::finalize(const std::vector<ColumnName>& ou
 
 namespace {
 
+// Calls func with the membership hash of every non-null value in the column. Numeric, bool and time values are all
+// hashed as doubles so that query values of a different type to the column can be probed consistently
+template<typename Func>
+void for_each_membership_hash(const ColumnWithStrings& input_column, std::string_view stat_name, Func&& func) {
+    details::visit_type(input_column.column_->type().data_type(), [&] (auto col_tag) {
+        using type_info = ScalarTypeInfo<decltype(col_tag)>;
+        if constexpr(is_dynamic_string_type(type_info::data_type)) {
+            Column::for_each<typename type_info::TDT>(*input_column.column_, [&input_column, &func](auto offset) {
+                if (auto str = input_column.string_at_offset(offset); str.has_value()) {
+                    func(membership_hash(*str));
+                }
+            });
+        } else if constexpr(is_numeric_type(type_info::data_type) || is_bool_type(type_info::data_type)) {
+            Column::for_each<typename type_info::TDT>(*input_column.column_, [&func](auto value) {
+                const auto as_double = static_cast<double>(value);
+                if (!std::isnan(as_double)) {
+                    func(membership_hash(as_double));
+                }
+            });
+        } else if constexpr(is_empty_type(type_info::data_type)) {
+            // Column only contains nulls, so there is nothing to record
+        } else {
+            schema::raise<ErrorCode::E_UNSUPPORTED_COLUMN_TYPE>(
+                    "{} column stat generation not supported with type {}",
+                    stat_name,
+                    type_info::data_type);
+        }
+    });
+}
+
+SegmentInMemory single_string_column_stat(const ColumnName& output_column_name, std::optional<std::string_view> value) {
+    SegmentInMemory seg;
+    auto col = std::make_shared<Column>(make_scalar_type(DataType::UTF_DYNAMIC64), Sparsity::PERMITTED);
+    col->template push_back<entity::position_t>(value.has_value() ? seg.string_pool().get(*value).offset() : not_a_string());
+    seg.add_column(scalar_field(DataType::UTF_DYNAMIC64, output_column_name.value), col);
+    return seg;
+}
+
+} // namespace
+
+void BloomFilterAggregatorData::aggregate(const ColumnWithStrings& input_column) {
+    seen_data_ = true;
+    for_each_membership_hash(input_column, "Bloom filter", [this](HashedValue hash) {
+        bloom_filter_.insert(hash);
+    });
+}
+
+SegmentInMemory BloomFilterAggregatorData::finalize(const std::vector<ColumnName>& output_column_names) const {
+    internal::check<ErrorCode::E_ASSERTION_FAILURE>(
+            output_column_names.size() == 1,
+            "Expected 1 output column name in BloomFilterAggregatorData::finalize, but got {}",
+            output_column_names.size());
+    if (!seen_data_) {
+        return {};
+    }
+    return single_string_column_stat(output_column_names[0], bloom_filter_.to_hex());
+}
+
+void DistinctValuesAggregatorData::aggregate(const ColumnWithStrings& input_column) {
+    seen_data_ = true;
+    if (overflowed_) {
+        return;
+    }
+    for_each_membership_hash(input_column, "Distinct values", [this](HashedValue hash) {
+        if (!overflowed_) {
+            hashes_.insert(hash);
+            overflowed_ = hashes_.size() > max_distinct_values_;
+        }
+    });
+    if (overflowed_) {
+        hashes_.clear();
+    }
+}
+
+SegmentInMemory DistinctValuesAggregatorData::finalize(const std::vector<ColumnName>& output_column_names) const {
+    internal::check<ErrorCode::E_ASSERTION_FAILURE>(
+            output_column_names.size() == 1,
+            "Expected 1 output column name in DistinctValuesAggregatorData::finalize, but got {}",
+            output_column_names.size());
+    if (!seen_data_) {
+        return {};
+    }
+    if (overflowed_) {
+        return single_string_column_stat(output_column_names[0], std::nullopt);
+    }
+    // Sorted so that the stat is deterministic and can be binary searched when reading
+    std::vector<HashedValue> sorted_hashes(hashes_.begin(), hashes_.end());
+    std::sort(sorted_hashes.begin(), sorted_hashes.end());
+    std::string res;
+    res.reserve(sorted_hashes.size() * 16);
+    for (auto hash: sorted_hashes) {
+        res += hash_to_hex(hash);
+    }
+    return single_string_column_stat(output_column_names[0], res);
+}
+
+namespace {
+
 template<typename T, typename T2=void>
 struct OutputType;
 
@@ -608,4 +710,307 @@ SegmentInMemory LastAggregatorData::finalize(const ColumnName& output_column_nam
     return res;
 }
 
+/******************************
+ * SumOfSquaresAggregatorData *
+ ******************************/
+
+namespace
+{
+    void check_numeric_aggregation_type(DataType data_type, std::string_view aggregation_name) {
+        schema::check<ErrorCode::E_UNSUPPORTED_COLUMN_TYPE>(
+                is_numeric_type(data_type) || is_bool_type(data_type) || is_empty_type(data_type),
+                "{} aggregation not supported with type {}",
+                aggregation_name,
+                data_type);
+    }
+
+    // Calls func with the group and the value as a double of every row of the input column, skipping NaNs as the other
+    // aggregations do
+    template <typename Func>
+    void for_each_grouped_double(
+            const ColumnWithStrings& input_column,
+            const std::vector<size_t>& groups,
+            Func&& func) {
+        details::visit_type(input_column.column_->type().data_type(), [&input_column, &groups, &func] (auto col_tag) {
+            using col_type_info = ScalarTypeInfo<decltype(col_tag)>;
+            if constexpr(!is_sequence_type(col_type_info::data_type)) {
+                Column::for_each_enumerated<typename col_type_info::TDT>(
+                        *input_column.column_,
+                        [&groups, &func](auto enumerating_it) {
+                    if constexpr (is_floating_point_type(col_type_info::data_type)) {
+                        if (ARCTICDB_LIKELY(!std::isnan(enumerating_it.value()))) {
+                            func(groups[enumerating_it.idx()], double(enumerating_it.value()));
+                        }
+                    } else {
+                        func(groups[enumerating_it.idx()], double(enumerating_it.value()));
+                    }
+                });
+            } else {
+                util::raise_rte("String aggregations not currently supported");
+            }
+        });
+    }
+
+    template <typename T, typename Func>
+    SegmentInMemory finalize_float64_column(
+            const ColumnName& output_column_name,
+            size_t unique_values,
+            std::vector<T>& aggregated,
+            Func&& to_double) {
+        SegmentInMemory res;
+        if(!aggregated.empty()) {
+            aggregated.resize(unique_values);
+            auto col = std::make_shared<Column>(
+                    make_scalar_type(DataType::FLOAT64),
+                    unique_values,
+                    AllocationType::PRESIZED,
+                    Sparsity::NOT_PERMITTED);
+            auto column_data = col->data();
+            std::transform(
+                    aggregated.begin(),
+                    aggregated.end(),
+                    column_data.begin<ScalarTagType<DataTypeTag<DataType::FLOAT64>>>(),
+                    to_double);
+            col->set_row_data(unique_values - 1);
+            res.add_column(scalar_field(DataType::FLOAT64, output_column_name.value), col);
+        }
+        return res;
+    }
+
+    void aggregate_moments(
+            const std::optional<ColumnWithStrings>& input_column,
+            const std::vector<size_t>& groups,
+            size_t unique_values,
+            std::vector<GroupMoments>& moments) {
+        if(input_column.has_value()) {
+            moments.resize(unique_values);
+            for_each_grouped_double(*input_column, groups, [&moments](size_t group, double value) {
+                moments[group].add(value);
+            });
+        }
+    }
+}
+
+void SumOfSquaresAggregatorData::add_data_type(DataType data_type) {
+    // Sums of squares are always doubles, as squaring integers overflows far sooner than summing them
+    check_numeric_aggregation_type(data_type, "Sum of squares");
+}
+
+void SumOfSquaresAggregatorData::aggregate(
+        const std::optional<ColumnWithStrings>& input_column,
+        const std::vector<size_t>& groups,
+        size_t unique_values) {
+    if(input_column.has_value()) {
+        aggregated_.resize(unique_values);
+        for_each_grouped_double(*input_column, groups, [this](size_t group, double value) {
+            aggregated_[group] += value * value;
+        });
+    }
+}
+
+SegmentInMemory SumOfSquaresAggregatorData::finalize(const ColumnName& output_column_name, bool, size_t unique_values) {
+    return finalize_float64_column(output_column_name, unique_values, aggregated_, [](double value) {
+        return value;
+    });
+}
+
+/****************
+ * GroupMoments *
+ ****************/
+
+void GroupMoments::add(double value) {
+    ++count_;
+    const auto delta = value - mean_;
+    mean_ += delta / static_cast<double>(count_);
+    m2_ += delta * (value - mean_);
+}
+
+double GroupMoments::variance() const {
+    return count_ < 2 ? std::numeric_limits<double>::quiet_NaN() : m2_ / static_cast<double>(count_ - 1);
+}
+
+/*********************
+ * VarAggregatorData *
+ *********************/
+
+void VarAggregatorData::add_data_type(DataType data_type) {
+    check_numeric_aggregation_type(data_type, "Var");
+}
+
+void VarAggregatorData::aggregate(
+        const std::optional<ColumnWithStrings>& input_column,
+        const std::vector<size_t>& groups,
+        size_t unique_values) {
+    aggregate_moments(input_column, groups, unique_values, moments_);
+}
+
+SegmentInMemory VarAggregatorData::finalize(const ColumnName& output_column_name, bool, size_t unique_values) {
+    return finalize_float64_column(output_column_name, unique_values, moments_, [](const GroupMoments& moments) {
+        return moments.variance();
+    });
+}
+
+/*********************
+ * StdAggregatorData *
+ *********************/
+
+void StdAggregatorData::add_data_type(DataType data_type) {
+    check_numeric_aggregation_type(data_type, "Std");
+}
+
+void StdAggregatorData::aggregate(
+        const std::optional<ColumnWithStrings>& input_column,
+        const std::vector<size_t>& groups,
+        size_t unique_values) {
+    aggregate_moments(input_column, groups, unique_values, moments_);
+}
+
+SegmentInMemory StdAggregatorData::finalize(const ColumnName& output_column_name, bool, size_t unique_values) {
+    return finalize_float64_column(output_column_name, unique_values, moments_, [](const GroupMoments& moments) {
+        return std::sqrt(moments.variance());
+    });
+}
+
+/*************************
+ * NUniqueAggregatorData *
+ *************************/
+
+void NUniqueGroupValues::insert(int64_t value) {
+    integers_.insert(value);
+}
+
+void NUniqueGroupValues::insert(uint64_t value) {
+    if (value <= static_cast<uint64_t>(std::numeric_limits<int64_t>::max()))
+        integers_.insert(static_cast<int64_t>(value));
+    else
+        large_unsigned_integers_.insert(value);
+}
+
+void NUniqueGroupValues::insert(double value) {
+    // 2^63 and 2^64 are exactly representable as doubles, unlike the largest int64 and uint64. Any zero is equal to the
+    // integer 0, so -0.0 and 0.0 are counted once
+    constexpr double two_to_63 = 9223372036854775808.0;
+    if (std::trunc(value) == value) {
+        if (value >= -two_to_63 && value < two_to_63) {
+            insert(static_cast<int64_t>(value));
+            return;
+        }
+        if (value >= 0 && value < 2 * two_to_63) {
+            insert(static_cast<uint64_t>(value));
+            return;
+        }
+    }
+    uint64_t bits;
+    std::memcpy(&bits, &value, sizeof(bits));
+    doubles_.insert(bits);
+}
+
+void NUniqueGroupValues::insert(std::string_view value) {
+    strings_.emplace(value);
+}
+
+size_t NUniqueGroupValues::size() const {
+    return integers_.size() + large_unsigned_integers_.size() + doubles_.size() + strings_.size();
+}
+
+void NUniqueAggregatorData::aggregate(
+        const std::optional<ColumnWithStrings>& input_column,
+        const std::vector<size_t>& groups,
+        size_t unique_values) {
+    if(input_column.has_value()) {
+        values_.resize(unique_values);
+        details::visit_type(input_column->column_->type().data_type(), [&input_column, &groups, this] (auto col_tag) {
+            using col_type_info = ScalarTypeInfo<decltype(col_tag)>;
+            using RawType = typename col_type_info::RawType;
+            if constexpr(is_dynamic_string_type(col_type_info::data_type)) {
+                Column::for_each_enumerated<typename col_type_info::TDT>(
+                        *input_column->column_,
+                        [&input_column, &groups, this](auto enumerating_it) {
+                    if (auto str = input_column->string_at_offset(enumerating_it.value()); str.has_value()) {
+                        values_[groups[enumerating_it.idx()]].insert(*str);
+                    }
+                });
+            } else if constexpr(is_numeric_type(col_type_info::data_type) || is_bool_type(col_type_info::data_type)) {
+                Column::for_each_enumerated<typename col_type_info::TDT>(
+                        *input_column->column_,
+                        [&groups, this](auto enumerating_it) {
+                    const auto value = enumerating_it.value();
+                    auto& group_values = values_[groups[enumerating_it.idx()]];
+                    if constexpr(std::is_floating_point_v<RawType>) {
+                        if (ARCTICDB_UNLIKELY(std::isnan(value)))
+                            return;
+                        group_values.insert(static_cast<double>(value));
+                    } else if constexpr(std::is_signed_v<RawType>) {
+                        group_values.insert(static_cast<int64_t>(value));
+                    } else {
+                        group_values.insert(static_cast<uint64_t>(value));
+                    }
+                });
+            } else {
+                schema::raise<ErrorCode::E_UNSUPPORTED_COLUMN_TYPE>(
+                        "NUnique aggregation not supported with type {}",
+                        col_type_info::data_type);
+            }
+        });
+    }
+}
+
+SegmentInMemory NUniqueAggregatorData::finalize(const ColumnName& output_column_name, bool, size_t unique_values) {
+    SegmentInMemory res;
+    if(!values_.empty()) {
+        values_.resize(unique_values);
+        auto pos = res.add_column(
+                scalar_field(DataType::UINT64, output_column_name.value),
+                unique_values,
+                AllocationType::PRESIZED);
+        auto& column = res.column(pos);
+        auto ptr = reinterpret_cast<uint64_t*>(column.ptr());
+        column.set_row_data(unique_values - 1);
+        for (const auto& group_values: values_) {
+            *ptr++ = group_values.size();
+        }
+    }
+    return res;
+}
+
+/**************************
+ * QuantileAggregatorData *
+ **************************/
+
+void QuantileAggregatorData::add_data_type(DataType data_type) {
+    check_numeric_aggregation_type(data_type, "Quantile");
+}
+
+void QuantileAggregatorData::aggregate(
+        const std::optional<ColumnWithStrings>& input_column,
+        const std::vector<size_t>& groups,
+        size_t unique_values) {
+    if(input_column.has_value()) {
+        values_.resize(unique_values);
+        for_each_grouped_double(*input_column, groups, [this](size_t group, double value) {
+            values_[group].emplace_back(value);
+        });
+    }
+}
+
+SegmentInMemory QuantileAggregatorData::finalize(const ColumnName& output_column_name, bool, size_t unique_values) {
+    // Linearly interpolates between the two closest ranks, as Pandas does by default. Only the two values either side
+    // of the quantile are found, which is linear rather than the n log n of a full sort
+    return finalize_float64_column(output_column_name, unique_values, values_, [this](std::vector<double>& values) {
+        if (values.empty()) {
+            return std::numeric_limits<double>::quiet_NaN();
+        }
+        const auto position = quantile_ * static_cast<double>(values.size() - 1);
+        const auto lower_rank = static_cast<size_t>(std::floor(position));
+        auto lower_it = values.begin() + static_cast<std::ptrdiff_t>(lower_rank);
+        std::nth_element(values.begin(), lower_it, values.end());
+        const auto lower = *lower_it;
+        if (lower_rank + 1 == values.size()) {
+            return lower;
+        }
+        const auto upper = *std::min_element(std::next(lower_it), values.end());
+        return lower + (upper - lower) * (position - static_cast<double>(lower_rank));
+    });
+}
+
 } //namespace arcticdb
@@ -12,6 +12,11 @@
 #include <arcticdb/entity/type_utils.hpp>
 #include <arcticdb/processing/aggregation_utils.hpp>
 #include <arcticdb/processing/expression_node.hpp>
+#include <arcticdb/util/bloom_filter.hpp>
+
+#include <ankerl/unordered_dense.h>
+
+#include <string>
 
 namespace arcticdb {
 
@@ -53,6 +58,89 @@ private:
     ColumnName output_column_name_max_;
 };
 
+class BloomFilterAggregatorData
+{
+public:
+
+    explicit BloomFilterAggregatorData(size_t num_bits)
+        : bloom_filter_(num_bits)
+    {}
+    ARCTICDB_MOVE_COPY_DEFAULT(BloomFilterAggregatorData)
+
+    void aggregate(const ColumnWithStrings& input_column);
+    SegmentInMemory finalize(const std::vector<ColumnName>& output_column_names) const;
+
+private:
+
+    BloomFilter bloom_filter_;
+    bool seen_data_{false};
+};
+
+class BloomFilterAggregator
+{
+public:
+
+    explicit BloomFilterAggregator(ColumnName column_name, ColumnName output_column_name, size_t num_bits)
+        : column_name_(std::move(column_name))
+        , output_column_name_(std::move(output_column_name))
+        , num_bits_(num_bits)
+    {}
+    ARCTICDB_MOVE_COPY_DEFAULT(BloomFilterAggregator)
+
+    [[nodiscard]] ColumnName get_input_column_name() const { return column_name_; }
+    [[nodiscard]] std::vector<ColumnName> get_output_column_names() const { return {output_column_name_}; }
+    [[nodiscard]] BloomFilterAggregatorData get_aggregator_data() const { return BloomFilterAggregatorData(num_bits_); }
+
+private:
+
+    ColumnName column_name_;
+    ColumnName output_column_name_;
+    size_t num_bits_;
+};
+
+class DistinctValuesAggregatorData
+{
+public:
+
+    explicit DistinctValuesAggregatorData(size_t max_distinct_values)
+        : max_distinct_values_(max_distinct_values)
+    {}
+    ARCTICDB_MOVE_COPY_DEFAULT(DistinctValuesAggregatorData)
+
+    void aggregate(const ColumnWithStrings& input_column);
+    SegmentInMemory finalize(const std::vector<ColumnName>& output_column_names) const;
+
+private:
+
+    size_t max_distinct_values_;
+    ankerl::unordered_dense::set<HashedValue> hashes_;
+    bool seen_data_{false};
+    // Set once more than max_distinct_values_ distinct values are seen, at which point the stat is stored as null
+    bool overflowed_{false};
+};
+
+class DistinctValuesAggregator
+{
+public:
+
+    explicit DistinctValuesAggregator(ColumnName column_name, ColumnName output_column_name, size_t max_distinct_values)
+        : column_name_(std::move(column_name))
+        , output_column_name_(std::move(output_column_name))
+        , max_distinct_values_(max_distinct_values)
+    {}
+    ARCTICDB_MOVE_COPY_DEFAULT(DistinctValuesAggregator)
+
+    [[nodiscard]] ColumnName get_input_column_name() const { return column_name_; }
+    [[nodiscard]] std::vector<ColumnName> get_output_column_names() const { return {output_column_name_}; }
+    [[nodiscard]] DistinctValuesAggregatorData get_aggregator_data() const { return DistinctValuesAggregatorData(max_distinct_values_); }
+
+private:
+
+    ColumnName column_name_;
+    ColumnName output_column_name_;
+    size_t max_distinct_values_;
+};
+
 class AggregatorDataBase
 {
 public:
@@ -190,6 +278,145 @@ private:
     std::unordered_set<size_t> groups_cache_;
 };
 
+class SumOfSquaresAggregatorData : private AggregatorDataBase
+{
+public:
+
+    void add_data_type(DataType data_type);
+    DataType get_output_data_type() {
+        return DataType::FLOAT64;
+    }
+    void aggregate(
+            const std::optional<ColumnWithStrings>& input_column,
+            const std::vector<size_t>& groups,
+            size_t unique_values);
+    SegmentInMemory finalize(const ColumnName& output_column_name, bool dynamic_schema, size_t unique_values);
+
+private:
+
+    std::vector<double> aggregated_;
+};
+
+// Running count, mean and sum of squared differences from the mean of a group, updated with Welford's algorithm so that
+// the variance does not suffer from the catastrophic cancellation of the naive sum of squares formula
+struct GroupMoments
+{
+    uint64_t count_{0};
+    double mean_{0.0};
+    double m2_{0.0};
+
+    void add(double value);
+    // Sample variance, i.e. with one delta degree of freedom as in Pandas
+    double variance() const;
+};
+
+class VarAggregatorData : private AggregatorDataBase
+{
+public:
+
+    void add_data_type(DataType data_type);
+    DataType get_output_data_type() {
+        return DataType::FLOAT64;
+    }
+    void aggregate(
+            const std::optional<ColumnWithStrings>& input_column,
+            const std::vector<size_t>& groups,
+            size_t unique_values);
+    SegmentInMemory finalize(const ColumnName& output_column_name, bool dynamic_schema, size_t unique_values);
+
+private:
+
+    std::vector<GroupMoments> moments_;
+};
+
+class StdAggregatorData : private AggregatorDataBase
+{
+public:
+
+    void add_data_type(DataType data_type);
+    DataType get_output_data_type() {
+        return DataType::FLOAT64;
+    }
+    void aggregate(
+            const std::optional<ColumnWithStrings>& input_column,
+            const std::vector<size_t>& groups,
+            size_t unique_values);
+    SegmentInMemory finalize(const ColumnName& output_column_name, bool dynamic_schema, size_t unique_values);
+
+private:
+
+    std::vector<GroupMoments> moments_;
+};
+
+// The distinct values seen in one group of an nunique aggregation. The values themselves are kept rather than their
+// hashes, so that the count is exact. Integers and floating point values equal to an integer are kept as integers, so
+// that equal values of different types compare equal when the column's type changes with dynamic schema. Strings are
+// copied out of the string pool of the row-slice they were read from, as each row-slice has its own pool.
+class NUniqueGroupValues
+{
+public:
+
+    void insert(int64_t value);
+    void insert(uint64_t value);
+    void insert(double value);
+    void insert(std::string_view value);
+    [[nodiscard]] size_t size() const;
+
+private:
+
+    ankerl::unordered_dense::set<int64_t> integers_;
+    // Unsigned integers too large to be represented as an int64
+    ankerl::unordered_dense::set<uint64_t> large_unsigned_integers_;
+    // Bit patterns of the floating point values that are not equal to any integer
+    ankerl::unordered_dense::set<uint64_t> doubles_;
+    ankerl::unordered_dense::set<std::string> strings_;
+};
+
+class NUniqueAggregatorData : private AggregatorDataBase
+{
+public:
+
+    // Values of any type can be counted, and the count is always an integer, so this is a no-op
+    void add_data_type(DataType) {}
+    DataType get_output_data_type() {
+        return DataType::UINT64;
+    }
+    void aggregate(
+            const std::optional<ColumnWithStrings>& input_column,
+            const std::vector<size_t>& groups,
+            size_t unique_values);
+    SegmentInMemory finalize(const ColumnName& output_column_name, bool dynamic_schema, size_t unique_values);
+
+private:
+
+    std::vector<NUniqueGroupValues> values_;
+};
+
+class QuantileAggregatorData : private AggregatorDataBase
+{
+public:
+
+    explicit QuantileAggregatorData(double quantile)
+        : quantile_(quantile)
+    {}
+
+    void add_data_type(DataType data_type);
+    DataType get_output_data_type() {
+        return DataType::FLOAT64;
+    }
+    void aggregate(
+            const std::optional<ColumnWithStrings>& input_column,
+            const std::vector<size_t>& groups,
+            size_t unique_values);
+    SegmentInMemory finalize(const ColumnName& output_column_name, bool dynamic_schema, size_t unique_values);
+
+private:
+
+    double quantile_;
+    // Unlike the other aggregations, quantiles cannot be computed incrementally, so every value of every group is kept
+    std::vector<std::vector<double>> values_;
+};
+
 template <class AggregatorData>
 class GroupingAggregatorImpl
 {
@@ -220,6 +447,35 @@ using MeanAggregatorUnsorted = GroupingAggregatorImpl<MeanAggregatorData>;
 using CountAggregatorUnsorted = GroupingAggregatorImpl<CountAggregatorData>;
 using FirstAggregatorUnsorted = GroupingAggregatorImpl<FirstAggregatorData>;
 using LastAggregatorUnsorted = GroupingAggregatorImpl<LastAggregatorData>;
+using SumOfSquaresAggregatorUnsorted = GroupingAggregatorImpl<SumOfSquaresAggregatorData>;
+using VarAggregatorUnsorted = GroupingAggregatorImpl<VarAggregatorData>;
+using StdAggregatorUnsorted = GroupingAggregatorImpl<StdAggregatorData>;
+using NUniqueAggregatorUnsorted = GroupingAggregatorImpl<NUniqueAggregatorData>;
+
+// Quantiles are parametrised, so unlike the other grouping aggregators they cannot use GroupingAggregatorImpl
+class QuantileAggregatorUnsorted
+{
+public:
+
+    explicit QuantileAggregatorUnsorted(ColumnName input_column_name, ColumnName output_column_name, double quantile)
+        : input_column_name_(std::move(input_column_name))
+        , output_column_name_(std::move(output_column_name))
+        , quantile_(quantile)
+    {
+    }
+
+    ARCTICDB_MOVE_COPY_DEFAULT(QuantileAggregatorUnsorted);
+
+    [[nodiscard]] ColumnName get_input_column_name() const { return input_column_name_; }
+    [[nodiscard]] ColumnName get_output_column_name() const { return output_column_name_; }
+    [[nodiscard]] QuantileAggregatorData get_aggregator_data() const { return QuantileAggregatorData(quantile_); }
+
+private:
+
+    ColumnName input_column_name_;
+    ColumnName output_column_name_;
+    double quantile_;
+};
 
 } //namespace arcticdb
 
@@ -0,0 +1,218 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <algorithm>
+#include <cmath>
+#include <limits>
+
+#include <fmt/format.h>
+
+#include <arcticdb/processing/window_aggregation.hpp>
+#include <arcticdb/util/preconditions.hpp>
+
+namespace arcticdb {
+
+WindowSpec WindowSpec::rows(int64_t num_rows, size_t min_periods) {
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(num_rows > 0, "Rolling window must contain at least one row, received {}", num_rows);
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+            min_periods <= static_cast<size_t>(num_rows),
+            "Rolling window min_periods {} must be <= window {}", min_periods, num_rows);
+    return WindowSpec{WindowType::ROWS, num_rows, min_periods};
+}
+
+WindowSpec WindowSpec::time(timestamp offset, size_t min_periods) {
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(offset > 0, "Rolling window offset must be positive, received {}ns", offset);
+    return WindowSpec{WindowType::TIME, offset, min_periods};
+}
+
+WindowSpec WindowSpec::expanding(size_t min_periods) {
+    return WindowSpec{WindowType::EXPANDING, 0, min_periods};
+}
+
+WindowSpec WindowSpec::exponential(double alpha, size_t min_periods, bool adjust) {
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+            alpha > 0.0 && alpha <= 1.0,
+            "Exponentially weighted window requires 0 < alpha <= 1, received {}", alpha);
+    // As in pandas, at least one observation is always required
+    return WindowSpec{WindowType::EXPONENTIAL, 0, std::max<size_t>(min_periods, 1), alpha, adjust};
+}
+
+std::string WindowSpec::to_string() const {
+    switch (type_) {
+        case WindowType::ROWS:
+            return fmt::format("ROLLING({}, min_periods={})", size_, min_periods_);
+        case WindowType::TIME:
+            return fmt::format("ROLLING({}ns, min_periods={})", size_, min_periods_);
+        case WindowType::EXPANDING:
+            return fmt::format("EXPANDING(min_periods={})", min_periods_);
+        case WindowType::EXPONENTIAL:
+            return fmt::format("EWM(alpha={}, min_periods={}, adjust={})", alpha_, min_periods_, adjust_);
+        default:
+            util::raise_rte("Unknown window type {}", static_cast<int>(type_));
+    }
+}
+
+WindowOperator window_operator_from_string(std::string_view name) {
+    if (name == "sum") {
+        return WindowOperator::SUM;
+    } else if (name == "mean") {
+        return WindowOperator::MEAN;
+    } else if (name == "count") {
+        return WindowOperator::COUNT;
+    } else if (name == "min") {
+        return WindowOperator::MIN;
+    } else if (name == "max") {
+        return WindowOperator::MAX;
+    } else {
+        user_input::raise<ErrorCode::E_INVALID_USER_ARGUMENT>("Unknown aggregation operator provided to window: {}", name);
+    }
+}
+
+void window_input_values(const Column& column, std::vector<double>& values) {
+    details::visit_type(column.type().data_type(), [&column, &values](auto col_tag) {
+        using col_type_info = ScalarTypeInfo<decltype(col_tag)>;
+        if constexpr ((is_numeric_type(col_type_info::data_type) && !is_time_type(col_type_info::data_type)) ||
+                      is_bool_type(col_type_info::data_type)) {
+            Column::for_each_enumerated<typename col_type_info::TDT>(column, [&values](auto enumerating_it) {
+                values[enumerating_it.idx()] = static_cast<double>(enumerating_it.value());
+            });
+        } else {
+            schema::raise<ErrorCode::E_UNSUPPORTED_COLUMN_TYPE>("Window aggregations not supported with column type {}", col_type_info::data_type);
+        }
+    });
+}
+
+WindowAggregatorState::WindowAggregatorState(const WindowSpec& spec, WindowOperator op) :
+        spec_(spec),
+        op_(op) {
+    internal::check<ErrorCode::E_ASSERTION_FAILURE>(
+            spec_.type_ != WindowType::EXPONENTIAL || op_ == WindowOperator::MEAN,
+            "Exponentially weighted windows only support the mean aggregation");
+}
+
+void WindowAggregatorState::aggregate(const double* values, const timestamp* index, size_t row_count, double* output) {
+    internal::check<ErrorCode::E_ASSERTION_FAILURE>(
+            spec_.type_ != WindowType::TIME || index != nullptr,
+            "Time-based windows require an index column");
+    for (size_t idx = 0; idx < row_count; ++idx) {
+        const double value = values[idx];
+        if (spec_.type_ == WindowType::EXPONENTIAL) {
+            output[idx] = exponential_value(value);
+            ++rows_seen_;
+            continue;
+        }
+        const timestamp ts = index != nullptr ? index[idx] : 0;
+        if (spec_.type_ == WindowType::TIME) {
+            sorting::check<ErrorCode::E_UNSORTED_DATA>(
+                    !last_ts_.has_value() || ts >= *last_ts_,
+                    "Time-based rolling windows require a sorted index, {} follows {}", ts, last_ts_.value_or(0));
+            last_ts_ = ts;
+        }
+        add(rows_seen_++, ts, value);
+        if (spec_.type_ == WindowType::ROWS) {
+            while (window_.size() > static_cast<size_t>(spec_.size_)) {
+                evict_front();
+            }
+        } else if (spec_.type_ == WindowType::TIME) {
+            // The current row is always in its own window, so this cannot empty the deque
+            while (window_.front().ts_ <= ts - spec_.size_) {
+                evict_front();
+            }
+        }
+        output[idx] = current_value();
+    }
+}
+
+void WindowAggregatorState::add(uint64_t position, timestamp ts, double value) {
+    if (spec_.type_ != WindowType::EXPANDING) {
+        window_.push_back({position, ts, value});
+    }
+    if (std::isnan(value)) {
+        return;
+    }
+    ++nobs_;
+    const double y = value - compensation_;
+    const double t = sum_ + y;
+    compensation_ = (t - sum_) - y;
+    sum_ = t;
+    if (op_ == WindowOperator::MIN || op_ == WindowOperator::MAX) {
+        while (!extrema_.empty() &&
+               (op_ == WindowOperator::MIN ? extrema_.back().value_ >= value : extrema_.back().value_ <= value)) {
+            extrema_.pop_back();
+        }
+        extrema_.push_back({position, ts, value});
+    }
+}
+
+void WindowAggregatorState::evict_front() {
+    const auto& entry = window_.front();
+    if (!std::isnan(entry.value_)) {
+        --nobs_;
+        if (nobs_ == 0) {
+            // Avoid accumulating floating point error across windows that become empty
+            sum_ = 0.0;
+            compensation_ = 0.0;
+        } else {
+            const double y = -entry.value_ - compensation_;
+            const double t = sum_ + y;
+            compensation_ = (t - sum_) - y;
+            sum_ = t;
+        }
+    }
+    if (!extrema_.empty() && extrema_.front().position_ == entry.position_) {
+        extrema_.pop_front();
+    }
+    window_.pop_front();
+}
+
+double WindowAggregatorState::current_value() const {
+    if (nobs_ < spec_.min_periods_) {
+        return std::numeric_limits<double>::quiet_NaN();
+    }
+    switch (op_) {
+        case WindowOperator::SUM:
+            return sum_;
+        case WindowOperator::MEAN:
+            return nobs_ == 0 ? std::numeric_limits<double>::quiet_NaN() : sum_ / static_cast<double>(nobs_);
+        case WindowOperator::COUNT:
+            return static_cast<double>(nobs_);
+        case WindowOperator::MIN:
+        case WindowOperator::MAX:
+            return extrema_.empty() ? std::numeric_limits<double>::quiet_NaN() : extrema_.front().value_;
+        default:
+            util::raise_rte("Unknown window operator {}", static_cast<int>(op_));
+    }
+}
+
+// Matches pandas ewm(...).mean() with ignore_na=False, so that the result of every row only depends on the rows
+// before it and the state after the last row of one row slice is all that is needed to continue into the next
+double WindowAggregatorState::exponential_value(double value) {
+    const bool is_observation = !std::isnan(value);
+    if (rows_seen_ == 0) {
+        weighted_ = value;
+        nobs_ = is_observation ? 1 : 0;
+        old_weight_ = 1.0;
+    } else {
+        nobs_ += is_observation ? 1 : 0;
+        if (!std::isnan(weighted_)) {
+            old_weight_ *= 1.0 - spec_.alpha_;
+            if (is_observation) {
+                const double new_weight = spec_.adjust_ ? 1.0 : spec_.alpha_;
+                // Avoids numerical errors on constant series
+                if (weighted_ != value) {
+                    weighted_ = (old_weight_ * weighted_ + new_weight * value) / (old_weight_ + new_weight);
+                }
+                old_weight_ = spec_.adjust_ ? old_weight_ + new_weight : 1.0;
+            }
+        } else if (is_observation) {
+            weighted_ = value;
+        }
+    }
+    return nobs_ >= spec_.min_periods_ ? weighted_ : std::numeric_limits<double>::quiet_NaN();
+}
+
+} //namespace arcticdb
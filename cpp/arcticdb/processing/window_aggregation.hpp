@@ -0,0 +1,106 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#pragma once
+
+#include <cstdint>
+#include <deque>
+#include <optional>
+#include <string>
+#include <vector>
+
+#include <arcticdb/column_store/column.hpp>
+#include <arcticdb/entity/types.hpp>
+
+namespace arcticdb {
+
+enum class WindowType {
+    // Fixed number of rows, including the current row
+    ROWS,
+    // Fixed time offset on the index, (ts - size, ts]
+    TIME,
+    // All rows up to and including the current row
+    EXPANDING,
+    // Exponentially weighted, matching pandas ewm with ignore_na=False
+    EXPONENTIAL
+};
+
+struct WindowSpec {
+    WindowType type_;
+    // Number of rows for ROWS windows, nanoseconds for TIME windows, unused otherwise
+    int64_t size_{0};
+    // Minimum number of non-NaN observations in the window required to produce a value
+    size_t min_periods_{1};
+    // Smoothing factor and adjust flag for EXPONENTIAL windows
+    double alpha_{0.0};
+    bool adjust_{true};
+
+    static WindowSpec rows(int64_t num_rows, size_t min_periods);
+    static WindowSpec time(timestamp offset, size_t min_periods);
+    static WindowSpec expanding(size_t min_periods);
+    static WindowSpec exponential(double alpha, size_t min_periods, bool adjust);
+
+    [[nodiscard]] std::string to_string() const;
+};
+
+enum class WindowOperator {
+    SUM,
+    MEAN,
+    COUNT,
+    MIN,
+    MAX
+};
+
+WindowOperator window_operator_from_string(std::string_view name);
+
+// Copies the values of a numeric or bool column into values as doubles. Rows missing from a sparse column are left
+// untouched, so values should be NaN-initialised by the caller
+void window_input_values(const Column& column, std::vector<double>& values);
+
+/*
+ * Computes one windowed aggregation over the rows of a symbol. The rows are fed in order, one row slice at a time, and
+ * all state required to compute the windows overlapping the next row slice is carried in this object, in the same way
+ * that SortedAggregator carries partially aggregated buckets across row slice boundaries when resampling.
+ * Output values are always doubles, with NaN representing windows with fewer than min_periods observations.
+ */
+class WindowAggregatorState {
+public:
+    WindowAggregatorState(const WindowSpec& spec, WindowOperator op);
+
+    // values and output have row_count elements, index may be nullptr unless the window type is TIME
+    void aggregate(const double* values, const timestamp* index, size_t row_count, double* output);
+
+private:
+    struct WindowEntry {
+        uint64_t position_;
+        timestamp ts_;
+        double value_;
+    };
+
+    void add(uint64_t position, timestamp ts, double value);
+    void evict_front();
+    [[nodiscard]] double current_value() const;
+    [[nodiscard]] double exponential_value(double value);
+
+    WindowSpec spec_;
+    WindowOperator op_;
+    uint64_t rows_seen_{0};
+    std::optional<timestamp> last_ts_;
+    // Rows currently in the window (not populated for expanding windows, which never evict)
+    std::deque<WindowEntry> window_;
+    // Monotonic deque of candidate extrema for MIN/MAX, front is the current extremum
+    std::deque<WindowEntry> extrema_;
+    size_t nobs_{0};
+    // Compensated (Kahan) running sum, as used by pandas rolling sum/mean
+    double sum_{0.0};
+    double compensation_{0.0};
+    // EXPONENTIAL state
+    double weighted_{0.0};
+    double old_weight_{1.0};
+};
+
+} //namespace arcticdb
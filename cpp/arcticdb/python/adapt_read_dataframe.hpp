@@ -19,4 +19,10 @@ inline auto adapt_read_df = [](ReadResult && ret) -> py::tuple{
     return py::make_tuple(ret.item, std::move(ret.frame_data), pynorm, pyuser_meta, multi_key_meta, ret.multi_keys);
 };
 
+inline auto adapt_arrow_read_df = [](ArrowReadResult && ret) -> py::tuple{
+    auto pynorm = python_util::pb_to_python(ret.norm_meta);
+    auto pyuser_meta = python_util::pb_to_python(ret.user_meta);
+    return py::make_tuple(ret.item, std::move(ret.frame_data), pynorm, pyuser_meta);
+};
+
 }
\ No newline at end of file
@@ -48,7 +48,21 @@ public:
     void finalize();
 
 private:
+    // Strings read into Python objects are created with the GIL held, which serialises this part of every read that
+    // returns strings. Everything that does not need the GIL, finding the unique strings in each segment and checking
+    // which can be copied straight into an ASCII unicode object rather than decoded as UTF-8, is done beforehand by
+    // the CPU thread decoding the segment, so that the time spent holding the GIL is as short as possible.
+    struct UniqueString {
+        entity::position_t offset_;
+        std::string_view view_;
+        size_t count_;
+        bool is_ascii_;
+    };
+
     struct UnicodeFromUnicodeCreator {
+        // Strings created this way depend on whether the type is converted, so are not shared between segments
+        static constexpr bool shareable = false;
+
         static PyObject* create(std::string_view sv, bool) {
             const auto size = sv.size() + 4;
             auto* buffer = reinterpret_cast<char*>(alloca(size));
@@ -61,13 +75,26 @@ private:
     };
 
     struct UnicodeFromStringAndSizeCreator {
+        static constexpr bool shareable = true;
+
         static PyObject* create(std::string_view sv, bool) {
             const auto actual_length = sv.size();
             return PyUnicode_FromStringAndSize(sv.data(), actual_length);
         }
+
+        // Equivalent to create for strings that are all ASCII, skipping the UTF-8 decoder
+        static PyObject* create_ascii(std::string_view sv) {
+            auto* obj = PyUnicode_New(static_cast<Py_ssize_t>(sv.size()), 127);
+            if (obj != nullptr)
+                memcpy(PyUnicode_1BYTE_DATA(obj), sv.data(), sv.size());
+
+            return obj;
+        }
     };
 
     struct BytesFromStringAndSizeCreator {
+        static constexpr bool shareable = false;
+
         static PyObject* create(std::string_view sv, bool has_type_conversion) {
             const auto actual_length = has_type_conversion ? std::min(sv.size(), strlen(sv.data())) : sv.size();
             return PYBIND11_BYTES_FROM_STRING_AND_SIZE(sv.data(), actual_length);
@@ -78,6 +105,40 @@ private:
         Py_INCREF(obj);
     }
 
+    static bool is_ascii(std::string_view sv) {
+        uint8_t bits = 0;
+        for (auto c : sv)
+            bits |= static_cast<uint8_t>(c);
+
+        return bits < 0x80;
+    }
+
+    template<typename StringCreator>
+    static std::vector<UniqueString> get_unique_strings(
+        const ankerl::unordered_dense::map<entity::position_t, size_t>& unique_counts,
+        const StringPool& string_pool) {
+        std::vector<UniqueString> unique_strings;
+        unique_strings.reserve(unique_counts.size());
+        for (const auto& [offset, count] : unique_counts) {
+            const auto sv = get_string_from_pool(offset, string_pool);
+            bool ascii = false;
+            if constexpr (std::is_same_v<StringCreator, UnicodeFromStringAndSizeCreator>)
+                ascii = is_ascii(sv);
+
+            unique_strings.emplace_back(UniqueString{offset, sv, count, ascii});
+        }
+        return unique_strings;
+    }
+
+    template<typename StringCreator>
+    static PyObject* create_string(const UniqueString& unique_string, bool has_type_conversion) {
+        if constexpr (std::is_same_v<StringCreator, UnicodeFromStringAndSizeCreator>) {
+            if (unique_string.is_ascii_)
+                return StringCreator::create_ascii(unique_string.view_);
+        }
+        return StringCreator::create(unique_string.view_, has_type_conversion);
+    }
+
     auto get_unique_counts(
         const Column& column
     ) {
@@ -130,80 +191,73 @@ private:
         increment_nan_refcount(nan_count);
     }
 
-    ankerl::unordered_dense::map<entity::position_t, PyObject*> get_allocated_strings(
-        const ankerl::unordered_dense::map<entity::position_t, size_t>& unique_counts,
-        const DecodePathData& shared_data,
-        const StringPool& string_pool
-        ) {
-        ankerl::unordered_dense::map<entity::position_t, PyObject *> output;
-        const auto& shared_map = *shared_data.unique_string_map();
-        for(auto& pair : unique_counts) {
-            auto offset = pair.first;
-
-            if(auto it = shared_map.find(get_string_from_pool(offset, string_pool)); it != shared_map.end())
-                output.try_emplace(offset, it->second);
-        }
-        return output;
-    }
-
+    // Strings seen in other segments of the same read reuse the same Python object, so that each unique string is
+    // created once per read rather than once per segment. The shared map is only modified with the GIL held
     template<typename StringCreator>
     void assign_strings_shared(
         size_t num_rows,
         const Column& source_column,
         bool has_type_conversion,
         const StringPool& string_pool,
-        const std::optional<util::BitSet>&) {
+        const std::optional<util::BitSet>& sparse_map) {
         ARCTICDB_SAMPLE(AssignStringsShared, 0)
         auto unique_counts = get_unique_counts(source_column);
-        auto allocated = get_allocated_strings(unique_counts, shared_data_, string_pool);
-        auto &shared_map = *shared_data_.unique_string_map();
+        const auto unique_strings = get_unique_strings<StringCreator>(unique_counts, string_pool);
+        auto& shared_map = *shared_data_.unique_string_map();
+        std::vector<PyObject*> objects(unique_strings.size());
         {
-            py::gil_scoped_acquire acquire_gil;
-            PyObject *obj{};
-            for (auto [offset, count] : unique_counts) {
-                if (auto it = allocated.find(offset); it == allocated.end()) {
-                    const auto sv = get_string_from_pool(offset, string_pool);
-                    if (auto shared = shared_map.find(get_string_from_pool(offset, string_pool)); shared
-                        != shared_map.end()) {
-                        obj = StringCreator::create(sv, has_type_conversion);
-                        shared_map.try_emplace(sv, obj);
-                    } else {
-                        obj = shared->second;
-                    }
-
-                    allocated.try_emplace(offset, obj);
-                    for (auto c = 1U; c < count; ++c)
-                        inc_ref(obj);
+            ARCTICDB_SUBSAMPLE(CreatePythonStrings, 0)
+            py::gil_scoped_acquire gil_lock;
+            for (auto i = 0U; i < unique_strings.size(); ++i) {
+                const auto& unique_string = unique_strings[i];
+                auto refs = unique_string.count_;
+                std::string key{unique_string.view_};
+                if (auto it = shared_map.find(key); it != shared_map.end()) {
+                    objects[i] = it->second;
+                } else {
+                    objects[i] = create_string<StringCreator>(unique_string, has_type_conversion);
+                    shared_map.insert(std::move(key), objects[i]);
+                    --refs;
                 }
+                for (auto c = 0U; c < refs; ++c)
+                    inc_ref(objects[i]);
             }
         }
+        auto py_strings = map_offsets_to_objects(unique_strings, objects);
         auto none = GilSafePyNone::instance();
-        auto [none_count, nan_count] = write_strings_to_destination(num_rows, source_column, none, allocated, source_column.opt_sparse_map());
+        auto [none_count, nan_count] = write_strings_to_destination(num_rows, source_column, none, py_strings, sparse_map);
         increment_none_refcount(none_count, none);
         increment_nan_refcount(nan_count);
     }
 
+    static ankerl::unordered_dense::map<entity::position_t, PyObject*> map_offsets_to_objects(
+        const std::vector<UniqueString>& unique_strings,
+        const std::vector<PyObject*>& objects) {
+        ankerl::unordered_dense::map<entity::position_t, PyObject*> py_strings;
+        py_strings.reserve(unique_strings.size());
+        for (auto i = 0U; i < unique_strings.size(); ++i)
+            py_strings.try_emplace(unique_strings[i].offset_, objects[i]);
+
+        return py_strings;
+    }
+
     template<typename StringCreator>
     auto assign_python_strings(
         const ankerl::unordered_dense::map<entity::position_t, size_t>& unique_counts,
         bool has_type_conversion,
         const StringPool& string_pool) {
-        ankerl::unordered_dense::map<entity::position_t, PyObject *> py_strings;
-        py_strings.reserve(unique_counts.size());
-
+        const auto unique_strings = get_unique_strings<StringCreator>(unique_counts, string_pool);
+        std::vector<PyObject*> objects(unique_strings.size());
         {
             ARCTICDB_SUBSAMPLE(CreatePythonStrings, 0)
             py::gil_scoped_acquire gil_lock;
-            for (const auto &[offset, count] : unique_counts) {
-                const auto sv = get_string_from_pool(offset, string_pool);
-                auto obj = StringCreator::create(sv, has_type_conversion);
-                for (auto c = 1U; c < count; ++c)
-                    inc_ref(obj);
-
-                py_strings.insert(std::make_pair(offset, obj));
+            for (auto i = 0U; i < unique_strings.size(); ++i) {
+                objects[i] = create_string<StringCreator>(unique_strings[i], has_type_conversion);
+                for (auto c = 1U; c < unique_strings[i].count_; ++c)
+                    inc_ref(objects[i]);
             }
         }
-        return py_strings;
+        return map_offsets_to_objects(unique_strings, objects);
     }
 
     void increment_none_refcount(size_t none_count, std::shared_ptr<py::none>& none) {
@@ -296,7 +350,7 @@ private:
         const std::optional<util::BitSet>& bitset,
         bool optimize_for_memory
     ) {
-        if (optimize_for_memory)
+        if (optimize_for_memory && StringCreator::shareable)
             assign_strings_shared<StringCreator>(num_rows, source_column, has_type_conversion, string_pool, bitset);
         else
             assign_strings_local<StringCreator>(num_rows, source_column, has_type_conversion, string_pool, bitset);
@@ -206,6 +206,29 @@ NativeTensor obj_to_tensor(PyObject *ptr, bool empty_types) {
     return {nbytes, arr->nd, strides.data(), shapes.data(), dt, elsize, data, ndim};
 }
 
+// String columns taken from Arrow arrive as an ArrowStrings tuple of (codes, offsets, data, is_utf8) rather than as an
+// array of Python strings, see _normalization.py. The tensor holds the codes, and the arrays stay owned by the item
+// being written, as with any other column
+static NativeTensor arrow_strings_to_tensor(const py::tuple& arrow_strings) {
+    util::check(arrow_strings.size() == 4, "Expected (codes, offsets, data, is_utf8) for Arrow strings, got {} items", arrow_strings.size());
+    const auto codes = arrow_strings[0].cast<py::array>();
+    const auto offsets = arrow_strings[1].cast<py::array>();
+    const auto data = arrow_strings[2].cast<py::array>();
+    util::check(codes.ndim() == 1 && codes.dtype().is(py::dtype::of<int64_t>()) && (codes.flags() & py::array::c_style),
+                "Expected contiguous int64 codes for Arrow strings");
+    util::check(offsets.ndim() == 1 && offsets.dtype().is(py::dtype::of<int64_t>()) && (offsets.flags() & py::array::c_style),
+                "Expected contiguous int64 offsets for Arrow strings");
+    util::check(data.ndim() == 1 && data.itemsize() == 1, "Expected byte data for Arrow strings");
+
+    const auto data_type = arrow_strings[3].cast<bool>() ? DataType::UTF_DYNAMIC64 : DataType::ASCII_DYNAMIC64;
+    const stride_t stride = sizeof(int64_t);
+    const shape_t num_rows = codes.shape(0);
+    NativeTensor tensor{num_rows * stride, 1, &stride, &num_rows, data_type, stride, num_rows ? codes.data() : nullptr, 1};
+    const auto num_values = offsets.shape(0) > 0 ? static_cast<size_t>(offsets.shape(0) - 1) : 0UL;
+    tensor.set_string_dictionary({static_cast<const int64_t*>(offsets.data()), static_cast<const char*>(data.data()), num_values});
+    return tensor;
+}
+
 std::shared_ptr<InputTensorFrame> py_ndf_to_frame(
     const StreamId& stream_name,
     const py::tuple &item,
@@ -258,7 +281,9 @@ std::shared_ptr<InputTensorFrame> py_ndf_to_frame(
     res->set_sorted(sorted);
 
     for (auto i = 0u; i < col_vals.size(); ++i) {
-        auto tensor = obj_to_tensor(col_vals[i].ptr(), empty_types);
+        auto tensor = py::isinstance<py::tuple>(col_vals[i]) ?
+            arrow_strings_to_tensor(col_vals[i].cast<py::tuple>()) :
+            obj_to_tensor(col_vals[i].ptr(), empty_types);
         res->num_rows = std::max(res->num_rows, static_cast<size_t>(tensor.shape(0)));
         if(tensor.expanded_dim() == 1) {
             res->desc.add_field(scalar_field(tensor.data_type(), col_names[i]));
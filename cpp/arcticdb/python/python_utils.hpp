@@ -265,6 +265,25 @@ inline py::list adapt_read_dfs(std::vector<std::variant<ReadResult, DataError>>&
     return lst;
 }
 
+inline py::list adapt_arrow_read_dfs(std::vector<std::variant<ArrowReadResult, DataError>>&& r) {
+    auto ret = std::move(r);
+    py::list lst;
+    for (auto &res: ret) {
+        util::variant_match(
+            res,
+            [&lst] (ArrowReadResult& read_result) {
+                auto pynorm = python_util::pb_to_python(read_result.norm_meta);
+                auto pyuser_meta = python_util::pb_to_python(read_result.user_meta);
+                lst.append(py::make_tuple(read_result.item, std::move(read_result.frame_data), pynorm, pyuser_meta));
+            },
+            [&lst] (DataError& data_error) {
+                lst.append(data_error);
+            }
+        );
+    }
+    return lst;
+}
+
 // aggregations is a dict similar to that accepted by Pandas agg method
 // The key-value pairs come in 2 forms:
 // 1: key is the column name to aggregate, value is the aggregation operator. Output column name will be the same as input column name
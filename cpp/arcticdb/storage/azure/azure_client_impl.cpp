@@ -75,6 +75,28 @@ Segment RealAzureClient::read_blob(
     return Segment::from_buffer(std::move(buffer));
 }
 
+std::shared_ptr<Buffer> RealAzureClient::read_blob_range(
+        const std::string& blob_name,
+        size_t offset,
+        std::optional<size_t> length,
+        unsigned int request_timeout) {
+
+    ARCTICDB_DEBUG(log::storage(), "Looking for {} bytes of blob {} at offset {}", length.value_or(0), blob_name, offset);
+    auto blob_client = container_client.GetBlockBlobClient(blob_name);
+    Azure::Core::Http::HttpRange range;
+    range.Offset = static_cast<int64_t>(offset);
+    if (length)
+        range.Length = static_cast<int64_t>(*length);
+
+    Azure::Storage::Blobs::DownloadBlobOptions download_option;
+    download_option.Range = range;
+    auto response = blob_client.Download(download_option, get_context(request_timeout));
+    const auto bytes = response.Value.BodyStream->ReadToEnd(get_context(request_timeout));
+    auto buffer = std::make_shared<Buffer>(bytes.size());
+    memcpy(buffer->data(), bytes.data(), bytes.size());
+    return buffer;
+}
+
 void RealAzureClient::delete_blobs(
         const std::vector<std::string>& blob_names,
         unsigned int request_timeout) {
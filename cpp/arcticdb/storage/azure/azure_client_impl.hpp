@@ -35,6 +35,12 @@ public:
             const Azure::Storage::Blobs::DownloadBlobToOptions& download_option,
             unsigned int request_timeout) override;
 
+    std::shared_ptr<Buffer> read_blob_range(
+            const std::string& blob_name,
+            size_t offset,
+            std::optional<size_t> length,
+            unsigned int request_timeout) override;
+
     void delete_blobs(
             const std::vector<std::string>& blob_names,
             unsigned int request_timeout) override;
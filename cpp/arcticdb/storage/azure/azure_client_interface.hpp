@@ -59,6 +59,13 @@ public:
             const Azure::Storage::Blobs::DownloadBlobToOptions& download_option,
             unsigned int request_timeout) = 0;
 
+    // Returns the raw bytes of the blob from offset, up to length bytes or to the end of the blob if length is not set
+    virtual std::shared_ptr<Buffer> read_blob_range(
+            const std::string& blob_name,
+            size_t offset,
+            std::optional<size_t> length,
+            unsigned int request_timeout) = 0;
+
     virtual void delete_blobs(
             const std::vector<std::string>& blob_names,
             unsigned int request_timeout) = 0;
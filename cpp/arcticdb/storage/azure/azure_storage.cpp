@@ -17,6 +17,7 @@
 #include <arcticdb/storage/storage_utils.hpp>
 #include <arcticdb/storage/object_store_utils.hpp>
 #include <arcticdb/storage/storage_options.hpp>
+#include <arcticdb/storage/column_range_reads.hpp>
 #include <arcticdb/entity/serialized_key.hpp>
 #include <arcticdb/util/configs_map.hpp>
 #include <arcticdb/storage/azure/azure_client_interface.hpp>
@@ -137,6 +138,23 @@ void do_update_impl(
     do_write_impl(key_seg, root_folder, azure_client, bucketizer, upload_option, request_timeout);
 }
 
+// Reads only the requested columns of the blob using ranged downloads, see column_range_reads.hpp
+Segment read_segment(
+    AzureClientWrapper& azure_client,
+    const std::string& blob_name,
+    const VariantKey& variant_key,
+    const ReadKeyOpts& opts,
+    const Azure::Storage::Blobs::DownloadBlobToOptions& download_option,
+    unsigned int request_timeout) {
+    if (use_column_range_reads(variant_key, opts)) {
+        auto get_range = [&azure_client, &blob_name, request_timeout] (size_t offset, std::optional<size_t> length) {
+            return azure_client.read_blob_range(blob_name, offset, length, request_timeout);
+        };
+        return read_segment_columns(get_range, *opts.columns_, ColumnRangeReadOptions::from_config());
+    }
+    return azure_client.read_blob(blob_name, download_option, request_timeout);
+}
+
 template<class KeyBucketizer>
 void do_read_impl(
     VariantKey&& variant_key,
@@ -153,7 +171,7 @@ void do_read_impl(
     auto key_type_dir = key_type_folder(root_folder, variant_key_type(variant_key));
     auto blob_name = object_path(bucketizer.bucketize(key_type_dir, variant_key), variant_key);
     try {
-        Segment segment = azure_client.read_blob(blob_name, download_option, request_timeout);
+        Segment segment = read_segment(azure_client, blob_name, variant_key, opts, download_option, request_timeout);
         visitor(variant_key, std::move(segment));
         ARCTICDB_DEBUG(log::storage(), "Read key {}: {}", variant_key_type(variant_key), variant_key_view(variant_key));
     }
@@ -187,7 +205,7 @@ KeySegmentPair do_read_impl(
     auto key_type_dir = key_type_folder(root_folder, variant_key_type(variant_key));
     auto blob_name = object_path(bucketizer.bucketize(key_type_dir, variant_key), variant_key);
     try {
-        return {VariantKey{variant_key}, azure_client.read_blob(blob_name, download_option, request_timeout)};
+        return {VariantKey{variant_key}, read_segment(azure_client, blob_name, variant_key, opts, download_option, request_timeout)};
         ARCTICDB_DEBUG(log::storage(), "Read key {}: {}", variant_key_type(variant_key), variant_key_view(variant_key));
     }
     catch (const Azure::Core::RequestFailedException& e) {
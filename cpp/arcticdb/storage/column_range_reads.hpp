@@ -0,0 +1,154 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#pragma once
+
+#include <arcticdb/codec/segment.hpp>
+#include <arcticdb/entity/key.hpp>
+#include <arcticdb/entity/variant_key.hpp>
+#include <arcticdb/storage/storage_options.hpp>
+#include <arcticdb/util/buffer.hpp>
+#include <arcticdb/util/configs_map.hpp>
+
+#include <algorithm>
+#include <optional>
+#include <string>
+#include <unordered_set>
+#include <vector>
+
+namespace arcticdb::storage {
+
+/*
+ * Object stores charge for, and take time over, every byte they return. When a read only needs a few of the columns
+ * of a wide symbol, the compressed size of every column recorded in the footer of a V2 segment lets us fetch just
+ * those columns with ranged reads, rather than the whole object:
+ *
+ * 1. The first ColumnRangeReadInitialBytes, which hold the header and usually the descriptors. Objects smaller than
+ *    this are read whole by this first request, so small segments cost no more than before.
+ * 2. The footer, which is read from its offset in the header to the end of the object.
+ * 3. Any of the descriptors not covered by the first request, then the requested columns and the string pool, where
+ *    ranges separated by fewer than ColumnRangeReadMaxGapBytes are merged into one request.
+ *
+ * The fetched bytes are copied to their offsets in a buffer the size of the object, so the segment decodes as usual.
+ * The bytes of the columns that were not fetched are never initialised, so the returned segment must only be decoded
+ * with the requested columns, and must never be written back to storage.
+ */
+struct ColumnRangeReadOptions {
+    size_t initial_bytes_ = 256 * 1024;
+    size_t max_gap_bytes_ = 64 * 1024;
+
+    static ColumnRangeReadOptions from_config() {
+        ColumnRangeReadOptions options;
+        options.initial_bytes_ = static_cast<size_t>(ConfigsMap::instance()->get_int("Storage.ColumnRangeReadInitialBytes", options.initial_bytes_));
+        options.max_gap_bytes_ = static_cast<size_t>(ConfigsMap::instance()->get_int("Storage.ColumnRangeReadMaxGapBytes", options.max_gap_bytes_));
+        return options;
+    }
+};
+
+inline bool use_column_range_reads(const VariantKey& variant_key, const ReadKeyOpts& opts) {
+    return opts.columns_ &&
+        variant_key_type(variant_key) == KeyType::TABLE_DATA &&
+        ConfigsMap::instance()->get_int("Storage.ColumnRangeReads", 0) == 1;
+}
+
+// Sorts the ranges and merges those that overlap or are separated by at most max_gap_bytes
+inline std::vector<SegmentByteRange> coalesce_byte_ranges(std::vector<SegmentByteRange>&& ranges, size_t max_gap_bytes) {
+    std::sort(std::begin(ranges), std::end(ranges), [] (const auto& left, const auto& right) {
+        return left.offset_ < right.offset_;
+    });
+    std::vector<SegmentByteRange> output;
+    for(const auto& range : ranges) {
+        if(range.length_ == 0)
+            continue;
+
+        if(!output.empty() && range.offset_ <= output.back().end() + max_gap_bytes)
+            output.back().length_ = std::max(output.back().end(), range.end()) - output.back().offset_;
+        else
+            output.emplace_back(range);
+    }
+    return output;
+}
+
+// The ranges of the index columns and the requested columns, and of the string pool, within the serialized segment
+inline std::vector<SegmentByteRange> requested_byte_ranges(
+        const SegmentColumnLayout& layout,
+        const StreamDescriptor& desc,
+        const std::unordered_set<std::string>& columns) {
+    util::check(layout.columns_.size() == desc.field_count(),
+                "Mismatch between {} encoded fields and {} descriptor fields", layout.columns_.size(), desc.field_count());
+    std::vector<SegmentByteRange> ranges;
+    for(size_t i = 0; i < desc.field_count(); ++i) {
+        if(i < desc.index().field_count() || columns.contains(std::string{desc.field(i).name()}))
+            ranges.emplace_back(layout.columns_[i]);
+    }
+    ranges.emplace_back(layout.string_pool_);
+    return ranges;
+}
+
+/*
+ * get_range(offset, length) returns a std::shared_ptr<Buffer> holding the bytes of the object starting at offset, up
+ * to length bytes, or to the end of the object if length is std::nullopt. It should throw if the object is missing.
+ */
+template<typename GetRange>
+Segment read_segment_columns(
+        const GetRange& get_range,
+        const std::unordered_set<std::string>& columns,
+        const ColumnRangeReadOptions& options) {
+    std::shared_ptr<Buffer> head = get_range(size_t{0}, std::make_optional(options.initial_bytes_));
+    if(head->bytes() < options.initial_bytes_)
+        return Segment::from_buffer(head);
+
+    util::check(head->bytes() >= FIXED_HEADER_SIZE, "Expected at least {} bytes of header, got {}", FIXED_HEADER_SIZE, head->bytes());
+    auto append_range = [&get_range, &head] (std::optional<size_t> length) {
+        auto tail = get_range(head->bytes(), length);
+        const auto head_bytes = head->bytes();
+        head->ensure(head_bytes + tail->bytes());
+        memcpy(head->data() + head_bytes, tail->data(), tail->bytes());
+    };
+
+    if(const auto header_bytes = serialized_header_bytes(head->data()); head->bytes() < header_bytes)
+        append_range(header_bytes - head->bytes());
+
+    const auto footer_offset = serialized_footer_offset(head->data());
+    if(!footer_offset) {
+        // Nothing to gain from ranged reads, so read the remainder of the object
+        append_range(std::nullopt);
+        return Segment::from_buffer(head);
+    }
+
+    auto footer = get_range(*footer_offset, std::nullopt);
+    const auto layout = serialized_column_layout(head->data(), footer->data());
+    const auto total_bytes = *footer_offset + footer->bytes();
+    if(head->bytes() < layout.preamble_.end())
+        append_range(layout.preamble_.end() - head->bytes());
+
+    auto buffer = std::make_shared<Buffer>(total_bytes);
+    const auto known_bytes = std::min(head->bytes(), total_bytes);
+    memcpy(buffer->data(), head->data(), known_bytes);
+    memcpy(buffer->data() + *footer_offset, footer->data(), footer->bytes());
+
+    // Only decodes the header and descriptors, which have all been fetched
+    const auto desc = Segment::from_bytes(buffer->data(), total_bytes).descriptor().clone();
+    auto ranges = requested_byte_ranges(layout, desc, columns);
+    for(auto& range : ranges) {
+        // The first request may already have covered some of the ranges
+        if(range.offset_ < known_bytes) {
+            const auto covered = std::min(range.length_, known_bytes - range.offset_);
+            range.offset_ += covered;
+            range.length_ -= covered;
+        }
+    }
+    for(const auto& range : coalesce_byte_ranges(std::move(ranges), options.max_gap_bytes_)) {
+        auto bytes = get_range(range.offset_, std::make_optional(range.length_));
+        util::check(bytes->bytes() == range.length_, "Expected {} bytes at offset {}, got {}", range.length_, range.offset_, bytes->bytes());
+        memcpy(buffer->data() + range.offset_, bytes->data(), range.length_);
+    }
+    ARCTICDB_DEBUG(log::storage(), "Read {} columns from segment of {} bytes using ranged reads", columns.size(), total_bytes);
+    return Segment::from_buffer(buffer);
+}
+
+} // namespace arcticdb::storage
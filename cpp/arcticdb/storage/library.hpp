@@ -195,6 +195,10 @@ class Library {
        StorageFailureSimulator::instance()->configure(cfg);
     }
 
+    [[nodiscard]] std::optional<LRUCacheStats> local_cache_stats() const {
+        return storages_->local_cache_stats();
+    }
+
     std::string name() {
         auto lib_name = storages_->name();
         return lib_name;
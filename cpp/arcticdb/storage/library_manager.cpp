@@ -218,7 +218,8 @@ std::shared_ptr<Library> LibraryManager::get_library(const LibraryPath& path,
     }
 
     arcticdb::proto::storage::LibraryConfig config = get_config_internal(path, {storage_override});
-    auto storages = create_storages(path, OpenMode::DELETE, config.storage_by_id(), native_storage_config);
+    auto storages = create_storages(path, OpenMode::DELETE, config.storage_by_id(), native_storage_config,
+                                    storage_override.local_cache());
     auto lib = std::make_shared<Library>(path, std::move(storages), config.lib_desc().version());
     open_libraries_.put(path, lib);
 
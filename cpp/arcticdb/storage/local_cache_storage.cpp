@@ -0,0 +1,352 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <arcticdb/storage/local_cache_storage.hpp>
+#include <arcticdb/util/buffer.hpp>
+#include <arcticdb/log/log.hpp>
+
+#include <folly/hash/Hash.h>
+
+#include <algorithm>
+#include <chrono>
+#include <fstream>
+#include <mutex>
+#include <random>
+#include <unordered_map>
+#include <vector>
+
+namespace arcticdb::storage {
+
+namespace {
+
+constexpr std::string_view CACHE_FILE_EXTENSION = ".seg";
+constexpr std::string_view TEMP_FILE_EXTENSION = ".tmp";
+// Temporary files are renamed into place as soon as they have been written, so one this old was left behind by a
+// process that exited while writing it, rather than being written by another process sharing the directory
+constexpr auto STALE_TEMP_FILE_AGE = std::chrono::hours(1);
+
+std::string cache_file_stem(const std::string& cache_key) {
+    return fmt::format("{:016x}", folly::hash::fnv64(cache_key));
+}
+
+uint64_t random_suffix() {
+    thread_local std::mt19937_64 generator{std::random_device{}()};
+    return generator();
+}
+
+} // namespace
+
+class LocalDiskCache::CachedFile {
+    std::filesystem::path path_;
+    std::shared_ptr<std::atomic<bool>> retain_;
+
+public:
+    CachedFile(std::filesystem::path path, std::shared_ptr<std::atomic<bool>> retain) :
+        path_(std::move(path)),
+        retain_(std::move(retain)) {
+    }
+
+    ARCTICDB_NO_MOVE_OR_COPY(CachedFile)
+
+    // Called once the file has been evicted or removed from the cache, and no reader still holds it
+    ~CachedFile() {
+        if(*retain_)
+            return;
+
+        std::error_code ec;
+        std::filesystem::remove(path_, ec);
+        if(ec)
+            log::storage().warn("Failed to delete local cache file {}: {}", path_.string(), ec.message());
+    }
+
+    [[nodiscard]] const std::filesystem::path& path() const {
+        return path_;
+    }
+};
+
+std::shared_ptr<LocalDiskCache> LocalDiskCache::open(const std::string& path, size_t capacity_bytes) {
+    static std::mutex mutex;
+    static std::unordered_map<std::string, std::weak_ptr<LocalDiskCache>> open_caches;
+
+    const auto canonical_path = std::filesystem::weakly_canonical(std::filesystem::path{path}).string();
+    std::lock_guard lock{mutex};
+    if(auto cache = open_caches[canonical_path].lock(); cache) {
+        if(cache->index_.capacity_bytes() != capacity_bytes)
+            log::storage().warn("Local cache {} is already open with a capacity of {} bytes, ignoring capacity of {} bytes",
+                                canonical_path, cache->index_.capacity_bytes(), capacity_bytes);
+        return cache;
+    }
+
+    auto cache = std::make_shared<LocalDiskCache>(canonical_path, capacity_bytes);
+    open_caches[canonical_path] = cache;
+    return cache;
+}
+
+LocalDiskCache::LocalDiskCache(std::filesystem::path path, size_t capacity_bytes) :
+    path_(std::move(path)),
+    retain_files_(std::make_shared<std::atomic<bool>>(false)),
+    index_(capacity_bytes) {
+    std::filesystem::create_directories(path_);
+    index_existing_files();
+}
+
+LocalDiskCache::~LocalDiskCache() {
+    *retain_files_ = true;
+    index_.clear();
+}
+
+void LocalDiskCache::index_existing_files() {
+    struct ExistingFile {
+        std::filesystem::path path_;
+        std::filesystem::file_time_type last_write_time_;
+        size_t bytes_;
+    };
+    std::vector<ExistingFile> files;
+    size_t stale_temp_files = 0;
+    const auto now = std::filesystem::file_time_type::clock::now();
+    for(const auto& entry : std::filesystem::directory_iterator{path_}) {
+        std::error_code ec;
+        if(!entry.is_regular_file(ec))
+            continue;
+
+        if(entry.path().extension() == TEMP_FILE_EXTENSION) {
+            const auto last_write_time = entry.last_write_time(ec);
+            if(!ec && now - last_write_time > STALE_TEMP_FILE_AGE && std::filesystem::remove(entry.path(), ec))
+                ++stale_temp_files;
+            continue;
+        }
+
+        if(entry.path().extension() != CACHE_FILE_EXTENSION)
+            continue;
+
+        const auto bytes = entry.file_size(ec);
+        const auto last_write_time = entry.last_write_time(ec);
+        if(!ec)
+            files.emplace_back(ExistingFile{entry.path(), last_write_time, bytes});
+    }
+
+    // Index the most recently written files last, so that they are the last to be evicted
+    std::sort(std::begin(files), std::end(files), [] (const auto& left, const auto& right) {
+        return left.last_write_time_ < right.last_write_time_;
+    });
+    for(auto& file : files) {
+        const auto filename = file.path_.stem().string();
+        const auto stem = filename.substr(0, filename.find('-'));
+        auto cached_file = std::make_shared<CachedFile>(std::move(file.path_), retain_files_);
+        index_.put(stem, std::move(cached_file), file.bytes_);
+    }
+    ARCTICDB_DEBUG(log::storage(), "Indexed {} existing files in local cache {}, removing {} stale temporary files",
+                   files.size(), path_.string(), stale_temp_files);
+}
+
+std::optional<Segment> LocalDiskCache::get(const std::string& cache_key) {
+    const auto stem = cache_file_stem(cache_key);
+    auto cached_file = index_.get(stem);
+    if(!cached_file)
+        return std::nullopt;
+
+    const auto& path = (*cached_file)->path();
+    std::ifstream file{path, std::ios::binary};
+    std::error_code ec;
+    const auto file_bytes = std::filesystem::file_size(path, ec);
+    uint32_t key_bytes = 0;
+    if(!ec && file)
+        file.read(reinterpret_cast<char*>(&key_bytes), sizeof(key_bytes));
+
+    if(ec || !file || file_bytes < sizeof(key_bytes) + key_bytes) {
+        // Another process sharing the directory may have evicted the file
+        ARCTICDB_DEBUG(log::storage(), "Local cache file {} could not be read", path.string());
+        index_.remove(stem);
+        return std::nullopt;
+    }
+
+    std::string stored_key(key_bytes, '\0');
+    file.read(stored_key.data(), key_bytes);
+    if(!file || stored_key != cache_key) {
+        ARCTICDB_DEBUG(log::storage(), "Local cache file {} does not hold key {}", path.string(), cache_key);
+        return std::nullopt;
+    }
+
+    const auto segment_bytes = file_bytes - sizeof(key_bytes) - key_bytes;
+    auto buffer = std::make_shared<Buffer>(segment_bytes);
+    file.read(reinterpret_cast<char*>(buffer->data()), static_cast<std::streamsize>(segment_bytes));
+    if(!file) {
+        index_.remove(stem);
+        return std::nullopt;
+    }
+    return Segment::from_buffer(buffer);
+}
+
+void LocalDiskCache::put(const std::string& cache_key, Segment& segment) {
+    const auto segment_bytes = segment.calculate_size();
+    Buffer buffer{segment_bytes};
+    segment.write_to(buffer.data());
+
+    // Every file has a unique name, so a file that is replaced by a concurrent put of the same key can be deleted
+    // without deleting its replacement
+    const auto stem = cache_file_stem(cache_key);
+    const auto path = path_ / fmt::format("{}-{:016x}{}", stem, random_suffix(), CACHE_FILE_EXTENSION);
+    auto temp_path = path;
+    temp_path += TEMP_FILE_EXTENSION;
+    {
+        std::ofstream file{temp_path, std::ios::binary | std::ios::trunc};
+        const auto key_bytes = static_cast<uint32_t>(cache_key.size());
+        file.write(reinterpret_cast<const char*>(&key_bytes), sizeof(key_bytes));
+        file.write(cache_key.data(), key_bytes);
+        file.write(reinterpret_cast<const char*>(buffer.data()), static_cast<std::streamsize>(segment_bytes));
+        if(!file) {
+            log::storage().warn("Failed to write local cache file {}", temp_path.string());
+            std::error_code ec;
+            std::filesystem::remove(temp_path, ec);
+            return;
+        }
+    }
+
+    std::error_code ec;
+    std::filesystem::rename(temp_path, path, ec);
+    if(ec) {
+        log::storage().warn("Failed to move local cache file into place at {}: {}", path.string(), ec.message());
+        std::filesystem::remove(temp_path, ec);
+        return;
+    }
+
+    const auto file_bytes = sizeof(uint32_t) + cache_key.size() + segment_bytes;
+    // If the file is too large to cache the index does not keep it, which deletes it
+    index_.put(stem, std::make_shared<CachedFile>(path, retain_files_), file_bytes);
+}
+
+void LocalDiskCache::remove(const std::string& cache_key) {
+    index_.remove(cache_file_stem(cache_key));
+}
+
+LocalCacheStorage::LocalCacheStorage(std::shared_ptr<Storage> primary, const LocalCacheOverride& local_cache) :
+    LocalCacheStorage(primary, LocalDiskCache::open(local_cache.path(), local_cache.max_bytes())) {
+}
+
+LocalCacheStorage::LocalCacheStorage(std::shared_ptr<Storage> primary, std::shared_ptr<LocalDiskCache> cache) :
+    Storage(primary->library_path(), primary->open_mode()),
+    primary_(std::move(primary)),
+    cache_(std::move(cache)) {
+    ARCTICDB_DEBUG(log::storage(), "Caching reads from {} in {}", primary_->name(), cache_->path().string());
+}
+
+bool LocalCacheStorage::caches(const VariantKey& key) {
+    switch(variant_key_type(key)) {
+        case KeyType::TABLE_DATA:
+        case KeyType::TABLE_INDEX:
+        case KeyType::TABLE_INDEX_PAGE:
+        case KeyType::VERSION:
+            return std::holds_alternative<AtomKey>(key);
+        default:
+            return false;
+    }
+}
+
+std::string LocalCacheStorage::name() const {
+    return primary_->name();
+}
+
+std::string LocalCacheStorage::cache_key(const VariantKey& key) const {
+    return fmt::format("{}/{}", primary_->name(), to_atom(key));
+}
+
+std::optional<KeySegmentPair> LocalCacheStorage::read_from_cache(const VariantKey& variant_key) {
+    if(!caches(variant_key))
+        return std::nullopt;
+
+    auto segment = cache_->get(cache_key(variant_key));
+    if(!segment)
+        return std::nullopt;
+
+    ARCTICDB_DEBUG(log::storage(), "Local cache hit for key {}", variant_key_view(variant_key));
+    return KeySegmentPair{VariantKey{variant_key}, std::move(*segment)};
+}
+
+KeySegmentPair LocalCacheStorage::cache_segment(KeySegmentPair&& key_seg) {
+    if(caches(key_seg.variant_key())) {
+        try {
+            cache_->put(cache_key(key_seg.variant_key()), *key_seg.segment_ptr());
+        } catch(const std::exception& e) {
+            // The local cache is an optimisation, so failing to populate it must not fail the read
+            log::storage().warn("Failed to cache key {} locally: {}", key_seg.key_view(), e.what());
+        }
+    }
+    return std::move(key_seg);
+}
+
+void LocalCacheStorage::remove_from_cache(const VariantKey& variant_key) {
+    if(caches(variant_key))
+        cache_->remove(cache_key(variant_key));
+}
+
+void LocalCacheStorage::do_write(KeySegmentPair& key_seg) {
+    primary_->write(key_seg);
+}
+
+void LocalCacheStorage::do_write_if_none(KeySegmentPair& kv) {
+    primary_->write_if_none(kv);
+}
+
+void LocalCacheStorage::do_update(KeySegmentPair& key_seg, UpdateOpts opts) {
+    remove_from_cache(key_seg.variant_key());
+    primary_->update(key_seg, opts);
+}
+
+void LocalCacheStorage::do_read(VariantKey&& variant_key, const ReadVisitor& visitor, ReadKeyOpts opts) {
+    auto key_seg = do_read(std::move(variant_key), opts);
+    visitor(key_seg.variant_key(), std::move(*key_seg.segment_ptr()));
+}
+
+KeySegmentPair LocalCacheStorage::do_read(VariantKey&& variant_key, ReadKeyOpts opts) {
+    if(!caches(variant_key))
+        return primary_->read(std::move(variant_key), opts);
+
+    if(auto cached = read_from_cache(variant_key); cached)
+        return std::move(*cached);
+
+    // Only whole segments are cached, so never read just some of the columns
+    opts.columns_.reset();
+    return cache_segment(primary_->read(std::move(variant_key), opts));
+}
+
+folly::Future<folly::Unit> LocalCacheStorage::do_async_read(VariantKey&& variant_key, const ReadVisitor& visitor, ReadKeyOpts opts) {
+    return do_async_read(std::move(variant_key), opts).thenValue([&visitor] (auto&& key_seg) {
+        visitor(key_seg.variant_key(), std::move(*key_seg.segment_ptr()));
+        return folly::Unit{};
+    });
+}
+
+folly::Future<KeySegmentPair> LocalCacheStorage::do_async_read(VariantKey&& variant_key, ReadKeyOpts opts) {
+    if(!caches(variant_key))
+        return primary_->async_api()->async_read(std::move(variant_key), opts);
+
+    if(auto cached = read_from_cache(variant_key); cached)
+        return folly::makeFuture(std::move(*cached));
+
+    opts.columns_.reset();
+    return primary_->async_api()->async_read(std::move(variant_key), opts).thenValue([this] (auto&& key_seg) {
+        return cache_segment(std::move(key_seg));
+    });
+}
+
+void LocalCacheStorage::do_remove(VariantKey&& variant_key, RemoveOpts opts) {
+    remove_from_cache(variant_key);
+    primary_->remove(std::move(variant_key), opts);
+}
+
+void LocalCacheStorage::do_remove(std::span<VariantKey> variant_keys, RemoveOpts opts) {
+    for(const auto& variant_key : variant_keys)
+        remove_from_cache(variant_key);
+
+    primary_->remove(variant_keys, opts);
+}
+
+bool LocalCacheStorage::do_key_exists(const VariantKey& key) {
+    return primary_->key_exists(key);
+}
+
+} // namespace arcticdb::storage
@@ -0,0 +1,173 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#pragma once
+
+#include <arcticdb/storage/storage.hpp>
+#include <arcticdb/storage/storage_override.hpp>
+#include <arcticdb/util/lru_cache.hpp>
+
+#include <atomic>
+#include <filesystem>
+#include <memory>
+#include <optional>
+#include <string>
+
+namespace arcticdb::storage {
+
+/*
+ * A directory of segments on local disk, bounded by the total size of the files in it. Each segment is written to its
+ * own file, named with a hash of its cache key and a random suffix, and prefixed with the full cache key so that hash
+ * collisions are detected when it is read back. Files are written to a temporary name and renamed into place, so a
+ * partially written file is never read. Temporary files left behind by a process that exited while writing them are
+ * deleted when the directory is opened.
+ *
+ * The files in the directory are indexed when it is opened, so the cache survives restarts of the process, and the
+ * least recently used files are deleted once the total size would exceed the capacity. Each directory is opened once
+ * per process and shared by every library using it. Several processes can share a directory, but each bounds the
+ * size of the files it knows about, so the directory can grow beyond the capacity of any one of them.
+ */
+class LocalDiskCache {
+    class CachedFile;
+
+    std::filesystem::path path_;
+    // Set when the cache is destroyed, so that the files it indexes are kept for the next process
+    std::shared_ptr<std::atomic<bool>> retain_files_;
+    SizeBoundedLRUCache<std::string, std::shared_ptr<CachedFile>> index_;
+
+    void index_existing_files();
+
+public:
+    // Returns the cache already open for this directory in this process, or opens it
+    static std::shared_ptr<LocalDiskCache> open(const std::string& path, size_t capacity_bytes);
+
+    LocalDiskCache(std::filesystem::path path, size_t capacity_bytes);
+
+    ~LocalDiskCache();
+
+    ARCTICDB_NO_MOVE_OR_COPY(LocalDiskCache)
+
+    [[nodiscard]] std::optional<Segment> get(const std::string& cache_key);
+
+    void put(const std::string& cache_key, Segment& segment);
+
+    void remove(const std::string& cache_key);
+
+    [[nodiscard]] const std::filesystem::path& path() const {
+        return path_;
+    }
+
+    [[nodiscard]] LRUCacheStats stats() const {
+        return index_.stats();
+    }
+};
+
+/*
+ * Decorates a remote storage, such as S3, Azure or Mongo, with a LocalDiskCache. Reads of the key types that are
+ * never rewritten once written (data, index and version keys) are served from local disk when possible, and are
+ * written to local disk when not. Everything else, including all ref keys, goes straight to the primary storage, so
+ * the latest version of each symbol is always read from the primary and consistency is unchanged.
+ *
+ * Segments are always read whole from the primary when they are cached, so reads of a subset of the columns of a
+ * cached key type do not use ranged requests, see Storage.ColumnRangeReads.
+ */
+class LocalCacheStorage final : public Storage, AsyncStorage {
+    std::shared_ptr<Storage> primary_;
+    std::shared_ptr<LocalDiskCache> cache_;
+
+    [[nodiscard]] std::string cache_key(const VariantKey& key) const;
+
+    std::optional<KeySegmentPair> read_from_cache(const VariantKey& variant_key);
+
+    KeySegmentPair cache_segment(KeySegmentPair&& key_seg);
+
+    void remove_from_cache(const VariantKey& variant_key);
+
+public:
+    LocalCacheStorage(std::shared_ptr<Storage> primary, const LocalCacheOverride& local_cache);
+
+    LocalCacheStorage(std::shared_ptr<Storage> primary, std::shared_ptr<LocalDiskCache> cache);
+
+    [[nodiscard]] static bool caches(const VariantKey& key);
+
+    [[nodiscard]] std::string name() const final;
+
+    [[nodiscard]] bool has_async_api() const final {
+        return primary_->has_async_api();
+    }
+
+    AsyncStorage* async_api() final {
+        return this;
+    }
+
+    void cleanup() final {
+        primary_->cleanup();
+    }
+
+    [[nodiscard]] bool supports_object_size_calculation() const final {
+        return primary_->supports_object_size_calculation();
+    }
+
+    [[nodiscard]] LRUCacheStats cache_stats() const {
+        return cache_->stats();
+    }
+
+    [[nodiscard]] const Storage& primary() const {
+        return *primary_;
+    }
+
+private:
+    void do_write(KeySegmentPair& key_seg) final;
+
+    void do_write_if_none(KeySegmentPair& kv) final;
+
+    void do_update(KeySegmentPair& key_seg, UpdateOpts opts) final;
+
+    void do_read(VariantKey&& variant_key, const ReadVisitor& visitor, ReadKeyOpts opts) final;
+
+    KeySegmentPair do_read(VariantKey&& variant_key, ReadKeyOpts opts) final;
+
+    folly::Future<folly::Unit> do_async_read(VariantKey&& variant_key, const ReadVisitor& visitor, ReadKeyOpts opts) final;
+
+    folly::Future<KeySegmentPair> do_async_read(VariantKey&& variant_key, ReadKeyOpts opts) final;
+
+    void do_remove(VariantKey&& variant_key, RemoveOpts opts) final;
+
+    void do_remove(std::span<VariantKey> variant_keys, RemoveOpts opts) final;
+
+    bool do_key_exists(const VariantKey& key) final;
+
+    bool do_supports_prefix_matching() const final {
+        return primary_->supports_prefix_matching();
+    }
+
+    SupportsAtomicWrites do_supports_atomic_writes() const final {
+        return primary_->supports_atomic_writes() ? SupportsAtomicWrites::YES : SupportsAtomicWrites::NO;
+    }
+
+    bool do_fast_delete() final {
+        return primary_->fast_delete();
+    }
+
+    bool do_iterate_type_until_match(KeyType key_type, const IterateTypePredicate& visitor, const std::string& prefix) final {
+        return primary_->scan_for_matching_key(key_type, visitor, prefix);
+    }
+
+    ObjectSizes do_get_object_sizes(KeyType key_type, const std::string& prefix) final {
+        return primary_->get_object_sizes(key_type, prefix);
+    }
+
+    [[nodiscard]] std::string do_key_path(const VariantKey& key) const final {
+        return primary_->key_path(key);
+    }
+
+    [[nodiscard]] bool do_is_path_valid(std::string_view path) const final {
+        return primary_->is_path_valid(path);
+    }
+};
+
+} // namespace arcticdb::storage
@@ -86,6 +86,34 @@ Segment MockAzureClient::read_blob(
     return std::move(pos->second);
 }
 
+std::shared_ptr<Buffer> MockAzureClient::read_blob_range(
+        const std::string& blob_name,
+        size_t offset,
+        std::optional<size_t> length,
+        unsigned int) {
+
+    auto maybe_exception = has_failure_trigger(blob_name, StorageOperation::READ);
+    if (maybe_exception.has_value()) {
+        throw *maybe_exception;
+    }
+
+    auto pos = azure_contents.find(blob_name);
+    if (pos == azure_contents.end()) {
+        auto error_code = AzureErrorCode_to_string(AzureErrorCode::BlobNotFound);
+        std::string message = fmt::format("Simulated Error, message: Read failed {} {}", error_code, static_cast<int>(Azure::Core::Http::HttpStatusCode::NotFound));
+        throw get_exception(message, error_code, Azure::Core::Http::HttpStatusCode::NotFound);
+    }
+
+    auto segment = pos->second.clone();
+    std::vector<uint8_t> bytes(segment.calculate_size());
+    segment.write_to(bytes.data());
+    const auto begin = std::min(offset, bytes.size());
+    const auto end = length ? std::min(begin + *length, bytes.size()) : bytes.size();
+    auto buffer = std::make_shared<Buffer>(end - begin);
+    memcpy(buffer->data(), bytes.data() + begin, end - begin);
+    return buffer;
+}
+
 void MockAzureClient::delete_blobs(
         const std::vector<std::string>& blob_names,
         unsigned int) {
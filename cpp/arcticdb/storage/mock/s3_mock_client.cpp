@@ -91,6 +91,26 @@ S3Result<Segment> MockS3Client::get_object(
     return {pos->second.value().clone()};
 }
 
+S3Result<std::shared_ptr<Buffer>> MockS3Client::get_object_range(
+        const std::string &s3_object_name,
+        const std::string &bucket_name,
+        size_t offset,
+        std::optional<size_t> length) const {
+    auto result = get_object(s3_object_name, bucket_name);
+    if (!result.is_success()) {
+        return {result.get_error()};
+    }
+
+    auto& segment = result.get_output();
+    std::vector<uint8_t> bytes(segment.calculate_size());
+    segment.write_to(bytes.data());
+    const auto begin = std::min(offset, bytes.size());
+    const auto end = length ? std::min(begin + *length, bytes.size()) : bytes.size();
+    auto buffer = std::make_shared<Buffer>(end - begin);
+    memcpy(buffer->data(), bytes.data() + begin, end - begin);
+    return {std::move(buffer)};
+}
+
 folly::Future<S3Result<Segment>> MockS3Client::get_object_async(
     const std::string &s3_object_name,
     const std::string &bucket_name) const {
@@ -183,7 +203,8 @@ constexpr auto page_size = 10;
 S3Result<ListObjectsOutput> MockS3Client::list_objects(
         const std::string& name_prefix,
         const std::string& bucket_name,
-        const std::optional<std::string>& continuation_token) const {
+        const std::optional<std::string>& continuation_token,
+        const std::optional<std::string>& start_after) const {
     std::scoped_lock<std::mutex> lock(mutex_);
 
     ListObjectsOutput output;
@@ -193,6 +214,8 @@ S3Result<ListObjectsOutput> MockS3Client::list_objects(
         // s3_contents map in between list_objects calls we won't return duplicate entries.
         it = s3_contents_.find({bucket_name, continuation_token.value()});
         util::check(it != s3_contents_.end(), "Invalid mock continuation_token");
+    } else if (start_after.has_value()) {
+        it = s3_contents_.upper_bound({bucket_name, start_after.value()});
     }
     for (auto i=0u; it != s3_contents_.end() && i<page_size; ++it, ++i) {
         if (it->first.bucket_name == bucket_name && it->first.s3_object_name.rfind(name_prefix, 0) == 0 && it->second.has_value()){
@@ -135,6 +135,7 @@ void register_bindings(py::module& storage, py::exception<arcticdb::ArcticExcept
         .value("SNAPSHOT_TOMBSTONE", KeyType::SNAPSHOT_TOMBSTONE)
         .value("LOG_COMPACTED", KeyType::LOG_COMPACTED)
         .value("COLUMN_STATS", KeyType::COLUMN_STATS)
+        .value("TABLE_INDEX_PAGE", KeyType::TABLE_INDEX_PAGE)
         ;
 
     py::enum_<OpenMode>(storage, "OpenMode")
@@ -283,6 +284,7 @@ void register_bindings(py::module& storage, py::exception<arcticdb::ArcticExcept
                                             return none.cast<py::object>();
                                        });
         })
+        .def("local_cache_stats", &Library::local_cache_stats)
         ;
 
     py::class_<S3Override>(storage, "S3Override")
@@ -314,12 +316,18 @@ void register_bindings(py::module& storage, py::exception<arcticdb::ArcticExcept
             .def_property("path", &LmdbOverride::path, &LmdbOverride::set_path)
             .def_property("map_size", &LmdbOverride::map_size, &LmdbOverride::set_map_size);
 
+    py::class_<LocalCacheOverride>(storage, "LocalCacheOverride")
+            .def(py::init<>())
+            .def_property("path", &LocalCacheOverride::path, &LocalCacheOverride::set_path)
+            .def_property("max_bytes", &LocalCacheOverride::max_bytes, &LocalCacheOverride::set_max_bytes);
+
     py::class_<StorageOverride>(storage, "StorageOverride")
         .def(py::init<>())
         .def("set_s3_override", &StorageOverride::set_s3_override)
         .def("set_azure_override", &StorageOverride::set_azure_override)
         .def("set_lmdb_override", &StorageOverride::set_lmdb_override)
-        .def("set_gcpxml_override", &StorageOverride::set_gcpxml_override);
+        .def("set_gcpxml_override", &StorageOverride::set_gcpxml_override)
+        .def("set_local_cache_override", &StorageOverride::set_local_cache_override);
 
     py::class_<LibraryManager, std::shared_ptr<LibraryManager>>(storage, "LibraryManager")
         .def(py::init<std::shared_ptr<storage::Library>>())
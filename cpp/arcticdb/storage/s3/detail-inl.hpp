@@ -9,6 +9,7 @@
 #include <google/protobuf/io/zero_copy_stream_impl_lite.h>
 #include <folly/gen/Base.h>
 #include <arcticdb/storage/object_store_utils.hpp>
+#include <arcticdb/storage/column_range_reads.hpp>
 #include <arcticdb/storage/storage_options.hpp>
 #include <arcticdb/storage/storage_utils.hpp>
 #include <arcticdb/storage/storage_exceptions.hpp>
@@ -17,6 +18,8 @@
 #include <arcticdb/util/exponential_backoff.hpp>
 #include <arcticdb/util/configs_map.hpp>
 #include <arcticdb/util/composite.hpp>
+#include <arcticdb/util/constructors.hpp>
+#include <arcticdb/async/task_scheduler.hpp>
 
 #include <aws/s3/model/GetObjectRequest.h>
 #include <aws/s3/model/PutObjectRequest.h>
@@ -31,6 +34,10 @@
 
 #include <boost/interprocess/streams/bufferstream.hpp>
 
+#include <atomic>
+#include <condition_variable>
+#include <mutex>
+
 #undef GetMessage
 
 namespace arcticdb::storage {
@@ -160,6 +167,31 @@ void do_update_impl(
     do_write_impl(key_seg, root_folder, bucket_name, s3_client, std::forward<KeyBucketizer>(bucketizer));
 }
 
+// Reads only the requested columns of the object using ranged GETs, see column_range_reads.hpp
+inline S3Result<Segment> get_object_columns(
+        const S3ClientInterface& s3_client,
+        const std::string& s3_object_name,
+        const std::string& bucket_name,
+        const std::unordered_set<std::string>& columns) {
+    struct RangeReadFailed {
+        Aws::S3::S3Error error_;
+    };
+
+    auto get_range = [&s3_client, &s3_object_name, &bucket_name] (size_t offset, std::optional<size_t> length) {
+        auto result = s3_client.get_object_range(s3_object_name, bucket_name, offset, length);
+        if (!result.is_success())
+            throw RangeReadFailed{result.get_error()};
+
+        return result.get_output();
+    };
+
+    try {
+        return {read_segment_columns(get_range, columns, ColumnRangeReadOptions::from_config())};
+    } catch (const RangeReadFailed& failure) {
+        return {failure.error_};
+    }
+}
+
 template<class KeyBucketizer, class KeyDecoder>
 KeySegmentPair do_read_impl(
         VariantKey&& variant_key,
@@ -172,7 +204,9 @@ KeySegmentPair do_read_impl(
     ARCTICDB_SAMPLE(S3StorageRead, 0)
     auto key_type_dir = key_type_folder(root_folder, variant_key_type(variant_key));
     auto s3_object_name = object_path(bucketizer.bucketize(key_type_dir, variant_key), variant_key);
-    auto get_object_result = s3_client.get_object(s3_object_name, bucket_name);
+    auto get_object_result = use_column_range_reads(variant_key, opts) ?
+        get_object_columns(s3_client, s3_object_name, bucket_name, *opts.columns_) :
+        s3_client.get_object(s3_object_name, bucket_name);
     auto unencoded_key = key_decoder(std::move(variant_key));
 
     if (get_object_result.is_success()) {
@@ -255,6 +289,85 @@ inline void raise_if_failed_deletes(const boost::container::small_vector<FailedD
     }
 }
 
+inline size_t max_parallel_requests() {
+    return static_cast<size_t>(ConfigsMap::instance()->get_int("S3Storage.MaxParallelRequests",
+                                                              async::TaskScheduler::instance()->io_thread_count()));
+}
+
+/*
+ * Runs task(i) for every i in [0, count), on the calling thread and on up to parallelism - 1 threads of the IO pool.
+ * The calling thread takes tasks as well, and only waits for the tasks that other threads have already started, so
+ * this cannot deadlock when called from an IO thread while the rest of the pool is busy. Once a task has thrown no
+ * more tasks are started, and the first exception is rethrown when the running tasks have finished.
+ */
+inline void run_on_io_threads(size_t count, size_t parallelism, std::function<void(size_t)>&& task) {
+    if (count <= 1 || parallelism <= 1) {
+        for (auto i = 0u; i < count; ++i)
+            task(i);
+        return;
+    }
+
+    struct State {
+        State(size_t count, std::function<void(size_t)>&& task) :
+            count_(count), task_(std::move(task)) {}
+
+        std::optional<size_t> claim() {
+            std::lock_guard lock{mutex_};
+            if (exception_ || next_ == count_)
+                return std::nullopt;
+
+            ++started_;
+            return next_++;
+        }
+
+        void finish(std::exception_ptr exception) {
+            std::lock_guard lock{mutex_};
+            ++finished_;
+            if (exception && !exception_)
+                exception_ = std::move(exception);
+
+            cv_.notify_all();
+        }
+
+        void run() {
+            while (auto i = claim()) {
+                try {
+                    task_(*i);
+                    finish(nullptr);
+                } catch (...) {
+                    finish(std::current_exception());
+                }
+            }
+        }
+
+        const size_t count_;
+        std::function<void(size_t)> task_;
+        std::mutex mutex_;
+        std::condition_variable cv_;
+        size_t next_ = 0;
+        size_t started_ = 0;
+        size_t finished_ = 0;
+        std::exception_ptr exception_;
+    };
+
+    auto state = std::make_shared<State>(count, std::move(task));
+    const auto helpers = std::min(count, parallelism) - 1;
+    for (auto i = 0u; i < helpers; ++i)
+        async::io_executor().add([state] { state->run(); });
+
+    state->run();
+    std::unique_lock lock{state->mutex_};
+    state->cv_.wait(lock, [&state] { return state->finished_ == state->started_; });
+    if (state->exception_)
+        std::rethrow_exception(state->exception_);
+}
+
+struct DeleteBatch {
+    KeyType key_type_;
+    std::string key_type_dir_;
+    std::vector<std::string> s3_object_names_;
+};
+
 template<class KeyBucketizer>
 void do_remove_impl(
     std::span<VariantKey> ks,
@@ -264,48 +377,51 @@ void do_remove_impl(
     KeyBucketizer&& bucketizer) {
     ARCTICDB_SUBSAMPLE(S3StorageDeleteBatch, 0)
     auto fmt_db = [](auto&& k) { return variant_key_type(k); };
-    std::vector<std::string> to_delete;
-    boost::container::small_vector<FailedDelete, 1> failed_deletes;
     static const size_t delete_object_limit =
         std::min(DELETE_OBJECTS_LIMIT,
                  static_cast<size_t>(ConfigsMap::instance()->get_int("S3Storage.DeleteBatchSize", 1000)));
 
-    to_delete.reserve(std::min(ks.size(), delete_object_limit));
-
+    std::vector<DeleteBatch> batches;
     (fg::from(ks) | fg::move | fg::groupBy(fmt_db)).foreach(
-        [&s3_client, &root_folder, &bucket_name, &to_delete,
-            b = std::forward<KeyBucketizer>(bucketizer), &failed_deletes](auto&& group) {
+        [&root_folder, &batches, b = std::forward<KeyBucketizer>(bucketizer)](auto&& group) {
             auto key_type_dir = key_type_folder(root_folder, group.key());
             for (auto k : folly::enumerate(group.values())) {
-                auto s3_object_name = object_path(b.bucketize(key_type_dir, *k), *k);
-                to_delete.emplace_back(std::move(s3_object_name));
-
-                if (to_delete.size() == delete_object_limit || k.index + 1 == group.size()) {
-                    auto delete_object_result = s3_client.delete_objects(to_delete, bucket_name);
-                    if (delete_object_result.is_success()) {
-                        ARCTICDB_RUNTIME_DEBUG(log::storage(), "Deleted {} objects, one of which with key '{}'",
-                                               to_delete.size(),
-                                               variant_key_view(*k));
-                        for (auto& bad_key : delete_object_result.get_output().failed_deletes) {
-                            auto bad_key_name = bad_key.s3_object_name.substr(key_type_dir.size(),
-                                                                              std::string::npos);
-                            failed_deletes.emplace_back(
-                                variant_key_from_bytes(
-                                    reinterpret_cast<const uint8_t *>(bad_key_name.data()),
-                                    bad_key_name.size(), group.key()),
-                                std::move(bad_key.error_message));
-                        }
-                    } else {
-                        auto& error = delete_object_result.get_error();
-                        std::string failed_objects = fmt::format("{}", fmt::join(to_delete, ", "));
-                        raise_s3_exception(error, failed_objects);
-                    }
-                    to_delete.clear();
+                if (k.index % delete_object_limit == 0) {
+                    batches.emplace_back(DeleteBatch{group.key(), key_type_dir, {}});
+                    batches.back().s3_object_names_.reserve(std::min(group.size() - k.index, delete_object_limit));
                 }
+                batches.back().s3_object_names_.emplace_back(object_path(b.bucketize(key_type_dir, *k), *k));
+            }
+        });
+
+    // The batches are independent, so they are sent in parallel, which matters when deleting millions of keys
+    std::mutex failed_deletes_mutex;
+    boost::container::small_vector<FailedDelete, 1> failed_deletes;
+    run_on_io_threads(batches.size(), max_parallel_requests(),
+        [&batches, &s3_client, &bucket_name, &failed_deletes, &failed_deletes_mutex](size_t i) {
+            auto& batch = batches[i];
+            auto delete_object_result = s3_client.delete_objects(batch.s3_object_names_, bucket_name);
+            if (delete_object_result.is_success()) {
+                ARCTICDB_RUNTIME_DEBUG(log::storage(), "Deleted {} objects, one of which with name '{}'",
+                                       batch.s3_object_names_.size(),
+                                       batch.s3_object_names_.front());
+                std::lock_guard lock{failed_deletes_mutex};
+                for (auto& bad_key : delete_object_result.get_output().failed_deletes) {
+                    auto bad_key_name = bad_key.s3_object_name.substr(batch.key_type_dir_.size(),
+                                                                      std::string::npos);
+                    failed_deletes.emplace_back(
+                        variant_key_from_bytes(
+                            reinterpret_cast<const uint8_t *>(bad_key_name.data()),
+                            bad_key_name.size(), batch.key_type_),
+                        std::move(bad_key.error_message));
+                }
+            } else {
+                auto& error = delete_object_result.get_error();
+                std::string failed_objects = fmt::format("{}", fmt::join(batch.s3_object_names_, ", "));
+                raise_s3_exception(error, failed_objects);
             }
         });
 
-    util::check(to_delete.empty(), "Have {} segment that have not been removed", to_delete.size());
     raise_if_failed_deletes(failed_deletes);
 }
 
@@ -448,6 +564,195 @@ PathInfo calculate_path_info(
     return {key_prefix, key_type_dir, path_to_key_size};
 }
 
+/*
+ * The upper bounds of the ranges that a listing is split into once the first page of results ending with
+ * last_object_name has come back truncated, in order. The names are split on the first character of the stream id,
+ * or on the first character after the requested prefix if that is longer, which spreads the ranges across symbols.
+ * The ranges together cover every name after last_object_name, however the names are distributed, with the last
+ * range being unbounded.
+ */
+inline std::vector<std::optional<std::string>> list_shard_bounds(
+    const PathInfo& path_info,
+    const std::string& last_object_name,
+    size_t shard_count) {
+    static const std::string shard_characters =
+        "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz";
+    // Tokenized keys start with the key descriptor and a delimiter, followed by the stream id
+    const auto stem_size = std::min(
+        last_object_name.size(),
+        std::max(path_info.key_prefix_.size(), path_info.path_to_key_size_ + sizeof(KeyDescriptor) + 1));
+    const auto stem = last_object_name.substr(0, stem_size);
+
+    std::vector<std::optional<std::string>> bounds;
+    for (auto i = 1u; i < shard_count; ++i) {
+        auto bound = stem + shard_characters[i * shard_characters.size() / shard_count];
+        if (bound > last_object_name && (bounds.empty() || bound > *bounds.back()))
+            bounds.emplace_back(std::move(bound));
+    }
+    bounds.emplace_back(std::nullopt);
+    return bounds;
+}
+
+/*
+ * Lists count ranges of object names with list_range, on the calling thread and on up to parallelism - 1 threads of
+ * the IO pool, and hands the names in each range to the caller of next() in order. At most parallelism ranges are
+ * listed ahead of the one last returned, so only those are held in memory, and once the caller stops no further
+ * ranges are started and those being listed stop early. As in run_on_io_threads, the calling thread lists a range
+ * itself rather than waiting for it if no other thread has started it, and IO threads never wait for the caller, so
+ * this cannot deadlock. The destructor waits for the ranges still being listed, as list_range may refer to the
+ * caller's stack.
+ */
+class OrderedRangeListing {
+  public:
+    using ListRange = std::function<std::vector<std::string>(size_t, const std::atomic<bool>& cancelled)>;
+
+    OrderedRangeListing(size_t count, size_t parallelism, ListRange&& list_range) :
+        state_(std::make_shared<State>(count, std::max<size_t>(parallelism, 1), std::move(list_range))) {
+        State::add_helpers(state_);
+    }
+
+    ARCTICDB_NO_MOVE_OR_COPY(OrderedRangeListing)
+
+    ~OrderedRangeListing() {
+        std::unique_lock lock{state_->mutex_};
+        state_->cancelled_ = true;
+        state_->cv_.wait(lock, [this] { return state_->in_flight_ == 0; });
+    }
+
+    // The names in the next range, or nullopt once every range has been returned
+    std::optional<std::vector<std::string>> next() {
+        std::unique_lock lock{state_->mutex_};
+        const auto i = state_->consumed_;
+        if (i == state_->count_)
+            return std::nullopt;
+
+        if (state_->next_ == i) {
+            ++state_->next_;
+            ++state_->in_flight_;
+            lock.unlock();
+            state_->list(i);
+            lock.lock();
+        }
+        state_->cv_.wait(lock, [this, i] { return state_->ranges_[i].has_value() || state_->exception_; });
+        if (!state_->ranges_[i])
+            std::rethrow_exception(state_->exception_);
+
+        auto names = std::move(*state_->ranges_[i]);
+        state_->ranges_[i].reset();
+        ++state_->consumed_;
+        lock.unlock();
+        State::add_helpers(state_);
+        return names;
+    }
+
+  private:
+    struct State {
+        State(size_t count, size_t parallelism, ListRange&& list_range) :
+            count_(count), parallelism_(parallelism), list_range_(std::move(list_range)), ranges_(count) {}
+
+        std::optional<size_t> claim() {
+            std::lock_guard lock{mutex_};
+            if (cancelled_ || exception_ || next_ == count_ || next_ >= consumed_ + parallelism_)
+                return std::nullopt;
+
+            ++in_flight_;
+            return next_++;
+        }
+
+        void list(size_t i) {
+            std::optional<std::vector<std::string>> names;
+            std::exception_ptr exception;
+            try {
+                names = list_range_(i, cancelled_);
+            } catch (...) {
+                exception = std::current_exception();
+            }
+            std::lock_guard lock{mutex_};
+            --in_flight_;
+            ranges_[i] = std::move(names);
+            if (exception && !exception_)
+                exception_ = std::move(exception);
+
+            cv_.notify_all();
+        }
+
+        void run() {
+            while (auto i = claim())
+                list(*i);
+
+            std::lock_guard lock{mutex_};
+            --helpers_;
+        }
+
+        // Tops the helpers on the IO pool back up to the number of ranges that can currently be started
+        static void add_helpers(const std::shared_ptr<State>& state) {
+            std::lock_guard lock{state->mutex_};
+            const auto window_end = std::min(state->count_, state->consumed_ + state->parallelism_);
+            const auto startable = window_end > state->next_ ? window_end - state->next_ : 0;
+            while (!state->cancelled_ && !state->exception_ && state->helpers_ < state->parallelism_ - 1
+                   && state->helpers_ < startable) {
+                ++state->helpers_;
+                async::io_executor().add([state] { state->run(); });
+            }
+        }
+
+        const size_t count_;
+        const size_t parallelism_;
+        ListRange list_range_;
+        std::mutex mutex_;
+        std::condition_variable cv_;
+        std::vector<std::optional<std::vector<std::string>>> ranges_;
+        std::atomic<bool> cancelled_ = false;
+        size_t next_ = 0;
+        size_t consumed_ = 0;
+        size_t in_flight_ = 0;
+        size_t helpers_ = 0;
+        std::exception_ptr exception_;
+    };
+
+    std::shared_ptr<State> state_;
+};
+
+/*
+ * Passes the names of the objects after start_after, up to and including upper_bound if it is set, in order, to
+ * on_object_name until it returns true. Returns whether it did.
+ */
+template<typename OnObjectName>
+bool visit_object_range(
+    const PathInfo& path_info,
+    const std::string& bucket_name,
+    const S3ClientInterface& s3_client,
+    KeyType key_type,
+    const std::string& start_after,
+    const std::optional<std::string>& upper_bound,
+    OnObjectName&& on_object_name) {
+    auto continuation_token = std::optional<std::string>();
+    do {
+        auto list_objects_result = s3_client.list_objects(path_info.key_prefix_, bucket_name, continuation_token, start_after);
+        if (!list_objects_result.is_success()) {
+            const auto& error = list_objects_result.get_error();
+            log::storage().warn("Failed to iterate key type with key '{}' after '{}' {}: {}",
+                                key_type,
+                                start_after,
+                                error.GetExceptionName().c_str(),
+                                error.GetMessage().c_str());
+            raise_if_unexpected_error(error, path_info.key_prefix_);
+            return false;
+        }
+
+        auto& output = list_objects_result.get_output();
+        for (auto& s3_object_name : output.s3_object_names) {
+            if (upper_bound && s3_object_name > *upper_bound)
+                return false;
+
+            if (on_object_name(std::move(s3_object_name)))
+                return true;
+        }
+        continuation_token = output.next_continuation_token;
+    } while (continuation_token.has_value());
+    return false;
+}
+
 template<class KeyBucketizer>
 bool do_iterate_type_impl(
     KeyType key_type,
@@ -464,43 +769,74 @@ bool do_iterate_type_impl(
     ARCTICDB_RUNTIME_DEBUG(log::storage(), "Iterating over objects in bucket {} with prefix {}", bucket_name,
                            path_info.key_prefix_);
 
-    auto continuation_token = std::optional<std::string>();
-    do {
-        auto list_objects_result = s3_client.list_objects(path_info.key_prefix_, bucket_name, continuation_token);
-        if (list_objects_result.is_success()) {
-            auto& output = list_objects_result.get_output();
+    auto visit = [&visitor, &path_info, key_type](const std::string& s3_object_name) {
+        auto key = s3_object_name.substr(path_info.path_to_key_size_);
+        ARCTICDB_TRACE(log::version(), "Got object_list: {}, key: {}", s3_object_name, key);
+        auto k = variant_key_from_bytes(
+            reinterpret_cast<uint8_t *>(key.data()),
+            key.size(),
+            key_type);
+
+        ARCTICDB_DEBUG(log::storage(), "Iterating key {}: {}", variant_key_type(k),
+                       variant_key_view(k));
+        ARCTICDB_SUBSAMPLE(S3StorageVisitKey, 0)
+        return visitor(std::move(k));
+    };
 
-            ARCTICDB_RUNTIME_DEBUG(log::storage(), "Received object list");
+    auto list_objects_result = s3_client.list_objects(path_info.key_prefix_, bucket_name, std::nullopt, std::nullopt);
+    if (!list_objects_result.is_success()) {
+        const auto& error = list_objects_result.get_error();
+        log::storage().warn("Failed to iterate key type with key '{}' {}: {}",
+                            key_type,
+                            error.GetExceptionName().c_str(),
+                            error.GetMessage().c_str());
+        // We don't raise on expected errors like NoSuchKey because we want to return an empty list
+        // instead of raising.
+        raise_if_unexpected_error(error, path_info.key_prefix_);
+        return false;
+    }
 
-            for (auto& s3_object_name : output.s3_object_names) {
-                auto key = s3_object_name.substr(path_info.path_to_key_size_);
-                ARCTICDB_TRACE(log::version(), "Got object_list: {}, key: {}", s3_object_name, key);
-                auto k = variant_key_from_bytes(
-                    reinterpret_cast<uint8_t *>(key.data()),
-                    key.size(),
-                    key_type);
-
-                ARCTICDB_DEBUG(log::storage(), "Iterating key {}: {}", variant_key_type(k),
-                               variant_key_view(k));
-                ARCTICDB_SUBSAMPLE(S3StorageVisitKey, 0)
-                if (visitor(std::move(k))) {
-                    return true;
-                }
-                ARCTICDB_SUBSAMPLE(S3StorageCursorNext, 0)
-            }
-            continuation_token = output.next_continuation_token;
-        } else {
-            const auto& error = list_objects_result.get_error();
-            log::storage().warn("Failed to iterate key type with key '{}' {}: {}",
-                                key_type,
-                                error.GetExceptionName().c_str(),
-                                error.GetMessage().c_str());
-            // We don't raise on expected errors like NoSuchKey because we want to return an empty list
-            // instead of raising.
-            raise_if_unexpected_error(error, path_info.key_prefix_);
-            return false;
+    ARCTICDB_RUNTIME_DEBUG(log::storage(), "Received object list");
+    auto& output = list_objects_result.get_output();
+    for (auto& s3_object_name : output.s3_object_names) {
+        if (visit(s3_object_name))
+            return true;
+        ARCTICDB_SUBSAMPLE(S3StorageCursorNext, 0)
+    }
+
+    if (!output.next_continuation_token.has_value())
+        return false;
+
+    // The listing did not fit in one page. Rather than paging through the rest one request at a time, split the
+    // remaining names into ranges which are listed in parallel, and visit them in order as they arrive.
+    const auto shard_count = static_cast<size_t>(ConfigsMap::instance()->get_int("S3Storage.ListShards", 16));
+    const auto last_object_name = output.s3_object_names.empty() ? path_info.key_prefix_ : output.s3_object_names.back();
+    if (shard_count <= 1)
+        return visit_object_range(path_info, bucket_name, s3_client, key_type, last_object_name, std::nullopt, visit);
+
+    const auto bounds = list_shard_bounds(path_info, last_object_name, shard_count);
+    ARCTICDB_RUNTIME_DEBUG(log::storage(), "Listing the remainder of prefix {} in {} ranges",
+                           path_info.key_prefix_, bounds.size());
+    OrderedRangeListing listing(bounds.size(), max_parallel_requests(),
+        [&bounds, &path_info, &bucket_name, &s3_client, key_type, &last_object_name](
+                size_t i, const std::atomic<bool>& cancelled) {
+            const auto& start_after = i == 0 ? last_object_name : *bounds[i - 1];
+            std::vector<std::string> names;
+            visit_object_range(path_info, bucket_name, s3_client, key_type, start_after, bounds[i],
+                [&names, &cancelled](std::string&& s3_object_name) {
+                    names.emplace_back(std::move(s3_object_name));
+                    return cancelled.load();
+                });
+            return names;
+        });
+
+    while (auto names = listing.next()) {
+        for (const auto& s3_object_name : *names) {
+            if (visit(s3_object_name))
+                return true;
+            ARCTICDB_SUBSAMPLE(S3StorageCursorNext, 0)
         }
-    } while (continuation_token.has_value());
+    }
     return false;
 }
 
@@ -522,7 +858,7 @@ ObjectSizes do_calculate_sizes_for_type_impl(
     auto continuation_token = std::optional<std::string>();
     ObjectSizes res{key_type};
     do {
-        auto list_objects_result = s3_client.list_objects(path_info.key_prefix_, bucket_name, continuation_token);
+        auto list_objects_result = s3_client.list_objects(path_info.key_prefix_, bucket_name, continuation_token, std::nullopt);
         if (list_objects_result.is_success()) {
             const auto& output = list_objects_result.get_output();
 
@@ -132,6 +132,27 @@ S3Result<Segment> S3ClientImpl::get_object(
     return {Segment::from_buffer(retrieved.get_buffer())};
 }
 
+S3Result<std::shared_ptr<Buffer>> S3ClientImpl::get_object_range(
+        const std::string &s3_object_name,
+        const std::string &bucket_name,
+        size_t offset,
+        std::optional<size_t> length) const {
+    ARCTICDB_RUNTIME_DEBUG(log::storage(), "Looking for {} bytes of object {} at offset {}", length.value_or(0), s3_object_name, offset);
+    Aws::S3::Model::GetObjectRequest request;
+    request.WithBucket(bucket_name.c_str()).WithKey(s3_object_name.c_str());
+    const auto range = length ? fmt::format("bytes={}-{}", offset, offset + *length - 1) : fmt::format("bytes={}-", offset);
+    request.SetRange(range.c_str());
+    request.SetResponseStreamFactory(S3StreamFactory());
+    auto outcome = s3_client.GetObject(request);
+
+    if (!outcome.IsSuccess()) {
+        return {outcome.GetError()};
+    }
+
+    auto &retrieved = dynamic_cast<S3IOStream &>(outcome.GetResult().GetBody());
+    return {retrieved.get_buffer()};
+}
+
 struct GetObjectAsyncHandler {
     std::shared_ptr<folly::Promise<S3Result<Segment>>> promise_;
     timestamp start_;
@@ -275,7 +296,8 @@ folly::Future<S3Result<std::monostate>> S3ClientImpl::delete_object(
 S3Result<ListObjectsOutput> S3ClientImpl::list_objects(
         const std::string& name_prefix,
         const std::string& bucket_name,
-        const std::optional<std::string>& continuation_token) const {
+        const std::optional<std::string>& continuation_token,
+        const std::optional<std::string>& start_after) const {
 
     ARCTICDB_RUNTIME_DEBUG(log::storage(), "Searching for objects in bucket {} with prefix {}", bucket_name,
                            name_prefix);
@@ -284,6 +306,8 @@ S3Result<ListObjectsOutput> S3ClientImpl::list_objects(
     request.SetPrefix(name_prefix.c_str());
     if (continuation_token.has_value())
         request.SetContinuationToken(*continuation_token);
+    if (start_after.has_value())
+        request.SetStartAfter(*start_after);
 
     auto outcome = s3_client.ListObjectsV2(request);
 
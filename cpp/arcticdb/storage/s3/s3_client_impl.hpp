@@ -43,6 +43,12 @@ public:
         const std::string& s3_object_name,
         const std::string& bucket_name) const override;
 
+    S3Result<std::shared_ptr<Buffer>> get_object_range(
+        const std::string& s3_object_name,
+        const std::string& bucket_name,
+        size_t offset,
+        std::optional<size_t> length) const override;
+
     S3Result<std::monostate> put_object(
             const std::string& s3_object_name,
             Segment& segment,
@@ -60,7 +66,8 @@ public:
     S3Result<ListObjectsOutput> list_objects(
         const std::string& prefix,
         const std::string& bucket_name,
-        const std::optional<std::string>& continuation_token) const override;
+        const std::optional<std::string>& continuation_token,
+        const std::optional<std::string>& start_after) const override;
 private:
     Aws::S3::S3Client s3_client;
 };
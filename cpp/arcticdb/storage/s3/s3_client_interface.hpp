@@ -85,6 +85,13 @@ public:
         const std::string& s3_object_name,
         const std::string& bucket_name) const = 0;
 
+    // Returns the raw bytes of the object from offset, up to length bytes or to the end of the object if length is not set
+    [[nodiscard]] virtual S3Result<std::shared_ptr<Buffer>> get_object_range(
+        const std::string& s3_object_name,
+        const std::string& bucket_name,
+        size_t offset,
+        std::optional<size_t> length) const = 0;
+
     virtual S3Result<std::monostate> put_object(
         const std::string& s3_object_name,
         Segment& segment,
@@ -99,10 +106,13 @@ public:
         const std::string& s3_object_name,
         const std::string& bucket_name) = 0;
 
+    // Lists the objects whose names start with prefix. If start_after is set, only the objects whose names sort after it
+    // are listed, which allows a listing to be split into ranges that are fetched in parallel.
     [[nodiscard]] virtual S3Result<ListObjectsOutput> list_objects(
         const std::string& prefix,
         const std::string& bucket_name,
-        const std::optional<std::string>& continuation_token) const = 0;
+        const std::optional<std::string>& continuation_token,
+        const std::optional<std::string>& start_after) const = 0;
 
     virtual ~S3ClientInterface() = default;
 };
@@ -100,6 +100,19 @@ folly::Future<S3Result<Segment>> S3ClientTestWrapper::get_object_async(
     return actual_client_->get_object_async(s3_object_name, bucket_name);
 }
 
+S3Result<std::shared_ptr<Buffer>> S3ClientTestWrapper::get_object_range(
+    const std::string &s3_object_name,
+    const std::string &bucket_name,
+    size_t offset,
+    std::optional<size_t> length) const {
+    auto maybe_error = has_failure_trigger(bucket_name);
+    if (maybe_error.has_value()) {
+        return {*maybe_error};
+    }
+
+    return actual_client_->get_object_range(s3_object_name, bucket_name, offset, length);
+}
+
 S3Result<std::monostate> S3ClientTestWrapper::put_object(
         const std::string &s3_object_name,
         Segment &segment,
@@ -140,13 +153,14 @@ folly::Future<S3Result<std::monostate>> S3ClientTestWrapper::delete_object(
 S3Result<ListObjectsOutput> S3ClientTestWrapper::list_objects(
         const std::string& name_prefix,
         const std::string& bucket_name,
-        const std::optional<std::string>& continuation_token) const {
+        const std::optional<std::string>& continuation_token,
+        const std::optional<std::string>& start_after) const {
     auto maybe_error = has_failure_trigger(bucket_name);
     if (maybe_error.has_value()) {
         return {*maybe_error};
     }
 
-    return actual_client_->list_objects(name_prefix, bucket_name, continuation_token);
+    return actual_client_->list_objects(name_prefix, bucket_name, continuation_token, start_after);
 }
 
 }
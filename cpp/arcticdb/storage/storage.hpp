@@ -151,8 +151,8 @@ public:
         return do_get_object_sizes(key_type, prefix);
     }
 
-    bool scan_for_matching_key(KeyType key_type, const IterateTypePredicate& predicate) {
-        return do_iterate_type_until_match(key_type, predicate, std::string());
+    bool scan_for_matching_key(KeyType key_type, const IterateTypePredicate& predicate, const std::string& prefix = std::string()) {
+        return do_iterate_type_until_match(key_type, predicate, prefix);
     }
 
     [[nodiscard]] std::string key_path(const VariantKey& key) const {
@@ -7,6 +7,10 @@
 
 #pragma once
 
+#include <memory>
+#include <string>
+#include <unordered_set>
+
 namespace arcticdb::storage {
 
 /**
@@ -34,6 +38,14 @@ struct ReadKeyOpts {
      * - s3_storage-inl.cpp:do_read_impl()
      */
     bool dont_warn_about_missing_key = false;
+
+    /**
+     * The columns the reader will decode, or null if it needs all of them. Index columns are always fetched.
+     *
+     * Applies to:
+     * - s3 and azure do_read_impl() for TABLE_DATA keys, when column range reads are enabled
+     */
+    std::shared_ptr<std::unordered_set<std::string>> columns_;
 };
 
 /**
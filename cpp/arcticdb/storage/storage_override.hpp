@@ -1,5 +1,6 @@
 #pragma once
 
+#include <optional>
 #include <variant>
 #include <string>
 
@@ -225,16 +226,49 @@ public:
     }
 };
 
+// Places a cache on local disk in front of the storage, see LocalCacheStorage. Unlike the overrides above this does
+// not modify the storage config, as the cache belongs to the client opening the library rather than to the library.
+class LocalCacheOverride {
+    std::string path_;
+    uint64_t max_bytes_ = 10ULL * 1024 * 1024 * 1024;
+
+public:
+    [[nodiscard]] std::string path() const {
+        return path_;
+    }
+
+    void set_path(std::string path) {
+        path_ = std::move(path);
+    }
+
+    [[nodiscard]] uint64_t max_bytes() const {
+        return max_bytes_;
+    }
+
+    void set_max_bytes(uint64_t max_bytes) {
+        max_bytes_ = max_bytes;
+    }
+};
+
 using VariantStorageOverride = std::variant<std::monostate, S3Override, AzureOverride, LmdbOverride, GCPXMLOverride>;
 
 class StorageOverride {
     VariantStorageOverride override_;
+    std::optional<LocalCacheOverride> local_cache_;
 
 public:
     [[nodiscard]] const VariantStorageOverride& variant() const {
         return override_;
     }
 
+    [[nodiscard]] const std::optional<LocalCacheOverride>& local_cache() const {
+        return local_cache_;
+    }
+
+    void set_local_cache_override(const LocalCacheOverride& local_cache_override) {
+        local_cache_ = local_cache_override;
+    }
+
     void set_s3_override(const S3Override& storage_override) {
         override_ = storage_override;
     }
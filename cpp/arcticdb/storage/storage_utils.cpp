@@ -47,7 +47,7 @@ AtomKey write_table_index_tree_from_source_to_target(
     ARCTICDB_SAMPLE(WriteIndexSourceToTarget, 0)
     // In
     auto [_, index_seg] = source_store->read_sync(index_key);
-    index::IndexSegmentReader index_segment_reader{std::move(index_seg)};
+    index::IndexSegmentReader index_segment_reader{index::read_index_pages(source_store, std::move(index_seg))};
     // Out
     index::IndexWriter<stream::RowCountIndex> writer(target_store,
             {index_key.id(), new_version_id.value_or(index_key.version_id())},
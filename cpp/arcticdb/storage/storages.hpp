@@ -13,6 +13,7 @@
 #include <arcticdb/util/composite.hpp>
 #include <arcticdb/util/configs_map.hpp>
 #include <arcticdb/storage/single_file_storage.hpp>
+#include <arcticdb/storage/local_cache_storage.hpp>
 
 #include <memory>
 #include <vector>
@@ -263,6 +264,14 @@ public:
         return primary().name();
     }
 
+    [[nodiscard]] std::optional<LRUCacheStats> local_cache_stats() const {
+        if (const auto* local_cache = dynamic_cast<const LocalCacheStorage*>(&primary()); local_cache != nullptr) {
+            return local_cache->cache_stats();
+        } else {
+            return std::nullopt;
+        }
+    }
+
 private:
     Storage& primary() {
         util::check(!storages_.empty(), "No storages configured");
@@ -281,7 +290,8 @@ private:
 inline std::shared_ptr<Storages> create_storages(const LibraryPath& library_path,
                                                  OpenMode mode,
                                                  decltype(std::declval<arcticc::pb2::storage_pb2::LibraryConfig>().storage_by_id())& storage_configs,
-                                                 const NativeVariantStorage& native_storage_config) {
+                                                 const NativeVariantStorage& native_storage_config,
+                                                 const std::optional<LocalCacheOverride>& local_cache = std::nullopt) {
     Storages::StorageVector storages;
     for (const auto& [storage_id, storage_config] : storage_configs) {
         util::variant_match(native_storage_config.variant(),
@@ -308,6 +318,9 @@ inline std::shared_ptr<Storages> create_storages(const LibraryPath& library_path
                             }
         );
     }
+    if (local_cache.has_value() && !storages.empty()) {
+        storages[0] = std::make_shared<LocalCacheStorage>(std::move(storages[0]), *local_cache);
+    }
     return std::make_shared<Storages>(std::move(storages), mode);
 }
 
@@ -0,0 +1,160 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <gtest/gtest.h>
+
+#include <arcticdb/codec/codec.hpp>
+#include <arcticdb/codec/default_codecs.hpp>
+#include <arcticdb/codec/magic_words.hpp>
+#include <arcticdb/storage/column_range_reads.hpp>
+#include <arcticdb/storage/mock/s3_mock_client.hpp>
+#include <arcticdb/storage/s3/detail-inl.hpp>
+#include <arcticdb/util/configs_map.hpp>
+
+using namespace arcticdb;
+using namespace arcticdb::storage;
+
+namespace {
+constexpr size_t NUM_ROWS = 1000;
+
+StreamDescriptor wide_descriptor() {
+    return stream_descriptor(StreamId{"wide"}, RowCountIndex{}, {
+        scalar_field(DataType::UINT64, "a"),
+        scalar_field(DataType::FLOAT64, "b"),
+        scalar_field(DataType::ASCII_DYNAMIC64, "c"),
+        scalar_field(DataType::UINT64, "d"),
+        scalar_field(DataType::FLOAT64, "e")
+    });
+}
+
+Segment wide_segment(EncodingVersion encoding_version = EncodingVersion::V2) {
+    SegmentInMemory in_mem_seg{wide_descriptor()};
+    for(auto i = 0UL; i < NUM_ROWS; ++i) {
+        in_mem_seg.set_scalar<uint64_t>(0, i);
+        in_mem_seg.set_scalar<double>(1, static_cast<double>(i) / 2);
+        in_mem_seg.set_string(2, fmt::format("string_{}", i % 10));
+        in_mem_seg.set_scalar<uint64_t>(3, i * 3);
+        in_mem_seg.set_scalar<double>(4, static_cast<double>(i) * 5);
+        in_mem_seg.end_row();
+    }
+    return encode_dispatch(std::move(in_mem_seg), codec::default_lz4_codec(), encoding_version);
+}
+
+std::vector<uint8_t> serialize(Segment& segment) {
+    std::vector<uint8_t> bytes(segment.calculate_size());
+    segment.write_to(bytes.data());
+    return bytes;
+}
+
+struct RangeReader {
+    const std::vector<uint8_t>& bytes_;
+    mutable size_t requests_ = 0;
+    mutable size_t bytes_read_ = 0;
+
+    std::shared_ptr<Buffer> operator()(size_t offset, std::optional<size_t> length) const {
+        const auto begin = std::min(offset, bytes_.size());
+        const auto end = length ? std::min(begin + *length, bytes_.size()) : bytes_.size();
+        auto buffer = std::make_shared<Buffer>(end - begin);
+        memcpy(buffer->data(), bytes_.data() + begin, end - begin);
+        ++requests_;
+        bytes_read_ += end - begin;
+        return buffer;
+    }
+};
+
+SegmentInMemory decode_columns(Segment& segment, const std::vector<FieldRef>& fields) {
+    SegmentInMemory output{stream_descriptor_from_range(StreamId{"wide"}, RowCountIndex{}, fields)};
+    decode_into_memory_segment(segment, segment.header(), output, segment.descriptor());
+    return output;
+}
+}
+
+TEST(ColumnRangeReads, Layout) {
+    auto segment = wide_segment();
+    const auto bytes = serialize(segment);
+    const auto header_bytes = serialized_header_bytes(bytes.data());
+    const auto footer_offset = serialized_footer_offset(bytes.data());
+    ASSERT_TRUE(footer_offset.has_value());
+    const auto layout = serialized_column_layout(bytes.data(), bytes.data() + *footer_offset);
+
+    ASSERT_EQ(layout.preamble_.offset_, header_bytes);
+    ASSERT_EQ(layout.columns_.size(), wide_descriptor().field_count());
+    auto pos = layout.preamble_.end();
+    for(const auto& column : layout.columns_) {
+        ASSERT_EQ(column.offset_, pos);
+        const auto* magic = bytes.data() + column.offset_;
+        ASSERT_NO_THROW(util::check_magic<ColumnMagic>(magic));
+        pos = column.end();
+    }
+    ASSERT_EQ(layout.string_pool_.offset_, pos);
+    ASSERT_EQ(layout.string_pool_.end(), *footer_offset);
+    const auto* magic = bytes.data() + layout.string_pool_.offset_;
+    ASSERT_NO_THROW(util::check_magic<StringPoolMagic>(magic));
+}
+
+TEST(ColumnRangeReads, NoLayoutForV1) {
+    auto segment = wide_segment(EncodingVersion::V1);
+    const auto bytes = serialize(segment);
+    ASSERT_FALSE(serialized_footer_offset(bytes.data()).has_value());
+    RangeReader reader{bytes};
+    auto read = read_segment_columns(reader, {"d"}, ColumnRangeReadOptions{64, 0});
+    // Falls back to reading the remainder of the object
+    ASSERT_EQ(reader.bytes_read_, bytes.size());
+    auto decoded = decode_columns(read, {scalar_field(DataType::UINT64, "d")});
+    ASSERT_EQ(decoded.scalar_at<uint64_t>(7, 0), 21U);
+}
+
+TEST(ColumnRangeReads, ReadsRequestedColumns) {
+    auto segment = wide_segment();
+    const auto bytes = serialize(segment);
+    RangeReader reader{bytes};
+    auto read = read_segment_columns(reader, {"c", "e"}, ColumnRangeReadOptions{64, 0});
+    ASSERT_LT(reader.bytes_read_, bytes.size());
+
+    auto decoded = decode_columns(read, {scalar_field(DataType::ASCII_DYNAMIC64, "c"), scalar_field(DataType::FLOAT64, "e")});
+    ASSERT_EQ(decoded.row_count(), NUM_ROWS);
+    for(auto i = 0UL; i < NUM_ROWS; ++i) {
+        ASSERT_EQ(decoded.string_at(i, 0), fmt::format("string_{}", i % 10));
+        ASSERT_EQ(decoded.scalar_at<double>(i, 1), static_cast<double>(i) * 5);
+    }
+}
+
+TEST(ColumnRangeReads, SmallObjectsReadWhole) {
+    auto segment = wide_segment();
+    const auto bytes = serialize(segment);
+    RangeReader reader{bytes};
+    auto read = read_segment_columns(reader, {"a"}, ColumnRangeReadOptions{bytes.size() + 1, 0});
+    ASSERT_EQ(reader.requests_, 1U);
+    auto decoded = decode_columns(read, {scalar_field(DataType::UINT64, "a"), scalar_field(DataType::UINT64, "d")});
+    ASSERT_EQ(decoded.scalar_at<uint64_t>(10, 0), 10U);
+    ASSERT_EQ(decoded.scalar_at<uint64_t>(10, 1), 30U);
+}
+
+TEST(ColumnRangeReads, CoalesceRanges) {
+    std::vector<SegmentByteRange> ranges{{100, 10}, {0, 10}, {12, 8}, {50, 0}, {30, 5}};
+    ASSERT_EQ(coalesce_byte_ranges(std::vector<SegmentByteRange>{ranges}, 0).size(), 4U);
+    const auto coalesced = coalesce_byte_ranges(std::move(ranges), 10);
+    ASSERT_EQ(coalesced.size(), 2U);
+    ASSERT_EQ(coalesced[0].offset_, 0U);
+    ASSERT_EQ(coalesced[0].length_, 35U);
+    ASSERT_EQ(coalesced[1].offset_, 100U);
+    ASSERT_EQ(coalesced[1].length_, 10U);
+}
+
+TEST(ColumnRangeReads, MockS3Client) {
+    s3::MockS3Client client;
+    auto segment = wide_segment();
+    ASSERT_TRUE(client.put_object("wide", segment, "bucket").is_success());
+    ScopedConfig initial_bytes("Storage.ColumnRangeReadInitialBytes", 64);
+    auto result = s3::detail::get_object_columns(client, "wide", "bucket", {"b"});
+    ASSERT_TRUE(result.is_success());
+    auto decoded = decode_columns(result.get_output(), {scalar_field(DataType::FLOAT64, "b")});
+    ASSERT_EQ(decoded.scalar_at<double>(9, 0), 4.5);
+
+    auto missing = s3::detail::get_object_columns(client, "missing", "bucket", {"b"});
+    ASSERT_FALSE(missing.is_success());
+}
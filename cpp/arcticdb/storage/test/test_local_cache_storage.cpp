@@ -0,0 +1,155 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <gtest/gtest.h>
+#include <arcticdb/codec/codec.hpp>
+#include <arcticdb/storage/local_cache_storage.hpp>
+#include <arcticdb/storage/memory/memory_storage.hpp>
+#include <arcticdb/storage/storage_exceptions.hpp>
+#include <arcticdb/stream/test/stream_test_common.hpp>
+
+#include <chrono>
+#include <filesystem>
+#include <fstream>
+
+using namespace arcticdb;
+namespace as = arcticdb::storage;
+
+namespace {
+
+Segment test_segment(size_t num_rows) {
+    auto segment_in_memory = get_test_frame<stream::TimeseriesIndex>("symbol", {}, num_rows, 0).segment_;
+    return encode_dispatch(std::move(segment_in_memory), proto::encoding::VariantCodec{}, EncodingVersion::V2);
+}
+
+AtomKey data_key(VersionId version_id) {
+    return atom_key_builder().version_id(version_id).content_hash(version_id).build(StreamId{"sym"}, KeyType::TABLE_DATA);
+}
+
+size_t count_cache_files(const std::filesystem::path& path) {
+    size_t count = 0;
+    for(const auto& entry : std::filesystem::directory_iterator{path})
+        count += entry.path().extension() == ".seg" ? 1 : 0;
+    return count;
+}
+
+class LocalCacheStorageTest : public testing::Test {
+protected:
+    void SetUp() override {
+        std::filesystem::remove_all(cache_path_);
+        primary_ = std::make_shared<as::memory::MemoryStorage>(as::LibraryPath{"local", "cache"}, as::OpenMode::DELETE, as::memory::MemoryStorage::Config{});
+    }
+
+    void TearDown() override {
+        std::filesystem::remove_all(cache_path_);
+    }
+
+    std::unique_ptr<as::LocalCacheStorage> cached_storage(size_t capacity_bytes) {
+        return std::make_unique<as::LocalCacheStorage>(primary_, std::make_shared<as::LocalDiskCache>(cache_path_, capacity_bytes));
+    }
+
+    void write_to_primary(const VariantKey& key, size_t num_rows = 10) {
+        primary_->write(as::KeySegmentPair{VariantKey{key}, test_segment(num_rows)});
+    }
+
+    const std::filesystem::path cache_path_ = std::filesystem::temp_directory_path() / "arcticdb_test_local_cache";
+    std::shared_ptr<as::Storage> primary_;
+};
+
+} // namespace
+
+TEST_F(LocalCacheStorageTest, ServesImmutableKeysLocally) {
+    auto storage = cached_storage(1 << 20);
+    const auto key = data_key(1);
+    write_to_primary(key);
+
+    const auto first = storage->read(VariantKey{key}, as::ReadKeyOpts{});
+    ASSERT_EQ(storage->cache_stats().misses_, 1U);
+    ASSERT_EQ(storage->cache_stats().entries_, 1U);
+    ASSERT_EQ(count_cache_files(cache_path_), 1U);
+
+    // Served locally even once the key has gone from the primary behind the cache's back
+    primary_->remove(VariantKey{key}, as::RemoveOpts{});
+    const auto second = storage->read(VariantKey{key}, as::ReadKeyOpts{});
+    ASSERT_EQ(storage->cache_stats().hits_, 1U);
+    ASSERT_EQ(second.segment().buffer_bytes(), first.segment().buffer_bytes());
+    ASSERT_EQ(memcmp(second.segment().buffer().data(), first.segment().buffer().data(), first.segment().buffer_bytes()), 0);
+
+    // Removing through the decorator removes the local copy
+    storage->remove(VariantKey{key}, as::RemoveOpts{true});
+    ASSERT_EQ(count_cache_files(cache_path_), 0U);
+    ASSERT_THROW(storage->read(VariantKey{key}, as::ReadKeyOpts{}), as::KeyNotFoundException);
+}
+
+TEST_F(LocalCacheStorageTest, RefKeysGoToPrimary) {
+    auto storage = cached_storage(1 << 20);
+    const RefKey ref_key{StreamId{"sym"}, KeyType::VERSION_REF};
+    ASSERT_FALSE(as::LocalCacheStorage::caches(ref_key));
+    write_to_primary(ref_key, 10);
+    (void)storage->read(VariantKey{ref_key}, as::ReadKeyOpts{});
+
+    const auto updated_bytes = test_segment(20).buffer_bytes();
+    as::KeySegmentPair updated{VariantKey{ref_key}, test_segment(20)};
+    storage->update(updated, as::UpdateOpts{});
+    const auto read = storage->read(VariantKey{ref_key}, as::ReadKeyOpts{});
+    ASSERT_EQ(read.segment().buffer_bytes(), updated_bytes);
+    ASSERT_EQ(storage->cache_stats().hits_, 0U);
+    ASSERT_EQ(storage->cache_stats().misses_, 0U);
+    ASSERT_EQ(count_cache_files(cache_path_), 0U);
+}
+
+TEST_F(LocalCacheStorageTest, EvictsBySize) {
+    {
+        auto probe = cached_storage(1 << 20);
+        write_to_primary(data_key(0), 100);
+        (void)probe->read(VariantKey{data_key(0)}, as::ReadKeyOpts{});
+    }
+    const auto file_bytes = std::filesystem::file_size(std::filesystem::directory_iterator{cache_path_}->path());
+    std::filesystem::remove_all(cache_path_);
+
+    auto storage = cached_storage(file_bytes * 2);
+    for(auto i = 1U; i <= 3; ++i) {
+        write_to_primary(data_key(i), 100);
+        (void)storage->read(VariantKey{data_key(i)}, as::ReadKeyOpts{});
+    }
+    ASSERT_EQ(storage->cache_stats().evictions_, 1U);
+    ASSERT_EQ(count_cache_files(cache_path_), 2U);
+}
+
+TEST_F(LocalCacheStorageTest, PersistsAcrossInstances) {
+    const auto key = data_key(1);
+    write_to_primary(key);
+    {
+        auto storage = cached_storage(1 << 20);
+        (void)storage->read(VariantKey{key}, as::ReadKeyOpts{});
+    }
+    ASSERT_EQ(count_cache_files(cache_path_), 1U);
+
+    primary_->remove(VariantKey{key}, as::RemoveOpts{});
+    auto storage = cached_storage(1 << 20);
+    ASSERT_EQ(storage->cache_stats().entries_, 1U);
+    const auto read = storage->read(VariantKey{key}, as::ReadKeyOpts{});
+    ASSERT_EQ(storage->cache_stats().hits_, 1U);
+    ASSERT_EQ(read.segment().header().encoding_version(), EncodingVersion::V2);
+}
+
+TEST_F(LocalCacheStorageTest, RemovesStaleTemporaryFiles) {
+    std::filesystem::create_directories(cache_path_);
+    const auto stale_path = cache_path_ / "0000000000000001-0000000000000001.seg.tmp";
+    const auto in_progress_path = cache_path_ / "0000000000000002-0000000000000002.seg.tmp";
+    for(const auto& path : {stale_path, in_progress_path})
+        std::ofstream{path} << "partial";
+    std::filesystem::last_write_time(
+            stale_path,
+            std::filesystem::file_time_type::clock::now() - std::chrono::hours(2));
+
+    auto storage = cached_storage(1 << 20);
+    ASSERT_FALSE(std::filesystem::exists(stale_path));
+    // May still be being written by another process sharing the directory
+    ASSERT_TRUE(std::filesystem::exists(in_progress_path));
+    ASSERT_EQ(storage->cache_stats().entries_, 0U);
+}
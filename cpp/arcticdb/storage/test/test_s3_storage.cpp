@@ -401,3 +401,78 @@ TEST_F(S3StorageFixture, test_matching_key_type_prefix_list) {
 
     ASSERT_EQ(list_in_store(store, entity::KeyType::LOG), log_symbols);
 }
+
+TEST_F(S3StorageFixture, test_list_sharded) {
+    // Symbols starting with a spread of characters, and many more of them than fit in one page of the mock
+    auto symbols = std::set<std::string>();
+    for (auto first : std::string{"09AMZamz_~"}) {
+        for (int i = 0; i < 12; ++i) {
+            auto symbol = fmt::format("{}symbol_{}", first, i);
+            write_in_store(store, symbol);
+            symbols.emplace(symbol);
+        }
+    }
+
+    for (auto shards : {0, 1, 2, 16, 100}) {
+        ScopedConfig list_shards("S3Storage.ListShards", shards);
+        auto names = std::vector<std::string>();
+        store.iterate_type(KeyType::TABLE_DATA, [&names](VariantKey &&key) {
+            names.emplace_back(std::get<StringId>(variant_key_id(key)));
+        });
+        // Every key is visited exactly once, in the order in which they are listed
+        ASSERT_EQ(names.size(), symbols.size());
+        ASSERT_TRUE(std::is_sorted(names.begin(), names.end()));
+        ASSERT_EQ(std::set<std::string>(names.begin(), names.end()), symbols);
+    }
+
+    write_in_store(store, MockS3Client::get_failure_trigger("zz_symbol", StorageOperation::LIST, Aws::S3::S3Errors::NETWORK_CONNECTION, false));
+    ASSERT_THROW(list_in_store(store), UnexpectedS3ErrorException);
+}
+
+TEST_F(S3StorageFixture, test_list_sharded_stops_early) {
+    auto symbols = std::set<std::string>();
+    for (auto first : std::string{"09AMZamz_~"}) {
+        for (int i = 0; i < 12; ++i) {
+            auto symbol = fmt::format("{}symbol_{}", first, i);
+            write_in_store(store, symbol);
+            symbols.emplace(symbol);
+        }
+    }
+    const std::string target = "asymbol_5";
+
+    ScopedConfig list_shards("S3Storage.ListShards", 16);
+    auto names = std::vector<std::string>();
+    ASSERT_TRUE(store.scan_for_matching_key(KeyType::TABLE_DATA, [&names, &target](VariantKey &&key) {
+        names.emplace_back(std::get<StringId>(variant_key_id(key)));
+        return names.back() == target;
+    }));
+    // The keys after the match are never passed to the visitor
+    ASSERT_EQ(names.back(), target);
+    ASSERT_TRUE(std::is_sorted(names.begin(), names.end()));
+    ASSERT_EQ(names.size(), static_cast<size_t>(std::distance(symbols.begin(), symbols.find(target))) + 1);
+}
+
+TEST_F(S3StorageFixture, test_list_shard_bounds) {
+    detail::PathInfo path_info{"lib/tdata/", "lib/tdata/", 10};
+    const std::string last_object_name = "lib/tdata/*sTt*Msymbol_3*0*0*0*0*0";
+    auto bounds = detail::list_shard_bounds(path_info, last_object_name, 8);
+    ASSERT_FALSE(bounds.back().has_value());
+    bounds.pop_back();
+    ASSERT_FALSE(bounds.empty());
+    for (auto i = 0u; i < bounds.size(); ++i) {
+        ASSERT_TRUE(bounds[i]->starts_with("lib/tdata/*sTt*"));
+        ASSERT_EQ(bounds[i]->size(), std::string{"lib/tdata/*sTt*"}.size() + 1);
+        ASSERT_GT(*bounds[i], last_object_name);
+        if (i > 0)
+            ASSERT_GT(*bounds[i], *bounds[i - 1]);
+    }
+}
+
+TEST_F(S3StorageFixture, test_remove_many_batches) {
+    auto symbols = populate_store(store, "symbol", 0, 2500);
+    ASSERT_EQ(list_in_store(store), symbols);
+
+    // More than one DeleteObjects request, which are sent in parallel
+    remove_in_store(store, std::vector<std::string>(symbols.begin(), symbols.end()));
+    ASSERT_TRUE(list_in_store(store).empty());
+}
@@ -61,11 +61,17 @@ AppendMapEntry entry_from_key(
     const entity::AtomKey& key,
     bool load_data);
 
+folly::Future<AppendMapEntry> async_entry_from_key(
+    const std::shared_ptr<stream::StreamSource>& store,
+    const entity::AtomKey& key,
+    bool load_data);
+
 std::vector<AppendMapEntry> get_incomplete_append_slices_for_stream_id(
     const std::shared_ptr<Store> &store,
     const StreamId &stream_id,
     bool via_iteration,
-    bool load_data);
+    bool load_data,
+    bool iterate_if_no_chain = false);
 
 inline std::vector<AppendMapEntry> load_via_iteration(
     const std::shared_ptr<Store>& store,
@@ -74,16 +80,29 @@ inline std::vector<AppendMapEntry> load_via_iteration(
 ) {
     auto prefix = std::holds_alternative<StringId>(stream_id) ? std::get<StringId>(stream_id) : std::string();
 
-    std::vector<AppendMapEntry> output;
-    store->iterate_type(KeyType::APPEND_DATA, [&store, load_data, &output, &stream_id] (const auto& vk) {
+    std::vector<AtomKey> keys;
+    store->iterate_type(KeyType::APPEND_DATA, [&keys, &stream_id] (const auto& vk) {
         const auto& key = to_atom(vk);
-        if(key.id() != stream_id)
-            return;
+        if(key.id() == stream_id)
+            keys.emplace_back(key);
+    }, prefix);
 
-        auto entry = entry_from_key(store, key, load_data);
+    // Unlike the append chain, staged segments don't reference each other so can all be read at once
+    std::vector<folly::Future<AppendMapEntry>> entry_futures;
+    entry_futures.reserve(keys.size());
+    for (const auto& key : keys)
+        entry_futures.emplace_back(async_entry_from_key(store, key, load_data));
 
-        output.emplace_back(std::move(entry));
-    });
+    ARCTICDB_DEBUG(log::version(), "Reading {} staged segments for stream {}", keys.size(), stream_id);
+    std::vector<AppendMapEntry> output;
+    output.reserve(keys.size());
+    for (auto&& entry : folly::collectAll(entry_futures).get()) {
+        // Finalized by another process since it was listed
+        if (entry.hasException<storage::KeyNotFoundException>())
+            continue;
+
+        output.emplace_back(std::move(entry.value()));
+    }
     return output;
 }
 
@@ -420,10 +439,12 @@ std::vector<SliceAndKey> get_incomplete(
     const pipelines::FilterRange &range,
     uint64_t last_row,
     bool via_iteration,
-    bool load_data) {
+    bool load_data,
+    bool iterate_if_no_chain) {
     using namespace arcticdb::pipelines;
 
-    auto entries = get_incomplete_append_slices_for_stream_id(store, stream_id, via_iteration, load_data);
+    auto entries = get_incomplete_append_slices_for_stream_id(
+        store, stream_id, via_iteration, load_data, iterate_if_no_chain);
 
     util::variant_match(range,
                         [](const RowRange &) {
@@ -473,13 +494,17 @@ void remove_incomplete_segments(
 std::vector<AppendMapEntry> load_via_list(
         const std::shared_ptr<Store>& store,
         const StreamId& stream_id,
-        bool load_data) {
+        bool load_data,
+        bool iterate_if_no_chain) {
     using namespace arcticdb::pipelines;
 
     ARCTICDB_DEBUG(log::version(), "Getting incomplete segments for stream {}", stream_id);
     ARCTICDB_SAMPLE_DEFAULT(GetIncomplete)
 
     auto [next_key, total_rows] = read_head(store, stream_id);
+    if (!next_key && iterate_if_no_chain)
+        return load_via_iteration(store, stream_id, load_data);
+
     std::vector<AppendMapEntry> output;
 
     try {
@@ -537,10 +562,7 @@ AppendMapEntry create_entry(const TimeseriesDescriptor& tsd) {
     return entry;
 }
 
-AppendMapEntry entry_from_key(const std::shared_ptr<StreamSource>& store, const AtomKey& key, bool load_data) {
-    auto opts = storage::ReadKeyOpts{};
-    opts.dont_warn_about_missing_key = true;
-    auto [tsd, seg] = get_descriptor_and_data(store, key, load_data, opts);
+AppendMapEntry entry_from_descriptor(const AtomKey& key, const TimeseriesDescriptor& tsd, std::optional<SegmentInMemory>&& seg) {
     auto entry = create_entry(tsd);
     auto descriptor = std::make_shared<StreamDescriptor>();
     auto desc = std::make_shared<StreamDescriptor>(tsd.as_stream_descriptor());
@@ -555,6 +577,29 @@ AppendMapEntry entry_from_key(const std::shared_ptr<StreamSource>& store, const
     return entry;
 }
 
+AppendMapEntry entry_from_key(const std::shared_ptr<StreamSource>& store, const AtomKey& key, bool load_data) {
+    auto opts = storage::ReadKeyOpts{};
+    opts.dont_warn_about_missing_key = true;
+    auto [tsd, seg] = get_descriptor_and_data(store, key, load_data, opts);
+    return entry_from_descriptor(key, tsd, std::move(seg));
+}
+
+folly::Future<AppendMapEntry> async_entry_from_key(const std::shared_ptr<StreamSource>& store, const AtomKey& key, bool load_data) {
+    auto opts = storage::ReadKeyOpts{};
+    opts.dont_warn_about_missing_key = true;
+    if(load_data) {
+        return store->read(key, opts).thenValue([key](std::pair<VariantKey, SegmentInMemory>&& key_seg) {
+            auto tsd = key_seg.second.index_descriptor();
+            return entry_from_descriptor(key, tsd, std::make_optional<SegmentInMemory>(std::move(key_seg.second)));
+        });
+    }
+    return store->read_compressed(key, opts).thenValue([key](storage::KeySegmentPair&& key_seg) {
+        auto tsd = decode_timeseries_descriptor_for_incompletes(*key_seg.segment_ptr());
+        internal::check<ErrorCode::E_ASSERTION_FAILURE>(tsd.has_value(), "Failed to decode timeseries descriptor");
+        return entry_from_descriptor(key, *tsd, std::nullopt);
+    });
+}
+
 void append_incomplete(
     const std::shared_ptr<Store>& store,
     const StreamId& stream_id,
@@ -630,14 +675,15 @@ std::vector<AppendMapEntry> get_incomplete_append_slices_for_stream_id(
         const std::shared_ptr<Store> &store,
         const StreamId &stream_id,
         bool via_iteration,
-        bool load_data) {
+        bool load_data,
+        bool iterate_if_no_chain) {
     using namespace arcticdb::pipelines;
     std::vector<AppendMapEntry> entries;
 
     if(via_iteration) {
         entries = load_via_iteration(store, stream_id, load_data);
     } else {
-        entries = load_via_list(store, stream_id, load_data);
+        entries = load_via_list(store, stream_id, load_data, iterate_if_no_chain);
     }
 
     if(!entries.empty()) {
@@ -666,6 +712,45 @@ std::vector<VariantKey> read_incomplete_keys_for_symbol(
     return slice_and_key;
 }
 
+StagedDataSummary get_staged_data_summary(
+    const std::shared_ptr<Store>& store,
+    const StreamId& stream_id,
+    bool include_sizes
+) {
+    auto prefix = std::holds_alternative<StringId>(stream_id) ? std::get<StringId>(stream_id) : std::string();
+    std::vector<AtomKey> keys;
+    store->iterate_type(KeyType::APPEND_DATA, [&keys, &stream_id] (const auto& vk) {
+        const auto& key = to_atom(vk);
+        if(key.id() == stream_id)
+            keys.emplace_back(key);
+    }, prefix);
+
+    StagedDataSummary summary;
+    summary.segment_count_ = keys.size();
+    for (const auto& key : keys)
+        summary.oldest_creation_ts_ = std::min(summary.oldest_creation_ts_.value_or(key.creation_ts()), key.creation_ts());
+
+    if(include_sizes) {
+        auto opts = storage::ReadKeyOpts{};
+        opts.dont_warn_about_missing_key = true;
+        std::vector<folly::Future<size_t>> size_futures;
+        size_futures.reserve(keys.size());
+        for (const auto& key : keys) {
+            size_futures.emplace_back(store->read_compressed(key, opts).thenValue([](storage::KeySegmentPair&& key_seg) {
+                return key_seg.segment_ptr()->calculate_size();
+            }));
+        }
+        for (auto&& size : folly::collectAll(size_futures).get()) {
+            if (size.hasException<storage::KeyNotFoundException>())
+                continue;
+
+            summary.compressed_bytes_ += size.value();
+        }
+    }
+    ARCTICDB_DEBUG(log::version(), "Stream {} has {} staged segments of {} bytes", stream_id, summary.segment_count_, summary.compressed_bytes_);
+    return summary;
+}
+
 std::optional<int64_t> latest_incomplete_timestamp(
     const std::shared_ptr<Store>& store,
     const StreamId& stream_id
@@ -30,6 +30,12 @@ struct WriteIncompleteOptions {
     const std::optional<std::vector<std::string>> sort_columns;
 };
 
+struct StagedDataSummary {
+    size_t segment_count_ = 0;
+    size_t compressed_bytes_ = 0;
+    std::optional<timestamp> oldest_creation_ts_;
+};
+
 std::pair<std::optional<entity::AtomKey>, size_t> read_head(
     const std::shared_ptr<stream::StreamSource>& store,
     StreamId stream_id);
@@ -40,13 +46,16 @@ std::set<StreamId> get_incomplete_symbols(const std::shared_ptr<Store>& store);
 
 std::set<StreamId> get_active_incomplete_refs(const std::shared_ptr<Store>& store);
 
+// With iterate_if_no_chain, a symbol without an append chain has its staged segments listed instead, as for
+// via_iteration, so that data staged either way is found with a single read of the append ref
 std::vector<pipelines::SliceAndKey> get_incomplete(
     const std::shared_ptr<Store> &store,
     const StreamId &stream_id,
     const pipelines::FilterRange &range,
     uint64_t last_row,
     bool via_iteration,
-    bool load_data);
+    bool load_data,
+    bool iterate_if_no_chain = false);
 
 void remove_incomplete_segments(
     const std::shared_ptr<Store>& store,
@@ -92,4 +101,10 @@ std::vector<VariantKey> read_incomplete_keys_for_symbol(
     const StreamId& stream_id,
     bool via_iteration);
 
+// Sizes require reading every staged segment, so are only calculated if include_sizes is set
+StagedDataSummary get_staged_data_summary(
+    const std::shared_ptr<Store>& store,
+    const StreamId& stream_id,
+    bool include_sizes);
+
 } //namespace arcticdb
@@ -245,6 +245,7 @@ inline auto generate_keys_from_segments(
                             expected_key_type, expected_index_type.value_or(KeyType::UNDEFINED), read_key
                         );
                         key_segs.push(read_store.read_sync(read_key));
+                        continue;
                     }
                     yield(read_key);
                 }
@@ -0,0 +1,122 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#pragma once
+
+#include <arcticdb/util/hash.hpp>
+#include <arcticdb/util/preconditions.hpp>
+
+#include <fmt/format.h>
+
+#include <cstdint>
+#include <string>
+#include <string_view>
+#include <vector>
+
+namespace arcticdb {
+
+// Numeric values are canonicalised to doubles before hashing so that a query value of a different (but comparable)
+// type to the column, e.g. an int64 literal against a float64 column, hashes identically to the stored value.
+// If you change anything here including the seed, existing column stats will silently produce false negatives.
+inline HashedValue membership_hash(double value) {
+    // -0.0 == 0.0, so they must hash identically
+    if (value == 0.0)
+        value = 0.0;
+    HashAccum accum;
+    accum(&value);
+    return accum.digest();
+}
+
+inline HashedValue membership_hash(std::string_view value) {
+    constexpr HashedValue seed = 0x42;
+    return XXH64(value.data(), value.size(), seed);
+}
+
+inline std::string hash_to_hex(HashedValue hash) {
+    return fmt::format("{:016x}", hash);
+}
+
+inline HashedValue hex_to_hash(std::string_view hex) {
+    internal::check<ErrorCode::E_ASSERTION_FAILURE>(hex.size() == 16, "Expected 16 hex characters, got {}", hex.size());
+    HashedValue res = 0;
+    for (auto c: hex) {
+        res <<= 4;
+        if (c >= '0' && c <= '9')
+            res |= static_cast<HashedValue>(c - '0');
+        else if (c >= 'a' && c <= 'f')
+            res |= static_cast<HashedValue>(c - 'a' + 10);
+        else
+            internal::raise<ErrorCode::E_ASSERTION_FAILURE>("Unexpected character '{}' in hex string", c);
+    }
+    return res;
+}
+
+/*
+ * Fixed size bloom filter over pre-hashed 64-bit values. The k probe positions are derived from the single 64-bit hash
+ * using double hashing (Kirsch-Mitzenmacher), so inserting and probing never rehash the underlying value.
+ * Serialised as a hex string, most significant word first, so that it can be stored in a column stats segment.
+ */
+class BloomFilter {
+public:
+    static constexpr size_t num_hashes = 4;
+
+    explicit BloomFilter(size_t num_bits) :
+        words_((std::max<size_t>(num_bits, 64) + 63) / 64, 0) {
+    }
+
+    void insert(HashedValue hash) {
+        for_each_bit(hash, [this](size_t bit) {
+            words_[bit / 64] |= uint64_t(1) << (bit % 64);
+        });
+    }
+
+    [[nodiscard]] bool may_contain(HashedValue hash) const {
+        bool res = true;
+        for_each_bit(hash, [this, &res](size_t bit) {
+            res &= (words_[bit / 64] & (uint64_t(1) << (bit % 64))) != 0;
+        });
+        return res;
+    }
+
+    [[nodiscard]] size_t num_bits() const {
+        return words_.size() * 64;
+    }
+
+    [[nodiscard]] std::string to_hex() const {
+        std::string res;
+        res.reserve(words_.size() * 16);
+        for (auto it = words_.rbegin(); it != words_.rend(); ++it)
+            res += hash_to_hex(*it);
+        return res;
+    }
+
+    static BloomFilter from_hex(std::string_view hex) {
+        internal::check<ErrorCode::E_ASSERTION_FAILURE>(
+                !hex.empty() && hex.size() % 16 == 0,
+                "Unexpected bloom filter hex string length {}", hex.size());
+        BloomFilter res(hex.size() * 4);
+        const auto num_words = res.words_.size();
+        for (size_t i = 0; i < num_words; ++i)
+            res.words_[num_words - 1 - i] = hex_to_hash(hex.substr(i * 16, 16));
+        return res;
+    }
+
+private:
+    template<typename Func>
+    void for_each_bit(HashedValue hash, Func&& func) const {
+        const auto h1 = static_cast<uint32_t>(hash);
+        // Must be odd so that successive probes do not collapse onto the same bit
+        const auto h2 = static_cast<uint32_t>(hash >> 32) | 1U;
+        const auto bits = num_bits();
+        for (size_t i = 0; i < num_hashes; ++i)
+            func((static_cast<uint64_t>(h1) + i * static_cast<uint64_t>(h2)) % bits);
+    }
+
+    std::vector<uint64_t> words_;
+};
+
+} // namespace arcticdb
@@ -13,6 +13,7 @@
 #include <arcticdb/entity/types.hpp>
 #include <arcticdb/util/lazy.hpp>
 
+#include <string>
 #include <vector>
 #include <folly/concurrency/ConcurrentHashMap.h>
 #include <boost/container/small_vector.hpp>
@@ -26,7 +27,8 @@ namespace entity {
 struct TypeDescriptor;
 }
 
-using UniqueStringMapType = folly::ConcurrentHashMap<std::string_view, PyObject*>;
+// Keys are owned by the map, as the string pools of the segments they were read from can be freed before the read ends
+using UniqueStringMapType = folly::ConcurrentHashMap<std::string, PyObject*>;
 
 struct DecodePathDataImpl {
     LazyInit<UniqueStringMapType> unique_string_map_;
@@ -7,6 +7,7 @@
 
 #include <arcticdb/util/global_lifetimes.hpp>
 #include <arcticdb/async/task_scheduler.hpp>
+#include <arcticdb/async/segment_cache.hpp>
 #include <arcticdb/util/allocator.hpp>
 #include <arcticdb/storage/s3/s3_api.hpp>
 #include <arcticdb/storage/mongo/mongo_instance.hpp>
@@ -27,6 +28,7 @@ ModuleData::~ModuleData() {
 #ifdef ARCTICDB_COUNT_ALLOCATIONS
     AllocationTracker::destroy_instance();
 #endif
+    async::SegmentCache::destroy_instance();
     BufferPool::destroy_instance();
     TracingData::destroy_instance();
     Allocator::destroy_instance();
@@ -9,6 +9,7 @@
 
 #include <memory>
 #include <arcticdb/column_store/key_segment.hpp>
+#include <arcticdb/pipeline/index_segment_reader.hpp>
 #include <arcticdb/storage/store.hpp>
 #include <arcticdb/stream/stream_reader.hpp>
 #include <arcticdb/stream/stream_utils.hpp>
@@ -136,6 +137,7 @@ inline ankerl::unordered_dense::set<AtomKey> recurse_segment(
                     res.emplace(std::move(key));
                     break;
                 case KeyType::TABLE_INDEX:
+                case KeyType::TABLE_INDEX_PAGE:
                 case KeyType::MULTI_KEY: {
                     auto sub_keys = recurse_index_key(store, key, version_id);
                     for (auto&& sub_key: sub_keys) {
@@ -182,7 +184,15 @@ inline ankerl::unordered_dense::set<AtomKey> recurse_index_keys(
                     res.emplace(std::move(key));
                 }
             } else if (index_key.type() == KeyType::TABLE_INDEX) {
-                KeySegment key_segment(store->read_sync(index_key, opts).second, SymbolStructure::SAME);
+                auto segment = store->read_sync(index_key, opts).second;
+                if (pipelines::index::is_paged_index(segment)) {
+                    // Recurse into the pages as for a multi-index key, which includes the page keys themselves
+                    for (auto&& key : recurse_segment(store, std::move(segment), std::nullopt)) {
+                        res.emplace(std::move(key));
+                    }
+                    continue;
+                }
+                KeySegment key_segment(std::move(segment), SymbolStructure::SAME);
                 auto data_keys = key_segment.materialise();
                 util::variant_match(
                     data_keys,
@@ -4,8 +4,14 @@
  *
  * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
  */
-#include <shared_mutex>
+
+#pragma once
+
+#include <list>
 #include <memory>
+#include <mutex>
+#include <optional>
+#include <shared_mutex>
 
 #include <ankerl/unordered_dense.h>
 #include <arcticdb/util/constructors.hpp>
@@ -36,7 +42,8 @@ public:
     }
 
     [[nodiscard]] std::optional<ValueType> get(const KeyType& key) const {
-        std::shared_lock lock(mutex_);
+        // Moving the found node to the front of the list is a write, so the lock must be exclusive
+        std::unique_lock lock(mutex_);
         ARCTICDB_DEBUG(log::inmem(), "Looking for key {}", key);
         auto it = cache_.find(key);
         if (it == cache_.end()) {
@@ -79,4 +86,122 @@ public:
     }
 };
 
-}
\ No newline at end of file
+struct LRUCacheStats {
+    uint64_t hits_{0};
+    uint64_t misses_{0};
+    uint64_t evictions_{0};
+    size_t entries_{0};
+    size_t bytes_{0};
+};
+
+/*
+ * As LRUCache, but bounded by the total size of the values it holds rather than by the number of entries. The size
+ * of each value is supplied by the caller on insertion. Hits, misses, and evictions are counted so that the
+ * effectiveness of the cache can be monitored.
+ */
+template <typename KeyType, typename ValueType>
+class SizeBoundedLRUCache {
+    struct Node {
+        KeyType key;
+        ValueType value;
+        size_t bytes;
+        Node(const KeyType& k, ValueType&& v, size_t b) : key(k), value(std::move(v)), bytes(b) {}
+    };
+
+    size_t capacity_bytes_;
+    size_t bytes_{0};
+    uint64_t hits_{0};
+    uint64_t misses_{0};
+    uint64_t evictions_{0};
+    std::list<Node> list_;
+    mutable std::mutex mutex_;
+    ankerl::unordered_dense::map<KeyType, typename std::list<Node>::iterator> cache_;
+
+    // Moves least recently used nodes into evicted until bytes_ + required_bytes fits within the capacity
+    void evict_for(size_t required_bytes, std::list<Node>& evicted) {
+        while (!list_.empty() && bytes_ + required_bytes > capacity_bytes_) {
+            ARCTICDB_DEBUG(log::inmem(), "Evicting key {}", list_.back().key);
+            bytes_ -= list_.back().bytes;
+            cache_.erase(list_.back().key);
+            evicted.splice(evicted.begin(), list_, std::prev(list_.end()));
+            ++evictions_;
+        }
+    }
+
+public:
+    explicit SizeBoundedLRUCache(size_t capacity_bytes) noexcept : capacity_bytes_(capacity_bytes) {}
+
+    ARCTICDB_NO_MOVE_OR_COPY(SizeBoundedLRUCache)
+
+    [[nodiscard]] size_t capacity_bytes() const {
+        std::lock_guard lock(mutex_);
+        return capacity_bytes_;
+    }
+
+    void set_capacity_bytes(size_t capacity_bytes) {
+        // Values are destroyed after the lock is released, in case destroying them calls back into the cache
+        std::list<Node> evicted;
+        std::lock_guard lock(mutex_);
+        capacity_bytes_ = capacity_bytes;
+        evict_for(0, evicted);
+    }
+
+    [[nodiscard]] std::optional<ValueType> get(const KeyType& key) {
+        std::lock_guard lock(mutex_);
+        auto it = cache_.find(key);
+        if (it == cache_.end()) {
+            ARCTICDB_DEBUG(log::inmem(), "Key {} does not exist", key);
+            ++misses_;
+            return std::nullopt;
+        }
+        ARCTICDB_DEBUG(log::inmem(), "Key {} found", key);
+        ++hits_;
+        list_.splice(list_.begin(), list_, it->second);
+        return it->second->value;
+    }
+
+    // Returns false, and does not store the value, if it is larger than the capacity of the cache
+    bool put(const KeyType& key, ValueType value, size_t bytes) {
+        std::list<Node> evicted;
+        std::lock_guard lock(mutex_);
+        ARCTICDB_DEBUG(log::inmem(), "Adding key {} of {} bytes", key, bytes);
+        if (auto it = cache_.find(key); it != cache_.end()) {
+            bytes_ -= it->second->bytes;
+            evicted.splice(evicted.begin(), list_, it->second);
+            cache_.erase(it);
+        }
+        if (bytes > capacity_bytes_) {
+            return false;
+        }
+        evict_for(bytes, evicted);
+        list_.emplace_front(key, std::move(value), bytes);
+        cache_[list_.front().key] = list_.begin();
+        bytes_ += bytes;
+        return true;
+    }
+
+    void remove(const KeyType& key) {
+        std::list<Node> evicted;
+        std::lock_guard lock(mutex_);
+        if (auto it = cache_.find(key); it != cache_.end()) {
+            bytes_ -= it->second->bytes;
+            evicted.splice(evicted.begin(), list_, it->second);
+            cache_.erase(it);
+        }
+    }
+
+    void clear() {
+        std::list<Node> evicted;
+        std::lock_guard lock(mutex_);
+        evicted.splice(evicted.begin(), list_);
+        cache_.clear();
+        bytes_ = 0;
+    }
+
+    [[nodiscard]] LRUCacheStats stats() const {
+        std::lock_guard lock(mutex_);
+        return LRUCacheStats{hits_, misses_, evictions_, cache_.size(), bytes_};
+    }
+};
+
+}
@@ -8,6 +8,8 @@
 #pragma once
 
 #include <pcre.h>
+#include <string>
+#include <string_view>
 #include <arcticdb/util/constructors.hpp>
 #include <arcticdb/util/preconditions.hpp>
 
@@ -89,6 +91,10 @@ public:
     }
 
     bool match(const std::string& text) {
+        return match(std::string_view{text});
+    }
+
+    bool match(std::string_view text) {
         ResultsType res = ::pcre_exec(pattern_.handle(), extra_, text.data(), static_cast<int>(text.size()), 0, options_, &results_[0], static_cast<int>(results_.size()));
         util::check(res >= 0 || res == PCRE_ERROR_NOMATCH, "Invalid result in regex compile with pattern {} and text {}: {}", pattern_.text(), text, res);
         return res > 0;
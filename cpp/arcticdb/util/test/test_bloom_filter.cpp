@@ -0,0 +1,52 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <gtest/gtest.h>
+#include <arcticdb/util/bloom_filter.hpp>
+
+using namespace arcticdb;
+
+TEST(BloomFilter, NoFalseNegatives) {
+    BloomFilter filter(1024);
+    for (int i = 0; i < 100; ++i)
+        filter.insert(membership_hash(static_cast<double>(i)));
+    for (int i = 0; i < 100; ++i)
+        EXPECT_TRUE(filter.may_contain(membership_hash(static_cast<double>(i))));
+}
+
+TEST(BloomFilter, RejectsMostAbsentValues) {
+    BloomFilter filter(4096);
+    for (int i = 0; i < 100; ++i)
+        filter.insert(membership_hash(fmt::format("value_{}", i)));
+    size_t false_positives = 0;
+    for (int i = 100; i < 1100; ++i)
+        false_positives += filter.may_contain(membership_hash(fmt::format("value_{}", i)));
+    // Expected false positive rate with these parameters is ~0.1%
+    EXPECT_LT(false_positives, 20u);
+}
+
+TEST(BloomFilter, HexRoundTrip) {
+    BloomFilter filter(100);
+    ASSERT_EQ(filter.num_bits(), 128u);
+    filter.insert(membership_hash(std::string_view{"hello"}));
+    filter.insert(membership_hash(3.5));
+    auto hex = filter.to_hex();
+    ASSERT_EQ(hex.size(), 32u);
+    auto round_tripped = BloomFilter::from_hex(hex);
+    EXPECT_EQ(round_tripped.to_hex(), hex);
+    EXPECT_TRUE(round_tripped.may_contain(membership_hash(std::string_view{"hello"})));
+    EXPECT_TRUE(round_tripped.may_contain(membership_hash(3.5)));
+}
+
+TEST(BloomFilter, SignedZero) {
+    EXPECT_EQ(membership_hash(0.0), membership_hash(-0.0));
+}
+
+TEST(BloomFilter, HashHexRoundTrip) {
+    HashedValue hash = membership_hash(std::string_view{"arctic"});
+    EXPECT_EQ(hex_to_hash(hash_to_hex(hash)), hash);
+}
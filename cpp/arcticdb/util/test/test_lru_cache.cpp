@@ -0,0 +1,60 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <gtest/gtest.h>
+
+#include <arcticdb/util/lru_cache.hpp>
+
+using namespace arcticdb;
+
+TEST(SizeBoundedLRUCache, EvictsLeastRecentlyUsedBySize) {
+    SizeBoundedLRUCache<int, int> cache(10);
+    ASSERT_TRUE(cache.put(1, 10, 4));
+    ASSERT_TRUE(cache.put(2, 20, 4));
+    // Makes 2 the least recently used
+    ASSERT_EQ(cache.get(1), 10);
+    ASSERT_TRUE(cache.put(3, 30, 4));
+    ASSERT_FALSE(cache.get(2).has_value());
+    ASSERT_EQ(cache.get(1), 10);
+    ASSERT_EQ(cache.get(3), 30);
+    auto stats = cache.stats();
+    ASSERT_EQ(stats.hits_, 3U);
+    ASSERT_EQ(stats.misses_, 1U);
+    ASSERT_EQ(stats.evictions_, 1U);
+    ASSERT_EQ(stats.entries_, 2U);
+    ASSERT_EQ(stats.bytes_, 8U);
+}
+
+TEST(SizeBoundedLRUCache, ReplaceAndOversizedValues) {
+    SizeBoundedLRUCache<int, int> cache(10);
+    ASSERT_TRUE(cache.put(1, 10, 4));
+    ASSERT_TRUE(cache.put(1, 11, 6));
+    ASSERT_EQ(cache.get(1), 11);
+    ASSERT_EQ(cache.stats().bytes_, 6U);
+    // Too big to ever fit, and replaces the existing value
+    ASSERT_FALSE(cache.put(1, 12, 11));
+    ASSERT_FALSE(cache.get(1).has_value());
+    ASSERT_EQ(cache.stats().bytes_, 0U);
+    ASSERT_EQ(cache.stats().evictions_, 0U);
+}
+
+TEST(SizeBoundedLRUCache, ShrinkAndClear) {
+    SizeBoundedLRUCache<int, int> cache(10);
+    for (int key = 0; key < 5; ++key) {
+        ASSERT_TRUE(cache.put(key, key, 2));
+    }
+    cache.set_capacity_bytes(4);
+    ASSERT_EQ(cache.capacity_bytes(), 4U);
+    ASSERT_EQ(cache.stats().entries_, 2U);
+    ASSERT_EQ(cache.get(4), 4);
+    ASSERT_EQ(cache.get(3), 3);
+    cache.remove(4);
+    ASSERT_EQ(cache.stats().bytes_, 2U);
+    cache.clear();
+    ASSERT_EQ(cache.stats().entries_, 0U);
+    ASSERT_EQ(cache.stats().bytes_, 0U);
+}
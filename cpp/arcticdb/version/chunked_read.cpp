@@ -0,0 +1,185 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <arcticdb/version/chunked_read.hpp>
+#include <arcticdb/async/task_scheduler.hpp>
+#include <arcticdb/pipeline/index_segment_reader.hpp>
+#include <arcticdb/util/preconditions.hpp>
+
+#include <algorithm>
+#include <map>
+
+namespace arcticdb::version_store {
+
+std::vector<pipelines::RowRange> chunk_row_slices(
+        const std::vector<pipelines::SliceAndKey>& slice_and_keys,
+        const std::optional<TimestampRange>& date_range,
+        uint64_t chunk_rows) {
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(chunk_rows > 0, "chunk_rows must be positive");
+
+    // With column slicing there is one slice per column-slice, and the slices for a given row-slice are not guaranteed
+    // to be adjacent, so dedupe on the row range
+    std::map<size_t, size_t> row_slices;
+    for (const auto& slice_and_key: slice_and_keys) {
+        if (date_range.has_value()) {
+            const auto& key = slice_and_key.key();
+            // The end index of a data key is one greater than the last index value in the segment
+            if (key.start_time() > date_range->second || key.end_time() <= date_range->first)
+                continue;
+        }
+        const auto& row_range = slice_and_key.slice().row_range;
+        row_slices.try_emplace(row_range.first, row_range.second);
+    }
+
+    std::vector<pipelines::RowRange> res;
+    std::optional<pipelines::RowRange> current;
+    for (const auto& [start_row, end_row]: row_slices) {
+        if (current.has_value() && current->second == start_row) {
+            current->second = end_row;
+        } else {
+            // Non-contiguous because the intervening row-slices were filtered out by the date range
+            if (current.has_value())
+                res.emplace_back(*current);
+            current = pipelines::RowRange{start_row, end_row};
+        }
+        if (current->diff() >= chunk_rows) {
+            res.emplace_back(*current);
+            current.reset();
+        }
+    }
+    if (current.has_value())
+        res.emplace_back(*current);
+    return res;
+}
+
+ChunkedReader::ChunkedReader(
+        std::shared_ptr<Store> store,
+        VersionedItem versioned_item,
+        std::shared_ptr<ReadQuery> read_query,
+        ReadOptions read_options,
+        std::function<std::shared_ptr<std::any>()> handler_data_factory,
+        std::optional<TimestampRange> date_range,
+        uint64_t chunk_rows,
+        uint64_t prefetch) :
+        store_(std::move(store)),
+        versioned_item_(std::move(versioned_item)),
+        read_query_(std::move(read_query)),
+        read_options_(std::move(read_options)),
+        handler_data_factory_(std::move(handler_data_factory)),
+        prefetch_(prefetch),
+        pipeline_context_(std::make_shared<pipelines::PipelineContext>()) {
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+        !read_query_->row_range.has_value() && std::holds_alternative<std::monostate>(read_query_->row_filter),
+        "Chunked reads do not support row_range or date_range filters on the read query, use clauses instead");
+    auto column_stats_fut = read_column_stats_for_pruning_async(store_, versioned_item_, *read_query_);
+    auto index_segment_reader = pipelines::index::get_index_reader(versioned_item_.key_, store_);
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+        !index_segment_reader.is_pickled(),
+        "Chunked reads are not supported for pickled data, use read instead");
+    const bool filter_on_date_range = date_range.has_value() && index_segment_reader.has_timestamp_index();
+    pipeline_context_->stream_id_ = versioned_item_.key_.id();
+    read_index_segment_reader_to_pipeline(
+        pipeline_context_, std::move(index_segment_reader), versioned_item_, *read_query_, read_options_);
+    std::ignore = prune_slices_using_column_stats(
+        pipeline_context_, std::move(column_stats_fut), versioned_item_, *read_query_, read_options_);
+
+    chunks_ = chunk_row_slices(
+        pipeline_context_->slice_and_keys_, filter_on_date_range ? date_range : std::nullopt, chunk_rows);
+    chunk_slices_.resize(chunks_.size());
+    for (const auto& slice_and_key: pipeline_context_->slice_and_keys_) {
+        const auto start_row = slice_and_key.slice().row_range.first;
+        // The last chunk starting at or before the row-slice, which holds it unless the date range dropped it
+        auto chunk = std::upper_bound(
+            chunks_.begin(),
+            chunks_.end(),
+            start_row,
+            [](size_t row, const pipelines::RowRange& range) { return row < range.first; });
+        if (chunk == chunks_.begin())
+            continue;
+        --chunk;
+        if (start_row < chunk->second)
+            chunk_slices_[std::distance(chunks_.begin(), chunk)].emplace_back(slice_and_key);
+    }
+    ARCTICDB_DEBUG(log::version(), "Chunked read of {} will produce {} chunks", versioned_item_.symbol(), chunks_.size());
+    schedule_reads(prefetch_);
+}
+
+std::shared_ptr<pipelines::PipelineContext> ChunkedReader::chunk_pipeline_context(
+        std::vector<pipelines::SliceAndKey>&& slice_and_keys) const {
+    auto res = std::make_shared<pipelines::PipelineContext>();
+    res->stream_id_ = pipeline_context_->stream_id_;
+    res->desc_ = pipeline_context_->desc_;
+    res->selected_columns_ = pipeline_context_->selected_columns_;
+    res->overall_column_bitset_ = pipeline_context_->overall_column_bitset_;
+    res->rows_ = pipeline_context_->rows_;
+    // Processing clauses can modify the normalization metadata
+    res->norm_meta_ = std::make_shared<arcticdb::proto::descriptors::NormalizationMetadata>(
+        *pipeline_context_->norm_meta_);
+    res->user_meta_ = std::make_unique<arcticdb::proto::descriptors::UserDefinedMetadata>(
+        *pipeline_context_->user_meta_);
+    res->bucketize_dynamic_ = pipeline_context_->bucketize_dynamic_;
+    res->slice_and_keys_ = std::move(slice_and_keys);
+    res->total_rows_ = res->calc_rows();
+    return res;
+}
+
+ChunkedReader::~ChunkedReader() {
+    try {
+        close();
+    } catch (const std::exception& e) {
+        log::version().warn("Failed to clean up chunked read of {}: {}", versioned_item_.symbol(), e.what());
+    }
+}
+
+void ChunkedReader::schedule_reads(size_t max_in_flight) {
+    while (next_chunk_to_schedule_ < chunks_.size() && in_flight_.size() < max_in_flight) {
+        const auto chunk_idx = next_chunk_to_schedule_++;
+        // Each chunk needs its own copy of the query, as the clauses are mutated as the read proceeds
+        auto chunk_query = std::make_shared<ReadQuery>();
+        chunk_query->columns = read_query_->columns;
+        chunk_query->row_filter = chunks_[chunk_idx];
+        std::vector<std::shared_ptr<Clause>> clauses;
+        for (const auto& clause: read_query_->clauses_)
+            clauses.emplace_back(std::make_shared<Clause>(*clause));
+        if (!clauses.empty())
+            chunk_query->add_clauses(clauses);
+
+        InFlightRead read{handler_data_factory_(), folly::Future<ReadVersionOutput>::makeEmpty()};
+        read.future_ = read_frame_from_pipeline_context(
+            store_,
+            chunk_pipeline_context(std::move(chunk_slices_[chunk_idx])),
+            chunk_query,
+            read_options_,
+            versioned_item_,
+            *read.handler_data_);
+        in_flight_.emplace_back(std::move(read));
+    }
+}
+
+std::optional<ChunkedReader::Chunk> ChunkedReader::next() {
+    // With no prefetching the chunk is only requested when asked for
+    schedule_reads(1);
+    if (in_flight_.empty())
+        return std::nullopt;
+    auto read = std::move(in_flight_.front());
+    in_flight_.pop_front();
+    Chunk res{std::move(read.future_).get(), std::move(read.handler_data_)};
+    // Keep prefetch_ reads in flight while the caller processes this chunk
+    schedule_reads(prefetch_);
+    return res;
+}
+
+void ChunkedReader::close() {
+    next_chunk_to_schedule_ = chunks_.size();
+    while (!in_flight_.empty()) {
+        // Results are discarded, but the reads must complete before the handler data they reference is freed
+        std::move(in_flight_.front().future_).wait();
+        in_flight_.pop_front();
+    }
+}
+
+} // namespace arcticdb::version_store
@@ -0,0 +1,116 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#pragma once
+
+#include <arcticdb/entity/versioned_item.hpp>
+#include <arcticdb/pipeline/pipeline_context.hpp>
+#include <arcticdb/pipeline/read_options.hpp>
+#include <arcticdb/pipeline/read_query.hpp>
+#include <arcticdb/version/version_core.hpp>
+
+#include <folly/futures/Future.h>
+
+#include <any>
+#include <deque>
+#include <functional>
+#include <memory>
+#include <optional>
+#include <vector>
+
+namespace arcticdb::version_store {
+
+/*
+ * Reads a single version of a symbol as a sequence of frames, each covering a group of consecutive row-slices holding
+ * at least chunk_rows rows (apart from the last one). Chunk boundaries always coincide with row-slice boundaries, so
+ * each data segment is read exactly once and no chunk ever needs truncating.
+ * The index (and column stats, if they can prune the read) are read once, when the reader is constructed, and each
+ * chunk is read from the row-slices of the resulting pipeline context that fall in its row range.
+ * Up to prefetch chunks beyond the one being consumed are read and decoded in the background on the async pools, so
+ * peak memory usage is bounded by roughly (prefetch + 1) * chunk_rows rows, regardless of the size of the symbol.
+ * The handler data for each chunk comes from handler_data_factory, and is released on whichever thread calls next() or
+ * close(), so handler data that must be freed under the GIL should acquire it in its deleter.
+ */
+class ChunkedReader {
+public:
+    ChunkedReader(
+        std::shared_ptr<Store> store,
+        VersionedItem versioned_item,
+        std::shared_ptr<ReadQuery> read_query,
+        ReadOptions read_options,
+        std::function<std::shared_ptr<std::any>()> handler_data_factory,
+        std::optional<TimestampRange> date_range,
+        uint64_t chunk_rows,
+        uint64_t prefetch);
+
+    ARCTICDB_NO_MOVE_OR_COPY(ChunkedReader)
+
+    ~ChunkedReader();
+
+    struct Chunk {
+        ReadVersionOutput output_;
+        // The handler data the chunk was read with, which the Arrow output format takes its string dictionaries from
+        std::shared_ptr<std::any> handler_data_;
+    };
+
+    // Returns the next chunk, or std::nullopt once the whole version has been consumed. Blocks until the chunk has
+    // been read, so callers holding the GIL should release it first
+    std::optional<Chunk> next();
+
+    // Waits for any in-flight reads to complete and discards them. Subsequent calls to next() return std::nullopt
+    void close();
+
+    [[nodiscard]] size_t num_chunks() const {
+        return chunk_slices_.size();
+    }
+
+    [[nodiscard]] const VersionedItem& versioned_item() const {
+        return versioned_item_;
+    }
+
+    [[nodiscard]] OutputFormat output_format() const {
+        return read_options_.output_format();
+    }
+
+private:
+    struct InFlightRead {
+        // read_frame_for_version holds a reference to the handler data until the future completes, so it must have
+        // a stable address
+        std::shared_ptr<std::any> handler_data_;
+        folly::Future<ReadVersionOutput> future_;
+    };
+
+    void schedule_reads(size_t max_in_flight);
+
+    // A pipeline context for a single chunk, sharing everything apart from the row-slices with pipeline_context_
+    std::shared_ptr<pipelines::PipelineContext> chunk_pipeline_context(
+        std::vector<pipelines::SliceAndKey>&& slice_and_keys) const;
+
+    std::shared_ptr<Store> store_;
+    VersionedItem versioned_item_;
+    std::shared_ptr<ReadQuery> read_query_;
+    ReadOptions read_options_;
+    std::function<std::shared_ptr<std::any>()> handler_data_factory_;
+    uint64_t prefetch_;
+    // Populated from the index of the whole version
+    std::shared_ptr<pipelines::PipelineContext> pipeline_context_;
+    std::vector<pipelines::RowRange> chunks_;
+    // The row-slices of pipeline_context_ in each chunk
+    std::vector<std::vector<pipelines::SliceAndKey>> chunk_slices_;
+    size_t next_chunk_to_schedule_ = 0;
+    std::deque<InFlightRead> in_flight_;
+};
+
+// Splits the row-slices into groups of consecutive slices, each covering at least chunk_rows rows (apart from the
+// last). If date_range is provided, which it must only be for timestamp indexed data, row-slices that cannot contain
+// any rows in the range are dropped first. Exposed for testing
+std::vector<pipelines::RowRange> chunk_row_slices(
+    const std::vector<pipelines::SliceAndKey>& slice_and_keys,
+    const std::optional<TimestampRange>& date_range,
+    uint64_t chunk_rows);
+
+} // namespace arcticdb::version_store
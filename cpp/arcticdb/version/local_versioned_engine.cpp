@@ -15,6 +15,7 @@
 #include <arcticdb/stream/stream_sink.hpp>
 #include <arcticdb/util/preconditions.hpp>
 #include <arcticdb/util/storage_lock.hpp>
+#include <arcticdb/util/reliable_storage_lock.hpp>
 #include <arcticdb/entity/metrics.hpp>
 #include <arcticdb/version/version_tasks.hpp>
 #include <arcticdb/pipeline/index_utils.hpp>
@@ -1078,6 +1079,39 @@ VersionedItem LocalVersionedEngine::compact_incomplete_dynamic(
     return versioned_item;
 }
 
+std::optional<VersionedItem> LocalVersionedEngine::compact_incomplete_unless_locked(
+    const StreamId& stream_id,
+    const std::optional<arcticdb::proto::descriptors::UserDefinedMetadata>& user_meta,
+    const CompactIncompleteOptions& options) {
+    // Concurrent finalizers of a symbol would both try to write the next version from overlapping staged segments
+    const auto lock_name = fmt::format("{}_staged_compaction", stream_id);
+    if (store()->supports_atomic_writes()) {
+        const auto timeout = ConfigsMap::instance()->get_int("StagedData.CompactionLockTimeoutMs", 60'000) * ONE_MILLISECOND;
+        lock::ReliableStorageLock<> lock{lock_name, store(), timeout};
+        auto lock_result = lock.try_take_lock();
+        if (std::holds_alternative<lock::LockInUse>(lock_result)) {
+            ARCTICDB_RUNTIME_DEBUG(log::version(), "Not compacting staged data for symbol {} due to lock contention", stream_id);
+            return std::nullopt;
+        }
+        lock::ReliableStorageLockGuard guard{lock, std::get<lock::AcquiredLock>(lock_result), std::nullopt};
+        return compact_incomplete_dynamic(stream_id, user_meta, options);
+    }
+
+    StorageLock lock{StringId{lock_name}};
+    if (!lock.try_lock(store())) {
+        ARCTICDB_RUNTIME_DEBUG(log::version(), "Not compacting staged data for symbol {} due to lock contention", stream_id);
+        return std::nullopt;
+    }
+    OnExit x([&lock, this] { lock.unlock(store()); });
+    return compact_incomplete_dynamic(stream_id, user_meta, options);
+}
+
+StagedDataSummary LocalVersionedEngine::get_staged_data_summary(
+    const StreamId& stream_id,
+    bool include_sizes) {
+    return arcticdb::get_staged_data_summary(store(), stream_id, include_sizes);
+}
+
 bool LocalVersionedEngine::is_symbol_fragmented(const StreamId& stream_id, std::optional<size_t> segment_size) {
     auto update_info = get_latest_undeleted_version_and_next_version_id(
             store(), version_map(), stream_id);
@@ -1180,6 +1214,26 @@ std::vector<std::variant<ReadVersionOutput, DataError>> LocalVersionedEngine::ba
     return transform_batch_items_or_throw(std::move(all_results), stream_ids, flags, version_queries);
 }
 
+ReadVersionOutput LocalVersionedEngine::batch_read_and_join_internal(
+    const std::vector<StreamId>& stream_ids,
+    const std::vector<VersionQuery>& version_queries,
+    std::vector<std::shared_ptr<ReadQuery>>& read_queries,
+    const ReadOptions& read_options,
+    std::vector<std::shared_ptr<Clause>>&& clauses,
+    std::any& handler_data) {
+    py::gil_scoped_release release_gil;
+    auto opt_index_keys = folly::collect(batch_get_versions_async(store(), version_map(), stream_ids, version_queries)).get();
+    std::vector<VersionedItem> versioned_items;
+    versioned_items.reserve(opt_index_keys.size());
+    for (auto&& [idx, opt_index_key]: folly::enumerate(opt_index_keys)) {
+        missing_data::check<ErrorCode::E_NO_SUCH_VERSION>(
+                opt_index_key.has_value(),
+                "batch_read_and_join_internal: version matching query '{}' not found for symbol '{}'", version_queries[idx], stream_ids[idx]);
+        versioned_items.emplace_back(std::move(*opt_index_key));
+    }
+    return read_and_join_frames(store(), versioned_items, std::move(read_queries), read_options, std::move(clauses), handler_data).get();
+}
+
 void LocalVersionedEngine::write_version_and_prune_previous(
         bool prune_previous_versions,
         const AtomKey& new_version,
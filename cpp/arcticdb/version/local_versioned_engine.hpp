@@ -116,6 +116,10 @@ public:
         const std::unordered_set<StreamId>& sids, const std::string& common_prefix
         );
 
+    StagedDataSummary get_staged_data_summary(
+        const StreamId& stream_id,
+        bool include_sizes);
+
     std::optional<VersionedItem> get_latest_version(
         const StreamId &stream_id);
 
@@ -298,6 +302,14 @@ public:
         const ReadOptions& read_options,
         std::any& handler_data);
 
+    ReadVersionOutput batch_read_and_join_internal(
+        const std::vector<StreamId>& stream_ids,
+        const std::vector<VersionQuery>& version_queries,
+        std::vector<std::shared_ptr<ReadQuery>>& read_queries,
+        const ReadOptions& read_options,
+        std::vector<std::shared_ptr<Clause>>&& clauses,
+        std::any& handler_data);
+
     std::vector<std::variant<DescriptorItem, DataError>> batch_read_descriptor_internal(
             const std::vector<StreamId>& stream_ids,
             const std::vector<VersionQuery>& version_queries,
@@ -415,6 +427,13 @@ protected:
             const std::optional<arcticdb::proto::descriptors::UserDefinedMetadata>& user_meta,
             const CompactIncompleteOptions& options);
 
+    // As compact_incomplete_dynamic, but returns std::nullopt without compacting if another process is already
+    // compacting the staged data of the symbol
+    std::optional<VersionedItem> compact_incomplete_unless_locked(
+            const StreamId& stream_id,
+            const std::optional<arcticdb::proto::descriptors::UserDefinedMetadata>& user_meta,
+            const CompactIncompleteOptions& options);
+
     /**
      * Take tombstoned indexes that have been pruned in the version map and perform the actual deletion
      * for indexes that are safe to delete (eg indexes contained in a snapshot are skipped).
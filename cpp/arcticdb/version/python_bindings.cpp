@@ -22,6 +22,7 @@
 #include <arcticdb/python/adapt_read_dataframe.hpp>
 #include <arcticdb/version/schema_checks.hpp>
 #include <arcticdb/util/pybind_mutex.hpp>
+#include <arcticdb/util/lru_cache.hpp>
 
 
 namespace arcticdb::version_store {
@@ -309,7 +310,40 @@ void register_bindings(py::module &version, py::exception<arcticdb::ArcticExcept
     py::class_<VersionedItem>(version, "VersionedItem")
         .def_property_readonly("symbol", &VersionedItem::symbol)
         .def_property_readonly("timestamp", &VersionedItem::timestamp)
-        .def_property_readonly("version", &VersionedItem::version);
+        .def_property_readonly("version", &VersionedItem::version)
+        .def_property_readonly("key", [](const VersionedItem& self) { return self.key_; })
+        .def_readonly("segments_skipped", &VersionedItem::segments_skipped_);
+
+    py::class_<LRUCacheStats>(version, "ResultCacheStats")
+        .def_readonly("hits", &LRUCacheStats::hits_)
+        .def_readonly("misses", &LRUCacheStats::misses_)
+        .def_readonly("evictions", &LRUCacheStats::evictions_)
+        .def_readonly("entries", &LRUCacheStats::entries_)
+        .def_readonly("bytes", &LRUCacheStats::bytes_)
+        .def("__repr__", [](const LRUCacheStats& stats) {
+            return fmt::format("ResultCacheStats(hits={}, misses={}, evictions={}, entries={}, bytes={})",
+                               stats.hits_, stats.misses_, stats.evictions_, stats.entries_, stats.bytes_);
+        });
+
+    // Holds Python objects, so every method must be called with the GIL held
+    using ReadResultCache = SizeBoundedLRUCache<std::string, py::object>;
+    py::class_<ReadResultCache, std::shared_ptr<ReadResultCache>>(version, "ReadResultCache")
+        .def(py::init<size_t>())
+        .def_property("capacity_bytes", &ReadResultCache::capacity_bytes, &ReadResultCache::set_capacity_bytes)
+        .def("get", &ReadResultCache::get)
+        .def("put", &ReadResultCache::put)
+        .def("remove", &ReadResultCache::remove)
+        .def("clear", &ReadResultCache::clear)
+        .def("stats", &ReadResultCache::stats);
+
+    py::class_<StagedDataSummary>(version, "StagedDataSummary")
+        .def_readonly("segment_count", &StagedDataSummary::segment_count_)
+        .def_readonly("compressed_bytes", &StagedDataSummary::compressed_bytes_)
+        .def_readonly("oldest_creation_ts", &StagedDataSummary::oldest_creation_ts_)
+        .def("__repr__", [](const StagedDataSummary& summary) {
+            return fmt::format("StagedDataSummary(segment_count={}, compressed_bytes={}, oldest_creation_ts={})",
+                               summary.segment_count_, summary.compressed_bytes_, summary.oldest_creation_ts_);
+        });
 
     py::class_<DescriptorItem>(version, "DescriptorItem")
         .def_property_readonly("symbol", &DescriptorItem::symbol)
@@ -368,17 +402,17 @@ void register_bindings(py::module &version, py::exception<arcticdb::ArcticExcept
             .def("__str__", &ProjectClause::to_string);
 
     py::class_<GroupByClause, std::shared_ptr<GroupByClause>>(version, "GroupByClause")
-            .def(py::init<std::string>())
-            .def_property_readonly("grouping_column", [](const GroupByClause& self) {
-                return self.grouping_column_;
+            .def(py::init<std::vector<std::string>>())
+            .def_property_readonly("grouping_columns", [](const GroupByClause& self) {
+                return self.grouping_columns_;
             })
             .def("__str__", &GroupByClause::to_string);
 
     py::class_<AggregationClause, std::shared_ptr<AggregationClause>>(version, "AggregationClause")
             .def(py::init([](
-                    const std::string& grouping_colum,
+                    const std::vector<std::string>& grouping_columns,
                     const std::unordered_map<std::string, std::variant<std::string, std::pair<std::string, std::string>>> aggregations) {
-                return AggregationClause(grouping_colum, python_util::named_aggregators_from_dict(aggregations));
+                return AggregationClause(grouping_columns, python_util::named_aggregators_from_dict(aggregations));
             }))
             .def("__str__", &AggregationClause::to_string);
 
@@ -389,6 +423,45 @@ void register_bindings(py::module &version, py::exception<arcticdb::ArcticExcept
             .value("LEFT", ResampleBoundary::LEFT)
             .value("RIGHT", ResampleBoundary::RIGHT);
 
+    py::class_<WindowClause, std::shared_ptr<WindowClause>>(version, "WindowClause")
+            .def_static("rolling_rows", [](int64_t num_rows, size_t min_periods) {
+                return WindowClause(WindowSpec::rows(num_rows, min_periods));
+            })
+            .def_static("rolling_time", [](timestamp offset, size_t min_periods) {
+                return WindowClause(WindowSpec::time(offset, min_periods));
+            })
+            .def_static("expanding", [](size_t min_periods) {
+                return WindowClause(WindowSpec::expanding(min_periods));
+            })
+            .def_static("ewm", [](double alpha, size_t min_periods, bool adjust) {
+                return WindowClause(WindowSpec::exponential(alpha, min_periods, adjust));
+            })
+            .def("set_aggregations", [](WindowClause& self,
+                                        const std::unordered_map<std::string, std::variant<std::string, std::pair<std::string, std::string>>> aggregations) {
+                self.set_aggregations(python_util::named_aggregators_from_dict(aggregations));
+            })
+            .def("__str__", &WindowClause::to_string);
+
+    py::class_<AsOfJoinClause, std::shared_ptr<AsOfJoinClause>>(version, "AsOfJoinClause")
+            .def(py::init([](std::vector<std::string> by, std::optional<timestamp> tolerance, bool allow_exact_matches) {
+                return AsOfJoinClause(AsOfJoinOptions{std::move(by), tolerance, allow_exact_matches});
+            }))
+            .def("__str__", &AsOfJoinClause::to_string);
+
+    py::enum_<JoinType>(version, "JoinType")
+            .value("INNER", JoinType::INNER)
+            .value("LEFT", JoinType::LEFT);
+
+    py::class_<JoinClause, std::shared_ptr<JoinClause>>(version, "JoinClause")
+            .def(py::init([](std::vector<std::string> on, JoinType join_type) {
+                return JoinClause(JoinOptions{std::move(on), join_type});
+            }))
+            .def("__str__", &JoinClause::to_string);
+
+    py::class_<ConcatClause, std::shared_ptr<ConcatClause>>(version, "ConcatClause")
+            .def(py::init())
+            .def("__str__", &ConcatClause::to_string);
+
     py::enum_<RowRangeClause::RowRangeType>(version, "RowRangeType")
             .value("HEAD", RowRangeClause::RowRangeType::HEAD)
             .value("TAIL", RowRangeClause::RowRangeType::TAIL)
@@ -420,6 +493,7 @@ void register_bindings(py::module &version, py::exception<arcticdb::ArcticExcept
                                 std::shared_ptr<AggregationClause>,
                                 std::shared_ptr<ResampleClause<ResampleBoundary::LEFT>>,
                                 std::shared_ptr<ResampleClause<ResampleBoundary::RIGHT>>,
+                                std::shared_ptr<WindowClause>,
                                 std::shared_ptr<RowRangeClause>,
                                 std::shared_ptr<DateRangeClause>>> clauses) {
                 clauses = plan_query(std::move(clauses));
@@ -434,6 +508,66 @@ void register_bindings(py::module &version, py::exception<arcticdb::ArcticExcept
                 self.add_clauses(_clauses);
             });
 
+    py::class_<ArrowOutputFrame>(version, "ArrowOutputFrame")
+        .def_property_readonly("num_blocks", &ArrowOutputFrame::num_blocks)
+        .def_property_readonly("names", &ArrowOutputFrame::names, py::return_value_policy::reference_internal)
+        .def_property_readonly("index_columns", &ArrowOutputFrame::index_columns, py::return_value_policy::reference_internal)
+        .def_property_readonly("offset", &ArrowOutputFrame::offset)
+        .def("record_batches", &ArrowOutputFrame::record_batches,
+             "Addresses of the (ArrowArray, ArrowSchema) C Data Interface structs of each record batch, to be imported with pyarrow.RecordBatch._import_from_c");
+
+    py::class_<ChunkedReader, std::shared_ptr<ChunkedReader>>(version, "ChunkedReader")
+            .def("__iter__", [](py::object& self) { return self; })
+            .def("__next__",
+                 [](ChunkedReader& self) -> py::tuple {
+                     std::optional<ChunkedReader::Chunk> chunk;
+                     std::optional<ArrowReadResult> arrow_result;
+                     {
+                         py::gil_scoped_release release_gil;
+                         chunk = self.next();
+                         if (chunk.has_value() && self.output_format() == OutputFormat::ARROW) {
+                             // Nothing in the Arrow read path touches Python objects
+                             arrow_result = create_arrow_read_result(
+                                 chunk->output_.versioned_item_,
+                                 std::move(chunk->output_.frame_and_descriptor_),
+                                 *chunk->handler_data_);
+                         }
+                     }
+                     if (!chunk.has_value())
+                         throw py::stop_iteration();
+                     if (arrow_result.has_value())
+                         return adapt_arrow_read_df(std::move(*arrow_result));
+                     return adapt_read_df(create_python_read_result(
+                         chunk->output_.versioned_item_,
+                         self.output_format(),
+                         std::move(chunk->output_.frame_and_descriptor_)));
+                 },
+                 py::call_guard<SingleThreadMutexHolder>())
+            .def("close",
+                 &ChunkedReader::close,
+                 py::call_guard<SingleThreadMutexHolder, py::gil_scoped_release>(),
+                 "Stop reading, discarding any chunks that have been prefetched")
+            .def_property_readonly("num_chunks", &ChunkedReader::num_chunks);
+
+    py::class_<StagedStreamWriter, std::shared_ptr<StagedStreamWriter>>(version, "StagedStreamWriter")
+            .def("write_row",
+                 &StagedStreamWriter::write_row,
+                 py::call_guard<SingleThreadMutexHolder>(),
+                 "Write a row of values keyed on column name, returning the number of segments staged")
+            .def("write_frame",
+                 [](StagedStreamWriter& self, const py::tuple& item, const py::object& norm) {
+                     // Columns with no values in the batch have the empty type, and are written as missing values
+                     return self.write_frame(convert::py_ndf_to_frame(self.descriptor().id(), item, norm, py::none(), true));
+                 },
+                 py::call_guard<SingleThreadMutexHolder>(),
+                 "Write the rows of a normalized frame, returning the number of segments staged")
+            .def("flush",
+                 &StagedStreamWriter::flush,
+                 py::call_guard<SingleThreadMutexHolder>(),
+                 "Stage the rows written since the last segment was staged, returning the number of segments staged")
+            .def_property_readonly("buffered_rows", &StagedStreamWriter::buffered_rows)
+            .def_property_readonly("staged_segments", &StagedStreamWriter::staged_segments);
+
     py::enum_<OperationType>(version, "OperationType")
             .value("ABS", OperationType::ABS)
             .value("NEG", OperationType::NEG)
@@ -441,6 +575,18 @@ void register_bindings(py::module &version, py::exception<arcticdb::ArcticExcept
             .value("NOTNULL", OperationType::NOTNULL)
             .value("IDENTITY", OperationType::IDENTITY)
             .value("NOT", OperationType::NOT)
+            .value("STR_LEN", OperationType::STR_LEN)
+            .value("DT_YEAR", OperationType::DT_YEAR)
+            .value("DT_MONTH", OperationType::DT_MONTH)
+            .value("DT_DAY", OperationType::DT_DAY)
+            .value("DT_HOUR", OperationType::DT_HOUR)
+            .value("DT_MINUTE", OperationType::DT_MINUTE)
+            .value("DT_SECOND", OperationType::DT_SECOND)
+            .value("DT_DAYOFWEEK", OperationType::DT_DAYOFWEEK)
+            .value("DT_DATE", OperationType::DT_DATE)
+            .value("LOG", OperationType::LOG)
+            .value("EXP", OperationType::EXP)
+            .value("SQRT", OperationType::SQRT)
             .value("ADD", OperationType::ADD)
             .value("SUB", OperationType::SUB)
             .value("MUL", OperationType::MUL)
@@ -453,9 +599,19 @@ void register_bindings(py::module &version, py::exception<arcticdb::ArcticExcept
             .value("GE", OperationType::GE)
             .value("ISIN", OperationType::ISIN)
             .value("ISNOTIN", OperationType::ISNOTIN)
+            .value("STARTSWITH", OperationType::STARTSWITH)
+            .value("ENDSWITH", OperationType::ENDSWITH)
+            .value("CONTAINS", OperationType::CONTAINS)
+            .value("REGEX_MATCH", OperationType::REGEX_MATCH)
+            .value("DT_FLOOR", OperationType::DT_FLOOR)
+            .value("DT_CEIL", OperationType::DT_CEIL)
+            .value("POW", OperationType::POW)
+            .value("ROUND", OperationType::ROUND)
+            .value("CAST", OperationType::CAST)
             .value("AND", OperationType::AND)
             .value("OR", OperationType::OR)
-            .value("XOR", OperationType::XOR);
+            .value("XOR", OperationType::XOR)
+            .value("WHERE", OperationType::WHERE);
 
     py::enum_<SortedValue>(version, "SortedValue")
             .value("UNKNOWN", SortedValue::UNKNOWN)
@@ -488,6 +644,9 @@ void register_bindings(py::module &version, py::exception<arcticdb::ArcticExcept
             }));
 
     py::class_<ExpressionNode, std::shared_ptr<ExpressionNode>>(version, "ExpressionNode")
+            .def(py::init([](VariantNode condition, VariantNode left, VariantNode right, OperationType operation_type) {
+                return ExpressionNode(condition, left, right, operation_type);
+            }))
             .def(py::init([](VariantNode left, VariantNode right, OperationType operation_type) {
                 return ExpressionNode(left, right, operation_type);
             }))
@@ -560,6 +719,14 @@ void register_bindings(py::module &version, py::exception<arcticdb::ArcticExcept
          .def("write_parallel",
              &PythonVersionStore::write_parallel,
              py::call_guard<SingleThreadMutexHolder>(), "Append to a symbol in parallel")
+         .def("stream_writer",
+             &PythonVersionStore::stream_writer,
+             py::arg("stream_id"),
+             py::arg("item"),
+             py::arg("norm"),
+             py::arg("max_rows"),
+             py::arg("max_interval_ns") = std::nullopt,
+             py::call_guard<SingleThreadMutexHolder>(), "Create a writer staging rows with the columns of the given frame")
          .def("write_metadata",
              &PythonVersionStore::write_metadata,
              py::call_guard<SingleThreadMutexHolder>(), "Create a new version with new metadata and data from the last version")
@@ -597,6 +764,18 @@ void register_bindings(py::module &version, py::exception<arcticdb::ArcticExcept
              py::arg("validate_index") = false,
              py::arg("delete_staged_data_on_failure") = false,
              py::call_guard<SingleThreadMutexHolder>(), "Compact incomplete segments")
+         .def("compact_incomplete_unless_locked",
+             &PythonVersionStore::compact_incomplete_unless_locked,
+             py::arg("stream_id"),
+             py::arg("append"),
+             py::arg("prune_previous_versions") = false,
+             py::arg("validate_index") = true,
+             py::call_guard<SingleThreadMutexHolder>(), "Compact incomplete segments, unless another process is already compacting them")
+         .def("get_staged_data_summary",
+             &PythonVersionStore::get_staged_data_summary,
+             py::arg("stream_id"),
+             py::arg("include_sizes") = false,
+             py::call_guard<SingleThreadMutexHolder>(), "Count, size and age of the staged segments of a symbol")
          .def("sort_merge",
              &PythonVersionStore::sort_merge,
              py::arg("stream_id"),
@@ -684,6 +863,21 @@ void register_bindings(py::module &version, py::exception<arcticdb::ArcticExcept
               },
              py::call_guard<SingleThreadMutexHolder>(),
              "Read the specified version of the dataframe from the store")
+        .def("read_dataframe_version_arrow",
+             [&](PythonVersionStore& v,  StreamId sid, const VersionQuery& version_query, const std::shared_ptr<ReadQuery>& read_query, const ReadOptions& read_options) {
+                auto result = [&]() {
+                    // Nothing in the Arrow read path touches Python objects
+                    py::gil_scoped_release release_gil;
+                    return v.read_dataframe_version_arrow(sid, version_query, read_query, read_options);
+                }();
+                return adapt_arrow_read_df(std::move(result));
+              },
+             py::call_guard<SingleThreadMutexHolder>(),
+             "Read the specified version of the dataframe from the store as Arrow record batches")
+        .def("read_dataframe_chunked",
+             &PythonVersionStore::read_dataframe_chunked,
+             py::call_guard<SingleThreadMutexHolder>(),
+             "Read the specified version of the dataframe from the store as a sequence of chunks of row-slices")
          .def("read_index",
              [&](PythonVersionStore& v, StreamId sid, const VersionQuery& version_query){
                  return adapt_read_df(v.read_index(sid, version_query));
@@ -781,6 +975,36 @@ void register_bindings(py::module &version, py::exception<arcticdb::ArcticExcept
                  return python_util::adapt_read_dfs(v.batch_read(stream_ids, version_queries, read_queries, read_options));
              },
              py::call_guard<SingleThreadMutexHolder>(), "Read a dataframe from the store")
+        .def("batch_read_and_join",
+             [&](PythonVersionStore& v,
+                 const std::vector<StreamId> &stream_ids,
+                 const std::vector<VersionQuery>& version_queries,
+                 std::vector<std::shared_ptr<ReadQuery>>& read_queries,
+                 const ReadOptions& read_options,
+                 const std::variant<std::shared_ptr<AsOfJoinClause>, std::shared_ptr<JoinClause>, std::shared_ptr<ConcatClause>>& join_clause,
+                 const std::shared_ptr<ReadQuery>& post_join_query){
+                 // The clauses to apply after the join are planned and converted by PythonVersionStoreReadQuery.add_clauses
+                 std::vector<std::shared_ptr<Clause>> clauses;
+                 std::visit([&clauses](const auto& clause) {
+                     clauses.emplace_back(std::make_shared<Clause>(*clause));
+                 }, join_clause);
+                 clauses.insert(clauses.end(), post_join_query->clauses_.begin(), post_join_query->clauses_.end());
+                 return adapt_read_df(v.batch_read_and_join(stream_ids, version_queries, read_queries, read_options, std::move(clauses)));
+             },
+             py::call_guard<SingleThreadMutexHolder>(), "Read and join dataframes from the store")
+        .def("batch_read_arrow",
+             [&](PythonVersionStore& v,
+                 const std::vector<StreamId> &stream_ids,
+                 const std::vector<VersionQuery>& version_queries,
+                 std::vector<std::shared_ptr<ReadQuery>>& read_queries,
+                 const ReadOptions& read_options){
+                 auto results = [&]() {
+                     py::gil_scoped_release release_gil;
+                     return v.batch_read_arrow(stream_ids, version_queries, read_queries, read_options);
+                 }();
+                 return python_util::adapt_arrow_read_dfs(std::move(results));
+             },
+             py::call_guard<SingleThreadMutexHolder>(), "Read dataframes from the store as Arrow record batches")
         .def("batch_read_keys",
              [&](PythonVersionStore& v, std::vector<AtomKey> atom_keys) {
                  return python_util::adapt_read_dfs(frame_to_read_result(v.batch_read_keys(atom_keys)));
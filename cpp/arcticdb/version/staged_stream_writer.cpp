@@ -0,0 +1,277 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <arcticdb/version/staged_stream_writer.hpp>
+#include <arcticdb/pipeline/frame_utils.hpp>
+#include <arcticdb/pipeline/slicing.hpp>
+#include <arcticdb/python/python_types.hpp>
+#include <arcticdb/util/constants.hpp>
+#include <arcticdb/util/format_date.hpp>
+#include <arcticdb/util/offset_string.hpp>
+#include <arcticdb/util/preconditions.hpp>
+
+#include <cmath>
+#include <cstring>
+#include <limits>
+
+namespace arcticdb::version_store {
+
+namespace {
+
+constexpr bool is_supported_column_type(DataType data_type) {
+    return is_numeric_type(data_type) || is_bool_type(data_type) || is_dynamic_string_type(data_type);
+}
+
+bool is_missing(PyObject* value) {
+    return value == nullptr || value == Py_None || is_py_nan(value);
+}
+
+StreamDescriptor writer_descriptor(const StreamId& stream_id, const std::shared_ptr<pipelines::InputTensorFrame>& schema_frame) {
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+        std::holds_alternative<stream::TimeseriesIndex>(schema_frame->index),
+        "Stream writer for symbol '{}' requires data with a timestamp index",
+        stream_id);
+    auto descriptor = schema_frame->desc.clone();
+    for (const auto& field : descriptor.fields()) {
+        schema::check<ErrorCode::E_UNSUPPORTED_COLUMN_TYPE>(
+            field.type().dimension() == Dimension::Dim0 && is_supported_column_type(field.type().data_type()),
+            "Stream writer for symbol '{}' does not support column '{}' of type {}. The first data written must have a "
+            "value in every column, as it determines the column types",
+            stream_id, field.name(), get_user_friendly_type_string(field.type()));
+    }
+    descriptor.set_sorted(SortedValue::ASCENDING);
+    return descriptor;
+}
+
+} // namespace
+
+StagedStreamWriter::StagedStreamWriter(
+    std::shared_ptr<Store> store,
+    const StreamId& stream_id,
+    const std::shared_ptr<pipelines::InputTensorFrame>& schema_frame,
+    size_t max_rows,
+    std::optional<timestamp> max_interval_ns) :
+    store_(std::move(store)),
+    stream_id_(stream_id),
+    descriptor_(writer_descriptor(stream_id, schema_frame)),
+    norm_meta_(schema_frame->norm_meta),
+    index_field_count_(descriptor_.index().field_count()),
+    pending_scalars_(descriptor_.field_count(), 0),
+    pending_strings_(descriptor_.field_count()),
+    aggregator_(
+        stream::FixedSchema{descriptor_.clone(), schema_frame->index},
+        [this](SegmentInMemory&& segment) { stage_segment(std::move(segment)); },
+        SegmentingPolicy{
+            stream::RowCountSegmentPolicy{max_rows},
+            stream::TimeBasedSegmentPolicy<>{max_interval_ns.value_or(std::numeric_limits<timestamp>::max())}}) {
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(max_rows > 0, "Stream writer requires max_rows to be positive");
+    column_keys_.reserve(descriptor_.field_count());
+    for (const auto& field : descriptor_.fields()) {
+        column_keys_.emplace_back(py::str(std::string{field.name()}));
+        if (is_time_type(field.type().data_type()) && !to_timestamp_)
+            to_timestamp_ = py::module_::import("pandas").attr("Timestamp");
+    }
+}
+
+void StagedStreamWriter::check_index_order(timestamp index, const std::optional<timestamp>& previous_index) const {
+    sorting::check<ErrorCode::E_UNSORTED_DATA>(
+        !previous_index.has_value() || index >= *previous_index,
+        "Stream writer for symbol '{}' requires rows to be written in index order, received {} after {} (in UTC)",
+        stream_id_, util::format_timestamp(index), util::format_timestamp(previous_index.value_or(0)));
+}
+
+void StagedStreamWriter::set_missing_value(size_t pos) {
+    const auto& field = descriptor_.field(pos);
+    details::visit_type(field.type().data_type(), [this, pos, &field](auto tag) {
+        using type_info = ScalarTypeInfo<decltype(tag)>;
+        using RawType = typename type_info::RawType;
+        if constexpr (is_dynamic_string_type(type_info::data_type)) {
+            pending_scalars_[pos] = static_cast<uint64_t>(not_a_string());
+        } else if constexpr (is_floating_point_type(type_info::data_type)) {
+            const auto value = std::numeric_limits<RawType>::quiet_NaN();
+            std::memcpy(&pending_scalars_[pos], &value, sizeof(RawType));
+        } else if constexpr (is_time_type(type_info::data_type)) {
+            const RawType value = NaT;
+            std::memcpy(&pending_scalars_[pos], &value, sizeof(RawType));
+        } else {
+            user_input::raise<ErrorCode::E_INVALID_USER_ARGUMENT>(
+                "Stream writer for symbol '{}' requires a value for column '{}' of type {}",
+                stream_id_, field.name(), get_user_friendly_type_string(field.type()));
+        }
+    });
+}
+
+void StagedStreamWriter::set_string_value(size_t pos, PyObject* value) {
+    std::variant<convert::StringEncodingError, convert::PyStringWrapper> wrapper_or_error;
+    if (PyUnicode_Check(value)) {
+        std::optional<ScopedGILLock> scoped_gil_lock;
+        wrapper_or_error = convert::py_unicode_to_buffer(value, scoped_gil_lock);
+    } else {
+        wrapper_or_error = convert::pystring_to_buffer(value, false);
+    }
+    if (auto* error = std::get_if<convert::StringEncodingError>(&wrapper_or_error))
+        error->raise(descriptor_.field(pos).name());
+    pending_strings_[pos].emplace(std::move(std::get<convert::PyStringWrapper>(wrapper_or_error)));
+}
+
+void StagedStreamWriter::set_object_value(size_t pos, PyObject* value) {
+    pending_strings_[pos].reset();
+    if (is_missing(value)) {
+        set_missing_value(pos);
+        return;
+    }
+    const auto& field = descriptor_.field(pos);
+    try {
+        details::visit_type(field.type().data_type(), [this, pos, value](auto tag) {
+            using type_info = ScalarTypeInfo<decltype(tag)>;
+            using RawType = typename type_info::RawType;
+            if constexpr (is_dynamic_string_type(type_info::data_type)) {
+                set_string_value(pos, value);
+            } else if constexpr (is_time_type(type_info::data_type)) {
+                const auto converted = PyLong_Check(value) ? py::handle(value).cast<RawType>() : to_timestamp_(py::handle(value)).attr("value").cast<RawType>();
+                std::memcpy(&pending_scalars_[pos], &converted, sizeof(RawType));
+            } else if constexpr (is_numeric_type(type_info::data_type) || is_bool_type(type_info::data_type)) {
+                const auto converted = py::handle(value).cast<RawType>();
+                std::memcpy(&pending_scalars_[pos], &converted, sizeof(RawType));
+            }
+        });
+    } catch (const py::cast_error&) {
+        user_input::raise<ErrorCode::E_INVALID_USER_ARGUMENT>(
+            "Stream writer for symbol '{}' cannot write value of type {} to column '{}' of type {}",
+            stream_id_, Py_TYPE(value)->tp_name, field.name(), get_user_friendly_type_string(field.type()));
+    }
+}
+
+void StagedStreamWriter::write_pending_row(timestamp index) {
+    aggregator_.start_row(index)([this](auto& row_builder) {
+        for (size_t pos = index_field_count_; pos < descriptor_.field_count(); ++pos) {
+            if (pending_strings_[pos].has_value()) {
+                const auto& wrapper = *pending_strings_[pos];
+                row_builder.set_string(pos, std::string{wrapper.buffer_, wrapper.length_});
+                continue;
+            }
+            details::visit_type(descriptor_.field(pos).type().data_type(), [this, pos, &row_builder](auto tag) {
+                using type_info = ScalarTypeInfo<decltype(tag)>;
+                using RawType = typename type_info::RawType;
+                if constexpr (is_numeric_type(type_info::data_type) || is_bool_type(type_info::data_type) || is_dynamic_string_type(type_info::data_type)) {
+                    RawType value;
+                    std::memcpy(&value, &pending_scalars_[pos], sizeof(RawType));
+                    row_builder.set_scalar(pos, value);
+                }
+            });
+        }
+    });
+    last_index_ = index;
+    // The segment may have been staged as the row ended
+    buffered_rows_ = aggregator_.row_count();
+}
+
+size_t StagedStreamWriter::write_row(timestamp index, const py::dict& values) {
+    check_index_order(index, last_index_);
+    size_t values_found = 0;
+    for (size_t pos = index_field_count_; pos < descriptor_.field_count(); ++pos) {
+        PyObject* value = PyDict_GetItem(values.ptr(), column_keys_[pos].ptr());
+        values_found += value != nullptr;
+        set_object_value(pos, value);
+    }
+    if (values_found != values.size()) {
+        for (const auto& item : values) {
+            const auto name = py::str(item.first).cast<std::string>();
+            schema::check<ErrorCode::E_COLUMN_DOESNT_EXIST>(
+                descriptor_.find_field(name).value_or(0) >= index_field_count_,
+                "Stream writer for symbol '{}' has no column '{}'",
+                stream_id_, name);
+        }
+    }
+    const auto staged_before = staged_segments_;
+    write_pending_row(index);
+    return staged_segments_ - staged_before;
+}
+
+size_t StagedStreamWriter::write_frame(const std::shared_ptr<pipelines::InputTensorFrame>& frame) {
+    const auto num_rows = frame->num_rows;
+    if (num_rows == 0)
+        return 0;
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+        std::holds_alternative<stream::TimeseriesIndex>(frame->index) && frame->index_tensor.has_value(),
+        "Stream writer for symbol '{}' requires data with a timestamp index",
+        stream_id_);
+    schema::check<ErrorCode::E_DESCRIPTOR_MISMATCH>(
+        frame->desc.field_count() == descriptor_.field_count(),
+        "Stream writer for symbol '{}' requires data with the columns {}, received {}",
+        stream_id_, descriptor_.fields(), frame->desc.fields());
+    for (size_t pos = index_field_count_; pos < descriptor_.field_count(); ++pos) {
+        const auto& expected = descriptor_.field(pos);
+        const auto& actual = frame->desc.field(pos);
+        // Columns with no values in the batch have the empty type, and are written as missing values
+        schema::check<ErrorCode::E_DESCRIPTOR_MISMATCH>(
+            expected.name() == actual.name() && (expected.type() == actual.type() || is_empty_type(actual.type().data_type())),
+            "Stream writer for symbol '{}' requires data with the columns {}, received {}",
+            stream_id_, descriptor_.fields(), frame->desc.fields());
+        user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+            !frame->field_tensors[pos - index_field_count_].string_dictionary().has_value(),
+            "Stream writer for symbol '{}' does not support categorical column '{}'",
+            stream_id_, expected.name());
+    }
+
+    const auto& index_tensor = *frame->index_tensor;
+    // Check the whole batch before writing any of it
+    auto previous_index = last_index_;
+    for (size_t row = 0; row < num_rows; ++row) {
+        const auto index = *index_tensor.ptr_cast<timestamp>(row);
+        check_index_order(index, previous_index);
+        previous_index = index;
+    }
+
+    const auto staged_before = staged_segments_;
+    for (size_t row = 0; row < num_rows; ++row) {
+        for (size_t pos = index_field_count_; pos < descriptor_.field_count(); ++pos) {
+            const auto& tensor = frame->field_tensors[pos - index_field_count_];
+            pending_strings_[pos].reset();
+            details::visit_type(tensor.data_type(), [this, pos, row, &tensor](auto tag) {
+                using type_info = ScalarTypeInfo<decltype(tag)>;
+                using RawType = typename type_info::RawType;
+                if constexpr (is_dynamic_string_type(type_info::data_type)) {
+                    PyObject* value = *tensor.template ptr_cast<PyObject*>(row);
+                    if (is_missing(value))
+                        set_missing_value(pos);
+                    else
+                        set_string_value(pos, value);
+                } else if constexpr (is_numeric_type(type_info::data_type) || is_bool_type(type_info::data_type)) {
+                    std::memcpy(&pending_scalars_[pos], tensor.template ptr_cast<RawType>(row), sizeof(RawType));
+                } else {
+                    set_missing_value(pos);
+                }
+            });
+        }
+        write_pending_row(*index_tensor.ptr_cast<timestamp>(row));
+    }
+    return staged_segments_ - staged_before;
+}
+
+size_t StagedStreamWriter::flush() {
+    const auto staged_before = staged_segments_;
+    if (buffered_rows_ > 0)
+        aggregator_.commit();
+    buffered_rows_ = 0;
+    return staged_segments_ - staged_before;
+}
+
+void StagedStreamWriter::stage_segment(SegmentInMemory&& segment) {
+    const auto row_count = segment.row_count();
+    const auto start_index = stream::TimeseriesIndex::start_value_for_segment(segment);
+    const auto end_index = pipelines::end_index_generator(stream::TimeseriesIndex::end_value_for_segment(segment));
+    auto norm_meta = norm_meta_;
+    segment.set_timeseries_descriptor(make_timeseries_descriptor(
+        row_count, descriptor_, std::move(norm_meta), std::nullopt, std::nullopt, std::nullopt, false));
+    segment.descriptor().set_sorted(SortedValue::ASCENDING);
+    store_->write(KeyType::APPEND_DATA, VersionId(0), stream_id_, start_index, end_index, std::move(segment)).get();
+    ++staged_segments_;
+    ARCTICDB_DEBUG(log::version(), "Stream writer staged segment of {} rows for symbol {}", row_count, stream_id_);
+}
+
+} // namespace arcticdb::version_store
@@ -0,0 +1,102 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#pragma once
+
+#include <arcticdb/entity/protobufs.hpp>
+#include <arcticdb/pipeline/input_tensor_frame.hpp>
+#include <arcticdb/python/python_to_tensor_frame.hpp>
+#include <arcticdb/storage/store.hpp>
+#include <arcticdb/stream/aggregator.hpp>
+#include <arcticdb/stream/index.hpp>
+#include <arcticdb/stream/schema.hpp>
+
+#include <pybind11/pybind11.h>
+
+#include <memory>
+#include <optional>
+#include <vector>
+
+namespace arcticdb::version_store {
+
+namespace py = pybind11;
+
+/*
+ * Accumulates rows of a timeseries written one at a time, or in small batches, into a segment in memory, and stages
+ * the segment for the symbol (as write_parallel does) once it holds max_rows rows, or once max_interval_ns has passed
+ * since its first row was written, whichever comes first. The time threshold is checked as each row is written, so a
+ * partially filled segment is only staged on a later write or an explicit flush().
+ * The columns and their types are fixed by the frame the writer is constructed from, and rows must be written in
+ * ascending index order, so that the staged segments can be finalized without sorting. Values are copied into the
+ * segment as they are written, so the Python objects passed in need not outlive the call.
+ * Must only be used with the GIL held.
+ */
+class StagedStreamWriter {
+public:
+    StagedStreamWriter(
+        std::shared_ptr<Store> store,
+        const StreamId& stream_id,
+        const std::shared_ptr<pipelines::InputTensorFrame>& schema_frame,
+        size_t max_rows,
+        std::optional<timestamp> max_interval_ns);
+
+    ARCTICDB_NO_MOVE_OR_COPY(StagedStreamWriter)
+
+    // Writes a row with the values in the dict, keyed on column name. Missing values and None are NaN/NaT/None in
+    // floating point/timestamp/string columns, and are not accepted for other columns. Returns the number of segments
+    // staged by the call
+    size_t write_row(timestamp index, const py::dict& values);
+
+    // Writes every row of a frame with the same columns as the writer. Returns the number of segments staged by the call
+    size_t write_frame(const std::shared_ptr<pipelines::InputTensorFrame>& frame);
+
+    // Stages the rows written since the last segment was staged, if there are any. Returns the number of segments staged
+    size_t flush();
+
+    [[nodiscard]] size_t buffered_rows() const {
+        return buffered_rows_;
+    }
+
+    [[nodiscard]] size_t staged_segments() const {
+        return staged_segments_;
+    }
+
+    [[nodiscard]] const StreamDescriptor& descriptor() const {
+        return descriptor_;
+    }
+
+private:
+    using SegmentingPolicy = stream::ListOfSegmentPolicies<2>;
+    using AggregatorType = stream::Aggregator<stream::TimeseriesIndex, stream::FixedSchema, SegmentingPolicy>;
+
+    void check_index_order(timestamp index, const std::optional<timestamp>& previous_index) const;
+    void set_missing_value(size_t pos);
+    void set_string_value(size_t pos, PyObject* value);
+    void set_object_value(size_t pos, PyObject* value);
+    void write_pending_row(timestamp index);
+    void stage_segment(SegmentInMemory&& segment);
+
+    std::shared_ptr<Store> store_;
+    StreamId stream_id_;
+    StreamDescriptor descriptor_;
+    arcticdb::proto::descriptors::NormalizationMetadata norm_meta_;
+    size_t index_field_count_;
+    // Column names as Python strings, to look values up in the dicts passed to write_row
+    std::vector<py::object> column_keys_;
+    // pandas.Timestamp, only needed if there are timestamp columns
+    py::object to_timestamp_;
+    // Values of the row being written, converted to the type of their column before any are set in the segment, so
+    // that a value that cannot be converted does not leave a partially written row behind
+    std::vector<uint64_t> pending_scalars_;
+    std::vector<std::optional<convert::PyStringWrapper>> pending_strings_;
+    std::optional<timestamp> last_index_;
+    size_t buffered_rows_ = 0;
+    size_t staged_segments_ = 0;
+    AggregatorType aggregator_;
+};
+
+} // namespace arcticdb::version_store
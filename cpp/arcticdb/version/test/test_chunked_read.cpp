@@ -0,0 +1,93 @@
+/* Copyright 2024 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <gtest/gtest.h>
+
+#include <arcticdb/version/chunked_read.hpp>
+#include <arcticdb/version/version_store_api.hpp>
+#include <arcticdb/stream/test/stream_test_common.hpp>
+#include <arcticdb/util/native_handler.hpp>
+#include <arcticdb/util/test/generators.hpp>
+
+struct ChunkedReadTest : arcticdb::TestStore {
+protected:
+    std::string get_name() override {
+        return "test.chunked_read";
+    }
+
+    arcticdb::VersionedItem write_symbol(const arcticdb::StreamId& symbol, size_t num_rows, size_t segment_row_size) {
+        arcticdb::proto::storage::VersionStoreConfig cfg;
+        cfg.CopyFrom(test_store_->cfg());
+        cfg.mutable_write_options()->set_segment_row_size(segment_row_size);
+        test_store_->configure(std::move(cfg));
+        auto test_frame = arcticdb::get_test_timeseries_frame(symbol, num_rows, 0);
+        return test_store_->write_versioned_dataframe_internal(symbol, std::move(test_frame.frame_), false, false, false);
+    }
+
+    std::vector<std::pair<arcticdb::timestamp, size_t>> read_chunks(
+            const arcticdb::VersionedItem& versioned_item,
+            std::optional<arcticdb::TimestampRange> date_range,
+            uint64_t chunk_rows,
+            uint64_t prefetch) {
+        using namespace arcticdb;
+        register_native_handler_data_factory();
+        version_store::ChunkedReader reader(
+            test_store_->_test_get_store(),
+            versioned_item,
+            std::make_shared<ReadQuery>(),
+            ReadOptions{},
+            [] { return std::make_shared<std::any>(get_type_handler_data(OutputFormat::NATIVE)); },
+            date_range,
+            chunk_rows,
+            prefetch);
+        // First index value and row count of each chunk
+        std::vector<std::pair<timestamp, size_t>> res;
+        while (auto chunk = reader.next()) {
+            const auto& frame = chunk->frame_and_descriptor_.frame_;
+            res.emplace_back(frame.scalar_at<timestamp>(0, 0).value(), frame.row_count());
+        }
+        EXPECT_EQ(res.size(), reader.num_chunks());
+        return res;
+    }
+};
+
+TEST_F(ChunkedReadTest, ChunksAlignedToRowSlices) {
+    using namespace arcticdb;
+    auto versioned_item = write_symbol("chunked", 95, 10);
+    using Chunks = std::vector<std::pair<timestamp, size_t>>;
+    ASSERT_EQ(read_chunks(versioned_item, std::nullopt, 25, 2), (Chunks{{0, 30}, {30, 30}, {60, 30}, {90, 5}}));
+    ASSERT_EQ(read_chunks(versioned_item, std::nullopt, 1, 0), (Chunks{{0, 10}, {10, 10}, {20, 10}, {30, 10}, {40, 10}, {50, 10}, {60, 10}, {70, 10}, {80, 10}, {90, 5}}));
+    ASSERT_EQ(read_chunks(versioned_item, std::nullopt, 1000, 1), (Chunks{{0, 95}}));
+}
+
+TEST_F(ChunkedReadTest, DateRangeDropsRowSlices) {
+    using namespace arcticdb;
+    auto versioned_item = write_symbol("chunked_date_range", 95, 10);
+    using Chunks = std::vector<std::pair<timestamp, size_t>>;
+    // Chunks are whole row-slices, trimming to the date range itself is the job of a DateRangeClause
+    ASSERT_EQ(read_chunks(versioned_item, TimestampRange{35, 52}, 1000, 2), (Chunks{{30, 30}}));
+    ASSERT_EQ(read_chunks(versioned_item, TimestampRange{35, 52}, 10, 2), (Chunks{{30, 10}, {40, 10}, {50, 10}}));
+    ASSERT_TRUE(read_chunks(versioned_item, TimestampRange{1000, 2000}, 10, 2).empty());
+}
+
+TEST_F(ChunkedReadTest, AbandonedReadDrainsInFlightChunks) {
+    using namespace arcticdb;
+    auto versioned_item = write_symbol("chunked_abandoned", 95, 10);
+    register_native_handler_data_factory();
+    version_store::ChunkedReader reader(
+        test_store_->_test_get_store(),
+        versioned_item,
+        std::make_shared<ReadQuery>(),
+        ReadOptions{},
+        [] { return std::make_shared<std::any>(get_type_handler_data(OutputFormat::NATIVE)); },
+        std::nullopt,
+        10,
+        4);
+    ASSERT_TRUE(reader.next().has_value());
+    reader.close();
+    ASSERT_FALSE(reader.next().has_value());
+}
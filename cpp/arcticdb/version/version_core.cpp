@@ -21,13 +21,17 @@
 #include <arcticdb/pipeline/read_options.hpp>
 #include <arcticdb/pipeline/column_mapping.hpp>
 #include <arcticdb/stream/stream_sink.hpp>
+#include <arcticdb/stream/merge_utils.hpp>
 #include <arcticdb/stream/schema.hpp>
 #include <arcticdb/pipeline/index_writer.hpp>
 #include <arcticdb/pipeline/index_utils.hpp>
 #include <arcticdb/version/schema_checks.hpp>
 #include <arcticdb/version/version_utils.hpp>
 #include <arcticdb/entity/merge_descriptors.hpp>
+#include <arcticdb/processing/categorical_utils.hpp>
 #include <arcticdb/processing/component_manager.hpp>
+#include <arcticdb/util/clock.hpp>
+#include <arcticdb/util/constructors.hpp>
 #include <ranges>
 
 namespace arcticdb::version_store {
@@ -683,8 +687,26 @@ folly::Future<std::vector<EntityId>> schedule_clause_processing(
         std::move(entity_id_to_segment_pos),
         clauses);
 
-    auto entity_ids_vec_fut = folly::collect(*futures).via(&async::io_executor());
+    return schedule_later_iterations(folly::collect(*futures).via(&async::io_executor()), clauses);
+}
+
+folly::Future<std::vector<std::vector<EntityId>>> schedule_clause_stage(
+        std::vector<std::vector<EntityId>>&& entity_id_vectors,
+        std::shared_ptr<std::vector<std::shared_ptr<Clause>>> clauses) {
+    auto next_units_of_work = clauses->front()->structure_for_processing(std::move(entity_id_vectors));
+
+    std::vector<folly::Future<std::vector<EntityId>>> work_futures;
+    for(auto&& unit_of_work : next_units_of_work) {
+        ARCTICDB_RUNTIME_DEBUG(log::memory(), "Scheduling work for entity ids: {}", unit_of_work);
+        work_futures.emplace_back(async::submit_cpu_task(async::MemSegmentProcessingTask{*clauses, std::move(unit_of_work)}));
+    }
+
+    return folly::collect(work_futures).via(&async::io_executor());
+}
 
+folly::Future<std::vector<EntityId>> schedule_later_iterations(
+        folly::Future<std::vector<std::vector<EntityId>>>&& entity_ids_vec_fut,
+        std::shared_ptr<std::vector<std::shared_ptr<Clause>>> clauses) {
     const auto scheduling_iterations = num_scheduling_iterations(*clauses);
     for (auto i = 1UL; i < scheduling_iterations; ++i) {
         entity_ids_vec_fut = std::move(entity_ids_vec_fut).thenValue([clauses, scheduling_iterations, i] (std::vector<std::vector<EntityId>>&& entity_id_vectors) {
@@ -692,15 +714,7 @@ folly::Future<std::vector<EntityId>> schedule_clause_processing(
 
             util::check(!clauses->empty(), "Scheduling iteration {} has no clauses to process", scheduling_iterations);
             remove_processed_clauses(*clauses);
-            auto next_units_of_work = clauses->front()->structure_for_processing(std::move(entity_id_vectors));
-
-            std::vector<folly::Future<std::vector<EntityId>>> work_futures;
-            for(auto&& unit_of_work : next_units_of_work) {
-                ARCTICDB_RUNTIME_DEBUG(log::memory(), "Scheduling work for entity ids: {}", unit_of_work);
-                work_futures.emplace_back(async::submit_cpu_task(async::MemSegmentProcessingTask{*clauses, std::move(unit_of_work)}));
-            }
-
-            return folly::collect(work_futures).via(&async::io_executor());
+            return schedule_clause_stage(std::move(entity_id_vectors), clauses);
         });
     }
 
@@ -713,7 +727,7 @@ void set_output_descriptors(
         const ProcessingUnit& proc,
         const std::vector<std::shared_ptr<Clause>>& clauses,
         const std::shared_ptr<PipelineContext>& pipeline_context) {
-    std::optional<std::string> index_column;
+    NewIndex index_columns;
     for (auto clause = clauses.rbegin(); clause != clauses.rend(); ++clause) {
         bool should_break = util::variant_match(
                 (*clause)->clause_info().index_,
@@ -739,11 +753,8 @@ void set_output_descriptors(
                     return true;
                 },
                 [&](const NewIndex& new_index) {
-                    index_column = new_index;
-                    auto mutable_index = pipeline_context->norm_meta_->mutable_df()->mutable_common()->mutable_index();
-                    mutable_index->set_name(new_index);
-                    mutable_index->clear_fake_name();
-                    mutable_index->set_is_physically_stored(true);
+                    index_columns = new_index;
+                    set_new_index_norm_metadata(*pipeline_context->norm_meta_, new_index);
                     return true;
                 });
         if (should_break) {
@@ -782,9 +793,12 @@ void set_output_descriptors(
         // Erase field from new_fields as we add them to final_stream_descriptor, as all fields left in new_fields
         // after these operations were created by the processing pipeline, and so should be appended
         // Index columns should always appear first
-        if (index_column.has_value()) {
-            const auto nh = new_fields.extract(*index_column);
-            internal::check<ErrorCode::E_ASSERTION_FAILURE>(!nh.empty(), "New index column not found in processing pipeline");
+        for (const auto& index_column: index_columns) {
+            const auto nh = new_fields.extract(index_column);
+            internal::check<ErrorCode::E_ASSERTION_FAILURE>(
+                    !nh.empty(),
+                    "New index column {} not found in processing pipeline",
+                    index_column);
             final_stream_descriptor.add_field(FieldRef{nh.mapped(), nh.key()});
         }
         for (const auto& field: original_stream_descriptor.fields()) {
@@ -896,13 +910,13 @@ std::vector<folly::Future<pipelines::SegmentAndSlice>> generate_segment_and_slic
  * segments will be retrieved from storage and decompressed before being passed to a MemSegmentProcessingTask which
  * will process all clauses up until a clause that requires a repartition.
  */
-folly::Future<std::vector<SliceAndKey>> read_and_process(
+folly::Future<std::vector<EntityId>> read_and_schedule_processing(
     const std::shared_ptr<Store>& store,
     const std::shared_ptr<PipelineContext>& pipeline_context,
     const std::shared_ptr<ReadQuery>& read_query,
-    const ReadOptions& read_options
+    const ReadOptions& read_options,
+    std::shared_ptr<ComponentManager> component_manager
     ) {
-    auto component_manager = std::make_shared<ComponentManager>();
     ProcessingConfig processing_config{opt_false(read_options.dynamic_schema()), pipeline_context->rows_};
     for (auto& clause: read_query->clauses_) {
         clause->set_processing_config(processing_config);
@@ -923,7 +937,17 @@ folly::Future<std::vector<SliceAndKey>> read_and_process(
         component_manager,
         std::move(segment_and_slice_futures),
         std::move(processing_unit_indexes),
-        std::make_shared<std::vector<std::shared_ptr<Clause>>>(read_query->clauses_))
+        std::make_shared<std::vector<std::shared_ptr<Clause>>>(read_query->clauses_));
+}
+
+folly::Future<std::vector<SliceAndKey>> read_and_process(
+    const std::shared_ptr<Store>& store,
+    const std::shared_ptr<PipelineContext>& pipeline_context,
+    const std::shared_ptr<ReadQuery>& read_query,
+    const ReadOptions& read_options
+    ) {
+    auto component_manager = std::make_shared<ComponentManager>();
+    return read_and_schedule_processing(store, pipeline_context, read_query, read_options, component_manager)
     .via(&async::cpu_executor())
     .thenValue([component_manager, read_query, pipeline_context](std::vector<EntityId>&& processed_entity_ids) {
         auto proc = gather_entities<std::shared_ptr<SegmentInMemory>,
@@ -966,7 +990,8 @@ FrameAndDescriptor read_segment_impl(
 FrameAndDescriptor read_index_impl(
     const std::shared_ptr<Store>& store,
     const VersionedItem& version) {
-    return read_segment_impl(store, version.key_);
+    auto [_, seg] = store->read_sync(version.key_);
+    return frame_and_descriptor_from_segment(index::read_index_pages(store, std::move(seg)));
 }
 
 std::optional<pipelines::index::IndexSegmentReader> get_index_segment_reader(
@@ -1015,24 +1040,19 @@ void check_multi_key_is_not_index_only(
     );
 }
 
-void read_indexed_keys_to_pipeline(
-        const std::shared_ptr<Store>& store,
+void read_index_segment_reader_to_pipeline(
         const std::shared_ptr<PipelineContext>& pipeline_context,
+        index::IndexSegmentReader&& index_segment_reader,
         const VersionedItem& version_info,
         ReadQuery& read_query,
         const ReadOptions& read_options) {
-    auto maybe_reader = get_index_segment_reader(store, pipeline_context, version_info);
-    if(!maybe_reader)
-        return;
-
-    auto index_segment_reader = std::move(*maybe_reader);
     ARCTICDB_DEBUG(log::version(), "Read index segment with {} keys", index_segment_reader.size());
     check_can_read_index_only_if_required(index_segment_reader, read_query);
     check_column_and_date_range_filterable(index_segment_reader, read_query);
     add_index_columns_to_query(read_query, index_segment_reader.tsd());
+    read_query.convert_to_positive_row_filter(static_cast<int64_t>(index_segment_reader.tsd().total_rows()));
 
     const auto& tsd = index_segment_reader.tsd();
-    read_query.convert_to_positive_row_filter(static_cast<int64_t>(tsd.total_rows()));
     bool bucketize_dynamic = index_segment_reader.bucketize_dynamic();
     pipeline_context->desc_ = tsd.as_stream_descriptor();
 
@@ -1047,11 +1067,109 @@ void read_indexed_keys_to_pipeline(
     pipeline_context->total_rows_ = pipeline_context->calc_rows();
     pipeline_context->rows_ = index_segment_reader.tsd().total_rows();
     pipeline_context->norm_meta_ = std::make_unique<arcticdb::proto::descriptors::NormalizationMetadata>(std::move(*index_segment_reader.mutable_tsd().mutable_proto().mutable_normalization()));
+    encode_categorical_filters(read_query.clauses_, *pipeline_context->norm_meta_);
     pipeline_context->user_meta_ = std::make_unique<arcticdb::proto::descriptors::UserDefinedMetadata>(std::move(*index_segment_reader.mutable_tsd().mutable_proto().mutable_user_meta()));
     pipeline_context->bucketize_dynamic_ = bucketize_dynamic;
     ARCTICDB_DEBUG(log::version(), "read_indexed_keys_to_pipeline: Symbol {} Found {} keys with {} total rows", pipeline_context->slice_and_keys_.size(), pipeline_context->total_rows_, version_info.symbol());
 }
 
+void read_indexed_keys_to_pipeline(
+        const std::shared_ptr<Store>& store,
+        const std::shared_ptr<PipelineContext>& pipeline_context,
+        const VersionedItem& version_info,
+        ReadQuery& read_query,
+        const ReadOptions& read_options) {
+    auto maybe_reader = get_index_segment_reader(store, pipeline_context, version_info);
+    if(!maybe_reader)
+        return;
+
+    auto index_segment_reader = std::move(*maybe_reader);
+    if (index::is_paged_index(index_segment_reader.seg())) {
+        // Only read the pages of the index that the row or date range can touch
+        read_query.convert_to_positive_row_filter(static_cast<int64_t>(index_segment_reader.tsd().total_rows()));
+        std::optional<RowRange> row_range;
+        std::optional<IndexRange> index_range;
+        util::variant_match(read_query.row_filter,
+            [&row_range](const RowRange& range) { row_range = range; },
+            [&index_range](const IndexRange& range) { index_range = range; },
+            [](const std::monostate&) {});
+        index_segment_reader = index::IndexSegmentReader{
+            index::read_index_pages(store, SegmentInMemory{index_segment_reader.seg()}, row_range, index_range)};
+    }
+    read_index_segment_reader_to_pipeline(
+        pipeline_context, std::move(index_segment_reader), version_info, read_query, read_options);
+}
+
+// The filters at the start of the processing pipeline, which column stats can be used to prune row-slices with
+std::vector<std::shared_ptr<ExpressionContext>> leading_row_filter_expressions(const ReadQuery& read_query) {
+    std::vector<std::shared_ptr<ExpressionContext>> row_filter_expressions;
+    for (const auto& clause: read_query.clauses_) {
+        auto row_filter_expression = clause->clause_info().row_filter_expression_;
+        if (!row_filter_expression)
+            break;
+        row_filter_expressions.emplace_back(std::move(row_filter_expression));
+    }
+    return row_filter_expressions;
+}
+
+// Starts reading the column stats of the version if they could be used to prune row-slices from the read, so that
+// they are read at the same time as the index. The future holds nothing if the version has no column stats
+std::optional<folly::Future<std::optional<SegmentInMemory>>> read_column_stats_for_pruning_async(
+        const std::shared_ptr<Store>& store,
+        const VersionedItem& version_info,
+        const ReadQuery& read_query) {
+    if (ConfigsMap::instance()->get_int("ColumnStats.UseForFiltering", 1) == 0 ||
+        leading_row_filter_expressions(read_query).empty())
+        return std::nullopt;
+    // Most versions have no column stats, so a missing key is expected
+    storage::ReadKeyOpts opts;
+    opts.dont_warn_about_missing_key = true;
+    return store->read(index_key_to_column_stats_key(version_info.key_), opts)
+        .thenValue([](auto&& key_seg) { return std::make_optional<SegmentInMemory>(std::move(key_seg.second)); })
+        .thenError(folly::tag_t<storage::KeyNotFoundException>{}, [](auto&&) {
+            return std::optional<SegmentInMemory>{};
+        });
+}
+
+// Removes row-slices from the pipeline that the column stats (if any) show cannot contain rows matching the filters at
+// the start of the processing pipeline, so that they are never read from storage. Returns the number of data segments
+// removed. Errors reading the column stats other than them not existing are rethrown
+size_t prune_slices_using_column_stats(
+        const std::shared_ptr<PipelineContext>& pipeline_context,
+        std::optional<folly::Future<std::optional<SegmentInMemory>>>&& column_stats_fut,
+        const VersionedItem& version_info,
+        const ReadQuery& read_query,
+        const ReadOptions& read_options) {
+    if (!column_stats_fut || pipeline_context->slice_and_keys_.empty())
+        return 0;
+
+    auto column_stats_segment = std::move(*column_stats_fut).get();
+    if (!column_stats_segment)
+        return 0;
+
+    const auto row_filter_expressions = leading_row_filter_expressions(read_query);
+    ColumnStatsFilter column_stats_filter(
+            std::move(*column_stats_segment),
+            pipeline_context->descriptor(),
+            opt_false(read_options.dynamic_schema()));
+    const auto num_slices = pipeline_context->slice_and_keys_.size();
+    std::erase_if(pipeline_context->slice_and_keys_, [&](const SliceAndKey& slice_and_key) {
+        const auto& key = slice_and_key.key();
+        if (!std::holds_alternative<NumericIndex>(key.start_index()) || !std::holds_alternative<NumericIndex>(key.end_index()))
+            return false;
+        const auto start_index = std::get<NumericIndex>(key.start_index());
+        const auto end_index = std::get<NumericIndex>(key.end_index());
+        return std::ranges::any_of(row_filter_expressions, [&](const auto& row_filter_expression) {
+            return !column_stats_filter.may_match(start_index, end_index, *row_filter_expression);
+        });
+    });
+    pipeline_context->total_rows_ = pipeline_context->calc_rows();
+    const auto segments_skipped = num_slices - pipeline_context->slice_and_keys_.size();
+    ARCTICDB_DEBUG(log::version(), "Column stats pruned {} of {} slices for symbol {}",
+                   segments_skipped, num_slices, version_info.symbol());
+    return segments_skipped;
+}
+
 // Returns true if there are staged segments
 bool read_incompletes_to_pipeline(
     const std::shared_ptr<Store>& store,
@@ -1061,7 +1179,8 @@ bool read_incompletes_to_pipeline(
     bool convert_int_to_float,
     bool via_iteration,
     bool sparsify,
-    bool dynamic_schema) {
+    bool dynamic_schema,
+    bool iterate_if_no_chain = false) {
 
     auto incomplete_segments = get_incomplete(
         store,
@@ -1069,7 +1188,8 @@ bool read_incompletes_to_pipeline(
         read_query.row_filter,
         pipeline_context->last_row(),
         via_iteration,
-        false);
+        false,
+        iterate_if_no_chain);
 
     ARCTICDB_DEBUG(log::version(), "Symbol {}: Found {} incomplete segments", pipeline_context->stream_id_, incomplete_segments.size());
     if(incomplete_segments.empty()) {
@@ -1489,6 +1609,7 @@ void create_column_stats_impl(
         internal::check<ErrorCode::E_ASSERTION_FAILURE>(
                 new_segment.column(0) == old_segment->column(0) && new_segment.column(1) == old_segment->column(1),
                 "Cannot create column stats, existing column stats row-groups do not match");
+        merge_string_columns(new_segment, old_segment->string_pool_ptr(), false);
         old_segment->concatenate(std::move(new_segment));
         store->update(column_stats_key, std::move(*old_segment), update_opts).get();
     }
@@ -1683,6 +1804,320 @@ std::optional<DeleteIncompleteKeysOnExit> get_delete_keys_on_failure(
         return std::nullopt;
 }
 
+namespace {
+
+// Rows sorted on the index, either held in memory or spilled to storage as chunks of consecutive rows
+struct SortedRun {
+    std::optional<SegmentInMemory> segment_;
+    std::vector<AtomKey> chunks_;
+};
+
+// The chunks of sorted runs spilled to storage. They are written under a stream id of their own, so that chunks left
+// behind by a process that died mid-sort can't be mistaken for data of the symbol. Each chunk is deleted once it has
+// been merged, and any left on exit, such as after a failure, are deleted then.
+class SpilledChunks {
+public:
+    SpilledChunks(std::shared_ptr<Store> store, const StreamId& symbol) :
+            store_(std::move(store)),
+            stream_id_(fmt::format("__sort_merge_run__{}_{}", symbol, util::SysClock::nanos_since_epoch())) {
+    }
+
+    ARCTICDB_NO_MOVE_OR_COPY(SpilledChunks)
+
+    ~SpilledChunks() {
+        if (outstanding_.empty())
+            return;
+
+        try {
+            store_->remove_keys_sync(
+                std::vector<VariantKey>(outstanding_.begin(), outstanding_.end()),
+                storage::RemoveOpts{.ignores_missing_key_ = true});
+        } catch (const std::exception& e) {
+            log::version().warn(
+                "Failed to delete {} spilled sort chunks of {}: {}", outstanding_.size(), stream_id_, e.what());
+        }
+    }
+
+    const StreamId& stream_id() const {
+        return stream_id_;
+    }
+
+    void add(const AtomKey& key) {
+        outstanding_.insert(key);
+    }
+
+    void remove(const AtomKey& key) {
+        store_->remove_key_sync(key, storage::RemoveOpts{.ignores_missing_key_ = true});
+        outstanding_.erase(key);
+    }
+
+private:
+    std::shared_ptr<Store> store_;
+    StreamId stream_id_;
+    std::unordered_set<AtomKey> outstanding_;
+};
+
+// Presents a sorted run to do_merge as a stream of rows. A spilled run holds only its current chunk in memory, with the
+// next chunk read from storage while the current one is merged, and each chunk is deleted as soon as it is merged
+struct SortedRunCursor {
+    SegmentInMemory seg_;
+    SegmentInMemory::iterator it_;
+
+    SortedRunCursor(std::shared_ptr<Store> store, SpilledChunks& spilled, const StreamId& stream_id, SortedRun&& run) :
+            seg_(run.segment_.has_value() ? std::move(*run.segment_) : SegmentInMemory{}),
+            it_(seg_.begin()),
+            store_(std::move(store)),
+            spilled_(spilled),
+            chunks_(std::move(run.chunks_)),
+            id_(stream_id) {
+        read_ahead();
+    }
+
+    // Waits for the first chunk of a spilled run, returning whether the run has any rows. Separate from construction so
+    // that the first chunks of all the runs being merged are read concurrently
+    bool start() {
+        return it_ != seg_.end() || next_chunk();
+    }
+
+    bool advance() {
+        return ++it_ != seg_.end() || next_chunk();
+    }
+
+    SegmentInMemory::Row& row() {
+        return *it_;
+    }
+
+    const StreamId& id() const {
+        return id_;
+    }
+
+private:
+    void read_ahead() {
+        if (next_chunk_idx_ < chunks_.size())
+            next_chunk_ = store_->read(chunks_[next_chunk_idx_++]);
+    }
+
+    bool next_chunk() {
+        while (next_chunk_.has_value()) {
+            // The rows of the current chunk have all been merged
+            if (next_chunk_idx_ > 1)
+                spilled_.remove(chunks_[next_chunk_idx_ - 2]);
+            seg_ = std::move(*next_chunk_).get().second;
+            next_chunk_.reset();
+            read_ahead();
+            it_ = seg_.begin();
+            if (it_ != seg_.end())
+                return true;
+        }
+        if (!chunks_.empty() && next_chunk_idx_ == chunks_.size()) {
+            spilled_.remove(chunks_.back());
+            ++next_chunk_idx_;
+        }
+        return false;
+    }
+
+    std::shared_ptr<Store> store_;
+    SpilledChunks& spilled_;
+    std::vector<AtomKey> chunks_;
+    size_t next_chunk_idx_ = 0;
+    std::optional<folly::Future<std::pair<VariantKey, SegmentInMemory>>> next_chunk_;
+    StreamId id_;
+};
+
+// Fixed width of a row, counting strings as their offsets into the string pool
+size_t estimated_bytes_per_row(const StreamDescriptor& desc) {
+    size_t bytes = 0;
+    for (const auto& field : desc.fields())
+        bytes += get_type_size(field.type().data_type());
+    return std::max<size_t>(bytes, 1);
+}
+
+template<typename SchemaType, typename Callable>
+void merge_sorted_runs(
+        const std::shared_ptr<Store>& store,
+        const std::shared_ptr<PipelineContext>& pipeline_context,
+        const stream::TimeseriesIndex& timeseries_index,
+        SpilledChunks& spilled,
+        std::vector<SortedRun>&& runs,
+        size_t segment_rows,
+        std::optional<timestamp> last_existing_index,
+        Callable&& on_segment) {
+    auto compare = [](const std::unique_ptr<SortedRunCursor>& left, const std::unique_ptr<SortedRunCursor>& right) {
+        const auto left_index = pipelines::index::index_value_from_row(left->row(), IndexDescriptorImpl::Type::TIMESTAMP, 0);
+        const auto right_index = pipelines::index::index_value_from_row(right->row(), IndexDescriptorImpl::Type::TIMESTAMP, 0);
+        return left_index > right_index;
+    };
+    movable_priority_queue<std::unique_ptr<SortedRunCursor>, std::vector<std::unique_ptr<SortedRunCursor>>, decltype(compare)> input_streams{compare};
+
+    std::vector<std::unique_ptr<SortedRunCursor>> cursors;
+    cursors.reserve(runs.size());
+    for (auto& run : runs)
+        cursors.emplace_back(
+            std::make_unique<SortedRunCursor>(store, spilled, pipeline_context->stream_id_, std::move(run)));
+    for (auto& cursor : cursors) {
+        if (cursor->start())
+            input_streams.emplace(std::move(cursor));
+    }
+
+    if (last_existing_index.has_value() && !input_streams.empty()) {
+        const auto incomplete_start =
+            std::get<timestamp>(*pipelines::index::index_value_from_row(input_streams.top()->row(), IndexDescriptorImpl::Type::TIMESTAMP, 0));
+        // NaT is rejected with its own message by do_merge
+        sorting::check<ErrorCode::E_UNSORTED_DATA>(
+            incomplete_start == NaT || *last_existing_index <= incomplete_start,
+            "Cannot append staged segments to existing data as incomplete segment contains index value {} < existing data {}",
+            date_and_time(incomplete_start),
+            date_and_time(*last_existing_index)
+        );
+    }
+
+    using AggregatorType = stream::Aggregator<stream::TimeseriesIndex, SchemaType, stream::RowCountSegmentPolicy, stream::SparseColumnPolicy>;
+    AggregatorType aggregator{
+        SchemaType{pipeline_context->descriptor(), timeseries_index},
+        std::forward<Callable>(on_segment),
+        stream::RowCountSegmentPolicy{segment_rows},
+        pipeline_context->descriptor(),
+        std::nullopt
+    };
+    stream::do_merge<stream::TimeseriesIndex, AggregatorType, decltype(input_streams)>(input_streams, aggregator, false);
+}
+
+// Merges the runs into a single run spilled to storage in chunks of chunk_rows rows
+template<typename SchemaType>
+SortedRun spill_merged_runs(
+        const std::shared_ptr<Store>& store,
+        const std::shared_ptr<PipelineContext>& pipeline_context,
+        const stream::TimeseriesIndex& timeseries_index,
+        SpilledChunks& spilled,
+        std::vector<SortedRun>&& runs,
+        size_t chunk_rows,
+        const std::shared_ptr<folly::NativeSemaphore>& semaphore) {
+    std::vector<folly::Future<VariantKey>> chunk_futures;
+    merge_sorted_runs<SchemaType>(
+        store, pipeline_context, timeseries_index, spilled, std::move(runs), chunk_rows, std::nullopt,
+        [&chunk_futures, &store, &pipeline_context, &spilled, &semaphore](SegmentInMemory&& segment) {
+            segment.descriptor().set_id(spilled.stream_id());
+            stream::StreamSink::PartialKey pk{
+                KeyType::TABLE_DATA,
+                pipeline_context->version_id_,
+                spilled.stream_id(),
+                TimeseriesIndex::start_value_for_segment(segment),
+                pipelines::end_index_generator(TimeseriesIndex::end_value_for_segment(segment))};
+            chunk_futures.emplace_back(store->write_maybe_blocking(pk, std::move(segment), semaphore));
+        });
+    auto results = folly::collectAll(chunk_futures).get();
+    // Record every chunk that was written before raising any failure, so that they are all deleted
+    for (const auto& result : results) {
+        if (result.hasValue())
+            spilled.add(to_atom(result.value()));
+    }
+    SortedRun run;
+    for (auto& result : results)
+        run.chunks_.emplace_back(to_atom(std::move(result.value())));
+    return run;
+}
+
+/*
+ * External merge sort of the staged segments, keeping the staged data held in memory within SortMerge.MemoryBudgetBytes.
+ *
+ * Staged segments are read and sorted concurrently on the CPU pool, in waves holding at most half of the budget. If all
+ * the staged data fits in a single wave it is merged straight into the output. Otherwise each wave is merged into a
+ * sorted run which is spilled to storage in small chunks, and the runs are streamed through a k-way merge holding two
+ * chunks of each run in memory. Should there be too many runs to do that within the budget, groups of runs are first
+ * merged into longer runs. Spilled chunks are deleted as soon as they have been merged, and on failure.
+ */
+template<typename SchemaType, typename Callable>
+void external_sort_merge(
+        const std::shared_ptr<Store>& store,
+        const std::shared_ptr<PipelineContext>& pipeline_context,
+        const stream::TimeseriesIndex& timeseries_index,
+        const WriteOptions& write_options,
+        std::optional<timestamp> last_existing_index,
+        Callable&& on_segment) {
+    std::vector<RangesAndKey> ranges_and_keys;
+    size_t staged_rows = 0;
+    for (auto it = pipeline_context->incompletes_begin(); it != pipeline_context->end(); ++it) {
+        const auto& sk = it->slice_and_key();
+        // Empty staged segments can only contribute columns, which are already in the staged descriptor
+        if (sk.slice().rows().diff() == 0)
+            continue;
+        staged_rows += sk.slice().rows().diff();
+        auto key = sk.key();
+        ranges_and_keys.emplace_back(sk.slice(), std::move(key), true);
+    }
+
+    const auto memory_budget = ConfigsMap::instance()->get_int("SortMerge.MemoryBudgetBytes", 2LL << 30);
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(memory_budget > 0, "SortMerge.MemoryBudgetBytes must be strictly positive but was {}", memory_budget);
+    const auto budget_rows = std::max<size_t>(static_cast<size_t>(memory_budget) / estimated_bytes_per_row(*pipeline_context->staged_descriptor_), 2);
+    // Sorting a segment needs it in memory twice over
+    const auto wave_rows = budget_rows / 2;
+    const bool spill = staged_rows > wave_rows;
+    // Each run being merged holds its current chunk and the one being read ahead
+    const auto chunk_rows = std::max<size_t>(std::min<size_t>(write_options.segment_row_size, budget_rows / 64), 1);
+    const auto max_fan_in = std::max<size_t>(budget_rows / (2 * chunk_rows), 2);
+    ARCTICDB_DEBUG(log::version(), "Sort merging {} staged rows of symbol {} with a budget of {} rows, spilling {}",
+                   staged_rows, pipeline_context->stream_id_, budget_rows, spill);
+
+    const std::string index_name{timeseries_index.name()};
+    const ProcessingConfig processing_config{write_options.dynamic_schema, pipeline_context->rows_};
+    auto semaphore = std::make_shared<folly::NativeSemaphore>(n_segments_live_during_compaction());
+    SpilledChunks spilled{store, pipeline_context->stream_id_};
+
+    std::vector<SortedRun> runs;
+    for (auto range_it = ranges_and_keys.begin(); range_it != ranges_and_keys.end();) {
+        // A wave always takes at least one segment, however large
+        std::vector<RangesAndKey> wave;
+        size_t wave_row_count = 0;
+        do {
+            wave_row_count += range_it->row_range_.diff();
+            wave.emplace_back(std::move(*range_it++));
+        } while (range_it != ranges_and_keys.end() && wave_row_count + range_it->row_range_.diff() <= wave_rows);
+
+        std::vector<folly::Future<SortedRun>> sorted_futures;
+        for (auto&& fut : generate_segment_and_slice_futures(store, pipeline_context, processing_config, std::move(wave))) {
+            sorted_futures.emplace_back(std::move(fut).via(&async::cpu_executor()).thenValue([&index_name](SegmentAndSlice&& segment_and_slice) {
+                auto& segment = segment_and_slice.segment_in_memory_;
+                segment.sort(index_name);
+                return SortedRun{std::move(segment), {}};
+            }));
+        }
+        auto sorted = folly::collect(sorted_futures).get();
+        if (spill)
+            runs.emplace_back(spill_merged_runs<SchemaType>(
+                store, pipeline_context, timeseries_index, spilled, std::move(sorted), chunk_rows, semaphore));
+        else
+            runs = std::move(sorted);
+    }
+
+    while (runs.size() > max_fan_in) {
+        ARCTICDB_DEBUG(log::version(), "Merging {} sorted runs of symbol {} in groups of {}", runs.size(), pipeline_context->stream_id_, max_fan_in);
+        std::vector<SortedRun> merged_runs;
+        for (size_t start = 0; start < runs.size(); start += max_fan_in) {
+            const auto end = std::min(start + max_fan_in, runs.size());
+            if (end - start == 1) {
+                merged_runs.emplace_back(std::move(runs[start]));
+                continue;
+            }
+            std::vector<SortedRun> group(std::make_move_iterator(runs.begin() + start), std::make_move_iterator(runs.begin() + end));
+            merged_runs.emplace_back(spill_merged_runs<SchemaType>(
+                store, pipeline_context, timeseries_index, spilled, std::move(group), chunk_rows, semaphore));
+        }
+        runs = std::move(merged_runs);
+    }
+
+    merge_sorted_runs<SchemaType>(
+        store,
+        pipeline_context,
+        timeseries_index,
+        spilled,
+        std::move(runs),
+        static_cast<size_t>(ConfigsMap::instance()->get_int("Merge.SegmentSize", 100000)),
+        last_existing_index,
+        std::forward<Callable>(on_segment));
+}
+
+} // namespace
+
 VersionedItem sort_merge_impl(
     const std::shared_ptr<Store>& store,
     const StreamId& stream_id,
@@ -1727,31 +2162,9 @@ VersionedItem sort_merge_impl(
     auto index = stream::index_type_from_descriptor(pipeline_context->descriptor());
     util::variant_match(index,
         [&](const stream::TimeseriesIndex &timeseries_index) {
-            read_query->clauses_.emplace_back(std::make_shared<Clause>(SortClause{timeseries_index.name(), pipeline_context->incompletes_after()}));
-            read_query->clauses_.emplace_back(std::make_shared<Clause>(RemoveColumnPartitioningClause{}));
-
-            read_query->clauses_.emplace_back(std::make_shared<Clause>(MergeClause{
-                timeseries_index,
-                SparseColumnPolicy{},
-                stream_id,
-                pipeline_context->descriptor(),
-                write_options.dynamic_schema
-            }));
-            ReadOptions read_options;
-            read_options.set_dynamic_schema(write_options.dynamic_schema);
-            auto segments = read_and_process(store, pipeline_context, read_query, read_options).get();
-            if (options.append_ && update_info.previous_index_key_ && !segments.empty()) {
-                const timestamp last_index_on_disc = update_info.previous_index_key_->end_time() - 1;
-                const timestamp incomplete_start =
-                    std::get<timestamp>(TimeseriesIndex::start_value_for_segment(segments[0].segment(store)));
-                sorting::check<ErrorCode::E_UNSORTED_DATA>(
-                    last_index_on_disc <= incomplete_start,
-                    "Cannot append staged segments to existing data as incomplete segment contains index value {} < existing data {}",
-                    date_and_time(incomplete_start),
-                    date_and_time(last_index_on_disc)
-                );
-            }
-            pipeline_context->total_rows_ = num_versioned_rows + get_slice_rowcounts(segments);
+            std::optional<timestamp> last_existing_index;
+            if (options.append_ && update_info.previous_index_key_.has_value())
+                last_existing_index = update_info.previous_index_key_->end_time() - 1;
 
             auto index = index_type_from_descriptor(pipeline_context->descriptor());
             stream::SegmentAggregator<TimeseriesIndex, DynamicSchema, RowCountSegmentPolicy, SparseColumnPolicy>
@@ -1769,23 +2182,28 @@ VersionedItem sort_merge_impl(
                 },
                 RowCountSegmentPolicy(write_options.segment_row_size)};
 
-            [[maybe_unused]] size_t count = 0;
-            for(auto& sk : segments) {
-                SegmentInMemory segment = sk.release_segment(store);
-
-                ARCTICDB_DEBUG(log::version(), "sort_merge_impl Symbol {} Segment {}: Segment has rows {} columns {} uncompressed bytes {}",
-                               pipeline_context->stream_id_, count++, segment.row_count(), segment.columns().size(),
+            size_t merged_rows = 0;
+            auto add_merged_segment = [&](SegmentInMemory&& segment) {
+                ARCTICDB_DEBUG(log::version(), "sort_merge_impl Symbol {}: Merged segment has rows {} columns {} uncompressed bytes {}",
+                               pipeline_context->stream_id_, segment.row_count(), segment.columns().size(),
                                segment.descriptor().uncompressed_bytes());
                 // Empty columns can appear only of one staged segment is empty and adds column which
-                // does not appear in any other segment. There can also be empty columns if all segments
-                // are empty in that case this loop won't be reached as segments.size() will be 0
+                // does not appear in any other segment
                 if (write_options.dynamic_schema) {
                     segment.drop_empty_columns();
                 }
-
-                aggregator.add_segment(std::move(segment), sk.slice(), options.convert_int_to_float_);
-            }
+                const auto start_row = num_versioned_rows + merged_rows;
+                merged_rows += segment.row_count();
+                auto desc = std::make_shared<StreamDescriptor>(segment.descriptor());
+                const FrameSlice slice{desc, ColRange{desc->index().field_count(), desc->field_count()}, RowRange{start_row, start_row + segment.row_count()}};
+                aggregator.add_segment(std::move(segment), slice, options.convert_int_to_float_);
+            };
+            if (write_options.dynamic_schema)
+                external_sort_merge<DynamicSchema>(store, pipeline_context, timeseries_index, write_options, last_existing_index, std::move(add_merged_segment));
+            else
+                external_sort_merge<FixedSchema>(store, pipeline_context, timeseries_index, write_options, last_existing_index, std::move(add_merged_segment));
             aggregator.commit();
+            pipeline_context->total_rows_ = num_versioned_rows + merged_rows;
             pipeline_context->desc_->set_sorted(deduce_sorted(previous_sorted_value.value_or(SortedValue::ASCENDING), SortedValue::ASCENDING));
         },
         [&](const auto &) {
@@ -2022,6 +2440,36 @@ void set_row_id_if_index_only(
     }
 }
 
+folly::Future<ReadVersionOutput> read_frame_from_pipeline_context(
+        const std::shared_ptr<Store>& store,
+        const std::shared_ptr<PipelineContext>& pipeline_context,
+        const std::shared_ptr<ReadQuery>& read_query,
+        const ReadOptions& read_options,
+        VersionedItem res_versioned_item,
+        std::any& handler_data) {
+    modify_descriptor(pipeline_context, read_options);
+    generate_filtered_field_descriptors(pipeline_context, read_query->columns);
+    ARCTICDB_DEBUG(log::version(), "Fetching data to frame");
+
+    DecodePathData shared_data;
+    if (opt_false(read_options.optimise_string_memory()))
+        shared_data.set_optimize_for_memory();
+
+    return do_direct_read_or_process(store, read_query, read_options, pipeline_context, shared_data, handler_data)
+    .thenValue([res_versioned_item, pipeline_context, read_options, &handler_data, read_query, shared_data](auto&& frame) mutable {
+        ARCTICDB_DEBUG(log::version(), "Reduce and fix columns");
+        return reduce_and_fix_columns(pipeline_context, frame, read_options, handler_data)
+        .via(&async::cpu_executor())
+        .thenValue([res_versioned_item, pipeline_context, frame, read_query, shared_data](auto&&) mutable {
+            set_row_id_if_index_only(*pipeline_context, frame, *read_query);
+            return ReadVersionOutput{std::move(res_versioned_item),
+                                     {frame,
+                                      timeseries_descriptor_from_pipeline_context(pipeline_context, {}, pipeline_context->bucketize_dynamic_),
+                                      {}}};
+        });
+    });
+}
+
 // This is the main user-facing read method that either returns all or
 // part of a dataframe as-is, or transforms it via a processing pipeline
 folly::Future<ReadVersionOutput> read_frame_for_version(
@@ -2033,6 +2481,7 @@ folly::Future<ReadVersionOutput> read_frame_for_version(
     using namespace arcticdb::pipelines;
     auto pipeline_context = std::make_shared<PipelineContext>();
     VersionedItem res_versioned_item;
+    std::optional<folly::Future<std::optional<SegmentInMemory>>> column_stats_fut;
 
     if(std::holds_alternative<StreamId>(version_info)) {
         pipeline_context->stream_id_ = std::get<StreamId>(version_info);
@@ -2047,8 +2496,10 @@ folly::Future<ReadVersionOutput> read_frame_for_version(
                                            .build<KeyType::TABLE_INDEX>(std::get<StreamId>(version_info)));
     } else {
         pipeline_context->stream_id_ = std::get<VersionedItem>(version_info).key_.id();
-        read_indexed_keys_to_pipeline(store, pipeline_context, std::get<VersionedItem>(version_info), *read_query, read_options);
-        res_versioned_item = std::get<VersionedItem>(version_info);
+        const auto& versioned_item = std::get<VersionedItem>(version_info);
+        column_stats_fut = read_column_stats_for_pruning_async(store, versioned_item, *read_query);
+        read_indexed_keys_to_pipeline(store, pipeline_context, versioned_item, *read_query, read_options);
+        res_versioned_item = versioned_item;
     }
 
     if(pipeline_context->multi_key_) {
@@ -2056,12 +2507,31 @@ folly::Future<ReadVersionOutput> read_frame_for_version(
         return read_multi_key(store, *pipeline_context->multi_key_, handler_data, std::move(res_versioned_item.key_));
     }
 
+    if(std::holds_alternative<VersionedItem>(version_info))
+        res_versioned_item.segments_skipped_ = prune_slices_using_column_stats(
+            pipeline_context,
+            std::move(column_stats_fut),
+            std::get<VersionedItem>(version_info),
+            *read_query,
+            read_options);
+
     if(opt_false(read_options.incompletes())) {
         util::check(std::holds_alternative<IndexRange>(read_query->row_filter), "Streaming read requires date range filter");
         const auto& query_range = std::get<IndexRange>(read_query->row_filter);
         const auto existing_range = pipeline_context->index_range();
-        if(!existing_range.specified_ || query_range.end_ > existing_range.end_)
-            read_incompletes_to_pipeline(store, pipeline_context, *read_query, read_options, false, false, false,  opt_false(read_options.dynamic_schema()));
+        if(!existing_range.specified_ || query_range.end_ > existing_range.end_) {
+            // Data staged with write_parallel has no append chain, so can only be found by listing
+            read_incompletes_to_pipeline(
+                store,
+                pipeline_context,
+                *read_query,
+                read_options,
+                false,
+                false,
+                false,
+                opt_false(read_options.dynamic_schema()),
+                true);
+        }
     }
 
     if(std::holds_alternative<StreamId>(version_info) && !pipeline_context->incompletes_after_) {
@@ -2069,18 +2539,73 @@ folly::Future<ReadVersionOutput> read_frame_for_version(
             "read_dataframe_impl: read returned no data for symbol {} (found no versions or append data)", pipeline_context->stream_id_);
     }
 
-    modify_descriptor(pipeline_context, read_options);
-    generate_filtered_field_descriptors(pipeline_context, read_query->columns);
-    ARCTICDB_DEBUG(log::version(), "Fetching data to frame");
+    return read_frame_from_pipeline_context(
+        store, pipeline_context, read_query, read_options, std::move(res_versioned_item), handler_data);
+}
 
-    DecodePathData shared_data;
-    return do_direct_read_or_process(store, read_query, read_options, pipeline_context, shared_data, handler_data)
-    .thenValue([res_versioned_item, pipeline_context, read_options, &handler_data, read_query, shared_data](auto&& frame) mutable {
-        ARCTICDB_DEBUG(log::version(), "Reduce and fix columns");
+folly::Future<ReadVersionOutput> read_and_join_frames(
+        const std::shared_ptr<Store>& store,
+        const std::vector<VersionedItem>& versioned_items,
+        std::vector<std::shared_ptr<ReadQuery>>&& read_queries,
+        const ReadOptions& read_options,
+        std::vector<std::shared_ptr<Clause>>&& join_clauses,
+        std::any& handler_data) {
+    util::check(versioned_items.size() == read_queries.size(),
+                "read_and_join_frames received {} versions but {} read queries", versioned_items.size(), read_queries.size());
+    util::check(!versioned_items.empty() && !join_clauses.empty(), "read_and_join_frames requires symbols and join clauses");
+    auto component_manager = std::make_shared<ComponentManager>();
+    std::vector<std::shared_ptr<PipelineContext>> pipeline_contexts;
+    std::vector<folly::Future<std::vector<EntityId>>> symbol_entity_ids;
+    pipeline_contexts.reserve(versioned_items.size());
+    symbol_entity_ids.reserve(versioned_items.size());
+    for (auto&& [idx, versioned_item]: folly::enumerate(versioned_items)) {
+        auto& read_query = read_queries[idx];
+        auto pipeline_context = std::make_shared<PipelineContext>();
+        pipeline_context->stream_id_ = versioned_item.key_.id();
+        auto column_stats_fut = read_column_stats_for_pruning_async(store, versioned_item, *read_query);
+        read_indexed_keys_to_pipeline(store, pipeline_context, versioned_item, *read_query, read_options);
+        user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+                !pipeline_context->multi_key_,
+                "Cannot join symbol {} as it contains recursively normalized data", pipeline_context->stream_id_);
+        util::check_rte(!pipeline_context->is_pickled(), "Cannot join pickled data");
+        std::ignore = prune_slices_using_column_stats(
+                pipeline_context, std::move(column_stats_fut), versioned_item, *read_query, read_options);
+        modify_descriptor(pipeline_context, read_options);
+        generate_filtered_field_descriptors(pipeline_context, read_query->columns);
+        if (read_query->clauses_.empty()) {
+            read_query->clauses_.emplace_back(std::make_shared<Clause>(PassthroughClause()));
+        }
+        symbol_entity_ids.emplace_back(read_and_schedule_processing(store, pipeline_context, read_query, read_options, component_manager));
+        pipeline_contexts.emplace_back(std::move(pipeline_context));
+    }
+
+    // The output takes its index, and the order of the columns it has in common with the input, from the first symbol
+    auto pipeline_context = pipeline_contexts.front();
+    ProcessingConfig processing_config{opt_false(read_options.dynamic_schema()), pipeline_context->rows_};
+    for (auto& clause: join_clauses) {
+        clause->set_processing_config(processing_config);
+        clause->set_component_manager(component_manager);
+    }
+    auto clauses = std::make_shared<std::vector<std::shared_ptr<Clause>>>(join_clauses);
+    return folly::collect(symbol_entity_ids).via(&async::io_executor())
+    .thenValue([clauses](std::vector<std::vector<EntityId>>&& entity_id_vectors) {
+        return schedule_later_iterations(schedule_clause_stage(std::move(entity_id_vectors), clauses), clauses);
+    })
+    .via(&async::cpu_executor())
+    .thenValue([component_manager, join_clauses=std::move(join_clauses), pipeline_context](std::vector<EntityId>&& processed_entity_ids) {
+        auto proc = gather_entities<std::shared_ptr<SegmentInMemory>,
+                                    std::shared_ptr<RowRange>,
+                                    std::shared_ptr<ColRange>>(*component_manager, processed_entity_ids);
+        set_output_descriptors(proc, join_clauses, pipeline_context);
+        return collect_segments(std::move(proc));
+    })
+    .thenValue([store, pipeline_context, read_options, &handler_data](std::vector<SliceAndKey>&& segs) {
+        return prepare_output_frame(std::move(segs), pipeline_context, store, read_options, handler_data);
+    })
+    .thenValue([res_versioned_item=versioned_items.front(), pipeline_context, read_options, &handler_data](SegmentInMemory&& frame) mutable {
         return reduce_and_fix_columns(pipeline_context, frame, read_options, handler_data)
         .via(&async::cpu_executor())
-        .thenValue([res_versioned_item, pipeline_context, frame, read_query, shared_data](auto&&) mutable {
-            set_row_id_if_index_only(*pipeline_context, frame, *read_query);
+        .thenValue([res_versioned_item=std::move(res_versioned_item), pipeline_context, frame](auto&&) mutable {
             return ReadVersionOutput{std::move(res_versioned_item),
                                      {frame,
                                       timeseries_descriptor_from_pipeline_context(pipeline_context, {}, pipeline_context->bucketize_dynamic_),
@@ -146,6 +146,17 @@ folly::Future<std::vector<EntityId>> schedule_clause_processing(
     std::vector<std::vector<size_t>>&& processing_unit_indexes,
     std::shared_ptr<std::vector<std::shared_ptr<Clause>>> clauses);
 
+// Runs the first remaining stage of clauses (the clauses up to the next change in processing structure), structured
+// for processing from the entity ids output by the previous stage
+folly::Future<std::vector<std::vector<EntityId>>> schedule_clause_stage(
+    std::vector<std::vector<EntityId>>&& entity_id_vectors,
+    std::shared_ptr<std::vector<std::shared_ptr<Clause>>> clauses);
+
+// Schedules all the stages of clauses after the first, which has been scheduled to produce entity_ids_vec_fut
+folly::Future<std::vector<EntityId>> schedule_later_iterations(
+    folly::Future<std::vector<std::vector<EntityId>>>&& entity_ids_vec_fut,
+    std::shared_ptr<std::vector<std::shared_ptr<Clause>>> clauses);
+
 FrameAndDescriptor read_segment_impl(
     const std::shared_ptr<Store>& store,
     const VariantKey& key);
@@ -207,10 +218,32 @@ void read_indexed_keys_to_pipeline(
     ReadQuery& read_query,
     const ReadOptions& read_options);
 
+// As read_indexed_keys_to_pipeline, for an index that has already been read, including every page of a paged index
+void read_index_segment_reader_to_pipeline(
+    const std::shared_ptr<PipelineContext>& pipeline_context,
+    pipelines::index::IndexSegmentReader&& index_segment_reader,
+    const VersionedItem& version_info,
+    ReadQuery& read_query,
+    const ReadOptions& read_options);
+
 void add_index_columns_to_query(
     const ReadQuery& read_query, 
     const TimeseriesDescriptor& desc);
 
+// Starts reading the column stats of the version if they could be used to prune row-slices from the read. The future
+// holds nothing if the version has no column stats
+std::optional<folly::Future<std::optional<SegmentInMemory>>> read_column_stats_for_pruning_async(
+    const std::shared_ptr<Store>& store,
+    const VersionedItem& version_info,
+    const ReadQuery& read_query);
+
+size_t prune_slices_using_column_stats(
+    const std::shared_ptr<PipelineContext>& pipeline_context,
+    std::optional<folly::Future<std::optional<SegmentInMemory>>>&& column_stats_fut,
+    const VersionedItem& version_info,
+    const ReadQuery& read_query,
+    const ReadOptions& read_options);
+
 folly::Future<ReadVersionOutput> read_frame_for_version(
     const std::shared_ptr<Store>& store,
     const std::variant<VersionedItem, StreamId>& version_info,
@@ -219,6 +252,29 @@ folly::Future<ReadVersionOutput> read_frame_for_version(
     std::any& handler_data
 );
 
+// Reads and processes the row-slices of a pipeline context that has already been populated from the index
+folly::Future<ReadVersionOutput> read_frame_from_pipeline_context(
+    const std::shared_ptr<Store>& store,
+    const std::shared_ptr<PipelineContext>& pipeline_context,
+    const std::shared_ptr<ReadQuery>& read_query,
+    const ReadOptions& read_options,
+    VersionedItem res_versioned_item,
+    std::any& handler_data
+);
+
+// Reads each of the given versions through its own read query into a shared component manager, then runs join_clauses
+// over the outputs of all of them. The first join clause is structured for processing with one vector of entity ids
+// per symbol, in the order of versioned_items. The output frame has the index and normalization metadata of the first
+// symbol
+folly::Future<ReadVersionOutput> read_and_join_frames(
+    const std::shared_ptr<Store>& store,
+    const std::vector<VersionedItem>& versioned_items,
+    std::vector<std::shared_ptr<ReadQuery>>&& read_queries,
+    const ReadOptions& read_options,
+    std::vector<std::shared_ptr<Clause>>&& join_clauses,
+    std::any& handler_data
+);
+
 class DeleteIncompleteKeysOnExit {
 public:
     DeleteIncompleteKeysOnExit(
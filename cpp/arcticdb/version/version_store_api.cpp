@@ -28,6 +28,7 @@
 #include <arcticdb/pipeline/pipeline_utils.hpp>
 #include <arcticdb/pipeline/frame_utils.hpp>
 #include <arcticdb/version/snapshot.hpp>
+#include <arcticdb/util/type_handler.hpp>
 #include <storage/file/file_store.hpp>
 
 #include <regex>
@@ -734,6 +735,23 @@ VersionedItem PythonVersionStore::compact_incomplete(
     return compact_incomplete_dynamic(stream_id, meta, options);
 }
 
+std::optional<VersionedItem> PythonVersionStore::compact_incomplete_unless_locked(
+        const StreamId& stream_id,
+        bool append,
+        bool prune_previous_versions,
+        bool validate_index) {
+    CompactIncompleteOptions options{
+        .prune_previous_versions_=prune_previous_versions,
+        .append_=append,
+        .convert_int_to_float_=false,
+        .via_iteration_=true,
+        .sparsify_=false,
+        .validate_index_=validate_index,
+        .delete_staged_data_on_failure_=false
+    };
+    return LocalVersionedEngine::compact_incomplete_unless_locked(stream_id, std::nullopt, options);
+}
+
 VersionedItem PythonVersionStore::sort_merge(
         const StreamId& stream_id,
         const py::object& user_meta,
@@ -770,6 +788,18 @@ void PythonVersionStore::write_parallel(
     write_parallel_frame(stream_id, frame, validate_index, sort_on_index, sort_columns);
 }
 
+std::shared_ptr<StagedStreamWriter> PythonVersionStore::stream_writer(
+    const StreamId& stream_id,
+    const py::tuple& item,
+    const py::object& norm,
+    size_t max_rows,
+    std::optional<timestamp> max_interval_ns) {
+    // With empty types, a column with no values in item has the empty type, and is rejected by the writer rather than
+    // being given a type it may not turn out to have
+    auto frame = convert::py_ndf_to_frame(stream_id, item, norm, py::none(), true);
+    return std::make_shared<StagedStreamWriter>(store(), stream_id, frame, max_rows, max_interval_ns);
+}
+
 std::unordered_map<VersionId, bool> PythonVersionStore::get_all_tombstoned_versions(const StreamId &stream_id) {
     return ::arcticdb::get_all_tombstoned_versions(store(), version_map(), stream_id);
 }
@@ -799,6 +829,50 @@ std::vector<std::variant<ReadResult, DataError>> PythonVersionStore::batch_read(
     return res;
 }
 
+ReadResult PythonVersionStore::batch_read_and_join(
+    const std::vector<StreamId>& stream_ids,
+    const std::vector<VersionQuery>& version_queries,
+    std::vector<std::shared_ptr<ReadQuery>>& read_queries,
+    const ReadOptions& read_options,
+    std::vector<std::shared_ptr<Clause>>&& clauses) {
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+            read_options.output_format() != OutputFormat::ARROW,
+            "Joining symbols is not supported with the Arrow output format");
+    auto handler_data = TypeHandlerRegistry::instance()->get_handler_data(read_options.output_format());
+    auto read_version = batch_read_and_join_internal(stream_ids, version_queries, read_queries, read_options, std::move(clauses), handler_data);
+    return create_python_read_result(read_version.versioned_item_,
+                                     read_options.output_format(),
+                                     std::move(read_version.frame_and_descriptor_));
+}
+
+std::vector<std::variant<ArrowReadResult, DataError>> PythonVersionStore::batch_read_arrow(
+    const std::vector<StreamId>& stream_ids,
+    const std::vector<VersionQuery>& version_queries,
+    std::vector<std::shared_ptr<ReadQuery>>& read_queries,
+    const ReadOptions& read_options) {
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+        read_options.output_format() == OutputFormat::ARROW,
+        "batch_read_arrow requires the Arrow output format");
+    auto handler_data = TypeHandlerRegistry::instance()->get_handler_data(OutputFormat::ARROW);
+
+    auto read_versions_or_errors = batch_read_internal(stream_ids, version_queries, read_queries, read_options, handler_data);
+    std::vector<std::variant<ArrowReadResult, DataError>> res;
+    for (auto&& [idx, read_version_or_error]: folly::enumerate(read_versions_or_errors)) {
+        util::variant_match(
+                read_version_or_error,
+                [&res, &handler_data] (ReadVersionOutput& read_version) {
+                    res.emplace_back(create_arrow_read_result(read_version.versioned_item_,
+                                                              std::move(read_version.frame_and_descriptor_),
+                                                              handler_data));
+                },
+                [&res] (DataError& data_error) {
+                    res.emplace_back(std::move(data_error));
+                }
+                );
+    }
+    return res;
+}
+
 std::vector<std::variant<VersionedItem, DataError>> PythonVersionStore::batch_update(
     const std::vector<StreamId>& stream_ids,
     const std::vector<py::tuple>& items,
@@ -866,6 +940,53 @@ ReadResult PythonVersionStore::read_dataframe_version(
     return create_python_read_result(opt_version_and_frame.versioned_item_, read_options.output_format(), std::move(opt_version_and_frame.frame_and_descriptor_));
 }
 
+ArrowReadResult PythonVersionStore::read_dataframe_version_arrow(
+    const StreamId &stream_id,
+    const VersionQuery& version_query,
+    const std::shared_ptr<ReadQuery>& read_query,
+    const ReadOptions& read_options) {
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+        read_options.output_format() == OutputFormat::ARROW,
+        "read_dataframe_version_arrow requires the Arrow output format");
+    auto handler_data = TypeHandlerRegistry::instance()->get_handler_data(OutputFormat::ARROW);
+    auto opt_version_and_frame = read_dataframe_version_internal(stream_id, version_query, read_query, read_options, handler_data);
+    return create_arrow_read_result(opt_version_and_frame.versioned_item_, std::move(opt_version_and_frame.frame_and_descriptor_), handler_data);
+}
+
+std::shared_ptr<ChunkedReader> PythonVersionStore::read_dataframe_chunked(
+    const StreamId& stream_id,
+    const VersionQuery& version_query,
+    const std::shared_ptr<ReadQuery>& read_query,
+    const ReadOptions& read_options,
+    const std::optional<TimestampRange>& date_range,
+    uint64_t chunk_rows,
+    uint64_t prefetch) {
+    auto version = get_version_to_read(stream_id, version_query);
+    missing_data::check<ErrorCode::E_NO_SUCH_VERSION>(
+        version.has_value(),
+        "read_dataframe_chunked: version matching query '{}' not found for symbol '{}'",
+        version_query,
+        stream_id);
+    // Python handler data holds Python objects, and is freed on whichever thread consumes or abandons the chunk
+    auto handler_data_factory = [output_format = read_options.output_format()]() {
+        py::gil_scoped_acquire acquire_gil;
+        return std::shared_ptr<std::any>(
+            new std::any(TypeHandlerRegistry::instance()->get_handler_data(output_format)),
+            [](std::any* handler_data) {
+                py::gil_scoped_acquire acquire_gil;
+                delete handler_data;
+            });
+    };
+    // Waiting on in-flight reads with the GIL held would deadlock if they need it to decode strings
+    return {
+        new ChunkedReader(store(), std::move(*version), read_query, read_options, std::move(handler_data_factory), date_range, chunk_rows, prefetch),
+        [](ChunkedReader* reader) {
+            py::gil_scoped_release release_gil;
+            delete reader;
+        }
+    };
+}
+
 namespace {
 
 std::vector<SnapshotVariantKey> ARCTICDB_UNUSED iterate_snapshot_tombstones (
@@ -23,6 +23,8 @@
 #include <arcticdb/pipeline/read_options.hpp>
 #include <arcticdb/stream/incompletes.hpp>
 #include <arcticdb/version/version_core.hpp>
+#include <arcticdb/version/chunked_read.hpp>
+#include <arcticdb/version/staged_stream_writer.hpp>
 #include <arcticdb/version/local_versioned_engine.hpp>
 #include <arcticdb/entity/read_result.hpp>
 
@@ -122,6 +124,12 @@ class PythonVersionStore : public LocalVersionedEngine {
             bool validate_index = false,
             bool delete_staged_data_on_failure=false);
 
+    std::optional<VersionedItem> compact_incomplete_unless_locked(
+            const StreamId& stream_id,
+            bool append,
+            bool prune_previous_versions,
+            bool validate_index);
+
     void write_parallel(
         const StreamId& stream_id,
         const py::tuple& item,
@@ -130,6 +138,14 @@ class PythonVersionStore : public LocalVersionedEngine {
         bool sort_on_index,
         std::optional<std::vector<std::string>> sort_columns) const;
 
+    // Writer staging rows with the columns of the normalized frame in item, which is not itself written
+    std::shared_ptr<StagedStreamWriter> stream_writer(
+        const StreamId& stream_id,
+        const py::tuple& item,
+        const py::object& norm,
+        size_t max_rows,
+        std::optional<timestamp> max_interval_ns);
+
     VersionedItem write_metadata(
         const StreamId& stream_id,
         const py::object & user_meta,
@@ -160,6 +176,22 @@ class PythonVersionStore : public LocalVersionedEngine {
         const ReadOptions& read_options,
         std::any& handler_data);
 
+    // Reads with OutputFormat::ARROW, and so does not need the GIL
+    ArrowReadResult read_dataframe_version_arrow(
+        const StreamId &stream_id,
+        const VersionQuery& version_query,
+        const std::shared_ptr<ReadQuery>& read_query,
+        const ReadOptions& read_options);
+
+    std::shared_ptr<ChunkedReader> read_dataframe_chunked(
+        const StreamId& stream_id,
+        const VersionQuery& version_query,
+        const std::shared_ptr<ReadQuery>& read_query,
+        const ReadOptions& read_options,
+        const std::optional<TimestampRange>& date_range,
+        uint64_t chunk_rows,
+        uint64_t prefetch);
+
     VersionedItem sort_merge(
             const StreamId& stream_id,
             const py::object& user_meta,
@@ -288,6 +320,19 @@ class PythonVersionStore : public LocalVersionedEngine {
         std::vector<std::shared_ptr<ReadQuery>>& read_queries,
         const ReadOptions& read_options);
 
+    ReadResult batch_read_and_join(
+        const std::vector<StreamId>& stream_ids,
+        const std::vector<VersionQuery>& version_queries,
+        std::vector<std::shared_ptr<ReadQuery>>& read_queries,
+        const ReadOptions& read_options,
+        std::vector<std::shared_ptr<Clause>>&& clauses);
+
+    std::vector<std::variant<ArrowReadResult, DataError>> batch_read_arrow(
+        const std::vector<StreamId>& stream_ids,
+        const std::vector<VersionQuery>& version_queries,
+        std::vector<std::shared_ptr<ReadQuery>>& read_queries,
+        const ReadOptions& read_options);
+
     std::vector<VersionedItemOrError> batch_update(
         const std::vector<StreamId>& stream_ids,
         const std::vector<py::tuple>& items,
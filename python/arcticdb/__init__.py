@@ -4,7 +4,7 @@ import sys as _sys
 
 from arcticdb.arctic import Arctic
 from arcticdb.options import LibraryOptions
-from arcticdb.version_store.processing import QueryBuilder
+from arcticdb.version_store.processing import QueryBuilder, where
 from arcticdb.version_store._store import VersionedItem
 import arcticdb.version_store.library as library
 from arcticdb.tools import set_config_from_env_vars
@@ -17,9 +17,12 @@ from arcticdb.version_store.library import (
     col,
     LazyDataFrame,
     LazyDataFrameCollection,
+    LazyDataFrameAfterJoin,
     StagedDataFinalizeMethod,
+    StagedDataCompactionPolicy,
     WriteMetadataPayload
 )
+from arcticdb.version_store.async_library import AsyncLibrary
 
 set_config_from_env_vars(_os.environ)
 
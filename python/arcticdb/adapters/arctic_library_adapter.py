@@ -7,14 +7,14 @@ As of the Change Date specified in that file, in accordance with the Business So
 """
 
 from abc import ABC, abstractmethod
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 
 from arcticc.pb2.storage_pb2 import EnvironmentConfigsMap, LibraryConfig, LibraryDescriptor
 from arcticdb.config import _DEFAULT_ENV
 from arcticdb.version_store._store import NativeVersionStore
 from arcticdb.options import DEFAULT_ENCODING_VERSION, LibraryOptions, EnterpriseLibraryOptions
 from arcticc.pb2.storage_pb2 import LibraryConfig
-from arcticdb_ext.storage import Library, StorageOverride, CONFIG_LIBRARY_NAME
+from arcticdb_ext.storage import Library, StorageOverride, LocalCacheOverride, CONFIG_LIBRARY_NAME
 from arcticdb.encoding_version import EncodingVersion
 
 
@@ -46,6 +46,23 @@ def set_library_options(lib_desc: "LibraryConfig", options: LibraryOptions,
     write_options.delayed_deletes = enterprise_library_options.background_deletion
 
 
+def set_local_cache_override(
+    storage_override: StorageOverride, local_cache: Optional[str], local_cache_size: Optional[int]
+) -> StorageOverride:
+    """
+    Places a cache on local disk at the path `local_cache` in front of the storage, holding at most `local_cache_size`
+    bytes, 10GiB by default. Data, index, and version keys read from the storage are cached, while ref keys are always
+    read from the storage. Does nothing if `local_cache` is not set.
+    """
+    if local_cache:
+        local_cache_override = LocalCacheOverride()
+        local_cache_override.path = local_cache
+        if local_cache_size is not None:
+            local_cache_override.max_bytes = int(local_cache_size)
+        storage_override.set_local_cache_override(local_cache_override)
+    return storage_override
+
+
 class ArcticLibraryAdapter(ABC):
     @abstractmethod
     def __init__(self, uri: str, encoding_version: EncodingVersion):
@@ -15,7 +15,11 @@ from arcticc.pb2.storage_pb2 import EnvironmentConfigsMap, LibraryConfig
 from arcticdb.version_store.helper import add_azure_library_to_env
 from arcticdb.config import _DEFAULT_ENV
 from arcticdb.version_store._store import NativeVersionStore
-from arcticdb.adapters.arctic_library_adapter import ArcticLibraryAdapter, set_library_options
+from arcticdb.adapters.arctic_library_adapter import (
+    ArcticLibraryAdapter,
+    set_library_options,
+    set_local_cache_override,
+)
 from arcticdb_ext.storage import StorageOverride, AzureOverride, CONFIG_LIBRARY_NAME
 from arcticdb.encoding_version import EncodingVersion
 from collections import namedtuple
@@ -32,6 +36,9 @@ class ParsedQuery:
     CA_cert_path: Optional[str] = "" # CURLOPT_CAINFO in curl
     CA_cert_dir: Optional[str] = "" # CURLOPT_CAPATH in curl
     Container: Optional[str] = None
+    # Directory on local disk in which to cache data read from the container, see LocalCacheOverride
+    Local_cache: Optional[str] = None
+    Local_cache_size: Optional[int] = None
 
 
 class AzureLibraryAdapter(ArcticLibraryAdapter):
@@ -129,7 +136,9 @@ class AzureLibraryAdapter(ArcticLibraryAdapter):
         storage_override = StorageOverride()
         storage_override.set_azure_override(azure_override)
 
-        return storage_override
+        return set_local_cache_override(
+            storage_override, self._query_params.Local_cache, self._query_params.Local_cache_size
+        )
 
     def get_masking_override(self) -> StorageOverride:
         storage_override = StorageOverride()
@@ -10,11 +10,16 @@ from arcticc.pb2.storage_pb2 import EnvironmentConfigsMap, LibraryConfig
 from arcticdb.version_store.helper import add_mongo_library_to_env
 from arcticdb.config import _DEFAULT_ENV
 from arcticdb.version_store._store import NativeVersionStore
-from arcticdb.adapters.arctic_library_adapter import ArcticLibraryAdapter, set_library_options
-from arcticdb_ext.storage import CONFIG_LIBRARY_NAME
+from arcticdb.adapters.arctic_library_adapter import (
+    ArcticLibraryAdapter,
+    set_library_options,
+    set_local_cache_override,
+)
+from arcticdb_ext.storage import CONFIG_LIBRARY_NAME, StorageOverride
 from arcticdb.encoding_version import EncodingVersion
 from arcticdb.exceptions import UserInputException
 import re
+from typing import Dict, Tuple
 
 try:
     from pymongo.uri_parser import parse_uri
@@ -24,12 +29,33 @@ except ImportError:
     _HAVE_PYMONGO = False
 
 
+# Options that configure ArcticDB rather than the Mongo client, so are removed from the URI before it is used
+_LOCAL_CACHE_OPTIONS = ("local_cache", "local_cache_size")
+
+
+def _extract_local_cache_options(uri: str) -> Tuple[str, Dict[str, str]]:
+    if "?" not in uri:
+        return uri, {}
+
+    base, query = uri.split("?", 1)
+    options = {}
+    remaining = []
+    for option in query.split("&"):
+        name, _, value = option.partition("=")
+        if name in _LOCAL_CACHE_OPTIONS:
+            options[name] = value
+        elif option:
+            remaining.append(option)
+    return (f"{base}?{'&'.join(remaining)}" if remaining else base), options
+
+
 class MongoLibraryAdapter(ArcticLibraryAdapter):
     @staticmethod
     def supports_uri(uri: str) -> bool:
         return uri.startswith("mongodb://") or uri.startswith("mongodb+srv://")
 
     def __init__(self, uri: str, encoding_version: EncodingVersion, *args, **kwargs):
+        uri, self._local_cache_options = _extract_local_cache_options(uri)
         try:
             if _HAVE_PYMONGO:
                 parameters = parse_uri(
@@ -63,5 +89,12 @@ class MongoLibraryAdapter(ArcticLibraryAdapter):
 
         return lib._library
 
+    def get_storage_override(self) -> StorageOverride:
+        return set_local_cache_override(
+            StorageOverride(),
+            self._local_cache_options.get("local_cache"),
+            self._local_cache_options.get("local_cache_size"),
+        )
+
     def add_library_to_env(self, env_cfg: EnvironmentConfigsMap, name: str):
         add_mongo_library_to_env(cfg=env_cfg, lib_name=name, env_name=_DEFAULT_ENV, uri=self._uri)
@@ -16,7 +16,7 @@ from arcticc.pb2.storage_pb2 import EnvironmentConfigsMap, LibraryDescriptor
 from arcticdb.version_store.helper import add_s3_library_to_env
 from arcticdb.config import _DEFAULT_ENV
 from arcticdb.version_store._store import NativeVersionStore
-from arcticdb.adapters.arctic_library_adapter import ArcticLibraryAdapter
+from arcticdb.adapters.arctic_library_adapter import ArcticLibraryAdapter, set_local_cache_override
 from arcticdb_ext.storage import (
     StorageOverride,
     S3Override,
@@ -62,6 +62,10 @@ class ParsedQuery:
 
     ssl: Optional[bool] = False
 
+    # Directory on local disk in which to cache data read from the bucket, see LocalCacheOverride
+    local_cache: Optional[str] = None
+    local_cache_size: Optional[int] = None
+
 
 class S3LibraryAdapter(ArcticLibraryAdapter):
     REGEX = r"s3(s)?://(?P<endpoint>.*):(?P<bucket>[-_a-zA-Z0-9.]+)(?P<query>\?.*)?"
@@ -183,6 +187,8 @@ class S3LibraryAdapter(ArcticLibraryAdapter):
 
             if field_dict[key].type == Optional[bool] and field_dict[key] is not None:
                 parsed_query[key] = bool(strtobool(parsed_query[key][0]))
+            if field_dict[key].type == Optional[int]:
+                parsed_query[key] = int(parsed_query[key])
             if field_dict[key].type == Optional[AWSAuthMethod]:
                 value = parsed_query[key]
                 if strtobool(value) or value.lower() == "default":
@@ -231,7 +237,9 @@ class S3LibraryAdapter(ArcticLibraryAdapter):
     def get_storage_override(self) -> StorageOverride:
         storage_override = StorageOverride()
         storage_override.set_s3_override(self._get_s3_override())
-        return storage_override
+        return set_local_cache_override(
+            storage_override, self._query_params.local_cache, self._query_params.local_cache_size
+        )
 
     def get_masking_override(self) -> StorageOverride:
         storage_override = StorageOverride()
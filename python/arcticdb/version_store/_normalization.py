@@ -82,6 +82,19 @@ NPDDataFrame = NamedTuple(
 
 NormalizedInput = NamedTuple("NormalizedInput", [("item", NPDDataFrame), ("metadata", NormalizationMetadata)])
 
+# A string column taken from Arrow, passed to c++ in place of an array of Python strings. Each row is a code into the
+# dictionary of values described by the Arrow large_string/large_binary offsets and data buffers, or -1 for null.
+ArrowStrings = NamedTuple(
+    "ArrowStrings",
+    [
+        # DO NOT REORDER, positional access used in c++
+        ("codes", np.ndarray),
+        ("offsets", np.ndarray),
+        ("data", np.ndarray),
+        ("is_utf8", bool),
+    ],
+)
+
 
 _PICKLED_METADATA_LOGLEVEL = None # set lazily with function below
 
@@ -854,11 +867,45 @@ class DataFrameNormalizer(_PandasNormalizer):
 
         if idx_type == "index":
             df.index.name = corrected_index_name(index, norm_meta)
+            df.index = self._denormalize_categorical_index(df.index, norm_meta)
         elif idx_type == "multi_index":
             df = self._denormalize_multi_index(df=df, norm_meta=norm_meta)
 
         return df
 
+    @staticmethod
+    def _categories(norm_meta, name):
+        if name in norm_meta.common.categories:
+            return list(norm_meta.common.categories[name].category)
+        if name in norm_meta.common.int_categories:
+            return list(norm_meta.common.int_categories[name].category)
+        return None
+
+    @staticmethod
+    def _denormalize_categorical_index(index, norm_meta):
+        # Grouping on a categorical column groups on its stored codes, so the resulting index holds the codes and needs
+        # mapping back onto the categories of the column it came from
+        name = index.name
+        if not norm_meta.common.index.is_categorical or not is_integer_dtype(index.dtype):
+            return index
+        categories = DataFrameNormalizer._categories(norm_meta, name)
+        if categories is None:
+            return index
+        return pd.CategoricalIndex(pd.Categorical.from_codes(codes=index.values, categories=categories), name=name)
+
+    @staticmethod
+    def _denormalize_categorical_levels(index, norm_meta):
+        # As _denormalize_categorical_index, for each level of the MultiIndex resulting from grouping on several columns
+        categorical_levels = norm_meta.common.multi_index.categorical_field_pos
+        if len(categorical_levels) == 0:
+            return index
+        levels = [index.get_level_values(level) for level in range(index.nlevels)]
+        for level in categorical_levels:
+            categories = DataFrameNormalizer._categories(norm_meta, index.names[level])
+            if categories is not None and is_integer_dtype(levels[level].dtype):
+                levels[level] = pd.Categorical.from_codes(codes=levels[level], categories=categories)
+        return pd.MultiIndex.from_arrays(levels, names=index.names)
+
     @staticmethod
     def _denormalize_multi_index(df: pd.DataFrame, norm_meta: NormalizationMetadata.PandasDataFrame) -> pd.DataFrame:
         midx = norm_meta.common.multi_index
@@ -920,6 +967,8 @@ class DataFrameNormalizer(_PandasNormalizer):
 
             df.index.names = index_names
 
+        df.index = DataFrameNormalizer._denormalize_categorical_levels(df.index, norm_meta)
+
         if norm_meta.has_synthetic_columns:
             df.columns = RangeIndex(0, len(df.columns))
 
@@ -990,6 +1039,169 @@ class DataFrameNormalizer(_PandasNormalizer):
         )
 
 
+def _is_arrow_table(item):
+    return type(item).__name__ == "Table" and type(item).__module__.startswith("pyarrow")
+
+
+def _is_polars_dataframe(item):
+    return type(item).__name__ == "DataFrame" and type(item).__module__.startswith("polars")
+
+
+def _arrow_pandas_index_columns(table):
+    # Entries are column names, or dicts describing a RangeIndex
+    pandas_metadata = table.schema.pandas_metadata or {}
+    return pandas_metadata.get("index_columns", [])
+
+
+def _arrow_strings(column):
+    import pyarrow as pa
+
+    if pa.types.is_dictionary(column.type):
+        # Chunks may each have their own dictionary
+        array = pa.Table.from_arrays([column], ["column"]).unify_dictionaries().column(0).combine_chunks()
+        codes = array.indices.cast(pa.int64()).fill_null(-1).to_numpy()
+        dictionary = array.dictionary
+    else:
+        array = column.combine_chunks()
+        dictionary = array
+        codes = np.arange(len(array), dtype=np.int64)
+        if array.null_count > 0:
+            codes[~array.is_valid().to_numpy(zero_copy_only=False)] = -1
+
+    is_utf8 = pa.types.is_string(dictionary.type) or pa.types.is_large_string(dictionary.type)
+    dictionary = dictionary.cast(pa.large_string() if is_utf8 else pa.large_binary())
+    if dictionary.null_count > 0:
+        null_values = np.flatnonzero(~dictionary.is_valid().to_numpy(zero_copy_only=False))
+        codes = np.where(np.isin(codes, null_values), -1, codes)
+
+    _, offsets, data = dictionary.buffers()
+    offsets = np.frombuffer(offsets, dtype=np.int64)[dictionary.offset : dictionary.offset + len(dictionary) + 1]
+    data = np.empty(0, dtype=np.uint8) if data is None else np.frombuffer(data, dtype=np.uint8)
+    return ArrowStrings(codes=codes, offsets=offsets, data=data, is_utf8=is_utf8)
+
+
+def _arrow_to_primitive(column, name):
+    import pyarrow as pa
+
+    column_type = column.type
+    if pa.types.is_dictionary(column_type):
+        value_type = column_type.value_type
+        if pa.types.is_string(value_type) or pa.types.is_large_string(value_type) or pa.types.is_binary(value_type):
+            return _arrow_strings(column)
+        column = column.cast(value_type)
+        column_type = value_type
+
+    if (
+        pa.types.is_string(column_type)
+        or pa.types.is_large_string(column_type)
+        or pa.types.is_binary(column_type)
+        or pa.types.is_large_binary(column_type)
+    ):
+        return _arrow_strings(column)
+
+    if pa.types.is_null(column_type):
+        return np.full(len(column), None, dtype=object)
+
+    if pa.types.is_boolean(column_type) and column.null_count > 0:
+        raise ArcticDbNotYetImplemented(f"Nullable booleans are not supported at the moment, column '{name}'")
+
+    if pa.types.is_timestamp(column_type) or pa.types.is_date(column_type):
+        # Time zones are dropped, leaving the UTC values
+        column = column.cast(pa.timestamp("ns", tz=getattr(column_type, "tz", None)))
+    elif not (
+        pa.types.is_integer(column_type) or pa.types.is_floating(column_type) or pa.types.is_boolean(column_type)
+    ):
+        raise ArcticDbNotYetImplemented(f"Arrow type {column_type} of column '{name}' is not supported")
+
+    # Zero-copy for single chunks without nulls. Integer columns with nulls become floats with NaN, as in pandas
+    array = column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+    return array.to_numpy(zero_copy_only=False)
+
+
+class ArrowTableNormalizer(Normalizer):
+    """
+    Normalizes pyarrow Tables (and Polars DataFrames, via their Arrow representation) without going through pandas.
+    Numeric buffers are passed through without copying wherever Arrow allows it, and string columns are passed as
+    their Arrow buffers rather than as Python strings. The data is stored exactly as the equivalent pandas DataFrame
+    would be, so reads return pandas DataFrames unless an Arrow output format is requested.
+
+    The index is taken from the pandas metadata of the table schema if there is one, so that tables converted from
+    pandas keep their index. Otherwise a row count index is used.
+    """
+
+    def __init__(self):
+        self._df_norm = DataFrameNormalizer()
+
+    def normalize(self, item, dynamic_schema=False, **kwargs):
+        if _is_polars_dataframe(item):
+            item = item.to_arrow()
+
+        norm_meta = NormalizationMetadata()
+        norm_meta.df.common.mark = True
+        norm_meta.df.common.columns.fake_name = True
+        index_norm = norm_meta.df.common.index
+        index_norm.is_physically_stored = False
+        index_norm.step = 1
+        index_column = None
+        index_columns = _arrow_pandas_index_columns(item)
+        if len(index_columns) > 1:
+            raise ArcticDbNotYetImplemented("Tables with a multi-level pandas index are not supported")
+        elif len(index_columns) == 1 and isinstance(index_columns[0], dict):
+            # A RangeIndex, which pandas stores as metadata rather than as a column
+            index_norm.start = index_columns[0]["start"]
+            index_norm.step = index_columns[0]["step"]
+            if index_columns[0].get("name") is not None:
+                index_norm.name = str(index_columns[0]["name"])
+        elif len(index_columns) == 1:
+            index_column = index_columns[0]
+
+        index_names, index_values = [], []
+        sort_status = _SortedValue.ASCENDING
+        if index_column is not None and item.num_rows > 0:
+            index = _arrow_to_primitive(item.column(index_column), index_column)
+            if index.dtype.kind != "M":
+                raise ArcticDbNotYetImplemented(
+                    f"Only datetime indexes are supported for Arrow tables, index '{index_column}' is {index.dtype}"
+                )
+            index_norm.is_physically_stored = True
+            index_type = item.schema.field(index_column).type
+            if getattr(index_type, "tz", None) is not None:
+                index_norm.tz = index_type.tz
+            # Unnamed pandas indexes are stored by pyarrow as __index_level_0__, and by us as index
+            index_name = "index" if index_column.startswith("__index_level_") else index_column
+            index_norm.fake_name = index_name != index_column
+            index_norm.name = index_name
+            index_names = [index_name]
+            index_values = [index]
+            if len(index) > 1:
+                if np.all(index[1:] >= index[:-1]):
+                    sort_status = _SortedValue.ASCENDING
+                elif np.all(index[1:] <= index[:-1]):
+                    sort_status = _SortedValue.DESCENDING
+                else:
+                    sort_status = _SortedValue.UNSORTED
+
+        positions = [pos for pos, name in enumerate(item.column_names) if name != index_column]
+        column_names = [item.column_names[pos] for pos in positions]
+        columns_values = [_arrow_to_primitive(item.column(pos), item.column_names[pos]) for pos in positions]
+        columns = _normalize_columns_names(column_names, index_names, norm_meta.df, dynamic_schema)
+        return NormalizedInput(
+            item=NPDDataFrame(
+                index_names=index_names,
+                index_values=index_values,
+                column_names=columns,
+                columns_values=columns_values,
+                sorted=sort_status,
+            ),
+            metadata=norm_meta,
+        )
+
+    def denormalize(self, item, norm_meta):
+        import pyarrow as pa
+
+        return pa.Table.from_pandas(self._df_norm.denormalize(item, norm_meta))
+
+
 class MsgPackNormalizer(Normalizer):
     """
     Fall back plan for the time being to store arbitrary data
@@ -1163,6 +1375,7 @@ class CompositeNormalizer(Normalizer):
         self.series = SeriesNormalizer()
         self.tf = TimeFrameNormalizer()
         self.np = NdArrayNormalizer()
+        self.arrow = ArrowTableNormalizer()
 
         if use_norm_failure_handler_known_types and fallback_normalizer is not None:
             self.df = KnownTypeFallbackOnError(self.df, fallback_normalizer)
@@ -1218,6 +1431,9 @@ class CompositeNormalizer(Normalizer):
         if isinstance(item, np.ndarray):
             return self.np.normalize
 
+        if _is_arrow_table(item) or _is_polars_dataframe(item):
+            return self.arrow.normalize
+
         if self.fallback_normalizer is not None:
             # Msgpack normalize if everything else fails.
             return self.fallback_normalizer.normalize
@@ -1378,7 +1594,21 @@ def restrict_data_to_date_range_only(data: T, *, start: Timestamp, end: Timestam
     def _strip_tz(s, e):
         return s.tz_localize(None), e.tz_localize(None)
 
-    if hasattr(data, "loc"):
+    if _is_arrow_table(data) or _is_polars_dataframe(data):
+        if _is_polars_dataframe(data):
+            data = data.to_arrow()
+        index_columns = _arrow_pandas_index_columns(data)
+        if len(index_columns) != 1 or not isinstance(index_columns[0], str):
+            raise NormalizationException("Only tables with a datetime index can be restricted to a date range")
+        if getattr(data.schema.field(index_columns[0]).type, "tz", None) is None:
+            start, end = _strip_tz(start, end)
+        index = _arrow_to_primitive(data.column(index_columns[0]), index_columns[0])
+        if len(index) > 1 and not np.all(index[1:] >= index[:-1]):
+            raise SortingException("E_UNSORTED_DATA When calling update, the input data must be sorted.")
+        start_idx = index.searchsorted(np.datetime64(start.value, "ns"), side="left")
+        end_idx = index.searchsorted(np.datetime64(end.value, "ns"), side="right")
+        data = data.slice(start_idx, max(end_idx - start_idx, 0))
+    elif hasattr(data, "loc"):
         if not data.index.get_level_values(0).tz:
             start, end = _strip_tz(start, end)
         if not data.index.is_monotonic_increasing:
@@ -16,13 +16,16 @@ import pytz
 import re
 import itertools
 import attr
+import hashlib
+import pickle
 import warnings
 import difflib
 from datetime import datetime
 from numpy import datetime64
 from pandas import Timestamp, to_datetime, Timedelta
-from typing import Any, Optional, Union, List, Sequence, Tuple, Dict, Set
+from typing import Any, Optional, Union, List, Sequence, Tuple, Dict, Set, Iterator
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 
 from arcticc.pb2.descriptors_pb2 import IndexDescriptor, TypeDescriptor
 from arcticdb_ext.version_store import SortedValue
@@ -30,7 +33,12 @@ from arcticc.pb2.storage_pb2 import LibraryConfig, EnvironmentConfigsMap
 from arcticdb.preconditions import check
 from arcticdb.supported_types import DateRangeInput, ExplicitlySupportedDates
 from arcticdb.toolbox.library_tool import LibraryTool
-from arcticdb.version_store.processing import QueryBuilder
+from arcticdb.version_store.processing import (
+    QueryBuilder,
+    PythonDateRangeClause,
+    PythonFilterClause,
+    PythonProjectionClause,
+)
 from arcticdb.encoding_version import EncodingVersion
 from arcticdb_ext.storage import (
     create_mem_config_resolver as _create_mem_config_resolver,
@@ -53,8 +61,11 @@ from arcticdb_ext.version_store import StreamDescriptorMismatch
 from arcticdb_ext.version_store import DataError
 from arcticdb_ext.version_store import sorted_value_name
 from arcticdb_ext.version_store import OutputFormat
+from arcticdb_ext.version_store import ReadResultCache as _ReadResultCache
+from arcticdb_ext.version_store import ResultCacheStats
+from arcticdb_ext import get_config_int
 from arcticdb.authorization.permissions import OpenMode
-from arcticdb.exceptions import ArcticDbNotYetImplemented, ArcticNativeException
+from arcticdb.exceptions import ArcticDbNotYetImplemented, ArcticNativeException, UserInputException
 from arcticdb.flattener import Flattener
 from arcticdb.log import version as log
 from arcticdb.version_store._custom_normalizers import get_custom_normalizer, CompositeCustomNormalizer
@@ -110,6 +121,11 @@ class VersionedItem:
     timestamp: Optional[int]
         The time in nanoseconds since epoch that this version was written. In the special case where no versions have
         been written yet, but data is being read exclusively from incomplete segments, this will be 0.
+    segments_skipped: int
+        For data retrieval operations with a `QueryBuilder` filter, the number of data segments that were not read out
+        of storage because column stats (see `create_column_stats`) showed they could not contain any matching rows.
+        Zero if the version has no column stats. Errors reading the column stats are raised rather than reported as no
+        segments skipped.
     """
 
     symbol: str = attr.ib()
@@ -119,10 +135,12 @@ class VersionedItem:
     metadata: Any = attr.ib(default=None)
     host: Optional[str] = attr.ib(default=None)
     timestamp: Optional[int] = attr.ib(default=0)
+    segments_skipped: int = attr.ib(default=0, repr=False)
 
     def __iter__(self):  # Backwards compatible with the old NamedTuple implementation
         warnings.warn("Don't iterate VersionedItem. Use attrs.astuple() explicitly", SyntaxWarning, stacklevel=2)
-        return iter(attr.astuple(self))
+        # segments_skipped postdates the NamedTuple implementation, so is excluded to keep unpacking working
+        return iter(attr.astuple(self, filter=lambda attribute, _: attribute.name != "segments_skipped"))
 
 
 def _env_config_from_lib_config(lib_cfg, env):
@@ -142,6 +160,24 @@ def _normalize_dt_range(dtr: DateRangeInput) -> _IndexRange:
     return _IndexRange(start.value, end.value)
 
 
+def _result_cache_query_digest(date_range, row_range, columns, query_builder, kwargs) -> Optional[str]:
+    # Staged data is not part of any version, so reads including it cannot be cached
+    if kwargs.get("incomplete", False):
+        return None
+    query = pickle.dumps(query_builder) if query_builder is not None else b""
+    arguments = repr((date_range, row_range, columns, sorted(kwargs.items()))).encode()
+    return hashlib.sha256(query + b"|" + arguments).hexdigest()
+
+
+def _result_cache_entry_bytes(data: Union[pd.DataFrame, pd.Series]) -> int:
+    memory_usage = data.memory_usage(index=True, deep=True)
+    return int(memory_usage.sum() if isinstance(data, pd.DataFrame) else memory_usage)
+
+
+def _copy_versioned_item(vit: "VersionedItem") -> "VersionedItem":
+    return attr.evolve(vit, data=vit.data.copy(deep=True), metadata=copy.deepcopy(vit.metadata))
+
+
 def _handle_categorical_columns(symbol, data, throw=True, operation_supports_categoricals=False):
     if isinstance(data, (pd.DataFrame, pd.Series)):
         categorical_columns = []
@@ -215,6 +251,74 @@ def _assume_false(name, kwargs):
         return True
 
 
+def _resolve_output_format(output_format):
+    if isinstance(output_format, OutputFormat):
+        return output_format
+    if isinstance(output_format, str) and output_format.upper() in OutputFormat.__members__:
+        return OutputFormat.__members__[output_format.upper()]
+    raise UserInputException(
+        f"Unsupported output_format {output_format}, expected one of {list(OutputFormat.__members__)}"
+    )
+
+
+def _arrow_table(frame):
+    import pyarrow as pa
+
+    # Importing the record batches moves their buffers into pyarrow, so the frame is left holding nothing
+    batches = [pa.RecordBatch._import_from_c(array, schema) for array, schema in frame.record_batches()]
+    return pa.Table.from_batches(batches)
+
+
+def _arrow_categorical_columns(table, norm_meta):
+    # Categorical columns are stored as their integer codes, with their categories in the normalization metadata, so
+    # they are returned as dictionary arrays over the codes. A code of -1 marks a missing value
+    input_type = norm_meta.WhichOneof("input_type")
+    if input_type not in ("df", "series"):
+        return table
+    common = getattr(norm_meta, input_type).common
+    if len(common.categories) == 0 and len(common.int_categories) == 0:
+        return table
+
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if common.WhichOneof("index_type") == "multi_index":
+        num_index_columns = common.multi_index.field_count + 1
+        categorical_index_columns = set(common.multi_index.categorical_field_pos)
+    else:
+        num_index_columns = 1 if common.index.is_physically_stored else 0
+        categorical_index_columns = {0} if common.index.is_categorical else set()
+
+    for pos, column_name in enumerate(table.column_names):
+        name = column_name
+        if pos < num_index_columns:
+            # An index column only holds codes if it was made from a categorical column, e.g. by grouping on it
+            if pos not in categorical_index_columns:
+                continue
+            if pos > 0:
+                name = name[_IDX_PREFIX_LEN:]
+        if name in common.categories:
+            dictionary = pa.array(list(common.categories[name].category), type=pa.large_utf8())
+        elif name in common.int_categories:
+            dictionary = pa.array(list(common.int_categories[name].category))
+        else:
+            continue
+        codes = table.column(pos)
+        if not pa.types.is_integer(codes.type):
+            continue
+        dictionary_type = pa.dictionary(codes.type, dictionary.type)
+        chunks = []
+        for chunk in codes.chunks:
+            missing = pc.less(chunk, 0)
+            if pc.any(missing).as_py():
+                chunk = pc.if_else(missing, pa.scalar(None, type=codes.type), chunk)
+            chunks.append(pa.DictionaryArray.from_arrays(chunk, dictionary))
+        table = table.set_column(
+            pos, pa.field(column_name, dictionary_type), pa.chunked_array(chunks, type=dictionary_type)
+        )
+    return table
+
+
 class NativeVersionStore:
     """
     NativeVersionStore objects provide access to ArcticDB libraries, enabling fundamental library operations
@@ -262,6 +366,7 @@ class NativeVersionStore:
         self._init_norm_failure_handler()
         self._open_mode = open_mode
         self._native_cfg = native_cfg
+        self._result_cache = None
 
     @classmethod
     def create_store_from_lib_config(cls, lib_cfg, env, open_mode=OpenMode.DELETE):
@@ -920,9 +1025,12 @@ class NativeVersionStore:
         self, symbol: str, column_stats: Dict[str, Set[str]], as_of: Optional[VersionQueryInput] = None
     ) -> None:
         """
-        Calculates the specified column statistics for each row-slice for the given symbol. In the future, these
-        statistics will be used by `QueryBuilder` filtering operations to reduce the number of data segments read out
-        of storage.
+        Calculates the specified column statistics for each row-slice for the given symbol. These statistics are used
+        by `QueryBuilder` filters at the start of a query to skip row-slices that cannot contain matching rows, reducing
+        the number of data segments read out of storage. "MINMAX" statistics are used by comparisons (==, !=, <, <=, >,
+        >=) and "BLOOM_FILTER" and "DISTINCT" statistics by equality and isin filters, combined with &, | and ~. The
+        number of segments skipped is reported by the `segments_skipped` attribute of the returned `VersionedItem`.
+        This can be disabled by setting the config option "ColumnStats.UseForFiltering" to 0.
 
         Parameters
         ----------
@@ -933,6 +1041,10 @@ class NativeVersionStore:
             Keys are column names.
             Values are sets of statistic types to build for that column. Options are:
                 "MINMAX" : store the minimum and maximum value for the column in each row-slice
+                "BLOOM_FILTER" : store a bloom filter of the values in the column in each row-slice. The size in bits
+                    is controlled by the config option "ColumnStats.BloomFilterBits" (default 4096)
+                "DISTINCT" : store the hashes of the distinct values in the column in each row-slice, if there are at
+                    most "ColumnStats.MaxDistinctValues" (default 64) of them
         as_of : `Optional[VersionQueryInput]`, default=None
             See documentation of `read` method for more details.
 
@@ -1104,6 +1216,16 @@ class NativeVersionStore:
         read_queries = self._get_read_queries(len(symbols), date_ranges, row_ranges, columns, query_builder)
         read_options = self._get_read_options(**kwargs)
         read_options.set_batch_throw_on_error(throw_on_error)
+        if read_options.output_format == OutputFormat.ARROW:
+            read_results = self.version_store.batch_read_arrow(symbols, version_queries, read_queries, read_options)
+            versioned_items = []
+            for read_result, read_query in zip(read_results, read_queries):
+                if isinstance(read_result, DataError):
+                    versioned_items.append(read_result)
+                else:
+                    vit, frame, norm, udm = read_result
+                    versioned_items.append(self._post_process_arrow(vit, frame, norm, udm, read_query))
+            return versioned_items
         read_results = self.version_store.batch_read(symbols, version_queries, read_queries, read_options)
         versioned_items = []
         for i in range(len(read_results)):
@@ -1116,6 +1238,35 @@ class NativeVersionStore:
                 versioned_items.append(vitem)
         return versioned_items
 
+    def _batch_read_and_join(
+        self, symbols, as_ofs, date_ranges, row_ranges, columns, per_symbol_query_builders, join_clause, query_builder, **kwargs
+    ) -> VersionedItem:
+        implement_read_index = kwargs.get("implement_read_index", False)
+        if columns:
+            columns = [self._resolve_empty_columns(c, implement_read_index) for c in columns]
+        version_queries = self._get_version_queries(len(symbols), as_ofs, **kwargs)
+        # Every symbol is read through the processing pipeline, so date and row ranges must be applied as clauses
+        per_symbol_query_builders = [
+            QueryBuilder() if q is None else copy.deepcopy(q)
+            for q in (per_symbol_query_builders or [None] * len(symbols))
+        ]
+        read_queries = self._get_read_queries(len(symbols), date_ranges, row_ranges, columns, per_symbol_query_builders)
+        post_join_query = _PythonVersionStoreReadQuery()
+        if query_builder is not None:
+            post_join_query.add_clauses(query_builder.clauses)
+        read_options = self._get_read_options(**kwargs)
+        check(
+            read_options.output_format == OutputFormat.PANDAS,
+            "output_format {} is not supported when joining symbols",
+            read_options.output_format,
+        )
+        read_result = ReadResult(
+            *self.version_store.batch_read_and_join(
+                symbols, version_queries, read_queries, read_options, join_clause, post_join_query
+            )
+        )
+        return self._post_process_dataframe(read_result, post_join_query, implement_read_index)
+
     def batch_read_metadata(
         self, symbols: List[str], as_ofs: Optional[List[VersionQueryInput]] = None, **kwargs
     ) -> Dict[str, VersionedItem]:
@@ -1338,28 +1489,37 @@ class NativeVersionStore:
         else:
             metadata_vector = list(metadata_vector)
 
-        for idx in range(len(symbols)):
-            _handle_categorical_columns(
-                symbols[idx], data_vector[idx], operation_supports_categoricals=operation_supports_categoricals)
-
         udms = []
         items = []
         norm_metas = []
         for idx in range(len(symbols)):
-            udm, item, norm_meta = self._try_normalize(
+            udm, item, norm_meta = self._normalize_batch_item(
                 symbols[idx],
                 data_vector[idx],
                 metadata_vector[idx],
-                pickle_on_failure,
                 dynamic_strings,
-                None,
+                pickle_on_failure,
                 norm_failure_msg,
+                operation_supports_categoricals,
             )
             udms.append(udm)
             items.append(item)
             norm_metas.append(norm_meta)
         return udms, items, norm_metas, metadata_vector
 
+    def _normalize_batch_item(
+        self,
+        symbol: str,
+        data: Any,
+        metadata: Any,
+        dynamic_strings: bool,
+        pickle_on_failure: bool,
+        norm_failure_msg: str,
+        operation_supports_categoricals: bool,
+    ):
+        _handle_categorical_columns(symbol, data, operation_supports_categoricals=operation_supports_categoricals)
+        return self._try_normalize(symbol, data, metadata, pickle_on_failure, dynamic_strings, None, norm_failure_msg)
+
     def _batch_write_internal(
         self,
         symbols: List[str],
@@ -1381,6 +1541,21 @@ class NativeVersionStore:
         )
         norm_failure_options_msg = kwargs.get("norm_failure_options_msg", self.norm_failure_options_msg_write)
 
+        pipeline_bytes = get_config_int("VersionStore.BatchWritePipelineBytes") or 0
+        if pipeline_bytes > 0:
+            return self._pipelined_batch_write(
+                symbols,
+                data_vector,
+                metadata_vector,
+                prune_previous_version,
+                pickle_on_failure,
+                validate_index,
+                throw_on_error,
+                dynamic_strings,
+                norm_failure_options_msg,
+                pipeline_bytes,
+            )
+
         udms, items, norm_metas, metadata_vector = self._generate_batch_vectors_for_modifying_operations(
             symbols,
             data_vector,
@@ -1395,6 +1570,72 @@ class NativeVersionStore:
         )
         return self._convert_cxx_batch_results_to_python(cxx_versioned_items, metadata_vector)
 
+    def _pipelined_batch_write(
+        self,
+        symbols: List[str],
+        data_vector: List[Any],
+        metadata_vector: Optional[List[Any]],
+        prune_previous_version: bool,
+        pickle_on_failure: bool,
+        validate_index: bool,
+        throw_on_error: bool,
+        dynamic_strings: bool,
+        norm_failure_options_msg: str,
+        max_bytes: int,
+    ) -> List[VersionedItem]:
+        # The symbols are normalized and passed to the native layer in chunks of around half of max_bytes. Each chunk
+        # is written from a worker thread, and batch_write releases the GIL once it has converted the chunk into input
+        # frames, so the chunk is encoded and uploaded while the next one is normalized on this thread. At most two
+        # chunks of normalized data are held at once.
+        if metadata_vector is None:
+            metadata_vector = len(symbols) * [None]
+        else:
+            metadata_vector = list(metadata_vector)
+        chunk_bytes = max(max_bytes // 2, 1)
+        cxx_versioned_items = []
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="arcticdb_batch_write") as executor:
+            in_flight = None
+            chunk_start = 0
+            udms, items, norm_metas = [], [], []
+            normalized_bytes = 0
+            for idx in range(len(symbols)):
+                udm, item, norm_meta = self._normalize_batch_item(
+                    symbols[idx],
+                    data_vector[idx],
+                    metadata_vector[idx],
+                    dynamic_strings,
+                    pickle_on_failure,
+                    norm_failure_options_msg,
+                    operation_supports_categoricals=True,
+                )
+                udms.append(udm)
+                items.append(item)
+                norm_metas.append(norm_meta)
+                # Arrow string columns are tuples of buffers, and object columns are counted as a pointer per row
+                for values in itertools.chain(item.index_values, item.columns_values):
+                    buffers = values if isinstance(values, tuple) else (values,)
+                    normalized_bytes += sum(getattr(buffer, "nbytes", 0) for buffer in buffers)
+                if normalized_bytes < chunk_bytes and idx + 1 < len(symbols):
+                    continue
+                if in_flight is not None:
+                    cxx_versioned_items.extend(in_flight.result())
+                in_flight = executor.submit(
+                    self.version_store.batch_write,
+                    symbols[chunk_start : idx + 1],
+                    items,
+                    norm_metas,
+                    udms,
+                    prune_previous_version,
+                    validate_index,
+                    throw_on_error,
+                )
+                chunk_start = idx + 1
+                udms, items, norm_metas = [], [], []
+                normalized_bytes = 0
+            if in_flight is not None:
+                cxx_versioned_items.extend(in_flight.result())
+        return self._convert_cxx_batch_results_to_python(cxx_versioned_items, metadata_vector)
+
     def _batch_write_metadata_to_versioned_items(
         self, symbols: List[str], metadata_vector: List[Any], prune_previous_version, throw_on_error
     ):
@@ -1712,13 +1953,18 @@ class NativeVersionStore:
         proto_cfg = self._lib_cfg.lib_desc.version.write_options
         read_options = _PythonVersionStoreReadOptions()
         read_options.set_force_strings_to_object(_assume_false("force_string_to_object", kwargs))
-        read_options.set_optimise_string_memory(_assume_false("optimise_string_memory", kwargs))
+        read_options.set_optimise_string_memory(
+            self.resolve_defaults("optimise_string_memory", proto_cfg, global_default=False, **kwargs)
+        )
         read_options.set_dynamic_schema(
             self.resolve_defaults("dynamic_schema", proto_cfg, global_default=False, **kwargs)
         )
         read_options.set_set_tz(self.resolve_defaults("set_tz", proto_cfg, global_default=False, **kwargs))
         read_options.set_allow_sparse(self.resolve_defaults("allow_sparse", proto_cfg, global_default=False, **kwargs))
         read_options.set_incompletes(self.resolve_defaults("incomplete", proto_cfg, global_default=False, **kwargs))
+        output_format = kwargs.get("output_format")
+        if output_format is not None:
+            read_options.set_output_format(_resolve_output_format(output_format))
         return read_options
 
     def _get_queries(self, as_of, date_range, row_range, columns=None, query_builder=None, **kwargs):
@@ -1813,6 +2059,9 @@ class NativeVersionStore:
         columns = self._resolve_empty_columns(columns, implement_read_index)
         # Take a copy as _get_queries can modify the input argument, which makes reusing the input counter-intuitive
         query_builder = copy.deepcopy(query_builder)
+        query_digest = None
+        if self._result_cache is not None:
+            query_digest = _result_cache_query_digest(date_range, row_range, columns, query_builder, kwargs)
         version_query, read_options, read_query = self._get_queries(
             as_of=as_of,
             date_range=date_range,
@@ -1823,22 +2072,164 @@ class NativeVersionStore:
         )
 
         if read_options.output_format == OutputFormat.ARROW:
-            vit, frame, meta = self.version_store.read_dataframe_version_arrow(symbol, version_query, read_query, read_options)
-            import pyarrow as pa
-            record_batches = []
-            for i in range(frame.num_blocks):
-                arrays = []
-                for arr, schema in zip(frame.arrays, frame.schemas):
-                    print("Arr: {} Schema: {}".format(arr, schema));
-                    arrays.append(pa.Array._import_from_c(arr[i], schema[i]))
+            vit, frame, norm, udm = self.version_store.read_dataframe_version_arrow(
+                symbol, version_query, read_query, read_options
+            )
+            return self._post_process_arrow(vit, frame, norm, udm, read_query)
+
+        if query_digest is not None:
+            return self._read_with_result_cache(
+                symbol, version_query, read_query, read_options, implement_read_index, query_digest
+            )
 
-                record_batches.append(pa.RecordBatch.from_arrays(arrays, names=frame.names))
+        read_result = self._read_dataframe(symbol, version_query, read_query, read_options)
+        return self._post_process_dataframe(read_result, read_query, implement_read_index)
 
-            return pa.Table.from_batches(record_batches)
+    def _read_with_result_cache(
+        self, symbol, version_query, read_query, read_options, implement_read_index, query_digest
+    ) -> VersionedItem:
+        # Versions are immutable, so the result of a query against the version's index key never changes
+        versioned_item = self.version_store.find_version(symbol, version_query)
+        cache_key = None if versioned_item is None else f"{versioned_item.key!r}|{query_digest}"
+        if cache_key is not None:
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                return _copy_versioned_item(cached)
+        # A missing version is reported by the read in the usual way
+        read_result = self._read_dataframe(symbol, version_query, read_query, read_options)
+        vit = self._post_process_dataframe(read_result, read_query, implement_read_index)
+        # A new version may have been written between finding the version and reading it, in which case the result
+        # does not belong under cache_key
+        if (
+            cache_key is not None
+            and read_result.version.key == versioned_item.key
+            and isinstance(vit.data, (pd.DataFrame, pd.Series))
+        ):
+            entry = _copy_versioned_item(vit)
+            self._result_cache.put(cache_key, entry, _result_cache_entry_bytes(entry.data))
+        return vit
+
+    def set_result_cache_size(self, max_bytes: int):
+        """
+        Enable, resize, or disable the in-process cache of `read` results.
+
+        Results are cached against the index key of the version read, together with the date_range, row_range,
+        columns, query_builder, and other arguments passed to `read`, so a cached result is only ever returned for an
+        identical query against the same version. Resolving `as_of` to a version is still performed on every read,
+        so reading the latest version returns new data as soon as it is written. Only reads returning a pandas
+        DataFrame or Series are cached, and each hit returns a copy so that modifying the result does not affect the
+        cache.
 
+        Parameters
+        ----------
+        max_bytes : int
+            Maximum total size of the cached results, as measured by `memory_usage(deep=True)`. The least recently
+            used results are evicted to stay within this limit. 0 disables the cache and drops its contents.
+        """
+        check(max_bytes >= 0, "max_bytes must be non-negative, received {}", max_bytes)
+        if max_bytes == 0:
+            self._result_cache = None
+        elif self._result_cache is None:
+            self._result_cache = _ReadResultCache(max_bytes)
         else:
-            read_result = self._read_dataframe(symbol, version_query, read_query, read_options)
-            return self._post_process_dataframe(read_result, read_query, implement_read_index)
+            self._result_cache.capacity_bytes = max_bytes
+
+    def result_cache_stats(self) -> Optional[ResultCacheStats]:
+        """
+        Hit, miss, and eviction counts, and the current number of entries and bytes, of the cache enabled with
+        `set_result_cache_size`. None if the cache is not enabled.
+        """
+        return None if self._result_cache is None else self._result_cache.stats()
+
+    def local_cache_stats(self) -> Optional[ResultCacheStats]:
+        """
+        Hit, miss, and eviction counts, and the current number of entries and bytes, of the cache on local disk placed
+        in front of the storage by the `local_cache` option of the URI. None if the library has no local cache.
+        """
+        return self._library.local_cache_stats()
+
+    def read_iter(
+        self,
+        symbol: str,
+        as_of: Optional[VersionQueryInput] = None,
+        date_range: Optional[DateRangeInput] = None,
+        columns: Optional[List[str]] = None,
+        query_builder: Optional[QueryBuilder] = None,
+        chunk_rows: int = 1_000_000,
+        prefetch: int = 2,
+        **kwargs,
+    ) -> Iterator[VersionedItem]:
+        """
+        Read data for the named symbol as a sequence of chunks, so that the whole symbol never needs to be held in
+        memory at once. Each chunk covers whole row-slices of the stored data, and is at least chunk_rows rows long
+        (apart from the last one) before any query_builder filtering is applied.
+
+        Parameters
+        ----------
+        symbol : `str`
+            Symbol name.
+        as_of : `Optional[VersionQueryInput]`, default=None
+            See documentation of `read` method for more details.
+        date_range: `Optional[DateRangeInput]`, default=None
+            DateRange to read data for. Row-slices entirely outside of the range are not read at all.
+        columns: `Optional[List[str]]`, default=None
+            Applicable only for Pandas data. Determines which columns to return data for.
+        query_builder: 'Optional[QueryBuilder]', default=None
+            A QueryBuilder object to apply to each chunk before it is returned. Only row-wise operations (filters,
+            projections and date ranges) are supported, as these give the same results applied chunk by chunk as they
+            do applied to the whole symbol.
+        chunk_rows: `int`, default=1_000_000
+            Minimum number of rows in each chunk, before any filtering.
+        prefetch: `int`, default=2
+            Number of chunks to read and decode in the background while the current chunk is being processed.
+
+        Returns
+        -------
+        Iterator[VersionedItem]
+        """
+        check(chunk_rows > 0, "chunk_rows must be positive, received {}", chunk_rows)
+        check(prefetch >= 0, "prefetch must be non-negative, received {}", prefetch)
+        implement_read_index = kwargs.get("implement_read_index", False)
+        columns = self._resolve_empty_columns(columns, implement_read_index)
+        query_builder = copy.deepcopy(query_builder)
+        if query_builder is not None:
+            for python_clause in query_builder._python_clauses:
+                if not isinstance(python_clause, (PythonFilterClause, PythonProjectionClause, PythonDateRangeClause)):
+                    raise UserInputException(
+                        f"read_iter only supports filter, projection and date_range clauses, received {python_clause}"
+                    )
+        chunk_date_range = None
+        if date_range is not None:
+            # Trimming to the date range is done by a clause, the date range passed to the chunked reader is only used
+            # to skip row-slices that cannot contain any data in the range
+            index_range = _normalize_dt_range(date_range)
+            chunk_date_range = (index_range.start_ts, index_range.end_ts)
+            date_range_query_builder = QueryBuilder().date_range(date_range)
+            query_builder = (
+                date_range_query_builder if query_builder is None else query_builder.prepend(date_range_query_builder)
+            )
+        version_query, read_options, read_query = self._get_queries(
+            as_of=as_of, date_range=None, row_range=None, columns=columns, query_builder=query_builder, **kwargs
+        )
+        reader = self.version_store.read_dataframe_chunked(
+            symbol, version_query, read_query, read_options, chunk_date_range, chunk_rows, prefetch
+        )
+        rows_read = 0
+        try:
+            for chunk in reader:
+                if read_options.output_format == OutputFormat.ARROW:
+                    vit, frame, norm, udm = chunk
+                    yield self._post_process_arrow(vit, frame, norm, udm, read_query)
+                    continue
+                vit = self._post_process_dataframe(ReadResult(*chunk), read_query, implement_read_index)
+                # Without any filtering the chunks are contiguous, so carry on the range index from the previous chunk
+                # to match read
+                if query_builder is None and isinstance(getattr(vit.data, "index", None), pd.RangeIndex):
+                    vit.data.index = vit.data.index + rows_read * vit.data.index.step
+                rows_read += len(vit.data)
+                yield vit
+        finally:
+            reader.close()
 
     def head(
         self,
@@ -1911,6 +2302,11 @@ class NativeVersionStore:
         return self._post_process_dataframe(read_result, read_query, implement_read_index, tail=n)
 
     def _read_dataframe(self, symbol, version_query, read_query, read_options):
+        check(
+            read_options.output_format == OutputFormat.PANDAS,
+            "output_format {} is only supported by read and batch_read",
+            read_options.output_format,
+        )
         return ReadResult(*self.version_store.read_dataframe_version(symbol, version_query, read_query, read_options))
 
     def _post_process_dataframe(self, read_result, read_query, implement_read_index=False, head=None, tail=None):
@@ -1955,10 +2351,36 @@ class NativeVersionStore:
                 metadata=vitem.metadata,
                 host=vitem.host,
                 timestamp=vitem.timestamp,
+                segments_skipped=vitem.segments_skipped,
             )
 
         return vitem
 
+    def _post_process_arrow(self, vit, frame, norm, udm, read_query) -> VersionedItem:
+        table = _arrow_table(frame)
+        # Whole row-slices are read, so trim them to the requested range. Slicing a pyarrow table does not copy
+        if read_query.row_filter is not None and read_query.needs_post_processing and table.num_rows > 0:
+            if isinstance(read_query.row_filter, _RowRange):
+                start_idx = max(read_query.row_filter.start - frame.offset, 0)
+                end_idx = min(read_query.row_filter.end - frame.offset, table.num_rows)
+            else:
+                index = table.column(0).to_numpy()
+                start_idx = index.searchsorted(datetime64(read_query.row_filter.start_ts, "ns"), side="left")
+                end_idx = index.searchsorted(datetime64(read_query.row_filter.end_ts, "ns"), side="right")
+            table = table.slice(start_idx, max(end_idx - start_idx, 0))
+        table = _arrow_categorical_columns(table, norm)
+
+        return VersionedItem(
+            symbol=vit.symbol,
+            library=self._library.library_path,
+            data=table,
+            version=vit.version,
+            metadata=denormalize_user_metadata(udm, self._normalizer),
+            host=self.env,
+            timestamp=vit.timestamp,
+            segments_skipped=vit.segments_skipped,
+        )
+
     def _compute_filter_start_end_row(self, read_result, read_query):
         start_idx = end_idx = None
         if isinstance(read_query.row_filter, _RowRange):
@@ -2162,6 +2584,7 @@ class NativeVersionStore:
             metadata=meta,
             host=self.env,
             timestamp=read_result.version.timestamp,
+            segments_skipped=read_result.version.segments_skipped,
         )
 
     def list_versions(
@@ -0,0 +1,261 @@
+"""
+Copyright 2024 Man Group Operations Limited
+
+Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+
+As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+"""
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from arcticdb.exceptions import ArcticException, NoSuchVersionException
+from arcticdb.preconditions import check
+from arcticdb.supported_types import Timestamp
+from arcticdb.util.errors import _exception_name
+from arcticdb.version_store._store import VersionedItem, _resolve_output_format
+from arcticdb.version_store.library import AsOf, Library, ReadInfoRequest, ReadRequest, SymbolDescription
+from arcticdb.version_store.processing import QueryBuilder
+import arcticdb_ext.exceptions as _cpp_exceptions
+from arcticdb_ext.exceptions import ErrorCode
+from arcticdb_ext.version_store import DataError, OutputFormat
+
+
+_READ = "read"
+_READ_METADATA = "read_metadata"
+
+
+def _copy_outcome(source: asyncio.Future, destination: asyncio.Future):
+    if destination.done():
+        # The caller stopped waiting, e.g. the awaiting task was cancelled
+        return
+    if source.cancelled():
+        destination.cancel()
+    elif source.exception() is not None:
+        destination.set_exception(source.exception())
+    else:
+        destination.set_result(source.result())
+
+
+def _data_error_to_exception(error: DataError) -> ArcticException:
+    # The exception the symbol's read raised in the native layer, as it would have been raised by Library.read
+    if error.error_code == ErrorCode.E_NO_SUCH_VERSION:
+        return NoSuchVersionException(error.exception_string)
+    if error.error_category is not None:
+        exception_type = getattr(_cpp_exceptions, _exception_name(error.error_category.name) + "Exception")
+        return exception_type(error.exception_string)
+    return ArcticException(error.exception_string)
+
+
+class AsyncLibrary:
+    """
+    asyncio interface to a `Library`. Its methods mirror those of `Library`, but are coroutines to be awaited from an
+    event loop rather than calls blocking the calling thread.
+
+    Calls are made from a pool of ``max_workers`` threads so that they do not block the event loop. ArcticDB only lets
+    one thread at a time into its native layer, so calls from different threads do not overlap there. The concurrency
+    comes from within each call instead: reads (and metadata reads) awaited concurrently from the same event loop are
+    coalesced into calls to `Library.read_batch` (and `Library.read_metadata_batch`) of up to ``max_batch_size``
+    symbols, whose segments are fetched and decoded in parallel on ArcticDB's own thread pools. More reads than
+    ``max_batch_size`` are split into several batches, which are read one after the other.
+
+    Reads with ``output_format="arrow"`` release the GIL for the whole of the native read, so the event loop keeps
+    running while they are in flight. Pandas reads hold the GIL while strings are decoded into Python objects. Calling
+    `Library` methods directly from the event loop's thread while calls are in flight blocks it until they complete.
+
+    Examples
+    --------
+
+    >>> lib = adb.Arctic("lmdb://test").get_library("test_library")
+    >>> async with AsyncLibrary(lib) as async_lib:
+    ...     results = await asyncio.gather(*(async_lib.read(symbol) for symbol in async_lib.library.list_symbols()))
+    """
+
+    def __init__(self, library: Library, max_batch_size: int = 1000, max_workers: Optional[int] = None):
+        """
+        Parameters
+        ----------
+        library
+            The library to make calls to.
+        max_batch_size
+            Maximum number of concurrent reads coalesced into a single batch read.
+        max_workers
+            Number of threads calls are made from. Defaults to the `ThreadPoolExecutor` default. As only one thread at
+            a time is let into the native layer, more than one thread only helps the parts of calls made in Python,
+            such as normalizing the data of writes.
+        """
+        check(max_batch_size > 0, "max_batch_size must be positive, received {}", max_batch_size)
+        self._library = library
+        self._max_batch_size = max_batch_size
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="arcticdb_async")
+        # Reads waiting to be coalesced, keyed on the event loop they were made from, the kind of read, and the output
+        # format
+        self._pending: Dict[Tuple[asyncio.AbstractEventLoop, str, Any], List[Tuple[Any, asyncio.Future]]] = {}
+
+    def __repr__(self):
+        return "AsyncLibrary(%s)" % self._library
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def library(self) -> Library:
+        """The library calls are made to."""
+        return self._library
+
+    def close(self):
+        """Stop the worker threads once calls already submitted to them have completed."""
+        self._executor.shutdown(wait=False)
+
+    async def _run(self, func: Callable, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    def _enqueue(self, kind: str, output_format: Any, request) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        key = (loop, kind, output_format)
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = []
+            # Everything enqueued before the event loop next gets control is read in the same batch
+            loop.call_soon(self._flush, key)
+        pending.append((request, future))
+        return future
+
+    def _flush(self, key):
+        loop, kind, output_format = key
+        pending = [(request, future) for request, future in self._pending.pop(key, []) if not future.done()]
+        for start in range(0, len(pending), self._max_batch_size):
+            chunk = pending[start : start + self._max_batch_size]
+            requests = [request for request, _ in chunk]
+            if kind == _READ:
+                batch_func = functools.partial(self._library.read_batch, requests, output_format=output_format)
+            else:
+                batch_func = functools.partial(self._library.read_metadata_batch, requests)
+            batch_future = loop.run_in_executor(self._executor, batch_func)
+            batch_future.add_done_callback(functools.partial(self._resolve, chunk))
+
+    @staticmethod
+    def _resolve(chunk, batch_future: asyncio.Future):
+        if batch_future.cancelled() or batch_future.exception() is not None:
+            for _, future in chunk:
+                _copy_outcome(batch_future, future)
+            return
+        for (_, future), result in zip(chunk, batch_future.result()):
+            if future.done():
+                continue
+            if isinstance(result, DataError):
+                future.set_exception(_data_error_to_exception(result))
+            else:
+                future.set_result(result)
+
+    async def read(
+        self,
+        symbol: str,
+        as_of: Optional[AsOf] = None,
+        date_range: Optional[Tuple[Optional[Timestamp], Optional[Timestamp]]] = None,
+        row_range: Optional[Tuple[int, int]] = None,
+        columns: Optional[List[str]] = None,
+        query_builder: Optional[QueryBuilder] = None,
+        output_format: Union[OutputFormat, str] = OutputFormat.PANDAS,
+    ) -> VersionedItem:
+        """
+        Read data for the named symbol, coalesced with other reads awaited concurrently into a single batch read.
+
+        See Also
+        --------
+        Library.read: For documentation on the parameters.
+        """
+        request = ReadRequest(
+            symbol=symbol,
+            as_of=as_of,
+            date_range=date_range,
+            row_range=row_range,
+            columns=columns,
+            query_builder=query_builder,
+        )
+        return await self._enqueue(_READ, _resolve_output_format(output_format), request)
+
+    async def read_metadata(self, symbol: str, as_of: Optional[AsOf] = None) -> VersionedItem:
+        """
+        Return the metadata saved for a symbol, coalesced with other metadata reads awaited concurrently into a single
+        batch read.
+
+        See Also
+        --------
+        Library.read_metadata: For documentation on the parameters.
+        """
+        return await self._enqueue(_READ_METADATA, None, ReadInfoRequest(symbol=symbol, as_of=as_of))
+
+    async def read_batch(self, *args, **kwargs) -> List[Union[VersionedItem, DataError]]:
+        """See `Library.read_batch`."""
+        return await self._run(self._library.read_batch, *args, **kwargs)
+
+    async def read_metadata_batch(self, *args, **kwargs) -> List[Union[VersionedItem, DataError]]:
+        """See `Library.read_metadata_batch`."""
+        return await self._run(self._library.read_metadata_batch, *args, **kwargs)
+
+    async def head(self, *args, **kwargs) -> VersionedItem:
+        """See `Library.head`."""
+        return await self._run(self._library.head, *args, **kwargs)
+
+    async def tail(self, *args, **kwargs) -> VersionedItem:
+        """See `Library.tail`."""
+        return await self._run(self._library.tail, *args, **kwargs)
+
+    async def write(self, *args, **kwargs) -> VersionedItem:
+        """See `Library.write`."""
+        return await self._run(self._library.write, *args, **kwargs)
+
+    async def write_batch(self, *args, **kwargs) -> List[Union[VersionedItem, DataError]]:
+        """See `Library.write_batch`."""
+        return await self._run(self._library.write_batch, *args, **kwargs)
+
+    async def append(self, *args, **kwargs) -> Optional[VersionedItem]:
+        """See `Library.append`."""
+        return await self._run(self._library.append, *args, **kwargs)
+
+    async def append_batch(self, *args, **kwargs) -> List[Union[VersionedItem, DataError]]:
+        """See `Library.append_batch`."""
+        return await self._run(self._library.append_batch, *args, **kwargs)
+
+    async def update(self, *args, **kwargs) -> VersionedItem:
+        """See `Library.update`."""
+        return await self._run(self._library.update, *args, **kwargs)
+
+    async def update_batch(self, *args, **kwargs) -> List[Union[VersionedItem, DataError]]:
+        """See `Library.update_batch`."""
+        return await self._run(self._library.update_batch, *args, **kwargs)
+
+    async def write_metadata(self, *args, **kwargs) -> VersionedItem:
+        """See `Library.write_metadata`."""
+        return await self._run(self._library.write_metadata, *args, **kwargs)
+
+    async def delete(self, *args, **kwargs) -> None:
+        """See `Library.delete`."""
+        return await self._run(self._library.delete, *args, **kwargs)
+
+    async def snapshot(self, *args, **kwargs) -> None:
+        """See `Library.snapshot`."""
+        return await self._run(self._library.snapshot, *args, **kwargs)
+
+    async def list_symbols(self, *args, **kwargs) -> List[str]:
+        """See `Library.list_symbols`."""
+        return await self._run(self._library.list_symbols, *args, **kwargs)
+
+    async def has_symbol(self, *args, **kwargs) -> bool:
+        """See `Library.has_symbol`."""
+        return await self._run(self._library.has_symbol, *args, **kwargs)
+
+    async def list_versions(self, *args, **kwargs):
+        """See `Library.list_versions`."""
+        return await self._run(self._library.list_versions, *args, **kwargs)
+
+    async def get_description(self, *args, **kwargs) -> SymbolDescription:
+        """See `Library.get_description`."""
+        return await self._run(self._library.get_description, *args, **kwargs)
@@ -8,10 +8,13 @@ As of the Change Date specified in that file, in accordance with the Business So
 import copy
 import datetime
 import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import pytz
 from enum import Enum, auto
-from typing import Optional, Any, Tuple, Dict, Union, List, Iterable, NamedTuple
+from typing import Optional, Any, Tuple, Dict, Union, List, Iterable, Iterator, NamedTuple
 
 from arcticdb.exceptions import ArcticDbNotYetImplemented
 from numpy import datetime64
@@ -22,13 +25,17 @@ from arcticdb.supported_types import Timestamp
 from arcticdb.util._versions import IS_PANDAS_TWO
 
 from arcticdb.version_store.processing import ExpressionNode, QueryBuilder
-from arcticdb.version_store._store import NativeVersionStore, VersionedItem
+from arcticdb.version_store._store import NativeVersionStore, VersionedItem, _resolve_output_format
 from arcticdb_ext.exceptions import ArcticException
+from arcticdb_ext.version_store import AsOfJoinClause as _AsOfJoinClause
+from arcticdb_ext.version_store import ConcatClause as _ConcatClause
+from arcticdb_ext.version_store import JoinClause as _JoinClause
+from arcticdb_ext.version_store import JoinType as _JoinType
 from arcticdb_ext.version_store import DataError, OutputFormat
 import pandas as pd
 import numpy as np
 import logging
-from arcticdb.version_store._normalization import normalize_metadata
+from arcticdb.version_store._normalization import normalize_metadata, _is_arrow_table, _is_polars_dataframe
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +56,11 @@ Library.write: for more documentation on normalisation.
 """
 
 
+def _is_normalizable(data) -> bool:
+    # pyarrow and polars are optional, so their types are recognised without importing them
+    return isinstance(data, NORMALIZABLE_TYPES) or _is_arrow_table(data) or _is_polars_dataframe(data)
+
+
 class ArcticInvalidApiUsageException(ArcticException):
     """Exception indicating an invalid call made to the Arctic API."""
 
@@ -481,6 +493,145 @@ class LazyDataFrameCollection(QueryBuilder):
             return []
         return self._lib.read_batch(self._read_requests())
 
+    def asof_join(
+            self,
+            by: Optional[Union[str, List[str]]] = None,
+            tolerance: Optional[Union[int, str, pd.Timedelta]] = None,
+            allow_exact_matches: bool = True,
+    ) -> "LazyDataFrameAfterJoin":
+        """
+        Join the two symbols in this collection on their timestamp indexes, in the same way as
+        `pd.merge_asof(left, right, left_index=True, right_index=True, by=by, tolerance=tolerance,
+        allow_exact_matches=allow_exact_matches)`, where left is the first symbol in the collection and right the second.
+        For each row of the left symbol, the columns of the last row of the right symbol with an index value at or before
+        it (and equal values in the by columns) are added.
+
+        The join is performed by the processing pipeline, with any queries applied to this collection (or to the
+        individual lazy dataframes) applied to each symbol before the join. Both symbols must have sorted timestamp
+        indexes.
+
+        Only backward matching is supported. Numeric and bool columns from the right symbol are returned as float64,
+        with NaN in rows with no match, as are datetime columns (with NaT) and string columns (with None). Columns other
+        than the by columns must not appear in both symbols.
+
+        Parameters
+        ----------
+        by : Optional[Union[str, List[str]]], default=None
+            Column(s) that must be equal in both symbols for rows to match.
+        tolerance : Optional[Union[int, str, pd.Timedelta]], default=None
+            Maximum distance between the index values of matched rows. Integers are interpreted as nanoseconds, other
+            values are anything accepted by the `pd.Timedelta` constructor.
+        allow_exact_matches : bool, default=True
+            Whether right rows with exactly the same index value as the left row can be matched.
+
+        Returns
+        -------
+        LazyDataFrameAfterJoin
+            Lazy dataframe to which further queries can be applied before calling `collect`.
+
+        Examples
+        --------
+
+        >>>
+        >>> lazy_dfs = lib.read_batch(["trades", "quotes"], lazy=True)
+        >>> lazy_dfs = lazy_dfs.date_range((pd.Timestamp("2024-01-02"), pd.Timestamp("2024-01-03")))
+        >>> lazy_df = lazy_dfs.asof_join(by="ticker", tolerance="2s")
+        >>> lazy_df["spread"] = lazy_df["ask"] - lazy_df["bid"]
+        >>> df = lazy_df.collect().data
+        """
+        check(
+            len(self._lazy_dataframes) == 2,
+            f"asof_join requires exactly 2 lazy dataframes in the collection, received {len(self._lazy_dataframes)}",
+        )
+        if by is None:
+            by = []
+        elif isinstance(by, str):
+            by = [by]
+        tolerance_ns = None
+        if tolerance is not None:
+            tolerance_ns = tolerance if isinstance(tolerance, int) else pd.Timedelta(tolerance).value
+            check(tolerance_ns >= 0, f"asof_join tolerance must be non-negative, received {tolerance}")
+        join_clause = _AsOfJoinClause(list(by), tolerance_ns, allow_exact_matches)
+        return LazyDataFrameAfterJoin(self, join_clause)
+
+    def join(self, on: Union[str, List[str]], how: str = "inner") -> "LazyDataFrameAfterJoin":
+        """
+        Join the two symbols in this collection on the values of one or more columns, in the same way as
+        `pd.merge(left, right, on=on, how=how, validate="many_to_one")` but keeping the index of the left symbol, where
+        left is the first symbol in the collection and right the second. Useful for enriching a symbol with reference
+        data, such as joining instrument metadata onto daily bars.
+
+        The join is performed by the processing pipeline, with any queries applied to this collection (or to the
+        individual lazy dataframes) applied to each symbol before the join. The rows of the left symbol keep their
+        order.
+
+        Only many-to-one joins are supported, so the values of the on columns must be unique in the right symbol.
+        Missing values in the on columns match each other. Numeric and bool columns from the right symbol are returned
+        as float64, with NaN in rows with no match, as are datetime columns (with NaT) and string columns (with None).
+        The index of the right symbol is dropped, and columns other than the on columns must not appear in both
+        symbols.
+
+        Parameters
+        ----------
+        on : Union[str, List[str]]
+            Column(s) that must be equal in both symbols for rows to match.
+        how : str, default="inner"
+            "inner" to drop left rows with no match in the right symbol, or "left" to keep them.
+
+        Returns
+        -------
+        LazyDataFrameAfterJoin
+            Lazy dataframe to which further queries can be applied before calling `collect`.
+
+        Examples
+        --------
+
+        >>>
+        >>> lazy_dfs = lib.read_batch(["daily_bars", ReadRequest("instruments", columns=["ticker", "sector"])], lazy=True)
+        >>> lazy_df = lazy_dfs.join(on="ticker", how="left")
+        >>> lazy_df = lazy_df[lazy_df["sector"] == "Energy"]
+        >>> df = lazy_df.collect().data
+        """
+        check(
+            len(self._lazy_dataframes) == 2,
+            f"join requires exactly 2 lazy dataframes in the collection, received {len(self._lazy_dataframes)}",
+        )
+        if isinstance(on, str):
+            on = [on]
+        check(len(on) > 0, "join requires at least one column to join on")
+        join_types = {"inner": _JoinType.INNER, "left": _JoinType.LEFT}
+        check(how in join_types, f"join how must be one of {list(join_types)}, received {how}")
+        join_clause = _JoinClause(list(on), join_types[how])
+        return LazyDataFrameAfterJoin(self, join_clause)
+
+    def concat(self) -> "LazyDataFrameAfterJoin":
+        """
+        Concatenate the symbols in this collection vertically, in the order they appear in the collection, in the
+        same way as `pd.concat`. Symbols with a row count index are concatenated as if `ignore_index=True` was passed.
+
+        The concatenation is performed by the processing pipeline, with any queries applied to this collection (or to
+        the individual lazy dataframes) applied to each symbol beforehand. All of the symbols must have the same index
+        type. Without dynamic schema they must also have the same columns with the same types, with dynamic schema
+        columns missing from some symbols are filled in the same way as for any other read.
+
+        Returns
+        -------
+        LazyDataFrameAfterJoin
+            Lazy dataframe to which further queries can be applied before calling `collect`.
+
+        Examples
+        --------
+
+        >>>
+        >>> lazy_dfs = lib.read_batch(["bars_2023", "bars_2024"], lazy=True)
+        >>> lazy_dfs = lazy_dfs[lazy_dfs["ticker"] == "AAA"]
+        >>> lazy_df = lazy_dfs.concat()
+        >>> lazy_df = lazy_df.resample("1W").agg({"volume": "sum"})
+        >>> df = lazy_df.collect().data
+        """
+        check(len(self._lazy_dataframes) > 0, "concat requires at least 1 lazy dataframe in the collection")
+        return LazyDataFrameAfterJoin(self, _ConcatClause())
+
     def _read_requests(self) -> List[ReadRequest]:
         # Combines queries for individual LazyDataFrames with the global query associated with this
         # LazyDataFrameCollection and returns a list of corresponding read requests
@@ -500,6 +651,67 @@ class LazyDataFrameCollection(QueryBuilder):
         return self.__str__()
 
 
+class LazyDataFrameAfterJoin(QueryBuilder):
+    """
+    Lazy dataframe holding the result of joining the symbols of a `LazyDataFrameCollection`. Queries applied to this
+    object are performed on the joined data. Returned by `LazyDataFrameCollection.asof_join`,
+    `LazyDataFrameCollection.join`, and `LazyDataFrameCollection.concat`.
+
+    See Also
+    --------
+    QueryBuilder for supported querying operations.
+
+    Examples
+    --------
+
+    >>>
+    >>> lazy_dfs = lib.read_batch(["trades", "quotes"], lazy=True)
+    >>> lazy_df = lazy_dfs.asof_join(by="ticker")
+    >>> lazy_df = lazy_df[lazy_df["price"] > lazy_df["bid"]]
+    # Actual reads, join, and processing happen here
+    >>> df = lazy_df.collect().data
+    """
+    def __init__(
+            self,
+            lazy_dataframes: LazyDataFrameCollection,
+            join_clause: Union[_AsOfJoinClause, _JoinClause, _ConcatClause],
+    ):
+        super().__init__()
+        self._lazy_dataframes = lazy_dataframes
+        self._join_clause = join_clause
+
+    def collect(self) -> VersionedItem:
+        """
+        Read the symbols, join them, and execute any queries applied to this object since the join.
+
+        Returns
+        -------
+        VersionedItem
+            Object that contains a .data and .metadata element. The symbol, version, and metadata are those of the
+            first symbol in the join.
+        """
+        read_requests = self._lazy_dataframes._read_requests()
+        return self._lazy_dataframes._lib._nvs._batch_read_and_join(
+            [read_request.symbol for read_request in read_requests],
+            [read_request.as_of for read_request in read_requests],
+            [read_request.date_range for read_request in read_requests],
+            [read_request.row_range for read_request in read_requests],
+            [read_request.columns for read_request in read_requests],
+            [read_request.query_builder for read_request in read_requests],
+            self._join_clause,
+            self,
+            implement_read_index=True,
+            iterate_snapshots_if_tombstoned=False,
+        )
+
+    def __str__(self) -> str:
+        query_builder_repr = super().__str__()
+        return f"LazyDataFrameAfterJoin({self._lazy_dataframes} | {self._join_clause}{' | ' if query_builder_repr else ''}{query_builder_repr})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
 def col(name: str) -> ExpressionNode:
     """
     Placeholder for referencing columns by name in lazy dataframe operations before the underlying object has been
@@ -528,6 +740,239 @@ class StagedDataFinalizeMethod(Enum):
     WRITE = auto()
     APPEND = auto()
 
+
+class StagedDataCompactionPolicy(NamedTuple):
+    """
+    Thresholds on the data staged for a symbol, beyond which `Library.stage` finalizes it in the background. Staged
+    data is finalized once any one of the thresholds that are set is reached.
+
+    Attributes
+    ----------
+    max_segments: Optional[int], default=None
+        Number of staged segments.
+    max_bytes: Optional[int], default=None
+        Compressed size of the staged segments in bytes. Checking this requires reading every staged segment, so is
+        considerably more expensive than checking the other thresholds.
+    max_age: Optional[pd.Timedelta], default=None
+        Time since the oldest staged segment was written.
+    mode: StagedDataFinalizeMethod, default=StagedDataFinalizeMethod.APPEND
+        See `Library.finalize_staged_data`.
+    prune_previous_versions: bool, default=False
+        See `Library.finalize_staged_data`.
+
+    See Also
+    --------
+    Library.stage: For documentation on how the policy is applied.
+    """
+
+    max_segments: Optional[int] = None
+    max_bytes: Optional[int] = None
+    max_age: Optional[pd.Timedelta] = None
+    mode: StagedDataFinalizeMethod = StagedDataFinalizeMethod.APPEND
+    prune_previous_versions: bool = False
+
+
+# Compactions are serialised on entry to the native layer anyway, so a single worker serves every library
+_staged_compaction_executor = None
+_staged_compaction_executor_lock = threading.Lock()
+
+
+def _get_staged_compaction_executor() -> ThreadPoolExecutor:
+    global _staged_compaction_executor
+    with _staged_compaction_executor_lock:
+        if _staged_compaction_executor is None:
+            _staged_compaction_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="arcticdb_compaction")
+        return _staged_compaction_executor
+
+
+class StreamWriter:
+    """
+    Writes rows of a timeseries to a symbol one at a time, or in small batches. Create with `Library.stream_writer`.
+
+    Rows are accumulated in memory in the native layer, and each time ``max_rows`` rows have been accumulated, or
+    ``max_interval`` has passed since the first of them was written, they are staged for the symbol as a single
+    segment. Unless the writer was created with ``staged=True``, each staged segment is then appended to the symbol
+    with `Library.finalize_staged_data`, so becomes readable as soon as it has been staged.
+
+    The first data written determines the columns and their types, so must have a value in every column. After that,
+    values missing from a row are written as NaN, NaT or None in floating point, timestamp or string columns, and are
+    not accepted in other columns. Rows must be written in index order.
+
+    The time threshold is only checked as rows are written, so call `flush` to stage the rows accumulated so far
+    without writing any more. Closing the writer, or leaving the ``with`` block it was created in, flushes it.
+    """
+
+    def __init__(
+        self,
+        library: "Library",
+        symbol: str,
+        max_rows: int,
+        max_interval: Optional[pd.Timedelta],
+        staged: bool,
+        compaction_policy: Optional[StagedDataCompactionPolicy],
+        prune_previous_versions: bool,
+    ):
+        check(max_rows > 0, "max_rows must be positive, received {}", max_rows)
+        check(
+            staged or compaction_policy is None,
+            "A compaction_policy can only be used with staged=True, as otherwise every segment is appended when staged",
+        )
+        self._library = library
+        self._nvs = library._nvs
+        self._symbol = symbol
+        self._max_rows = max_rows
+        self._max_interval_ns = None if max_interval is None else pd.Timedelta(max_interval).value
+        self._staged = staged
+        self._compaction_policy = compaction_policy
+        self._prune_previous_versions = prune_previous_versions
+        # Created from the first data written, which determines the columns
+        self._native = None
+        self._closed = False
+
+    def __repr__(self):
+        return "StreamWriter(symbol=%s, buffered_rows=%d)" % (self._symbol, self.buffered_rows)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def symbol(self) -> str:
+        """The symbol written to."""
+        return self._symbol
+
+    @property
+    def buffered_rows(self) -> int:
+        """Number of rows written that have not yet been staged."""
+        return 0 if self._native is None else self._native.buffered_rows
+
+    def _normalize(self, data):
+        _, item, norm_meta = self._nvs._try_normalize(
+            self._symbol,
+            data,
+            None,
+            pickle_on_failure=False,
+            dynamic_strings=True,
+            coerce_columns=None,
+            norm_failure_options_msg="Failed to normalize data for the stream writer",
+        )
+        return item, norm_meta
+
+    def _native_writer(self, item, norm_meta):
+        check(not self._closed, "Stream writer for symbol {} has been closed", self._symbol)
+        self._native = self._nvs.version_store.stream_writer(
+            self._symbol, item, norm_meta, self._max_rows, self._max_interval_ns
+        )
+        return self._native
+
+    def _on_staged(self, staged_segments: int) -> Optional[Union[VersionedItem, Future]]:
+        if staged_segments == 0:
+            return None
+        if not self._staged:
+            return self._library.finalize_staged_data(
+                self._symbol,
+                mode=StagedDataFinalizeMethod.APPEND,
+                prune_previous_versions=self._prune_previous_versions,
+            )
+        if self._compaction_policy is not None and self._library._staged_data_due_for_compaction(
+            self._symbol, self._compaction_policy
+        ):
+            return _get_staged_compaction_executor().submit(
+                self._library._compact_staged_data, self._symbol, self._compaction_policy, True
+            )
+        return None
+
+    def write_row(self, index: Timestamp, values: Dict[str, Any]) -> Optional[Union[VersionedItem, Future]]:
+        """
+        Write a single row. The values are copied straight into the segment being accumulated, without building any
+        pandas objects, apart from for the first row written.
+
+        Parameters
+        ----------
+        index: Timestamp
+            Index value of the row. Integers are taken to be nanoseconds since the epoch (UTC).
+        values: Dict[str, Any]
+            Values of the row, keyed on column name.
+
+        Returns
+        -------
+        Optional[Union[VersionedItem, Future]]
+            If writing the row staged a segment, the version it was appended in, or with ``staged=True``, the future
+            returned by the compaction policy as for `Library.stage`. Otherwise None.
+
+        Raises
+        ------
+        SortingException
+            If the index value is before that of the last row written.
+        SchemaException
+            If there is a value for a column that the writer does not have.
+        UserInputException
+            If a value cannot be converted to the type of its column.
+        """
+        native = self._native
+        if native is None:
+            native = self._native_writer(
+                *self._normalize(
+                    pd.DataFrame({name: [value] for name, value in values.items()}, index=pd.DatetimeIndex([index]))
+                )
+            )
+        return self._on_staged(native.write_row(index if isinstance(index, int) else pd.Timestamp(index).value, values))
+
+    def write(self, data: pd.DataFrame) -> Optional[Union[VersionedItem, Future]]:
+        """
+        Write the rows of a dataframe with a DatetimeIndex, which must have the same columns as the writer.
+
+        Returns
+        -------
+        Optional[Union[VersionedItem, Future]]
+            As for `write_row`. If more than one segment was staged, the outcome for the last of them.
+
+        Raises
+        ------
+        SortingException
+            If the index is not sorted, or starts before the last row written. None of the rows are written.
+        SchemaException
+            If the columns or their types do not match those of the writer. None of the rows are written.
+        """
+        item, norm_meta = self._normalize(data)
+        native = self._native
+        if native is None:
+            native = self._native_writer(item, norm_meta)
+        return self._on_staged(native.write_frame(item, norm_meta))
+
+    def flush(self) -> Optional[Union[VersionedItem, Future]]:
+        """
+        Stage the rows written since the last segment was staged, if there are any.
+
+        Returns
+        -------
+        Optional[Union[VersionedItem, Future]]
+            As for `write_row`.
+        """
+        if self._native is None:
+            return None
+        return self._on_staged(self._native.flush())
+
+    def close(self) -> Optional[Union[VersionedItem, Future]]:
+        """
+        Flush the writer. No more rows can be written once it has been closed.
+
+        Returns
+        -------
+        Optional[Union[VersionedItem, Future]]
+            As for `flush`.
+        """
+        if self._closed:
+            return None
+        try:
+            return self.flush()
+        finally:
+            self._native = None
+            self._closed = True
+
+
 class DevTools:
     def __init__(self, nvs):
         self._nvs = nvs
@@ -628,11 +1073,19 @@ class Library:
         data: NormalizableType,
         validate_index=True,
         sort_on_index=False,
-        sort_columns: List[str] = None
-    ):
+        sort_columns: List[str] = None,
+        compaction_policy: Optional[StagedDataCompactionPolicy] = None,
+    ) -> Optional[Future]:
         """
         Write a staged data chunk to storage, that will not be visible until finalize_staged_data is called on
-        the symbol. Equivalent to write() with staged=True.
+        the symbol, or it is finalized under a compaction policy. Equivalent to write() with staged=True.
+
+        Any number of processes can stage data for the same symbol concurrently. With a ``compaction_policy``, once the
+        data staged for the symbol reaches one of its thresholds it is finalized in a background thread, so that many
+        writers can feed a symbol without any of them finalizing it explicitly. Only one process finalizes the staged
+        data of a symbol at a time, with the others skipping compaction while it is in progress. Segments staged while
+        a compaction is in progress are left for the next one. Failures of background compactions are logged, and the
+        staged data is left in place.
 
         Parameters
         ----------
@@ -648,6 +1101,20 @@ class Library:
             index will be used as the primary sort column, and the others as secondaries.
         sort_columns:
             Sort the data by specific columns prior to writing.
+        compaction_policy: Optional[StagedDataCompactionPolicy], default=None
+            Thresholds beyond which the staged data of the symbol is finalized in the background.
+
+        Returns
+        -------
+        Optional[Future]
+            If the staged data was due to be finalized under the ``compaction_policy``, a future resolving to the
+            VersionedItem written by the compaction, or to None if another process was already compacting the symbol.
+            Otherwise None.
+
+        Examples
+        --------
+        >>> policy = adb.StagedDataCompactionPolicy(max_segments=100, max_age=pd.Timedelta(minutes=5))
+        >>> lib.stage("sym", df, compaction_policy=policy)
         """
         self._nvs.stage(
             symbol,
@@ -657,6 +1124,96 @@ class Library:
             sort_columns=sort_columns,
             norm_failure_options_msg="Failed to normalize data. It is inadvisable to pickle staged data"
                                      " as it will not be possible to finalize it.")
+        if compaction_policy is not None and self._staged_data_due_for_compaction(symbol, compaction_policy):
+            return _get_staged_compaction_executor().submit(
+                self._compact_staged_data, symbol, compaction_policy, validate_index
+            )
+        return None
+
+    def _staged_data_due_for_compaction(self, symbol: str, policy: StagedDataCompactionPolicy) -> bool:
+        summary = self._nvs.version_store.get_staged_data_summary(symbol, include_sizes=policy.max_bytes is not None)
+        if summary.segment_count == 0:
+            return False
+        if policy.max_segments is not None and summary.segment_count >= policy.max_segments:
+            return True
+        if policy.max_bytes is not None and summary.compressed_bytes >= policy.max_bytes:
+            return True
+        if policy.max_age is not None and summary.oldest_creation_ts is not None:
+            return time.time_ns() - summary.oldest_creation_ts >= pd.Timedelta(policy.max_age).value
+        return False
+
+    def _compact_staged_data(
+        self, symbol: str, policy: StagedDataCompactionPolicy, validate_index: bool
+    ) -> Optional[VersionedItem]:
+        try:
+            vit = self._nvs.version_store.compact_incomplete_unless_locked(
+                symbol,
+                append=policy.mode in (StagedDataFinalizeMethod.APPEND, "append"),
+                prune_previous_versions=policy.prune_previous_versions,
+                validate_index=validate_index,
+            )
+        except Exception as e:
+            logger.warning("Background compaction of staged data for symbol %s failed: %s", symbol, e)
+            raise
+        return None if vit is None else self._nvs._convert_thin_cxx_item_to_python(vit, None)
+
+    def stream_writer(
+        self,
+        symbol: str,
+        max_rows: Optional[int] = None,
+        max_interval: Optional[pd.Timedelta] = None,
+        staged: bool = False,
+        compaction_policy: Optional[StagedDataCompactionPolicy] = None,
+        prune_previous_versions: bool = False,
+    ) -> StreamWriter:
+        """
+        Create a writer for rows of a timeseries arriving one at a time or in small batches, such as captured ticks.
+        Rather than each batch being appended as its own small segment, rows are accumulated in memory until there
+        are enough of them to make a segment of ``max_rows`` rows, or until ``max_interval`` has passed since the first
+        of them was written, and are then staged as a single segment.
+
+        By default, each segment is appended to the symbol as soon as it has been staged, with
+        `finalize_staged_data`. Any other data staged for the symbol is appended along with it. With ``staged=True``,
+        segments are left staged, to be finalized with `finalize_staged_data` or under the ``compaction_policy``.
+
+        Parameters
+        ----------
+        symbol : str
+            Symbol name.
+        max_rows: Optional[int], default=None
+            Number of rows accumulated before they are staged as a segment. Defaults to the ``rows_per_segment`` of the
+            library.
+        max_interval: Optional[pd.Timedelta], default=None
+            Time after the first row of a segment is written beyond which the segment is staged by the next row written.
+            By default segments are only staged when full, or when the writer is flushed.
+        staged: bool, default=False
+            Leave segments staged rather than appending them to the symbol.
+        compaction_policy: Optional[StagedDataCompactionPolicy], default=None
+            With ``staged=True``, thresholds beyond which the staged data of the symbol is finalized in the background.
+            See `stage`.
+        prune_previous_versions: bool, default=False
+            Removes previous (non-snapshotted) versions as segments are appended.
+
+        Returns
+        -------
+        StreamWriter
+            The writer, to be used as a context manager so that the rows written are flushed when done.
+
+        Examples
+        --------
+        >>> with lib.stream_writer("ticks", max_rows=100_000, max_interval=pd.Timedelta(seconds=30)) as writer:
+        ...     for tick in feed:
+        ...         writer.write_row(tick.time, {"price": tick.price, "size": tick.size})
+        """
+        return StreamWriter(
+            self,
+            symbol,
+            max_rows=self.options().rows_per_segment if max_rows is None else max_rows,
+            max_interval=max_interval,
+            staged=staged,
+            compaction_policy=compaction_policy,
+            prune_previous_versions=prune_previous_versions,
+        )
 
     def write(
         self,
@@ -676,6 +1233,11 @@ class Library:
         DataFrames, Pandas Series and Numpy NDArrays can all be normalised. Normalised data will be split along both the
         columns and rows into segments. By default, a segment will contain 100,000 rows and 127 columns.
 
+        pyarrow Tables and Polars DataFrames can also be written, and are stored as the equivalent Pandas DataFrame
+        would be without being converted to one. Their numeric columns are passed through without copying where Arrow
+        allows it, and their string columns are read straight from the Arrow buffers. Tables converted from Pandas
+        keep their index through the Pandas metadata of their schema, otherwise a ``RowCount`` index is used.
+
         If this library has ``write_deduplication`` enabled then segments will be deduplicated against storage prior to
         write to reduce required IO operations and storage requirements. Data will be effectively deduplicated for all
         segments up until the first differing row when compared to storage. As a result, modifying the beginning
@@ -751,7 +1313,7 @@ class Library:
         >>> w = adb.WritePayload("symbol", df, metadata={'the': 'metadata'})
         >>> lib.write(*w, staged=True)
         """
-        if not isinstance(data, NORMALIZABLE_TYPES):
+        if not _is_normalizable(data):
             raise ArcticUnsupportedDataTypeException(
                 "data is of a type that cannot be normalized. Consider using "
                 f"write_pickle instead. type(data)=[{type(data)}]"
@@ -828,7 +1390,7 @@ class Library:
     def _raise_if_unsupported_type_in_write_batch(payloads):
         bad_symbols = []
         for p in payloads:
-            if not isinstance(p.data, NORMALIZABLE_TYPES):
+            if not _is_normalizable(p.data):
                 bad_symbols.append((p.symbol, type(p.data)))
 
         if not bad_symbols:
@@ -848,6 +1410,10 @@ class Library:
         """
         Write a batch of multiple symbols.
 
+        By default every payload is normalized before any are written. Setting the
+        ``VersionStore.BatchWritePipelineBytes`` runtime option instead writes the payloads in chunks of bounded size,
+        each written while the next is normalized.
+
         Parameters
         ----------
         payloads : `List[WritePayload]`
@@ -1555,7 +2121,9 @@ class Library:
         row_range: Optional[Tuple[int, int]] = None,
         columns: Optional[List[str]] = None,
         query_builder: Optional[QueryBuilder] = None,
-        lazy: bool = False
+        lazy: bool = False,
+        output_format: Union[OutputFormat, str] = OutputFormat.PANDAS,
+        include_incompletes: bool = False,
     ) -> Union[VersionedItem, LazyDataFrame]:
         """
         Read data for the named symbol.  Returns a VersionedItem object with a data and metadata element (as passed into
@@ -1606,6 +2174,19 @@ class Library:
             Defer query execution until `collect` is called on the returned `LazyDataFrame` object. See documentation
             on `LazyDataFrame` for more details.
 
+        output_format: Union[OutputFormat, str], default=OutputFormat.PANDAS
+            Format of the returned data. ``OutputFormat.ARROW`` (or ``"arrow"``) returns a ``pyarrow.Table``, which
+            requires pyarrow to be installed. The table has one record batch per row-slice of the stored data, whose
+            numeric buffers are handed over from the read without being copied, and the index is returned as its first
+            column(s) rather than as an index. String columns are dictionary encoded, and categorical columns are
+            returned as dictionary arrays over their codes. Cannot be combined with lazy.
+
+        include_incompletes: bool, default=False
+            Also return data staged for the symbol that has not yet been finalized, after the data of the version read,
+            as ``finalize_staged_data`` with ``StagedDataFinalizeMethod.APPEND`` would. Only supported for timeseries
+            data, and cannot be combined with row_range or lazy. Reads of symbols with staged data but no versions
+            return just the staged data.
+
         Returns
         -------
         Union[VersionedItem, LazyDataFrame]
@@ -1631,7 +2212,15 @@ class Library:
         1       6
         2       7
         """
+        output_format = _resolve_output_format(output_format)
+        if include_incompletes:
+            check(not lazy, "include_incompletes cannot be used with lazy=True")
+            check(row_range is None, "include_incompletes cannot be used with row_range")
+            # Staged data is found by index range
+            if date_range is None:
+                date_range = (None, None)
         if lazy:
+            check(output_format == OutputFormat.PANDAS, "output_format {} cannot be used with lazy=True", output_format)
             return LazyDataFrame(
                 self,
                 ReadRequest(
@@ -1652,14 +2241,107 @@ class Library:
                 columns=columns,
                 query_builder=query_builder,
                 implement_read_index=True,
-                iterate_snapshots_if_tombstoned=False
+                iterate_snapshots_if_tombstoned=False,
+                output_format=output_format,
+                incomplete=include_incompletes,
             )
 
+    def read_iter(
+        self,
+        symbol: str,
+        as_of: Optional[AsOf] = None,
+        date_range: Optional[Tuple[Optional[Timestamp], Optional[Timestamp]]] = None,
+        columns: Optional[List[str]] = None,
+        query_builder: Optional[QueryBuilder] = None,
+        chunk_rows: int = 1_000_000,
+        prefetch: int = 2,
+        output_format: Union[OutputFormat, str] = OutputFormat.PANDAS,
+    ) -> Iterator[Union[pd.DataFrame, pd.Series, "pyarrow.Table"]]:
+        """
+        Read data for the named symbol one chunk at a time, so that symbols too large to fit in memory can be processed
+        in full. Concatenating the chunks gives the same data as ``read`` with the same arguments.
+
+        Each chunk is made up of whole row-slices of the stored data (see ``LibraryOptions.rows_per_segment``), so
+        chunks are at least ``chunk_rows`` rows long (apart from the last one) before any filtering is applied, and may
+        be longer. While a chunk is being processed, the next ``prefetch`` chunks are read and decoded in the
+        background, so memory usage is bounded by roughly ``(prefetch + 1) * chunk_rows`` rows.
+
+        All chunks come from the same version of the symbol, even if it is modified while the chunks are being read.
+
+        Parameters
+        ----------
+        symbol : str
+            Symbol name.
+
+        as_of : AsOf, default=None
+            Return the data as it was as of the point in time. See the ``read`` method for more details.
+
+        date_range: Tuple[Optional[Timestamp], Optional[Timestamp]], default=None
+            DateRange to restrict read data to. Row-slices wholly outside of the range are never read from storage.
+            See the ``read`` method for more details.
+
+        columns: List[str], default=None
+            Applicable only for Pandas data. Determines which columns to return data for. See the ``read`` method for
+            more details.
+
+        query_builder: Optional[QueryBuilder], default=None
+            A QueryBuilder object to apply to each chunk before it is returned. Only filters, projections and date
+            ranges are supported, as operations spanning multiple rows such as groupby and resample cannot be applied
+            chunk by chunk.
+
+        chunk_rows: int, default=1_000_000
+            Minimum number of rows in each chunk, before any filtering is applied.
+
+        prefetch: int, default=2
+            Number of chunks to read ahead of the one being processed. 0 disables reading ahead.
+
+        output_format: Union[OutputFormat, str], default=OutputFormat.PANDAS
+            Format of each chunk. ``OutputFormat.ARROW`` (or ``"arrow"``) returns each chunk as a ``pyarrow.Table``.
+            See the ``read`` method for more details.
+
+        Returns
+        -------
+        Iterator[Union[pd.DataFrame, pd.Series, pyarrow.Table]]
+            Iterator over the chunks of the data, as ``pyarrow.Table`` objects if ``output_format`` is
+            ``OutputFormat.ARROW``. Chunks that are entirely filtered out by the ``query_builder`` are yielded as empty
+            dataframes, or empty tables with Arrow output.
+
+        Raises
+        ------
+        UserInputException
+            If the query_builder contains clauses other than filters, projections and date ranges.
+
+        Examples
+        --------
+
+        >>> df = pd.DataFrame({'column': [5, 6, 7]})
+        >>> lib.write("symbol", df)
+        >>> total = 0
+        >>> for chunk in lib.read_iter("symbol", chunk_rows=2):
+        ...     total += chunk["column"].sum()
+        >>> total
+        18
+        """
+        for vit in self._nvs.read_iter(
+            symbol=symbol,
+            as_of=as_of,
+            date_range=date_range,
+            columns=columns,
+            query_builder=query_builder,
+            chunk_rows=chunk_rows,
+            prefetch=prefetch,
+            implement_read_index=True,
+            iterate_snapshots_if_tombstoned=False,
+            output_format=_resolve_output_format(output_format),
+        ):
+            yield vit.data
+
     def read_batch(
         self,
         symbols: List[Union[str, ReadRequest]],
         query_builder: Optional[QueryBuilder] = None,
         lazy: bool = False,
+        output_format: Union[OutputFormat, str] = OutputFormat.PANDAS,
     ) -> Union[List[Union[VersionedItem, DataError]], LazyDataFrameCollection]:
         """
         Reads multiple symbols.
@@ -1677,6 +2359,9 @@ class Library:
             Defer query execution until `collect` is called on the returned `LazyDataFrameCollection` object. See
             documentation on `LazyDataFrameCollection` for more details.
 
+        output_format: Union[OutputFormat, str], default=OutputFormat.PANDAS
+            Format of the returned data. See documentation on `read` for more details.
+
         Returns
         -------
         Union[List[Union[VersionedItem, DataError]], LazyDataFrameCollection]
@@ -1761,7 +2446,9 @@ class Library:
                     " [ReadRequest] are supported."
                 )
         throw_on_error = False
+        output_format = _resolve_output_format(output_format)
         if lazy:
+            check(output_format == OutputFormat.PANDAS, "output_format {} cannot be used with lazy=True", output_format)
             lazy_dataframes = []
             for idx in range(len(symbol_strings)):
                 q = copy.deepcopy(query_builder)
@@ -1792,6 +2479,7 @@ class Library:
                 throw_on_error,
                 implement_read_index=True,
                 iterate_snapshots_if_tombstoned=False,
+                output_format=output_format,
             )
 
     def read_metadata(self, symbol: str, as_of: Optional[AsOf] = None) -> VersionedItem:
@@ -2438,6 +3126,60 @@ class Library:
         """
         return self._nvs.compact_symbol_list()
 
+    def set_result_cache_size(self, max_bytes: int) -> None:
+        """
+        Enable, resize, or disable an in-process cache of `read` results, for workloads that repeatedly run the same
+        query against the same version of a symbol.
+
+        Results are cached against the version read, together with all of the other arguments passed to `read`, so a
+        cached result is only returned for an identical query against the same version. `as_of` is still resolved to a
+        version on every read, so reading the latest version returns new data as soon as it is written. Each hit
+        returns a copy of the cached data. Only reads returning pandas objects are cached, and the cache is not shared
+        between `Library` instances or processes.
+
+        Parameters
+        ----------
+        max_bytes : int
+            Maximum total size of the cached results. The least recently used results are evicted to stay within this
+            limit. 0 disables the cache and drops its contents.
+
+        Examples
+        --------
+
+        >>> lib.set_result_cache_size(512 * 1024 ** 2)
+        >>> df = lib.read("prices", columns=["close"]).data  # read from storage
+        >>> df = lib.read("prices", columns=["close"]).data  # returned from the cache
+        >>> lib.result_cache_stats()
+        ResultCacheStats(hits=1, misses=1, evictions=0, entries=1, bytes=...)
+        """
+        self._nvs.set_result_cache_size(max_bytes)
+
+    def result_cache_stats(self):
+        """
+        Statistics for the cache enabled with `set_result_cache_size`.
+
+        Returns
+        -------
+        Optional[ResultCacheStats]
+            Object with hits, misses, evictions, entries, and bytes attributes, or None if the cache is not enabled.
+        """
+        return self._nvs.result_cache_stats()
+
+    def local_cache_stats(self):
+        """
+        Statistics for the cache on local disk enabled with the `local_cache` option of the URI, for example
+        ``s3://endpoint:bucket?local_cache=/mnt/ssd/arcticdb&local_cache_size=107374182400``. Data, index, and version
+        objects read from the storage are cached, and the cache is shared by every library using the same directory
+        in the process.
+
+        Returns
+        -------
+        Optional[ResultCacheStats]
+            Object with hits, misses, evictions, entries, and bytes attributes, or None if the library has no local
+            cache.
+        """
+        return self._nvs.local_cache_stats()
+
     def is_symbol_fragmented(self, symbol: str, segment_size: Optional[int] = None) -> bool:
         """
         Check whether the number of segments that would be reduced by compaction is more than or equal to the
@@ -15,7 +15,7 @@ import numpy as np
 import pandas as pd
 from pandas.tseries.frequencies import to_offset
 
-from typing import Dict, NamedTuple, Optional, Tuple, Union
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
 
 from arcticdb.exceptions import ArcticDbNotYetImplemented, ArcticNativeException, UserInputException
 from arcticdb.version_store._normalization import normalize_dt_range_to_ts
@@ -31,6 +31,7 @@ from arcticdb_ext.version_store import AggregationClause as _AggregationClause
 from arcticdb_ext.version_store import ResampleClauseLeftClosed as _ResampleClauseLeftClosed
 from arcticdb_ext.version_store import ResampleClauseRightClosed as _ResampleClauseRightClosed
 from arcticdb_ext.version_store import ResampleBoundary as _ResampleBoundary
+from arcticdb_ext.version_store import WindowClause as _WindowClause
 from arcticdb_ext.version_store import RowRangeClause as _RowRangeClause
 from arcticdb_ext.version_store import DateRangeClause as _DateRangeClause
 from arcticdb_ext.version_store import RowRangeType as _RowRangeType
@@ -67,14 +68,17 @@ class ExpressionNode:
 
     def __init__(self):
         self.left = self.right = self.operator = None
+        # Only set for ternary operations
+        self.condition = None
         self.name = None
 
     @classmethod
-    def compose(cls, left, operator, right):
+    def compose(cls, left, operator, right, condition=None):
         output = cls()
         output.left = left
         output.operator = operator
         output.right = right
+        output.condition = condition
         return output
 
     @classmethod
@@ -82,7 +86,7 @@ class ExpressionNode:
         return cls.compose(left, COLUMN, None)
 
     def _apply(self, right, operator):
-        left = ExpressionNode.compose(self.left, self.operator, self.right)
+        left = ExpressionNode.compose(self.left, self.operator, self.right, self.condition)
         self = ExpressionNode()
         self.left = left
         self.operator = operator
@@ -90,7 +94,7 @@ class ExpressionNode:
         return self
 
     def _rapply(self, left, operator):
-        right = ExpressionNode.compose(self.left, self.operator, self.right)
+        right = ExpressionNode.compose(self.left, self.operator, self.right, self.condition)
         self = ExpressionNode()
         self.right = right
         self.operator = operator
@@ -118,6 +122,9 @@ class ExpressionNode:
     def __truediv__(self, right):
         return self._apply(right, _OperationType.DIV)
 
+    def __pow__(self, right):
+        return self._apply(right, _OperationType.POW)
+
     def __eq__(self, right):
         if is_supported_sequence(right):
             return self.isin(right)
@@ -178,6 +185,9 @@ class ExpressionNode:
     def __rtruediv__(self, left):
         return self._rapply(left, _OperationType.DIV)
 
+    def __rpow__(self, left):
+        return self._rapply(left, _OperationType.POW)
+
     def __rand__(self, left):
         if left is True:
             return self
@@ -228,6 +238,62 @@ class ExpressionNode:
     def notnull(self):
         return ExpressionNode.compose(self, _OperationType.NOTNULL, None)
 
+    def startswith(self, prefix: str):
+        return self._apply(_string_argument(prefix, "startswith"), _OperationType.STARTSWITH)
+
+    def endswith(self, suffix: str):
+        return self._apply(_string_argument(suffix, "endswith"), _OperationType.ENDSWITH)
+
+    def contains(self, substring: str):
+        return self._apply(_string_argument(substring, "contains"), _OperationType.CONTAINS)
+
+    def regex_match(self, pattern: str):
+        return self._apply(_string_argument(pattern, "regex_match"), _OperationType.REGEX_MATCH)
+
+    def str_len(self):
+        return ExpressionNode.compose(self, _OperationType.STR_LEN, None)
+
+    @property
+    def dt(self):
+        return _DatetimeAccessor(self)
+
+    def log(self):
+        return ExpressionNode.compose(self, _OperationType.LOG, None)
+
+    def exp(self):
+        return ExpressionNode.compose(self, _OperationType.EXP, None)
+
+    def sqrt(self):
+        return ExpressionNode.compose(self, _OperationType.SQRT, None)
+
+    def round(self, decimals: int = 0):
+        if not isinstance(decimals, (int, np.integer)) or isinstance(decimals, bool):
+            raise UserInputException(f"round expects an integer number of decimals, received {type(decimals).__name__}")
+        return self._apply(int(decimals), _OperationType.ROUND)
+
+    def __round__(self, ndigits=None):
+        return self.round(0 if ndigits is None else ndigits)
+
+    def astype(self, dtype):
+        dtype = np.dtype(dtype)
+        if dtype.kind not in "biuf":
+            raise UserInputException(f"astype only supports numeric and boolean types, received {dtype}")
+        return self._apply(dtype, _OperationType.CAST)
+
+    def fillna(self, value):
+        return where(self.notnull(), self, value)
+
+    def clip(self, lower=None, upper=None):
+        if lower is None and upper is None:
+            raise UserInputException("clip requires at least one of lower and upper")
+        # NaNs fail both comparisons, so are left as they are as in pandas
+        output = self
+        if upper is not None:
+            output = where(self > upper, upper, output)
+        if lower is not None:
+            output = where(self < lower, lower, output)
+        return output
+
     def __str__(self):
         return self.get_name()
 
@@ -235,8 +301,12 @@ class ExpressionNode:
         if not self.name:
             if self.operator == COLUMN:
                 self.name = 'Column["{}"]'.format(self.left)
-            elif self.operator in [_OperationType.ABS, _OperationType.NEG, _OperationType.NOT]:
+            elif self.operator in _UNARY_OPERATIONS:
                 self.name = "{}({})".format(self.operator.name, self.left)
+            elif self.operator == _OperationType.WHERE:
+                self.name = "{}({}, {}, {})".format(
+                    self.operator.name, _child_name(self.condition), _child_name(self.left), _child_name(self.right)
+                )
             else:
                 if isinstance(self.left, ExpressionNode):
                     left = str(self.left)
@@ -250,6 +320,121 @@ class ExpressionNode:
         return self.name
 
 
+_UNARY_OPERATIONS = [
+    _OperationType.ABS,
+    _OperationType.NEG,
+    _OperationType.NOT,
+    _OperationType.STR_LEN,
+    _OperationType.DT_YEAR,
+    _OperationType.DT_MONTH,
+    _OperationType.DT_DAY,
+    _OperationType.DT_HOUR,
+    _OperationType.DT_MINUTE,
+    _OperationType.DT_SECOND,
+    _OperationType.DT_DAYOFWEEK,
+    _OperationType.DT_DATE,
+    _OperationType.LOG,
+    _OperationType.EXP,
+    _OperationType.SQRT,
+]
+
+
+def _child_name(child):
+    return str(child) if isinstance(child, ExpressionNode) else to_string(child)
+
+
+def where(condition, left, right):
+    """
+    Choose row by row between two expressions, columns, or values, similar to numpy.where.
+
+    Parameters
+    ----------
+    condition: `ExpressionNode`
+        Boolean expression or column selecting left where it holds, and right where it does not.
+    left:
+        Expression, column, or value to take where the condition holds.
+    right:
+        Expression, column, or value to take where the condition does not hold.
+
+    Returns
+    -------
+    ExpressionNode
+        For use in QueryBuilder filters and projections.
+
+    Examples
+    --------
+
+    >>> q = adb.QueryBuilder()
+    >>> q = q.apply("capped", where(q["signal"] > 1, 1, q["signal"]))
+    """
+    if isinstance(condition, bool):
+        raise UserInputException("where expects an expression as its condition, received {}".format(condition))
+    return ExpressionNode.compose(left, _OperationType.WHERE, right, condition)
+
+
+class _DatetimeAccessor:
+    """
+    Datetime components and rounding of a timestamp column, mirroring the pandas Series.dt accessor. All operations are
+    performed in UTC.
+    """
+
+    def __init__(self, node):
+        self._node = node
+
+    def _component(self, operator):
+        return ExpressionNode.compose(self._node, operator, None)
+
+    def _round(self, freq, operator):
+        frequency = nanoseconds_timedelta(freq)
+        if frequency <= 0:
+            raise UserInputException(f"Datetime rounding frequency must be positive, received {freq}")
+        return self._node._apply(np.int64(frequency), operator)
+
+    @property
+    def year(self):
+        return self._component(_OperationType.DT_YEAR)
+
+    @property
+    def month(self):
+        return self._component(_OperationType.DT_MONTH)
+
+    @property
+    def day(self):
+        return self._component(_OperationType.DT_DAY)
+
+    @property
+    def hour(self):
+        return self._component(_OperationType.DT_HOUR)
+
+    @property
+    def minute(self):
+        return self._component(_OperationType.DT_MINUTE)
+
+    @property
+    def second(self):
+        return self._component(_OperationType.DT_SECOND)
+
+    @property
+    def dayofweek(self):
+        return self._component(_OperationType.DT_DAYOFWEEK)
+
+    @property
+    def date(self):
+        return self._component(_OperationType.DT_DATE)
+
+    def floor(self, freq: Union[str, pd.Timedelta, datetime.timedelta]):
+        return self._round(freq, _OperationType.DT_FLOOR)
+
+    def ceil(self, freq: Union[str, pd.Timedelta, datetime.timedelta]):
+        return self._round(freq, _OperationType.DT_CEIL)
+
+
+def _string_argument(value, operation):
+    if not isinstance(value, str):
+        raise UserInputException(f"{operation} expects a string argument, received {type(value).__name__}")
+    return value
+
+
 def is_supported_sequence(obj):
     return isinstance(obj, (list, set, frozenset, tuple, np.ndarray))
 
@@ -297,6 +482,20 @@ def value_list_from_args(*args):
     return value_list
 
 
+def _to_grouping_columns(name: Union[str, List[str]]) -> List[str]:
+    grouping_columns = [name] if isinstance(name, str) else list(name)
+    check(len(grouping_columns) > 0, "GroupBy requires at least one grouping column")
+    check(
+        all(isinstance(column, str) for column in grouping_columns),
+        f"GroupBy column names expected to be strings, received {grouping_columns}",
+    )
+    check(
+        len(set(grouping_columns)) == len(grouping_columns),
+        f"GroupBy columns must be unique, received {grouping_columns}",
+    )
+    return grouping_columns
+
+
 # These are just used for shallow/deep copying, pickling, and equality checks
 PythonFilterClause = namedtuple("PythonFilterClause", ["expr"])
 PythonProjectionClause = namedtuple("PythonProjectionClause", ["name", "expr"])
@@ -323,6 +522,36 @@ class PythonResampleClause:
     origin: Union[str, pd.Timestamp] = "epoch"
 
 
+@dataclass
+class PythonWindowClause:
+    # One of "rows", "time", "expanding", or "ewm"
+    window_type: str
+    # Number of rows for "rows" windows, nanoseconds for "time" windows
+    window: int = 0
+    min_periods: int = 0
+    alpha: float = 0.0
+    adjust: bool = True
+    aggregations: Dict[str, Union[str, Tuple[str, str]]] = None
+
+
+def _window_clause(python_clause: PythonWindowClause):
+    if python_clause.window_type == "rows":
+        return _WindowClause.rolling_rows(python_clause.window, python_clause.min_periods)
+    elif python_clause.window_type == "time":
+        return _WindowClause.rolling_time(python_clause.window, python_clause.min_periods)
+    elif python_clause.window_type == "expanding":
+        return _WindowClause.expanding(python_clause.min_periods)
+    else:
+        return _WindowClause.ewm(python_clause.alpha, python_clause.min_periods, python_clause.adjust)
+
+
+def _check_min_periods(min_periods):
+    check(
+        isinstance(min_periods, (int, np.integer)) and not isinstance(min_periods, bool) and min_periods >= 0,
+        f"min_periods must be a non-negative integer, received {min_periods}",
+    )
+
+
 class QueryBuilder:
     """
     Build a query to process read results with. Syntax is designed to be similar to Pandas:
@@ -336,8 +565,20 @@ class QueryBuilder:
 
     Supported arithmetic operations when projection or filtering:
 
-    * Binary arithmetic: +, -, *, /
+    * Binary arithmetic: +, -, *, /, ** (always producing float64)
     * Unary arithmetic: -, abs
+    * Math functions: log, exp, and sqrt (integers produce float64, floats keep their type), and round(decimals) (which
+    rounds half to even as in numpy, and keeps the type of its input)
+    * Casts: astype with a numeric or boolean type. Casting a column containing NaN to an integer type raises.
+    * Conditionals: where(condition, left, right) takes left where the boolean expression condition holds and right
+    where it does not, each of which may be a column, expression, or value. fillna(value) and clip(lower, upper) are
+    built on where, and leave NaN as it is in the same way as pandas. These are supported for numeric, boolean, and
+    timestamp columns only. For example:
+        ```
+        q = q.apply("log_return", (q["close"] / q["open"]).log())
+        q = q.apply("capped", q["signal"].clip(-3, 3))
+        q = q.apply("side", where(q["qty"] > 0, 1, -1))
+        ```
 
     Supported filtering operations:
 
@@ -352,6 +593,17 @@ class QueryBuilder:
     * Unary NOT: ~
     * Binary combinators: &, |, ^
     * List membership: isin, isnotin (also accessible with == and !=)
+    * String matching: startswith, endswith, contains, and regex_match. regex_match uses Perl-compatible regular
+    expressions and matches anywhere in the string unless anchored with ^ or $. Missing strings never match. For
+    example:
+        ```
+        q = q[q["symbol"].startswith("AAPL")]
+        ```
+
+    String lengths (in characters) are available with str_len, which gives NaN for missing strings as in pandas, and can
+    be filtered on or projected:
+
+        q = q[q["symbol"].str_len() > 4]
 
     isin/isnotin accept lists, sets, frozensets, 1D ndarrays, or *args unpacking. For example:
 
@@ -383,6 +635,19 @@ class QueryBuilder:
     Note that internally all of these types are converted to nanoseconds (since epoch in the Timestamp/datetime
     cases). This means that nonsensical operations such as multiplying two times together are permitted (but not
     encouraged).
+
+    Timestamp columns, including the index (referred to by its name, or "index" if it is unnamed), have a dt accessor
+    similar to the pandas one, evaluated in UTC. year, month, day, hour, minute, second and dayofweek (Monday=0) give
+    integer columns, date gives the timestamp of the start of the day, and floor/ceil round to a frequency:
+
+        q = q[(q["index"].dt.hour >= 9) & (q["index"].dt.hour < 17) & (q["index"].dt.dayofweek < 5)]
+        q = q.apply("bucket", q["index"].dt.floor("15min"))
+
+    Adding or subtracting a timedelta to a timestamp column gives a timestamp column, whereas subtracting one timestamp
+    column from another gives the difference as integer nanoseconds. Grouping on a datetime component is done by
+    projecting it first:
+
+        q = q.apply("hour", q["index"].dt.hour).groupby("hour").agg({"price": "mean"})
     #Restrictions
     String equality/inequality (and isin/isnotin) is supported for printable ASCII characters only.
     Although not prohibited, it is not recommended to use ==, !=, isin, or isnotin with floating point values.
@@ -458,23 +723,33 @@ class QueryBuilder:
         self._python_clauses = self._python_clauses + [PythonProjectionClause(name, expr)]
         return self
 
-    def groupby(self, name: str):
+    def groupby(self, name: Union[str, List[str]]):
         """
-        Group symbol by column name. GroupBy operations must be followed by an aggregation operator. Currently the following five aggregation
-        operators are supported:
+        Group symbol by one or more columns. GroupBy operations must be followed by an aggregation operator. Currently
+        the following aggregation operators are supported:
 
         * "mean" - compute the mean of the group
         * "sum" - compute the sum of the group
         * "min" - compute the min of the group
         * "max" - compute the max of the group
         * "count" - compute the count of group
+        * "std" - compute the sample standard deviation of the group
+        * "var" - compute the sample variance of the group
+        * "sum_of_squares" - compute the sum of the squares of the values in the group
+        * "nunique" - compute the number of distinct values in the group
+        * "median" - compute the median of the group
+        * "quantile(q)" - compute the q-th quantile of the group, with q between 0 and 1 (e.g. "quantile(0.9)"),
+          linearly interpolating between values as Pandas does
+
+        Rows with a missing value in any of the grouping columns are dropped, as with Pandas' default ``dropna=True``.
+        Grouping on more than one column produces a result with a MultiIndex, with one level per grouping column.
 
         For usage examples, see below.
 
         Parameters
         ----------
-        name: `str`
-            Name of the column to group on. Note that currently GroupBy only supports single-column groupings.
+        name: `Union[str, List[str]]`
+            Name of the column to group on, or a list of names of the columns to group on.
 
         Examples
         --------
@@ -551,20 +826,42 @@ class QueryBuilder:
             group_1          1          3  1.666667
             group_2          4          5       2.2
 
+        Standard deviation over two grouping columns:
+
+        >>> df = pd.DataFrame(
+            {
+                "grouping_column_1": ["group_1", "group_1", "group_1", "group_2", "group_2"],
+                "grouping_column_2": [1, 1, 2, 1, 1],
+                "to_std": [1.0, 3.0, 2.5, 4.0, 2.0],
+            },
+            index=np.arange(5),
+        )
+        >>> q = adb.QueryBuilder()
+        >>> q = q.groupby(["grouping_column_1", "grouping_column_2"]).agg({"to_std": "std"})
+        >>> lib.write("symbol", df)
+        >>> lib.read("symbol", query_builder=q).data
+
+                                                 to_std
+            grouping_column_1 grouping_column_2
+            group_1           1                1.414214
+                              2                     NaN
+            group_2           1                1.414214
+
         Returns
         -------
         QueryBuilder
             Modified QueryBuilder object.
         """
-        self.clauses = self.clauses + [_GroupByClause(name)]
+        grouping_columns = _to_grouping_columns(name)
+        self.clauses = self.clauses + [_GroupByClause(grouping_columns)]
         self._python_clauses = self._python_clauses + [PythonGroupByClause(name)]
         return self
 
     def agg(self, aggregations: Dict[str, Union[str, Tuple[str, str]]]):
-        # Only makes sense if previous stage is a group-by or resample
+        # Only makes sense if previous stage is a group-by, resample, or window
         check(
-            len(self.clauses) and isinstance(self.clauses[-1], (_GroupByClause, _ResampleClauseLeftClosed, _ResampleClauseRightClosed)),
-            f"Aggregation only makes sense after groupby or resample",
+            len(self.clauses) and isinstance(self.clauses[-1], (_GroupByClause, _ResampleClauseLeftClosed, _ResampleClauseRightClosed, _WindowClause)),
+            f"Aggregation only makes sense after groupby, resample, rolling, expanding, or ewm",
         )
         for k, v in aggregations.items():
             check(isinstance(v, (str, tuple)), f"Values in agg dict expected to be strings or tuples, received {v} of type {type(v)}")
@@ -578,7 +875,7 @@ class QueryBuilder:
                 aggregations[k] = (v[0], v[1].lower())
 
         if isinstance(self.clauses[-1], _GroupByClause):
-            self.clauses = self.clauses + [_AggregationClause(self.clauses[-1].grouping_column, aggregations)]
+            self.clauses = self.clauses + [_AggregationClause(self.clauses[-1].grouping_columns, aggregations)]
             self._python_clauses = self._python_clauses + [PythonAggregationClause(aggregations)]
         else:
             self.clauses[-1].set_aggregations(aggregations)
@@ -779,6 +1076,181 @@ class QueryBuilder:
         self._python_clauses = self._python_clauses + [PythonResampleClause(rule=rule, closed=boundary_map[closed], label=boundary_map[label], offset=offset_ns, origin=origin)]
         return self
 
+    def rolling(self, window: Union[int, str, pd.Timedelta, datetime.timedelta], min_periods: Optional[int] = None):
+        """
+        Compute aggregations over a rolling window ending at each row. Rolling operations must be followed by an
+        aggregation operator. Unlike groupby and resample, the number of rows and the index are unchanged, and each
+        aggregation is appended to the data as a new float64 column. Currently, the following 5 aggregation operators
+        are supported:
+
+        * "mean" - compute the mean of the window
+        * "sum" - compute the sum of the window
+        * "min" - compute the min of the window
+        * "max" - compute the max of the window
+        * "count" - compute the number of non-NaN values in the window
+
+        Only numeric and bool columns are supported. NaN values are omitted from aggregations, and windows with fewer
+        than min_periods non-NaN values produce NaN, matching Pandas.
+
+        Windows are computed in row-slice order, carrying the state of each window across row-slice boundaries, so
+        the whole history never needs to be materialised in Pandas.
+
+        Parameters
+        ----------
+        window: Union[int, str, pd.Timedelta, datetime.timedelta]
+            If an integer, the number of rows in each window, including the current row. Otherwise, a fixed time
+            offset, such as "5min", and each window covers the index values in (ts - window, ts]. Time-based windows
+            require a sorted timestamp index.
+        min_periods: Optional[int], default=None
+            Minimum number of non-NaN values required in a window to produce a value. Defaults to the window size for
+            row-based windows, and 1 for time-based windows.
+
+        Returns
+        -------
+        QueryBuilder
+            Modified QueryBuilder object.
+
+        Raises
+        -------
+        ArcticNativeException
+            min_periods is not a non-negative integer.
+        UserInputException
+            The window is not a positive integer or fixed time offset, or min_periods is larger than a row-based window.
+        SchemaException
+            Raised on call to read if a column being aggregated is not numeric or bool, or if a time-based window is
+            used with a symbol that is not timestamp indexed.
+
+        Examples
+        --------
+        Rolling 5 minute mean of the column 'price':
+
+        >>> df = pd.DataFrame(
+            {
+                "price": [1.0, 2.0, 3.0, 4.0],
+            },
+            index=pd.date_range("2024-01-01", freq="2min", periods=4),
+        )
+        >>> q = adb.QueryBuilder()
+        >>> q = q.rolling("5min").agg({"price_mean": ("price", "mean")})
+        >>> lib.write("symbol", df)
+        >>> lib.read("symbol", query_builder=q).data
+
+                                 price  price_mean
+            2024-01-01 00:00:00    1.0         1.0
+            2024-01-01 00:02:00    2.0         1.5
+            2024-01-01 00:04:00    3.0         2.0
+            2024-01-01 00:06:00    4.0         3.0
+        """
+        if isinstance(window, (int, np.integer)) and not isinstance(window, bool):
+            min_periods = int(window) if min_periods is None else min_periods
+            _check_min_periods(min_periods)
+            python_clause = PythonWindowClause(window_type="rows", window=int(window), min_periods=int(min_periods))
+        else:
+            try:
+                window_ns = to_offset(window).nanos
+            except (TypeError, ValueError):
+                raise UserInputException(
+                    f"Rolling window must be an integer number of rows or a fixed time offset, received {window}"
+                )
+            min_periods = 1 if min_periods is None else min_periods
+            _check_min_periods(min_periods)
+            python_clause = PythonWindowClause(window_type="time", window=window_ns, min_periods=int(min_periods))
+        self.clauses = self.clauses + [_window_clause(python_clause)]
+        self._python_clauses = self._python_clauses + [python_clause]
+        return self
+
+    def expanding(self, min_periods: int = 1):
+        """
+        Compute aggregations over all of the rows up to and including each row. Supports the same aggregation
+        operators as `rolling`, and must be followed by an aggregation operator.
+
+        Parameters
+        ----------
+        min_periods: int, default=1
+            Minimum number of non-NaN values required in a window to produce a value.
+
+        Returns
+        -------
+        QueryBuilder
+            Modified QueryBuilder object.
+
+        Examples
+        --------
+        >>> q = adb.QueryBuilder()
+        >>> q = q.expanding().agg({"cumulative_volume": ("volume", "sum")})
+        """
+        _check_min_periods(min_periods)
+        python_clause = PythonWindowClause(window_type="expanding", min_periods=int(min_periods))
+        self.clauses = self.clauses + [_window_clause(python_clause)]
+        self._python_clauses = self._python_clauses + [python_clause]
+        return self
+
+    def ewm(
+            self,
+            com: Optional[float] = None,
+            span: Optional[float] = None,
+            halflife: Optional[float] = None,
+            alpha: Optional[float] = None,
+            min_periods: int = 0,
+            adjust: bool = True,
+    ):
+        """
+        Compute exponentially weighted aggregations, matching `pd.DataFrame.ewm` with `ignore_na=False`. Must be
+        followed by an aggregation operator, and only the "mean" aggregation is currently supported. Exactly one of
+        com, span, halflife, and alpha must be provided. halflife is measured in rows, time-based halflives are not
+        currently supported.
+
+        Parameters
+        ----------
+        com: Optional[float], default=None
+            Specify decay in terms of center of mass, alpha = 1 / (1 + com), for com >= 0.
+        span: Optional[float], default=None
+            Specify decay in terms of span, alpha = 2 / (span + 1), for span >= 1.
+        halflife: Optional[float], default=None
+            Specify decay in terms of half-life, alpha = 1 - exp(-ln(2) / halflife), for halflife > 0.
+        alpha: Optional[float], default=None
+            Specify smoothing factor directly, 0 < alpha <= 1.
+        min_periods: int, default=0
+            Minimum number of non-NaN values observed so far required to produce a value.
+        adjust: bool, default=True
+            Divide by decaying adjustment factor in beginning periods to account for imbalance in relative weightings.
+
+        Returns
+        -------
+        QueryBuilder
+            Modified QueryBuilder object.
+
+        Raises
+        -------
+        ArcticNativeException
+            Not exactly one of com, span, halflife, and alpha is provided, or the provided value is out of range.
+
+        Examples
+        --------
+        >>> q = adb.QueryBuilder()
+        >>> q = q.ewm(span=10).agg({"price_ewma": ("price", "mean")})
+        """
+        decay_args = {"com": com, "span": span, "halflife": halflife, "alpha": alpha}
+        provided = [name for name, value in decay_args.items() if value is not None]
+        check(len(provided) == 1, f"ewm requires exactly one of com, span, halflife, and alpha, received {provided}")
+        if com is not None:
+            check(com >= 0, f"ewm com must satisfy com >= 0, received {com}")
+            alpha = 1.0 / (1.0 + com)
+        elif span is not None:
+            check(span >= 1, f"ewm span must satisfy span >= 1, received {span}")
+            alpha = 2.0 / (span + 1.0)
+        elif halflife is not None:
+            check(halflife > 0, f"ewm halflife must satisfy halflife > 0, received {halflife}")
+            alpha = 1.0 - np.exp(np.log(0.5) / halflife)
+        check(0 < alpha <= 1, f"ewm alpha must satisfy 0 < alpha <= 1, received {alpha}")
+        _check_min_periods(min_periods)
+        python_clause = PythonWindowClause(
+            window_type="ewm", min_periods=int(min_periods), alpha=float(alpha), adjust=bool(adjust)
+        )
+        self.clauses = self.clauses + [_window_clause(python_clause)]
+        self._python_clauses = self._python_clauses + [python_clause]
+        return self
+
     # TODO: specify type of other must be QueryBuilder with from __future__ import annotations once only Python 3.7+
     # supported
     def then(self, other):
@@ -948,9 +1420,11 @@ class QueryBuilder:
                 input_columns, expression_context = visit_expression(python_clause.expr)
                 self.clauses = self.clauses + [_ProjectClause(input_columns, python_clause.name, expression_context)]
             elif isinstance(python_clause, PythonGroupByClause):
-                self.clauses = self.clauses + [_GroupByClause(python_clause.name)]
+                self.clauses = self.clauses + [_GroupByClause(_to_grouping_columns(python_clause.name))]
             elif isinstance(python_clause, PythonAggregationClause):
-                self.clauses = self.clauses + [_AggregationClause(self.clauses[-1].grouping_column, python_clause.aggregations)]
+                self.clauses = self.clauses + [
+                    _AggregationClause(self.clauses[-1].grouping_columns, python_clause.aggregations)
+                ]
             elif isinstance(python_clause, PythonResampleClause):
                 if python_clause.closed == _ResampleBoundary.LEFT:
                     self.clauses = self.clauses + [_ResampleClauseLeftClosed(python_clause.rule, python_clause.label, python_clause.offset, python_clause.origin)]
@@ -958,6 +1432,10 @@ class QueryBuilder:
                     self.clauses = self.clauses + [_ResampleClauseRightClosed(python_clause.rule, python_clause.label, python_clause.offset, python_clause.origin)]
                 if python_clause.aggregations is not None:
                     self.clauses[-1].set_aggregations(python_clause.aggregations)
+            elif isinstance(python_clause, PythonWindowClause):
+                self.clauses = self.clauses + [_window_clause(python_clause)]
+                if python_clause.aggregations is not None:
+                    self.clauses[-1].set_aggregations(python_clause.aggregations)
             elif isinstance(python_clause, PythonRowRangeClause):
                 if python_clause.start is not None and python_clause.end is not None:
                     self.clauses = self.clauses + [_RowRangeClause(python_clause.start, python_clause.end)]
@@ -1005,6 +1483,10 @@ CONSTRUCTOR_MAP = {
 
 
 def create_value(value):
+    if isinstance(value, np.dtype):
+        # Cast targets are passed as a value of the type being cast to
+        return ValueBool(False) if value.kind == "b" else CONSTRUCTOR_MAP.get(value.kind).get(value.itemsize)(0)
+
     if value in [inf, -inf]:
         raise ArcticNativeException("Infinite values not supported in queries")
 
@@ -1033,6 +1515,8 @@ def to_string(leaf):
     else:
         if isinstance(leaf, str):
             key = "Str({})".format(leaf)
+        elif isinstance(leaf, np.dtype):
+            key = "Type({})".format(leaf)
         elif isinstance(leaf, bool):
             key = "Bool({})".format(leaf)
         else:
@@ -1074,7 +1558,11 @@ def visit_expression(expr):
             raise ArcticNativeException("Query is trivially {}".format(node))
 
         left = _visit_child(node.left)
-        if node.right is not None:
+        if node.condition is not None:
+            condition = _visit_child(node.condition)
+            right = _visit_child(node.right)
+            expression_node = _ExpressionNode(condition, left, right, node.operator)
+        elif node.right is not None:
             right = _visit_child(node.right)
             expression_node = _ExpressionNode(left, right, node.operator)
         else:
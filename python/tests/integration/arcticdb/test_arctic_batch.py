@@ -24,6 +24,7 @@ from datetime import datetime, date, timedelta
 import numpy as np
 from arcticdb.util.test import (
     assert_frame_equal,
+    config_context,
     distinct_timestamps,
     random_strings_of_length,
     random_floats,
@@ -389,6 +390,30 @@ def test_write_batch(library_factory):
         assert_frame_equal(read_batch_result[sym].data, original_dataframe)
 
 
+@pytest.mark.parametrize("pipeline_bytes", [1, 5000, 2**30])
+def test_write_batch_pipelined(arctic_library, pipeline_bytes):
+    lib = arctic_library
+    dfs = {
+        f"symbol_{idx}": pd.DataFrame(
+            {"col": np.arange(idx, idx + 50, dtype=np.int64), "str": [f"s{i}" for i in range(50)]},
+            index=pd.date_range(datetime(2019, 4, 8), periods=50),
+        )
+        for idx in range(10)
+    }
+    with config_context("VersionStore.BatchWritePipelineBytes", pipeline_bytes):
+        results = lib.write_batch([WritePayload(symbol, df, metadata=symbol) for symbol, df in dfs.items()])
+        pickle_results = lib.write_pickle_batch(
+            [WritePayload("pickled", A("id_1")), WritePayload("symbol_0", dfs["symbol_1"])]
+        )
+    assert [result.symbol for result in results] == list(dfs)
+    assert all(result.version == 0 and result.metadata == result.symbol for result in results)
+    assert [(result.symbol, result.version) for result in pickle_results] == [("pickled", 0), ("symbol_0", 1)]
+    assert lib.read("pickled").data.id == "id_1"
+    assert_frame_equal(lib.read("symbol_0").data, dfs["symbol_1"])
+    for symbol, df in list(dfs.items())[1:]:
+        assert_frame_equal(lib.read(symbol).data, df)
+
+
 def test_write_batch_dedup(library_factory):
     """Should be able to write different size of batch of data reusing deduplicated data from previous versions."""
     lib = library_factory(LibraryOptions(rows_per_segment=10, dedup=True))
@@ -6,6 +6,7 @@ Use of this software is governed by the Business Source License 1.1 included in
 As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
 """
 
+import os
 import re
 import time
 from multiprocessing import Queue, Process
@@ -19,6 +20,7 @@ from arcticdb_ext.storage import NoDataFoundException
 
 from arcticdb_ext import set_config_string
 from arcticdb_ext.storage import KeyType
+from arcticdb import Arctic
 from arcticdb.util.test import create_df, assert_frame_equal
 
 from arcticdb.storage_fixtures.s3 import MotoNfsBackedS3StorageFixtureFactory
@@ -222,3 +224,47 @@ def test_library_get_key_path(lib_name, storage_bucket, test_prefix):
             assert path.startswith(test_prefix)
 
     assert keys_count > 0
+
+
+def test_s3_local_cache(s3_storage, lib_name, tmp_path):
+    stale_temp_file = tmp_path / "0000000000000001-0000000000000001.seg.tmp"
+    stale_temp_file.write_bytes(b"partial")
+    two_hours_ago = time.time() - 2 * 60 * 60
+    os.utime(stale_temp_file, (two_hours_ago, two_hours_ago))
+
+    ac = Arctic(s3_storage.arctic_uri + f"&local_cache={tmp_path}&local_cache_size={1 << 30}")
+    lib = ac.create_library(lib_name)
+    # Left behind by a process that exited while writing it
+    assert not stale_temp_file.exists()
+
+    df = create_df()
+    lib.write("sym", df)
+    lib.write("other", df)
+
+    # Miss: read from the storage and written to the cache
+    assert_frame_equal(lib.read("sym").data, df)
+    stats = lib.local_cache_stats()
+    assert stats.hits == 0
+    assert stats.misses > 0
+    assert stats.entries > 0
+    misses = stats.misses
+    entries = stats.entries
+    assert len(list(tmp_path.glob("*.seg"))) == entries
+
+    # Hit: served from the cache without going to the storage
+    assert_frame_equal(lib.read("sym").data, df)
+    stats = lib.local_cache_stats()
+    assert stats.hits > 0
+    assert stats.misses == misses
+    assert stats.entries == entries
+
+    # Invalidation: deleting the symbol removes its keys from the cache as well as the storage
+    assert_frame_equal(lib.read("other").data, df)
+    entries = lib.local_cache_stats().entries
+    lib.delete("sym")
+    stats = lib.local_cache_stats()
+    assert stats.entries < entries
+    assert len(list(tmp_path.glob("*.seg"))) == stats.entries
+    with pytest.raises(NoDataFoundException):
+        lib.read("sym")
+    assert_frame_equal(lib.read("other").data, df)
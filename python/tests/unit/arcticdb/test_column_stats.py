@@ -9,6 +9,8 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from arcticdb.util.test import config_context
+from arcticdb.version_store.processing import QueryBuilder
 from arcticdb_ext.exceptions import SchemaException, StorageException, UserInputException, InternalException
 from arcticdb_ext.storage import KeyType, NoDataFoundException
 from arcticdb_ext.version_store import NoSuchVersionException
@@ -49,6 +51,14 @@ def assert_stats_equal(received, expected):
     pd.testing.assert_index_equal(received.index, expected.index)
 
 
+def assert_filter_results_equal(expected, received, description):
+    if expected.empty:
+        # dtypes of empty results are not preserved
+        assert received.empty, description
+    else:
+        pd.testing.assert_frame_equal(expected, received, obj=description)
+
+
 def test_column_stats_basic_flow(lmdb_version_store_tiny_segment):
     lib = lmdb_version_store_tiny_segment
     sym = "test_column_stats_basic_flow"
@@ -628,6 +638,152 @@ def test_column_stats_object_deleted_with_index_key(lmdb_version_store):
         clear()
 
 
+def test_column_stats_bloom_filter_and_distinct_creation(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_column_stats_bloom_filter_and_distinct_creation"
+    generate_symbol(lib, sym)
+    column_stats_dict = {"col_0": {"BLOOM_FILTER", "DISTINCT"}, "col_1": {"MINMAX", "BLOOM_FILTER"}}
+    lib.create_column_stats(sym, column_stats_dict)
+    assert lib.get_column_stats_info(sym) == column_stats_dict
+
+    column_stats = lib.read_column_stats(sym)
+    assert len(column_stats) == 2
+    for column in ["v1.0_BLOOM_FILTER(col_0)", "v1.0_DISTINCT(col_0)", "v1.0_BLOOM_FILTER(col_1)"]:
+        assert column in column_stats.columns
+    # Each row-slice contains two distinct values, each stored as a 16 character hash
+    assert all(len(distinct) == 32 for distinct in column_stats["v1.0_DISTINCT(col_0)"])
+    assert column_stats["v1.0_BLOOM_FILTER(col_0)"].iloc[0] != column_stats["v1.0_BLOOM_FILTER(col_0)"].iloc[1]
+
+    lib.drop_column_stats(sym, {"col_0": {"DISTINCT"}})
+    assert lib.get_column_stats_info(sym) == {"col_0": {"BLOOM_FILTER"}, "col_1": {"MINMAX", "BLOOM_FILTER"}}
+
+
+@pytest.mark.parametrize("stat_type", ["BLOOM_FILTER", "DISTINCT"])
+def test_column_stats_membership_filtering(lmdb_version_store_tiny_segment, stat_type):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_column_stats_membership_filtering"
+    df = pd.DataFrame(
+        {
+            "col_0": [f"{i // 2}" for i in range(10)],
+            "col_1": np.arange(10, dtype=np.int64),
+            "col_2": np.arange(10, dtype=np.float64) / 2,
+        },
+        index=pd.date_range("2000-01-01", periods=10),
+    )
+    lib.write(sym, df)
+    lib.create_column_stats(sym, {"col_0": {stat_type}, "col_1": {stat_type}, "col_2": {stat_type}})
+
+    queries = [
+        ("col_0 == '2'", lambda q: q[q["col_0"] == "2"]),
+        ("col_0 isin", lambda q: q[q["col_0"].isin(["1", "4", "not present"])]),
+        ("col_1 == 3.0", lambda q: q[q["col_1"] == 3.0]),
+        ("col_1 isin", lambda q: q[q["col_1"].isin([0, 9])]),
+        ("col_2 == 1", lambda q: q[q["col_2"] == 1]),
+        ("empty result", lambda q: q[q["col_0"] == "not present"]),
+        ("or", lambda q: q[(q["col_0"] == "0") | (q["col_1"] == 9)]),
+        ("and", lambda q: q[(q["col_0"] == "0") & (q["col_1"] == 9)]),
+        ("not", lambda q: q[~(q["col_0"] == "0")]),
+    ]
+    for description, query in queries:
+        expected = query(df)
+        received = lib.read(sym, query_builder=query(QueryBuilder())).data
+        with config_context("ColumnStats.UseForFiltering", 0):
+            received_without_stats = lib.read(sym, query_builder=query(QueryBuilder())).data
+        assert_filter_results_equal(expected, received, description)
+        assert_filter_results_equal(received_without_stats, received, description)
+
+
+def test_column_stats_distinct_too_many_values(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_column_stats_distinct_too_many_values"
+    df = pd.DataFrame({"col_0": ["a", "b", "c", "c"]}, index=pd.date_range("2000-01-01", periods=4))
+    lib.write(sym, df)
+    with config_context("ColumnStats.MaxDistinctValues", 1):
+        lib.create_column_stats(sym, {"col_0": {"DISTINCT"}})
+    column_stats = lib.read_column_stats(sym)
+    # The first row-slice has too many distinct values, so the stat is not stored
+    assert column_stats["v1.0_DISTINCT(col_0)"].iloc[0] is None
+    assert len(column_stats["v1.0_DISTINCT(col_0)"].iloc[1]) == 16
+    q = QueryBuilder()
+    q = q[q["col_0"].isin(["a", "c"])]
+    pd.testing.assert_frame_equal(df.iloc[[0, 2, 3]], lib.read(sym, query_builder=q).data)
+
+
+def test_column_stats_minmax_filtering(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_column_stats_minmax_filtering"
+    # Tiny segment has 2 rows per segment, so 5 row-slices with col_1 ranges [0, 1], [2, 3], ... [8, 9]
+    df = pd.DataFrame(
+        {
+            "col_1": np.arange(10, dtype=np.int64),
+            "col_2": np.arange(10, dtype=np.float64),
+            "col_3": np.arange(10, dtype=np.uint8),
+        },
+        index=pd.date_range("2000-01-01", periods=10),
+    )
+    lib.write(sym, df)
+    lib.create_column_stats(sym, {"col_1": {"MINMAX"}, "col_2": {"MINMAX"}, "col_3": {"MINMAX"}})
+
+    queries = [
+        ("col_1 < 3", lambda q: q[q["col_1"] < 3], 3),
+        ("col_1 <= 3", lambda q: q[q["col_1"] <= 3], 3),
+        ("col_1 > 7", lambda q: q[q["col_1"] > 7], 4),
+        ("col_1 >= 7", lambda q: q[q["col_1"] >= 7], 3),
+        ("col_1 == 5", lambda q: q[q["col_1"] == 5], 4),
+        ("5 == col_1", lambda q: q[5 == q["col_1"]], 4),
+        ("col_1 != 5", lambda q: q[q["col_1"] != 5], 0),
+        ("col_1 between", lambda q: q[(q["col_1"] >= 4) & (q["col_1"] < 6)], 4),
+        ("col_1 outside", lambda q: q[(q["col_1"] < 2) | (q["col_1"] > 7)], 3),
+        ("col_1 not", lambda q: q[~(q["col_1"] >= 2)], 4),
+        ("col_1 not between", lambda q: q[~((q["col_1"] >= 2) & (q["col_1"] <= 7))], 3),
+        ("col_1 float value", lambda q: q[q["col_1"] > 7.5], 4),
+        ("col_2 < 3", lambda q: q[q["col_2"] < 3], 3),
+        ("col_2 not", lambda q: q[~(q["col_2"] >= 2)], 0),
+        ("col_3 negative", lambda q: q[q["col_3"] > -1], 0),
+        ("col_3 < 2", lambda q: q[q["col_3"] < 2], 4),
+        ("mixed", lambda q: q[(q["col_1"] < 2) & (q["col_3"] > 0)], 4),
+        ("empty", lambda q: q[q["col_1"] > 100], 5),
+    ]
+    for description, query, expected_segments_skipped in queries:
+        expected = query(df)
+        vit = lib.read(sym, query_builder=query(QueryBuilder()))
+        with config_context("ColumnStats.UseForFiltering", 0):
+            vit_without_stats = lib.read(sym, query_builder=query(QueryBuilder()))
+        assert_filter_results_equal(expected, vit.data, description)
+        assert_filter_results_equal(vit_without_stats.data, vit.data, description)
+        assert vit.segments_skipped == expected_segments_skipped, description
+        assert vit_without_stats.segments_skipped == 0
+
+
+def test_column_stats_minmax_filtering_nans(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_column_stats_minmax_filtering_nans"
+    df = pd.DataFrame({"col": [1.0, np.nan, np.nan, 2.0]}, index=pd.date_range("2000-01-01", periods=4))
+    lib.write(sym, df)
+    lib.create_column_stats(sym, {"col": {"MINMAX"}})
+    for query in [
+        lambda q: q[q["col"] != 1.0],
+        lambda q: q[~(q["col"] < 5)],
+        lambda q: q[~(q["col"] == 1.0)],
+    ]:
+        pd.testing.assert_frame_equal(query(df), lib.read(sym, query_builder=query(QueryBuilder())).data)
+
+
+def test_column_stats_minmax_filtering_stats_dropped(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_column_stats_minmax_filtering_stats_dropped"
+    df = pd.DataFrame({"col": np.arange(10, dtype=np.int64)}, index=pd.date_range("2000-01-01", periods=10))
+    lib.write(sym, df)
+    lib.create_column_stats(sym, {"col": {"MINMAX"}})
+    q = QueryBuilder()
+    q = q[q["col"] < 3]
+    assert lib.read(sym, query_builder=q).segments_skipped == 3
+    lib.drop_column_stats(sym)
+    vit = lib.read(sym, query_builder=q)
+    pd.testing.assert_frame_equal(df[df["col"] < 3], vit.data)
+    assert vit.segments_skipped == 0
+
+
 @pytest.mark.xfail(
     reason=(
         "ArcticDB/issues/230 This test can be folded in with test_column_stats_object_deleted_with_index_key once the"
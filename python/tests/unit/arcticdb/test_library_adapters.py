@@ -103,3 +103,23 @@ def test_gcp_path_prefix():
     adapter = GCPXMLLibraryAdapter("gcpxml://my_endpoint:my_bucket?aws_auth=true&path_prefix=my_prefix",
                                encoding_version=EncodingVersion.V1)
     assert adapter.path_prefix == "my_prefix"
+
+
+def test_s3_local_cache():
+    adapter = S3LibraryAdapter("s3://my_endpoint:my_bucket?aws_auth=true&local_cache=/tmp/cache&local_cache_size=1024",
+                               encoding_version=EncodingVersion.V1)
+    assert adapter._query_params.local_cache == "/tmp/cache"
+    assert adapter._query_params.local_cache_size == 1024
+    adapter.get_storage_override()
+
+
+def test_mongo_local_cache_options_removed_from_uri():
+    from arcticdb.adapters.mongo_library_adapter import _extract_local_cache_options
+
+    uri, options = _extract_local_cache_options("mongodb://host:27017/db?local_cache=/tmp/cache&w=1&local_cache_size=1024")
+    assert uri == "mongodb://host:27017/db?w=1"
+    assert options == {"local_cache": "/tmp/cache", "local_cache_size": "1024"}
+
+    uri, options = _extract_local_cache_options("mongodb://host:27017/db?local_cache=/tmp/cache")
+    assert uri == "mongodb://host:27017/db"
+    assert options == {"local_cache": "/tmp/cache"}
@@ -11,7 +11,7 @@ import pandas as pd
 from pandas import DataFrame
 
 from arcticdb.version_store.processing import QueryBuilder
-from arcticdb_ext.exceptions import InternalException, SchemaException
+from arcticdb_ext.exceptions import InternalException, SchemaException, UserInputException
 from arcticdb.util.test import assert_frame_equal, generic_aggregation_test, make_dynamic
 
 
@@ -26,6 +26,59 @@ def test_group_on_float_column_with_nans(lmdb_version_store_v1):
     generic_aggregation_test(lib, symbol, df, "grouping_column", {"agg_column": "sum"})
 
 
+def test_group_on_categorical_column(lmdb_version_store_v1):
+    lib = lmdb_version_store_v1
+    symbol = "test_group_on_categorical_column"
+    df = pd.DataFrame({"grouping_column": ["b", "a", "b", "c", "a"], "agg_column": [1, 2, 3, 4, 5]})
+    df["grouping_column"] = df["grouping_column"].astype("category")
+    lib.write(symbol, df)
+    q = QueryBuilder()
+    q = q.groupby("grouping_column").agg({"agg_column": "sum"})
+    received = lib.read(symbol, query_builder=q).data
+    received.sort_index(inplace=True)
+    expected = df.groupby("grouping_column", observed=True).agg({"agg_column": "sum"})
+    assert_frame_equal(expected, received, check_dtype=False, check_index_type=False)
+    assert list(received.index) == ["a", "b", "c"]
+
+
+@pytest.mark.parametrize("grouping_columns", (["grouping_column", "other"], ["other", "grouping_column"]))
+def test_group_on_categorical_and_other_column(lmdb_version_store_v1, grouping_columns):
+    lib = lmdb_version_store_v1
+    symbol = "test_group_on_categorical_and_other_column"
+    df = pd.DataFrame(
+        {
+            "grouping_column": ["b", "a", "b", "c", "a", "b"],
+            "other": [1, 1, 2, 1, 1, 1],
+            "agg_column": [1, 2, 3, 4, 5, 6],
+        }
+    )
+    df["grouping_column"] = df["grouping_column"].astype("category")
+    lib.write(symbol, df)
+    q = QueryBuilder()
+    q = q.groupby(grouping_columns).agg({"agg_column": "sum"})
+    received = lib.read(symbol, query_builder=q).data
+    received.sort_index(inplace=True)
+    expected = df.groupby(grouping_columns, observed=True).agg({"agg_column": "sum"})
+    assert list(received.index.names) == grouping_columns
+    assert list(received.index) == list(expected.index)
+    assert list(received["agg_column"]) == list(expected["agg_column"])
+    level = grouping_columns.index("grouping_column")
+    assert list(received.index.get_level_values(level).categories) == ["a", "b", "c"]
+
+
+def test_group_on_datetime_component(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    symbol = "test_group_on_datetime_component"
+    df = pd.DataFrame({"agg_column": np.arange(50, dtype=np.float64)}, index=pd.date_range("2024-01-01", periods=50, freq="47min"))
+    lib.write(symbol, df)
+    q = QueryBuilder()
+    q = q.apply("hour", q["index"].dt.hour).groupby("hour").agg({"agg_column": "mean"})
+    received = lib.read(symbol, query_builder=q).data
+    received.sort_index(inplace=True)
+    expected = df.groupby(df.index.hour.rename("hour")).agg({"agg_column": "mean"})
+    assert_frame_equal(expected, received, check_dtype=False, check_index_type=False)
+
+
 # TODO: Add first and last once un-feature flagged
 @pytest.mark.parametrize("aggregator", ("sum", "min", "max", "mean", "count"))
 def test_aggregate_float_columns_with_nans(lmdb_version_store_v1, aggregator):
@@ -260,6 +313,136 @@ def test_group_column_splitting_strings(lmdb_version_store_tiny_segment):
     )
 
 
+def test_group_multiple_columns(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    symbol = "test_group_multiple_columns"
+    df = DataFrame(
+        {
+            "grouping_column_1": [
+                "group_1", "group_1", "group_2", "group_2", "group_1", "group_2", "group_1", "group_1"
+            ],
+            "grouping_column_2": [1, 2, 1, 2, 1, 1, 2, 3],
+            "to_sum": [1, 2, 3, 4, 5, 6, 7, 8],
+            "to_mean": [1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5],
+        }
+    )
+    lib.write(symbol, df)
+    grouping_columns = ["grouping_column_1", "grouping_column_2"]
+    generic_aggregation_test(lib, symbol, df, grouping_columns, {"to_sum": "sum", "to_mean": "mean"})
+    q = QueryBuilder().groupby(grouping_columns).agg({"to_sum": "sum"})
+    received = lib.read(symbol, query_builder=q).data
+    assert list(received.index.names) == ["grouping_column_1", "grouping_column_2"]
+
+
+def test_group_multiple_columns_with_missing_values(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    symbol = "test_group_multiple_columns_with_missing_values"
+    df = DataFrame(
+        {
+            "grouping_column_1": ["group_1", None, "group_2", "group_2", "group_1", np.nan, "group_1"],
+            "grouping_column_2": [1.0, 2.0, np.nan, 2.0, 1.0, 1.0, 2.0],
+            "to_count": [1, 2, 3, 4, 5, 6, 7],
+        }
+    )
+    lib.write(symbol, df)
+    generic_aggregation_test(lib, symbol, df, ["grouping_column_1", "grouping_column_2"], {"to_count": "count"})
+
+
+@pytest.mark.parametrize("aggregator", ("std", "var", "nunique", "median"))
+def test_aggregate_moments_and_order_statistics(lmdb_version_store_tiny_segment, aggregator):
+    lib = lmdb_version_store_tiny_segment
+    symbol = "test_aggregate_moments_and_order_statistics"
+    df = DataFrame(
+        {
+            "grouping_column": ["group_1", "group_2", "group_1", "group_3", "group_1", "group_2", "group_1", "group_2"],
+            "agg_column": [1.0, np.nan, 2.5, 4.0, 2.5, 7.0, -3.0, 1.0],
+        }
+    )
+    lib.write(symbol, df)
+    generic_aggregation_test(lib, symbol, df, "grouping_column", {"agg_column": aggregator})
+
+
+def test_nunique_aggregation_strings(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    symbol = "test_nunique_aggregation_strings"
+    df = DataFrame(
+        {
+            "grouping_column": [1, 1, 2, 1, 2, 1, 2],
+            "to_nunique": ["a", "b", "a", "a", None, "c", "a"],
+        }
+    )
+    lib.write(symbol, df)
+    generic_aggregation_test(lib, symbol, df, "grouping_column", {"to_nunique": "nunique"})
+
+
+@pytest.mark.parametrize("dtype", (np.int64, np.uint64))
+def test_nunique_aggregation_large_integers(lmdb_version_store_tiny_segment, dtype):
+    lib = lmdb_version_store_tiny_segment
+    symbol = "test_nunique_aggregation_large_integers"
+    # Consecutive integers above 2^53 are not distinct as doubles
+    df = DataFrame(
+        {
+            "grouping_column": [1, 1, 2, 1, 2, 2],
+            "to_nunique": np.array([2**53, 2**53 + 1, 2**53 + 1, 2**53 + 2, 2**62, 2**62 + 1], dtype=dtype),
+        }
+    )
+    lib.write(symbol, df)
+    generic_aggregation_test(lib, symbol, df, "grouping_column", {"to_nunique": "nunique"})
+
+
+def test_nunique_aggregation_floats(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    symbol = "test_nunique_aggregation_floats"
+    # NaN is not counted, and -0.0 is the same value as 0.0
+    df = DataFrame(
+        {
+            "grouping_column": [1, 1, 2, 1, 2, 1, 2, 1, 2],
+            "to_nunique": [0.0, -0.0, np.nan, 0.5, np.inf, np.nan, -np.inf, 0.5 + 2**-52, 2.0**64],
+        }
+    )
+    lib.write(symbol, df)
+    generic_aggregation_test(lib, symbol, df, "grouping_column", {"to_nunique": "nunique"})
+
+
+@pytest.mark.parametrize("quantile", (0.0, 0.1, 0.5, 0.75, 1.0))
+def test_quantile_aggregation(lmdb_version_store_tiny_segment, quantile):
+    lib = lmdb_version_store_tiny_segment
+    symbol = "test_quantile_aggregation"
+    df = DataFrame(
+        {
+            "grouping_column": ["group_1", "group_2", "group_1", "group_1", "group_2", "group_1", "group_3"],
+            "to_quantile": [5, 1, 3, 9, 4, 1, 8],
+        }
+    )
+    lib.write(symbol, df)
+    q = QueryBuilder().groupby("grouping_column").agg({"to_quantile": f"quantile({quantile})"})
+    received = lib.read(symbol, query_builder=q).data.sort_index()
+    expected = df.groupby("grouping_column")[["to_quantile"]].quantile(quantile)
+    assert_frame_equal(expected, received, check_dtype=False)
+
+
+def test_sum_of_squares_aggregation(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    symbol = "test_sum_of_squares_aggregation"
+    df = DataFrame(
+        {
+            "grouping_column": ["group_1", "group_2", "group_1", "group_1", "group_2"],
+            "to_sum_of_squares": [1.5, np.nan, -2.0, 3.0, 4],
+        }
+    )
+    lib.write(symbol, df)
+    q = QueryBuilder().groupby("grouping_column").agg({"to_sum_of_squares": "sum_of_squares"})
+    received = lib.read(symbol, query_builder=q).data.sort_index()
+    expected = (df[["to_sum_of_squares"]] ** 2).groupby(df["grouping_column"]).sum()
+    assert_frame_equal(expected, received, check_dtype=False)
+
+
+@pytest.mark.parametrize("aggregator", ("quantile(1.5)", "quantile(x)", "quantile()"))
+def test_invalid_quantile_aggregation(aggregator):
+    with pytest.raises(UserInputException):
+        QueryBuilder().groupby("grouping_column").agg({"to_quantile": aggregator})
+
+
 def test_aggregation_with_nones_and_nans_in_string_grouping_column(version_store_factory):
     lib = version_store_factory(column_group_size=2, segment_row_size=2, dynamic_strings=True)
     symbol = "test_aggregation_with_nones_and_nans_in_string_grouping_column"
@@ -0,0 +1,163 @@
+"""
+Copyright 2024 Man Group Operations Limited
+
+Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+
+As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from arcticdb.options import LibraryOptions
+from arcticdb.exceptions import ArcticNativeException
+from arcticdb.util.test import assert_frame_equal
+from arcticdb.version_store.processing import QueryBuilder
+from arcticdb_ext.version_store import OutputFormat
+
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def lmdb_library_small_segments(lmdb_storage, lib_name):
+    yield lmdb_storage.create_arctic().create_library(lib_name, library_options=LibraryOptions(rows_per_segment=10))
+
+
+def _df(num_rows):
+    return pd.DataFrame(
+        {
+            "col_int": np.arange(num_rows, dtype=np.int64),
+            "col_uint": np.arange(num_rows, dtype=np.uint16),
+            "col_float": np.arange(num_rows, dtype=np.float64) / 2,
+            "col_bool": np.arange(num_rows) % 3 == 0,
+            "col_str": [f"s{idx % 7}" if idx % 5 else None for idx in range(num_rows)],
+        },
+        index=pd.date_range("2024-01-01", periods=num_rows, freq="s"),
+    )
+
+
+def _to_pandas(table):
+    df = table.to_pandas()
+    df["col_str"] = df["col_str"].astype(object).where(df["col_str"].notna(), None)
+    return df.set_index(table.column_names[0]).rename_axis(None)
+
+
+@pytest.mark.parametrize("output_format", [OutputFormat.ARROW, "arrow"])
+def test_arrow_read_matches_pandas(lmdb_library_small_segments, output_format):
+    lib = lmdb_library_small_segments
+    sym = "test_arrow_read_matches_pandas"
+    df = _df(95)
+    lib.write(sym, df, metadata={"a": 1})
+    vit = lib.read(sym, output_format=output_format)
+    assert isinstance(vit.data, pa.Table)
+    assert vit.metadata == {"a": 1}
+    assert vit.version == 0
+    # One record batch per row-slice
+    assert len(vit.data.to_batches()) == 10
+    assert pa.types.is_dictionary(vit.data.schema.field("col_str").type)
+    assert pa.types.is_timestamp(vit.data.schema.field(0).type)
+    assert_frame_equal(_to_pandas(vit.data), df, check_freq=False)
+
+
+def test_arrow_read_column_missing_from_some_segments(lmdb_version_store_dynamic_schema):
+    lib = lmdb_version_store_dynamic_schema
+    sym = "test_arrow_read_column_missing_from_some_segments"
+    df_0 = pd.DataFrame({"col_int": [1, 2]}, index=pd.date_range("2024-01-01", periods=2))
+    df_1 = pd.DataFrame({"col_int": [3], "col_str": ["a"]}, index=pd.date_range("2024-01-03", periods=1))
+    lib.write(sym, df_0)
+    lib.append(sym, df_1)
+    table = lib.read(sym, output_format=OutputFormat.ARROW).data
+    assert table.column("col_int").to_pylist() == [1, 2, 3]
+    assert table.column("col_str").to_pylist() == [None, None, "a"]
+
+
+@pytest.mark.parametrize("row_range", [(0, 95), (3, 17), (20, 30), (-15, -2), (90, 200)])
+def test_arrow_read_row_range(lmdb_library_small_segments, row_range):
+    lib = lmdb_library_small_segments
+    sym = "test_arrow_read_row_range"
+    df = _df(95)
+    lib.write(sym, df)
+    table = lib.read(sym, row_range=row_range, output_format=OutputFormat.ARROW).data
+    assert_frame_equal(_to_pandas(table), lib.read(sym, row_range=row_range).data, check_freq=False)
+
+
+def test_arrow_read_date_range(lmdb_library_small_segments):
+    lib = lmdb_library_small_segments
+    sym = "test_arrow_read_date_range"
+    df = _df(95)
+    lib.write(sym, df)
+    date_range = (pd.Timestamp("2024-01-01 00:00:13"), pd.Timestamp("2024-01-01 00:00:41"))
+    table = lib.read(sym, date_range=date_range, output_format=OutputFormat.ARROW).data
+    assert_frame_equal(_to_pandas(table), lib.read(sym, date_range=date_range).data, check_freq=False)
+
+
+def test_arrow_read_batch(lmdb_library_small_segments):
+    lib = lmdb_library_small_segments
+    df_0 = _df(15)
+    df_1 = _df(25)
+    lib.write("sym_0", df_0)
+    lib.write("sym_1", df_1)
+    vits = lib.read_batch(["sym_0", "sym_1", "missing"], output_format=OutputFormat.ARROW)
+    assert_frame_equal(_to_pandas(vits[0].data), df_0, check_freq=False)
+    assert_frame_equal(_to_pandas(vits[1].data), df_1, check_freq=False)
+    assert vits[2].symbol == "missing"
+
+
+@pytest.mark.parametrize("row_range", [None, (3, 17)])
+def test_arrow_read_categorical(lmdb_library_small_segments, row_range):
+    lib = lmdb_library_small_segments
+    sym = "test_arrow_read_categorical"
+    df = pd.DataFrame(
+        {
+            "col_cat": pd.Categorical(["b", "a", None, "c", "b"] * 5, categories=["c", "b", "a"]),
+            "col_int_cat": pd.Categorical([30, 10, 20, 10, 30] * 5),
+        },
+        index=pd.date_range("2024-01-01", periods=25, freq="s"),
+    )
+    lib.write(sym, df)
+    table = lib.read(sym, row_range=row_range, output_format=OutputFormat.ARROW).data
+    expected = df if row_range is None else df.iloc[row_range[0] : row_range[1]]
+    for name in ["col_cat", "col_int_cat"]:
+        assert pa.types.is_dictionary(table.schema.field(name).type)
+        column = table.column(name)
+        assert column.to_pylist() == expected[name].astype(object).where(expected[name].notna(), None).tolist()
+        for chunk in column.chunks:
+            assert chunk.dictionary.to_pylist() == list(df[name].cat.categories)
+    received = table.to_pandas()
+    assert list(received["col_cat"].cat.categories) == ["c", "b", "a"]
+    assert received["col_cat"].isna().tolist() == expected["col_cat"].isna().tolist()
+
+
+def test_arrow_read_group_on_categorical(lmdb_library_small_segments):
+    lib = lmdb_library_small_segments
+    sym = "test_arrow_read_group_on_categorical"
+    df = pd.DataFrame(
+        {
+            "grouping_column": pd.Categorical(["b", "a", "b", "c", "a"]),
+            "other": [1, 1, 2, 1, 1],
+            "agg_column": [1, 2, 3, 4, 5],
+        }
+    )
+    lib.write(sym, df)
+    q = QueryBuilder().groupby("grouping_column").agg({"agg_column": "sum"})
+    table = lib.read(sym, query_builder=q, output_format=OutputFormat.ARROW).data
+    assert pa.types.is_dictionary(table.schema.field(0).type)
+    assert dict(zip(table.column(0).to_pylist(), table.column("agg_column").to_pylist())) == {"a": 7, "b": 4, "c": 4}
+
+    # Only the levels made from categorical columns hold codes
+    q = QueryBuilder().groupby(["grouping_column", "other"]).agg({"agg_column": "sum"})
+    table = lib.read(sym, query_builder=q, output_format=OutputFormat.ARROW).data
+    assert pa.types.is_dictionary(table.schema.field(0).type)
+    assert pa.types.is_integer(table.schema.field(1).type)
+    received = zip(table.column(0).to_pylist(), table.column(1).to_pylist(), table.column("agg_column").to_pylist())
+    assert sorted(received) == [("a", 1, 7), ("b", 1, 1), ("b", 2, 3), ("c", 1, 4)]
+
+
+def test_arrow_read_unsupported(lmdb_library_small_segments):
+    lib = lmdb_library_small_segments
+    sym = "test_arrow_read_unsupported"
+    lib.write(sym, _df(5))
+    with pytest.raises(ArcticNativeException):
+        lib.read(sym, output_format=OutputFormat.ARROW, lazy=True)
+    with pytest.raises(ArcticNativeException):
+        lib._nvs.head(sym, output_format=OutputFormat.ARROW)
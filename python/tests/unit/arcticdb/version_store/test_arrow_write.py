@@ -0,0 +1,123 @@
+"""
+Copyright 2024 Man Group Operations Limited
+
+Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+
+As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from arcticdb.exceptions import ArcticDbNotYetImplemented
+from arcticdb.util.test import assert_frame_equal
+from arcticdb.version_store._normalization import ArrowStrings, ArrowTableNormalizer
+
+pa = pytest.importorskip("pyarrow")
+
+
+def _df(num_rows, start="2024-01-01"):
+    return pd.DataFrame(
+        {
+            "col_int": np.arange(num_rows, dtype=np.int64),
+            "col_uint": np.arange(num_rows, dtype=np.uint16),
+            "col_float": np.arange(num_rows, dtype=np.float64) / 2,
+            "col_bool": np.arange(num_rows) % 3 == 0,
+            "col_str": [f"s{idx % 7}" if idx % 5 else None for idx in range(num_rows)],
+        },
+        index=pd.date_range(start, periods=num_rows, freq="s"),
+    )
+
+
+def test_arrow_write_matches_pandas_write(lmdb_library):
+    lib = lmdb_library
+    df = _df(100)
+    lib.write("from_arrow", pa.Table.from_pandas(df))
+    lib.write("from_pandas", df)
+    assert_frame_equal(lib.read("from_arrow").data, lib.read("from_pandas").data)
+
+
+def test_arrow_write_without_index(lmdb_library):
+    lib = lmdb_library
+    sym = "test_arrow_write_without_index"
+    table = pa.table({"col_int": [1, 2, 3], "col_str": ["a", None, "c"]})
+    lib.write(sym, table)
+    expected = pd.DataFrame({"col_int": [1, 2, 3], "col_str": ["a", None, "c"]})
+    assert_frame_equal(lib.read(sym).data, expected)
+
+
+def test_arrow_write_dictionary_and_chunked_strings(lmdb_library):
+    lib = lmdb_library
+    sym = "test_arrow_write_dictionary_and_chunked_strings"
+    # Each chunk has its own dictionary
+    dictionary_column = pa.chunked_array(
+        [
+            pa.array(["x", "y", None, "x"]).dictionary_encode(),
+            pa.array(["z", "y"]).dictionary_encode(),
+        ]
+    )
+    string_column = pa.chunked_array([pa.array(["a", "bb", "ccc"], pa.large_string()), pa.array([None, "", "d", "e"], pa.large_string())[1:]])
+    lib.write(sym, pa.table({"dict": dictionary_column, "str": string_column}))
+    expected = pd.DataFrame({"dict": ["x", "y", None, "x", "z", "y"], "str": ["a", "bb", "ccc", "", "d", "e"]})
+    assert_frame_equal(lib.read(sym).data, expected)
+
+
+def test_arrow_strings_are_not_python_objects():
+    table = pa.table({"col_str": pa.array(["a", None, "a", "b"]).dictionary_encode()})
+    item, _ = ArrowTableNormalizer().normalize(table)
+    column = item.columns_values[0]
+    assert isinstance(column, ArrowStrings)
+    assert column.codes.tolist() == [0, -1, 0, 1]
+    assert column.offsets.tolist() == [0, 1, 2]
+    assert column.data.tobytes() == b"ab"
+    assert column.is_utf8
+
+
+def test_arrow_numeric_columns_zero_copy():
+    values = np.arange(10, dtype=np.float64)
+    table = pa.table({"col_float": values})
+    item, _ = ArrowTableNormalizer().normalize(table)
+    assert np.shares_memory(item.columns_values[0], values)
+
+
+def test_arrow_append_and_update(lmdb_library):
+    lib = lmdb_library
+    df = _df(10)
+    to_append = _df(5, "2024-01-02")
+    update = _df(3, "2024-01-01 00:00:02")
+    update["col_int"] += 100
+    lib.write("from_arrow", pa.Table.from_pandas(df))
+    lib.append("from_arrow", pa.Table.from_pandas(to_append))
+    lib.update("from_arrow", pa.Table.from_pandas(update))
+    lib.write("from_pandas", df)
+    lib.append("from_pandas", to_append)
+    lib.update("from_pandas", update)
+    assert_frame_equal(lib.read("from_arrow").data, lib.read("from_pandas").data)
+
+
+def test_arrow_update_date_range(lmdb_library):
+    lib = lmdb_library
+    df = _df(10)
+    update = _df(10)
+    update["col_int"] += 100
+    date_range = (pd.Timestamp("2024-01-01 00:00:03"), pd.Timestamp("2024-01-01 00:00:05"))
+    lib.write("from_arrow", df)
+    lib.update("from_arrow", pa.Table.from_pandas(update), date_range=date_range)
+    lib.write("from_pandas", df)
+    lib.update("from_pandas", update, date_range=date_range)
+    assert_frame_equal(lib.read("from_arrow").data, lib.read("from_pandas").data)
+
+
+def test_arrow_write_polars(lmdb_library):
+    pl = pytest.importorskip("polars")
+    lib = lmdb_library
+    sym = "test_arrow_write_polars"
+    lib.write(sym, pl.DataFrame({"col_int": [1, 2, 3], "col_str": ["a", "b", None]}))
+    expected = pd.DataFrame({"col_int": [1, 2, 3], "col_str": ["a", "b", None]})
+    assert_frame_equal(lib.read(sym).data, expected)
+
+
+def test_arrow_write_unsupported_type(lmdb_library):
+    table = pa.table({"col_list": pa.array([[1], [2, 3]])})
+    with pytest.raises(ArcticDbNotYetImplemented):
+        lmdb_library.write("test_arrow_write_unsupported_type", table)
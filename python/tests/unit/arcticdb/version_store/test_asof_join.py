@@ -0,0 +1,170 @@
+"""
+Copyright 2024 Man Group Operations Limited
+
+Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+
+As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from arcticdb import col, LazyDataFrameAfterJoin, LazyDataFrameCollection, ReadRequest
+from arcticdb.exceptions import ArcticNativeException, UnsortedDataException, UserInputException
+from arcticdb.options import LibraryOptions
+from arcticdb.util.test import assert_frame_equal
+
+pytestmark = pytest.mark.pipeline
+
+
+@pytest.fixture
+def small_segment_library(lmdb_storage, lib_name):
+    # Small segments so that both symbols span many row and column slices
+    yield lmdb_storage.create_arctic().create_library(
+        lib_name, library_options=LibraryOptions(rows_per_segment=3, columns_per_segment=2)
+    )
+
+
+def trades_and_quotes(num_trades=25, num_quotes=40):
+    rng = np.random.default_rng(17)
+    tickers = np.array(["AAA", "BBB", "CCC"])
+    trade_index = pd.DatetimeIndex(np.sort(rng.integers(0, 60, num_trades)) * 10**9 + pd.Timestamp("2024-01-02").value)
+    quote_index = pd.DatetimeIndex(np.sort(rng.integers(0, 60, num_quotes)) * 10**9 + pd.Timestamp("2024-01-02").value)
+    trades = pd.DataFrame(
+        {
+            "ticker": tickers[rng.integers(0, 3, num_trades)],
+            "price": rng.random(num_trades) * 100,
+            "size": rng.integers(1, 1000, num_trades),
+        },
+        index=trade_index,
+    )
+    quotes = pd.DataFrame(
+        {
+            "ticker": tickers[rng.integers(0, 3, num_quotes)],
+            "bid": rng.random(num_quotes) * 100,
+            "ask_size": rng.integers(1, 1000, num_quotes),
+            "is_firm": rng.integers(0, 2, num_quotes).astype(bool),
+            "venue": np.array(["X", "Y", None], dtype=object)[rng.integers(0, 3, num_quotes)],
+            "quote_time": quote_index,
+        },
+        index=quote_index,
+    )
+    return trades, quotes
+
+
+def expected_asof_join(left, right, **kwargs):
+    expected = pd.merge_asof(left, right, left_index=True, right_index=True, **kwargs)
+    # Numeric and bool columns from the right symbol always come back as float64
+    for column in ["bid", "ask_size", "is_firm"]:
+        if column in expected.columns:
+            expected[column] = expected[column].astype(np.float64)
+    return expected
+
+
+def test_asof_join(small_segment_library):
+    lib = small_segment_library
+    trades, quotes = trades_and_quotes()
+    quotes = quotes.drop(columns="ticker")
+    lib.write("trades", trades)
+    lib.write("quotes", quotes)
+    lazy_df = lib.read_batch(["trades", "quotes"], lazy=True).asof_join()
+    assert isinstance(lazy_df, LazyDataFrameAfterJoin)
+    received = lazy_df.collect()
+    assert received.symbol == "trades"
+    assert_frame_equal(expected_asof_join(trades, quotes), received.data)
+
+
+@pytest.mark.parametrize("tolerance", [None, "3s", pd.Timedelta(seconds=1), 0])
+@pytest.mark.parametrize("allow_exact_matches", [True, False])
+def test_asof_join_by(small_segment_library, tolerance, allow_exact_matches):
+    lib = small_segment_library
+    trades, quotes = trades_and_quotes()
+    lib.write("trades", trades)
+    lib.write("quotes", quotes)
+    received = (
+        lib.read_batch(["trades", "quotes"], lazy=True)
+        .asof_join(by="ticker", tolerance=tolerance, allow_exact_matches=allow_exact_matches)
+        .collect()
+        .data
+    )
+    expected = expected_asof_join(
+        trades,
+        quotes,
+        by="ticker",
+        tolerance=None if tolerance is None else pd.Timedelta(tolerance),
+        allow_exact_matches=allow_exact_matches,
+    )
+    assert_frame_equal(expected, received)
+
+
+def test_asof_join_with_queries(small_segment_library):
+    lib = small_segment_library
+    trades, quotes = trades_and_quotes()
+    lib.write("trades", trades)
+    lib.write("quotes", quotes)
+    date_range = (pd.Timestamp("2024-01-02 00:00:10"), pd.Timestamp("2024-01-02 00:00:50"))
+    lazy_dfs = lib.read_batch(
+        ["trades", ReadRequest("quotes", columns=["ticker", "bid"])], lazy=True
+    )
+    # Applied to both symbols before the join
+    lazy_dfs = lazy_dfs.date_range(date_range)
+    lazy_dfs = lazy_dfs[lazy_dfs["ticker"] != "CCC"]
+    # Applied to the joined data
+    lazy_df = lazy_dfs.asof_join(by="ticker")
+    lazy_df["edge"] = col("price") - col("bid")
+    lazy_df = lazy_df[lazy_df["edge"] > 0]
+    received = lazy_df.collect().data
+
+    left = trades.loc[date_range[0]:date_range[1]]
+    left = left[left["ticker"] != "CCC"]
+    right = quotes.loc[date_range[0]:date_range[1], ["ticker", "bid"]]
+    right = right[right["ticker"] != "CCC"]
+    expected = expected_asof_join(left, right, by="ticker")
+    expected["edge"] = expected["price"] - expected["bid"]
+    expected = expected[expected["edge"] > 0]
+    assert_frame_equal(expected, received)
+
+
+def test_asof_join_split_lazy_dataframes(lmdb_library):
+    lib = lmdb_library
+    trades, quotes = trades_and_quotes()
+    lib.write("trades", trades)
+    lib.write("quotes", quotes.drop(columns="ticker"))
+    lazy_trades, lazy_quotes = lib.read_batch(["trades", "quotes"], lazy=True).split()
+    lazy_trades = lazy_trades[lazy_trades["size"] > 500]
+    received = LazyDataFrameCollection([lazy_trades, lazy_quotes]).asof_join().collect().data
+    expected = expected_asof_join(trades[trades["size"] > 500], quotes.drop(columns="ticker"))
+    assert_frame_equal(expected, received)
+
+
+def test_asof_join_no_matches(lmdb_library):
+    lib = lmdb_library
+    left = pd.DataFrame({"a": [1, 2]}, index=pd.date_range("2024-01-01", periods=2))
+    right = pd.DataFrame({"b": [3.0, 4.0]}, index=pd.date_range("2025-01-01", periods=2))
+    lib.write("left", left)
+    lib.write("right", right)
+    received = lib.read_batch(["left", "right"], lazy=True).asof_join().collect().data
+    assert_frame_equal(expected_asof_join(left, right), received)
+
+
+def test_asof_join_invalid(lmdb_library):
+    lib = lmdb_library
+    trades, quotes = trades_and_quotes()
+    lib.write("trades", trades)
+    lib.write("quotes", quotes)
+    lib.write("unsorted", quotes.drop(columns="ticker").iloc[::-1].rename(columns={"bid": "unsorted_bid"}))
+    with pytest.raises(ArcticNativeException):
+        lib.read_batch(["trades"], lazy=True).asof_join()
+    with pytest.raises(ArcticNativeException):
+        lib.read_batch(["trades", "quotes"], lazy=True).asof_join(tolerance="-1s")
+    # ticker is in both symbols, but is not a by column
+    with pytest.raises(UserInputException):
+        lib.read_batch(["trades", "quotes"], lazy=True).asof_join().collect()
+    with pytest.raises(UnsortedDataException):
+        lib.read_batch(["trades", "unsorted"], lazy=True).asof_join().collect()
+
+
+def test_asof_join_str(lmdb_library):
+    lib = lmdb_library
+    lazy_df = lib.read_batch(["trades", "quotes"], lazy=True).asof_join(by=["ticker"], tolerance=5)
+    assert "ASOF_JOIN(by=[ticker], tolerance=5ns, allow_exact_matches=true)" in str(lazy_df)
@@ -0,0 +1,119 @@
+"""
+Copyright 2024 Man Group Operations Limited
+
+Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+
+As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+"""
+import asyncio
+import re
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from arcticdb import AsyncLibrary
+from arcticdb.exceptions import NoSuchVersionException, ArcticException
+from arcticdb.util.test import assert_frame_equal
+
+
+def test_async_read_coalesced(lmdb_library):
+    lib = lmdb_library
+    num_symbols = 25
+    dfs = {f"sym_{idx}": pd.DataFrame({"col": np.arange(idx, idx + 10)}) for idx in range(num_symbols)}
+    for symbol, df in dfs.items():
+        lib.write(symbol, df)
+    batch_sizes = []
+    read_batch = lib.read_batch
+
+    def recording_read_batch(symbols, *args, **kwargs):
+        batch_sizes.append(len(symbols))
+        return read_batch(symbols, *args, **kwargs)
+
+    lib.read_batch = recording_read_batch
+
+    async def read_all():
+        async with AsyncLibrary(lib, max_batch_size=10) as async_lib:
+            return await asyncio.gather(*(async_lib.read(symbol, columns=["col"]) for symbol in dfs))
+
+    results = asyncio.run(read_all())
+    assert batch_sizes == [10, 10, 5]
+    for (symbol, df), result in zip(dfs.items(), results):
+        assert result.symbol == symbol
+        assert_frame_equal(df, result.data)
+
+
+def test_async_read_errors_match_sync_api(lmdb_library):
+    lib = lmdb_library
+    df = pd.DataFrame({"col": np.arange(10)})
+    lib.write("sym", df)
+
+    async def read_with_error():
+        async with AsyncLibrary(lib) as async_lib:
+            return await asyncio.gather(
+                async_lib.read("sym"),
+                async_lib.read("sym", as_of=5),
+                async_lib.read_metadata("sym"),
+                async_lib.read_metadata("missing"),
+                return_exceptions=True,
+            )
+
+    read, missing_version, metadata, missing_metadata = asyncio.run(read_with_error())
+    assert_frame_equal(df, read.data)
+    assert isinstance(missing_version, NoSuchVersionException)
+    assert re.search(r"E_NO_SUCH_VERSION.*version matching query .* not found for symbol 'sym'", str(missing_version))
+    assert metadata.version == 0
+    assert isinstance(missing_metadata, NoSuchVersionException)
+    assert re.search(r"E_NO_SUCH_VERSION.*missing@.*: version not found", str(missing_metadata))
+
+
+def test_async_read_does_not_block_event_loop(lmdb_library):
+    lib = lmdb_library
+    df = pd.DataFrame({"col": np.arange(10)})
+    lib.write("sym", df)
+    # The batch read waits for the event loop to run another task, so this only completes if the read is made from a
+    # worker thread rather than the event loop's thread
+    loop_ran = threading.Event()
+    read_batch = lib.read_batch
+    read_threads = []
+
+    def waiting_read_batch(*args, **kwargs):
+        read_threads.append(threading.current_thread())
+        assert loop_ran.wait(timeout=10)
+        return read_batch(*args, **kwargs)
+
+    lib.read_batch = waiting_read_batch
+
+    async def read_while_looping():
+        async with AsyncLibrary(lib) as async_lib:
+            read = asyncio.ensure_future(async_lib.read("sym"))
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            loop_ran.set()
+            return await read
+
+    result = asyncio.run(read_while_looping())
+    assert_frame_equal(df, result.data)
+    assert len(read_threads) == 1
+    assert read_threads[0] is not threading.main_thread()
+
+
+def test_async_write_and_list(lmdb_library):
+    lib = lmdb_library
+    df = pd.DataFrame({"col": np.arange(10)})
+
+    async def write_then_read():
+        async with AsyncLibrary(lib) as async_lib:
+            await async_lib.write("sym", df)
+            await async_lib.append("sym", df)
+            return await async_lib.list_symbols(), await async_lib.read("sym")
+
+    symbols, result = asyncio.run(write_then_read())
+    assert symbols == ["sym"]
+    assert_frame_equal(pd.concat([df, df], ignore_index=True), result.data)
+
+
+def test_async_library_invalid_batch_size(lmdb_library):
+    with pytest.raises(ArcticException, match="max_batch_size must be positive, received 0"):
+        AsyncLibrary(lmdb_library, max_batch_size=0)
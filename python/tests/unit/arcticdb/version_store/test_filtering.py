@@ -70,12 +70,36 @@ def test_filter_categorical(lmdb_version_store_v1):
     lib = lmdb_version_store_v1
     df = pd.DataFrame({"a": ["hello", "hi", "hello"]}, index=np.arange(3))
     df.a = df.a.astype("category")
+    symbol = "test_filter_categorical"
+    lib.write(symbol, df)
+
     q = QueryBuilder()
     q = q[q.a == "hi"]
-    symbol = "test_filter_categorical"
+    assert_frame_equal(df[df.a == "hi"], lib.read(symbol, query_builder=q).data)
+
+    q = QueryBuilder()
+    q = q[q.a != "hi"]
+    assert_frame_equal(df[df.a != "hi"], lib.read(symbol, query_builder=q).data)
+
+    q = QueryBuilder()
+    q = q[q.a.isin(["hi", "not a category"])]
+    assert_frame_equal(df[df.a.isin(["hi", "not a category"])], lib.read(symbol, query_builder=q).data)
+
+    q = QueryBuilder()
+    q = q[q.a == "not a category"]
+    assert lib.read(symbol, query_builder=q).data.empty
+
+
+def test_filter_int_categorical(lmdb_version_store_v1):
+    lib = lmdb_version_store_v1
+    df = pd.DataFrame({"a": [10, 20, 10, 30]}, index=np.arange(4))
+    df.a = df.a.astype("category")
+    symbol = "test_filter_int_categorical"
     lib.write(symbol, df)
-    with pytest.raises(UserInputException):
-        _ = lib.read(symbol, query_builder=q)
+
+    q = QueryBuilder()
+    q = q[q.a.isnotin([10, 30])]
+    assert_frame_equal(df[~df.a.isin([10, 30])], lib.read(symbol, query_builder=q).data)
 
 
 def test_filter_date_range_row_indexed(lmdb_version_store_tiny_segment):
@@ -835,6 +859,104 @@ def test_filter_string_nans_col_col(lmdb_version_store_v1):
     generic_filter_test_nans(lib, symbol, q, expected)
 
 
+@pytest.mark.parametrize("dynamic_strings", [True, False])
+def test_filter_string_predicates(lmdb_version_store_tiny_segment, dynamic_strings):
+    lib = lmdb_version_store_tiny_segment
+    symbol = "test_filter_string_predicates"
+    df = pd.DataFrame({"a": ["AAPL", "AAPL.OQ", "MSFT", "MSFT.OQ", "GOOG", "ÀAPL", "AAPL"]}, index=np.arange(7))
+    lib.write(symbol, df, dynamic_strings=dynamic_strings)
+
+    q = QueryBuilder()
+    q = q[q["a"].startswith("AAPL")]
+    assert_frame_equal(df[df["a"].str.startswith("AAPL")], lib.read(symbol, query_builder=q).data)
+
+    q = QueryBuilder()
+    q = q[q["a"].endswith(".OQ")]
+    assert_frame_equal(df[df["a"].str.endswith(".OQ")], lib.read(symbol, query_builder=q).data)
+
+    q = QueryBuilder()
+    q = q[q["a"].contains("AP")]
+    assert_frame_equal(df[df["a"].str.contains("AP", regex=False)], lib.read(symbol, query_builder=q).data)
+
+    q = QueryBuilder()
+    q = q[q["a"].regex_match("^[A-Z]+$")]
+    assert_frame_equal(df[df["a"].str.contains("^[A-Z]+$")], lib.read(symbol, query_builder=q).data)
+
+    q = QueryBuilder()
+    q = q[~q["a"].startswith("MSFT") & (q["a"].str_len() == 4)]
+    assert_frame_equal(df[~df["a"].str.startswith("MSFT") & (df["a"].str.len() == 4)], lib.read(symbol, query_builder=q).data)
+
+
+def test_filter_string_predicates_nans(lmdb_version_store_v1):
+    lib = lmdb_version_store_v1
+    symbol = "test_filter_string_predicates_nans"
+    df = pd.DataFrame({"a": ["row1", None, "row2", np.nan, "other"]}, index=np.arange(5))
+    lib.write(symbol, df)
+
+    q = QueryBuilder()
+    q = q[q["a"].startswith("row")]
+    expected = df[df["a"].str.startswith("row", na=False)]
+    generic_filter_test_nans(lib, symbol, q, expected)
+
+
+def test_filter_datetime_components(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    symbol = "test_filter_datetime_components"
+    df = pd.DataFrame({"a": np.arange(100)}, index=pd.date_range("2024-02-28 20:00", periods=100, freq="37min"))
+    lib.write(symbol, df)
+
+    q = QueryBuilder()
+    q = q[(q["index"].dt.hour >= 9) & (q["index"].dt.hour < 17) & (q["index"].dt.dayofweek < 5)]
+    expected = df[(df.index.hour >= 9) & (df.index.hour < 17) & (df.index.dayofweek < 5)]
+    assert_frame_equal(expected, lib.read(symbol, query_builder=q).data)
+
+    q = QueryBuilder()
+    q = q[(q["index"].dt.month == 3) & (q["index"].dt.day == 1) & (q["index"].dt.minute < 30)]
+    expected = df[(df.index.month == 3) & (df.index.day == 1) & (df.index.minute < 30)]
+    assert_frame_equal(expected, lib.read(symbol, query_builder=q).data)
+
+
+def test_filter_datetime_column_nats(lmdb_version_store_v1):
+    lib = lmdb_version_store_v1
+    symbol = "test_filter_datetime_column_nats"
+    df = pd.DataFrame(
+        {"a": [pd.Timestamp("2024-01-01 10:00"), pd.NaT, pd.Timestamp("1969-12-31 23:00"), pd.NaT]},
+        index=np.arange(4),
+    )
+    lib.write(symbol, df)
+    q = QueryBuilder()
+    q = q[q["a"].dt.hour >= 10]
+    assert_frame_equal(df.iloc[[0, 2]], lib.read(symbol, query_builder=q).data)
+
+
+def test_filter_datetime_component_of_non_timestamp(lmdb_version_store_v1):
+    lib = lmdb_version_store_v1
+    symbol = "test_filter_datetime_component_of_non_timestamp"
+    lib.write(symbol, pd.DataFrame({"a": [1, 2, 3]}))
+    q = QueryBuilder()
+    q = q[q["a"].dt.hour == 1]
+    with pytest.raises(UserInputException):
+        lib.read(symbol, query_builder=q)
+
+    q = QueryBuilder()
+    q = q[~q["a"].startswith("row")]
+    expected = df[~df["a"].str.startswith("row", na=False)]
+    generic_filter_test_nans(lib, symbol, q, expected)
+
+
+def test_filter_string_predicates_invalid(lmdb_version_store_v1):
+    lib = lmdb_version_store_v1
+    symbol = "test_filter_string_predicates_invalid"
+    lib.write(symbol, pd.DataFrame({"a": ["hello"], "b": [1]}))
+    q = QueryBuilder()
+    q = q[q["b"].startswith("1")]
+    with pytest.raises(UserInputException):
+        lib.read(symbol, query_builder=q)
+    q = QueryBuilder()
+    with pytest.raises(UserInputException):
+        q = q[q["a"].contains(1)]
+
+
 @pytest.mark.parametrize("method", ("isna", "notna", "isnull", "notnull"))
 @pytest.mark.parametrize("dtype", (np.int64, np.float32, np.float64, np.datetime64, str))
 def test_filter_null_filtering(lmdb_version_store_v1, method, dtype):
@@ -0,0 +1,118 @@
+"""
+Copyright 2024 Man Group Operations Limited
+
+Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+
+As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from arcticdb.util.test import assert_frame_equal, config_context
+from arcticdb_ext.storage import KeyType
+
+
+# With 2 rows per segment, 20 rows are written as 10 data keys, whose index is split into 4 pages of at most 3 rows
+NUM_ROWS = 20
+PAGE_ROWS = 3
+NUM_PAGES = 4
+
+
+@pytest.fixture(autouse=True)
+def paged_index():
+    with config_context("VersionStore.IndexPageRows", PAGE_ROWS):
+        yield
+
+
+def make_df(start=0):
+    return pd.DataFrame(
+        {"col": np.arange(start, start + NUM_ROWS, dtype=np.int64)},
+        index=pd.date_range("2024-01-01", periods=NUM_ROWS, freq="s"),
+    )
+
+
+def index_page_versions(lib, symbol):
+    return sorted(key.version_id for key in lib.library_tool().find_keys_for_id(KeyType.TABLE_INDEX_PAGE, symbol))
+
+
+def test_index_pages_written(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    lib.write("sym", make_df())
+    assert index_page_versions(lib, "sym") == [0] * NUM_PAGES
+    assert len(lib.library_tool().find_keys_for_id(KeyType.TABLE_DATA, "sym")) == NUM_ROWS // 2
+
+
+@pytest.mark.parametrize("n", [1, 3, 7, NUM_ROWS, NUM_ROWS + 5, -4])
+def test_index_pages_head_tail(lmdb_version_store_tiny_segment, n):
+    lib = lmdb_version_store_tiny_segment
+    df = make_df()
+    lib.write("sym", df)
+    assert_frame_equal(df.head(n), lib.head("sym", n=n).data)
+    assert_frame_equal(df.tail(n), lib.tail("sym", n=n).data)
+
+
+@pytest.mark.parametrize(
+    "row_range", [(0, 1), (3, 10), (5, 6), (0, NUM_ROWS), (-7, -2), (-NUM_ROWS, -1), (-3, NUM_ROWS)]
+)
+def test_index_pages_row_range(lmdb_version_store_tiny_segment, row_range):
+    lib = lmdb_version_store_tiny_segment
+    df = make_df()
+    lib.write("sym", df)
+    assert_frame_equal(df.iloc[row_range[0] : row_range[1]], lib.read("sym", row_range=row_range).data)
+
+
+@pytest.mark.parametrize("start, end", [(0, 0), (1, 4), (5, 12), (6, 7), (0, NUM_ROWS - 1), (17, NUM_ROWS - 1)])
+def test_index_pages_date_range(lmdb_version_store_tiny_segment, start, end):
+    lib = lmdb_version_store_tiny_segment
+    df = make_df()
+    lib.write("sym", df)
+    date_range = (df.index[start], df.index[end])
+    assert_frame_equal(df.loc[date_range[0] : date_range[1]], lib.read("sym", date_range=date_range).data)
+
+
+def test_index_pages_read_index(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    df = make_df()
+    lib.write("paged", df)
+    with config_context("VersionStore.IndexPageRows", 0):
+        lib.write("unpaged", df)
+    assert index_page_versions(lib, "unpaged") == []
+    # The pages are flattened back into one row per data key
+    columns = ["end_index", "start_row", "end_row", "start_col", "end_col", "key_type"]
+    paged = lib.read_index("paged")
+    assert len(paged) == NUM_ROWS // 2
+    assert_frame_equal(lib.read_index("unpaged")[columns], paged[columns])
+
+
+def test_index_pages_delete(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    lib.write("sym", make_df())
+    lib.write("sym", make_df(100))
+    assert index_page_versions(lib, "sym") == [0] * NUM_PAGES + [1] * NUM_PAGES
+    lib.delete("sym")
+    assert index_page_versions(lib, "sym") == []
+    assert lib.library_tool().find_keys_for_id(KeyType.TABLE_DATA, "sym") == []
+
+
+def test_index_pages_prune_previous_versions_and_snapshot(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    df_0 = make_df()
+    df_1 = make_df(100)
+    df_2 = make_df(200)
+    lib.write("sym", df_0)
+    lib.snapshot("snap")
+    lib.write("sym", df_1)
+    lib.write("sym", df_2)
+
+    # The pages of version 0 are kept for the snapshot, and those of version 1 are deleted
+    lib.prune_previous_versions("sym")
+    assert index_page_versions(lib, "sym") == [0] * NUM_PAGES + [2] * NUM_PAGES
+    assert_frame_equal(df_0, lib.read("sym", as_of="snap").data)
+    assert_frame_equal(df_0.iloc[5:12], lib.read("sym", as_of="snap", row_range=(5, 12)).data)
+    assert_frame_equal(df_0.tail(3), lib.tail("sym", n=3, as_of="snap").data)
+    assert_frame_equal(df_2, lib.read("sym").data)
+
+    lib.delete_snapshot("snap")
+    assert index_page_versions(lib, "sym") == [2] * NUM_PAGES
+    assert_frame_equal(df_2.head(5), lib.head("sym", n=5).data)
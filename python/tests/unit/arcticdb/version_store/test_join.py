@@ -0,0 +1,188 @@
+"""
+Copyright 2024 Man Group Operations Limited
+
+Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+
+As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from arcticdb import col, LazyDataFrameAfterJoin, LazyDataFrameCollection, ReadRequest
+from arcticdb.exceptions import ArcticNativeException, SchemaException, UserInputException
+from arcticdb.options import LibraryOptions
+from arcticdb.util.test import assert_frame_equal
+
+pytestmark = pytest.mark.pipeline
+
+
+@pytest.fixture
+def small_segment_library(lmdb_storage, lib_name):
+    # Small segments so that both symbols span many row and column slices
+    yield lmdb_storage.create_arctic().create_library(
+        lib_name, library_options=LibraryOptions(rows_per_segment=3, columns_per_segment=2)
+    )
+
+
+def bars_and_instruments(num_bars=30):
+    rng = np.random.default_rng(23)
+    tickers = np.array(["AAA", "BBB", "CCC", "DDD"])
+    bars = pd.DataFrame(
+        {
+            "ticker": tickers[rng.integers(0, 4, num_bars)],
+            "close": rng.random(num_bars) * 100,
+            "volume": rng.integers(1, 10_000, num_bars),
+        },
+        index=pd.date_range("2024-01-01", periods=num_bars),
+    )
+    # No entry for DDD
+    instruments = pd.DataFrame(
+        {
+            "ticker": ["CCC", "AAA", "BBB"],
+            "sector": ["Energy", "Tech", None],
+            "lot_size": [100, 10, 1],
+            "listed": pd.to_datetime(["2001-01-01", "2010-06-30", "1999-12-31"]),
+        },
+    )
+    return bars, instruments
+
+
+def expected_join(left, right, **kwargs):
+    expected = pd.merge(left.reset_index(), right, validate="many_to_one", **kwargs).set_index("index")
+    expected.index.name = None
+    # Numeric and bool columns from the right symbol always come back as float64
+    expected["lot_size"] = expected["lot_size"].astype(np.float64)
+    return expected
+
+
+@pytest.mark.parametrize("how", ["inner", "left"])
+def test_join(small_segment_library, how):
+    lib = small_segment_library
+    bars, instruments = bars_and_instruments()
+    lib.write("bars", bars)
+    lib.write("instruments", instruments)
+    lazy_df = lib.read_batch(["bars", "instruments"], lazy=True).join(on="ticker", how=how)
+    assert isinstance(lazy_df, LazyDataFrameAfterJoin)
+    received = lazy_df.collect()
+    assert received.symbol == "bars"
+    assert_frame_equal(expected_join(bars, instruments, on="ticker", how=how), received.data)
+
+
+def test_join_multiple_on_columns(lmdb_library):
+    lib = lmdb_library
+    left = pd.DataFrame(
+        {"a": [1, 2, 1, 2, 3], "b": ["x", "x", "y", "y", None], "c": np.arange(5, dtype=np.float32)},
+        index=pd.date_range("2024-01-01", periods=5),
+    )
+    right = pd.DataFrame({"a": np.array([2, 1, 3], dtype=np.uint8), "b": ["x", "y", None], "lot_size": [7, 8, 9]})
+    lib.write("left", left)
+    lib.write("right", right)
+    received = lib.read_batch(["left", "right"], lazy=True).join(on=["a", "b"], how="left").collect().data
+    # Integer widths do not have to match, and missing values match each other
+    expected = expected_join(left, right.astype({"a": np.int64}), on=["a", "b"], how="left")
+    assert_frame_equal(expected, received)
+
+
+def test_join_with_queries(small_segment_library):
+    lib = small_segment_library
+    bars, instruments = bars_and_instruments()
+    lib.write("bars", bars)
+    lib.write("instruments", instruments)
+    lazy_bars, lazy_instruments = lib.read_batch(
+        ["bars", ReadRequest("instruments", columns=["ticker", "lot_size"])], lazy=True
+    ).split()
+    lazy_bars = lazy_bars[lazy_bars["volume"] > 2_000]
+    lazy_df = LazyDataFrameCollection([lazy_bars, lazy_instruments]).join(on="ticker")
+    lazy_df["notional"] = col("close") * col("lot_size")
+    lazy_df = lazy_df[lazy_df["notional"] > 1_000]
+    received = lazy_df.collect().data
+
+    expected = expected_join(bars[bars["volume"] > 2_000], instruments[["ticker", "lot_size"]], on="ticker", how="inner")
+    expected["notional"] = expected["close"] * expected["lot_size"]
+    expected = expected[expected["notional"] > 1_000]
+    assert_frame_equal(expected, received)
+
+
+def test_join_invalid(lmdb_library):
+    lib = lmdb_library
+    bars, instruments = bars_and_instruments()
+    lib.write("bars", bars)
+    lib.write("instruments", instruments)
+    lib.write("duplicated", pd.concat([instruments, instruments]))
+    lib.write("no_ticker", instruments.drop(columns="ticker"))
+    with pytest.raises(ArcticNativeException):
+        lib.read_batch(["bars"], lazy=True).join(on="ticker")
+    with pytest.raises(ArcticNativeException):
+        lib.read_batch(["bars", "instruments"], lazy=True).join(on="ticker", how="outer")
+    with pytest.raises(ArcticNativeException):
+        lib.read_batch(["bars", "instruments"], lazy=True).join(on=[])
+    # Only many-to-one joins are supported
+    with pytest.raises(UserInputException):
+        lib.read_batch(["bars", "duplicated"], lazy=True).join(on="ticker").collect()
+    with pytest.raises(SchemaException):
+        lib.read_batch(["bars", "no_ticker"], lazy=True).join(on="ticker").collect()
+
+
+def test_concat(small_segment_library):
+    lib = small_segment_library
+    bars, _ = bars_and_instruments()
+    lib.write("bars_0", bars.iloc[:10])
+    lib.write("bars_1", bars.iloc[10:17])
+    lib.write("bars_2", bars.iloc[17:])
+    lazy_df = lib.read_batch(["bars_0", "bars_1", "bars_2"], lazy=True).concat()
+    assert "CONCAT" in str(lazy_df)
+    received = lazy_df.collect()
+    assert received.symbol == "bars_0"
+    assert_frame_equal(bars, received.data)
+
+
+def test_concat_with_queries(small_segment_library):
+    lib = small_segment_library
+    bars, _ = bars_and_instruments()
+    lib.write("bars_0", bars.iloc[:15])
+    lib.write("bars_1", bars.iloc[15:])
+    lazy_dfs = lib.read_batch(["bars_0", "bars_1"], lazy=True)
+    lazy_dfs = lazy_dfs[lazy_dfs["ticker"] != "AAA"]
+    lazy_df = lazy_dfs.concat()
+    lazy_df = lazy_df.resample("1W").agg({"volume": "sum"})
+    received = lazy_df.collect().data
+    expected = bars[bars["ticker"] != "AAA"].resample("1W").agg({"volume": "sum"})
+    assert_frame_equal(expected, received, check_dtype=False)
+
+
+def test_concat_row_count_index(lmdb_library):
+    lib = lmdb_library
+    df_0 = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    df_1 = pd.DataFrame({"a": [4, 5], "b": ["u", "v"]})
+    lib.write("df_0", df_0)
+    lib.write("df_1", df_1)
+    received = lib.read_batch(["df_1", "df_0"], lazy=True).concat().collect().data
+    assert_frame_equal(pd.concat([df_1, df_0], ignore_index=True), received)
+
+
+def test_concat_dynamic_schema(lmdb_library_dynamic_schema):
+    lib = lmdb_library_dynamic_schema
+    df_0 = pd.DataFrame({"a": [1, 2]}, index=pd.date_range("2024-01-01", periods=2))
+    df_1 = pd.DataFrame({"a": [3, 4], "b": [0.5, 1.5]}, index=pd.date_range("2024-01-03", periods=2))
+    lib.write("df_0", df_0)
+    lib.write("df_1", df_1)
+    received = lib.read_batch(["df_0", "df_1"], lazy=True).concat().collect().data
+    assert_frame_equal(pd.concat([df_0, df_1]), received)
+
+
+def test_concat_invalid(lmdb_library):
+    lib = lmdb_library
+    lib.write("timeseries", pd.DataFrame({"a": [1]}, index=pd.date_range("2024-01-01", periods=1)))
+    lib.write("row_count", pd.DataFrame({"a": [1]}))
+    lib.write("other_columns", pd.DataFrame({"b": [1]}, index=pd.date_range("2024-01-02", periods=1)))
+    with pytest.raises(SchemaException):
+        lib.read_batch(["timeseries", "row_count"], lazy=True).concat().collect()
+    with pytest.raises(SchemaException):
+        lib.read_batch(["timeseries", "other_columns"], lazy=True).concat().collect()
+
+
+def test_join_str(lmdb_library):
+    lib = lmdb_library
+    lazy_df = lib.read_batch(["bars", "instruments"], lazy=True).join(on="ticker", how="left")
+    assert "JOIN(on=[ticker], how=left)" in str(lazy_df)
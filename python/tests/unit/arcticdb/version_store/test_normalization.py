@@ -356,6 +356,22 @@ def test_empty_df_with_multiindex_with_tz(tz):
             assert sliced_denorm_df_index_level_num.tz.zone == orig_df_index_level_num.tz.zone
 
 
+def test_integer_index_named_like_categorical_column():
+    # The index is only mapped onto categories when its metadata marks it as holding codes, e.g. after grouping on the
+    # categorical column, not just because it shares the categorical column's name
+    d = pd.DataFrame({"cat": pd.Categorical(["x", "y", "x"])}, index=pd.Index([1, 0, 1], name="cat"))
+    norm = CompositeNormalizer(use_norm_failure_handler_known_types=True, fallback_normalizer=test_msgpack_normalizer)
+    df, norm_meta = norm.normalize(d)
+    assert not norm_meta.df.common.index.is_categorical
+    assert_frame_equal(d, norm.denormalize(FrameData.from_npd_df(df), norm_meta))
+
+    norm_meta.df.common.index.is_categorical = True
+    denorm = norm.denormalize(FrameData.from_npd_df(df), norm_meta)
+    assert isinstance(denorm.index, pd.CategoricalIndex)
+    assert list(denorm.index) == ["y", "x", "y"]
+    assert denorm.index.name == "cat"
+
+
 def test_timestamp_without_tz():
     dt = datetime.datetime(2019, 4, 8, 10, 5, 2, 1)
     ts, tz = _to_tz_timestamp(dt)
@@ -14,6 +14,7 @@ import pytest
 
 
 from arcticdb.exceptions import (
+    ArcticNativeException,
     SortingException,
     SchemaException,
     UserInputException, ArcticDbNotYetImplemented,
@@ -30,7 +31,7 @@ from arcticdb.version_store.library import Library
 from arcticdb_ext.exceptions import UnsortedDataException
 from arcticdb_ext.storage import KeyType
 
-from arcticdb import util, LibraryOptions
+from arcticdb import util, LibraryOptions, StagedDataCompactionPolicy, StagedDataFinalizeMethod
 
 from arcticdb.util.test import config_context_multi
 
@@ -1657,3 +1658,68 @@ class TestConvertIntToFloat:
         lib.compact_incomplete(sym, append=append, convert_int_to_float=True)
         expected = pd.DataFrame({"a": np.array([1, 2, 3], dtype=np.float64)}, index=pd.date_range(pd.Timestamp(0), periods=3, freq="ns"))
         assert_frame_equal(lib.read(sym).data, expected, check_dtype=True)
+
+
+def test_stage_compaction_policy_max_segments(lmdb_library):
+    lib = lmdb_library
+    sym = "test_stage_compaction_policy_max_segments"
+    df = pd.DataFrame({"col": np.arange(9)}, index=pd.date_range("2024-01-01", periods=9))
+    policy = StagedDataCompactionPolicy(max_segments=3)
+    assert lib.stage(sym, df.iloc[0:3], compaction_policy=policy) is None
+    assert lib.stage(sym, df.iloc[3:6], compaction_policy=policy) is None
+    compaction = lib.stage(sym, df.iloc[6:9], compaction_policy=policy)
+    vit = compaction.result()
+    assert vit.symbol == sym
+    assert vit.version == 0
+    assert lib.get_staged_symbols() == []
+    assert_frame_equal(df, lib.read(sym).data)
+
+
+@pytest.mark.parametrize("policy", [
+    StagedDataCompactionPolicy(max_age=pd.Timedelta(0)),
+    StagedDataCompactionPolicy(max_bytes=1),
+])
+def test_stage_compaction_policy_appends(lmdb_library, policy):
+    lib = lmdb_library
+    sym = "test_stage_compaction_policy_appends"
+    df = pd.DataFrame({"col": np.arange(6)}, index=pd.date_range("2024-01-01", periods=6))
+    lib.write(sym, df.iloc[:3])
+    vit = lib.stage(sym, df.iloc[3:], compaction_policy=policy).result()
+    assert vit.version == 1
+    assert_frame_equal(df, lib.read(sym).data)
+
+
+def test_stage_compaction_policy_not_due(lmdb_library):
+    lib = lmdb_library
+    sym = "test_stage_compaction_policy_not_due"
+    df = pd.DataFrame({"col": np.arange(3)}, index=pd.date_range("2024-01-01", periods=3))
+    policy = StagedDataCompactionPolicy(max_segments=10, max_age=pd.Timedelta(days=1), max_bytes=1 << 30)
+    assert lib.stage(sym, df, compaction_policy=policy) is None
+    assert lib.get_staged_symbols() == [sym]
+    assert not lib.has_symbol(sym)
+
+
+def test_read_include_incompletes(lmdb_library):
+    lib = lmdb_library
+    sym = "test_read_include_incompletes"
+    df = pd.DataFrame({"col": np.arange(10)}, index=pd.date_range("2024-01-01", periods=10))
+    lib.write(sym, df.iloc[:4])
+    lib.stage(sym, df.iloc[7:])
+    lib.stage(sym, df.iloc[4:7])
+    assert_frame_equal(df.iloc[:4], lib.read(sym).data)
+    assert_frame_equal(df, lib.read(sym, include_incompletes=True).data)
+    date_range = (df.index[2], df.index[8])
+    assert_frame_equal(df.iloc[2:9], lib.read(sym, date_range=date_range, include_incompletes=True).data)
+    with pytest.raises(ArcticNativeException):
+        lib.read(sym, row_range=(0, 5), include_incompletes=True)
+    lib.finalize_staged_data(sym, mode=StagedDataFinalizeMethod.APPEND)
+    assert_frame_equal(df, lib.read(sym, include_incompletes=True).data)
+
+
+def test_read_include_incompletes_no_versions(lmdb_library):
+    lib = lmdb_library
+    sym = "test_read_include_incompletes_no_versions"
+    df = pd.DataFrame({"col": np.arange(6)}, index=pd.date_range("2024-01-01", periods=6))
+    lib.stage(sym, df.iloc[:3])
+    lib.stage(sym, df.iloc[3:])
+    assert_frame_equal(df, lib.read(sym, include_incompletes=True).data)
@@ -10,7 +10,7 @@ import pandas as pd
 import pytest
 
 from arcticdb_ext.exceptions import InternalException, UserInputException
-from arcticdb.version_store.processing import QueryBuilder
+from arcticdb.version_store.processing import QueryBuilder, where
 from arcticdb.util.test import assert_frame_equal, make_dynamic, regularize_dataframe
 
 
@@ -71,6 +71,165 @@ def test_project_string_unary_arithmetic(lmdb_version_store_v1):
         lib.read(symbol, query_builder=q)
 
 
+@pytest.mark.parametrize("dynamic_strings", [True, False])
+def test_project_str_len(lmdb_version_store_v1, dynamic_strings):
+    lib = lmdb_version_store_v1
+    symbol = "test_project_str_len"
+    df = pd.DataFrame({"a": ["hello", "", "bonjour", "héllo", "hello"]}, index=np.arange(5))
+    lib.write(symbol, df, dynamic_strings=dynamic_strings)
+    q = QueryBuilder()
+    q = q.apply("b", q["a"].str_len())
+    expected = df.copy()
+    expected["b"] = df["a"].str.len().astype(np.float64)
+    assert_frame_equal(expected, lib.read(symbol, query_builder=q).data)
+
+
+def test_project_str_len_nans(lmdb_version_store_v1):
+    lib = lmdb_version_store_v1
+    symbol = "test_project_str_len_nans"
+    df = pd.DataFrame({"a": ["hello", None, np.nan]}, index=np.arange(3))
+    lib.write(symbol, df)
+    q = QueryBuilder()
+    q = q.apply("b", q["a"].str_len())
+    received = lib.read(symbol, query_builder=q).data
+    assert received["b"].iloc[0] == 5
+    assert received["b"].iloc[1:].isna().all()
+
+
+def test_project_datetime_components(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    symbol = "test_project_datetime_components"
+    index = pd.date_range("1969-12-30 22:00", periods=20, freq="11h17min13s")
+    df = pd.DataFrame({"a": np.arange(20)}, index=index)
+    lib.write(symbol, df)
+    q = QueryBuilder()
+    for component in ["year", "month", "day", "hour", "minute", "second", "dayofweek"]:
+        q = q.apply(component, getattr(q["index"].dt, component))
+    q = q.apply("date", q["index"].dt.date)
+    q = q.apply("floor", q["index"].dt.floor("15min"))
+    q = q.apply("ceil", q["index"].dt.ceil(pd.Timedelta(hours=1)))
+    expected = df.copy()
+    for component in ["year", "month", "day", "hour", "minute", "second", "dayofweek"]:
+        expected[component] = getattr(index, component).astype(np.int32)
+    expected["date"] = index.normalize()
+    expected["floor"] = index.floor("15min")
+    expected["ceil"] = index.ceil("1h")
+    assert_frame_equal(expected, lib.read(symbol, query_builder=q).data)
+
+
+def test_project_timestamp_arithmetic(lmdb_version_store_v1):
+    lib = lmdb_version_store_v1
+    symbol = "test_project_timestamp_arithmetic"
+    df = pd.DataFrame(
+        {
+            "start": pd.date_range("2024-01-01", periods=5, freq="D"),
+            "end": pd.date_range("2024-01-01 12:00", periods=5, freq="13h"),
+        },
+        index=np.arange(5),
+    )
+    lib.write(symbol, df)
+    q = QueryBuilder()
+    q = q.apply("shifted", q["start"] + pd.Timedelta(minutes=90))
+    q = q.apply("rewound", q["end"] - pd.Timedelta(days=1))
+    q = q.apply("elapsed", q["end"] - q["start"])
+    expected = df.copy()
+    expected["shifted"] = df["start"] + pd.Timedelta(minutes=90)
+    expected["rewound"] = df["end"] - pd.Timedelta(days=1)
+    expected["elapsed"] = (df["end"] - df["start"]).astype(np.int64)
+    assert_frame_equal(expected, lib.read(symbol, query_builder=q).data)
+
+
+def test_project_datetime_round_invalid_frequency():
+    q = QueryBuilder()
+    with pytest.raises(UserInputException):
+        q.apply("floor", q["index"].dt.floor("0s"))
+
+
+def test_project_math_functions(lmdb_version_store_v1):
+    lib = lmdb_version_store_v1
+    symbol = "test_project_math_functions"
+    df = pd.DataFrame(
+        {"ints": np.arange(1, 6, dtype=np.int64), "floats": [0.125, 1.5, 2.5, 3.456, 10.0]}, index=np.arange(5)
+    )
+    lib.write(symbol, df)
+    q = QueryBuilder()
+    q = q.apply("log", q["ints"].log())
+    q = q.apply("exp", q["floats"].exp())
+    q = q.apply("sqrt", q["ints"].sqrt())
+    q = q.apply("pow", q["floats"] ** q["ints"])
+    q = q.apply("rpow", 2 ** q["ints"])
+    q = q.apply("round", q["floats"].round())
+    q = q.apply("round_2", round(q["floats"], 2))
+    q = q.apply("as_int32", q["floats"].astype(np.int32))
+    q = q.apply("as_float32", q["ints"].astype(np.float32))
+    expected = df.copy()
+    expected["log"] = np.log(df["ints"])
+    expected["exp"] = np.exp(df["floats"])
+    expected["sqrt"] = np.sqrt(df["ints"])
+    expected["pow"] = df["floats"] ** df["ints"]
+    expected["rpow"] = (2 ** df["ints"]).astype(np.float64)
+    expected["round"] = df["floats"].round()
+    expected["round_2"] = df["floats"].round(2)
+    expected["as_int32"] = df["floats"].astype(np.int32)
+    expected["as_float32"] = df["ints"].astype(np.float32)
+    assert_frame_equal(expected, lib.read(symbol, query_builder=q).data)
+
+
+def test_project_astype_nan_to_int(lmdb_version_store_v1):
+    lib = lmdb_version_store_v1
+    symbol = "test_project_astype_nan_to_int"
+    lib.write(symbol, pd.DataFrame({"col": [1.0, np.nan]}, index=np.arange(2)))
+    q = QueryBuilder()
+    q = q.apply("new_col", q["col"].astype(np.int64))
+    with pytest.raises(UserInputException):
+        lib.read(symbol, query_builder=q)
+
+
+def test_project_where_fillna_clip(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    symbol = "test_project_where_fillna_clip"
+    df = pd.DataFrame(
+        {"a": [1.0, np.nan, -3.0, 4.0, np.nan, 6.0, -7.0], "b": np.arange(7, dtype=np.int64)}, index=np.arange(7)
+    )
+    lib.write(symbol, df)
+    q = QueryBuilder()
+    q = q.apply("where_col_col", where(q["b"] > 2, q["a"], q["b"]))
+    q = q.apply("where_col_val", where(q["a"] < 0, 0, q["a"]))
+    q = q.apply("fillna", q["a"].fillna(-1.5))
+    q = q.apply("clip", q["a"].clip(lower=-2, upper=5))
+    q = q.apply("clip_upper", q["a"].clip(upper=1.5))
+    expected = df.copy()
+    expected["where_col_col"] = np.where(df["b"] > 2, df["a"], df["b"])
+    expected["where_col_val"] = np.where(df["a"] < 0, 0, df["a"])
+    expected["fillna"] = df["a"].fillna(-1.5)
+    expected["clip"] = df["a"].clip(lower=-2, upper=5)
+    expected["clip_upper"] = df["a"].clip(upper=1.5)
+    assert_frame_equal(expected, lib.read(symbol, query_builder=q).data)
+
+
+def test_filter_where(lmdb_version_store_v1):
+    lib = lmdb_version_store_v1
+    symbol = "test_filter_where"
+    df = pd.DataFrame({"a": np.arange(10, dtype=np.int64), "b": np.arange(10, 0, -1, dtype=np.int64)}, index=np.arange(10))
+    lib.write(symbol, df)
+    q = QueryBuilder()
+    q = q[where(q["a"] < 5, q["a"], q["b"]) > 3]
+    expected = df[np.where(df["a"] < 5, df["a"], df["b"]) > 3]
+    assert_frame_equal(expected, lib.read(symbol, query_builder=q).data)
+
+
+def test_project_math_invalid_arguments():
+    q = QueryBuilder()
+    with pytest.raises(UserInputException):
+        q["col"].round(1.5)
+    with pytest.raises(UserInputException):
+        q["col"].astype(str)
+    with pytest.raises(UserInputException):
+        q["col"].clip()
+    with pytest.raises(UserInputException):
+        where(True, q["col"], 0)
+
+
 def test_docstring_example_query_builder_apply(lmdb_version_store_v1):
     lib = lmdb_version_store_v1
     df = pd.DataFrame(
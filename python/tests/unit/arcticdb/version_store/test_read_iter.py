@@ -0,0 +1,123 @@
+"""
+Copyright 2024 Man Group Operations Limited
+
+Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+
+As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from arcticdb.exceptions import UserInputException
+from arcticdb.options import LibraryOptions
+from arcticdb.util.test import assert_frame_equal
+from arcticdb.version_store.processing import QueryBuilder
+
+
+pytestmark = pytest.mark.pipeline
+
+
+@pytest.fixture
+def lmdb_library_small_segments(lmdb_storage, lib_name):
+    yield lmdb_storage.create_arctic().create_library(lib_name, library_options=LibraryOptions(rows_per_segment=10))
+
+
+def _df(num_rows, range_index=False):
+    df = pd.DataFrame(
+        {
+            "col_int": np.arange(num_rows, dtype=np.int64),
+            "col_float": np.arange(num_rows, dtype=np.float64) / 2,
+            "col_str": [f"s{idx % 7}" for idx in range(num_rows)],
+        },
+        index=None if range_index else pd.date_range("2024-01-01", periods=num_rows, freq="s"),
+    )
+    return df
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 10, 25, 1000])
+@pytest.mark.parametrize("prefetch", [0, 2])
+@pytest.mark.parametrize("range_index", [True, False])
+def test_read_iter_matches_read(lmdb_library_small_segments, chunk_rows, prefetch, range_index):
+    lib = lmdb_library_small_segments
+    sym = "test_read_iter_matches_read"
+    df = _df(95, range_index)
+    lib.write(sym, df)
+    chunks = list(lib.read_iter(sym, chunk_rows=chunk_rows, prefetch=prefetch))
+    # Chunks are made of whole segments
+    expected_num_chunks = -(-95 // (10 * -(-chunk_rows // 10)))
+    assert len(chunks) == expected_num_chunks
+    assert all(len(chunk) >= min(chunk_rows, 95) for chunk in chunks[:-1])
+    assert_frame_equal(pd.concat(chunks), lib.read(sym).data)
+
+
+def test_read_iter_columns_and_query_builder(lmdb_library_small_segments):
+    lib = lmdb_library_small_segments
+    sym = "test_read_iter_columns_and_query_builder"
+    df = _df(95)
+    lib.write(sym, df)
+    q = QueryBuilder()
+    q = q[q["col_int"] % 3 == 0].apply("new_col", q["col_float"] * 2)
+    columns = ["col_int", "col_float"]
+    chunks = list(lib.read_iter(sym, columns=columns, query_builder=q, chunk_rows=20))
+    assert len(chunks) == 5
+    expected = lib.read(sym, columns=columns, query_builder=q).data
+    assert_frame_equal(pd.concat(chunks), expected)
+
+
+def test_read_iter_date_range(lmdb_library_small_segments):
+    lib = lmdb_library_small_segments
+    sym = "test_read_iter_date_range"
+    df = _df(95)
+    lib.write(sym, df)
+    date_range = (pd.Timestamp("2024-01-01 00:00:35"), pd.Timestamp("2024-01-01 00:00:52"))
+    chunks = list(lib.read_iter(sym, date_range=date_range, chunk_rows=10))
+    # Only the segments overlapping the date range are read
+    assert len(chunks) == 3
+    assert_frame_equal(pd.concat(chunks), df.loc[date_range[0] : date_range[1]])
+
+
+def test_read_iter_pins_version(lmdb_library_small_segments):
+    lib = lmdb_library_small_segments
+    sym = "test_read_iter_pins_version"
+    df = _df(95)
+    lib.write(sym, df)
+    chunks = lib.read_iter(sym, chunk_rows=10, prefetch=0)
+    first_chunk = next(chunks)
+    lib.write(sym, _df(5))
+    assert_frame_equal(pd.concat([first_chunk] + list(chunks)), df)
+    assert_frame_equal(pd.concat(lib.read_iter(sym, as_of=0, chunk_rows=10)), df)
+
+
+def test_read_iter_abandoned(lmdb_library_small_segments):
+    lib = lmdb_library_small_segments
+    sym = "test_read_iter_abandoned"
+    df = _df(95)
+    lib.write(sym, df)
+    chunks = lib.read_iter(sym, chunk_rows=10, prefetch=4)
+    assert_frame_equal(next(chunks), df.iloc[:10])
+    chunks.close()
+    assert_frame_equal(lib.read(sym).data, df)
+
+
+@pytest.mark.parametrize("clause", [QueryBuilder().groupby("col_str").agg({"col_int": "sum"}), QueryBuilder().head(5)])
+def test_read_iter_unsupported_clauses(lmdb_library_small_segments, clause):
+    lib = lmdb_library_small_segments
+    sym = "test_read_iter_unsupported_clauses"
+    lib.write(sym, _df(20))
+    with pytest.raises(UserInputException):
+        next(lib.read_iter(sym, query_builder=clause))
+
+
+def test_read_iter_arrow(lmdb_library_small_segments):
+    pa = pytest.importorskip("pyarrow")
+    lib = lmdb_library_small_segments
+    sym = "test_read_iter_arrow"
+    lib.write(sym, _df(95))
+    q = QueryBuilder()
+    q = q[q["col_int"] % 3 == 0]
+    chunks = list(lib.read_iter(sym, query_builder=q, chunk_rows=20, output_format="arrow"))
+    assert len(chunks) == 5
+    assert all(isinstance(chunk, pa.Table) for chunk in chunks)
+    expected = lib.read(sym, query_builder=q, output_format="arrow").data
+    assert pa.concat_tables(chunks).combine_chunks().to_pandas().equals(expected.to_pandas())
@@ -0,0 +1,127 @@
+"""
+Copyright 2024 Man Group Operations Limited
+
+Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+
+As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from arcticdb.exceptions import ArcticNativeException, NoSuchVersionException
+from arcticdb.util.test import assert_frame_equal
+from arcticdb.version_store.processing import QueryBuilder
+
+
+def sample_df(num_rows=100, offset=0):
+    return pd.DataFrame(
+        {"a": np.arange(offset, offset + num_rows), "b": [f"str_{i}" for i in range(num_rows)]},
+        index=pd.date_range("2024-01-01", periods=num_rows),
+    )
+
+
+def test_result_cache_disabled_by_default(lmdb_library):
+    lib = lmdb_library
+    lib.write("sym", sample_df())
+    lib.read("sym")
+    assert lib.result_cache_stats() is None
+
+
+def test_result_cache_hits_and_misses(lmdb_library):
+    lib = lmdb_library
+    df = sample_df()
+    lib.write("sym", df)
+    lib.set_result_cache_size(10 * 1024**2)
+    q = QueryBuilder()
+    q = q[q["a"] > 50]
+    for _ in range(3):
+        assert_frame_equal(df, lib.read("sym").data)
+        assert_frame_equal(df[df["a"] > 50], lib.read("sym", query_builder=q).data)
+        assert_frame_equal(df[["b"]], lib.read("sym", columns=["b"]).data)
+    stats = lib.result_cache_stats()
+    assert stats.misses == 3
+    assert stats.hits == 6
+    assert stats.evictions == 0
+    assert stats.entries == 3
+    assert stats.bytes > 0
+
+
+def test_result_cache_equal_query_builders_share_entries(lmdb_library):
+    lib = lmdb_library
+    lib.write("sym", sample_df())
+    lib.set_result_cache_size(10 * 1024**2)
+    for _ in range(2):
+        q = QueryBuilder()
+        q = q[q["a"] > 50]
+        lib.read("sym", query_builder=q)
+    assert lib.result_cache_stats().hits == 1
+
+
+def test_result_cache_new_version(lmdb_library):
+    lib = lmdb_library
+    lib.write("sym", sample_df())
+    lib.set_result_cache_size(10 * 1024**2)
+    lib.read("sym")
+    new_df = sample_df(offset=1000)
+    lib.write("sym", new_df)
+    # The latest version is resolved on every read, so the new data is returned straight away
+    assert_frame_equal(new_df, lib.read("sym").data)
+    # Older versions are still served from the cache
+    assert_frame_equal(sample_df(), lib.read("sym", as_of=0).data)
+    stats = lib.result_cache_stats()
+    assert stats.misses == 2
+    assert stats.hits == 1
+
+
+def test_result_cache_returns_copies(lmdb_library):
+    lib = lmdb_library
+    df = sample_df()
+    lib.write("sym", df)
+    lib.set_result_cache_size(10 * 1024**2)
+    lib.read("sym").data["a"] = -1
+    first_hit = lib.read("sym").data
+    first_hit["a"] = -2
+    assert_frame_equal(df, lib.read("sym").data)
+
+
+def test_result_cache_eviction(lmdb_library):
+    lib = lmdb_library
+    for idx in range(3):
+        lib.write(f"sym_{idx}", sample_df())
+    lib.set_result_cache_size(10 * 1024**2)
+    lib.read("sym_0")
+    entry_bytes = lib.result_cache_stats().bytes
+    # Room for two results
+    lib.set_result_cache_size(2 * entry_bytes + 1)
+    lib.read("sym_1")
+    lib.read("sym_0")
+    lib.read("sym_2")
+    stats = lib.result_cache_stats()
+    assert stats.evictions == 1
+    assert stats.entries == 2
+    # sym_1 was the least recently used
+    lib.read("sym_0")
+    lib.read("sym_1")
+    stats = lib.result_cache_stats()
+    assert stats.hits == 2
+    assert stats.misses == 4
+
+
+def test_result_cache_disable(lmdb_library):
+    lib = lmdb_library
+    lib.write("sym", sample_df())
+    lib.set_result_cache_size(10 * 1024**2)
+    lib.read("sym")
+    lib.set_result_cache_size(0)
+    assert lib.result_cache_stats() is None
+    with pytest.raises(ArcticNativeException):
+        lib.set_result_cache_size(-1)
+
+
+def test_result_cache_missing_symbol(lmdb_library):
+    lib = lmdb_library
+    lib.set_result_cache_size(10 * 1024**2)
+    with pytest.raises(NoSuchVersionException):
+        lib.read("missing")
+    assert lib.result_cache_stats().entries == 0
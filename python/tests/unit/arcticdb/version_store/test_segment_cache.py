@@ -0,0 +1,65 @@
+"""
+Copyright 2024 Man Group Operations Limited
+
+Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+
+As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from arcticdb_ext.cpp_async import set_segment_cache_size, segment_cache_stats, clear_segment_cache
+from arcticdb.util.test import assert_frame_equal
+
+
+@pytest.fixture
+def segment_cache():
+    set_segment_cache_size(64 * 1024**2)
+    clear_segment_cache()
+    yield
+    set_segment_cache_size(0)
+
+
+def test_segment_cache_serves_repeated_reads(lmdb_library, segment_cache):
+    lib = lmdb_library
+    df = pd.DataFrame({"a": np.arange(100), "b": np.arange(100.0)}, index=pd.date_range("2024-01-01", periods=100))
+    lib.write("sym", df)
+
+    initial = segment_cache_stats()
+    assert_frame_equal(df, lib.read("sym").data)
+    after_first_read = segment_cache_stats()
+    assert after_first_read.misses > initial.misses
+    assert after_first_read.entries > 0
+
+    assert_frame_equal(df, lib.read("sym").data)
+    assert_frame_equal(df.head(5), lib.head("sym").data)
+    assert_frame_equal(df.tail(5), lib.tail("sym").data)
+    assert_frame_equal(df[["b"]], lib.read("sym", columns=["b"]).data)
+    after_reads = segment_cache_stats()
+    assert after_reads.hits >= after_first_read.hits + 4
+    assert after_reads.misses == after_first_read.misses
+
+
+def test_segment_cache_sees_new_versions(lmdb_library, segment_cache):
+    lib = lmdb_library
+    df = pd.DataFrame({"a": np.arange(10)})
+    lib.write("sym", df)
+    assert_frame_equal(df, lib.read("sym").data)
+
+    updated = pd.DataFrame({"a": np.arange(10, 20)})
+    lib.write("sym", updated)
+    assert_frame_equal(updated, lib.read("sym").data)
+    assert_frame_equal(df, lib.read("sym", as_of=0).data)
+
+
+def test_segment_cache_disabled(lmdb_library):
+    set_segment_cache_size(0)
+    lib = lmdb_library
+    lib.write("sym", pd.DataFrame({"a": np.arange(10)}))
+    initial = segment_cache_stats()
+    lib.read("sym")
+    lib.read("sym")
+    stats = segment_cache_stats()
+    assert stats.hits == initial.hits
+    assert stats.misses == initial.misses
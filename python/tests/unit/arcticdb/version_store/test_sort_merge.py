@@ -900,3 +900,78 @@ def test_sort_and_finalize_staged_data_dynamic_schema_named_index(
     staged_keys = 1 if mode == StagedDataFinalizeMethod.APPEND else 2
     expected_key_count = 0 if delete_staged_data_on_failure else staged_keys
     assert len(get_append_keys(lib, sym)) == expected_key_count
+
+
+class TestExternalMerge:
+    """
+    Each row staged in these tests is 16 bytes (the index plus one 8 byte column), so a budget of 320 bytes sorts 10 rows
+    at a time, spills sorted runs in chunks of a single row, and merges up to 10 runs at once.
+    """
+    MEMORY_BUDGET = 320
+
+    @staticmethod
+    def stage_shuffled(lib, sym, df, num_segments):
+        rng = np.random.default_rng(seed=0)
+        shuffled = df.iloc[rng.permutation(len(df))]
+        for segment in np.array_split(shuffled, num_segments):
+            lib.write(sym, segment, staged=True)
+
+    @staticmethod
+    def assert_no_spilled_keys(lib, sym):
+        lib_tool = lib._nvs.library_tool()
+        data_keys = lib_tool.find_keys_for_symbol(KeyType.TABLE_DATA, sym)
+        assert len(data_keys) == len(lib._nvs.read_index(sym))
+        # Sorted runs are spilled under a temporary stream id of their own
+        all_data_keys = lib_tool.find_keys(KeyType.TABLE_DATA)
+        assert not [key for key in all_data_keys if str(key.id).startswith("__sort_merge_run__")]
+
+    @pytest.mark.parametrize("num_segments", [1, 5, 30])
+    def test_write(self, lmdb_library_static_dynamic, num_segments):
+        lib = lmdb_library_static_dynamic
+        df = pd.DataFrame({"col": np.arange(150, dtype=np.int64)}, index=pd.date_range("2024-01-01", periods=150, freq="s"))
+        self.stage_shuffled(lib, "sym", df, num_segments)
+        with config_context("SortMerge.MemoryBudgetBytes", self.MEMORY_BUDGET):
+            lib.sort_and_finalize_staged_data("sym")
+        assert_frame_equal(lib.read("sym").data, df)
+        assert len(get_append_keys(lib, "sym")) == 0
+        self.assert_no_spilled_keys(lib, "sym")
+
+    def test_append(self, lmdb_library_static_dynamic):
+        lib = lmdb_library_static_dynamic
+        df = pd.DataFrame({"col": np.arange(100, dtype=np.int64)}, index=pd.date_range("2024-01-01", periods=100, freq="s"))
+        lib.write("sym", df.iloc[:20])
+        self.stage_shuffled(lib, "sym", df.iloc[20:], 16)
+        with config_context("SortMerge.MemoryBudgetBytes", self.MEMORY_BUDGET):
+            lib.sort_and_finalize_staged_data("sym", mode=StagedDataFinalizeMethod.APPEND)
+        assert_frame_equal(lib.read("sym").data, df)
+        self.assert_no_spilled_keys(lib, "sym")
+
+    def test_append_before_existing_data(self, lmdb_library):
+        lib = lmdb_library
+        df = pd.DataFrame({"col": np.arange(100, dtype=np.int64)}, index=pd.date_range("2024-01-01", periods=100, freq="s"))
+        lib.write("sym", df.iloc[80:])
+        self.stage_shuffled(lib, "sym", df.iloc[:80], 8)
+        with config_context("SortMerge.MemoryBudgetBytes", self.MEMORY_BUDGET):
+            with pytest.raises(SortingException):
+                lib.sort_and_finalize_staged_data("sym", mode=StagedDataFinalizeMethod.APPEND)
+        assert_frame_equal(lib.read("sym").data, df.iloc[80:])
+        self.assert_no_spilled_keys(lib, "sym")
+
+    def test_dynamic_schema(self, lmdb_library_dynamic_schema):
+        lib = lmdb_library_dynamic_schema
+        index = pd.date_range("2024-01-01", periods=60, freq="s")
+        df_0 = pd.DataFrame({"x": np.arange(30, dtype=np.int64)}, index=index[0::2])
+        df_1 = pd.DataFrame({"y": [str(i) for i in range(30)]}, index=index[1::2])
+        self.stage_shuffled(lib, "sym", df_0, 3)
+        self.stage_shuffled(lib, "sym", df_1, 3)
+        with config_context("SortMerge.MemoryBudgetBytes", self.MEMORY_BUDGET):
+            lib.sort_and_finalize_staged_data("sym")
+        expected = pd.DataFrame(
+            {
+                "x": [i // 2 if i % 2 == 0 else 0 for i in range(60)],
+                "y": [None if i % 2 == 0 else str(i // 2) for i in range(60)],
+            },
+            index=index,
+        )
+        assert_frame_equal(lib.read("sym").data, expected)
+        self.assert_no_spilled_keys(lib, "sym")
@@ -0,0 +1,180 @@
+"""
+Copyright 2024 Man Group Operations Limited
+
+Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+
+As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from arcticdb import StagedDataCompactionPolicy
+from arcticdb.exceptions import ArcticNativeException, SchemaException, SortingException, UserInputException
+from arcticdb.util.test import assert_frame_equal
+
+
+def _expected(num_rows, start=0):
+    return pd.DataFrame(
+        {
+            "price": np.arange(start, start + num_rows, dtype=np.float64) / 4,
+            "size": np.arange(start, start + num_rows, dtype=np.int64),
+            "venue": [f"v{idx % 3}" for idx in range(start, start + num_rows)],
+        },
+        index=pd.date_range("2024-01-01", periods=num_rows, freq="s") + pd.Timedelta(seconds=start),
+    )
+
+
+def _write_rows(writer, df):
+    results = []
+    for ts, row in zip(df.index, df.itertuples(index=False)):
+        results.append(writer.write_row(ts, {"price": row.price, "size": row.size, "venue": row.venue}))
+    return results
+
+
+def _num_data_segments(lib, symbol):
+    return len(lib._nvs.read_index(symbol))
+
+
+def test_write_rows_appends_full_segments(lmdb_library):
+    lib = lmdb_library
+    expected = _expected(25)
+    with lib.stream_writer("sym", max_rows=10) as writer:
+        results = _write_rows(writer, expected)
+        assert [idx for idx, result in enumerate(results) if result is not None] == [9, 19]
+        assert writer.buffered_rows == 5
+        assert_frame_equal(lib.read("sym").data, expected.iloc[:20])
+    assert_frame_equal(lib.read("sym").data, expected)
+    assert _num_data_segments(lib, "sym") == 3
+    assert len(lib.list_versions("sym")) == 3
+
+
+def test_write_batches(lmdb_library):
+    lib = lmdb_library
+    expected = _expected(23)
+    with lib.stream_writer("sym", max_rows=10) as writer:
+        _write_rows(writer, expected.iloc[:2])
+        for start in range(2, 23, 3):
+            writer.write(expected.iloc[start : start + 3])
+    assert_frame_equal(lib.read("sym").data, expected)
+    assert _num_data_segments(lib, "sym") == 3
+
+
+def test_write_appends_to_existing_data(lmdb_library):
+    lib = lmdb_library
+    expected = _expected(30)
+    lib.write("sym", expected.iloc[:10])
+    with lib.stream_writer("sym") as writer:
+        writer.write(expected.iloc[10:20])
+        _write_rows(writer, expected.iloc[20:])
+        assert writer.buffered_rows == 20
+    assert_frame_equal(lib.read("sym").data, expected)
+    assert _num_data_segments(lib, "sym") == 2
+
+
+def test_missing_values(lmdb_library):
+    lib = lmdb_library
+    index = pd.date_range("2024-01-01", periods=4, freq="s")
+    with lib.stream_writer("sym") as writer:
+        writer.write_row(index[0], {"price": 1.5, "ts": index[0], "venue": "a", "size": 1})
+        writer.write_row(index[1], {"price": None, "ts": None, "venue": None, "size": 2})
+        writer.write_row(index[2], {"size": 3})
+        writer.write(pd.DataFrame({"price": [np.nan], "ts": [pd.NaT], "venue": [None], "size": [4]}, index=index[3:]))
+        with pytest.raises(UserInputException):
+            writer.write_row(index[3], {"price": 1.5})
+        assert writer.buffered_rows == 4
+    expected = pd.DataFrame(
+        {
+            "price": [1.5, np.nan, np.nan, np.nan],
+            "ts": [index[0], pd.NaT, pd.NaT, pd.NaT],
+            "venue": ["a", None, None, None],
+            "size": np.arange(1, 5, dtype=np.int64),
+        },
+        index=index,
+    )
+    assert_frame_equal(lib.read("sym").data, expected)
+
+
+def test_invalid_rows_are_not_written(lmdb_library):
+    lib = lmdb_library
+    expected = _expected(3)
+    with lib.stream_writer("sym") as writer:
+        _write_rows(writer, expected.iloc[:2])
+        with pytest.raises(SortingException):
+            writer.write_row(expected.index[0], {"price": 1.0, "size": 1, "venue": "v"})
+        with pytest.raises(SortingException):
+            writer.write(expected.iloc[::-1])
+        with pytest.raises(SchemaException):
+            writer.write_row(expected.index[2], {"price": 1.0, "size": 1, "venue": "v", "other": 1})
+        with pytest.raises(SchemaException):
+            writer.write(expected.iloc[2:].rename(columns={"size": "other"}))
+        with pytest.raises(UserInputException):
+            writer.write_row(expected.index[2], {"price": 1.0, "size": "one", "venue": "v"})
+        _write_rows(writer, expected.iloc[2:])
+    assert_frame_equal(lib.read("sym").data, expected)
+
+
+def test_max_interval(lmdb_library):
+    lib = lmdb_library
+    expected = _expected(5)
+    with lib.stream_writer("sym", max_interval=pd.Timedelta(0)) as writer:
+        assert all(result is not None for result in _write_rows(writer, expected))
+        assert writer.buffered_rows == 0
+    assert_frame_equal(lib.read("sym").data, expected)
+    assert len(lib.list_versions("sym")) == 5
+
+
+def test_staged(lmdb_library):
+    lib = lmdb_library
+    expected = _expected(25)
+    with lib.stream_writer("sym", max_rows=10, staged=True) as writer:
+        assert all(result is None for result in _write_rows(writer, expected))
+    assert not lib.has_symbol("sym")
+    assert lib.get_staged_symbols() == ["sym"]
+    lib.finalize_staged_data("sym")
+    assert_frame_equal(lib.read("sym").data, expected)
+    assert _num_data_segments(lib, "sym") == 3
+
+
+def test_staged_compaction_policy(lmdb_library):
+    lib = lmdb_library
+    expected = _expected(25)
+    policy = StagedDataCompactionPolicy(max_segments=2)
+    with lib.stream_writer("sym", max_rows=10, staged=True, compaction_policy=policy) as writer:
+        results = _write_rows(writer, expected.iloc[:20])
+        assert [idx for idx, result in enumerate(results) if result is not None] == [19]
+        results[19].result()
+        assert_frame_equal(lib.read("sym").data, expected.iloc[:20])
+        _write_rows(writer, expected.iloc[20:])
+    # The last segment is staged on closing the writer, but is below the policy threshold
+    assert_frame_equal(lib.read("sym").data, expected.iloc[:20])
+    lib.finalize_staged_data("sym", mode="append")
+    assert_frame_equal(lib.read("sym").data, expected)
+
+
+def test_closed_writer(lmdb_library):
+    lib = lmdb_library
+    expected = _expected(2)
+    writer = lib.stream_writer("sym")
+    _write_rows(writer, expected.iloc[:1])
+    assert writer.close() is not None
+    assert writer.close() is None
+    with pytest.raises(ArcticNativeException):
+        _write_rows(writer, expected.iloc[1:])
+    assert_frame_equal(lib.read("sym").data, expected.iloc[:1])
+
+
+def test_invalid_arguments(lmdb_library):
+    lib = lmdb_library
+    index = pd.DatetimeIndex([pd.Timestamp("2024-01-01")])
+    with pytest.raises(ArcticNativeException):
+        lib.stream_writer("sym", max_rows=0)
+    with pytest.raises(ArcticNativeException):
+        lib.stream_writer("sym", compaction_policy=StagedDataCompactionPolicy(max_segments=1))
+    with lib.stream_writer("sym") as writer:
+        with pytest.raises(SchemaException):
+            # The first row determines the column types, so must have a value in every column
+            writer.write_row(index[0], {"price": 1.0, "venue": None})
+        with pytest.raises(UserInputException):
+            writer.write(pd.DataFrame({"price": [1.0]}))
+    assert not lib.has_symbol("sym")
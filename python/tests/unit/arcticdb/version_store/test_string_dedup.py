@@ -52,6 +52,25 @@ def test_string_dedup_basic(lmdb_version_store_tiny_segment):
     assert getsize(read_df_with_dedup) <= getsize(read_df_without_dedup)
 
 
+def test_string_dedup_shares_objects_across_segments(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    symbol = "test_string_dedup_shares_objects_across_segments"
+    # Mix of ASCII and non-ASCII strings, which are created differently
+    strings = ["abc", "", "déjà vu", "日本語", "abc" * 20, None]
+    df = pd.DataFrame({"col1": strings * 4}, index=pd.date_range("2000-1-1", periods=len(strings) * 4))
+    lib.write(symbol, df, dynamic_strings=True)
+
+    read_df = lib.read(symbol, optimise_string_memory=True).data
+    assert np.array_equal(df, read_df)
+    values = read_df["col1"].tolist()
+    for row, value in enumerate(values[: len(strings)]):
+        if value is not None:
+            assert all(other is value for other in values[row :: len(strings)])
+
+    read_df = lib.read(symbol, optimise_string_memory=False).data
+    assert np.array_equal(df, read_df)
+
+
 # Test that dedup still works when writing fixed-width strings and appending dynamic strings, and vice-versa
 def test_string_dedup_dynamic_schema(lmdb_version_store_dynamic_schema):
     lib = lmdb_version_store_dynamic_schema
@@ -0,0 +1,185 @@
+"""
+Copyright 2024 Man Group Operations Limited
+
+Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+
+As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+"""
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from arcticdb import QueryBuilder
+from arcticdb.exceptions import ArcticNativeException, SchemaException, UserInputException
+from arcticdb.util.test import assert_frame_equal
+from arcticdb.util._versions import IS_PANDAS_TWO
+
+pytestmark = pytest.mark.pipeline
+
+
+# Rolling count only respects min_periods from Pandas 2 onwards, which is the behaviour we match
+WINDOW_AGGREGATIONS = ["sum", "mean", "min", "max", "count"] if IS_PANDAS_TWO else ["sum", "mean", "min", "max"]
+
+
+def window_test_df(num_rows=20):
+    rng = np.random.default_rng(42)
+    values = rng.random(num_rows)
+    values[[3, 4, 11]] = np.nan
+    return pd.DataFrame(
+        {
+            "float_col": values,
+            "int_col": rng.integers(-100, 100, num_rows),
+            "bool_col": rng.integers(0, 2, num_rows).astype(bool),
+        },
+        index=pd.date_range("2024-01-01", freq="37s", periods=num_rows),
+    )
+
+
+def expected_window(df, window, aggregations):
+    expected = df.copy()
+    for output_column, (input_column, agg) in aggregations.items():
+        expected[output_column] = getattr(window(df[input_column].astype(np.float64)), agg)()
+    return expected
+
+
+@pytest.mark.parametrize("agg", WINDOW_AGGREGATIONS)
+@pytest.mark.parametrize("column", ["float_col", "int_col", "bool_col"])
+def test_rolling_rows_spans_row_slices(lmdb_version_store_tiny_segment, agg, column):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_rolling_rows_spans_row_slices"
+    df = window_test_df()
+    lib.write(sym, df)
+    aggregations = {"out": (column, agg)}
+    q = QueryBuilder().rolling(5, min_periods=2).agg(aggregations)
+    received = lib.read(sym, query_builder=q).data
+    expected = expected_window(df, lambda s: s.rolling(5, min_periods=2), aggregations)
+    assert_frame_equal(expected, received)
+
+
+@pytest.mark.parametrize("window", ["1min", "3min", pd.Timedelta(seconds=90)])
+def test_rolling_time(lmdb_version_store_tiny_segment, window):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_rolling_time"
+    df = window_test_df()
+    lib.write(sym, df)
+    aggregations = {f"float_{agg}": ("float_col", agg) for agg in WINDOW_AGGREGATIONS}
+    q = QueryBuilder().rolling(window).agg(aggregations)
+    received = lib.read(sym, query_builder=q).data
+    expected = expected_window(df, lambda s: s.rolling(window), aggregations)
+    assert_frame_equal(expected, received)
+
+
+def test_expanding(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_expanding"
+    df = window_test_df()
+    lib.write(sym, df)
+    aggregations = {f"int_{agg}": ("int_col", agg) for agg in WINDOW_AGGREGATIONS}
+    q = QueryBuilder().expanding().agg(aggregations)
+    received = lib.read(sym, query_builder=q).data
+    expected = expected_window(df, lambda s: s.expanding(), aggregations)
+    assert_frame_equal(expected, received)
+
+
+@pytest.mark.parametrize("kwargs", [{"span": 3}, {"com": 0.5}, {"halflife": 2.5}, {"alpha": 0.3, "adjust": False}, {"alpha": 0.7, "min_periods": 4}])
+def test_ewm_mean(lmdb_version_store_tiny_segment, kwargs):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_ewm_mean"
+    df = window_test_df()
+    lib.write(sym, df)
+    aggregations = {"ewma": ("float_col", "mean")}
+    q = QueryBuilder().ewm(**kwargs).agg(aggregations)
+    received = lib.read(sym, query_builder=q).data
+    expected = expected_window(df, lambda s: s.ewm(**kwargs), aggregations)
+    assert_frame_equal(expected, received)
+
+
+def test_rolling_after_filter(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_rolling_after_filter"
+    df = window_test_df()
+    lib.write(sym, df)
+    q = QueryBuilder()
+    q = q[q["int_col"] > 0]
+    q = q.rolling(3, min_periods=1).agg({"int_sum": ("int_col", "sum")})
+    received = lib.read(sym, query_builder=q).data
+    filtered = df[df["int_col"] > 0]
+    expected = expected_window(filtered, lambda s: s.rolling(3, min_periods=1), {"int_sum": ("int_col", "sum")})
+    assert_frame_equal(expected, received)
+
+
+def test_projection_after_rolling(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_projection_after_rolling"
+    df = window_test_df()
+    lib.write(sym, df)
+    q = QueryBuilder().rolling("2min").agg({"float_mean": ("float_col", "mean")})
+    q = q.apply("deviation", q["float_col"] - q["float_mean"])
+    received = lib.read(sym, query_builder=q).data
+    expected = expected_window(df, lambda s: s.rolling("2min"), {"float_mean": ("float_col", "mean")})
+    expected["deviation"] = expected["float_col"] - expected["float_mean"]
+    assert_frame_equal(expected, received)
+
+
+def test_rolling_dynamic_schema_missing_column(lmdb_version_store_dynamic_schema_v1):
+    lib = lmdb_version_store_dynamic_schema_v1
+    sym = "test_rolling_dynamic_schema_missing_column"
+    df_0 = pd.DataFrame({"col_0": [0.0, 1.0]}, index=pd.date_range("2024-01-01", periods=2))
+    df_1 = pd.DataFrame({"col_1": [2.0, 3.0]}, index=pd.date_range("2024-01-03", periods=2))
+    df_2 = pd.DataFrame({"col_0": [4.0, 5.0]}, index=pd.date_range("2024-01-05", periods=2))
+    lib.write(sym, df_0)
+    lib.append(sym, df_1)
+    lib.append(sym, df_2)
+    q = QueryBuilder().rolling(3, min_periods=1).agg({"col_0_sum": ("col_0", "sum")})
+    received = lib.read(sym, query_builder=q).data
+    np.testing.assert_array_equal(received["col_0_sum"].to_numpy(), [0.0, 1.0, 1.0, 1.0, 4.0, 9.0])
+
+
+def test_rolling_pickle_and_str():
+    q = QueryBuilder().rolling("5min").agg({"out": ("col", "mean")})
+    q_roundtrip = pickle.loads(pickle.dumps(q))
+    assert q == q_roundtrip
+    assert str(q) == str(q_roundtrip)
+    assert "ROLLING(300000000000ns, min_periods=1)" in str(q)
+    assert QueryBuilder().rolling(5).agg({"out": ("col", "mean")}) != QueryBuilder().rolling(6).agg({"out": ("col", "mean")})
+
+
+def test_window_invalid_arguments():
+    with pytest.raises(UserInputException):
+        QueryBuilder().rolling(0)
+    with pytest.raises(UserInputException):
+        QueryBuilder().rolling(3, min_periods=4)
+    with pytest.raises(UserInputException):
+        QueryBuilder().rolling("MS")
+    with pytest.raises(ArcticNativeException):
+        QueryBuilder().rolling(3, min_periods=-1)
+    with pytest.raises(ArcticNativeException):
+        QueryBuilder().ewm(span=3, alpha=0.5)
+    with pytest.raises(ArcticNativeException):
+        QueryBuilder().ewm(alpha=1.5)
+    with pytest.raises(UserInputException):
+        QueryBuilder().ewm(alpha=0.5).agg({"out": ("col", "sum")})
+    with pytest.raises(UserInputException):
+        QueryBuilder().rolling(3).agg({"out": ("col", "first")})
+
+
+def test_window_unsupported_column_types(lmdb_version_store_v1):
+    lib = lmdb_version_store_v1
+    sym = "test_window_unsupported_column_types"
+    df = pd.DataFrame({"str_col": ["a", "b"], "ts_col": pd.date_range("2024-01-01", periods=2)}, index=pd.date_range("2024-01-01", periods=2))
+    lib.write(sym, df)
+    for column in df.columns:
+        q = QueryBuilder().rolling(2).agg({"out": (column, "sum")})
+        with pytest.raises(SchemaException):
+            lib.read(sym, query_builder=q)
+
+
+def test_rolling_time_requires_timeseries(lmdb_version_store_v1):
+    lib = lmdb_version_store_v1
+    sym = "test_rolling_time_requires_timeseries"
+    lib.write(sym, pd.DataFrame({"col": [1.0, 2.0]}))
+    q = QueryBuilder().rolling("1min").agg({"out": ("col", "sum")})
+    with pytest.raises(SchemaException):
+        lib.read(sym, query_builder=q)